@@ -0,0 +1,133 @@
+# agent_policy.py
+#
+# The deterministic part of Agent:selectAction (src/ai/navigation/Agent.lua)
+# as vectorized NumPy over (N, 11) states, so offline tools can see the
+# actions the game would take rather than the raw network argmax:
+#
+#   1. emergency override: a ray closer than the danger thresholds hands the
+#      step to Agent:getHeuristicAction; the network is not consulted
+#   2. (epsilon exploration and early-episode heuristic injection are random
+#      and left out; this is the greedy policy)
+#   3. argmax of the Q-values over the valid actions (all five; see
+#      BotNavigator.getValidActions)
+#   4. caution-zone turn biasing toward the clearer side
+#   5. straight-ahead preference when centered and aligned
+#   6. lateral wall guardrail
+#
+# Thresholds are copied from Agent.lua; keep them in sync when it changes.
+# Actions are 1-based, as in the game and the logs.
+
+from typing import Tuple
+
+import numpy as np
+
+FORWARD, FORWARD_LEFT, FORWARD_RIGHT, SHARP_LEFT, SHARP_RIGHT = 1, 2, 3, 4, 5
+
+# Agent:getHeuristicAction
+HEURISTIC_WALL_THRESHOLD = 0.35
+HEURISTIC_AHEAD_DANGER = 0.25
+HEURISTIC_AHEAD_CAUTION = 0.50
+
+# Agent:selectAction
+WALL_DANGER = 0.40
+AHEAD_DANGER = 0.45
+CAUTION_ZONE = 0.55
+STRAIGHT_HEADING_DOT = 0.9
+STRAIGHT_MAX_LATERAL = 0.3
+STRAIGHT_MIN_AHEAD = 0.6
+GUARDRAIL_LATERAL = 0.6
+
+# Which step decided each action (select_actions' `source`)
+SOURCE_EMERGENCY, SOURCE_NETWORK, SOURCE_OVERRIDE = 0, 1, 2
+SOURCE_NAMES = ("emergency", "network", "override")
+
+
+def proximities(states: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (leftProx, rightProx, aheadProx) from the five normalized ray distances.
+    """
+    far_left, left, center, right, far_right = (states[:, i] for i in range(6, 11))
+    return (
+        np.minimum(far_left, left),
+        np.minimum(far_right, right),
+        np.minimum(np.minimum(left, center), right),
+    )
+
+
+def heuristic_actions(states: np.ndarray) -> np.ndarray:
+    """
+    Agent:getHeuristicAction. Later rules only apply where no earlier one
+    fired, so they are evaluated in reverse and overwritten.
+    """
+    states = np.asarray(states, dtype=np.float64)
+    lateral, heading_dot = states[:, 1], states[:, 2]
+    left, right, ahead = proximities(states)
+    turn_left = left > right + 0.05
+
+    actions = np.full(len(states), FORWARD, dtype=np.int64)
+    # 5) centering
+    actions[lateral > 0.25] = FORWARD_LEFT
+    actions[lateral < -0.25] = FORWARD_RIGHT
+    # 4) misalignment
+    misaligned = heading_dot < 0.3
+    actions[misaligned] = np.where(lateral[misaligned] < 0, FORWARD_RIGHT, FORWARD_LEFT)
+    # 3) caution ahead
+    caution = ahead < HEURISTIC_AHEAD_CAUTION
+    actions[caution] = np.where(turn_left[caution], FORWARD_LEFT, FORWARD_RIGHT)
+    # 2) emergency ahead
+    danger = ahead < HEURISTIC_AHEAD_DANGER
+    actions[danger] = np.where(turn_left[danger], SHARP_LEFT, SHARP_RIGHT)
+    # 1) side walls
+    actions[(right < HEURISTIC_WALL_THRESHOLD) & (left > right + 0.1)] = FORWARD_LEFT
+    actions[(left < HEURISTIC_WALL_THRESHOLD) & (right > left + 0.1)] = FORWARD_RIGHT
+    return actions
+
+
+def emergency_mask(states: np.ndarray) -> np.ndarray:
+    """
+    States where selectAction returns the heuristic before looking at Q.
+    """
+    left, right, ahead = proximities(np.asarray(states, dtype=np.float64))
+    return (left < WALL_DANGER) | (right < WALL_DANGER) | (ahead < AHEAD_DANGER)
+
+
+def post_argmax_overrides(states: np.ndarray, greedy: np.ndarray) -> np.ndarray:
+    """
+    selectAction steps 6 and 7 applied to the network's greedy actions.
+    """
+    states = np.asarray(states, dtype=np.float64)
+    lateral, heading_dot = states[:, 1], states[:, 2]
+    left, right, ahead = proximities(states)
+    a = np.asarray(greedy, dtype=np.int64).copy()
+    turns_right = lambda x: (x == FORWARD_RIGHT) | (x == SHARP_RIGHT)
+    turns_left = lambda x: (x == FORWARD_LEFT) | (x == SHARP_LEFT)
+
+    # 6) caution zone: steer toward the clearer side
+    caution = ahead < CAUTION_ZONE
+    left_clear = caution & (left > right + 0.1)
+    right_clear = caution & ~left_clear & (right > left + 0.1)
+    a[left_clear & turns_right(a)] = FORWARD_LEFT
+    a[right_clear & turns_left(a)] = FORWARD_RIGHT
+
+    # 7) straight when centered and aligned, then the wall guardrail
+    a[(heading_dot > STRAIGHT_HEADING_DOT) & (np.abs(lateral) < STRAIGHT_MAX_LATERAL)
+      & (ahead > STRAIGHT_MIN_AHEAD)] = FORWARD
+    a[(lateral > GUARDRAIL_LATERAL) & turns_right(a)] = FORWARD_LEFT
+    a[(lateral < -GUARDRAIL_LATERAL) & turns_left(a)] = FORWARD_RIGHT
+    return a
+
+
+def select_actions(states: np.ndarray, greedy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy selectAction for every state, given the network's 1-based argmax
+    actions. Returns (actions, source) with source one of SOURCE_*.
+    """
+    states = np.asarray(states, dtype=np.float64)
+    greedy = np.asarray(greedy, dtype=np.int64)
+    emergency = emergency_mask(states)
+
+    actions = post_argmax_overrides(states, greedy)
+    source = np.where(actions == greedy, SOURCE_NETWORK, SOURCE_OVERRIDE)
+    actions[emergency] = heuristic_actions(states[emergency])
+    source[emergency] = SOURCE_EMERGENCY
+    return actions, source
@@ -0,0 +1,592 @@
+# benchmark.py
+#
+# End-to-end performance benchmark for the boat_rl pipeline. Each stage runs
+# in its own freshly spawned process against synthetic logs, so peak RSS is
+# per stage and nothing is warmed up by an earlier stage:
+#
+#   ingest      concurrent POST /transitions against a local log_data.py
+#   load        load_transitions with a cold episode manifest
+#   tensors     transitions_to_tensors
+#   train       train_dqn epochs
+#   export      checkpoint -> dqn_weights.json + DqnWeights.lua
+#   qvalues     pure-Python stand-in for Agent:qValues (flat layout)
+#
+# Synthetic episodes come from river_sim under a random policy, so they have
+# the logged layout and realistic lengths. Results are written as JSON and can
+# be compared against a stored baseline; a regression beyond --tolerance makes
+# the script exit non-zero.
+
+import argparse
+import asyncio
+import contextlib
+import importlib.metadata
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+BASE_DIR = Path(__file__).resolve().parent
+
+STAGES = ("ingest", "load", "tensors", "train", "export", "qvalues")
+
+# Metric name suffixes and which direction is an improvement
+HIGHER_IS_BETTER = ("_per_sec",)
+LOWER_IS_BETTER = ("_ms", "_mb")
+
+# Seconds log_data.py gets to exit after SIGTERM before it is killed
+SERVER_SHUTDOWN_TIMEOUT = 15.0
+
+
+# -----------------------------
+# Synthetic logs
+# -----------------------------
+def generate_synthetic_logs(log_dir: Path, num_episodes: int, seed: int = 0) -> dict:
+    """
+    Write num_episodes transitions_XXX.json files rolled out by river_sim
+    with a random policy. Returns a summary of what was written.
+    """
+    from river_sim import RiverSim, collect_episodes, random_policy
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    sim = RiverSim(num_boats=min(num_episodes, 256), seed=seed)
+
+    num_transitions = 0
+    num_bytes = 0
+    for i, ep in enumerate(collect_episodes(sim, random_policy(rng), num_episodes), start=1):
+        transitions = [
+            {"s": s, "a": a, "r": r, "d": d, "ns": ns}
+            for s, a, r, d, ns in zip(
+                ep["s"].tolist(), ep["a"].tolist(), ep["r"].tolist(), ep["d"].tolist(), ep["ns"].tolist()
+            )
+        ]
+        path = log_dir / f"transitions_{i:03d}.json"
+        path.write_text(json.dumps(transitions))
+        num_transitions += len(transitions)
+        num_bytes += path.stat().st_size
+
+    return {"episodes": num_episodes, "transitions": num_transitions, "mb": num_bytes / (1024 * 1024)}
+
+
+def log_files(log_dir: Path) -> List[Path]:
+    return sorted(log_dir.glob("transitions_*.json"))
+
+
+# -----------------------------
+# Stage helpers (run inside the stage process)
+# -----------------------------
+def _peak_rss_mb(pid: str = "self") -> Optional[float]:
+    """
+    Peak RSS in MB of this process or of a running child.
+
+    VmHWM is preferred: ru_maxrss survives fork + exec, so a spawned stage
+    would otherwise report the parent's peak rather than its own.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None or pid != "self":
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextlib.contextmanager
+def _quiet():
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _checkpoint_path(work_dir: Path) -> Path:
+    """
+    Checkpoint written by the train stage, or a freshly initialized model of
+    the default architecture when that stage was skipped.
+    """
+    import torch
+    from train_dqn import DQN
+
+    path = work_dir / "bench_weights_best.pth"
+    if not path.exists():
+        model = DQN(11, 5)
+        torch.save(
+            {
+                "state_dim": 11,
+                "num_actions": 5,
+                "hidden_sizes": list(model.hidden_sizes),
+                "model_state_dict": model.state_dict(),
+            },
+            path,
+        )
+    return path
+
+
+def _percentile_ms(latencies: List[float], q: float) -> float:
+    return float(np.percentile(latencies, q) * 1000.0) if latencies else 0.0
+
+
+# -----------------------------
+# Stages
+# -----------------------------
+async def _post_episodes(port: int, bodies: List[bytes], num_requests: int, concurrency: int) -> dict:
+    import aiohttp
+
+    url = f"http://127.0.0.1:{port}/transitions"
+    latencies: List[float] = []
+    errors = 0
+    queue = iter(range(num_requests))
+
+    async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
+        async def client():
+            nonlocal errors
+            for i in queue:
+                start = time.perf_counter()
+                async with session.post(url, data=bodies[i % len(bodies)]) as resp:
+                    await resp.read()
+                    if resp.status != 200:
+                        errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {"elapsed": elapsed, "latencies": latencies, "errors": errors}
+
+
+async def _wait_for_server(port: int, proc: subprocess.Popen, timeout: float = 30.0):
+    import aiohttp
+
+    deadline = time.perf_counter() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"log_data.py exited with code {proc.returncode}")
+            try:
+                async with session.get(f"http://127.0.0.1:{port}/metrics") as resp:
+                    if resp.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("log_data.py did not start in time")
+
+
+def stage_ingest(work_dir: Path, opts: dict) -> dict:
+    """
+    Requests/sec for concurrent episode POSTs against a local log_data.py.
+    """
+    bodies = [b'{"transitions": ' + p.read_bytes() + b"}" for p in log_files(work_dir / "logs")]
+    ingest_dir = work_dir / "ingest_logs"
+    port = _free_port()
+
+    proc = subprocess.Popen(
+        [sys.executable, str(BASE_DIR / "log_data.py"), "--port", str(port), "--log-dir", str(ingest_dir)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(_wait_for_server(port, proc))
+        result = asyncio.run(_post_episodes(port, bodies, opts["ingest_requests"], opts["concurrency"]))
+        server_rss = _peak_rss_mb(str(proc.pid))
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=SERVER_SHUTDOWN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            # Graceful shutdown waits on open connections; don't let it stall the run
+            proc.kill()
+            proc.wait()
+
+    latencies = result["latencies"]
+    return {
+        "requests": len(latencies),
+        "concurrency": opts["concurrency"],
+        "errors": result["errors"],
+        "seconds": result["elapsed"],
+        "requests_per_sec": len(latencies) / max(result["elapsed"], 1e-9),
+        "p50_latency_ms": _percentile_ms(latencies, 50),
+        "p99_latency_ms": _percentile_ms(latencies, 99),
+        "server_peak_rss_mb": server_rss,
+    }
+
+
+def stage_load(work_dir: Path, opts: dict) -> dict:
+    """
+    Files/sec and MB/sec for load_transitions, starting without a manifest.
+
+    Rates count the files actually parsed: the cold run summarizes every
+    file into the manifest and then parses the selected episodes again; the
+    warm run parses only the selected episodes.
+    """
+    from episode_manifest import load_manifest, manifest_path
+    from train_dqn import load_transitions, select_episodes
+
+    log_dir = work_dir / "logs"
+    files = log_files(log_dir)
+    mb = sum(p.stat().st_size for p in files) / (1024 * 1024)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(manifest_path(str(log_dir)))
+
+    with _quiet():
+        start = time.perf_counter()
+        transitions, _, _ = load_transitions(log_dir=str(log_dir))
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load_transitions(log_dir=str(log_dir))
+        warm = time.perf_counter() - start
+
+        # Same selection load_transitions made, from the now-complete manifest
+        candidates = [e for e in load_manifest(str(log_dir), refresh=False) if e["length"] > 0]
+        selected = [candidates[i]["file"] for i in select_episodes(
+            [e["return"] for e in candidates], [e["max_progress"] for e in candidates]
+        )]
+    selected_mb = sum((log_dir / f).stat().st_size for f in selected) / (1024 * 1024)
+    cold_files, cold_mb = len(files) + len(selected), mb + selected_mb
+
+    return {
+        "files": len(files),
+        "mb": mb,
+        "selected_files": len(selected),
+        "transitions_loaded": len(transitions),
+        "seconds": cold,
+        "files_per_sec": cold_files / max(cold, 1e-9),
+        "mb_per_sec": cold_mb / max(cold, 1e-9),
+        "warm_seconds": warm,
+        "warm_files_per_sec": len(selected) / max(warm, 1e-9),
+    }
+
+
+def stage_tensors(work_dir: Path, opts: dict) -> dict:
+    """
+    Transitions/sec for transitions_to_tensors on the selected episodes.
+    """
+    from train_dqn import load_transitions, transitions_to_tensors
+
+    with _quiet():
+        transitions, state_dim, _ = load_transitions(log_dir=str(work_dir / "logs"))
+
+    start = time.perf_counter()
+    transitions_to_tensors(transitions, state_dim)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "transitions": len(transitions),
+        "seconds": elapsed,
+        "transitions_per_sec": len(transitions) / max(elapsed, 1e-9),
+    }
+
+
+def stage_train(work_dir: Path, opts: dict) -> dict:
+    """
+    Samples/sec over train_dqn epochs (data loading excluded).
+    """
+    import torch
+    from train_dqn import train_dqn
+
+    torch.manual_seed(opts["seed"])
+    with _quiet():
+        stats = train_dqn(
+            log_dir=str(work_dir / "logs"),
+            num_epochs=opts["epochs"],
+            batch_size=opts["batch_size"],
+            save_path=str(work_dir / "bench_weights.pth"),
+            best_save_path=str(work_dir / "bench_weights_best.pth"),
+        )
+
+    return {
+        "samples": stats["num_samples"],
+        "epochs": stats["epochs"],
+        "seconds": stats["train_seconds"],
+        "samples_per_sec": stats["samples_per_sec"],
+        "final_loss": stats["final_loss"],
+    }
+
+
+def stage_export(work_dir: Path, opts: dict) -> dict:
+    """
+    Checkpoint to dqn_weights.json and a flat DqnWeights.lua.
+    """
+    from export_weights import pytorch_to_json
+    from lua_weights import write_weights
+
+    checkpoint = _checkpoint_path(work_dir)
+    lua_path = work_dir / "DqnWeights.lua"
+
+    with _quiet():
+        start = time.perf_counter()
+        for _ in range(opts["export_repeats"]):
+            weights_obj = pytorch_to_json(checkpoint)
+            write_weights(weights_obj, work_dir / "dqn_weights.json", lua_path, "flat", opts["quantize"])
+        elapsed = time.perf_counter() - start
+
+    return {
+        "exports": opts["export_repeats"],
+        "quantize": opts["quantize"],
+        "lua_kb": lua_path.stat().st_size / 1024,
+        "seconds": elapsed,
+        "exports_per_sec": opts["export_repeats"] / max(elapsed, 1e-9),
+    }
+
+
+def flat_layers(encoded: list) -> list:
+    """
+    (W, b, in_dim, use_relu) per layer, with W flattened row-major as in the
+    exported Lua module (W[(j - 1) * in_dim + i]).
+    """
+    return [
+        (e["W_seen"].ravel().tolist(), e["b_seen"].tolist(), e["in_dim"], e["activation"] == "relu")
+        for e in encoded
+    ]
+
+
+def q_values_python(layers: list, state: List[float]) -> List[float]:
+    """
+    Plain-Python mirror of Agent:qValues for the flat layout: one scalar
+    multiply-add at a time, as the Luau interpreter executes it.
+    """
+    x = state
+    for W, b, in_dim, use_relu in layers:
+        y = []
+        for j in range(len(b)):
+            total = b[j]
+            base = j * in_dim
+            for i in range(in_dim):
+                total += W[base + i] * x[i]
+            if use_relu and total < 0.0:
+                total = 0.0
+            y.append(total)
+        x = y
+    return x
+
+
+def stage_qvalues(work_dir: Path, opts: dict) -> dict:
+    """
+    Decisions/sec for the pure-Python Agent:qValues stand-in (forward + argmax).
+    """
+    from export_weights import pytorch_to_json, sample_states
+    from lua_weights import count_macs, encode_flat_layers, forward_encoded
+
+    with _quiet():
+        weights_obj = pytorch_to_json(_checkpoint_path(work_dir))
+        states = sample_states(opts["decisions"], weights_obj["state_dim"], work_dir / "logs")
+    encoded = encode_flat_layers(weights_obj, opts["quantize"])
+    layers = flat_layers(encoded)
+    state_lists = states.tolist()
+
+    start = time.perf_counter()
+    actions = []
+    for state in state_lists:
+        q = q_values_python(layers, state)
+        actions.append(max(range(len(q)), key=q.__getitem__))
+    elapsed = time.perf_counter() - start
+
+    # The stand-in must compute what the exported module computes
+    reference = forward_encoded(encoded, states).argmax(axis=1)
+    agreement = float(np.mean(np.asarray(actions) == reference))
+
+    return {
+        "decisions": len(state_lists),
+        "macs_per_decision": count_macs(weights_obj),
+        "seconds": elapsed,
+        "decisions_per_sec": len(state_lists) / max(elapsed, 1e-9),
+        "argmax_agreement": agreement,
+    }
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[[Path, dict], dict]] = {
+    "ingest": stage_ingest,
+    "load": stage_load,
+    "tensors": stage_tensors,
+    "train": stage_train,
+    "export": stage_export,
+    "qvalues": stage_qvalues,
+}
+
+
+def _run_stage(name: str, work_dir: str, opts: dict) -> dict:
+    # Executed in a fresh spawned process; seed everything a stage might sample from
+    sys.path.insert(0, str(BASE_DIR))
+    random.seed(opts["seed"])
+    np.random.seed(opts["seed"])
+    metrics = STAGE_FUNCTIONS[name](Path(work_dir), opts)
+    metrics["peak_rss_mb"] = _peak_rss_mb()
+    return metrics
+
+
+def run_stage(name: str, work_dir: Path, opts: dict) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(_run_stage, name, str(work_dir), opts).result()
+
+
+# -----------------------------
+# Baseline comparison
+# -----------------------------
+def metric_direction(name: str) -> int:
+    """
+    +1 if larger is better, -1 if smaller is better, 0 if not compared.
+    """
+    if name.endswith(HIGHER_IS_BETTER):
+        return 1
+    if name.endswith(LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float) -> List[dict]:
+    """
+    Per-metric relative change against the baseline. A metric regresses when it
+    is worse by more than `tolerance` (a fraction of the baseline value).
+    """
+    rows = []
+    for stage, metrics in results["stages"].items():
+        base_metrics = baseline.get("stages", {}).get(stage, {})
+        for name, value in metrics.items():
+            direction = metric_direction(name)
+            base = base_metrics.get(name)
+            if direction == 0 or not isinstance(value, (int, float)) or not isinstance(base, (int, float)) or base == 0:
+                continue
+            change = (value - base) / abs(base)
+            rows.append({
+                "stage": stage,
+                "metric": name,
+                "baseline": base,
+                "value": value,
+                "change": change,
+                "regressed": direction * change < -tolerance,
+            })
+    return rows
+
+
+def print_results(results: dict):
+    print("\n=== Benchmark Results ===")
+    for stage, metrics in results["stages"].items():
+        shown = ", ".join(
+            f"{k}={v:,.1f}" if isinstance(v, float) else f"{k}={v}"
+            for k, v in metrics.items()
+            if metric_direction(k) != 0 or k == "seconds"
+        )
+        print(f"{stage:>8}: {shown}")
+
+
+def print_comparison(rows: List[dict], tolerance: float):
+    print(f"\n=== Baseline Comparison (tolerance {tolerance:.0%}) ===")
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['stage']:>8} {row['metric']:<22} {row['baseline']:>14,.1f} -> {row['value']:>14,.1f} "
+            f"({row['change']:+.1%}) {flag}"
+        )
+
+
+def environment_info() -> dict:
+    # Versions from package metadata so the parent process never imports torch
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "torch": importlib.metadata.version("torch"),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end performance benchmark for the boat_rl pipeline")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--episodes", type=int, default=500, help="synthetic episodes to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ingest-requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64, help="concurrent ingest clients")
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--export-repeats", type=int, default=5)
+    parser.add_argument("--quantize", choices=("none", "float16", "int8"), default="none")
+    parser.add_argument("--decisions", type=int, default=20000, help="forward passes for the qvalues stage")
+    parser.add_argument("--work-dir", type=Path, default=None, help="keep synthetic logs and outputs here")
+    parser.add_argument("--out", type=Path, default=BASE_DIR / "benchmark_results.json")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative regression")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="also write the results here")
+    args = parser.parse_args()
+
+    opts = {
+        "seed": args.seed,
+        "ingest_requests": args.ingest_requests,
+        "concurrency": args.concurrency,
+        "epochs": args.epochs,
+        "batch_size": args.batch_size,
+        "export_repeats": args.export_repeats,
+        "quantize": args.quantize,
+        "decisions": args.decisions,
+    }
+
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="boat_rl_bench_"))
+    try:
+        print(f"Generating {args.episodes} synthetic episodes in {work_dir / 'logs'}")
+        synthetic = generate_synthetic_logs(work_dir / "logs", args.episodes, args.seed)
+        print(f"  {synthetic['transitions']:,} transitions, {synthetic['mb']:.1f} MB")
+
+        results = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "environment": environment_info(),
+                "scale": {"episodes": args.episodes, **opts},
+                "synthetic": synthetic,
+            },
+            "stages": {},
+        }
+        for name in STAGES:
+            if name not in args.stages:
+                continue
+            print(f"Running stage: {name}")
+            results["stages"][name] = run_stage(name, work_dir, opts)
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_results(results)
+    args.out.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {args.out}")
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(json.dumps(results, indent=2))
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline is not None:
+        rows = compare_to_baseline(results, json.loads(args.baseline.read_text()), args.tolerance)
+        print_comparison(rows, args.tolerance)
+        regressions = [r for r in rows if r["regressed"]]
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed beyond {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+# distill.py
+#
+# Shrink the trained Q-network for cheaper in-game inference.
+#
+# Agent:qValues evaluates every layer densely, so its cost per decision is
+# count_macs() of the exported net (18,432 multiply-adds for 11 -> 128 -> 128
+# -> 5). This script distills the teacher checkpoint into smaller students on
+# logged states. Optionally it also prunes hidden units by weight magnitude
+# and fine-tunes the result. It then reports, for every candidate, the
+# multiply-adds, argmax agreement with the teacher, and the teacher-Q regret
+# of the student's choices on held-out episodes.
+#
+# Pruning is structured: it removes whole hidden units, ranked by
+# |incoming| * |outgoing| weight norm. Zeroing single weights would not save
+# any work in the dense Luau loop.
+#
+# Students are trained on teacher Q-values scaled by their std, with an MSE
+# term plus a temperature-softened cross-entropy on the teacher's action
+# distribution, which is what argmax agreement depends on.
+#
+# The winner is the cheapest candidate that meets --min-reduction and
+# --min-agreement (or the most faithful one with at least --min-reduction
+# if none does). With --export it is saved as a train_dqn checkpoint and
+# written through the same DqnWeights.lua path as export_weights.py; a winner
+# below --min-agreement is only exported with --force-export.
+#
+# Usage:
+#   python distill.py --students 32 48,24 64,32 --prune 0.25 0.5
+#   python distill.py --students 64,32 --export --quantize int8
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from episode_manifest import load_manifest
+from export_weights import json_path, lua_path, roundtrip_check, sequential_to_json
+from lua_weights import LUA_FORMATS, QUANTIZE_MODES, forward_encoded, write_weights
+from parallel_loader import load_episode_arrays_parallel
+from train_daemon import is_heldout
+from train_dqn import DQN, load_dqn_checkpoint
+
+BASE_DIR = Path(__file__).resolve().parent
+
+DEFAULT_STUDENTS = ["32", "48,24", "64,32"]
+
+
+# -----------------------------
+# Data
+# -----------------------------
+def load_states(log_dir: str, state_dim: int, heldout_fraction: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unique logged states, split into (train, heldout) by episode file so that
+    near-identical consecutive states never straddle the split.
+    """
+    entries = [e for e in load_manifest(log_dir) if e["length"] > 0 and e["state_dim"] == state_dim]
+    if not entries:
+        raise FileNotFoundError(f"No {state_dim}-dim episodes in {log_dir}")
+
+    splits = {False: [], True: []}
+    for e in entries:
+        splits[is_heldout(e["file"], heldout_fraction)].append(os.path.join(log_dir, e["file"]))
+
+    states = []
+    for heldout in (False, True):
+        if not splits[heldout]:
+            states.append(np.zeros((0, state_dim), dtype=np.float32))
+            continue
+        columns = load_episode_arrays_parallel(splits[heldout], state_dim)
+        states.append(np.unique(columns["s"].astype(np.float32), axis=0))
+
+    train, heldout = states
+    if len(heldout) == 0:
+        # Too few episodes for the file-hash split; fall back to a row split
+        rng = np.random.default_rng(0)
+        order = rng.permutation(len(train))
+        cut = max(1, int(len(train) * heldout_fraction))
+        train, heldout = train[order[cut:]], train[order[:cut]]
+    return train, heldout
+
+
+@torch.no_grad()
+def predict(model: nn.Module, states: torch.Tensor, batch_size: int = 65536) -> torch.Tensor:
+    model.eval()
+    return torch.cat([model(states[i:i + batch_size]) for i in range(0, len(states), batch_size)])
+
+
+# -----------------------------
+# Distillation and pruning
+# -----------------------------
+def distill(
+    student: DQN,
+    states: torch.Tensor,
+    teacher_q: torch.Tensor,
+    epochs: int,
+    batch_size: int = 256,
+    lr: float = 1e-3,
+    temperature: float = 0.1,
+    ce_weight: float = 1.0,
+    seed: int = 0,
+) -> float:
+    """
+    Fit `student` to the teacher's Q-values on `states`, in place. Returns
+    the final epoch's mean loss.
+    """
+    scale = teacher_q.std().clamp_min(1e-6)
+    target = teacher_q / scale
+    soft_target = F.softmax(target / temperature, dim=1)
+
+    # Train in the scaled units; a pruned warm start keeps its outputs
+    last = student.net[-1]
+    with torch.no_grad():
+        last.weight.div_(scale)
+        last.bias.div_(scale)
+
+    optimizer = torch.optim.Adam(student.parameters(), lr=lr)
+    generator = torch.Generator(device=states.device).manual_seed(seed)
+    epoch_loss = float("nan")
+    for _ in range(epochs):
+        student.train()
+        perm = torch.randperm(len(states), generator=generator, device=states.device)
+        total = 0.0
+        for i in range(0, len(states), batch_size):
+            idx = perm[i:i + batch_size]
+            q = student(states[idx])
+            loss = F.mse_loss(q, target[idx])
+            if ce_weight > 0:
+                log_probs = F.log_softmax(q / temperature, dim=1)
+                loss = loss + ce_weight * -(soft_target[idx] * log_probs).sum(dim=1).mean()
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total += loss.item() * len(idx)
+        epoch_loss = total / len(states)
+
+    # Undo the target scaling so the student predicts Q-values directly
+    with torch.no_grad():
+        last.weight.mul_(scale)
+        last.bias.mul_(scale)
+    student.eval()
+    return epoch_loss
+
+
+def prune_hidden_units(model: DQN, fraction: float) -> DQN:
+    """
+    A copy of `model` with `fraction` of every hidden layer's units removed,
+    keeping the units with the largest |incoming| * |outgoing| weight norm.
+    """
+    linears = [m for m in model.net if isinstance(m, nn.Linear)]
+    keep_in = torch.arange(linears[0].in_features)
+    sliced = []
+    for layer, nxt in zip(linears[:-1], linears[1:]):
+        W = layer.weight.detach()[:, keep_in]
+        score = W.norm(dim=1) * nxt.weight.detach().norm(dim=0)
+        keep = max(1, int(round(layer.out_features * (1.0 - fraction))))
+        keep_out = torch.sort(torch.topk(score, keep).indices).values
+        sliced.append((W[keep_out], layer.bias.detach()[keep_out]))
+        keep_in = keep_out
+    last = linears[-1]
+    sliced.append((last.weight.detach()[:, keep_in], last.bias.detach()))
+
+    pruned = DQN(linears[0].in_features, last.out_features, [len(b) for _, b in sliced[:-1]])
+    with torch.no_grad():
+        for layer, (W, b) in zip((m for m in pruned.net if isinstance(m, nn.Linear)), sliced):
+            layer.weight.copy_(W)
+            layer.bias.copy_(b)
+    return pruned.to(W.device)
+
+
+def model_macs(model: DQN) -> int:
+    linears = [m for m in model.net if isinstance(m, nn.Linear)]
+    return sum(m.in_features * m.out_features for m in linears)
+
+
+def evaluate(model: nn.Module, states: torch.Tensor, teacher_q: torch.Tensor) -> dict:
+    """
+    Agreement with the teacher's greedy action, and how much teacher Q the
+    student's choice gives up (0 when they agree or the teacher is tied).
+    """
+    q = predict(model, states)
+    choice = q.argmax(dim=1)
+    best = teacher_q.max(dim=1).values
+    regret = best - teacher_q.gather(1, choice[:, None]).squeeze(1)
+    return {
+        "argmax_agreement": float((choice == teacher_q.argmax(dim=1)).float().mean()),
+        "mean_regret": float(regret.mean()),
+        "max_regret": float(regret.max()),
+        "mean_abs_q_error": float((q - teacher_q).abs().mean()),
+    }
+
+
+def parse_hidden_sizes(spec: str) -> Tuple[int, ...]:
+    sizes = tuple(int(h) for h in spec.split(",") if h.strip())
+    if not sizes or min(sizes) < 1:
+        raise ValueError(f"Bad student architecture {spec!r}; expected e.g. 32 or 64,32")
+    return sizes
+
+
+def architecture_name(state_dim: int, hidden_sizes: Sequence[int], num_actions: int) -> str:
+    return " -> ".join(str(d) for d in (state_dim, *hidden_sizes, num_actions))
+
+
+def select_winner(candidates: List[dict], min_reduction: float, min_agreement: float) -> Optional[dict]:
+    eligible = [c for c in candidates if c["reduction"] >= min_reduction]
+    if not eligible:
+        return None
+    passing = [c for c in eligible if c["argmax_agreement"] >= min_agreement]
+    if passing:
+        return min(passing, key=lambda c: (c["macs"], -c["argmax_agreement"]))
+    return max(eligible, key=lambda c: (c["argmax_agreement"], -c["macs"]))
+
+
+def print_candidates(candidates: List[dict], teacher_macs: int, winner: Optional[dict]):
+    print(f"\n{'candidate':<22} {'architecture':<24} {'MACs':>7} {'x fewer':>8} "
+          f"{'agree':>7} {'regret':>8} {'|dQ|':>8} {'train s':>8}")
+    print(f"{'teacher':<22} {'':<24} {teacher_macs:>7,} {1.0:>8.1f}")
+    for c in candidates:
+        mark = "  <- winner" if c is winner else ""
+        print(f"{c['name']:<22} {c['architecture']:<24} {c['macs']:>7,} {c['reduction']:>8.1f} "
+              f"{c['argmax_agreement']:>7.2%} {c['mean_regret']:>8.4f} {c['mean_abs_q_error']:>8.3f} "
+              f"{c['train_seconds']:>8.1f}{mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill and prune the DQN into cheaper students")
+    parser.add_argument("--checkpoint", type=Path, default=BASE_DIR / "dqn_weights_best.pth", help="teacher")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--students", nargs="*", default=DEFAULT_STUDENTS,
+                        help="hidden sizes per student, e.g. 32 64,32 (default: %(default)s)")
+    parser.add_argument("--prune", type=float, nargs="*", default=[],
+                        help="also prune each student and the teacher by these hidden-unit fractions")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--prune-epochs", type=int, default=10, help="fine-tuning epochs after pruning")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--lr", type=float, default=1e-3)
+    parser.add_argument("--temperature", type=float, default=0.1, help="softmax temperature on scaled Q")
+    parser.add_argument("--ce-weight", type=float, default=1.0, help="weight of the action cross-entropy term")
+    parser.add_argument("--heldout-fraction", type=float, default=0.1)
+    parser.add_argument("--min-reduction", type=float, default=5.0, help="required multiply-add reduction")
+    parser.add_argument("--min-agreement", type=float, default=0.98, help="required held-out argmax agreement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", type=Path, default=None, help="write all candidates as JSON")
+    parser.add_argument("--export", action="store_true", help="save and export the winner to DqnWeights.lua")
+    parser.add_argument("--force-export", action="store_true",
+                        help="export the winner even if it is below --min-agreement")
+    parser.add_argument("--student-out", type=Path, default=BASE_DIR / "dqn_weights_student.pth")
+    parser.add_argument("--output", type=Path, default=lua_path)
+    parser.add_argument("--format", choices=LUA_FORMATS, default="flat")
+    parser.add_argument("--quantize", choices=QUANTIZE_MODES, default="none")
+    args = parser.parse_args()
+
+    try:
+        students = [parse_hidden_sizes(spec) for spec in args.students]
+    except ValueError as e:
+        parser.error(str(e))
+    if any(not 0.0 < f < 1.0 for f in args.prune):
+        parser.error("--prune fractions must be in (0, 1)")
+
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    torch.manual_seed(args.seed)
+
+    teacher, checkpoint = load_dqn_checkpoint(str(args.checkpoint), device=str(device))
+    state_dim = checkpoint.get("state_dim", 11)
+    num_actions = checkpoint.get("num_actions", 5)
+    teacher_macs = model_macs(teacher)
+    print(f"Teacher {args.checkpoint.name}: {architecture_name(state_dim, teacher.hidden_sizes, num_actions)}, "
+          f"{teacher_macs:,} multiply-adds per decision")
+
+    train_np, heldout_np = load_states(args.log_dir, state_dim, args.heldout_fraction)
+    train_states = torch.from_numpy(train_np).to(device)
+    heldout_states = torch.from_numpy(heldout_np).to(device)
+    train_q = predict(teacher, train_states)
+    heldout_q = predict(teacher, heldout_states)
+    print(f"Distilling on {len(train_states):,} unique states, evaluating on {len(heldout_states):,} held-out\n")
+
+    candidates: List[dict] = []
+    models: Dict[str, DQN] = {}
+
+    def add_candidate(name: str, model: DQN, loss: float, seconds: float):
+        macs = model_macs(model)
+        c = {
+            "name": name,
+            "hidden_sizes": list(model.hidden_sizes),
+            "architecture": architecture_name(state_dim, model.hidden_sizes, num_actions),
+            "macs": macs,
+            "reduction": teacher_macs / macs,
+            "final_loss": loss,
+            "train_seconds": seconds,
+            **evaluate(model, heldout_states, heldout_q),
+        }
+        candidates.append(c)
+        models[name] = model
+        print(f"  {name:<22} {c['architecture']:<24} agreement {c['argmax_agreement']:.2%} ({seconds:.1f}s)")
+
+    def add_pruned(base_name: str, base: DQN):
+        for fraction in args.prune:
+            start = time.perf_counter()
+            pruned = prune_hidden_units(base, fraction)
+            loss = distill(pruned, train_states, train_q, args.prune_epochs, args.batch_size, args.lr,
+                           args.temperature, args.ce_weight, args.seed)
+            add_candidate(f"{base_name} -{fraction:.0%}", pruned, loss, time.perf_counter() - start)
+
+    add_pruned("teacher", teacher)
+    for hidden_sizes in students:
+        start = time.perf_counter()
+        student = DQN(state_dim, num_actions, hidden_sizes).to(device)
+        loss = distill(student, train_states, train_q, args.epochs, args.batch_size, args.lr,
+                       args.temperature, args.ce_weight, args.seed)
+        name = "student " + ",".join(str(h) for h in hidden_sizes)
+        add_candidate(name, student, loss, time.perf_counter() - start)
+        add_pruned(name, student)
+
+    winner = select_winner(candidates, args.min_reduction, args.min_agreement)
+    print_candidates(candidates, teacher_macs, winner)
+
+    if args.report is not None:
+        args.report.write_text(json.dumps({
+            "teacher": str(args.checkpoint),
+            "teacher_macs": teacher_macs,
+            "train_states": len(train_states),
+            "heldout_states": len(heldout_states),
+            "candidates": candidates,
+            "winner": winner["name"] if winner else None,
+        }, indent=2))
+        print(f"\nWrote {args.report}")
+
+    if winner is None:
+        print(f"\nNo candidate reaches a {args.min_reduction:.1f}x multiply-add reduction")
+        return
+    below_agreement = winner["argmax_agreement"] < args.min_agreement
+    if below_agreement:
+        print(f"\nWARNING: no candidate with >={args.min_reduction:.1f}x fewer multiply-adds reaches "
+              f"{args.min_agreement:.0%} agreement; best is {winner['name']} "
+              f"({winner['argmax_agreement']:.2%})")
+    else:
+        print(f"\nWinner: {winner['name']} ({winner['reduction']:.1f}x fewer multiply-adds, "
+              f"{winner['argmax_agreement']:.2%} agreement)")
+
+    if not args.export:
+        return
+    if below_agreement and not args.force_export:
+        print(f"Not exporting {winner['name']}: below --min-agreement {args.min_agreement:.0%} "
+              f"(pass --force-export to export it anyway)")
+        return
+
+    model = models[winner["name"]].cpu()
+    torch.save({
+        "model_state_dict": model.state_dict(),
+        "state_dim": state_dim,
+        "num_actions": num_actions,
+        "hidden_sizes": list(model.hidden_sizes),
+        "distilled_from": str(args.checkpoint),
+        "distill_report": winner,
+    }, args.student_out)
+    print(f"Saved student checkpoint to {args.student_out}")
+
+    weights_obj = sequential_to_json(model.net, state_dim, num_actions)
+    header = (f"AUTO-GENERATED by boat_rl/distill.py ({winner['name']}, distilled from "
+              f"{args.checkpoint.name}). Do not edit by hand.")
+    encoded = write_weights(weights_obj, json_path, args.output, args.format, args.quantize, header)
+
+    if encoded:
+        report = roundtrip_check(args.student_out, encoded, heldout_np)
+        if report["argmax_agreement"] < 1.0:
+            print("WARNING: Exported weights change some argmax decisions; consider a finer --quantize")
+        q_lua = forward_encoded(encoded, heldout_np)
+        agreement = float(np.mean(q_lua.argmax(axis=1) == heldout_q.cpu().numpy().argmax(axis=1)))
+        print(f"  exported vs teacher argmax agreement = {agreement * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# episode_manifest.py
+#
+# Persistent per-episode statistics for a log directory, so episode filtering
+# in train_dqn can run without parsing every transitions_*.json file.
+#
+# The manifest lives next to the logs as <log_dir>/manifest.jsonl, one JSON
+# object per line:
+#   {"file": "transitions_001.json", "length": 312, "return": 41.7,
+#    "max_progress": 0.33, "state_dim": 11, "actions": {"1": 200, "3": 112},
+#    "mtime": 1731000000.0}
+#
+# log_data.py appends an entry as each episode arrives. Lines are only ever
+# appended; when a file is re-summarized the later line wins.
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from episode_store import read_json_episode
+
+MANIFEST_NAME = "manifest.jsonl"
+LOG_PATTERN_PREFIX = "transitions_"
+LOG_PATTERN_SUFFIX = ".json"
+
+
+def manifest_path(log_dir: str) -> str:
+    return os.path.join(log_dir, MANIFEST_NAME)
+
+
+def summarize_episode(fname: str, transitions: List[dict], mtime: float) -> dict:
+    """
+    Compute the manifest entry for one episode's transitions.
+    """
+    ep_return = 0.0
+    max_progress = 0.0
+    actions: Dict[str, int] = {}
+
+    for t in transitions:
+        ep_return += float(t.get("r", 0.0))
+        # state[0] is progress
+        if "s" in t and len(t["s"]) > 0:
+            max_progress = max(max_progress, t["s"][0])
+        if "a" in t:
+            key = str(t["a"])
+            actions[key] = actions.get(key, 0) + 1
+
+    state_dim = len(transitions[0].get("s", [])) if transitions else 0
+
+    return {
+        "file": fname,
+        "length": len(transitions),
+        "return": ep_return,
+        "max_progress": max_progress,
+        "state_dim": state_dim,
+        "actions": actions,
+        "mtime": mtime,
+    }
+
+
+def append_entries(log_dir: str, entries: List[dict]):
+    if not entries:
+        return
+    # One write call per batch keeps concurrent O_APPEND writers from interleaving lines
+    text = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+    with open(manifest_path(log_dir), "a") as f:
+        f.write(text)
+
+
+def record_episode(log_dir: str, path: str, transitions: List[dict]):
+    """
+    Append the manifest entry for a freshly written episode file.
+    """
+    entry = summarize_episode(os.path.basename(path), transitions, os.path.getmtime(path))
+    append_entries(log_dir, [entry])
+
+
+def read_manifest(log_dir: str) -> Dict[str, dict]:
+    """
+    Read the manifest as {file: entry}; later lines override earlier ones.
+    """
+    entries: Dict[str, dict] = {}
+    path = manifest_path(log_dir)
+    if not os.path.exists(path):
+        return entries
+
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Torn final line from an interrupted append
+                continue
+            entries[entry["file"]] = entry
+
+    return entries
+
+
+def load_manifest(log_dir: str = "logs", refresh: bool = True) -> List[dict]:
+    """
+    Return manifest entries for every transitions_*.json in log_dir, sorted by file name.
+
+    With refresh=True, files that are missing from the manifest or whose mtime
+    changed are parsed once and appended, so later calls are metadata-only.
+    """
+    entries = read_manifest(log_dir)
+
+    files = sorted(
+        f for f in os.listdir(log_dir)
+        if f.startswith(LOG_PATTERN_PREFIX) and f.endswith(LOG_PATTERN_SUFFIX)
+    )
+
+    result: List[dict] = []
+    stale: List[dict] = []
+
+    for fname in files:
+        entry: Optional[dict] = entries.get(fname)
+        if refresh:
+            mtime = os.path.getmtime(os.path.join(log_dir, fname))
+            if entry is None or entry.get("mtime") != mtime:
+                entry = summarize_episode(fname, read_json_episode(os.path.join(log_dir, fname)), mtime)
+                stale.append(entry)
+        if entry is not None:
+            result.append(entry)
+
+    if stale:
+        print(f"Manifest: summarized {len(stale)} new or changed episode files")
+        append_entries(log_dir, stale)
+
+    return result
+
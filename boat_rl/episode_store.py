@@ -0,0 +1,318 @@
+# episode_store.py
+#
+# Append-only columnar storage for logged transitions.
+#
+# Layout of a store directory:
+#   meta.json     {"state_dim": int, "version": int}
+#   s.f32         float32 [N, state_dim]   states
+#   ns.f32        float32 [N, state_dim]   next states
+#   a.i8          int8    [N]              actions (1-based, as logged by Roblox)
+#   r.f32         float32 [N]              rewards
+#   d.bool        bool    [N]              done flags
+#   episodes.idx  EPISODE_DTYPE [E]        per-episode offsets and stats
+#   sources.txt   absolute source path per episode (same order as episodes.idx)
+#
+# Columns are appended first and the index record last, so the index is the
+# commit point: bytes past the last indexed transition are ignored on read.
+#
+# Usage (convert existing JSON logs, safe to re-run):
+#   python episode_store.py logs archive/old_logs7 archive/old_logs8 --out store
+
+import argparse
+import glob
+import json
+import os
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+STORE_VERSION = 1
+
+EPISODE_DTYPE = np.dtype(
+    [
+        ("start", "<i8"),
+        ("length", "<i4"),
+        ("return", "<f4"),
+        ("max_progress", "<f4"),
+    ]
+)
+
+COLUMN_FILES = {
+    "s": "s.f32",
+    "ns": "ns.f32",
+    "a": "a.i8",
+    "r": "r.f32",
+    "d": "d.bool",
+}
+
+COLUMN_DTYPES = {
+    "s": np.float32,
+    "ns": np.float32,
+    "a": np.int8,
+    "r": np.float32,
+    "d": np.bool_,
+}
+
+
+# -----------------------------
+# JSON log parsing
+# -----------------------------
+def read_json_episode(path: str) -> List[dict]:
+    """
+    Read one transitions_*.json file and return its transition list.
+
+    Accepts the three layouts load_transitions understands: a bare list,
+    a {"transitions": [...]} payload, or a single transition dict.
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and "transitions" in data:
+        return data["transitions"]
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def episode_to_arrays(transitions: List[dict], state_dim: int) -> Tuple[np.ndarray, ...]:
+    """
+    Convert a list of transition dicts into column arrays (s, ns, a, r, d).
+    """
+    n = len(transitions)
+    s = np.empty((n, state_dim), dtype=np.float32)
+    ns = np.empty((n, state_dim), dtype=np.float32)
+    a = np.empty(n, dtype=np.int8)
+    r = np.empty(n, dtype=np.float32)
+    d = np.empty(n, dtype=np.bool_)
+
+    for i, t in enumerate(transitions):
+        if len(t["s"]) != state_dim or len(t["ns"]) != state_dim:
+            raise ValueError(
+                f"Inconsistent state dimension: expected {state_dim}, "
+                f"got s={len(t['s'])}, ns={len(t['ns'])}"
+            )
+        s[i] = t["s"]
+        ns[i] = t["ns"]
+        a[i] = t["a"]
+        r[i] = t["r"]
+        d[i] = bool(t["d"])
+
+    return s, ns, a, r, d
+
+
+# -----------------------------
+# Store
+# -----------------------------
+class EpisodeStore:
+    """
+    Append-only columnar episode store (see module header for the layout).
+    """
+
+    def __init__(self, root: str, state_dim: Optional[int] = None):
+        self.root = root
+        meta_path = os.path.join(root, "meta.json")
+
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta.get("version") != STORE_VERSION:
+                raise ValueError(f"Unsupported store version {meta.get('version')} at {root}")
+            if state_dim is not None and meta["state_dim"] != state_dim:
+                raise ValueError(
+                    f"Store at {root} has state_dim={meta['state_dim']}, requested {state_dim}"
+                )
+            self.state_dim = int(meta["state_dim"])
+        else:
+            if state_dim is None:
+                raise FileNotFoundError(f"No episode store at {root} (missing meta.json)")
+            os.makedirs(root, exist_ok=True)
+            with open(meta_path, "w") as f:
+                json.dump({"state_dim": state_dim, "version": STORE_VERSION}, f)
+            self.state_dim = int(state_dim)
+
+        # (episodes, transitions) committed so far; loaded lazily by append_episode
+        self._tail: Optional[Tuple[int, int]] = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    # ---- reading ----
+    def read_index(self) -> np.ndarray:
+        path = self._path("episodes.idx")
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=EPISODE_DTYPE)
+        raw = np.fromfile(path, dtype=np.uint8)
+        # Drop a torn trailing record from an interrupted append
+        usable = (raw.size // EPISODE_DTYPE.itemsize) * EPISODE_DTYPE.itemsize
+        return raw[:usable].view(EPISODE_DTYPE)
+
+    def read_sources(self) -> List[str]:
+        path = self._path("sources.txt")
+        if not os.path.exists(path):
+            return []
+        with open(path, "r") as f:
+            return [line.rstrip("\n") for line in f]
+
+    def num_transitions(self, index: Optional[np.ndarray] = None) -> int:
+        if index is None:
+            index = self.read_index()
+        if index.size == 0:
+            return 0
+        last = index[-1]
+        return int(last["start"]) + int(last["length"])
+
+    def memmap_columns(self, index: Optional[np.ndarray] = None) -> dict:
+        """
+        Memory-map every column, truncated to the committed transition count.
+        """
+        n = self.num_transitions(index)
+        columns = {}
+        for key, fname in COLUMN_FILES.items():
+            shape = (n, self.state_dim) if key in ("s", "ns") else (n,)
+            if n == 0:
+                columns[key] = np.zeros(shape, dtype=COLUMN_DTYPES[key])
+                continue
+            columns[key] = np.memmap(
+                self._path(fname), dtype=COLUMN_DTYPES[key], mode="r", shape=shape
+            )
+        return columns
+
+    # ---- writing ----
+    def _load_tail(self) -> Tuple[int, int]:
+        index = self.read_index()
+        sources = self.read_sources()
+        if len(sources) > index.size:
+            # Source line written but its index record never committed
+            with open(self._path("sources.txt"), "w") as f:
+                f.writelines(line + "\n" for line in sources[: index.size])
+        return index.size, self.num_transitions(index)
+
+    def append_episode(
+        self,
+        s: np.ndarray,
+        ns: np.ndarray,
+        a: np.ndarray,
+        r: np.ndarray,
+        d: np.ndarray,
+        source: str = "",
+    ) -> int:
+        """
+        Append one episode and return its episode number in the index.
+        """
+        n = len(a)
+        if n == 0:
+            raise ValueError("Cannot append an empty episode")
+        if s.shape != (n, self.state_dim) or ns.shape != (n, self.state_dim):
+            raise ValueError(
+                f"Expected states of shape ({n}, {self.state_dim}), got s={s.shape}, ns={ns.shape}"
+            )
+
+        if self._tail is None:
+            self._tail = self._load_tail()
+        episode_id, start = self._tail
+
+        columns = {"s": s, "ns": ns, "a": a, "r": r, "d": d}
+        for key, fname in COLUMN_FILES.items():
+            path = self._path(fname)
+            arr = np.ascontiguousarray(columns[key], dtype=COLUMN_DTYPES[key])
+            row_bytes = arr.itemsize * (self.state_dim if key in ("s", "ns") else 1)
+            with open(path, "ab") as f:
+                # Discard uncommitted bytes left behind by an interrupted append
+                f.truncate(start * row_bytes)
+                f.write(arr.tobytes())
+
+        record = np.zeros(1, dtype=EPISODE_DTYPE)
+        record["start"] = start
+        record["length"] = n
+        record["return"] = float(np.sum(r, dtype=np.float64))
+        record["max_progress"] = max(0.0, float(np.max(s[:, 0])))
+
+        with open(self._path("sources.txt"), "a") as f:
+            f.write(source.replace("\n", " ") + "\n")
+        with open(self._path("episodes.idx"), "ab") as f:
+            f.truncate(episode_id * EPISODE_DTYPE.itemsize)
+            f.write(record.tobytes())
+
+        self._tail = (episode_id + 1, start + n)
+        return episode_id
+
+
+# -----------------------------
+# Converter
+# -----------------------------
+def iter_json_logs(log_dirs: Iterable[str]) -> Iterable[str]:
+    for log_dir in log_dirs:
+        pattern = os.path.join(log_dir, "transitions_*.json")
+        for path in sorted(glob.glob(pattern)):
+            yield path
+
+
+def convert_json_logs(log_dirs: Iterable[str], out_dir: str, state_dim: int = 11) -> dict:
+    """
+    Ingest transitions_*.json files from the given directories into a store.
+
+    Files that are already listed in sources.txt are skipped, so the converter
+    can be re-run after new episodes arrive. Sources are compared as real
+    absolute paths, so the same directory spelled differently (or from another
+    working directory) is not ingested twice. Episodes whose state_dim does
+    not match the store (older log generations) are skipped and counted.
+    """
+    store = EpisodeStore(out_dir, state_dim=state_dim)
+    # Older stores recorded cwd-relative paths; resolve them the same way
+    known = {os.path.realpath(s) for s in store.read_sources()[: store.read_index().size]}
+
+    stats = {"added": 0, "skipped_known": 0, "skipped_empty": 0, "skipped_dim": 0, "errors": 0}
+
+    for path in iter_json_logs(log_dirs):
+        source = os.path.realpath(path)
+        if source in known:
+            stats["skipped_known"] += 1
+            continue
+
+        try:
+            transitions = read_json_episode(path)
+        except (OSError, ValueError) as e:
+            print(f"  Skipping unreadable {path}: {e}")
+            stats["errors"] += 1
+            continue
+
+        if not transitions:
+            stats["skipped_empty"] += 1
+            continue
+
+        try:
+            if len(transitions[0].get("s", [])) != store.state_dim:
+                stats["skipped_dim"] += 1
+                continue
+            arrays = episode_to_arrays(transitions, store.state_dim)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            print(f"  Skipping malformed {path}: {e}")
+            stats["errors"] += 1
+            continue
+
+        store.append_episode(*arrays, source=source)
+        known.add(source)
+        stats["added"] += 1
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert JSON transition logs into an episode store")
+    parser.add_argument("log_dirs", nargs="+", help="directories containing transitions_*.json")
+    parser.add_argument("--out", default="store", help="store directory (default: store)")
+    parser.add_argument("--state-dim", type=int, default=11)
+    args = parser.parse_args()
+
+    stats = convert_json_logs(args.log_dirs, args.out, state_dim=args.state_dim)
+    store = EpisodeStore(args.out)
+    index = store.read_index()
+
+    print(f"Converted logs into {args.out}")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    print(f"Store now holds {index.size} episodes, {store.num_transitions(index)} transitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,21 @@
+import argparse
+import glob
 import json
 import torch
+import torch.nn as nn
+import numpy as np
 from pathlib import Path
 
+from lua_weights import (
+    LUA_FORMATS,
+    QUANTIZE_MODES,
+    forward_encoded,
+    make_weights_obj,
+    print_architecture,
+    write_weights,
+)
+from train_dqn import load_dqn_checkpoint
+
 BASE_DIR = Path(__file__).resolve().parent
 
 # Input: PyTorch model checkpoint
@@ -14,6 +28,36 @@ json_path = BASE_DIR / "dqn_weights.json"
 lua_path = BASE_DIR.parent / "src" / "ai" / "navigation" / "DqnWeights.lua"
 
 
+def sequential_to_json(net: nn.Sequential, state_dim: int, num_actions: int) -> dict:
+    """
+    Walk an nn.Sequential of Linear/ReLU modules and build the weights object.
+
+    Each Linear becomes one layer; a ReLU directly after it sets that layer's
+    activation to "relu", otherwise it is "linear". Any other module type is
+    rejected, since Agent:qValues only implements these two.
+    """
+    layers = []
+    for name, module in net.named_children():
+        if isinstance(module, nn.Linear):
+            W = module.weight.detach().cpu().numpy()  # [out_dim, in_dim]
+            if module.bias is not None:
+                b = module.bias.detach().cpu().numpy()
+            else:
+                b = np.zeros(W.shape[0], dtype=np.float32)
+            layers.append([W, b, "linear"])
+        elif isinstance(module, nn.ReLU):
+            if not layers or layers[-1][2] != "linear":
+                raise ValueError(f"ReLU at net.{name} does not follow a Linear layer")
+            layers[-1][2] = "relu"
+        else:
+            raise ValueError(
+                f"Unsupported module net.{name} ({type(module).__name__}); "
+                "only Linear and ReLU can be exported"
+            )
+
+    return make_weights_obj(state_dim, num_actions, [tuple(layer) for layer in layers])
+
+
 def pytorch_to_json(checkpoint_path: Path) -> dict:
     """
     Convert PyTorch checkpoint to JSON-serializable format
@@ -22,114 +66,109 @@ def pytorch_to_json(checkpoint_path: Path) -> dict:
         'state_dim': int,
         'num_actions': int,
         'model_state_dict': OrderedDict,
+        'hidden_sizes': list,   # optional; inferred from the state_dict if missing
         ...
     }
     """
-    # Load checkpoint
-    checkpoint = torch.load(checkpoint_path, map_location='cpu')
-    
-    state_dict = checkpoint['model_state_dict']
+    model, checkpoint = load_dqn_checkpoint(str(checkpoint_path))
     state_dim = checkpoint.get('state_dim', 11)
     num_actions = checkpoint.get('num_actions', 5)
     
     print(f"Converting model with state_dim={state_dim}, num_actions={num_actions}")
-    
-    # Extract layers from sequential network
-    # Expected keys: net.0.weight, net.0.bias (layer 1), net.2.weight, net.2.bias (layer 2), etc.
-    layers = []
-    
-    # Layer 1: Linear(state_dim, 128)
-    W1 = state_dict['net.0.weight'].cpu().numpy()  # [128, state_dim]
-    b1 = state_dict['net.0.bias'].cpu().numpy()    # [128]
-    
-    layers.append({
-        'W': W1.tolist(),  # Convert to list for JSON
-        'b': b1.tolist(),
-    })
-    
-    # Layer 2: Linear(128, 128)
-    W2 = state_dict['net.2.weight'].cpu().numpy()  # [128, 128]
-    b2 = state_dict['net.2.bias'].cpu().numpy()    # [128]
-    
-    layers.append({
-        'W': W2.tolist(),
-        'b': b2.tolist(),
-    })
-    
-    # Layer 3: Linear(128, num_actions)
-    W3 = state_dict['net.4.weight'].cpu().numpy()  # [num_actions, 128]
-    b3 = state_dict['net.4.bias'].cpu().numpy()    # [num_actions]
-    
-    layers.append({
-        'W': W3.tolist(),
-        'b': b3.tolist(),
-    })
-    
-    # Validate dimensions
-    assert W1.shape == (128, state_dim), f"Layer 1 weight shape mismatch: {W1.shape}"
-    assert W2.shape == (128, 128), f"Layer 2 weight shape mismatch: {W2.shape}"
-    assert W3.shape == (num_actions, 128), f"Layer 3 weight shape mismatch: {W3.shape}"
-    
-    print(f"Layer 1: {W1.shape} ({state_dim} -> 128)")
-    print(f"Layer 2: {W2.shape} (128 -> 128)")
-    print(f"Layer 3: {W3.shape} (128 -> {num_actions})")
-    
-    weights_obj = {
-        'state_dim': state_dim,
-        'num_actions': num_actions,
-        'layers': layers,
-    }
+
+    weights_obj = sequential_to_json(model.net, state_dim, num_actions)
+    print_architecture(weights_obj)
     
     return weights_obj
 
 
-def export_to_lua(weights_obj: dict, output_path: Path):
+# -----------------------------
+# Round-trip check
+# -----------------------------
+def sample_states(num_states: int, state_dim: int, log_dir: Path = BASE_DIR / "logs") -> np.ndarray:
     """
-    Export weights to Lua format using JSON encoding
-    This creates a Lua file that uses HttpService:JSONDecode
+    Logged states for the round-trip check, padded with random states in the
+    feature ranges of Env.getState when there are not enough logs.
     """
-    # Minify JSON to reduce file size
-    minified_json = json.dumps(weights_obj, separators=(',', ':'))
-    
-    lua_code = f"""local HttpService = game:GetService("HttpService")
+    states = []
+    for path in sorted(glob.glob(str(log_dir / "transitions_*.json"))):
+        with open(path, "r") as f:
+            data = json.load(f)
+        transitions = data["transitions"] if isinstance(data, dict) else data
+        states.extend(t["s"] for t in transitions if len(t.get("s", [])) == state_dim)
+        if len(states) >= num_states:
+            break
+
+    rng = np.random.default_rng(0)
+    missing = num_states - len(states)
+    if missing > 0:
+        random_states = rng.uniform(-1.0, 1.0, size=(missing, state_dim))
+        random_states[:, 0] = rng.uniform(0.0, 1.0, size=missing)   # progress
+        random_states[:, 6:] = rng.uniform(0.0, 1.0, size=(missing, state_dim - 6))  # rays
+        states.extend(random_states.tolist())
+
+    return np.asarray(states[:num_states], dtype=np.float32)
+
+
+def roundtrip_check(checkpoint_path: Path, encoded: list, states: np.ndarray) -> dict:
+    """
+    Compare the PyTorch model against the exported values, evaluated the way
+    Agent:qValues does (double precision, per-layer activations).
+    """
+    model, _ = load_dqn_checkpoint(str(checkpoint_path))
 
--- AUTO-GENERATED by boat_rl/export_weights.py. Do not edit by hand.
--- Model: {weights_obj['state_dim']}-dim state, {weights_obj['num_actions']} actions
--- Architecture: {weights_obj['state_dim']} -> 128 -> 128 -> {weights_obj['num_actions']}
+    with torch.no_grad():
+        q_torch = model(torch.from_numpy(states)).numpy().astype(np.float64)
 
-local json = [=[{minified_json}]=]
+    q_lua = forward_encoded(encoded, states)
 
-local Weights = HttpService:JSONDecode(json)
+    abs_err = np.abs(q_lua - q_torch)
+    report = {
+        "num_states": int(states.shape[0]),
+        "max_abs_q_error": float(abs_err.max()),
+        "mean_abs_q_error": float(abs_err.mean()),
+        "argmax_agreement": float(np.mean(q_lua.argmax(axis=1) == q_torch.argmax(axis=1))),
+    }
 
-return Weights
-"""
-    
-    output_path.write_text(lua_code)
-    print(f"Exported Lua weights to {output_path}")
-    
-    # Print file size
-    size_kb = output_path.stat().st_size / 1024
-    print(f"File size: {size_kb:.1f} KB")
+    print(f"Round-trip check on {report['num_states']} states:")
+    print(f"  max |dQ| = {report['max_abs_q_error']:.3e}, mean |dQ| = {report['mean_abs_q_error']:.3e}")
+    print(f"  argmax agreement = {report['argmax_agreement'] * 100:.2f}%")
+    return report
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Export a trained DQN checkpoint to DqnWeights.lua")
+    parser.add_argument("--checkpoint", type=Path, default=weights_pth_path)
+    parser.add_argument("--output", type=Path, default=lua_path)
+    parser.add_argument("--format", choices=LUA_FORMATS, default="flat",
+                        help="json: embedded JSON string (HttpService:JSONDecode); "
+                             "flat: plain Luau numeric arrays, no decode at require time")
+    parser.add_argument("--quantize", choices=QUANTIZE_MODES, default="none",
+                        help="weight encoding for --format flat")
+    parser.add_argument("--check-states", type=int, default=4096,
+                        help="states used by the flat-format round-trip check (0 to skip)")
+    args = parser.parse_args()
+
     # Check if checkpoint exists
-    if not weights_pth_path.exists():
-        print(f"ERROR: Checkpoint not found at {weights_pth_path}")
+    if not args.checkpoint.exists():
+        print(f"ERROR: Checkpoint not found at {args.checkpoint}")
         print("Please run train_dqn.py first to generate weights")
         return
     
-    print(f"Loading weights from {weights_pth_path}")
+    print(f"Loading weights from {args.checkpoint}")
     
     # Convert PyTorch to JSON
-    weights_obj = pytorch_to_json(weights_pth_path)
-    
-    # Save intermediate JSON (optional, for debugging)
-    json_path.write_text(json.dumps(weights_obj, indent=2))
-    print(f"Saved JSON weights to {json_path}")
+    weights_obj = pytorch_to_json(args.checkpoint)
     
-    # Export to Lua
-    export_to_lua(weights_obj, lua_path)
+    # Save intermediate JSON (for debugging) and export to Lua
+    header = f"AUTO-GENERATED by boat_rl/export_weights.py --format {args.format}. Do not edit by hand."
+    encoded = write_weights(weights_obj, json_path, args.output, args.format, args.quantize, header)
+
+    if encoded and args.check_states > 0:
+        states = sample_states(args.check_states, weights_obj["state_dim"])
+        report = roundtrip_check(args.checkpoint, encoded, states)
+        if report["argmax_agreement"] < 1.0:
+            print("WARNING: Exported weights change some argmax decisions; consider a finer --quantize")
     
     print("\nExport complete!")
     print(f"  State dimension: {weights_obj['state_dim']}")
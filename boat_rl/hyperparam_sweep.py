@@ -0,0 +1,396 @@
+# hyperparam_sweep.py
+#
+# Parallel hyperparameter sweep over train_dqn's knobs that loads the
+# dataset exactly once.
+#
+# The parent parses every episode once (JSON logs or an episode store) and
+# copies the columns into multiprocessing.shared_memory blocks. Worker
+# processes map those blocks as zero-copy tensors. Each trial then only
+# selects its episodes and gathers minibatches from the shared rows.
+# Episode selection (elite_fraction, min_progress_threshold) runs per trial
+# on the per-episode returns, so those knobs sweep freely too.
+#
+# A fixed fraction of episodes is held out from every trial, chosen by file
+# name with train_daemon.is_heldout so it is the same split the daemon,
+# distill.py and policy_eval.py use. After each
+# epoch a trial reports its held-out Huber TD loss. It is stopped early if
+# that loss is non-finite, or if it is worse than the median of the other
+# trials with the same gamma at the same epoch (median stopping rule).
+# TD losses are only comparable at equal gamma, since gamma scales the
+# targets. The leaderboard therefore ranks within gamma groups.
+#
+# Usage:
+#   python hyperparam_sweep.py --grid lr=1e-4,3e-4,1e-3 batch_size=64,256 \
+#       gamma=0.95,0.99 --workers 4 --out sweep_results.json
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from train_daemon import is_heldout
+from train_dqn import DQN, episode_ranges_to_indices, q_and_targets, select_episodes
+
+# train_dqn keyword arguments a sweep may vary, with their defaults
+SWEEPABLE = {
+    "gamma": 0.95,
+    "lr": 1e-4,
+    "batch_size": 64,
+    "num_epochs": 10,
+    "elite_fraction": 0.5,
+    "min_progress_threshold": 0.2,
+    "use_double_dqn": True,
+}
+
+
+# -----------------------------
+# Dataset (loaded once, shared)
+# -----------------------------
+def load_episodes(log_dir: str, store_dir: Optional[str], state_dim: int) -> Tuple[Dict[str, np.ndarray], dict]:
+    """
+    All episodes as concatenated columns plus per-episode metadata
+    {"start", "length", "return", "max_progress", "file"} arrays; "file" is
+    the episode's log file name.
+    """
+    if store_dir is not None:
+        from episode_store import EpisodeStore
+
+        store = EpisodeStore(store_dir)
+        index = store.read_index()
+        columns = {key: np.ascontiguousarray(col) for key, col in store.memmap_columns(index).items()}
+        episodes = {key: np.asarray(index[key]) for key in ("start", "length", "return", "max_progress")}
+        episodes["file"] = np.array([os.path.basename(s) for s in store.read_sources()[: index.size]])
+        return columns, episodes
+
+    from episode_manifest import load_manifest
+    from parallel_loader import load_episode_arrays_parallel
+
+    entries = [e for e in load_manifest(log_dir) if e["length"] > 0 and e["state_dim"] == state_dim]
+    if not entries:
+        raise FileNotFoundError(f"No {state_dim}-dim episodes in {log_dir}")
+    columns = load_episode_arrays_parallel([os.path.join(log_dir, e["file"]) for e in entries], state_dim)
+    lengths = np.array([e["length"] for e in entries], dtype=np.int64)
+    episodes = {
+        "start": np.concatenate([[0], np.cumsum(lengths)[:-1]]),
+        "length": lengths,
+        "return": np.array([e["return"] for e in entries]),
+        "max_progress": np.array([e["max_progress"] for e in entries]),
+        "file": np.array([e["file"] for e in entries]),
+    }
+    return columns, episodes
+
+
+class SharedColumns:
+    """
+    Column arrays copied into named shared-memory blocks. `spec` is what a
+    worker needs to map them again (see _init_worker).
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.spec = {}
+        for key, col in columns.items():
+            block = shared_memory.SharedMemory(create=True, size=max(col.nbytes, 1))
+            np.ndarray(col.shape, dtype=col.dtype, buffer=block.buf)[...] = col
+            self.blocks.append(block)
+            self.spec[key] = (block.name, col.shape, col.dtype.str)
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+
+# Worker-process globals, set once by _init_worker
+_WORKER: dict = {}
+
+
+def _init_worker(
+    spec: dict, episodes: dict, heldout_rows, num_actions: int, threads: int, core_sets: list, counter, progress
+):
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+    if core_sets and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, core_sets[worker_id % len(core_sets)])
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+
+    blocks, tensors = [], {}
+    for key, (name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)  # keep the mapping alive for the worker's lifetime
+        tensors[key] = torch.from_numpy(np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+    _WORKER.update(blocks=blocks, tensors=tensors, episodes=episodes, num_actions=num_actions,
+                   heldout_rows=torch.from_numpy(heldout_rows), progress=progress)
+
+
+def _batch(rows) -> list:
+    """
+    Gather one minibatch from the shared columns, converted the way
+    columns_to_tensors converts a whole dataset (0-based actions, float dones).
+    """
+    t = _WORKER["tensors"]
+    return [
+        t["s"][rows],
+        t["a"][rows].long() - 1,
+        t["r"][rows],
+        t["ns"][rows],
+        t["d"][rows].float(),
+    ]
+
+
+def _heldout_loss(model, gamma: float, use_double_dqn: bool, batch_size: int = 8192) -> float:
+    rows = _WORKER["heldout_rows"]
+    total = 0.0
+    with torch.no_grad():
+        for start in range(0, rows.numel(), batch_size):
+            q_sa, targets = q_and_targets(model, model, *_batch(rows[start:start + batch_size]), gamma, use_double_dqn)
+            total += F.smooth_l1_loss(q_sa, targets, reduction="sum").item()
+    return total / max(rows.numel(), 1)
+
+
+def _should_stop(trial_id: int, gamma: float, epoch: int, loss: float, grace_epochs: int, margin: float) -> bool:
+    """
+    Median stopping rule against the other trials with the same gamma that
+    have reported this epoch.
+    """
+    if epoch < grace_epochs:
+        return False
+    peers = [
+        curve[epoch - 1]
+        for other, (other_gamma, curve) in _WORKER["progress"].items()
+        if other != trial_id and other_gamma == gamma and len(curve) >= epoch
+    ]
+    if len(peers) < 2:
+        return False
+    return loss > float(np.median(peers)) * (1.0 + margin)
+
+
+def run_trial(trial_id: int, params: dict, grace_epochs: int, margin: float, seed: int) -> dict:
+    """
+    Train one configuration on the shared dataset (mirrors train_dqn's loop).
+    """
+    start_time = time.perf_counter()
+    torch.manual_seed(seed + trial_id)
+    eps = _WORKER["episodes"]
+    train = np.flatnonzero(~eps["heldout"])
+    with contextlib.redirect_stdout(io.StringIO()):
+        selected = train[select_episodes(
+            eps["return"][train].tolist(),
+            eps["max_progress"][train].tolist(),
+            elite_fraction=params["elite_fraction"],
+            min_progress_threshold=params["min_progress_threshold"],
+        )]
+    rows = torch.from_numpy(episode_ranges_to_indices(eps["start"][selected], eps["length"][selected]))
+
+    state_dim, num_actions = _WORKER["tensors"]["s"].shape[1], _WORKER["num_actions"]
+    model = DQN(state_dim, num_actions)
+    target_model = DQN(state_dim, num_actions)
+    target_model.load_state_dict(model.state_dict())
+    target_model.eval()
+    optimizer = torch.optim.Adam(model.parameters(), lr=params["lr"])
+    loss_fn = nn.SmoothL1Loss()
+    gamma, double, batch_size = params["gamma"], params["use_double_dqn"], params["batch_size"]
+
+    status, train_loss, heldout_curve = "done", float("nan"), []
+    for epoch in range(1, params["num_epochs"] + 1):
+        model.train()
+        epoch_loss = torch.zeros(())
+        num_batches = 0
+        perm = rows[torch.randperm(rows.numel())]
+        for b in range(0, perm.numel(), batch_size):
+            q_sa, targets = q_and_targets(model, target_model, *_batch(perm[b:b + batch_size]), gamma, double)
+            loss = loss_fn(q_sa, targets)
+            optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+            optimizer.step()
+            epoch_loss += loss.detach()
+            num_batches += 1
+        train_loss = epoch_loss.item() / max(num_batches, 1)
+        target_model.load_state_dict(model.state_dict())
+
+        model.eval()
+        heldout = _heldout_loss(model, gamma, double)
+        heldout_curve.append(heldout)
+        # Reassign (not mutate) so the manager proxy sees the update
+        _WORKER["progress"][trial_id] = (gamma, list(heldout_curve))
+
+        if not (np.isfinite(train_loss) and np.isfinite(heldout)):
+            status = "diverged"
+            break
+        if epoch < params["num_epochs"] and _should_stop(trial_id, gamma, epoch, heldout, grace_epochs, margin):
+            status = "pruned"
+            break
+
+    return {
+        "trial": trial_id,
+        "params": params,
+        "status": status,
+        "epochs_run": len(heldout_curve),
+        "train_samples": int(rows.numel()),
+        "final_train_loss": train_loss,
+        "heldout_loss": heldout_curve[-1] if heldout_curve else float("nan"),
+        "best_heldout_loss": min(heldout_curve) if heldout_curve else float("nan"),
+        "heldout_curve": heldout_curve,
+        "seconds": time.perf_counter() - start_time,
+        "worker_pid": os.getpid(),
+    }
+
+
+# -----------------------------
+# Sweep
+# -----------------------------
+def parse_grid(specs: List[str]) -> Dict[str, list]:
+    """
+    --grid key=v1,v2 ... -> {key: [values]}, typed after the train_dqn default.
+    """
+    grid = {}
+    for spec in specs:
+        key, _, values = spec.partition("=")
+        if key not in SWEEPABLE or not values:
+            raise ValueError(f"Grid entries look like <key>=v1,v2,... with key in {sorted(SWEEPABLE)}, got {spec!r}")
+        kind = type(SWEEPABLE[key])
+        if kind is bool:
+            grid[key] = [v.strip().lower() in ("1", "true", "yes") for v in values.split(",")]
+        else:
+            grid[key] = [kind(float(v)) if kind is int else kind(v) for v in values.split(",")]
+    return grid
+
+
+def expand_grid(grid: Dict[str, list], max_trials: Optional[int], seed: int) -> List[dict]:
+    keys = list(grid)
+    configs = [
+        {**SWEEPABLE, **dict(zip(keys, combo))}
+        for combo in itertools.product(*(grid[k] for k in keys))
+    ]
+    if max_trials is not None and len(configs) > max_trials:
+        picks = np.random.default_rng(seed).choice(len(configs), size=max_trials, replace=False)
+        configs = [configs[i] for i in sorted(picks)]
+    return configs
+
+
+def core_sets_for(workers: int, threads: int) -> list:
+    if not hasattr(os, "sched_getaffinity"):
+        return []
+    cores = sorted(os.sched_getaffinity(0))
+    if len(cores) < workers * threads:
+        return []  # oversubscribed: let the scheduler place workers
+    return [cores[w * threads:(w + 1) * threads] for w in range(workers)]
+
+
+def print_leaderboard(results: List[dict], swept: List[str]):
+    print("\n=== Leaderboard (held-out TD loss, ranked within each gamma) ===")
+    widths = {k: max(len(k), 8) for k in swept}
+    header = f"{'rank':>4} {'trial':>5} " + " ".join(f"{k:>{widths[k]}}" for k in swept)
+    header += f" {'status':>8} {'epochs':>6} {'train loss':>11} {'held-out':>10} {'seconds':>8}"
+    for gamma in sorted({r["params"]["gamma"] for r in results}):
+        group = sorted(
+            (r for r in results if r["params"]["gamma"] == gamma),
+            key=lambda r: (r["status"] == "diverged", r["heldout_loss"] if np.isfinite(r["heldout_loss"]) else np.inf),
+        )
+        print(f"\ngamma={gamma}")
+        print(header)
+        for rank, r in enumerate(group, start=1):
+            values = " ".join(f"{str(r['params'][k]):>{widths[k]}}" for k in swept)
+            print(f"{rank:>4} {r['trial']:>5} {values} {r['status']:>8} {r['epochs_run']:>6} "
+                  f"{r['final_train_loss']:>11.5f} {r['heldout_loss']:>10.5f} {r['seconds']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel DQN hyperparameter sweep over one shared dataset")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--store-dir", default=None, help="columnar episode store instead of JSON logs")
+    parser.add_argument("--state-dim", type=int, default=11)
+    parser.add_argument("--num-actions", type=int, default=None, help="default: highest logged action")
+    parser.add_argument("--grid", nargs="+", default=[],
+                        help="e.g. lr=1e-4,3e-4 batch_size=64,256 use_double_dqn=true,false")
+    parser.add_argument("--max-trials", type=int, default=None, help="random subset of the grid")
+    parser.add_argument("--workers", type=int, default=None, help="parallel trials (default: cores / threads)")
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--heldout-fraction", type=float, default=0.1)
+    parser.add_argument("--grace-epochs", type=int, default=2, help="epochs before a trial can be pruned")
+    parser.add_argument("--prune-margin", type=float, default=0.0,
+                        help="prune when held-out loss exceeds the peer median by this fraction")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="sweep_results.json")
+    args = parser.parse_args()
+
+    grid = parse_grid(args.grid)
+    configs = expand_grid(grid, args.max_trials, args.seed)
+    workers = args.workers or max(1, (os.cpu_count() or 1) // args.threads_per_worker)
+
+    load_start = time.perf_counter()
+    columns, episodes = load_episodes(args.log_dir, args.store_dir, args.state_dim)
+    num_actions = args.num_actions or int(columns["a"].max())
+    episodes["heldout"] = np.array([is_heldout(f, args.heldout_fraction) for f in episodes.pop("file")], dtype=bool)
+    heldout_rows = episode_ranges_to_indices(
+        episodes["start"][episodes["heldout"]], episodes["length"][episodes["heldout"]]
+    )
+    shared = SharedColumns(columns)
+    load_seconds = time.perf_counter() - load_start
+    print(f"Loaded {len(episodes['length'])} episodes ({len(columns['a']):,} transitions, "
+          f"{sum(c.nbytes for c in columns.values()) / 1e6:.1f} MB shared) in {load_seconds:.2f}s; "
+          f"{int(episodes['heldout'].sum())} episodes held out, {num_actions} actions")
+    del columns
+    print(f"Running {len(configs)} trials on {workers} workers x {args.threads_per_worker} threads\n")
+
+    ctx = get_context("spawn")
+    results: List[dict] = []
+    sweep_start = time.perf_counter()
+    try:
+        with ctx.Manager() as manager:
+            progress = manager.dict()
+            counter = ctx.Value("i", 0)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=ctx,
+                initializer=_init_worker,
+                initargs=(shared.spec, episodes, heldout_rows, num_actions, args.threads_per_worker,
+                          core_sets_for(workers, args.threads_per_worker), counter, progress),
+            ) as pool:
+                futures = [
+                    pool.submit(run_trial, i, params, args.grace_epochs, args.prune_margin, args.seed)
+                    for i, params in enumerate(configs)
+                ]
+                for future in as_completed(futures):
+                    r = future.result()
+                    results.append(r)
+                    print(f"  trial {r['trial']:>3} {r['status']:>8} after {r['epochs_run']} epochs: "
+                          f"held-out {r['heldout_loss']:.5f} ({r['seconds']:.1f}s) "
+                          f"[{len(results)}/{len(configs)}]")
+    finally:
+        shared.close()
+    sweep_seconds = time.perf_counter() - sweep_start
+
+    results.sort(key=lambda r: r["trial"])
+    print_leaderboard(results, list(grid) or ["gamma"])
+    pruned = sum(r["status"] == "pruned" for r in results)
+    print(f"\nLoad {load_seconds:.1f}s + sweep {sweep_seconds:.1f}s; {pruned} trials pruned early")
+
+    with open(args.out, "w") as f:
+        json.dump({
+            "grid": grid,
+            "load_seconds": load_seconds,
+            "sweep_seconds": sweep_seconds,
+            "workers": workers,
+            "threads_per_worker": args.threads_per_worker,
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# inference_loadgen.py
+#
+# Load generator for inference_server.py: simulates many bots, each asking
+# for Q-values once per decision step (Config.stepInterval), and compares
+# the result with every bot running its own interpreted forward pass.
+#
+# Each simulated bot sends one logged state, waits for the answer, then
+# sleeps for the rest of its step interval (--step-interval 0 sends
+# back to back to find peak throughput). Bots start at random offsets within
+# the first interval, as real bots do. Reported:
+#   client side   decisions/s, p50/p99 round-trip latency, and the share of
+#                 decisions that took longer than a step interval
+#   server side   /metrics: p50/p99 latency, queue wait, batch-size histogram
+#   baseline      decisions/s of one core running the plain-Python
+#                 Agent:qValues stand-in from benchmark.py, one state at a
+#                 time. It is a proxy for per-bot Luau (a different
+#                 interpreter), not a measurement of it.
+#
+# Without --url a server is started on a free port with the given
+# checkpoint and batching flags, and stopped afterwards.
+#
+# Usage:
+#   python inference_loadgen.py --bots 300 --duration 10
+#   python inference_loadgen.py --bots 500 --step-interval 0 --max-wait-ms 5
+#   python inference_loadgen.py --url http://127.0.0.1:5001 --bots 200
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import aiohttp
+import numpy as np
+
+from benchmark import flat_layers, q_values_python
+from export_weights import pytorch_to_json, sample_states
+from lua_weights import count_macs, encode_flat_layers
+
+BASE_DIR = Path(__file__).resolve().parent
+
+STEP_INTERVAL = 0.1  # Config.stepInterval
+SERVER_START_TIMEOUT = 30.0
+SERVER_SHUTDOWN_TIMEOUT = 15.0
+BASELINE_DECISIONS = 2000
+
+
+# -----------------------------
+# Server process
+# -----------------------------
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(url: str, proc: Optional[subprocess.Popen]):
+    deadline = time.perf_counter() + SERVER_START_TIMEOUT
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() < deadline:
+            if proc is not None and proc.poll() is not None:
+                raise RuntimeError(f"inference_server.py exited with code {proc.returncode}")
+            try:
+                async with session.get(f"{url}/metrics") as resp:
+                    if resp.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"No inference server answering at {url}")
+
+
+# -----------------------------
+# Simulated bots
+# -----------------------------
+async def run_bot(
+    session: aiohttp.ClientSession,
+    url: str,
+    states: List[List[float]],
+    step_interval: float,
+    stop_at: float,
+    latencies: List[float],
+    errors: List[int],
+):
+    rng = random.Random()
+    await asyncio.sleep(rng.uniform(0.0, step_interval))
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        try:
+            async with session.post(f"{url}/q", json={"state": rng.choice(states)}) as resp:
+                await resp.read()
+                ok = resp.status == 200
+        except aiohttp.ClientError:
+            ok = False
+        elapsed = time.perf_counter() - start
+        if ok:
+            latencies.append(elapsed)
+        else:
+            errors[0] += 1
+        if step_interval > 0:
+            await asyncio.sleep(max(0.0, step_interval - elapsed))
+
+
+async def generate_load(url: str, states: List[List[float]], bots: int, duration: float, step_interval: float) -> dict:
+    latencies: List[float] = []
+    errors = [0]
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        stop_at = start + duration
+        await asyncio.gather(*(
+            run_bot(session, url, states, step_interval, stop_at, latencies, errors) for _ in range(bots)
+        ))
+        elapsed = time.perf_counter() - start
+        async with session.get(f"{url}/metrics") as resp:
+            server = await resp.json()
+    return {"latencies": latencies, "errors": errors[0], "elapsed": elapsed, "server": server}
+
+
+def python_baseline(checkpoint: str, states: np.ndarray) -> dict:
+    """
+    Decisions/sec of the one-state-at-a-time plain-Python forward pass.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        weights_obj = pytorch_to_json(Path(checkpoint))
+    layers = flat_layers(encode_flat_layers(weights_obj))
+    state_lists = states[:BASELINE_DECISIONS].tolist()
+    start = time.perf_counter()
+    for state in state_lists:
+        q = q_values_python(layers, state)
+        max(range(len(q)), key=q.__getitem__)
+    elapsed = time.perf_counter() - start
+    return {"macs": count_macs(weights_obj), "decisions_per_sec": len(state_lists) / max(elapsed, 1e-9)}
+
+
+def print_report(result: dict, bots: int, step_interval: float, baseline: Optional[dict]):
+    lat = np.asarray(result["latencies"]) * 1000.0
+    decisions = len(lat)
+    rate = decisions / max(result["elapsed"], 1e-9)
+    print(f"\n{bots} bots, {result['elapsed']:.1f}s: {decisions:,} decisions ({rate:,.0f}/s), {result['errors']} errors")
+    if decisions:
+        p50, p99 = np.percentile(lat, [50, 99])
+        print(f"  client round trip: p50 {p50:.2f} ms, p99 {p99:.2f} ms, max {lat.max():.2f} ms")
+        if step_interval > 0:
+            late = np.mean(lat > step_interval * 1000.0)
+            print(f"  demand {bots / step_interval:,.0f}/s; {late:.2%} of decisions took longer than a step")
+
+    server = result["server"]
+    print(f"  server: p50 {server['latency_ms']['p50']:.2f} ms, p99 {server['latency_ms']['p99']:.2f} ms, "
+          f"queue wait p99 {server['queue_wait_ms']['p99']:.2f} ms, "
+          f"mean batch {server['mean_batch_size']:.1f} states, "
+          f"{server['inference_ms_per_batch']:.3f} ms per forward pass")
+    print("  batch sizes: " + ", ".join(f"<={k}: {v}" for k, v in server["batch_sizes"].items() if v))
+
+    if baseline is not None:
+        per_core = baseline["decisions_per_sec"]
+        print(f"\nPer-bot baseline ({baseline['macs']:,} multiply-adds, plain Python, one state at a time): "
+              f"{per_core:,.0f} decisions/s per core")
+        if step_interval > 0:
+            print(f"  {bots} bots at {1 / step_interval:.0f} decisions/s each need "
+                  f"{bots / step_interval / per_core:.2f} cores of interpreted inference")
+        print(f"  server throughput above: {rate / per_core:.1f}x the per-core baseline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many bots against inference_server.py")
+    parser.add_argument("--url", default=None, help="running server (default: start one)")
+    parser.add_argument("--checkpoint", default=str(BASE_DIR / "dqn_weights_best.pth"))
+    parser.add_argument("--bots", type=int, default=300)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--step-interval", type=float, default=STEP_INTERVAL,
+                        help="seconds between a bot's decisions (0: back to back)")
+    parser.add_argument("--max-batch", type=int, default=256, help="for a started server")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="for a started server")
+    parser.add_argument("--threads", type=int, default=1, help="torch threads for a started server")
+    parser.add_argument("--log-dir", default=str(BASE_DIR / "logs"), help="states to send")
+    parser.add_argument("--no-baseline", action="store_true", help="skip the plain-Python per-bot baseline")
+    args = parser.parse_args()
+
+    states = sample_states(4096, 11, Path(args.log_dir))
+    baseline = None if args.no_baseline else python_baseline(args.checkpoint, states)
+
+    proc = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        proc = subprocess.Popen(
+            [sys.executable, str(BASE_DIR / "inference_server.py"), "--checkpoint", args.checkpoint,
+             "--port", str(port), "--max-batch", str(args.max_batch),
+             "--max-wait-ms", str(args.max_wait_ms), "--threads", str(args.threads)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    try:
+        asyncio.run(wait_for_server(url, proc))
+        result = asyncio.run(generate_load(url, states.tolist(), args.bots, args.duration, args.step_interval))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=SERVER_SHUTDOWN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    print_report(result, args.bots, args.step_interval, baseline)
+
+
+if __name__ == "__main__":
+    main()
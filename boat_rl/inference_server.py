@@ -0,0 +1,301 @@
+# inference_server.py
+#
+# Optional local Q-value service for many concurrent bots, run next to
+# log_data.py. Instead of every bot evaluating Agent:qValues in interpreted
+# Luau one state at a time, bots POST their state and the server answers
+# with the Q-vector.
+#
+# Concurrent requests are coalesced into micro-batches. The batcher takes
+# the oldest queued request, then keeps adding requests until the batch
+# holds --max-batch states or --max-wait-ms has passed since that oldest
+# request arrived, and runs one forward pass for all of them on a dedicated
+# inference thread. While a batch is being computed new requests queue up,
+# so under load batches grow without waiting at all.
+#
+# Usage:
+#   python inference_server.py [--checkpoint dqn_weights_best.pth] [--port 5001]
+#       [--max-batch 256] [--max-wait-ms 2] [--threads 1]
+#   python inference_loadgen.py --bots 300      # simulated bots, see there
+#
+# POST /q
+#   {"state": [11 numbers]}          -> {"q": [5 numbers], "action": a}
+#   {"states": [[11 numbers], ...]}  -> {"q": [[...], ...], "actions": [...]}
+# Actions are the 1-based argmax; Agent:selectAction's overrides still apply
+# on the game side.
+#
+# GET /metrics returns request counts, p50/p99 latency (server side, body
+# received to response ready) and the batch-size histogram as JSON.
+
+import argparse
+import asyncio
+import bisect
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import torch
+from aiohttp import web
+
+from lua_weights import forward
+from train_dqn import load_dqn_checkpoint
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Upper bounds of the batch-size histogram buckets (states per forward pass)
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, float("inf")]
+
+# Recent requests kept for the latency percentiles
+LATENCY_WINDOW = 10_000
+
+
+# -----------------------------
+# Model
+# -----------------------------
+def load_policy(path: str) -> Tuple[Callable[[np.ndarray], np.ndarray], int, int]:
+    """
+    (q_fn, state_dim, num_actions) for a train_dqn checkpoint or an
+    exported weights JSON. q_fn maps a (B, state_dim) array to (B, num_actions).
+    """
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            weights_obj = json.load(f)
+        return (lambda states: forward(weights_obj, states)), weights_obj["state_dim"], weights_obj["num_actions"]
+
+    model, checkpoint = load_dqn_checkpoint(path)
+
+    @torch.no_grad()
+    def q_fn(states: np.ndarray) -> np.ndarray:
+        return model(torch.from_numpy(states)).numpy()
+
+    return q_fn, checkpoint.get("state_dim", 11), checkpoint.get("num_actions", 5)
+
+
+# -----------------------------
+# Metrics
+# -----------------------------
+class InferenceMetrics:
+    """
+    Request/batch counters and recent latencies. Only updated from the event loop.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.requests = 0
+        self.bad_requests = 0
+        self.states = 0
+        self.batches = 0
+        self.inference_seconds = 0.0
+        self.batch_counts = [0] * len(BATCH_SIZE_BUCKETS)
+        self.latencies_ms: deque = deque(maxlen=LATENCY_WINDOW)
+        self.queue_wait_ms: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def observe_batch(self, num_states: int, seconds: float):
+        self.batches += 1
+        self.states += num_states
+        self.inference_seconds += seconds
+        self.batch_counts[bisect.bisect_left(BATCH_SIZE_BUCKETS, num_states)] += 1
+
+    @staticmethod
+    def _percentiles(samples: deque) -> dict:
+        if not samples:
+            return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+        values = np.fromiter(samples, dtype=np.float64)
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        return {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(values.max())}
+
+    def to_dict(self) -> dict:
+        uptime = max(time.time() - self.started_at, 1e-9)
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "bad_requests": self.bad_requests,
+            "states": self.states,
+            "batches": self.batches,
+            "states_per_s": self.states / uptime,
+            "mean_batch_size": self.states / self.batches if self.batches else 0.0,
+            "inference_ms_per_batch": 1000.0 * self.inference_seconds / self.batches if self.batches else 0.0,
+            "latency_ms": self._percentiles(self.latencies_ms),
+            "queue_wait_ms": self._percentiles(self.queue_wait_ms),
+            "batch_sizes": {
+                ("+inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(BATCH_SIZE_BUCKETS, self.batch_counts)
+            },
+        }
+
+
+# -----------------------------
+# Micro-batching
+# -----------------------------
+class MicroBatcher:
+    """
+    Coalesces submitted state arrays into batched forward passes.
+    """
+
+    def __init__(
+        self,
+        q_fn: Callable[[np.ndarray], np.ndarray],
+        metrics: InferenceMetrics,
+        max_batch: int = 256,
+        max_wait_ms: float = 2.0,
+    ):
+        self.q_fn = q_fn
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        # One inference thread: batches run back to back, never concurrently
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, states: np.ndarray) -> np.ndarray:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((states, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> List[tuple]:
+        first = await self.queue.get()
+        batch = [first]
+        size = len(first[0])
+        deadline = first[2] + self.max_wait
+        while size < self.max_batch:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            started = time.perf_counter()
+            for _, _, queued_at in batch:
+                self.metrics.queue_wait_ms.append((started - queued_at) * 1000.0)
+
+            states = np.concatenate([s for s, _, _ in batch]) if len(batch) > 1 else batch[0][0]
+            try:
+                q = await loop.run_in_executor(self.pool, self.q_fn, states)
+            except Exception as e:  # surface model failures to the waiting requests
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.metrics.observe_batch(len(states), time.perf_counter() - started)
+
+            offset = 0
+            for s, future, _ in batch:
+                if not future.done():  # the client may have gone away
+                    future.set_result(q[offset:offset + len(s)])
+                offset += len(s)
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.pool.shutdown(wait=True)
+
+
+# -----------------------------
+# Server
+# -----------------------------
+class InferenceServer:
+    def __init__(self, checkpoint: str, max_batch: int = 256, max_wait_ms: float = 2.0):
+        q_fn, self.state_dim, self.num_actions = load_policy(checkpoint)
+        self.metrics = InferenceMetrics()
+        self.batcher = MicroBatcher(q_fn, self.metrics, max_batch, max_wait_ms)
+
+    def parse_states(self, data) -> Tuple[np.ndarray, bool]:
+        """
+        (states (B, state_dim) float32, single) from a request body.
+        """
+        if not isinstance(data, dict) or ("state" in data) == ("states" in data):
+            raise ValueError("body must have exactly one of 'state' or 'states'")
+        single = "state" in data
+        try:
+            states = np.asarray([data["state"]] if single else data["states"], dtype=np.float32)
+        except (TypeError, ValueError):
+            raise ValueError("states must be numeric")
+        if states.ndim != 2 or states.shape[1] != self.state_dim or len(states) == 0:
+            raise ValueError(f"expected {self.state_dim}-dim states, got shape {states.shape}")
+        return states, single
+
+    async def handle_q(self, request: web.Request) -> web.Response:
+        self.metrics.requests += 1
+        body = await request.read()
+        start = time.perf_counter()
+        try:
+            states, single = self.parse_states(json.loads(body))
+        except ValueError as e:
+            self.metrics.bad_requests += 1
+            return web.json_response({"error": str(e)}, status=400)
+
+        q = await self.batcher.submit(states)
+        actions = (q.argmax(axis=1) + 1).tolist()
+        if single:
+            result = {"q": q[0].tolist(), "action": actions[0]}
+        else:
+            result = {"q": q.tolist(), "actions": actions}
+        self.metrics.latencies_ms.append((time.perf_counter() - start) * 1000.0)
+        return web.json_response(result)
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.json_response(self.metrics.to_dict())
+
+    async def _on_startup(self, app: web.Application):
+        self.batcher.start()
+
+    async def _on_cleanup(self, app: web.Application):
+        await self.batcher.stop()
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/q", self.handle_q)
+        app.router.add_get("/metrics", self.handle_metrics)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-batching Q-value inference server")
+    parser.add_argument("--checkpoint", default=str(BASE_DIR / "dqn_weights_best.pth"),
+                        help="train_dqn checkpoint (.pth) or exported weights (.json)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--max-batch", type=int, default=256, help="states per forward pass")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="latency budget: longest a request waits for its batch to fill")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads")
+    args = parser.parse_args()
+
+    if args.max_batch < 1 or args.max_wait_ms < 0:
+        parser.error("--max-batch must be at least 1 and --max-wait-ms non-negative")
+    torch.set_num_threads(args.threads)
+
+    server = InferenceServer(args.checkpoint, args.max_batch, args.max_wait_ms)
+    print(f"Serving {args.checkpoint} ({server.state_dim}-dim states, {server.num_actions} actions), "
+          f"batches up to {args.max_batch} states within {args.max_wait_ms} ms")
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# live_stats.py
+#
+# Rolling fleet statistics for the ingest server (GET /stats on log_data.py).
+#
+# Each posted episode is reduced to one fixed-length summary vector while it
+# is parsed on the worker pool: return, max progress, steps, outcome
+# (finished / crashed / truncated / open), action counts and the posted
+# metadata.epsilon. Windows keep those vectors in a deque with running sums,
+# so adding an episode and evicting the oldest are O(1) no matter how large
+# the window is. The window maximum of max progress uses a monotonic deque
+# (amortized O(1)).
+#
+# Window specs: a plain integer keeps the last N episodes; a number with an
+# s/m/h suffix keeps the episodes received in the last that many seconds,
+# minutes or hours. The lifetime totals are always reported as "all".
+#
+#   python log_data.py --stats-windows 100,1000,5m,1h
+#   curl localhost:5000/stats?window=5m
+
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+from rewards import FINISH_PROGRESS, MAX_STEPS_PER_EPISODE
+
+NUM_ACTIONS = 5
+
+DEFAULT_WINDOWS = "100,1000,5m,1h"
+
+OUTCOMES = ("finished", "crashed", "truncated", "open")
+
+SUMMARY_FIELDS = (
+    ("return", "return_sq", "max_progress", "steps")
+    + OUTCOMES
+    + ("epsilon", "has_epsilon")
+    + tuple(f"action_{a}" for a in range(1, NUM_ACTIONS + 1))
+)
+FIELD_INDEX = {name: i for i, name in enumerate(SUMMARY_FIELDS)}
+
+TIME_UNITS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def episode_outcome(transitions: List[dict], max_steps: int = MAX_STEPS_PER_EPISODE) -> str:
+    """
+    Per-episode version of rewards.terminal_flags. "open" is an episode
+    whose last transition is not marked done.
+    """
+    last = transitions[-1]
+    if not last.get("d"):
+        return "open"
+    ns = last["ns"]
+    if len(ns) > 5 and ns[0] >= FINISH_PROGRESS and ns[5] == 0:
+        return "finished"
+    if len(transitions) >= max_steps - 1:
+        return "truncated"
+    return "crashed"
+
+
+def summarize_episode(transitions: List[dict], metadata: Optional[dict] = None) -> List[float]:
+    """
+    Summary vector of one episode, laid out as SUMMARY_FIELDS.
+    """
+    summary = [0.0] * len(SUMMARY_FIELDS)
+    if not transitions:
+        return summary
+
+    total = 0.0
+    max_progress = 0.0
+    for t in transitions:
+        total += t["r"]
+        max_progress = max(max_progress, t["s"][0])
+        a = t["a"]
+        if 1 <= a <= NUM_ACTIONS:
+            summary[FIELD_INDEX[f"action_{a}"]] += 1
+
+    summary[FIELD_INDEX["return"]] = total
+    summary[FIELD_INDEX["return_sq"]] = total * total
+    summary[FIELD_INDEX["max_progress"]] = max_progress
+    summary[FIELD_INDEX["steps"]] = len(transitions)
+    summary[FIELD_INDEX[episode_outcome(transitions)]] = 1.0
+
+    epsilon = (metadata or {}).get("epsilon")
+    if isinstance(epsilon, (int, float)) and not isinstance(epsilon, bool):
+        summary[FIELD_INDEX["epsilon"]] = float(epsilon)
+        summary[FIELD_INDEX["has_epsilon"]] = 1.0
+    return summary
+
+
+class RollingWindow:
+    """
+    Running sums over the last `episodes` episodes and/or the last `seconds`
+    seconds. With neither limit it accumulates forever.
+    """
+
+    def __init__(self, episodes: Optional[int] = None, seconds: Optional[float] = None):
+        self.episodes = episodes
+        self.seconds = seconds
+        self.count = 0
+        self.sums = [0.0] * len(SUMMARY_FIELDS)
+        self._seq = 0
+        self._entries: deque = deque()  # (seq, time, summary), only kept when bounded
+        self._max_progress: deque = deque()  # (seq, value), values decreasing
+
+    @property
+    def bounded(self) -> bool:
+        return self.episodes is not None or self.seconds is not None
+
+    def add(self, summary: Sequence[float], now: float):
+        self._seq += 1
+        self.count += 1
+        sums = self.sums
+        for i, value in enumerate(summary):
+            sums[i] += value
+
+        progress = summary[FIELD_INDEX["max_progress"]]
+        while self._max_progress and self._max_progress[-1][1] <= progress:
+            self._max_progress.pop()
+        self._max_progress.append((self._seq, progress))
+
+        if self.bounded:
+            self._entries.append((self._seq, now, summary))
+            self.evict(now)
+
+    def evict(self, now: float):
+        entries = self._entries
+        while entries and (
+            (self.episodes is not None and len(entries) > self.episodes)
+            or (self.seconds is not None and entries[0][1] < now - self.seconds)
+        ):
+            seq, _, summary = entries.popleft()
+            self.count -= 1
+            sums = self.sums
+            for i, value in enumerate(summary):
+                sums[i] -= value
+            if self._max_progress and self._max_progress[0][0] == seq:
+                self._max_progress.popleft()
+
+        if self.count == 0:
+            # Drop accumulated float error once the window drains
+            self.sums = [0.0] * len(SUMMARY_FIELDS)
+
+    def to_dict(self, now: float) -> dict:
+        if self.bounded:
+            self.evict(now)
+        n = self.count
+        if n == 0:
+            return {"episodes": 0}
+
+        sums = {name: self.sums[i] for name, i in FIELD_INDEX.items()}
+        mean_return = sums["return"] / n
+        variance = max(sums["return_sq"] / n - mean_return * mean_return, 0.0)
+        actions = [sums[f"action_{a}"] for a in range(1, NUM_ACTIONS + 1)]
+        total_actions = sum(actions)
+
+        stats = {
+            "episodes": n,
+            "transitions": int(round(sums["steps"])),
+            "mean_return": mean_return,
+            "std_return": math.sqrt(variance),
+            "mean_max_progress": sums["max_progress"] / n,
+            "max_progress": self._max_progress[0][1] if self._max_progress else 0.0,
+            "mean_steps": sums["steps"] / n,
+            "rates": {outcome: sums[outcome] / n for outcome in OUTCOMES},
+            "action_distribution": {
+                str(a): (count / total_actions if total_actions else 0.0)
+                for a, count in enumerate(actions, start=1)
+            },
+            "mean_epsilon": sums["epsilon"] / sums["has_epsilon"] if sums["has_epsilon"] >= 0.5 else None,
+        }
+        if self._entries:
+            stats["span_s"] = now - self._entries[0][1]
+        return stats
+
+
+def parse_window_spec(spec: str) -> Dict[str, RollingWindow]:
+    """
+    "100,1000,5m,1h" -> {"last_100": ..., "last_1000": ..., "5m": ..., "1h": ...}
+    """
+    windows: Dict[str, RollingWindow] = {}
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        try:
+            if part[-1].lower() in TIME_UNITS:
+                seconds = float(part[:-1]) * TIME_UNITS[part[-1].lower()]
+                if seconds <= 0:
+                    raise ValueError
+                windows[part] = RollingWindow(seconds=seconds)
+            else:
+                episodes = int(part)
+                if episodes <= 0:
+                    raise ValueError
+                windows[f"last_{episodes}"] = RollingWindow(episodes=episodes)
+        except ValueError:
+            raise ValueError(f"Bad stats window {part!r}; use an episode count or e.g. 30s, 5m, 1h")
+    return windows
+
+
+class LiveStats:
+    """
+    The configured windows plus lifetime totals. Not thread-safe: the ingest
+    server only touches it from the event loop.
+    """
+
+    def __init__(self, spec: str = DEFAULT_WINDOWS, clock=time.monotonic):
+        self.clock = clock
+        self.windows = parse_window_spec(spec)
+        self.windows["all"] = RollingWindow()
+        self.started_at = clock()
+
+    def add(self, summary: Sequence[float]):
+        now = self.clock()
+        for window in self.windows.values():
+            window.add(summary, now)
+
+    def to_dict(self, window: Optional[str] = None) -> dict:
+        now = self.clock()
+        names = [window] if window is not None else list(self.windows)
+        unknown = [name for name in names if name not in self.windows]
+        if unknown:
+            raise KeyError(unknown[0])
+        uptime = now - self.started_at
+        windows = {}
+        for name in names:
+            stats = windows[name] = self.windows[name].to_dict(now)
+            seconds = self.windows[name].seconds
+            if self.windows[name].episodes is not None:
+                # Episode-count windows cover the time since their oldest episode
+                covered = stats.get("span_s", 0.0)
+            else:
+                covered = uptime if seconds is None else min(seconds, uptime)
+            stats["episodes_per_min"] = stats["episodes"] * 60.0 / covered if covered > 0 else 0.0
+        return {"uptime_s": uptime, "windows": windows}
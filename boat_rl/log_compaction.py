@@ -0,0 +1,314 @@
+# log_compaction.py
+#
+# Merge JSON log generations (logs/, archive/old_logs*) into one compacted,
+# compressed shard set.
+#
+# Layout of a compacted directory:
+#   index.json         {"version": int, "episodes": [record, ...]}
+#   shard_00000.npz    np.savez_compressed columns s, ns, a, r, d
+#   shard_00001.npz    ...
+#
+# Each shard holds consecutive episodes of a single state_dim (older
+# generations logged 8- or 9-dim states). One index record per episode:
+#   {"shard": "shard_00000.npz", "start": 0, "length": 312, "return": 41.7,
+#    "max_progress": 0.33, "state_dim": 11, "generation": "old_logs7",
+#    "source": "/abs/path/archive/old_logs7/transitions_012.json", "hash": "..."}
+#
+# A generation is named after its directory's basename. Two different
+# directories with the same basename (archive/a/logs and logs) are refused
+# rather than merged into one generation.
+#
+# Empty and unparseable files are dropped, and episodes are deduplicated by a
+# hash of their decoded columns, so the same episode copied into two
+# generations (or re-serialized with different formatting) is kept once.
+# Shards are written first and index.json is replaced last, so an
+# interrupted run leaves the previous index intact; re-running with new
+# directories only appends episodes whose hash is not indexed yet.
+#
+# Usage:
+#   python log_compaction.py logs archive/old_logs* --out compacted
+#   python train_dqn.py --compacted-dir compacted --generations logs old_logs8
+
+import argparse
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from episode_store import COLUMN_DTYPES, episode_to_arrays, iter_json_logs, read_json_episode
+
+COMPACTION_VERSION = 1
+INDEX_NAME = "index.json"
+
+# Transitions per shard; ~100 B each for 11-dim states before compression
+SHARD_TRANSITIONS = 200_000
+
+
+def generation_name(log_dir: str) -> str:
+    return os.path.basename(os.path.normpath(log_dir))
+
+
+def check_generation_names(log_dirs: Sequence[str], existing: Sequence[dict]):
+    """
+    Raise ValueError if two distinct directories, in this run or already in
+    the index, map to the same generation name.
+    """
+    owners: Dict[str, str] = {}
+    for r in existing:
+        # Older indexes recorded cwd-relative sources; resolve them the same way
+        owners.setdefault(r["generation"], os.path.dirname(os.path.realpath(r["source"])))
+    for log_dir in log_dirs:
+        generation, directory = generation_name(log_dir), os.path.realpath(log_dir)
+        owner = owners.setdefault(generation, directory)
+        if owner != directory:
+            raise ValueError(
+                f"{log_dir} and {owner} would both be generation '{generation}'; "
+                "rename one of the directories before compacting"
+            )
+
+
+def episode_hash(arrays: Sequence[np.ndarray]) -> str:
+    """
+    Content hash of an episode's decoded columns (s, ns, a, r, d).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arr, dtype in zip(arrays, COLUMN_DTYPES.values()):
+        arr = np.ascontiguousarray(arr, dtype=dtype)
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+# -----------------------------
+# Reading
+# -----------------------------
+def read_index(compact_dir: str) -> List[dict]:
+    path = os.path.join(compact_dir, INDEX_NAME)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        index = json.load(f)
+    if index.get("version") != COMPACTION_VERSION:
+        raise ValueError(f"Unsupported compaction version {index.get('version')} at {compact_dir}")
+    return index["episodes"]
+
+
+def load_episode_columns(compact_dir: str, records: Sequence[dict]) -> Dict[str, np.ndarray]:
+    """
+    Gather the columns of `records` (all of one state_dim), opening each
+    shard once. Actions stay 1-based, as logged.
+    """
+    dims = {r["state_dim"] for r in records}
+    if len(dims) > 1:
+        raise ValueError(f"Cannot concatenate episodes with different state_dims: {sorted(dims)}")
+
+    by_shard: Dict[str, List[int]] = {}
+    for i, r in enumerate(records):
+        by_shard.setdefault(r["shard"], []).append(i)
+
+    parts: List[Optional[Dict[str, np.ndarray]]] = [None] * len(records)
+    for shard, members in by_shard.items():
+        with np.load(os.path.join(compact_dir, shard)) as data:
+            columns = {key: data[key] for key in COLUMN_DTYPES}
+        for i in members:
+            start, length = records[i]["start"], records[i]["length"]
+            parts[i] = {key: col[start:start + length] for key, col in columns.items()}
+
+    return {key: np.concatenate([p[key] for p in parts]) for key in COLUMN_DTYPES}
+
+
+def select_generations(
+    records: Sequence[dict],
+    generations: Optional[Sequence[str]] = None,
+    state_dim: Optional[int] = None,
+) -> List[dict]:
+    """
+    Filter index records by generation and state_dim. Without an explicit
+    state_dim, the dimension holding the most transitions among the chosen
+    generations is used (a model trains on one state layout).
+    """
+    if generations:
+        known = {r["generation"] for r in records}
+        missing = [g for g in generations if g not in known]
+        if missing:
+            raise ValueError(f"Unknown generations {missing}; available: {sorted(known)}")
+        records = [r for r in records if r["generation"] in set(generations)]
+    if not records:
+        return []
+
+    if state_dim is None:
+        weight = Counter()
+        for r in records:
+            weight[r["state_dim"]] += r["length"]
+        state_dim = weight.most_common(1)[0][0]
+    return [r for r in records if r["state_dim"] == state_dim]
+
+
+# -----------------------------
+# Compaction
+# -----------------------------
+class ShardWriter:
+    """
+    Buffers episodes per state_dim and writes a compressed shard whenever a
+    buffer reaches `shard_transitions`.
+    """
+
+    def __init__(self, compact_dir: str, first_shard: int, shard_transitions: int):
+        self.compact_dir = compact_dir
+        self.next_shard = first_shard
+        self.shard_transitions = shard_transitions
+        self.pending: Dict[int, List[tuple]] = {}
+        self.bytes_written = 0
+
+    def add(self, record: dict, arrays: Sequence[np.ndarray]):
+        buffer = self.pending.setdefault(record["state_dim"], [])
+        buffer.append((record, arrays))
+        if sum(r["length"] for r, _ in buffer) >= self.shard_transitions:
+            self.flush(record["state_dim"])
+
+    def flush(self, state_dim: int):
+        buffer = self.pending.pop(state_dim, [])
+        if not buffer:
+            return
+        name = f"shard_{self.next_shard:05d}.npz"
+        self.next_shard += 1
+
+        start = 0
+        for record, _ in buffer:
+            record["shard"] = name
+            record["start"] = start
+            start += record["length"]
+
+        columns = {
+            key: np.concatenate([arrays[col] for _, arrays in buffer]).astype(dtype, copy=False)
+            for col, (key, dtype) in enumerate(COLUMN_DTYPES.items())
+        }
+        path = os.path.join(self.compact_dir, name)
+        np.savez_compressed(path, **columns)
+        self.bytes_written += os.path.getsize(path)
+
+    def flush_all(self):
+        for state_dim in list(self.pending):
+            self.flush(state_dim)
+
+
+def compact_logs(
+    log_dirs: Iterable[str],
+    compact_dir: str,
+    shard_transitions: int = SHARD_TRANSITIONS,
+) -> dict:
+    """
+    Add every new, valid, non-duplicate episode from `log_dirs` to the
+    compacted set at `compact_dir`. Returns per-outcome counts.
+    """
+    log_dirs = list(log_dirs)
+    existing = read_index(compact_dir)
+    check_generation_names(log_dirs, existing)
+    os.makedirs(compact_dir, exist_ok=True)
+    seen = {r["hash"] for r in existing}
+    first_shard = 1 + max((int(r["shard"][6:11]) for r in existing), default=-1)
+    writer = ShardWriter(compact_dir, first_shard, shard_transitions)
+
+    stats = Counter()
+    added: List[dict] = []
+    for log_dir in log_dirs:
+        generation = generation_name(log_dir)
+        for path in iter_json_logs([log_dir]):
+            stats["files"] += 1
+            stats["bytes_in"] += os.path.getsize(path)
+            if os.path.getsize(path) == 0:
+                stats["empty"] += 1
+                continue
+
+            try:
+                transitions = read_json_episode(path)
+                if not transitions:
+                    stats["empty"] += 1
+                    continue
+                state_dim = len(transitions[0]["s"])
+                arrays = episode_to_arrays(transitions, state_dim)
+            except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+                print(f"  Dropping corrupt {path}: {e}")
+                stats["corrupt"] += 1
+                continue
+
+            digest = episode_hash(arrays)
+            if digest in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(digest)
+
+            s, r = arrays[0], arrays[3]
+            record = {
+                "shard": None,
+                "start": 0,
+                "length": len(r),
+                "return": float(np.sum(r, dtype=np.float64)),
+                "max_progress": max(0.0, float(np.max(s[:, 0]))),
+                "state_dim": state_dim,
+                "generation": generation,
+                "source": os.path.realpath(path),
+                "hash": digest,
+            }
+            writer.add(record, arrays)
+            added.append(record)
+            stats["added"] += 1
+            stats[f"added_{generation}"] += 1
+
+    writer.flush_all()
+
+    # index.json is the commit point: replace it only after every shard is on disk
+    index_path = os.path.join(compact_dir, INDEX_NAME)
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": COMPACTION_VERSION, "episodes": existing + added}, f)
+    os.replace(tmp_path, index_path)
+
+    stats["bytes_out"] = writer.bytes_written
+    return dict(stats)
+
+
+def print_index_summary(records: Sequence[dict]):
+    by_generation: Dict[str, Counter] = {}
+    for r in records:
+        c = by_generation.setdefault(r["generation"], Counter())
+        c["episodes"] += 1
+        c["transitions"] += r["length"]
+        c[f"dim{r['state_dim']}"] += 1
+
+    print(f"{'generation':<12} {'episodes':>9} {'transitions':>12}  state_dims")
+    for generation in sorted(by_generation):
+        c = by_generation[generation]
+        dims = ", ".join(f"{k[3:]}: {v}" for k, v in sorted(c.items()) if k.startswith("dim"))
+        print(f"{generation:<12} {c['episodes']:>9} {c['transitions']:>12}  {dims}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact JSON log generations into compressed shards")
+    parser.add_argument("log_dirs", nargs="+", help="directories containing transitions_*.json")
+    parser.add_argument("--out", default="compacted", help="compacted directory (default: compacted)")
+    parser.add_argument("--shard-transitions", type=int, default=SHARD_TRANSITIONS)
+    args = parser.parse_args()
+
+    try:
+        stats = compact_logs(args.log_dirs, args.out, args.shard_transitions)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"Compacted {stats.get('files', 0)} files into {args.out}")
+    for key in ("added", "duplicates", "empty", "corrupt"):
+        print(f"  {key}: {stats.get(key, 0)}")
+    if stats.get("added"):
+        print(f"  JSON in: {stats['bytes_in'] / 1e6:.1f} MB -> shards out: {stats['bytes_out'] / 1e6:.1f} MB")
+
+    records = read_index(args.out)
+    shards = {r["shard"] for r in records}
+    print(f"Index now holds {len(records)} episodes in {len(shards)} shards\n")
+    print_index_summary(records)
+
+
+if __name__ == "__main__":
+    main()
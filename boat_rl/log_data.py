@@ -1,31 +1,492 @@
-from flask import Flask, request
-import json, time, os
+# log_data.py
+#
+# Transition ingest server. Roblox servers POST one episode per request to
+# /transitions (see Agent:onEpisodeEnd); each episode is written to
+# logs/transitions_XXX.json and recorded in the episode manifest.
+#
+# The server runs on asyncio (aiohttp). Episode IDs come from an in-process
+# counter seeded from the log directory once at startup, so concurrent
+# requests never share a filename. Parsing and file writes run on a thread
+# pool, and fsyncs are batched by a background task.
+#
+# Usage:
+#   python log_data.py [--port 5000] [--log-dir logs] [--workers 8]
+#
+# GET /metrics returns request/byte/latency counters as JSON.
+# GET /stats returns rolling fleet statistics (return, progress, outcome
+# rates, action mix, epsilon) over the --stats-windows; see live_stats.py.
+# GET /stats?window=5m returns a single window.
+#
+# Accepted request bodies (the original single-episode JSON still works):
+#   - Content-Encoding: gzip or zstd (zstd needs the optional `zstandard` package)
+#   - a single episode:  {"transitions": [...], "metadata": {...}}
+#   - a batch envelope:  {"episodes": [{"transitions": [...]}, ...]}
+#   - compact transitions that omit "ns" when it equals the next transition's "s";
+#     "ns" is rebuilt before the episode is written, so files keep the full format
 
-app = Flask(__name__)
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
-os.makedirs("logs", exist_ok=True)
+from aiohttp import web
 
-@app.post("/transitions")
-def save_transitions():
-    # print("Request received")
-    data = request.get_json(silent=True)
-    # print("Raw data:", data)
+try:
+    import zstandard
+except ImportError:  # optional: only needed for Content-Encoding: zstd
+    zstandard = None
 
-    if not data or "transitions" not in data:
-        print("ERROR: Missing 'transitions' key")
-        return "bad request", 400
+from episode_manifest import record_episode
+from live_stats import DEFAULT_WINDOWS, LiveStats, summarize_episode
 
-    existing = [f for f in os.listdir("logs")
-                if f.startswith("transitions_") and f.endswith(".json")]
-    next_idx = len(existing) + 1
-    fname = os.path.join("logs", f"transitions_{next_idx:03d}.json")
+DECODE_ERRORS = (OSError, EOFError, zlib.error) + ((zstandard.ZstdError,) if zstandard is not None else ())
 
-    with open(fname, "w") as f:
-        json.dump(data["transitions"], f)
+LOG_PREFIX = "transitions_"
+LOG_SUFFIX = ".json"
 
-    # print("Saved", fname)
-    return "ok"
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Refuse bodies that inflate beyond this (decompression bombs)
+MAX_DECODED_BYTES = 512 * 1024 * 1024
+
+# Upper bounds (ms) of the request latency histogram buckets
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf")]
+
+
+# -----------------------------
+# Episode IDs
+# -----------------------------
+class EpisodeIdAllocator:
+    """
+    Thread-safe counter for episode file numbers.
+
+    Seeded once from the highest existing transitions_XXX.json so that a
+    restarted server continues the sequence instead of listing the directory
+    on every request.
+    """
+
+    def __init__(self, log_dir: str):
+        self._lock = threading.Lock()
+        self._next = self._scan_max_index(log_dir) + 1
+
+    @staticmethod
+    def _scan_max_index(log_dir: str) -> int:
+        max_idx = 0
+        for fname in os.listdir(log_dir):
+            if not (fname.startswith(LOG_PREFIX) and fname.endswith(LOG_SUFFIX)):
+                continue
+            try:
+                max_idx = max(max_idx, int(fname[len(LOG_PREFIX):-len(LOG_SUFFIX)]))
+            except ValueError:
+                continue
+        return max_idx
+
+    def peek(self) -> int:
+        with self._lock:
+            return self._next
+
+    def allocate(self) -> int:
+        with self._lock:
+            idx = self._next
+            self._next += 1
+            return idx
+
+
+# -----------------------------
+# Metrics
+# -----------------------------
+class IngestMetrics:
+    """
+    Request/byte/latency counters. Only updated from the event loop.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.requests = 0
+        self.bad_requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.batched_requests = 0
+        self.episodes_written = 0
+        self.transitions_written = 0
+        self.fsync_batches = 0
+        self.files_fsynced = 0
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.latency_counts = [0] * len(LATENCY_BUCKETS_MS)
+
+    def observe_latency(self, ms: float):
+        self.latency_sum_ms += ms
+        self.latency_max_ms = max(self.latency_max_ms, ms)
+        self.latency_counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+
+    def to_dict(self) -> dict:
+        uptime = max(time.time() - self.started_at, 1e-9)
+        observed = sum(self.latency_counts)
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "bad_requests": self.bad_requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "batched_requests": self.batched_requests,
+            "episodes_written": self.episodes_written,
+            "transitions_written": self.transitions_written,
+            "requests_per_s": self.requests / uptime,
+            "fsync_batches": self.fsync_batches,
+            "files_fsynced": self.files_fsynced,
+            "latency_ms": {
+                "mean": self.latency_sum_ms / observed if observed else 0.0,
+                "max": self.latency_max_ms,
+                "buckets": {
+                    ("+inf" if bound == float("inf") else str(bound)): count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_counts)
+                },
+            },
+        }
+
+
+# -----------------------------
+# Disk writes (run on the thread pool)
+# -----------------------------
+class PayloadError(ValueError):
+    """Raised for request bodies that cannot be decoded into episodes."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def gunzip_bounded(body: bytes, limit: int) -> bytes:
+    """
+    gzip.decompress with an output cap, so a bomb is refused before it is
+    inflated in full. Concatenated gzip members are decoded in turn.
+    """
+    parts = []
+    size = 0
+    while True:
+        inflater = zlib.decompressobj(wbits=31)
+        part = inflater.decompress(body, limit - size + 1)
+        size += len(part)
+        if size > limit or inflater.unconsumed_tail:
+            raise PayloadError("decoded body too large", status=413)
+        if not inflater.eof:
+            raise PayloadError("corrupt gzip body: truncated stream")
+        parts.append(part)
+        body = inflater.unused_data
+        if not body:
+            return b"".join(parts)
+
+
+def decode_body(body: bytes, content_encoding: str = "") -> bytes:
+    """
+    Undo gzip/zstd content encoding. Compressed bodies sent without a
+    Content-Encoding header are recognised by their magic bytes.
+    """
+    encoding = content_encoding.strip().lower()
+    if encoding in ("", "identity"):
+        if body.startswith(GZIP_MAGIC):
+            encoding = "gzip"
+        elif body.startswith(ZSTD_MAGIC):
+            encoding = "zstd"
+        else:
+            return body
+
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            decoded = gunzip_bounded(body, MAX_DECODED_BYTES)
+        elif encoding == "zstd":
+            if zstandard is None:
+                raise PayloadError("zstd bodies need the 'zstandard' package", status=415)
+            decoded = zstandard.ZstdDecompressor().decompress(body, max_output_size=MAX_DECODED_BYTES)
+        else:
+            raise PayloadError(f"unsupported Content-Encoding: {content_encoding}", status=415)
+    except DECODE_ERRORS as e:
+        raise PayloadError(f"corrupt {encoding} body: {e}")
+
+    if len(decoded) > MAX_DECODED_BYTES:
+        raise PayloadError("decoded body too large", status=413)
+    return decoded
+
+
+def check_transitions(transitions: List[dict], episode: int):
+    """
+    Every transition must be an object with list "s" and "a"/"r"/"d" fields.
+    """
+    for i, t in enumerate(transitions):
+        if not isinstance(t, dict):
+            raise PayloadError(f"episode {episode}: transition {i} is not an object")
+        missing = [key for key in ("s", "a", "r", "d") if key not in t]
+        if missing:
+            raise PayloadError(f"episode {episode}: transition {i} is missing {', '.join(missing)}")
+        if not isinstance(t["s"], list) or ("ns" in t and not isinstance(t["ns"], list)):
+            raise PayloadError(f"episode {episode}: transition {i} has a non-list state")
+
+
+def expand_compact_transitions(transitions: List[dict]) -> List[dict]:
+    """
+    Fill in "ns" for transitions that omitted it; it equals the next transition's "s".
+    """
+    for i, t in enumerate(transitions):
+        if "ns" in t:
+            continue
+        if i + 1 >= len(transitions):
+            raise PayloadError(f"transition {i} omits 'ns' but has no following state")
+        t["ns"] = transitions[i + 1]["s"]
+    return transitions
+
+
+def parse_episodes(body: bytes) -> List[Tuple[List[dict], dict]]:
+    """
+    Return (transitions, metadata) for every episode in a decoded request
+    body. Episodes in a batch envelope without their own metadata inherit
+    the envelope's.
+
+    Raises PayloadError if the body is not a single-episode payload or a batch
+    envelope of them; nothing from a malformed batch is written.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise PayloadError("body is not valid JSON")
+
+    if not data or not isinstance(data, dict):
+        raise PayloadError("Missing 'transitions' key")
+
+    if "episodes" in data:
+        payloads = data["episodes"]
+        if not isinstance(payloads, list):
+            raise PayloadError("'episodes' must be a list")
+    else:
+        payloads = [data]
+    default_metadata = data.get("metadata")
+
+    episodes = []
+    for n, payload in enumerate(payloads):
+        if not isinstance(payload, dict) or "transitions" not in payload:
+            raise PayloadError("Missing 'transitions' key")
+        transitions = payload["transitions"]
+        if not isinstance(transitions, list):
+            raise PayloadError("'transitions' must be a list")
+        check_transitions(transitions, n)
+        metadata = payload.get("metadata", default_metadata)
+        if not isinstance(metadata, dict):
+            metadata = {}
+        episodes.append((expand_compact_transitions(transitions), metadata))
+
+    return episodes
+
+
+def write_episode(log_dir: str, idx: int, transitions: List[dict]) -> str:
+    """
+    Write one episode file atomically (temp file + rename) and record it in the manifest.
+    """
+    fname = os.path.join(log_dir, f"{LOG_PREFIX}{idx:03d}{LOG_SUFFIX}")
+    tmp_name = fname + ".tmp"
+
+    with open(tmp_name, "w") as f:
+        json.dump(transitions, f)
+    os.replace(tmp_name, fname)
+
+    record_episode(log_dir, fname, transitions)
+    return fname
+
+
+def fsync_files(log_dir: str, paths: List[str]) -> int:
+    synced = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            continue
+        try:
+            os.fsync(fd)
+            synced += 1
+        finally:
+            os.close(fd)
+
+    # Persist the renames themselves
+    dir_fd = os.open(log_dir, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return synced
+
+
+# -----------------------------
+# Server
+# -----------------------------
+class IngestServer:
+    def __init__(
+        self,
+        log_dir: str = "logs",
+        workers: int = 8,
+        fsync_interval: float = 1.0,
+        fsync_batch: int = 64,
+        stats_windows: str = DEFAULT_WINDOWS,
+    ):
+        os.makedirs(log_dir, exist_ok=True)
+        self.log_dir = log_dir
+        self.allocator = EpisodeIdAllocator(log_dir)
+        self.metrics = IngestMetrics()
+        self.stats = LiveStats(stats_windows)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest")
+
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        self._pending_fsync: List[str] = []
+        self._fsync_wakeup: Optional[asyncio.Event] = None
+        self._fsync_task: Optional[asyncio.Task] = None
+
+    def _ingest(self, body: bytes, content_encoding: str) -> Tuple[List[str], int, int, List[List[float]]]:
+        decoded = decode_body(body, content_encoding)
+        episodes = parse_episodes(decoded)
+
+        paths = []
+        num_transitions = 0
+        summaries = []
+        for transitions, metadata in episodes:
+            paths.append(write_episode(self.log_dir, self.allocator.allocate(), transitions))
+            num_transitions += len(transitions)
+            # Built here on the worker so the event loop only does the O(1)
+            # window updates; odd transitions are still logged, just not counted
+            try:
+                summaries.append(summarize_episode(transitions, metadata))
+            except (KeyError, TypeError, IndexError):
+                pass
+        return paths, num_transitions, len(decoded), summaries
+
+    async def handle_transitions(self, request: web.Request) -> web.Response:
+        start = time.perf_counter()
+        self.metrics.requests += 1
+
+        body = await request.read()
+        self.metrics.bytes_received += len(body)
+
+        content_encoding = request.headers.get("Content-Encoding", "")
+
+        loop = asyncio.get_running_loop()
+        try:
+            paths, num_transitions, decoded_size, summaries = await loop.run_in_executor(
+                self.pool, self._ingest, body, content_encoding
+            )
+        except PayloadError as e:
+            self.metrics.bad_requests += 1
+            print(f"ERROR: {e}")
+            return web.Response(status=e.status, text="bad request")
+        except OSError as e:
+            self.metrics.errors += 1
+            print(f"ERROR: Failed to write episode: {e}")
+            return web.Response(status=500, text="write failed")
+        finally:
+            self.metrics.observe_latency((time.perf_counter() - start) * 1000.0)
+
+        self.metrics.bytes_decoded += decoded_size
+        self.metrics.episodes_written += len(paths)
+        self.metrics.transitions_written += num_transitions
+        if len(paths) > 1:
+            self.metrics.batched_requests += 1
+        for summary in summaries:
+            self.stats.add(summary)
+
+        self._pending_fsync.extend(paths)
+        if len(self._pending_fsync) >= self.fsync_batch and self._fsync_wakeup is not None:
+            self._fsync_wakeup.set()
+
+        return web.Response(text="ok")
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.json_response(self.metrics.to_dict())
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        window = request.query.get("window")
+        try:
+            stats = self.stats.to_dict(window)
+        except KeyError:
+            return web.json_response(
+                {"error": f"unknown window {window!r}", "windows": list(self.stats.windows)}, status=404
+            )
+        return web.json_response(stats)
+
+    async def _flush_pending(self):
+        if not self._pending_fsync:
+            return
+        batch, self._pending_fsync = self._pending_fsync, []
+        loop = asyncio.get_running_loop()
+        synced = await loop.run_in_executor(self.pool, fsync_files, self.log_dir, batch)
+        self.metrics.fsync_batches += 1
+        self.metrics.files_fsynced += synced
+
+    async def _fsync_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._fsync_wakeup.wait(), timeout=self.fsync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._fsync_wakeup.clear()
+            await self._flush_pending()
+
+    async def _on_startup(self, app: web.Application):
+        self._fsync_wakeup = asyncio.Event()
+        self._fsync_task = asyncio.create_task(self._fsync_loop())
+
+    async def _on_cleanup(self, app: web.Application):
+        if self._fsync_task is not None:
+            self._fsync_task.cancel()
+            try:
+                await self._fsync_task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_pending()
+        self.pool.shutdown(wait=True)
+
+    def make_app(self) -> web.Application:
+        # Roblox episodes can be several MB of JSON
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/transitions", self.handle_transitions)
+        app.router.add_get("/metrics", self.handle_metrics)
+        app.router.add_get("/stats", self.handle_stats)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transition ingest server for Roblox episodes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--workers", type=int, default=8, help="disk/parse worker threads")
+    parser.add_argument("--fsync-interval", type=float, default=1.0, help="seconds between fsync batches")
+    parser.add_argument("--fsync-batch", type=int, default=64, help="flush early once this many files are pending")
+    parser.add_argument("--stats-windows", default=DEFAULT_WINDOWS,
+                        help=f"GET /stats windows: episode counts and/or durations like 5m, 1h (default: {DEFAULT_WINDOWS})")
+    args = parser.parse_args()
+
+    try:
+        server = IngestServer(
+            log_dir=args.log_dir,
+            workers=args.workers,
+            fsync_interval=args.fsync_interval,
+            fsync_batch=args.fsync_batch,
+            stats_windows=args.stats_windows,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Ingesting episodes into {args.log_dir}/ (next episode #{server.allocator.peek()})")
+    # Bodies are decompressed on the worker pool by decode_body, not on the event loop
+    web.run_app(server.make_app(), host=args.host, port=args.port, auto_decompress=False)
 
 
 if __name__ == "__main__":
-    app.run(port=5000, debug=True)
+    main()
@@ -0,0 +1,315 @@
+# lua_weights.py
+#
+# Shared DqnWeights.lua writer for export_weights.py (trained checkpoints) and
+# generate_placeholder_weights.py (random weights).
+#
+# Both produce the same in-memory "weights object":
+#   {
+#       "state_dim": int,
+#       "num_actions": int,
+#       "layers": [{"W": [[...]], "b": [...], "activation": "relu" | "linear"}, ...],
+#   }
+# where W has shape [out_dim, in_dim] (PyTorch nn.Linear layout), and write
+# it either as an embedded JSON string or as flat Luau arrays.
+
+import json
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+ACTIVATIONS = ("relu", "linear")
+LUA_FORMATS = ("json", "flat")
+
+
+# -----------------------------
+# Weights object
+# -----------------------------
+def make_weights_obj(
+    state_dim: int,
+    num_actions: int,
+    layers: Sequence[Tuple[np.ndarray, np.ndarray, str]],
+) -> dict:
+    """
+    Build a weights object from (W, b, activation) triples, checking that
+    layer shapes chain from state_dim to num_actions.
+    """
+    in_dim = state_dim
+    out_layers = []
+    for idx, (W, b, activation) in enumerate(layers, start=1):
+        W = np.asarray(W, dtype=np.float32)
+        b = np.asarray(b, dtype=np.float32)
+        if W.ndim != 2 or W.shape[1] != in_dim or b.shape != (W.shape[0],):
+            raise ValueError(
+                f"Layer {idx} shape mismatch: W={W.shape}, b={b.shape}, expected input dim {in_dim}"
+            )
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Layer {idx} has unsupported activation {activation!r}")
+        out_layers.append({"W": W.tolist(), "b": b.tolist(), "activation": activation})
+        in_dim = W.shape[0]
+
+    if in_dim != num_actions:
+        raise ValueError(f"Output layer has {in_dim} units, expected num_actions={num_actions}")
+
+    return {
+        "state_dim": state_dim,
+        "num_actions": num_actions,
+        "layers": out_layers,
+    }
+
+
+def layer_dims(weights_obj: dict) -> List[int]:
+    return [weights_obj["state_dim"]] + [len(layer["b"]) for layer in weights_obj["layers"]]
+
+
+def architecture_string(weights_obj: dict) -> str:
+    return " -> ".join(str(d) for d in layer_dims(weights_obj))
+
+
+def count_macs(weights_obj: dict) -> int:
+    """
+    Multiply-adds per forward pass (one per weight), the inner-loop cost of Agent:qValues.
+    """
+    dims = layer_dims(weights_obj)
+    return sum(dims[i] * dims[i + 1] for i in range(len(dims) - 1))
+
+
+def count_flops(weights_obj: dict) -> int:
+    """
+    FLOPs per forward pass: a multiply and an add per weight, one add per bias,
+    and one comparison per ReLU unit.
+    """
+    flops = 0
+    for layer in weights_obj["layers"]:
+        out_dim = len(layer["b"])
+        in_dim = len(layer["W"][0]) if out_dim else 0
+        flops += 2 * in_dim * out_dim + out_dim
+        if layer["activation"] == "relu":
+            flops += out_dim
+    return flops
+
+
+def print_architecture(weights_obj: dict):
+    dims = layer_dims(weights_obj)
+    for idx, layer in enumerate(weights_obj["layers"]):
+        print(f"Layer {idx + 1}: ({dims[idx + 1]}, {dims[idx]}) "
+              f"({dims[idx]} -> {dims[idx + 1]}, {layer['activation']})")
+    print(f"Architecture: {architecture_string(weights_obj)}")
+    print(f"Cost per forward pass: {count_macs(weights_obj):,} multiply-adds, "
+          f"{count_flops(weights_obj):,} FLOPs")
+
+
+def forward(weights_obj: dict, states: np.ndarray) -> np.ndarray:
+    """
+    Reference NumPy forward pass (float64, like Luau numbers).
+    """
+    x = np.asarray(states, dtype=np.float64)
+    for layer in weights_obj["layers"]:
+        x = x @ np.asarray(layer["W"], dtype=np.float64).T + np.asarray(layer["b"], dtype=np.float64)
+        if layer["activation"] == "relu":
+            x = np.maximum(x, 0.0)
+    return x
+
+
+# -----------------------------
+# Embedded-JSON Lua export
+# -----------------------------
+def export_json_lua(weights_obj: dict, output_path: Path, header: str):
+    """
+    Export weights to Lua format using JSON encoding
+    This creates a Lua file that uses HttpService:JSONDecode
+    """
+    # Minify JSON to reduce file size
+    minified_json = json.dumps(weights_obj, separators=(",", ":"))
+
+    lua_code = f"""local HttpService = game:GetService("HttpService")
+
+-- {header}
+-- Model: {weights_obj['state_dim']}-dim state, {weights_obj['num_actions']} actions
+-- Architecture: {architecture_string(weights_obj)}
+
+local json = [=[{minified_json}]=]
+
+local Weights = HttpService:JSONDecode(json)
+
+return Weights
+"""
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(lua_code)
+    print(f"Exported Lua weights to {output_path}")
+
+    # Print file size
+    size_kb = output_path.stat().st_size / 1024
+    print(f"File size: {size_kb:.1f} KB")
+
+
+# -----------------------------
+# Flat (pre-laid-out) Lua export
+# -----------------------------
+QUANTIZE_MODES = ("none", "float16", "int8")
+
+
+def format_number(x) -> str:
+    # Shortest decimal that round-trips the value at its own precision
+    return str(x)
+
+
+def encode_flat_layers(weights_obj: dict, quantize: str = "none") -> list:
+    """
+    Lay each layer out as a flat row-major weight array, W[(j - 1) * in_dim + i]
+    in Lua, with values already rounded to the chosen encoding.
+
+    Returns per-layer dicts holding both the text to emit and the values the
+    Lua side will actually see (used by roundtrip_check):
+      quantize="none"     float32 weights
+      quantize="float16"  weights rounded to float16 (shorter literals)
+      quantize="int8"     int8 weights plus one float32 scale per output row
+    """
+    if quantize not in QUANTIZE_MODES:
+        raise ValueError(f"Unknown quantization {quantize!r}, expected one of {QUANTIZE_MODES}")
+
+    encoded = []
+    for layer in weights_obj["layers"]:
+        W = np.asarray(layer["W"], dtype=np.float32)
+        b = np.asarray(layer["b"], dtype=np.float32)
+        out_dim, in_dim = W.shape
+
+        entry = {
+            "in_dim": in_dim,
+            "out_dim": out_dim,
+            "activation": layer["activation"],
+            "quantize": quantize,
+        }
+        entry["b_text"] = [format_number(v) for v in b]
+
+        if quantize == "int8":
+            scale = (np.abs(W).max(axis=1) / 127.0).astype(np.float32)
+            scale[scale == 0] = 1.0
+            q = np.clip(np.rint(W / scale[:, None]), -127, 127).astype(np.int8)
+            entry["q_text"] = [str(int(v)) for v in q.ravel()]
+            entry["scale_text"] = [format_number(v) for v in scale]
+            W_seen = q.astype(np.float64) * np.array([float(t) for t in entry["scale_text"]])[:, None]
+        else:
+            values = W.astype(np.float16) if quantize == "float16" else W
+            entry["W_text"] = [format_number(v) for v in values.ravel()]
+            W_seen = np.array([float(t) for t in entry["W_text"]]).reshape(out_dim, in_dim)
+
+        entry["W_seen"] = W_seen
+        entry["b_seen"] = np.array([float(t) for t in entry["b_text"]])
+        encoded.append(entry)
+
+    return encoded
+
+
+def _lua_array(items: list, per_line: int = 16, indent: str = "        ") -> str:
+    lines = [", ".join(items[i:i + per_line]) for i in range(0, len(items), per_line)]
+    return "{\n" + "".join(f"{indent}{line},\n" for line in lines) + indent[:-4] + "}"
+
+
+def export_flat_lua(weights_obj: dict, encoded: list, output_path: Path, header: str):
+    """
+    Write DqnWeights.lua as plain Luau table literals: no JSONDecode at require
+    time, and Agent:qValues reads the flat rows directly.
+    """
+    quantize = encoded[0]["quantize"] if encoded else "none"
+
+    parts = [
+        f"-- {header}",
+        f"-- Model: {weights_obj['state_dim']}-dim state, {weights_obj['num_actions']} actions",
+        f"-- Architecture: {architecture_string(weights_obj)}",
+        f"-- Layout: flat row-major, W[(j - 1) * inDim + i]; encoding: {quantize}",
+        "",
+    ]
+
+    if quantize == "int8":
+        parts += [
+            "local function dequantize(inDim, outDim, q, scale)",
+            "    local W = table.create(inDim * outDim, 0)",
+            "    for j = 1, outDim do",
+            "        local s = scale[j]",
+            "        local base = (j - 1) * inDim",
+            "        for i = 1, inDim do",
+            "            W[base + i] = q[base + i] * s",
+            "        end",
+            "    end",
+            "    return W",
+            "end",
+            "",
+        ]
+
+    parts.append("local layers = {}")
+    for idx, e in enumerate(encoded, start=1):
+        if quantize == "int8":
+            W_expr = (
+                f"dequantize({e['in_dim']}, {e['out_dim']},\n"
+                f"        {_lua_array(e['q_text'], per_line=32, indent='            ')},\n"
+                f"        {_lua_array(e['scale_text'], indent='            ')})"
+            )
+        else:
+            W_expr = _lua_array(e["W_text"])
+        parts += [
+            "",
+            f"layers[{idx}] = {{",
+            f"    inDim = {e['in_dim']},",
+            f"    outDim = {e['out_dim']},",
+            f"    activation = \"{e['activation']}\",",
+            f"    W = {W_expr},",
+            f"    b = {_lua_array(e['b_text'])},",
+            "}",
+        ]
+
+    parts += [
+        "",
+        "return {",
+        f"    state_dim = {weights_obj['state_dim']},",
+        f"    num_actions = {weights_obj['num_actions']},",
+        '    format = "flat",',
+        "    layers = layers,",
+        "}",
+        "",
+    ]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(parts))
+    print(f"Exported flat Lua weights to {output_path}")
+    size_kb = output_path.stat().st_size / 1024
+    print(f"File size: {size_kb:.1f} KB")
+
+
+def forward_encoded(encoded: list, states: np.ndarray) -> np.ndarray:
+    """
+    Forward pass over the values the exported Lua module actually contains.
+    """
+    x = np.asarray(states, dtype=np.float64)
+    for e in encoded:
+        x = x @ e["W_seen"].T + e["b_seen"]
+        if e["activation"] == "relu":
+            x = np.maximum(x, 0.0)
+    return x
+
+
+def write_weights(
+    weights_obj: dict,
+    json_path: Path,
+    lua_path: Path,
+    lua_format: str = "flat",
+    quantize: str = "none",
+    header: str = "AUTO-GENERATED by boat_rl/export_weights.py. Do not edit by hand.",
+) -> list:
+    """
+    Save the debug JSON and DqnWeights.lua. Returns the flat encoding (empty
+    for the JSON format) so callers can run a round-trip check on it.
+    """
+    json_path.write_text(json.dumps(weights_obj, indent=2))
+    print(f"Saved JSON weights to {json_path}")
+
+    if lua_format == "json":
+        export_json_lua(weights_obj, lua_path, header)
+        return []
+    if lua_format != "flat":
+        raise ValueError(f"Unknown Lua format {lua_format!r}, expected one of {LUA_FORMATS}")
+
+    encoded = encode_flat_layers(weights_obj, quantize)
+    export_flat_lua(weights_obj, encoded, lua_path, header)
+    return encoded
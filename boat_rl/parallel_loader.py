@@ -0,0 +1,88 @@
+# parallel_loader.py
+#
+# Multi-process JSON log parsing. Each worker parses a chunk of
+# transitions_*.json files and returns per-episode NumPy column arrays; the
+# parent only concatenates them.
+#
+# train_dqn switches to this loader automatically once a log directory holds
+# PARALLEL_MIN_FILES or more episode files.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from episode_store import episode_to_arrays, read_json_episode
+
+PARALLEL_MIN_FILES = 200
+
+# Files handed to a worker per task; amortizes IPC for small episodes
+FILES_PER_TASK = 16
+
+
+def count_log_files(log_dir: str) -> int:
+    if not os.path.isdir(log_dir):
+        return 0
+    return sum(
+        1 for f in os.listdir(log_dir)
+        if f.startswith("transitions_") and f.endswith(".json")
+    )
+
+
+def _parse_chunk(task_id: int, paths: List[str], state_dim: int) -> Tuple[int, List[Tuple[np.ndarray, ...]]]:
+    episodes = []
+    for path in paths:
+        transitions = read_json_episode(path)
+        if transitions:
+            episodes.append(episode_to_arrays(transitions, state_dim))
+    return task_id, episodes
+
+
+def load_episode_arrays_parallel(
+    paths: Sequence[str],
+    state_dim: int,
+    workers: Optional[int] = None,
+    deterministic: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Parse episode files across a process pool and concatenate their columns.
+
+    Returns {"s", "ns", "a", "r", "d"} arrays (actions stay 1-based, as logged).
+    With deterministic=True episodes are concatenated in the order of `paths`,
+    so runs are reproducible; otherwise in completion order, which avoids
+    holding finished chunks back behind a slow one.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [list(paths[i:i + FILES_PER_TASK]) for i in range(0, len(paths), FILES_PER_TASK)]
+
+    results: List[Optional[List[Tuple[np.ndarray, ...]]]] = [None] * len(chunks)
+    completion_order: List[int] = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_parse_chunk, task_id, chunk, state_dim)
+            for task_id, chunk in enumerate(chunks)
+        ]
+        for future in as_completed(futures):
+            task_id, episodes = future.result()
+            results[task_id] = episodes
+            completion_order.append(task_id)
+
+    order = range(len(chunks)) if deterministic else completion_order
+    episodes = [ep for task_id in order for ep in results[task_id]]
+
+    if not episodes:
+        empty_states = np.zeros((0, state_dim), dtype=np.float32)
+        return {
+            "s": empty_states,
+            "ns": empty_states.copy(),
+            "a": np.zeros(0, dtype=np.int8),
+            "r": np.zeros(0, dtype=np.float32),
+            "d": np.zeros(0, dtype=np.bool_),
+        }
+
+    return {
+        key: np.concatenate([ep[col] for ep in episodes])
+        for col, key in enumerate(("s", "ns", "a", "r", "d"))
+    }
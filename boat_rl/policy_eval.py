@@ -0,0 +1,281 @@
+# policy_eval.py
+#
+# Offline evaluation of trained policies on held-out logged episodes,
+# without deploying them to Roblox.
+#
+# The held-out episodes (the same file-hash split as train_daemon and
+# distill) are loaded once. Each checkpoint (.pth from train_dqn, or the
+# exported dqn_weights.json) then gets one batched Q pass over every state,
+# and its greedy actions go through agent_policy.select_actions. That
+# reproduces what Agent:selectAction would do: the emergency heuristic, the
+# caution-zone turn bias, the straight-ahead preference and the wall
+# guardrail. Reported per checkpoint:
+#
+#   agreement    greedy policy (overrides included) vs the logged action, on
+#                all states and on the states where the network is consulted;
+#                logged actions include exploration, so 100% is not the goal
+#   calibration  Q(s, a_logged) against the observed discounted return from
+#                s, under the checkpoint's gamma and reward config: bias,
+#                MAE, correlation and a per-decile table of mean Q vs return
+#   overrides    how often the emergency heuristic answers instead of the
+#                network, and how often a post-argmax override changes the
+#                network's choice
+#
+# Episodes whose last transition is not marked done (still being logged)
+# are left out of calibration, since their returns are cut short.
+#
+# Usage:
+#   python policy_eval.py                               # dqn_weights_best.pth
+#   python policy_eval.py checkpoints/ dqn_weights.json --out eval.json
+#   python train_dqn.py --checkpoint-dir checkpoints && python policy_eval.py checkpoints/
+
+import argparse
+import glob
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from agent_policy import SOURCE_EMERGENCY, SOURCE_NETWORK, SOURCE_OVERRIDE, select_actions
+from episode_manifest import load_manifest
+from log_compaction import load_episode_columns, read_index, select_generations
+from lua_weights import forward
+from nstep import episode_ends
+from parallel_loader import load_episode_arrays_parallel
+from rewards import recompute_rewards
+from train_daemon import is_heldout
+from train_dqn import load_dqn_checkpoint
+
+BASE_DIR = Path(__file__).resolve().parent
+
+DEFAULT_GAMMA = 0.95
+CALIBRATION_BINS = 10
+INFERENCE_BATCH = 1 << 16
+
+
+# -----------------------------
+# Held-out data
+# -----------------------------
+def load_heldout(
+    log_dir: str,
+    compacted_dir: Optional[str],
+    state_dim: int,
+    heldout_fraction: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Columns of the held-out episodes (all episodes when heldout_fraction is
+    1), from a compacted shard set if given, else from the JSON logs.
+    """
+    if compacted_dir is not None:
+        records = select_generations(read_index(compacted_dir), state_dim=state_dim)
+        records = [r for r in records if is_heldout(os.path.basename(r["source"]), heldout_fraction)]
+        if not records:
+            raise FileNotFoundError(f"No held-out {state_dim}-dim episodes in {compacted_dir}")
+        return load_episode_columns(compacted_dir, records)
+
+    entries = [e for e in load_manifest(log_dir) if e["length"] > 0 and e["state_dim"] == state_dim]
+    paths = [os.path.join(log_dir, e["file"]) for e in entries if is_heldout(e["file"], heldout_fraction)]
+    if not paths:
+        raise FileNotFoundError(f"No held-out {state_dim}-dim episodes in {log_dir}")
+    return load_episode_arrays_parallel(paths, state_dim)
+
+
+def discounted_returns(r: np.ndarray, end: np.ndarray, gamma: float) -> np.ndarray:
+    """
+    Observed return sum_k gamma^k r[t+k] to the end of each episode. Rows
+    are processed by their distance to the episode end, one vectorized step
+    per distance, so the work is O(N) with at most max-episode-length passes.
+    """
+    N = len(r)
+    rows = np.arange(N)
+    end_rows = np.flatnonzero(end)
+    to_end = end_rows[np.searchsorted(end_rows, rows)] - rows if N else rows
+
+    G = np.asarray(r, dtype=np.float64).copy()
+    order = np.argsort(to_end, kind="stable")
+    bounds = np.searchsorted(to_end[order], np.arange(to_end.max() + 2)) if N else [0]
+    for k in range(1, len(bounds) - 1):
+        idx = order[bounds[k]:bounds[k + 1]]
+        G[idx] += gamma * G[idx + 1]
+    return G
+
+
+# -----------------------------
+# Policies
+# -----------------------------
+def load_q_function(path: str, device: torch.device) -> Tuple[Callable[[np.ndarray], np.ndarray], dict]:
+    """
+    Batched Q(s) for a train_dqn checkpoint or an exported weights JSON.
+    Returns (q_fn, info) with the gamma/reward_config the policy was trained
+    under when the file records them.
+    """
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            weights_obj = json.load(f)
+        return (lambda states: forward(weights_obj, states)), {"state_dim": weights_obj["state_dim"]}
+
+    model, checkpoint = load_dqn_checkpoint(path, device=str(device))
+
+    @torch.no_grad()
+    def q_fn(states: np.ndarray) -> np.ndarray:
+        out = []
+        for i in range(0, len(states), INFERENCE_BATCH):
+            batch = torch.from_numpy(np.ascontiguousarray(states[i:i + INFERENCE_BATCH], dtype=np.float32))
+            out.append(model(batch.to(device)).cpu().numpy())
+        return np.concatenate(out) if out else np.zeros((0, checkpoint.get("num_actions", 5)))
+
+    info = {key: checkpoint.get(key) for key in ("state_dim", "gamma", "reward_config", "epoch", "loss")}
+    return q_fn, info
+
+
+def expand_checkpoints(paths: List[str]) -> List[str]:
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = sorted(glob.glob(os.path.join(path, "*.pth")))
+            if not found:
+                raise FileNotFoundError(f"No .pth checkpoints in {path}")
+            expanded.extend(found)
+        else:
+            expanded.append(path)
+    return expanded
+
+
+# -----------------------------
+# Scoring
+# -----------------------------
+def calibration(q_taken: np.ndarray, returns: np.ndarray, bins: int = CALIBRATION_BINS) -> dict:
+    if len(q_taken) == 0:
+        return {"count": 0}
+    err = q_taken - returns
+    order = np.argsort(q_taken, kind="stable")
+    table = []
+    for chunk in np.array_split(order, min(bins, len(order))):
+        table.append({
+            "count": int(len(chunk)),
+            "mean_q": float(q_taken[chunk].mean()),
+            "mean_return": float(returns[chunk].mean()),
+        })
+    corr = np.corrcoef(q_taken, returns)[0, 1] if len(q_taken) > 1 and q_taken.std() > 0 and returns.std() > 0 else float("nan")
+    return {
+        "count": int(len(q_taken)),
+        "bias": float(err.mean()),
+        "mae": float(np.abs(err).mean()),
+        "rmse": float(np.sqrt(np.mean(err ** 2))),
+        "correlation": float(corr),
+        "deciles": table,
+    }
+
+
+def evaluate_policy(q_fn: Callable[[np.ndarray], np.ndarray], columns: Dict[str, np.ndarray], returns: np.ndarray,
+                    complete: np.ndarray) -> dict:
+    states = columns["s"]
+    logged = columns["a"].astype(np.int64)
+
+    start = time.perf_counter()
+    q = q_fn(states)
+    inference_s = time.perf_counter() - start
+
+    greedy = q.argmax(axis=1) + 1  # 1-based, as in the game
+    actions, source = select_actions(states, greedy)
+    consulted = source != SOURCE_EMERGENCY
+    q_taken = q[np.arange(len(q)), np.clip(logged - 1, 0, q.shape[1] - 1)]
+
+    n = len(states)
+    return {
+        "states": n,
+        "inference_seconds": inference_s,
+        "states_per_sec": n / max(inference_s, 1e-9),
+        "agreement": float(np.mean(actions == logged)),
+        "agreement_network_states": float(np.mean(actions[consulted] == logged[consulted])) if consulted.any() else float("nan"),
+        "argmax_agreement": float(np.mean(greedy == logged)),
+        "emergency_rate": float(np.mean(source == SOURCE_EMERGENCY)),
+        "override_rate": float(np.mean(source == SOURCE_OVERRIDE)),
+        "override_rate_network_states": float(np.mean(source[consulted] == SOURCE_OVERRIDE)) if consulted.any() else float("nan"),
+        "network_rate": float(np.mean(source == SOURCE_NETWORK)),
+        "action_distribution": (np.bincount(actions, minlength=q.shape[1] + 1)[1:] / max(n, 1)).tolist(),
+        "calibration": calibration(q_taken[complete], returns[complete]),
+    }
+
+
+def print_report(name: str, report: dict, detail: bool):
+    cal = report["calibration"]
+    print(f"{name:<28} {report['agreement']:>7.2%} {report['agreement_network_states']:>8.2%} "
+          f"{report['emergency_rate']:>9.2%} {report['override_rate_network_states']:>9.2%} "
+          f"{cal.get('bias', float('nan')):>8.3f} {cal.get('mae', float('nan')):>8.3f} "
+          f"{cal.get('correlation', float('nan')):>6.3f} {report['states_per_sec']:>12,.0f}")
+    if detail and cal.get("count"):
+        print(f"\n  Calibration (deciles of Q(s, a_logged), gamma={report['gamma']}):")
+        print(f"  {'mean Q':>10} {'mean return':>12} {'count':>9}")
+        for row in cal["deciles"]:
+            print(f"  {row['mean_q']:>10.3f} {row['mean_return']:>12.3f} {row['count']:>9,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score checkpoints against held-out logged episodes")
+    parser.add_argument("checkpoints", nargs="*", default=[str(BASE_DIR / "dqn_weights_best.pth")],
+                        help=".pth checkpoints, directories of them, or exported weights .json")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--compacted-dir", default=None, help="read episodes from log_compaction.py shards")
+    parser.add_argument("--heldout-fraction", type=float, default=0.1,
+                        help="fraction of episodes held out by file hash (1 scores every episode)")
+    parser.add_argument("--gamma", type=float, default=None,
+                        help="discount for observed returns (default: the checkpoint's, else 0.95)")
+    parser.add_argument("--state-dim", type=int, default=11)
+    parser.add_argument("--out", type=Path, default=None, help="write all reports as JSON")
+    args = parser.parse_args()
+
+    try:
+        paths = expand_checkpoints(args.checkpoints)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    start = time.perf_counter()
+    columns = load_heldout(args.log_dir, args.compacted_dir, args.state_dim, args.heldout_fraction)
+    end = episode_ends(columns["s"], columns["ns"], columns["d"])
+    end_rows = np.flatnonzero(end)
+    rows = np.arange(len(end))
+    # Rows of episodes that finished logging; open ones have cut-short returns
+    complete = columns["d"].astype(bool)[end_rows[np.searchsorted(end_rows, rows)]]
+    print(f"Loaded {len(rows):,} held-out transitions ({len(end_rows):,} episodes) "
+          f"in {time.perf_counter() - start:.1f}s\n")
+
+    returns_cache: Dict[str, np.ndarray] = {}
+    reports = []
+    print(f"{'checkpoint':<28} {'agree':>7} {'agree@Q':>8} {'emergency':>9} {'override':>9} "
+          f"{'Q bias':>8} {'Q MAE':>8} {'corr':>6} {'states/s':>12}")
+    for path in paths:
+        q_fn, info = load_q_function(path, device)
+        if info.get("state_dim", args.state_dim) != args.state_dim:
+            print(f"{os.path.basename(path):<28} skipped: state_dim {info['state_dim']} != {args.state_dim}")
+            continue
+        gamma = args.gamma if args.gamma is not None else (info.get("gamma") or DEFAULT_GAMMA)
+        reward_config = info.get("reward_config")
+
+        # Returns depend only on gamma and the reward config, shared by most checkpoints
+        key = json.dumps([gamma, reward_config], sort_keys=True)
+        if key not in returns_cache:
+            r = columns["r"] if reward_config is None else recompute_rewards(
+                columns["s"], columns["ns"], columns["d"], reward_config)
+            returns_cache[key] = discounted_returns(r, end, gamma)
+
+        report = evaluate_policy(q_fn, columns, returns_cache[key], complete)
+        report.update(checkpoint=path, gamma=gamma, epoch=info.get("epoch"), train_loss=info.get("loss"))
+        reports.append(report)
+        print_report(os.path.basename(path), report, detail=len(paths) == 1)
+
+    print("\n  agree: selectAction (greedy, overrides included) vs logged action; agree@Q: where the network is consulted")
+    print("  override: post-argmax overrides among network-consulted states")
+
+    if args.out is not None:
+        args.out.write_text(json.dumps(reports, indent=2))
+        print(f"\nWrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
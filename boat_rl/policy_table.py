@@ -0,0 +1,339 @@
+# policy_table.py
+#
+# Compile the trained DQN into a quantized-state action table: a Luau module
+# whose lookup(state) costs eleven short bin scans and one string.byte,
+# instead of Agent:qValues' thousands of multiply-adds.
+#
+# Every state feature gets a small number of bins whose edges are quantiles
+# of the logged states, so bins are narrow where boats actually are.
+# Duplicate quantiles collapse (e.g. rays that usually see nothing and read
+# exactly 1.0), which can leave a feature with fewer bins than asked for.
+#
+# Only states that reach the network are used: selectAction's emergency
+# override (agent_policy.emergency_mask) handles the others with the
+# heuristic before Q is computed, so the table never needs to be right
+# there. Each visited cell stores the network's most common greedy action
+# over the logged states in it. Unvisited cells store the greedy action at
+# the cell's representative point (the per-feature bin medians).
+#
+# The report compares each bin layout's table size against agreement with
+# the full network on held-out episodes:
+#   decision agreement  table vs network argmax, on states that reach it
+#   policy agreement    selectAction with the table vs with the network,
+#                       overrides included, on all held-out states
+#
+# Bin layouts name a bin count per feature; "rays" sets all five rays:
+#   progress, lateral, heading, forward_speed, lateral_speed, speed,
+#   far_left, left, center, right, far_right
+#
+# Usage:
+#   python policy_table.py --layout progress=4,lateral=6,heading=4,rays=3 --layout ...
+#   python policy_table.py --layout progress=4,lateral=6,heading=4,rays=3 --export
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+from agent_policy import emergency_mask, select_actions
+from distill import load_states, predict
+from train_dqn import load_dqn_checkpoint
+
+BASE_DIR = Path(__file__).resolve().parent
+LUA_OUTPUT = BASE_DIR.parent / "src" / "ai" / "navigation" / "PolicyTable.lua"
+
+FEATURES = (
+    "progress", "lateral", "heading", "forward_speed", "lateral_speed", "speed",
+    "far_left", "left", "center", "right", "far_right",
+)
+RAYS = FEATURES[6:]
+
+DEFAULT_LAYOUTS = [
+    "progress=4,lateral=8,heading=6,forward_speed=3,lateral_speed=4",
+    "progress=2,lateral=4,heading=3,forward_speed=2,lateral_speed=2,speed=1,rays=2",
+    "progress=3,lateral=5,heading=4,forward_speed=2,lateral_speed=3,speed=2,rays=3",
+    "progress=4,lateral=6,heading=4,forward_speed=3,lateral_speed=3,speed=2,rays=3",
+]
+
+# Refuse layouts whose table would be larger than this many cells
+MAX_CELLS = 4_000_000
+
+LUA_CHARS_PER_LINE = 256
+
+
+# -----------------------------
+# Bins
+# -----------------------------
+def parse_layout(spec: str) -> List[int]:
+    """
+    "progress=4,rays=3" -> bins per feature; unnamed features get 1 bin.
+    """
+    bins = {name: 1 for name in FEATURES}
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        name, _, value = part.partition("=")
+        names = RAYS if name == "rays" else (name,)
+        if any(n not in bins for n in names) or not value.isdigit() or int(value) < 1:
+            raise ValueError(f"Bad layout entry {part!r}; expected <feature>=<bins> with features {FEATURES} or rays")
+        for n in names:
+            bins[n] = int(value)
+    return [bins[name] for name in FEATURES]
+
+
+def quantile_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    """
+    Inner bin edges at equal-frequency quantiles. A value x falls in bin
+    #(edges <= x), the same rule the Luau lookup uses.
+    """
+    if bins <= 1 or len(values) == 0:
+        return np.zeros(0)
+    edges = np.unique(np.quantile(values, np.arange(1, bins) / bins))
+    # An edge at the minimum would leave its lower bin empty
+    return edges[edges > values.min()]
+
+
+def bin_indices(states: np.ndarray, edges: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Flat row-major cell index of every state.
+    """
+    sizes = [len(e) + 1 for e in edges]
+    per_dim = [np.searchsorted(e, states[:, d], side="right") for d, e in enumerate(edges)]
+    return np.ravel_multi_index(per_dim, sizes)
+
+
+def bin_representatives(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Median logged value of each bin (its midpoint if no state falls in it).
+    """
+    idx = np.searchsorted(edges, values, side="right")
+    bounds = np.concatenate([[values.min()], edges, [values.max()]])
+    reps = np.empty(len(edges) + 1)
+    for b in range(len(edges) + 1):
+        inside = values[idx == b]
+        reps[b] = np.median(inside) if len(inside) else 0.5 * (bounds[b] + bounds[b + 1])
+    return reps
+
+
+# -----------------------------
+# Compilation
+# -----------------------------
+def greedy_actions(model: torch.nn.Module, states: np.ndarray) -> np.ndarray:
+    q = predict(model, torch.from_numpy(np.ascontiguousarray(states, dtype=np.float32)))
+    return q.argmax(dim=1).numpy() + 1  # 1-based, as in the game
+
+
+def compile_table(model: torch.nn.Module, states: np.ndarray, bins: Sequence[int], num_actions: int) -> dict:
+    """
+    Fit edges to `states` and fill every cell. Returns {"edges", "sizes",
+    "actions" (uint8 per cell, 1-based), "visited"}.
+    """
+    edges = [quantile_edges(states[:, d], b) for d, b in enumerate(bins)]
+    sizes = [len(e) + 1 for e in edges]
+    num_cells = int(np.prod(sizes))
+    if num_cells > MAX_CELLS:
+        raise ValueError(f"Layout has {num_cells:,} cells, above the {MAX_CELLS:,} limit")
+
+    # Unvisited cells: the network at the cell's representative state
+    reps = [bin_representatives(states[:, d], e) for d, e in enumerate(edges)]
+    actions = np.empty(num_cells, dtype=np.uint8)
+    chunk = 1 << 18
+    for start in range(0, num_cells, chunk):
+        cells = np.arange(start, min(start + chunk, num_cells))
+        grid = np.stack([reps[d][i] for d, i in enumerate(np.unravel_index(cells, sizes))], axis=1)
+        actions[cells] = greedy_actions(model, grid)
+
+    # Visited cells: the network's most common choice among logged states
+    cell = bin_indices(states, edges)
+    votes = np.bincount(cell * num_actions + greedy_actions(model, states) - 1,
+                        minlength=num_cells * num_actions).reshape(num_cells, num_actions)
+    visited = votes.sum(axis=1) > 0
+    actions[visited] = votes[visited].argmax(axis=1) + 1
+
+    return {"edges": edges, "sizes": sizes, "actions": actions, "visited": int(visited.sum())}
+
+
+def table_actions(table: dict, states: np.ndarray) -> np.ndarray:
+    return table["actions"][bin_indices(states, table["edges"])].astype(np.int64)
+
+
+def lookup_reference(table: dict, state: Sequence[float]) -> int:
+    """
+    Scalar mirror of the emitted Luau lookup, for checking the index math.
+    """
+    idx = 0
+    for d, edges in enumerate(table["edges"]):
+        b = 0
+        for k, edge in enumerate(edges, start=1):
+            if state[d] >= edge:
+                b = k
+            else:
+                break
+        idx = idx * table["sizes"][d] + b
+    return int(table["actions"][idx])
+
+
+def evaluate_table(table: dict, model: torch.nn.Module, states: np.ndarray) -> dict:
+    greedy = greedy_actions(model, states)
+    looked_up = table_actions(table, states)
+    decides = ~emergency_mask(states)
+    policy_net, _ = select_actions(states, greedy)
+    policy_table, _ = select_actions(states, looked_up)
+    return {
+        "decision_agreement": float(np.mean(looked_up[decides] == greedy[decides])) if decides.any() else float("nan"),
+        "argmax_agreement": float(np.mean(looked_up == greedy)),
+        "policy_agreement": float(np.mean(policy_table == policy_net)),
+        "decision_states": int(decides.sum()),
+    }
+
+
+# -----------------------------
+# Luau module
+# -----------------------------
+def _lua_number_list(values) -> str:
+    return "{" + ", ".join(repr(float(v)) for v in values) + "}"
+
+
+def export_lua_table(table: dict, layout: str, output_path: Path, header: str):
+    """
+    Write the action table as a Luau module: per-feature edges and one
+    digit string with an action per cell, in row-major cell order.
+    """
+    digits = "".join(chr(48 + int(a)) for a in table["actions"])
+    chunks = [digits[i:i + LUA_CHARS_PER_LINE] for i in range(0, len(digits), LUA_CHARS_PER_LINE)]
+
+    parts = [
+        f"-- {header}",
+        f"-- Layout: {layout}",
+        f"-- Cells: {len(table['actions']):,} ({' x '.join(str(s) for s in table['sizes'])})",
+        "-- lookup(state) returns the network's greedy action (1-based); apply",
+        "-- Agent:selectAction's overrides to it as with the argmax of qValues.",
+        "",
+        "local EDGES = {",
+    ]
+    parts += [f"    {_lua_number_list(e)},  -- {name}" for name, e in zip(FEATURES, table["edges"])]
+    parts += [
+        "}",
+        "",
+        f"local SIZES = {{{', '.join(str(s) for s in table['sizes'])}}}",
+        "",
+        "local ACTIONS = table.concat({",
+    ]
+    parts += [f'    "{chunk}",' for chunk in chunks]
+    parts += [
+        "})",
+        "",
+        "local function lookup(state)",
+        "    local idx = 0",
+        f"    for d = 1, {len(FEATURES)} do",
+        "        local x = state[d]",
+        "        local edges = EDGES[d]",
+        "        local b = 0",
+        "        for k = 1, #edges do",
+        "            if x >= edges[k] then",
+        "                b = k",
+        "            else",
+        "                break",
+        "            end",
+        "        end",
+        "        idx = idx * SIZES[d] + b",
+        "    end",
+        "    return string.byte(ACTIONS, idx + 1) - 48",
+        "end",
+        "",
+        "return {",
+        f"    state_dim = {len(FEATURES)},",
+        f"    num_actions = {int(table['actions'].max()) if len(table['actions']) else 0},",
+        "    lookup = lookup,",
+        "}",
+        "",
+    ]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text("\n".join(parts))
+    print(f"Exported policy table to {output_path}")
+    print(f"File size: {output_path.stat().st_size / 1024:.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the DQN into a quantized-state action table")
+    parser.add_argument("--checkpoint", type=Path, default=BASE_DIR / "dqn_weights_best.pth")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--layout", action="append", default=None,
+                        help="bins per feature, e.g. progress=4,lateral=6,rays=3 (repeatable)")
+    parser.add_argument("--heldout-fraction", type=float, default=0.1)
+    parser.add_argument("--all-states", action="store_true",
+                        help="also fit states handled by the emergency override")
+    parser.add_argument("--report", type=Path, default=None, help="write all layouts as JSON")
+    parser.add_argument("--export", action="store_true",
+                        help="write the best layout (or the only one) as a Luau module")
+    parser.add_argument("--output", type=Path, default=LUA_OUTPUT)
+    args = parser.parse_args()
+
+    layouts = args.layout or DEFAULT_LAYOUTS
+    try:
+        bins = [parse_layout(spec) for spec in layouts]
+    except ValueError as e:
+        parser.error(str(e))
+
+    model, checkpoint = load_dqn_checkpoint(str(args.checkpoint))
+    state_dim = checkpoint.get("state_dim", 11)
+    num_actions = checkpoint.get("num_actions", 5)
+    if state_dim != len(FEATURES):
+        parser.error(f"Policy tables need the {len(FEATURES)}-dim state, checkpoint has {state_dim}")
+
+    train, heldout = load_states(args.log_dir, state_dim, args.heldout_fraction)
+    fit = train if args.all_states else train[~emergency_mask(train)]
+    print(f"Fitting on {len(fit):,} logged states, evaluating on {len(heldout):,} held-out\n")
+
+    results = []
+    tables: Dict[str, dict] = {}
+    for spec, layout_bins in zip(layouts, bins):
+        try:
+            table = compile_table(model, fit, layout_bins, num_actions)
+        except ValueError as e:
+            print(f"Skipping {spec}: {e}")
+            continue
+        cells = len(table["actions"])
+        result = {
+            "layout": spec,
+            "sizes": table["sizes"],
+            "cells": cells,
+            "visited_fraction": table["visited"] / cells,
+            **evaluate_table(table, model, heldout),
+        }
+        results.append(result)
+        tables[spec] = table
+
+    print(f"{'cells':>10} {'visited':>8} {'decision':>9} {'argmax':>8} {'policy':>8}  layout")
+    for r in results:
+        print(f"{r['cells']:>10,} {r['visited_fraction']:>8.1%} {r['decision_agreement']:>9.2%} "
+              f"{r['argmax_agreement']:>8.2%} {r['policy_agreement']:>8.2%}  {r['layout']}")
+    print("  decision: table vs network argmax where the network is consulted")
+    print("  policy:   selectAction with the table vs with the network, all states")
+
+    if args.report is not None:
+        args.report.write_text(json.dumps({"checkpoint": str(args.checkpoint), "layouts": results}, indent=2))
+        print(f"\nWrote {args.report}")
+
+    if not args.export or not results:
+        return
+
+    best: Optional[dict] = max(results, key=lambda r: (r["policy_agreement"], -r["cells"]))
+    table = tables[best["layout"]]
+    states = heldout[:1000]
+    mismatches = sum(lookup_reference(table, s) != a for s, a in zip(states, table_actions(table, states)))
+    if mismatches:
+        raise RuntimeError(f"Scalar lookup disagrees with the compiled table on {mismatches} states")
+
+    header = (f"AUTO-GENERATED by boat_rl/policy_table.py from {args.checkpoint.name}. "
+              "Do not edit by hand.")
+    print(f"\nExporting {best['layout']} ({best['policy_agreement']:.2%} policy agreement)")
+    export_lua_table(table, best["layout"], args.output, header)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# prioritized_replay.py
+#
+# Proportional prioritized experience replay for offline DQN training.
+#
+# A flat NumPy sum-tree holds one priority per transition. Sampling and
+# priority updates walk the tree one level at a time for the whole batch at
+# once, so each operation is O(batch * log n) with no per-item Python work,
+# which keeps it usable at millions of transitions.
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SumTree:
+    """
+    Binary sum-tree over `size` leaves stored in one array.
+
+    Node 1 is the root, node i has children 2i and 2i+1, and leaves occupy
+    [capacity, 2 * capacity) where capacity is `size` rounded up to a power of
+    two. Padding leaves keep priority 0 and are never sampled.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("SumTree needs at least one leaf")
+        self.size = size
+        self.capacity = 1 << max(0, int(np.ceil(np.log2(size))))
+        self.depth = int(np.log2(self.capacity))
+        self.tree = np.zeros(2 * self.capacity, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def priorities(self, indices: np.ndarray) -> np.ndarray:
+        return self.tree[self.capacity + indices]
+
+    def set_all(self, priorities: np.ndarray):
+        """
+        Overwrite every leaf and rebuild the internal nodes bottom-up.
+        """
+        self.tree[:] = 0.0
+        self.tree[self.capacity:self.capacity + self.size] = priorities
+        for level_start in (1 << d for d in range(self.depth - 1, -1, -1)):
+            nodes = np.arange(level_start, 2 * level_start)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray):
+        """
+        Set leaf priorities and refresh their ancestors.
+
+        Parents are recomputed from their children rather than adjusted by a
+        delta, so duplicate indices within a batch stay consistent.
+        """
+        nodes = np.asarray(indices, dtype=np.int64) + self.capacity
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes >> 1)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """
+        Return the leaf index for each prefix-sum value in [0, total).
+        """
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(values.shape[0], dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values >= left_sum
+            values = np.where(go_right, values - left_sum, values)
+            nodes = np.where(go_right, left + 1, left)
+        # Float round-off can land on a zero-priority padding leaf
+        return np.minimum(nodes - self.capacity, self.size - 1)
+
+
+class PrioritizedSampler:
+    """
+    Proportional prioritized sampling (Schaul et al., 2016) over a fixed dataset.
+
+    P(i) = p_i^alpha / sum_k p_k^alpha, with p_i = |TD error| + eps.
+    Importance-sampling weights (N * P(i))^-beta are normalized by the batch
+    maximum; beta is annealed towards 1 over training by the caller.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        alpha: float = 0.6,
+        eps: float = 1e-3,
+        initial_priorities: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ):
+        self.size = size
+        self.alpha = alpha
+        self.eps = eps
+        self.tree = SumTree(size)
+        self.rng = np.random.default_rng(seed)
+
+        if initial_priorities is None:
+            # Every transition starts at the same priority until it is first trained on
+            initial_priorities = np.ones(size, dtype=np.float64)
+        self.tree.set_all(np.power(initial_priorities, alpha))
+
+    def sample(self, batch_size: int, beta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw a stratified batch of indices and their importance-sampling weights.
+        """
+        total = self.tree.total
+        segment = total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        indices = self.tree.find(np.minimum(values, np.nextafter(total, 0.0)))
+
+        probs = self.tree.priorities(indices) / total
+        weights = np.power(self.size * probs, -beta)
+        weights /= weights.max()
+        return indices, weights.astype(np.float32)
+
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray):
+        priorities = np.abs(td_errors).astype(np.float64) + self.eps
+        self.tree.update(indices, np.power(priorities, self.alpha))
@@ -0,0 +1,376 @@
+# raycast.py
+#
+# Batched analytic version of the five-ray obstacle sensor in Env.lua
+# (rayDistanceNormalized). Rays are cast for many boat poses at once against
+# the river walls and finish line (ray-box slabs) and the ball rocks
+# (ray-sphere), and normalized like the Luau code: hit distance /
+# VISION_MAX_DISTANCE, 1.0 on a miss.
+#
+# Rocks are looked up through RockGrid, a per-layout bucket grid along the
+# river, so each ray fan only tests the rocks in the handful of cells it can
+# reach instead of every rock on the course.
+#
+# Run directly for a rays/sec benchmark, or with --audit to compare logged
+# ray columns against the static course geometry.
+
+import argparse
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from world_config import (
+    BOAT_Y, COURSE_START_Z, RIVER_CENTER_X, RIVER_HALF_WIDTH, RIVER_LENGTH,
+    ROCK_COUNT, ROCK_RADIUS_RANGE, ROCK_REGION_X, ROCK_REGION_Z, STATIC_BOXES,
+    scatter_rocks,
+)
+
+# -----------------------------
+# Env.lua sensing
+# -----------------------------
+VISION_MAX_DISTANCE = 120.0     # Config.visionMaxDistance
+RAYCAST_FORWARD_OFFSET = 15.0
+RAYCAST_HEIGHT_OFFSET = 3.0
+RAY_COLUMNS = slice(6, 11)      # distFarLeft .. distFarRight in the state vector
+
+# Local ray directions (x = right, z = -forward), as in Env.lua
+RAY_DIRS_LOCAL = np.array([[-1.0, -1.0], [-0.5, -1.0], [0.0, -1.0], [0.5, -1.0], [1.0, -1.0]])
+RAY_DIRS_LOCAL /= np.linalg.norm(RAY_DIRS_LOCAL, axis=1, keepdims=True)
+NUM_RAYS = len(RAY_DIRS_LOCAL)
+
+# Grid cells span the river width and this many studs along it
+DEFAULT_CELL_SIZE = 40.0
+
+
+# -----------------------------
+# Geometry
+# -----------------------------
+def ray_directions(psi: np.ndarray) -> np.ndarray:
+    """
+    World-space (x, z) directions of the five sensor rays, shape (N, 5, 2).
+    """
+    look = np.stack([np.sin(psi), np.cos(psi)], axis=-1)
+    right = np.stack([-np.cos(psi), np.sin(psi)], axis=-1)
+    # local (x, z) -> x * RightVector - z * LookVector
+    return (RAY_DIRS_LOCAL[None, :, 0, None] * right[:, None, :]
+            - RAY_DIRS_LOCAL[None, :, 1, None] * look[:, None, :])
+
+
+def ray_origins(x: np.ndarray, z: np.ndarray, psi: np.ndarray, boat_y: float = BOAT_Y) -> np.ndarray:
+    """
+    root.Position + LookVector * 15 + (0, 3, 0), shape (N, 3).
+    """
+    return np.stack([
+        x + np.sin(psi) * RAYCAST_FORWARD_OFFSET,
+        np.full_like(x, boat_y + RAYCAST_HEIGHT_OFFSET),
+        z + np.cos(psi) * RAYCAST_FORWARD_OFFSET,
+    ], axis=-1)
+
+
+def ray_box_distances(origins: np.ndarray, dirs: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """
+    Entry distance of horizontal rays into axis-aligned boxes, inf on a miss.
+
+    origins (N, 3), dirs (N, R, 2) as (x, z), boxes (M, 2, 3). Rays starting
+    inside a box do not hit it, as with Workspace:Raycast. Returns (N, R).
+    """
+    o = origins[:, None, None, :]                          # N,1,1,3
+    lo, hi = boxes[None, None, :, 0, :], boxes[None, None, :, 1, :]
+    t_near = np.zeros(dirs.shape[:2] + (boxes.shape[0],))
+    t_far = np.full_like(t_near, np.inf)
+
+    for axis, d in ((0, dirs[..., 0]), (2, dirs[..., 1])):
+        d = d[..., None]                                   # N,R,1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t1 = (lo[..., axis] - o[..., axis]) / d
+            t2 = (hi[..., axis] - o[..., axis]) / d
+        # A ray parallel to the slab is either always or never inside it
+        parallel = d == 0
+        inside = (o[..., axis] >= lo[..., axis]) & (o[..., axis] <= hi[..., axis])
+        enter = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2))
+        leave = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2))
+        t_near = np.maximum(t_near, enter)
+        t_far = np.minimum(t_far, leave)
+
+    # Rays are horizontal, so the y slab is all-or-nothing
+    in_y = (o[..., 1] >= lo[..., 1]) & (o[..., 1] <= hi[..., 1])
+    start_inside = np.all((o >= lo) & (o <= hi), axis=-1)
+    hit = in_y & (t_near <= t_far) & ~start_inside
+    return np.where(hit, t_near, np.inf).min(axis=-1)
+
+
+def ray_sphere_distances(origins: np.ndarray, dirs: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    First hit distance of horizontal rays against per-boat spheres, inf on a miss.
+
+    origins (N, 3), dirs (N, R, 2), centers (N, K, 3), radii (N, K); a radius
+    of 0 is an absent rock. Returns (N, R).
+    """
+    if centers.shape[1] == 0:
+        return np.full(dirs.shape[:2], np.inf)
+    rel = centers - origins[:, None, :]                    # N,K,3
+    b = np.einsum("nrc,nkc->nrk", dirs, rel[..., [0, 2]])
+    c = (rel * rel).sum(axis=-1) - np.where(radii > 0, radii * radii, -1.0)
+    disc = b * b - c[:, None, :]
+    with np.errstate(invalid="ignore"):
+        t = b - np.sqrt(disc)
+    # c < 0 means the origin is inside the rock, which the raycast ignores
+    hit = (disc >= 0) & (t >= 0) & (c[:, None, :] >= 0)
+    return np.where(hit, t, np.inf).min(axis=-1)
+
+
+# -----------------------------
+# Rock index
+# -----------------------------
+class RockGrid:
+    """
+    Bucket grid over the rocks of L independent layouts.
+
+    The river is narrower than one ray, so cells are strips of `cell_size`
+    studs along z spanning the full width. Each layout keeps its rocks sorted
+    by z, and cell_start[l, c] is the index of its first rock in cell c, so the
+    rocks of any run of cells are one contiguous slice. Query cost depends on
+    how many rocks sit near a boat, not on how many are on the course.
+    """
+
+    def __init__(self, centers: np.ndarray, radii: np.ndarray, cell_size: float = DEFAULT_CELL_SIZE):
+        self.num_layouts, self.max_rocks = radii.shape
+        self.cell_size = cell_size
+        self.z0 = ROCK_REGION_Z[0]
+        self.num_cells = max(1, int(math.ceil((ROCK_REGION_Z[1] - self.z0) / cell_size)))
+        # Interior cell boundaries; rocks outside the region fall into the end cells
+        self.boundaries = self.z0 + cell_size * np.arange(1, self.num_cells)
+        self.max_radius = ROCK_RADIUS_RANGE[1]
+
+        self.centers = np.zeros((self.num_layouts, self.max_rocks, 3))
+        self.radii = np.zeros((self.num_layouts, self.max_rocks))
+        self.cell_start = np.zeros((self.num_layouts, self.num_cells + 1), dtype=np.int64)
+        self.update(np.arange(self.num_layouts), centers, radii)
+
+    def update(self, layouts: np.ndarray, centers: np.ndarray, radii: np.ndarray):
+        """
+        Replace the rocks of the given layouts (an index array or boolean mask).
+        """
+        key = np.where(radii > 0, centers[..., 2], np.inf)
+        order = np.argsort(key, axis=1)
+        key = np.take_along_axis(key, order, axis=1)
+
+        self.centers[layouts] = np.take_along_axis(centers, order[..., None], axis=1)
+        self.radii[layouts] = np.take_along_axis(radii, order, axis=1)
+        starts = (key[:, None, :] < self.boundaries[None, :, None]).sum(axis=-1)
+        present = np.isfinite(key).sum(axis=1)
+        self.cell_start[layouts] = np.concatenate(
+            [np.zeros((len(key), 1), dtype=np.int64), starts, present[:, None]], axis=1
+        )
+
+    def cell_of(self, z: np.ndarray) -> np.ndarray:
+        return np.clip(np.floor((z - self.z0) / self.cell_size), 0, self.num_cells - 1).astype(np.int64)
+
+    def query(self, layouts: np.ndarray, z_lo: np.ndarray, z_hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rocks whose center could lie within max radius of [z_lo, z_hi].
+
+        Returns centers (N, W, 3) and radii (N, W) padded to the widest window
+        in the batch; padding has radius 0.
+        """
+        first = self.cell_start[layouts, self.cell_of(z_lo - self.max_radius)]
+        last = self.cell_start[layouts, self.cell_of(z_hi + self.max_radius) + 1]
+        width = int((last - first).max()) if len(layouts) else 0
+
+        idx = first[:, None] + np.arange(width)
+        valid = idx < last[:, None]
+        idx = np.minimum(idx, self.max_rocks - 1)
+        rows = layouts[:, None]
+        return self.centers[rows, idx], np.where(valid, self.radii[rows, idx], 0.0)
+
+
+# -----------------------------
+# Sensor
+# -----------------------------
+def normalize_distances(t: np.ndarray) -> np.ndarray:
+    return np.where(t <= VISION_MAX_DISTANCE, t / VISION_MAX_DISTANCE, 1.0)
+
+
+def sensor_rays(
+    x: np.ndarray,
+    z: np.ndarray,
+    psi: np.ndarray,
+    grid: Optional[RockGrid] = None,
+    layouts: Optional[np.ndarray] = None,
+    boat_y: float = BOAT_Y,
+) -> np.ndarray:
+    """
+    Env.rayDistanceNormalized for all five rays of N poses. Returns (N, 5).
+
+    psi is the yaw with 0 facing downstream (+Z). Boat i sees the rocks of
+    grid layout layouts[i] (default i); without a grid only walls and the
+    finish line are hit.
+    """
+    origins = ray_origins(x, z, psi, boat_y)
+    dirs = ray_directions(psi)
+    t = ray_box_distances(origins, dirs, STATIC_BOXES)
+
+    if grid is not None:
+        layouts = np.arange(len(x)) if layouts is None else layouts
+        ends_z = origins[:, None, 2] + dirs[..., 1] * VISION_MAX_DISTANCE
+        z_lo = np.minimum(origins[:, 2], ends_z.min(axis=1))
+        z_hi = np.maximum(origins[:, 2], ends_z.max(axis=1))
+        centers, radii = grid.query(layouts, z_lo, z_hi)
+        t = np.minimum(t, ray_sphere_distances(origins, dirs, centers, radii))
+
+    return normalize_distances(t)
+
+
+# -----------------------------
+# Auditing logged rays
+# -----------------------------
+def poses_from_states(states: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Recover (x, z, |psi|, valid) from logged states.
+
+    progress and lateral give the position; headingDot only gives the yaw up
+    to its sign. Rows where either is clamped (the boat is past an end of the
+    course or against a wall) do not pin the position and are marked invalid.
+    """
+    progress = states[:, 0].astype(np.float64)
+    lateral = states[:, 1].astype(np.float64)
+    x = RIVER_CENTER_X + lateral * RIVER_HALF_WIDTH
+    z = COURSE_START_Z + progress * RIVER_LENGTH
+    abs_psi = np.arccos(np.clip(states[:, 2].astype(np.float64), -1.0, 1.0))
+    valid = (progress > 0) & (progress < 1) & (np.abs(lateral) < 1)
+    return x, z, abs_psi, valid
+
+
+def regenerate_ray_columns(
+    states: np.ndarray,
+    grid: Optional[RockGrid] = None,
+    layouts: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recompute the ray columns of logged states from their poses.
+
+    For each row the yaw sign whose prediction is closest to the logged rays
+    is kept. Returns (states with ray columns replaced, valid mask); invalid
+    rows keep their logged rays.
+    """
+    x, z, abs_psi, valid = poses_from_states(states)
+    logged = states[:, RAY_COLUMNS].astype(np.float64)
+
+    candidates = [sensor_rays(x, z, sign * abs_psi, grid, layouts) for sign in (1.0, -1.0)]
+    errors = [np.abs(pred - logged).sum(axis=1) for pred in candidates]
+    rays = np.where((errors[0] <= errors[1])[:, None], candidates[0], candidates[1])
+
+    out = np.array(states, dtype=np.float32, copy=True)
+    out[valid, RAY_COLUMNS] = rays[valid]
+    return out, valid
+
+
+def audit_ray_columns(states: np.ndarray, tol: float = 0.02) -> Dict[str, np.ndarray]:
+    """
+    Compare logged rays with the static course (walls and finish line).
+
+    Logged episodes do not record their rock layout, so a logged ray shorter
+    than the prediction is expected (a rock, or another boat); one longer than
+    the prediction means the sensor saw less than the geometry allows. Returns
+    per-ray fractions of "match", "occluded" and "excess" rows, plus the row count.
+    """
+    regenerated, valid = regenerate_ray_columns(states)
+    diff = states[valid, RAY_COLUMNS].astype(np.float64) - regenerated[valid, RAY_COLUMNS]
+    n = max(int(valid.sum()), 1)
+    return {
+        "rows": int(valid.sum()),
+        "match": (np.abs(diff) <= tol).sum(axis=0) / n,
+        "occluded": (diff < -tol).sum(axis=0) / n,
+        "excess": (diff > tol).sum(axis=0) / n,
+    }
+
+
+def load_logged_states(log_dir: str, state_dim: int = 11) -> np.ndarray:
+    from episode_store import episode_to_arrays, iter_json_logs, read_json_episode
+
+    chunks = []
+    for path in iter_json_logs([log_dir]):
+        transitions = read_json_episode(path)
+        if not transitions or len(transitions[0].get("s", [])) != state_dim:
+            continue
+        try:
+            s, _, _, _, _ = episode_to_arrays(transitions, state_dim)
+        except (KeyError, TypeError, ValueError):
+            continue
+        chunks.append(s)
+    return np.concatenate(chunks) if chunks else np.zeros((0, state_dim), dtype=np.float32)
+
+
+# -----------------------------
+# Benchmark
+# -----------------------------
+def random_poses(num_poses: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    x = rng.uniform(ROCK_REGION_X[0], ROCK_REGION_X[1], num_poses)
+    z = rng.uniform(ROCK_REGION_Z[0], ROCK_REGION_Z[1], num_poses)
+    psi = rng.uniform(-np.pi, np.pi, num_poses)
+    return x, z, psi
+
+
+def benchmark(num_poses: int, rock_count: int, repeats: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x, z, psi = random_poses(num_poses, rng)
+    centers, radii = scatter_rocks(num_poses, rng, rock_count=rock_count)
+
+    start = time.perf_counter()
+    grid = RockGrid(centers, radii)
+    build = time.perf_counter() - start
+
+    def brute():
+        origins = ray_origins(x, z, psi)
+        dirs = ray_directions(psi)
+        t = np.minimum(
+            ray_box_distances(origins, dirs, STATIC_BOXES),
+            ray_sphere_distances(origins, dirs, centers, radii),
+        )
+        return normalize_distances(t)
+
+    def gridded():
+        return sensor_rays(x, z, psi, grid)
+
+    results = {}
+    for name, fn in (("brute force", brute), ("grid", gridded)):
+        fn()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            out = fn()
+        elapsed = (time.perf_counter() - start) / repeats
+        results[name] = out
+        print(f"  {name:<12} {num_poses * NUM_RAYS / elapsed:>14,.0f} rays/sec")
+
+    placed = int((radii > 0).sum(axis=1).mean())
+    mismatch = np.abs(results["brute force"] - results["grid"]).max()
+    print(f"  {placed} rocks per layout, grid build {build * 1e3:.1f} ms, max |brute - grid| = {mismatch:.2e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched 5-ray obstacle sensor")
+    parser.add_argument("--poses", type=int, default=20000)
+    parser.add_argument("--rock-count", type=int, default=ROCK_COUNT)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--audit", metavar="LOG_DIR", default=None,
+                        help="Compare logged ray columns in LOG_DIR with the course geometry")
+    parser.add_argument("--tol", type=float, default=0.02)
+    args = parser.parse_args()
+
+    if args.audit is None:
+        print(f"Casting {args.poses} poses x {NUM_RAYS} rays, rock count {args.rock_count}")
+        benchmark(args.poses, args.rock_count, args.repeats)
+        return
+
+    states = load_logged_states(args.audit)
+    report = audit_ray_columns(states, args.tol)
+    print(f"Audited {report['rows']} of {len(states)} logged states (tolerance {args.tol})")
+    names = ("farLeft", "left", "center", "right", "farRight")
+    print(f"  {'ray':<9} {'match':>7} {'occluded':>9} {'excess':>7}")
+    for i, name in enumerate(names):
+        print(f"  {name:<9} {report['match'][i]:>7.1%} {report['occluded'][i]:>9.1%} {report['excess'][i]:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
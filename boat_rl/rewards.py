@@ -0,0 +1,272 @@
+# rewards.py
+#
+# Env.getRewardAndDone as vectorized NumPy, shared by the simulator and by
+# offline reward recomputation.
+#
+# Logged transitions bake in the reward constants that were active when they
+# were played. recompute_rewards() rebuilds r from the stored s/ns columns and
+# the terminal flag under any reward config, so Config.lua changes can be
+# evaluated (and trained on, via train_dqn --reward-config) without new play
+# sessions. Configs are JSON objects or Config.lua itself, using the Config.lua
+# key names; omitted keys keep the defaults below.
+#
+# Run directly to check recomputation against logged rewards and to sweep a
+# parameter over a log directory or episode store.
+
+import argparse
+import json
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from world_config import COURSE_START_Z, FINISH_TRIGGER, HULL_HALF_LENGTH, HULL_HALF_WIDTH, RIVER_LENGTH
+
+# -----------------------------
+# Config.lua
+# -----------------------------
+MAX_STEPS_PER_EPISODE = 800
+
+REWARD_CONFIG = {
+    "progressRewardScale": 5.0,
+    "stepPenalty": -0.001,
+    "finishReward": 500.0,
+    "crashPenalty": -30.0,
+    "velocityRewardScale": 0.3,
+    "targetForwardSpeed": 0.2,
+    "lateralPenaltyScale": 0.15,
+    "alignmentRewardScale": 0.1,
+    "checkpointStep": 0.1,
+    "checkpointReward": 10.0,
+    "centerPenaltyScale": 0.1,
+    "obstacleProxPenaltyScale": 0.15,
+    "obstacleProxThreshold": 0.5,
+}
+
+
+# Lowest progress at which a boat can touch the finish trigger. Touched fires
+# up to about one hull diagonal before the hull's own bounding box arrives
+# (seat, welded blocks), so allow two.
+FINISH_PROGRESS = (
+    FINISH_TRIGGER[0][2] - 2 * float(np.hypot(HULL_HALF_LENGTH, HULL_HALF_WIDTH)) - COURSE_START_Z
+) / RIVER_LENGTH
+
+_LUA_ASSIGNMENT = re.compile(r"^\s*Config\.(\w+)\s*=\s*(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)")
+
+
+def load_reward_config(path: str) -> Dict[str, float]:
+    """
+    Read reward constants from a JSON object or from a Config.lua file.
+
+    JSON keys must be REWARD_CONFIG names; from Config.lua only the reward
+    constants are picked up.
+    """
+    with open(path, "r") as f:
+        text = f.read()
+
+    if path.endswith(".lua"):
+        config = {}
+        for line in text.splitlines():
+            match = _LUA_ASSIGNMENT.match(line)
+            if match and match.group(1) in REWARD_CONFIG:
+                config[match.group(1)] = float(match.group(2))
+        return config
+
+    config = json.loads(text)
+    if not isinstance(config, dict):
+        raise ValueError(f"Reward config {path} must be a JSON object")
+    unknown = sorted(set(config) - set(REWARD_CONFIG))
+    if unknown:
+        raise ValueError(f"Unknown reward config keys in {path}: {', '.join(unknown)}")
+    return {key: float(value) for key, value in config.items()}
+
+
+def reward_and_done(
+    prev_states: np.ndarray,
+    states: np.ndarray,
+    finished: np.ndarray,
+    crashed: np.ndarray,
+    prev_finished: Optional[np.ndarray] = None,
+    prev_crashed: Optional[np.ndarray] = None,
+    config: Optional[Dict[str, float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Env.getRewardAndDone over arrays of (prevInfo, info) pairs.
+
+    prev_states/states are (N, 11) states in Env.getState order; the finished
+    and crashed flags are the boat attributes after the step (and before it,
+    defaulting to False). Returns (reward float64 (N,), done bool (N,)).
+    """
+    cfg = dict(REWARD_CONFIG, **(config or {}))
+    prev_states = np.asarray(prev_states, dtype=np.float64)
+    states = np.asarray(states, dtype=np.float64)
+    prev_finished = np.zeros(len(states), dtype=bool) if prev_finished is None else prev_finished
+    prev_crashed = np.zeros(len(states), dtype=bool) if prev_crashed is None else prev_crashed
+
+    delta_progress = states[:, 0] - prev_states[:, 0]
+    reward = cfg["progressRewardScale"] * delta_progress
+
+    if cfg["checkpointStep"] > 0:
+        prev_cp = np.floor(prev_states[:, 0] / cfg["checkpointStep"])
+        curr_cp = np.floor(states[:, 0] / cfg["checkpointStep"])
+        reward += cfg["checkpointReward"] * np.maximum(curr_cp - prev_cp, 0)
+
+    fwd = states[:, 3]
+    reward += np.where(
+        fwd > 0,
+        cfg["velocityRewardScale"] * (1.0 - np.abs(fwd - cfg["targetForwardSpeed"])),
+        cfg["velocityRewardScale"] * fwd,
+    )
+
+    reward += cfg["alignmentRewardScale"] * states[:, 2]
+    reward -= cfg["lateralPenaltyScale"] * np.abs(states[:, 4])
+
+    if cfg["centerPenaltyScale"] > 0:
+        reward -= cfg["centerPenaltyScale"] * states[:, 1] ** 2
+
+    if cfg["obstacleProxPenaltyScale"] > 0:
+        threshold = cfg["obstacleProxThreshold"]
+        min_ray = states[:, 6:11].min(axis=1)
+        reward -= np.where(
+            min_ray < threshold,
+            cfg["obstacleProxPenaltyScale"] * (threshold - min_ray) / threshold,
+            0.0,
+        )
+
+    reward += cfg["stepPenalty"]
+    reward = np.where((delta_progress <= 0) & (reward > 0), 0.0, reward)
+
+    finish_now = finished & ~prev_finished
+    crash_now = crashed & ~prev_crashed & ~finish_now
+    reward += np.where(finish_now, cfg["finishReward"], 0.0)
+    reward += np.where(crash_now, cfg["crashPenalty"], 0.0)
+    return reward, finish_now | crash_now
+
+
+# -----------------------------
+# Offline recomputation
+# -----------------------------
+def episode_starts(d: np.ndarray) -> np.ndarray:
+    """
+    Start row of each episode in concatenated columns; every episode but
+    possibly the last ends with d=True.
+    """
+    d = np.asarray(d, dtype=bool)
+    return np.concatenate([[0], np.flatnonzero(d[:-1]) + 1]).astype(np.int64)
+
+
+def terminal_flags(
+    ns: np.ndarray,
+    d: np.ndarray,
+    max_steps: int = MAX_STEPS_PER_EPISODE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split logged done flags into (finished, crashed).
+
+    The log only records d, which also covers the maxStepsPerEpisode cut.
+    A finish shows in the terminal next state as a boat at the finish
+    trigger with velocityMag exactly 0, since FinishService anchors it;
+    crashed boats are still moving. BotService logs transitions from its
+    second step on, so an episode cut by MAX_STEPS has max_steps - 1
+    transitions; any other terminal transition is a crash.
+    """
+    d = np.asarray(d, dtype=bool)
+    ns = np.asarray(ns)
+    finished = d & (ns[:, 0] >= FINISH_PROGRESS) & (ns[:, 5] == 0)
+
+    starts = episode_starts(d)
+    lengths = np.diff(np.append(starts, len(d)))
+    position = np.arange(len(d)) - np.repeat(starts, lengths)
+    truncated = d & (position + 1 >= max_steps - 1)
+
+    crashed = d & ~finished & ~truncated
+    return finished, crashed
+
+
+def recompute_rewards(
+    s: np.ndarray,
+    ns: np.ndarray,
+    d: np.ndarray,
+    config: Optional[Dict[str, float]] = None,
+) -> np.ndarray:
+    """
+    Rewards of logged transitions under `config`, as float32. s/ns are the
+    (N, 11) state columns and d the logged done flags, with episodes
+    contiguous and in order.
+    """
+    finished, crashed = terminal_flags(ns, d)
+    reward, _ = reward_and_done(s, ns, finished, crashed, config=config)
+    return reward.astype(np.float32)
+
+
+def load_columns(log_dir: Optional[str], store_dir: Optional[str], state_dim: int = 11) -> Dict[str, np.ndarray]:
+    """
+    All episodes with `state_dim` states from an episode store or a JSON log directory.
+    """
+    if store_dir is not None:
+        from episode_store import EpisodeStore
+        store = EpisodeStore(store_dir)
+        if store.state_dim != state_dim:
+            raise ValueError(f"Episode store {store_dir} holds {store.state_dim}-dim states, expected {state_dim}")
+        return {key: np.asarray(col) for key, col in store.memmap_columns().items()}
+
+    import os
+    from episode_manifest import load_manifest
+    from parallel_loader import load_episode_arrays_parallel
+
+    entries = [e for e in load_manifest(log_dir) if e["length"] > 0 and e["state_dim"] == state_dim]
+    return load_episode_arrays_parallel([os.path.join(log_dir, e["file"]) for e in entries], state_dim)
+
+
+def parse_sweep(spec: str) -> Tuple[str, List[float]]:
+    key, _, values = spec.partition("=")
+    if key not in REWARD_CONFIG or not values:
+        raise ValueError(f"Sweep must look like <key>=v1,v2,... with a key from REWARD_CONFIG, got {spec!r}")
+    return key, [float(v) for v in values.split(",")]
+
+
+def summarize(rewards: np.ndarray, starts: np.ndarray) -> str:
+    returns = np.add.reduceat(rewards.astype(np.float64), starts) if len(rewards) else np.zeros(0)
+    return (f"mean return {returns.mean():9.3f}, median {np.median(returns):9.3f}, "
+            f"mean step reward {rewards.mean():7.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute logged rewards under a reward config")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--store-dir", default=None)
+    parser.add_argument("--config", default=None, help="JSON reward config or Config.lua")
+    parser.add_argument("--sweep", action="append", default=[],
+                        help="Sweep one parameter, e.g. --sweep obstacleProxPenaltyScale=0,0.15,0.3")
+    args = parser.parse_args()
+
+    columns = load_columns(args.log_dir, args.store_dir)
+    s, ns, r, d = columns["s"], columns["ns"], columns["r"], columns["d"]
+    starts = episode_starts(d)
+    base = load_reward_config(args.config) if args.config else {}
+
+    finished, crashed = terminal_flags(ns, d)
+    print(f"{len(r)} transitions in {len(starts)} episodes "
+          f"({int(finished.sum())} finished, {int(crashed.sum())} crashed)")
+
+    start = time.perf_counter()
+    recomputed = recompute_rewards(s, ns, d, base)
+    elapsed = time.perf_counter() - start
+    print(f"Recomputed in {elapsed * 1e3:.1f} ms ({len(r) / max(elapsed, 1e-9):,.0f} transitions/sec)")
+
+    diff = np.abs(recomputed - r)
+    print(f"Agreement with logged r: {np.mean(diff <= 1e-3):.1%} within 1e-3, max |diff| {diff.max():.4f}")
+    print(f"  logged     {summarize(r, starts)}")
+    print(f"  recomputed {summarize(recomputed, starts)}")
+
+    for spec in args.sweep:
+        key, values = parse_sweep(spec)
+        print(f"\nSweep {key}:")
+        for value in values:
+            rewards = recompute_rewards(s, ns, d, dict(base, **{key: value}))
+            print(f"  {key}={value:<8g} {summarize(rewards, starts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+# river_sim.py
+#
+# Headless, vectorized re-implementation of the river course for offline
+# rollouts. N boats are stepped together as NumPy arrays and observe the same
+# 11-dim state as Env.getState:
+#
+#   [progress, lateral, headingDot, forwardSpeed, lateralSpeed, velocityMag,
+#    distFarLeft, distLeft, distCenter, distRight, distFarRight]
+#
+# and receive the reward of Env.getRewardAndDone.
+#
+# Geometry comes from world_config (WorldConfig.lua: river walls, finish
+# trigger, ROCK_COUNT ball rocks scattered as in TerrainGen.scatterRocks) and
+# the five-ray sensor from raycast. Boat control follows BoatService's
+# heartbeat controller: thrust along the look vector, linear drag, the river
+# current as a constant force and the damped turn-rate law. Roblox's
+# buoyancy and water drag have no closed form, so the effective mass, water
+# drag and turn efficiency below were fitted to logged episodes; expect
+# matching state distributions, not identical trajectories.
+
+import argparse
+import time
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from raycast import RockGrid, sensor_rays
+from rewards import MAX_STEPS_PER_EPISODE, REWARD_CONFIG, reward_and_done
+from world_config import (
+    COURSE_START_Z, CURRENT_STRENGTH, CURRENT_Z_RANGE, FINISH_TRIGGER, HULL_HALF_HEIGHT,
+    HULL_HALF_LENGTH, HULL_HALF_WIDTH, BOAT_Y, RIVER_CENTER_X, RIVER_HALF_WIDTH,
+    RIVER_LENGTH, SPAWN_X, SPAWN_Z, scatter_rocks,
+)
+
+# -----------------------------
+# Constants.lua (BOAT) and BoatService controller
+# -----------------------------
+MAX_THRUST = 18000.0
+TURN_TORQUE = 3000.0
+LINEAR_DRAG = 0.7
+ANGULAR_DRAG = 1.2
+
+# Fitted to logged episodes (see module header)
+BOAT_MASS = 220.0
+WATER_DRAG_FORWARD = 1.33        # 1/s, on top of LinearDrag
+WATER_DRAG_LATERAL = 2.9         # 1/s
+TURN_EFFICIENCY = 0.4            # achieved / commanded turn rate
+
+HEARTBEAT_DT = 1.0 / 60.0
+
+# BotNavigator ACTIONS, indexed by 1-based action id (index 0 unused)
+ACTION_THROTTLE = np.array([0.0, 1.0, 1.0, 1.0, 0.9, 0.9])
+ACTION_STEER = np.array([0.0, 0.0, -0.5, 0.5, -1.0, 1.0])
+NUM_ACTIONS = 5
+
+# -----------------------------
+# Config.lua
+# -----------------------------
+STATE_DIM = 11
+STEP_INTERVAL = 0.1
+
+
+# -----------------------------
+# Vectorized environment
+# -----------------------------
+class RiverSim:
+    """
+    N boats on independent copies of the course, stepped together.
+
+    step() takes 1-based action ids (as in BotNavigator) and returns
+    (next_states, rewards, dones, info). Boats whose episode ended are reset
+    automatically: next_states holds their terminal observation, as logged by
+    BotService, while `states` already holds the first observation of the new
+    episode. Episodes are cut at MAX_STEPS_PER_EPISODE with done=True, as in
+    BotService.
+    """
+
+    def __init__(
+        self,
+        num_boats: int,
+        seed: Optional[int] = None,
+        reward_config: Optional[Dict[str, float]] = None,
+        reseed_rocks: bool = True,
+        max_steps: int = MAX_STEPS_PER_EPISODE,
+    ):
+        self.num_boats = num_boats
+        self.rng = np.random.default_rng(seed)
+        self.reward_config = dict(REWARD_CONFIG, **(reward_config or {}))
+        self.reseed_rocks = reseed_rocks
+        self.max_steps = max_steps
+        self.substeps = max(1, int(round(STEP_INTERVAL / HEARTBEAT_DT)))
+
+        n = num_boats
+        self.x = np.zeros(n)
+        self.z = np.zeros(n)
+        self.psi = np.zeros(n)          # yaw; 0 faces downstream (+Z)
+        self.vx = np.zeros(n)
+        self.vz = np.zeros(n)
+        self.omega = np.zeros(n)
+        self.finished = np.zeros(n, dtype=bool)
+        self.crashed = np.zeros(n, dtype=bool)
+        self.step_count = np.zeros(n, dtype=np.int64)
+
+        if reseed_rocks:
+            self.rocks = RockGrid(*scatter_rocks(n, self.rng))
+            self.layouts = np.arange(n)
+        else:
+            # One world shared by every boat, like a single game server
+            self.rocks = RockGrid(*scatter_rocks(1, self.rng))
+            self.layouts = np.zeros(n, dtype=np.int64)
+
+        self.states = np.zeros((n, STATE_DIM), dtype=np.float64)
+        self.reset()
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Put the selected boats (all by default) back at BOAT_WATER_SPAWN facing downstream.
+        """
+        mask = np.ones(self.num_boats, dtype=bool) if mask is None else mask
+        self.x[mask] = SPAWN_X
+        self.z[mask] = SPAWN_Z
+        for arr in (self.psi, self.vx, self.vz, self.omega):
+            arr[mask] = 0.0
+        self.finished[mask] = False
+        self.crashed[mask] = False
+        # BotService counts the first observation as step 1
+        self.step_count[mask] = 1
+
+        if self.reseed_rocks and mask.any():
+            self.rocks.update(mask, *scatter_rocks(int(mask.sum()), self.rng))
+
+        self.states[mask] = self._observe(mask)
+        return self.states.astype(np.float32)
+
+    def _observe(self, mask: np.ndarray) -> np.ndarray:
+        x, z, psi = self.x[mask], self.z[mask], self.psi[mask]
+        vx, vz = self.vx[mask], self.vz[mask]
+        look_x, look_z = np.sin(psi), np.cos(psi)
+
+        states = np.empty((len(x), STATE_DIM))
+        states[:, 0] = np.clip((z - COURSE_START_Z) / RIVER_LENGTH, 0.0, 1.0)
+        states[:, 1] = np.clip((x - RIVER_CENTER_X) / RIVER_HALF_WIDTH, -1.0, 1.0)
+        states[:, 2] = np.clip(look_z, -1.0, 1.0)
+        states[:, 3] = (vx * look_x + vz * look_z) / 100
+        states[:, 4] = (-vx * look_z + vz * look_x) / 100
+        states[:, 5] = np.hypot(vx, vz) / 100
+        states[:, 6:11] = sensor_rays(x, z, psi, self.rocks, self.layouts[mask])
+        return states
+
+    def _hull_extents(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Half extents of the hull's world-aligned bounding box along x and z.
+        """
+        s, c = np.abs(np.sin(self.psi)), np.abs(np.cos(self.psi))
+        return HULL_HALF_LENGTH * s + HULL_HALF_WIDTH * c, HULL_HALF_LENGTH * c + HULL_HALF_WIDTH * s
+
+    def _check_contacts(self, active: np.ndarray):
+        ext_x, ext_z = self._hull_extents()
+
+        # Finish trigger touch (FinishService)
+        lo, hi = FINISH_TRIGGER
+        touching = (
+            (self.z + ext_z >= lo[2]) & (self.z - ext_z <= hi[2])
+            & (self.x + ext_x >= lo[0]) & (self.x - ext_x <= hi[0])
+        )
+        finish_now = active & touching
+        self.finished |= finish_now
+        # FinishService.freezeBoat anchors the boat and zeroes its velocity
+        self.vx[finish_now] = 0.0
+        self.vz[finish_now] = 0.0
+        self.omega[finish_now] = 0.0
+
+        # River walls (BoatDestructionService marks any wall touch as a crash)
+        wall = np.abs(self.x - RIVER_CENTER_X) + ext_x >= RIVER_HALF_WIDTH
+
+        # Rocks: circle (rock slice at the hull bottom) vs hull rectangle
+        centers, radii = self.rocks.query(self.layouts, self.z - ext_z, self.z + ext_z)
+        hull_bottom = BOAT_Y - HULL_HALF_HEIGHT
+        dy = hull_bottom - centers[..., 1]
+        slice_r2 = np.where(radii > 0, radii ** 2 - dy ** 2, -1.0)
+        rel_x = centers[..., 0] - self.x[:, None]
+        rel_z = centers[..., 2] - self.z[:, None]
+        look_x, look_z = np.sin(self.psi)[:, None], np.cos(self.psi)[:, None]
+        along = np.clip(rel_x * look_x + rel_z * look_z, -HULL_HALF_LENGTH, HULL_HALF_LENGTH)
+        across = np.clip(-rel_x * look_z + rel_z * look_x, -HULL_HALF_WIDTH, HULL_HALF_WIDTH)
+        gap_x = rel_x - (along * look_x - across * look_z)
+        gap_z = rel_z - (along * look_z + across * look_x)
+        rock = ((gap_x ** 2 + gap_z ** 2) <= slice_r2).any(axis=1)
+
+        self.crashed |= active & ~self.finished & (wall | rock)
+
+    def _integrate(self, throttle: np.ndarray, steer: np.ndarray):
+        dt = HEARTBEAT_DT
+        for _ in range(self.substeps):
+            # The episode is over once a boat finishes or crashes; a crashed
+            # boat keeps the velocity it hit with, as in logged terminal states
+            active = ~(self.finished | self.crashed)
+            if not active.any():
+                break
+
+            look_x, look_z = np.sin(self.psi), np.cos(self.psi)
+            v_fwd = self.vx * look_x + self.vz * look_z
+            v_lat = -self.vx * look_z + self.vz * look_x
+
+            in_current = (self.z >= CURRENT_Z_RANGE[0]) & (self.z <= CURRENT_Z_RANGE[1])
+            thrust = MAX_THRUST * throttle / BOAT_MASS
+            drag = LINEAR_DRAG * 100 / BOAT_MASS
+            a_fwd = thrust - (drag + WATER_DRAG_FORWARD) * v_fwd
+            a_lat = -(drag + WATER_DRAG_LATERAL) * v_lat
+            a_x = a_fwd * look_x - a_lat * look_z
+            a_z = a_fwd * look_z + a_lat * look_x + np.where(in_current, CURRENT_STRENGTH / BOAT_MASS, 0.0)
+
+            # BoatService: desired = -steer * TurnTorque / 1000, damped by the current rate
+            omega = TURN_EFFICIENCY * (-steer * TURN_TORQUE / 1000) - self.omega * ANGULAR_DRAG * 0.5
+
+            self.vx = np.where(active, self.vx + a_x * dt, self.vx)
+            self.vz = np.where(active, self.vz + a_z * dt, self.vz)
+            self.omega = np.where(active, omega, self.omega)
+            self.x += np.where(active, self.vx * dt, 0.0)
+            self.z += np.where(active, self.vz * dt, 0.0)
+            # Roblox yaw is counter-clockwise about +Y, which turns the look vector left
+            self.psi += np.where(active, self.omega * dt, 0.0)
+
+            self._check_contacts(active)
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        actions = np.asarray(actions, dtype=np.int64)
+        prev_states = self.states
+
+        self._integrate(ACTION_THROTTLE[actions], ACTION_STEER[actions])
+
+        all_boats = np.ones(self.num_boats, dtype=bool)
+        next_states = self._observe(all_boats)
+        rewards, env_done = reward_and_done(
+            prev_states, next_states, self.finished, self.crashed, config=self.reward_config
+        )
+
+        self.step_count += 1
+        truncated = ~env_done & (self.step_count >= self.max_steps)
+        dones = env_done | truncated
+        info = {
+            "finished": self.finished & env_done,
+            "crashed": self.crashed & env_done & ~self.finished,
+            "truncated": truncated,
+        }
+
+        # Copy first: resetting overwrites the done boats' rows of self.states
+        observed = next_states.astype(np.float32)
+        self.states = next_states
+        if dones.any():
+            self.reset(dones)
+
+        return observed, rewards.astype(np.float32), dones, info
+
+
+# -----------------------------
+# Rollouts
+# -----------------------------
+def random_policy(rng: np.random.Generator) -> Callable[[np.ndarray], np.ndarray]:
+    def policy(states: np.ndarray) -> np.ndarray:
+        return rng.integers(1, NUM_ACTIONS + 1, size=len(states))
+    return policy
+
+
+def epsilon_greedy_policy(model, epsilon: float, rng: np.random.Generator) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Greedy actions from a train_dqn.DQN with epsilon-random exploration.
+    """
+    import torch
+
+    def policy(states: np.ndarray) -> np.ndarray:
+        with torch.no_grad():
+            greedy = model(torch.from_numpy(states)).argmax(dim=1).numpy() + 1
+        explore = rng.random(len(states)) < epsilon
+        return np.where(explore, rng.integers(1, NUM_ACTIONS + 1, size=len(states)), greedy)
+
+    return policy
+
+
+def collect_episodes(
+    sim: RiverSim,
+    policy: Callable[[np.ndarray], np.ndarray],
+    num_episodes: int,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Run the simulator until `num_episodes` episodes have finished, yielding each
+    as column arrays {"s", "ns", "a", "r", "d"} in the logged layout (actions
+    1-based) plus "outcome" ("finished", "crashed" or "truncated").
+    """
+    n, cap = sim.num_boats, sim.max_steps
+    buf_s = np.zeros((cap, n, STATE_DIM), dtype=np.float32)
+    buf_ns = np.zeros_like(buf_s)
+    buf_a = np.zeros((cap, n), dtype=np.int8)
+    buf_r = np.zeros((cap, n), dtype=np.float32)
+    lengths = np.zeros(n, dtype=np.int64)
+    boats = np.arange(n)
+    emitted = 0
+
+    while emitted < num_episodes:
+        states = sim.states.astype(np.float32)
+        actions = policy(states)
+        next_states, rewards, dones, info = sim.step(actions)
+
+        buf_s[lengths, boats] = states
+        buf_ns[lengths, boats] = next_states
+        buf_a[lengths, boats] = actions
+        buf_r[lengths, boats] = rewards
+        lengths += 1
+
+        for i in np.flatnonzero(dones):
+            length = lengths[i]
+            d = np.zeros(length, dtype=np.bool_)
+            d[-1] = True
+            outcome = next(k for k in ("finished", "crashed", "truncated") if info[k][i])
+            yield {
+                "s": buf_s[:length, i].copy(),
+                "ns": buf_ns[:length, i].copy(),
+                "a": buf_a[:length, i].copy(),
+                "r": buf_r[:length, i].copy(),
+                "d": d,
+                "outcome": outcome,
+            }
+            lengths[i] = 0
+            emitted += 1
+            if emitted >= num_episodes:
+                return
+
+
+def benchmark(num_boats: int, num_steps: int, seed: int = 0):
+    sim = RiverSim(num_boats, seed=seed)
+    policy = random_policy(np.random.default_rng(seed))
+    outcomes = {"finished": 0, "crashed": 0, "truncated": 0}
+
+    start = time.perf_counter()
+    for _ in range(num_steps):
+        _, _, dones, info = sim.step(policy(sim.states))
+        for key in outcomes:
+            outcomes[key] += int(info[key].sum())
+    elapsed = time.perf_counter() - start
+
+    boat_steps = num_boats * num_steps
+    print(f"{num_boats} boats x {num_steps} steps in {elapsed:.2f}s")
+    print(f"  {boat_steps / elapsed:,.0f} boat-steps/sec ({boat_steps / elapsed * 60 / 1e6:.1f}M per minute)")
+    print(f"  episodes ended: {outcomes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless vectorized river simulator")
+    parser.add_argument("--boats", type=int, default=1024)
+    parser.add_argument("--steps", type=int, default=500, help="Benchmark steps (without --out)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write episodes to this episode store")
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--checkpoint", default=None, help="Roll out a DQN checkpoint instead of random actions")
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--fixed-rocks", action="store_true", help="Share one rock layout across all boats")
+    args = parser.parse_args()
+
+    if args.out is None:
+        benchmark(args.boats, args.steps, args.seed)
+        return
+
+    from episode_store import EpisodeStore
+
+    rng = np.random.default_rng(args.seed)
+    if args.checkpoint:
+        from train_dqn import load_dqn_checkpoint
+        model, _ = load_dqn_checkpoint(args.checkpoint)
+        policy = epsilon_greedy_policy(model, args.epsilon, rng)
+        source = f"sim:{args.checkpoint}:eps={args.epsilon}:seed={args.seed}"
+    else:
+        policy = random_policy(rng)
+        source = f"sim:random:seed={args.seed}"
+
+    sim = RiverSim(args.boats, seed=args.seed, reseed_rocks=not args.fixed_rocks)
+    store = EpisodeStore(args.out, state_dim=STATE_DIM)
+    outcomes = {"finished": 0, "crashed": 0, "truncated": 0}
+    transitions = 0
+
+    start = time.perf_counter()
+    for ep in collect_episodes(sim, policy, args.episodes):
+        store.append_episode(ep["s"], ep["ns"], ep["a"], ep["r"], ep["d"], source=source)
+        outcomes[ep["outcome"]] += 1
+        transitions += len(ep["a"])
+    elapsed = time.perf_counter() - start
+
+    print(f"Wrote {args.episodes} episodes ({transitions} transitions) to {args.out} in {elapsed:.1f}s")
+    print(f"  outcomes: {outcomes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# streaming.py
+#
+# Constant-memory minibatch streaming for train_dqn(stream=True).
+#
+# Episodes are visited in a fresh random order every epoch and loaded one at a
+# time into a preallocated shuffle buffer. Whenever the buffer fills, it is
+# permuted in place and half of it is emitted as minibatches; the other half
+# stays behind to mix with the next episodes. Memory therefore depends only on
+# the buffer size, not on how many episodes exist.
+
+import sys
+from typing import Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+COLUMNS = ("s", "ns", "a", "r", "d")
+
+
+def transition_nbytes(state_dim: int) -> int:
+    # s + ns (float32), a (int8), r (float32), d (bool)
+    return 2 * state_dim * 4 + 1 + 4 + 1
+
+
+def buffer_capacity_for_budget(memory_budget_mb: float, state_dim: int, batch_size: int) -> int:
+    """
+    Largest shuffle buffer that fits the budget. Permuting the buffer briefly
+    needs a second copy, hence the factor of two.
+    """
+    capacity = int(memory_budget_mb * 1024 * 1024) // (2 * transition_nbytes(state_dim))
+    return max(capacity, 2 * batch_size)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process in MB, or None if unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class ShuffleBuffer:
+    """
+    Fixed-capacity column buffer that turns an episode stream into shuffled minibatches.
+    """
+
+    def __init__(self, capacity: int, state_dim: int, batch_size: int, rng: np.random.Generator):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.rng = rng
+        self.size = 0
+        self.columns = {
+            "s": np.empty((capacity, state_dim), dtype=np.float32),
+            "ns": np.empty((capacity, state_dim), dtype=np.float32),
+            "a": np.empty(capacity, dtype=np.int8),
+            "r": np.empty(capacity, dtype=np.float32),
+            "d": np.empty(capacity, dtype=np.bool_),
+        }
+
+    def _shuffle(self):
+        perm = self.rng.permutation(self.size)
+        for key, col in self.columns.items():
+            col[:self.size] = col[:self.size][perm]
+
+    def _emit(self, count: int) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Emit the first `count` rows as minibatches and shift the rest to the front.
+        """
+        for start in range(0, count, self.batch_size):
+            end = min(start + self.batch_size, count)
+            yield {key: col[start:end].copy() for key, col in self.columns.items()}
+
+        remaining = self.size - count
+        for col in self.columns.values():
+            col[:remaining] = col[count:self.size]
+        self.size = remaining
+
+    def add(self, episode: Dict[str, np.ndarray]) -> Iterator[Dict[str, np.ndarray]]:
+        n = len(episode["a"])
+        pos = 0
+        while pos < n:
+            take = min(self.capacity - self.size, n - pos)
+            for key, col in self.columns.items():
+                col[self.size:self.size + take] = episode[key][pos:pos + take]
+            self.size += take
+            pos += take
+
+            if self.size == self.capacity:
+                self._shuffle()
+                # Emit whole batches from the first half; keep the rest for mixing
+                half = max(self.batch_size, (self.capacity // 2) // self.batch_size * self.batch_size)
+                yield from self._emit(half)
+
+    def drain(self) -> Iterator[Dict[str, np.ndarray]]:
+        if self.size == 0:
+            return
+        self._shuffle()
+        yield from self._emit(self.size)
+
+
+def stream_minibatches(
+    load_episode: Callable[[int], Dict[str, np.ndarray]],
+    num_episodes: int,
+    state_dim: int,
+    batch_size: int,
+    buffer_capacity: int,
+    rng: np.random.Generator,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    One epoch of shuffled minibatches. load_episode(i) returns the column
+    arrays of episode i (see COLUMNS; actions 1-based as logged).
+    """
+    buffer = ShuffleBuffer(buffer_capacity, state_dim, batch_size, rng)
+    for i in rng.permutation(num_episodes):
+        yield from buffer.add(load_episode(int(i)))
+    yield from buffer.drain()
@@ -0,0 +1,418 @@
+# train_daemon.py
+#
+# Long-running trainer that closes the log -> train -> export loop.
+#
+# It polls the ingest directory written by log_data.py. Once enough new
+# episodes have arrived, it fine-tunes the latest checkpoint on only those
+# transitions, mixed with a uniform replay sample of older ones. The
+# candidate is then scored on a held-out episode set against the current
+# best. DqnWeights.lua is regenerated only when the candidate wins.
+#
+# Per-update cost follows the new data: the replay pool and the held-out set
+# are fixed-capacity reservoirs (uniform samples of all history), so neither
+# training nor evaluation grows with the number of logged episodes.
+#
+# Episodes are assigned to the held-out set by a hash of their file name, so
+# the split is stable across restarts and held-out episodes are never trained
+# on. The score is the mean Huber TD error on the held-out transitions.
+#
+# Usage:
+#   python train_daemon.py --log-dir logs
+#   python train_daemon.py --log-dir logs --once        # one poll, then exit
+
+import argparse
+import json
+import os
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from episode_store import episode_to_arrays, read_json_episode
+from export_weights import json_path as default_json_path, lua_path as default_lua_path, pytorch_to_json
+from lua_weights import QUANTIZE_MODES, write_weights
+from train_dqn import DQN, columns_to_tensors, iterate_minibatch_indices, load_dqn_checkpoint, q_and_targets
+from training_metrics import MetricsWriter
+
+COLUMNS = ("s", "ns", "a", "r", "d")
+
+
+# -----------------------------
+# Episode bookkeeping
+# -----------------------------
+def is_heldout(fname: str, fraction: float) -> bool:
+    return zlib.crc32(fname.encode()) % 10_000 < fraction * 10_000
+
+
+def list_log_files(log_dir: str) -> List[str]:
+    if not os.path.isdir(log_dir):
+        return []
+    return sorted(f for f in os.listdir(log_dir) if f.startswith("transitions_") and f.endswith(".json"))
+
+
+def read_episode_columns(path: str, state_dim: int) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Column arrays for one episode file, or None if it is empty, unreadable
+    or logged with a different state_dim.
+    """
+    try:
+        transitions = read_json_episode(path)
+        if not transitions or len(transitions[0]["s"]) != state_dim:
+            return None
+        return dict(zip(COLUMNS, episode_to_arrays(transitions, state_dim)))
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+
+def format_loss(loss: Optional[float]) -> str:
+    return "n/a" if loss is None else f"{loss:.5f}"
+
+
+def concat_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return {key: np.concatenate([p[key] for p in parts]) for key in COLUMNS}
+
+
+class Reservoir:
+    """
+    Fixed-capacity uniform sample of every transition ever added
+    (reservoir sampling, vectorized per added batch).
+    """
+
+    def __init__(self, capacity: int, state_dim: int, rng: np.random.Generator):
+        self.capacity = capacity
+        self.rng = rng
+        self.size = 0
+        self.seen = 0
+        self.columns = {
+            "s": np.empty((capacity, state_dim), dtype=np.float32),
+            "ns": np.empty((capacity, state_dim), dtype=np.float32),
+            "a": np.empty(capacity, dtype=np.int8),
+            "r": np.empty(capacity, dtype=np.float32),
+            "d": np.empty(capacity, dtype=np.bool_),
+        }
+
+    def add(self, batch: Dict[str, np.ndarray]):
+        n = len(batch["a"])
+        # Fill free slots first
+        take = min(self.capacity - self.size, n)
+        for key, col in self.columns.items():
+            col[self.size:self.size + take] = batch[key][:take]
+        self.size += take
+
+        # Row k of the rest is the (seen + k + 1)-th item overall; it replaces a
+        # random slot with probability capacity / (seen + k + 1)
+        rest = np.arange(take, n)
+        if rest.size:
+            slots = (self.rng.random(rest.size) * (self.seen + rest + 1)).astype(np.int64)
+            keep = slots < self.capacity
+            for key, col in self.columns.items():
+                col[slots[keep]] = batch[key][rest[keep]]
+        self.seen += n
+
+    def sample(self, count: int) -> Dict[str, np.ndarray]:
+        idx = self.rng.integers(0, self.size, size=min(count, self.size)) if self.size else np.zeros(0, np.int64)
+        return {key: col[idx] for key, col in self.columns.items()}
+
+    def contents(self) -> Dict[str, np.ndarray]:
+        return {key: col[:self.size] for key, col in self.columns.items()}
+
+
+# -----------------------------
+# Training and evaluation
+# -----------------------------
+@torch.no_grad()
+def heldout_td_loss(model: nn.Module, columns: Dict[str, np.ndarray], gamma: float, batch_size: int = 8192) -> float:
+    """
+    Mean Huber TD error of `model` on held-out transitions, bootstrapping
+    from the model itself (Double DQN form).
+    """
+    states, actions, rewards, next_states, dones = columns_to_tensors(columns)
+    total, n = 0.0, states.shape[0]
+    for start in range(0, n, batch_size):
+        sl = slice(start, start + batch_size)
+        q_sa, targets = q_and_targets(
+            model, model, states[sl], actions[sl], rewards[sl], next_states[sl], dones[sl], gamma, True
+        )
+        total += nn.functional.smooth_l1_loss(q_sa, targets, reduction="sum").item()
+    return total / max(n, 1)
+
+
+def fine_tune(
+    model: nn.Module,
+    optimizer: torch.optim.Optimizer,
+    columns: Dict[str, np.ndarray],
+    epochs: int,
+    batch_size: int,
+    gamma: float,
+) -> float:
+    """
+    A few epochs of Double DQN updates over `columns`; the target network is
+    refreshed from the online network at the start of every epoch, as in
+    train_dqn. Returns the last epoch's mean loss.
+    """
+    states, actions, rewards, next_states, dones = columns_to_tensors(columns)
+    target_model = DQN(states.shape[1], int(model.net[-1].out_features), model.hidden_sizes)
+    target_model.eval()
+    loss_fn = nn.SmoothL1Loss()
+    model.train()
+
+    avg_loss = 0.0
+    for _ in range(epochs):
+        target_model.load_state_dict(model.state_dict())
+        epoch_loss = torch.zeros(())
+        num_batches = 0
+        for idx in iterate_minibatch_indices(states.shape[0], batch_size):
+            q_sa, targets = q_and_targets(
+                model, target_model, states[idx], actions[idx], rewards[idx], next_states[idx], dones[idx],
+                gamma, True,
+            )
+            loss = loss_fn(q_sa, targets)
+            optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+            optimizer.step()
+            epoch_loss += loss.detach()
+            num_batches += 1
+        avg_loss = epoch_loss.item() / max(num_batches, 1)
+
+    model.eval()
+    return avg_loss
+
+
+# -----------------------------
+# Daemon
+# -----------------------------
+class ContinuousTrainer:
+    """
+    Poll -> fine-tune -> evaluate -> promote/export loop (see module header).
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = np.random.default_rng(args.seed)
+        self.metrics = MetricsWriter(args.metrics_out, append=True)
+
+        if os.path.exists(args.checkpoint):
+            self.model, checkpoint = load_dqn_checkpoint(args.checkpoint)
+            print(f"Resuming from {args.checkpoint}")
+        else:
+            self.model, checkpoint = DQN(args.state_dim, args.num_actions), {}
+            print(f"No checkpoint at {args.checkpoint}; starting from a fresh DQN "
+                  f"({args.state_dim}-dim states, {args.num_actions} actions)")
+        self.state_dim = int(checkpoint.get("state_dim", args.state_dim))
+        self.num_actions = int(checkpoint.get("num_actions", self.model.net[-1].out_features))
+
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=args.lr)
+        if "optimizer_state_dict" in checkpoint:
+            self.optimizer.load_state_dict(checkpoint["optimizer_state_dict"])
+
+        self.best_model = load_dqn_checkpoint(args.best_checkpoint)[0] if os.path.exists(args.best_checkpoint) else None
+
+        self.replay = Reservoir(args.replay_capacity, self.state_dim, self.rng)
+        self.heldout = Reservoir(args.heldout_capacity, self.state_dim, self.rng)
+        self.heldout_files: set = set()
+        self.pending: List[Tuple[str, Dict[str, np.ndarray]]] = []
+
+        self.state = self._load_state()
+        self.seen = set(self.state["seen"])
+        self._seed_from_history()
+
+    # ---- persistent state ----
+    def _load_state(self) -> dict:
+        if os.path.exists(self.args.state_file):
+            with open(self.args.state_file, "r") as f:
+                return json.load(f)
+        return {"seen": [], "updates": 0}
+
+    def _save_state(self):
+        self.state["seen"] = sorted(self.seen)
+        tmp = self.args.state_file + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.args.state_file)
+
+    def _seed_from_history(self):
+        """
+        Fill the held-out set and the replay pool from episodes that are
+        already on disk. Replay files are read in random order only until
+        the pool is full, so startup cost is bounded by its capacity.
+        """
+        files = list_log_files(self.args.log_dir)
+        if self.args.skip_existing and not self.state["seen"]:
+            self.seen.update(files)
+
+        trained = [f for f in files if f in self.seen and not is_heldout(f, self.args.heldout_fraction)]
+        for fname in files:
+            if is_heldout(fname, self.args.heldout_fraction):
+                self._add_heldout(fname)
+        for i in self.rng.permutation(len(trained)):
+            if self.replay.size >= self.replay.capacity:
+                break
+            columns = read_episode_columns(os.path.join(self.args.log_dir, trained[i]), self.state_dim)
+            if columns is not None:
+                self.replay.add(columns)
+
+        print(f"History: {len(trained)} trained episodes, replay pool {self.replay.size:,} transitions, "
+              f"held-out {len(self.heldout_files)} episodes ({self.heldout.size:,} transitions)")
+
+    def _add_heldout(self, fname: str):
+        if fname in self.heldout_files:
+            return
+        self.heldout_files.add(fname)
+        columns = read_episode_columns(os.path.join(self.args.log_dir, fname), self.state_dim)
+        if columns is not None:
+            self.heldout.add(columns)
+
+    # ---- one poll ----
+    def poll(self) -> bool:
+        """
+        Pick up new episodes and run an update once enough have arrived.
+        Returns True if an update ran.
+        """
+        pending_files = {fname for fname, _ in self.pending}
+        for fname in list_log_files(self.args.log_dir):
+            if fname in self.seen or fname in pending_files:
+                continue
+            if is_heldout(fname, self.args.heldout_fraction):
+                self._add_heldout(fname)
+                continue
+            columns = read_episode_columns(os.path.join(self.args.log_dir, fname), self.state_dim)
+            if columns is None:
+                self.seen.add(fname)  # empty, corrupt or another state layout: never retried
+                continue
+            self.pending.append((fname, columns))
+
+        num_new = sum(len(c["a"]) for _, c in self.pending)
+        if num_new == 0 or num_new < self.args.min_new_transitions:
+            return False
+        self.update()
+        return True
+
+    def update(self):
+        args = self.args
+        start = time.perf_counter()
+        new = concat_columns([c for _, c in self.pending])
+        replay = self.replay.sample(int(args.replay_ratio * len(new["a"])))
+        train_columns = concat_columns([new, replay])
+
+        train_loss = fine_tune(self.model, self.optimizer, train_columns, args.epochs, args.batch_size, args.gamma)
+
+        # New data joins the replay pool only after the update, so replay samples are always older
+        self.replay.add(new)
+        for fname, _ in self.pending:
+            self.seen.add(fname)
+        self.pending = []
+        self.state["updates"] += 1
+
+        heldout = self.heldout.contents()
+        candidate_loss = heldout_td_loss(self.model, heldout, args.gamma) if self.heldout.size else None
+        best_loss = heldout_td_loss(self.best_model, heldout, args.gamma) if self.best_model and self.heldout.size else None
+
+        if self.best_model is None:
+            promote = True
+        elif candidate_loss is None:
+            promote = False  # nothing to compare on yet
+        else:
+            promote = candidate_loss < best_loss * (1.0 - args.min_improvement)
+
+        self._save_checkpoint(args.checkpoint, include_optimizer=True)
+        if promote:
+            self._save_checkpoint(args.best_checkpoint, include_optimizer=False)
+            self.best_model, _ = load_dqn_checkpoint(args.best_checkpoint)
+            self._export()
+        self._save_state()
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"[update {self.state['updates']}] {len(new['a']):,} new + {len(replay['a']):,} replay transitions, "
+            f"train loss {train_loss:.5f}, held-out TD loss {format_loss(candidate_loss)} vs best {format_loss(best_loss)} "
+            f"-> {'promoted' if promote else 'kept best'} ({elapsed:.2f}s)"
+        )
+        self.metrics.write(
+            "update",
+            update=self.state["updates"],
+            new_transitions=len(new["a"]),
+            replay_transitions=len(replay["a"]),
+            train_loss=train_loss,
+            heldout_transitions=self.heldout.size,
+            candidate_heldout_loss=candidate_loss,
+            best_heldout_loss=best_loss,
+            promoted=promote,
+            seconds=elapsed,
+        )
+
+    def _save_checkpoint(self, path: str, include_optimizer: bool):
+        checkpoint = {
+            "state_dim": self.state_dim,
+            "num_actions": self.num_actions,
+            "hidden_sizes": list(self.model.hidden_sizes),
+            "model_state_dict": self.model.state_dict(),
+            "gamma": self.args.gamma,
+            "double_dqn": True,
+            "daemon_update": self.state["updates"],
+        }
+        if include_optimizer:
+            checkpoint["optimizer_state_dict"] = self.optimizer.state_dict()
+        torch.save(checkpoint, path)
+
+    def _export(self):
+        weights_obj = pytorch_to_json(self.args.best_checkpoint)
+        header = (f"AUTO-GENERATED by boat_rl/train_daemon.py (update {self.state['updates']}). "
+                  "Do not edit by hand.")
+        write_weights(weights_obj, self.args.json_out, self.args.lua_out, "flat", self.args.quantize, header)
+
+    def run(self):
+        print(f"Watching {self.args.log_dir}/ every {self.args.poll_seconds}s "
+              f"(update after {self.args.min_new_transitions:,} new transitions)")
+        try:
+            while True:
+                self.poll()
+                if self.args.once:
+                    break
+                time.sleep(self.args.poll_seconds)
+        except KeyboardInterrupt:
+            print("\nStopping")
+        finally:
+            self.metrics.close()
+
+
+def main():
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description="Continuously fine-tune the DQN on newly ingested episodes")
+    parser.add_argument("--log-dir", default="logs")
+    parser.add_argument("--checkpoint", default="dqn_weights.pth", help="latest fine-tuned model (resumed from)")
+    parser.add_argument("--best-checkpoint", default="dqn_weights_best.pth", help="model currently exported")
+    parser.add_argument("--state-file", default="train_daemon_state.json")
+    parser.add_argument("--json-out", type=Path, default=default_json_path)
+    parser.add_argument("--lua-out", type=Path, default=default_lua_path)
+    parser.add_argument("--quantize", choices=QUANTIZE_MODES, default="none")
+    parser.add_argument("--poll-seconds", type=float, default=30.0)
+    parser.add_argument("--once", action="store_true", help="poll once (update if enough data) and exit")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="on first start, treat episodes already on disk as trained (replay only)")
+    parser.add_argument("--min-new-transitions", type=int, default=5000)
+    parser.add_argument("--replay-ratio", type=float, default=2.0, help="replay transitions per new transition")
+    parser.add_argument("--replay-capacity", type=int, default=500_000)
+    parser.add_argument("--heldout-fraction", type=float, default=0.1)
+    parser.add_argument("--heldout-capacity", type=int, default=100_000)
+    parser.add_argument("--min-improvement", type=float, default=0.0,
+                        help="relative held-out improvement required to promote a candidate")
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--lr", type=float, default=1e-4)
+    parser.add_argument("--gamma", type=float, default=0.95)
+    parser.add_argument("--state-dim", type=int, default=11, help="used only when starting without a checkpoint")
+    parser.add_argument("--num-actions", type=int, default=5, help="used only when starting without a checkpoint")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--metrics-out", default=None, help="JSON-lines record per update")
+    args = parser.parse_args()
+
+    ContinuousTrainer(args).run()
+
+
+if __name__ == "__main__":
+    main()
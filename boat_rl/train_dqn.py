@@ -1,18 +1,79 @@
 # train_dqn.py
+import math
 import os
-import glob
-import json
-from typing import List, Tuple
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 import torch
 import torch.nn as nn
-from torch.utils.data import TensorDataset, DataLoader
+import torch.nn.functional as F
+
+from episode_manifest import load_manifest
+from episode_store import EpisodeStore, episode_to_arrays, read_json_episode
+from log_compaction import load_episode_columns, read_index, select_generations
+from nstep import episode_ends, multistep_targets
+from prioritized_replay import PrioritizedSampler
+from rewards import load_reward_config, recompute_rewards
+from parallel_loader import PARALLEL_MIN_FILES, count_log_files, load_episode_arrays_parallel
+from streaming import buffer_capacity_for_budget, peak_rss_mb, stream_minibatches
+from training_metrics import MetricsWriter, PhaseTimer, print_phase_table, summarize_values
 
 
 # -----------------------------
 # Data loading (episode-aware with improved filtering)
 # -----------------------------
+def select_episodes(
+    returns: Sequence[float],
+    max_progresses: Sequence[float],
+    elite_fraction: float = 0.5,
+    min_progress_threshold: float = 0.2,
+) -> List[int]:
+    """
+    Two-stage episode filter. Returns the indices of the episodes to keep.
+
+    Stage 1: Keep episodes with meaningful progress
+    Stage 2: If we filtered out too many, fall back to top elite_fraction by return
+    """
+    num_episodes = len(returns)
+    progress_filtered = [i for i in range(num_episodes) if max_progresses[i] >= min_progress_threshold]
+
+    min_keep = max(1, int(num_episodes * elite_fraction))
+
+    if len(progress_filtered) < min_keep:
+        print(f"Progress filter kept {len(progress_filtered)} episodes, using return-based filter instead")
+        by_return = sorted(range(num_episodes), key=lambda i: returns[i])
+        return by_return[-min_keep:]
+
+    print(f"Progress filter kept {len(progress_filtered)}/{num_episodes} episodes (progress >= {min_progress_threshold})")
+    return progress_filtered
+
+
+def print_episode_statistics(
+    num_episodes: int,
+    returns: Sequence[float],
+    progresses: Sequence[float],
+    num_transitions: int,
+    state_dim: int,
+    num_actions: int,
+):
+    returns = sorted(returns)
+    progresses = sorted(progresses)
+
+    print(f"\n=== Episode Statistics ===")
+    print(f"Total episodes: {num_episodes}")
+    print(f"Selected episodes: {len(returns)}")
+    print(f"Episode returns: min={returns[0]:.2f}, median={returns[len(returns)//2]:.2f}, max={returns[-1]:.2f}")
+    print(f"Max progress: min={progresses[0]:.2f}, median={progresses[len(progresses)//2]:.2f}, max={progresses[-1]:.2f}")
+    print(f"Total transitions: {num_transitions}")
+    print(f"Inferred state_dim={state_dim}, num_actions={num_actions}")
+
+    if state_dim != 11:
+        print(f"WARNING: Expected state_dim=11, got {state_dim}")
+    if num_actions != 5:
+        print(f"WARNING: Expected num_actions=5, got {num_actions}")
+
+
 def load_transitions(
     log_dir: str = "logs",
     elite_fraction: float = 0.5,
@@ -24,66 +85,44 @@ def load_transitions(
     Improvements:
     - Keeps episodes with meaningful progress (>20%) OR top 50% by return
     - This ensures we learn from partial successes, not just crashes
+    - Filtering runs on the cached episode manifest (episode_manifest.py),
+      so only the selected episode files are parsed
     """
     pattern = os.path.join(log_dir, "transitions_*.json")
-    files = sorted(glob.glob(pattern))
-
-    if not files:
+    if not os.path.isdir(log_dir):
         raise FileNotFoundError(f"No transition files found at {pattern}")
 
-    episodes = []
+    manifest = load_manifest(log_dir)
 
-    for path in files:
-        with open(path, "r") as f:
-            data = json.load(f)
+    if not manifest:
+        raise FileNotFoundError(f"No transition files found at {pattern}")
 
-        if isinstance(data, dict) and "transitions" in data:
-            transitions = data["transitions"]
-        elif isinstance(data, list):
-            transitions = data
-        else:
-            transitions = [data]
+    candidates = [e for e in manifest if e["length"] > 0]
 
-        if not transitions:
-            continue
+    if not candidates:
+        raise ValueError("Loaded log files but found no transitions in any episode.")
 
-        ep_return = 0.0
-        max_progress = 0.0
-        
-        for t in transitions:
-            ep_return += float(t.get("r", 0.0))
-            # Track maximum progress reached (state[0] is progress)
-            if "s" in t and len(t["s"]) > 0:
-                max_progress = max(max_progress, t["s"][0])
+    selected = select_episodes(
+        [e["return"] for e in candidates],
+        [e["max_progress"] for e in candidates],
+        elite_fraction=elite_fraction,
+        min_progress_threshold=min_progress_threshold,
+    )
+    num_episodes = len(candidates)
 
-        episodes.append(
+    elite_episodes = []
+    for i in selected:
+        entry = candidates[i]
+        path = os.path.join(log_dir, entry["file"])
+        elite_episodes.append(
             {
                 "file": path,
-                "transitions": transitions,
-                "return": ep_return,
-                "max_progress": max_progress,
+                "transitions": read_json_episode(path),
+                "return": entry["return"],
+                "max_progress": entry["max_progress"],
             }
         )
 
-    if not episodes:
-        raise ValueError("Loaded log files but found no transitions in any episode.")
-
-    # NEW: Two-stage filtering
-    # Stage 1: Keep episodes with meaningful progress
-    progress_filtered = [e for e in episodes if e["max_progress"] >= min_progress_threshold]
-    
-    # Stage 2: If we filtered out too many, fall back to top elite_fraction by return
-    num_episodes = len(episodes)
-    min_keep = max(1, int(num_episodes * elite_fraction))
-    
-    if len(progress_filtered) < min_keep:
-        print(f"Progress filter kept {len(progress_filtered)} episodes, using return-based filter instead")
-        episodes.sort(key=lambda e: e["return"])
-        elite_episodes = episodes[-min_keep:]
-    else:
-        print(f"Progress filter kept {len(progress_filtered)}/{num_episodes} episodes (progress >= {min_progress_threshold})")
-        elite_episodes = progress_filtered
-
     # Flatten transitions from selected episodes
     all_transitions: List[dict] = []
     for ep in elite_episodes:
@@ -94,22 +133,14 @@ def load_transitions(
     state_dim = len(first_transition["s"])
     num_actions = max(t["a"] for ep in elite_episodes for t in ep["transitions"])
 
-    # Calculate statistics
-    returns = [e["return"] for e in elite_episodes]
-    progresses = [e["max_progress"] for e in elite_episodes]
-    
-    print(f"\n=== Episode Statistics ===")
-    print(f"Total episodes: {num_episodes}")
-    print(f"Selected episodes: {len(elite_episodes)}")
-    print(f"Episode returns: min={min(returns):.2f}, median={sorted(returns)[len(returns)//2]:.2f}, max={max(returns):.2f}")
-    print(f"Max progress: min={min(progresses):.2f}, median={sorted(progresses)[len(progresses)//2]:.2f}, max={max(progresses):.2f}")
-    print(f"Total transitions: {len(all_transitions)}")
-    print(f"Inferred state_dim={state_dim}, num_actions={num_actions}")
-
-    if state_dim != 11:
-        print(f"WARNING: Expected state_dim=11, got {state_dim}")
-    if num_actions != 5:
-        print(f"WARNING: Expected num_actions=5, got {num_actions}")
+    print_episode_statistics(
+        num_episodes,
+        [e["return"] for e in elite_episodes],
+        [e["max_progress"] for e in elite_episodes],
+        len(all_transitions),
+        state_dim,
+        num_actions,
+    )
 
     return all_transitions, state_dim, num_actions
 
@@ -151,14 +182,269 @@ def transitions_to_tensors(
     return states, actions, rewards, next_states, dones
 
 
+def columns_to_tensors(columns: dict) -> Tuple[torch.Tensor, ...]:
+    """
+    Convert NumPy transition columns (as stored, 1-based actions) into the
+    (states, actions, rewards, next_states, dones) training tensors.
+    """
+    states = torch.from_numpy(np.ascontiguousarray(columns["s"], dtype=np.float32))
+    actions = torch.from_numpy(columns["a"].astype(np.int64) - 1)  # 0-based for PyTorch
+    rewards = torch.from_numpy(np.ascontiguousarray(columns["r"], dtype=np.float32))
+    next_states = torch.from_numpy(np.ascontiguousarray(columns["ns"], dtype=np.float32))
+    dones = torch.from_numpy(columns["d"].astype(np.float32))
+    return states, actions, rewards, next_states, dones
+
+
+def episode_ranges_to_indices(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Expand per-episode (start, length) ranges into one flat transition index array.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Offset of each transition within its episode, plus the episode start
+    ends = np.cumsum(lengths)
+    within = np.arange(total, dtype=np.int64) - np.repeat(ends - lengths, lengths)
+    return np.repeat(np.asarray(starts, dtype=np.int64), lengths) + within
+
+
+def load_store_tensors(
+    store_dir: str = "store",
+    elite_fraction: float = 0.5,
+    min_progress_threshold: float = 0.2,
+) -> Tuple[Tuple[torch.Tensor, ...], int, int]:
+    """
+    Load transitions from a columnar episode store (see episode_store.py).
+
+    Episode selection runs on the store index alone; only the selected
+    episodes are gathered from the memory-mapped columns. Returns the same
+    tensors as transitions_to_tensors plus state_dim and num_actions.
+    """
+    store = EpisodeStore(store_dir)
+    index = store.read_index()
+
+    if index.size == 0:
+        raise FileNotFoundError(f"Episode store at {store_dir} has no episodes")
+
+    selected = np.asarray(
+        select_episodes(
+            index["return"].tolist(),
+            index["max_progress"].tolist(),
+            elite_fraction=elite_fraction,
+            min_progress_threshold=min_progress_threshold,
+        ),
+        dtype=np.int64,
+    )
+    elite = index[selected]
+    rows = episode_ranges_to_indices(elite["start"], elite["length"])
+
+    columns = store.memmap_columns(index)
+    tensors = columns_to_tensors({key: col[rows] for key, col in columns.items()})
+
+    state_dim = store.state_dim
+    num_actions = int(tensors[1].max().item()) + 1
+
+    print_episode_statistics(
+        int(index.size),
+        elite["return"].tolist(),
+        elite["max_progress"].tolist(),
+        int(rows.size),
+        state_dim,
+        num_actions,
+    )
+
+    return tensors, state_dim, num_actions
+
+
+def load_compacted_tensors(
+    compacted_dir: str = "compacted",
+    generations: Optional[Sequence[str]] = None,
+    elite_fraction: float = 0.5,
+    min_progress_threshold: float = 0.2,
+) -> Tuple[Tuple[torch.Tensor, ...], int, int]:
+    """
+    Load transitions from a compacted shard set (see log_compaction.py),
+    restricted to the given generations (default: all).
+
+    Episode selection runs on the index records; only shards holding a
+    selected episode are decompressed.
+    """
+    index = read_index(compacted_dir)
+    records = select_generations(index, generations)
+    if not records:
+        raise FileNotFoundError(f"No compacted episodes at {compacted_dir} for generations {generations}")
+
+    selected = select_episodes(
+        [r["return"] for r in records],
+        [r["max_progress"] for r in records],
+        elite_fraction=elite_fraction,
+        min_progress_threshold=min_progress_threshold,
+    )
+    elite = [records[i] for i in selected]
+    tensors = columns_to_tensors(load_episode_columns(compacted_dir, elite))
+
+    state_dim = elite[0]["state_dim"]
+    num_actions = int(tensors[1].max().item()) + 1
+    used = sorted({r["generation"] for r in records})
+    print(f"Compacted generations: {', '.join(used)} (state_dim={state_dim})")
+    other_dims = sum(1 for r in index if (not generations or r["generation"] in generations)) - len(records)
+    if other_dims:
+        print(f"Skipped {other_dims} episodes logged with a different state_dim")
+
+    print_episode_statistics(
+        len(records),
+        [r["return"] for r in elite],
+        [r["max_progress"] for r in elite],
+        int(tensors[1].shape[0]),
+        state_dim,
+        num_actions,
+    )
+
+    return tensors, state_dim, num_actions
+
+
+def load_transitions_parallel(
+    log_dir: str = "logs",
+    elite_fraction: float = 0.5,
+    min_progress_threshold: float = 0.2,
+    workers: Optional[int] = None,
+    deterministic: bool = True,
+) -> Tuple[Tuple[torch.Tensor, ...], int, int]:
+    """
+    Same selection as load_transitions, but the selected episode files are
+    parsed into NumPy arrays across a process pool (see parallel_loader.py).
+    Returns the same tensors as transitions_to_tensors plus state_dim and num_actions.
+    """
+    manifest = load_manifest(log_dir)
+    candidates = [e for e in manifest if e["length"] > 0]
+
+    if not candidates:
+        raise ValueError("Loaded log files but found no transitions in any episode.")
+
+    selected = select_episodes(
+        [e["return"] for e in candidates],
+        [e["max_progress"] for e in candidates],
+        elite_fraction=elite_fraction,
+        min_progress_threshold=min_progress_threshold,
+    )
+    elite = [candidates[i] for i in selected]
+    state_dim = elite[0]["state_dim"]
+
+    columns = load_episode_arrays_parallel(
+        [os.path.join(log_dir, e["file"]) for e in elite],
+        state_dim,
+        workers=workers,
+        deterministic=deterministic,
+    )
+    tensors = columns_to_tensors(columns)
+    num_actions = int(columns["a"].max())
+
+    print_episode_statistics(
+        len(candidates),
+        [e["return"] for e in elite],
+        [e["max_progress"] for e in elite],
+        int(columns["a"].size),
+        state_dim,
+        num_actions,
+    )
+
+    return tensors, state_dim, num_actions
+
+
+class StreamingSource(NamedTuple):
+    """Selected episodes for stream=True, loaded one at a time by load_episode(i)."""
+    load_episode: Callable[[int], Dict[str, np.ndarray]]
+    num_episodes: int
+    num_transitions: int
+    state_dim: int
+    num_actions: int
+
+
+def select_streaming_episodes(
+    log_dir: str = "logs",
+    store_dir: Optional[str] = None,
+    elite_fraction: float = 0.5,
+    min_progress_threshold: float = 0.2,
+) -> StreamingSource:
+    """
+    Run episode selection on metadata only (store index or log manifest) and
+    return a loader for the selected episodes, without loading any of them.
+    """
+    if store_dir is not None:
+        store = EpisodeStore(store_dir)
+        index = store.read_index()
+        if index.size == 0:
+            raise FileNotFoundError(f"Episode store at {store_dir} has no episodes")
+
+        selected = select_episodes(
+            index["return"].tolist(),
+            index["max_progress"].tolist(),
+            elite_fraction=elite_fraction,
+            min_progress_threshold=min_progress_threshold,
+        )
+        elite = index[np.asarray(selected, dtype=np.int64)]
+        columns = store.memmap_columns(index)
+
+        # Scan the action column in chunks so the memmap never becomes resident at once
+        num_actions = 0
+        chunk = 1 << 20
+        for start in range(0, columns["a"].shape[0], chunk):
+            num_actions = max(num_actions, int(columns["a"][start:start + chunk].max()))
+
+        def load_episode(i: int) -> Dict[str, np.ndarray]:
+            start, length = int(elite[i]["start"]), int(elite[i]["length"])
+            return {key: np.array(col[start:start + length]) for key, col in columns.items()}
+
+        returns, progresses = elite["return"].tolist(), elite["max_progress"].tolist()
+        lengths = elite["length"].tolist()
+        num_total = int(index.size)
+        state_dim = store.state_dim
+    else:
+        candidates = [e for e in load_manifest(log_dir) if e["length"] > 0]
+        if not candidates:
+            raise ValueError("Loaded log files but found no transitions in any episode.")
+
+        selected = select_episodes(
+            [e["return"] for e in candidates],
+            [e["max_progress"] for e in candidates],
+            elite_fraction=elite_fraction,
+            min_progress_threshold=min_progress_threshold,
+        )
+        elite_entries = [candidates[i] for i in selected]
+        state_dim = elite_entries[0]["state_dim"]
+        num_actions = max(int(a) for e in elite_entries for a in e["actions"])
+
+        def load_episode(i: int) -> Dict[str, np.ndarray]:
+            path = os.path.join(log_dir, elite_entries[i]["file"])
+            arrays = episode_to_arrays(read_json_episode(path), state_dim)
+            return dict(zip(("s", "ns", "a", "r", "d"), arrays))
+
+        returns = [e["return"] for e in elite_entries]
+        progresses = [e["max_progress"] for e in elite_entries]
+        lengths = [e["length"] for e in elite_entries]
+        num_total = len(candidates)
+
+    print_episode_statistics(num_total, returns, progresses, int(sum(lengths)), state_dim, num_actions)
+
+    return StreamingSource(
+        load_episode=load_episode,
+        num_episodes=len(lengths),
+        num_transitions=int(sum(lengths)),
+        state_dim=state_dim,
+        num_actions=num_actions,
+    )
+
+
 # -----------------------------
 # DQN model (with Double DQN support)
 # -----------------------------
 class DQN(nn.Module):
     """
-    DQN architecture: state_dim -> 128 -> 128 -> num_actions
+    DQN architecture: state_dim -> hidden_sizes... -> num_actions
+    (default state_dim -> 128 -> 128 -> num_actions), Linear layers with ReLU between.
     """
-    def __init__(self, state_dim: int, num_actions: int):
+    def __init__(self, state_dim: int, num_actions: int, hidden_sizes: Sequence[int] = (128, 128)):
         super().__init__()
         
         if state_dim != 11:
@@ -166,13 +452,16 @@ class DQN(nn.Module):
         if num_actions != 5:
             print(f"WARNING: DQN initialized with num_actions={num_actions}, expected 5")
         
-        self.net = nn.Sequential(
-            nn.Linear(state_dim, 128),
-            nn.ReLU(),
-            nn.Linear(128, 128),
-            nn.ReLU(),
-            nn.Linear(128, num_actions),
-        )
+        self.hidden_sizes = tuple(int(h) for h in hidden_sizes)
+
+        layers: List[nn.Module] = []
+        in_dim = state_dim
+        for hidden in self.hidden_sizes:
+            layers += [nn.Linear(in_dim, hidden), nn.ReLU()]
+            in_dim = hidden
+        layers.append(nn.Linear(in_dim, num_actions))
+
+        self.net = nn.Sequential(*layers)
         
         self._initialize_weights()
     
@@ -186,6 +475,153 @@ class DQN(nn.Module):
         return self.net(x)
 
 
+def infer_hidden_sizes(state_dict: dict) -> Tuple[int, ...]:
+    """
+    Recover hidden layer widths from a DQN state_dict (net.<i>.weight keys),
+    for checkpoints saved before hidden_sizes was recorded.
+    """
+    linear_keys = sorted(
+        (k for k in state_dict if k.startswith("net.") and k.endswith(".weight")),
+        key=lambda k: int(k.split(".")[1]),
+    )
+    return tuple(int(state_dict[k].shape[0]) for k in linear_keys[:-1])
+
+
+def load_dqn_checkpoint(checkpoint_path: str, device: str = "cpu") -> Tuple["DQN", dict]:
+    """
+    Rebuild the DQN saved by train_dqn and load its weights (eval mode).
+    """
+    checkpoint = torch.load(checkpoint_path, map_location=device)
+    state_dict = checkpoint["model_state_dict"]
+    hidden_sizes = checkpoint.get("hidden_sizes") or infer_hidden_sizes(state_dict)
+
+    model = DQN(checkpoint.get("state_dim", 11), checkpoint.get("num_actions", 5), hidden_sizes)
+    model.load_state_dict(state_dict)
+    model.to(device)
+    model.eval()
+    return model, checkpoint
+
+
+# -----------------------------
+# Minibatch helpers
+# -----------------------------
+def iterate_minibatch_indices(
+    num_samples: int,
+    batch_size: int,
+    generator: Optional[torch.Generator] = None,
+):
+    """
+    Yield index tensors for one shuffled pass over the dataset.
+
+    One permutation per epoch; each minibatch is then a single gather from the
+    contiguous dataset tensors instead of a per-item DataLoader collate.
+    """
+    perm = torch.randperm(num_samples, generator=generator)
+    for start in range(0, num_samples, batch_size):
+        yield perm[start:start + batch_size]
+
+
+def prioritized_minibatch_indices(
+    sampler: PrioritizedSampler,
+    num_batches: int,
+    batch_size: int,
+    beta_start: float,
+    beta_end: float,
+    step: int,
+    total_steps: int,
+):
+    """
+    Yield (indices, importance-sampling weights) for one epoch of prioritized
+    sampling, annealing beta linearly from beta_start to beta_end over training.
+    """
+    for b in range(num_batches):
+        frac = min(1.0, (step + b) / max(total_steps - 1, 1))
+        beta = beta_start + (beta_end - beta_start) * frac
+        indices, weights = sampler.sample(batch_size, beta)
+        yield torch.from_numpy(indices), torch.from_numpy(weights)
+
+
+def q_and_targets(
+    model: nn.Module,
+    target_model: nn.Module,
+    batch_states: torch.Tensor,
+    batch_actions: torch.Tensor,
+    batch_rewards: torch.Tensor,
+    batch_next_states: torch.Tensor,
+    batch_dones: torch.Tensor,
+    gamma: float,
+    use_double_dqn: bool,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Return Q(s, a) and the 1-step TD targets for a minibatch.
+
+    With Double DQN the online network's passes over s and s' are fused into a
+    single forward over the concatenated batch; the s' half is only used for
+    the (non-differentiable) argmax, so it is detached.
+    """
+    n = batch_states.shape[0]
+
+    if use_double_dqn:
+        q_all = model(torch.cat([batch_states, batch_next_states], dim=0))
+        q_values = q_all[:n]
+        with torch.no_grad():
+            # Double DQN: use online network to select actions, target network to evaluate
+            next_actions = q_all[n:].detach().argmax(dim=1)
+            max_next_q = target_model(batch_next_states).gather(1, next_actions.unsqueeze(1)).squeeze(1)
+    else:
+        q_values = model(batch_states)
+        with torch.no_grad():
+            # Standard DQN: use target network for both selection and evaluation
+            max_next_q, _ = target_model(batch_next_states).max(dim=1)
+
+    q_sa = q_values.gather(1, batch_actions.unsqueeze(1)).squeeze(1)
+    targets = batch_rewards + gamma * (1.0 - batch_dones) * max_next_q
+    return q_sa, targets
+
+
+def q_and_multistep_targets(
+    model: nn.Module,
+    target_model: nn.Module,
+    batch_states: torch.Tensor,
+    batch_actions: torch.Tensor,
+    batch_returns: torch.Tensor,
+    batch_boot_states: torch.Tensor,
+    batch_boot_discounts: torch.Tensor,
+    use_double_dqn: bool,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Return Q(s, a) and precomputed multi-step targets (see nstep.py):
+    ret + sum_k disc[:, k] * Q'(boot_states[:, k]).
+
+    boot_states is [B, K, state_dim]; all K bootstrap states go through the
+    networks as one flattened batch.
+    """
+    n, k = batch_boot_states.shape[:2]
+    boot = batch_boot_states.reshape(n * k, -1)
+
+    if use_double_dqn:
+        q_all = model(torch.cat([batch_states, boot], dim=0))
+        q_values = q_all[:n]
+        with torch.no_grad():
+            next_actions = q_all[n:].detach().argmax(dim=1)
+            boot_q = target_model(boot).gather(1, next_actions.unsqueeze(1)).squeeze(1)
+    else:
+        q_values = model(batch_states)
+        with torch.no_grad():
+            boot_q, _ = target_model(boot).max(dim=1)
+
+    q_sa = q_values.gather(1, batch_actions.unsqueeze(1)).squeeze(1)
+    targets = batch_returns + (batch_boot_discounts * boot_q.view(n, k)).sum(dim=1)
+    return q_sa, targets
+
+
+def peak_memory_mb(device: torch.device) -> Dict[str, Optional[float]]:
+    memory = {"peak_rss_mb": peak_rss_mb()}
+    if device.type == "cuda":
+        memory["cuda_peak_allocated_mb"] = torch.cuda.max_memory_allocated(device) / (1024 * 1024)
+    return memory
+
+
 # -----------------------------
 # Training loop (with Double DQN)
 # -----------------------------
@@ -201,23 +637,169 @@ def train_dqn(
     elite_fraction: float = 0.5,
     min_progress_threshold: float = 0.2,
     use_double_dqn: bool = True,     # NEW: Enable Double DQN
+    store_dir: Optional[str] = None,  # Columnar episode store; skips JSON logs entirely
+    load_workers: Optional[int] = None,  # Process count for parallel JSON loading (default: all cores)
+    deterministic_load: bool = True,     # Keep episode order fixed when loading in parallel
+    prioritized_replay: bool = False,    # Sample by |TD error| (sum-tree) instead of uniformly
+    per_alpha: float = 0.6,              # Priority exponent (0 = uniform)
+    per_beta_start: float = 0.4,         # Importance-sampling exponent, annealed to per_beta_end
+    per_beta_end: float = 1.0,
+    per_eps: float = 1e-3,               # Keeps zero-error transitions sampleable
+    stream: bool = False,                # Stream episodes through a bounded shuffle buffer
+    memory_budget_mb: float = 512.0,     # Shuffle buffer budget when streaming
+    hidden_sizes: Sequence[int] = (128, 128),
+    reward_config: Optional[Dict[str, float]] = None,  # Recompute r under these reward constants (rewards.py)
+    n_step: int = 1,                     # Bootstrap after n rewards (targets precomputed at load, nstep.py)
+    td_lambda: Optional[float] = None,   # Truncated lambda-return over 1..n_step-step returns
+    compacted_dir: Optional[str] = None,  # Compacted shard set (log_compaction.py); takes precedence over store_dir
+    generations: Optional[Sequence[str]] = None,  # Generations to train on from compacted_dir (default: all)
+    metrics_path: Optional[str] = None,  # JSON-lines metrics: config, one record per epoch, summary
+    trace_path: Optional[str] = None,    # Chrome trace of the timed phases
+    torch_profile_batches: int = 0,      # Run torch.profiler over the first N batches
+    torch_profile_path: str = "torch_trace.json",
+    checkpoint_dir: Optional[str] = None,  # Also save every epoch as <dir>/epoch_XXX.pth (for policy_eval.py)
 ):
+    if stream and prioritized_replay:
+        raise ValueError("Prioritized replay needs the whole dataset in memory; it cannot be combined with stream=True")
+    multistep = n_step > 1 or td_lambda is not None
+    if stream and multistep:
+        raise ValueError("Multi-step targets index across whole episodes; they cannot be combined with stream=True")
+    if stream and compacted_dir is not None:
+        raise ValueError("Compacted shards are decompressed whole; stream from logs or an episode store instead")
+
+    device = torch.device(device)
+
+    # Phase timers are always on; CUDA is only synchronized when someone is reading the numbers
+    profiling = metrics_path is not None or trace_path is not None or torch_profile_batches > 0
+    sync = torch.cuda.synchronize if device.type == "cuda" and profiling else None
+    annotate = torch.profiler.record_function if torch_profile_batches > 0 else None
+    timer = PhaseTimer(sync=sync, trace=trace_path is not None, annotate=annotate)
+    metrics = MetricsWriter(metrics_path)
+
     # Load data with improved filtering
-    transitions, state_dim, num_actions = load_transitions(
-        log_dir=log_dir,
-        elite_fraction=elite_fraction,
-        min_progress_threshold=min_progress_threshold,
-    )
-    states, actions, rewards, next_states, dones = transitions_to_tensors(
-        transitions, state_dim
-    )
+    if stream:
+        with timer.phase("load"):
+            source = select_streaming_episodes(
+                log_dir=log_dir,
+                store_dir=store_dir,
+                elite_fraction=elite_fraction,
+                min_progress_threshold=min_progress_threshold,
+            )
+        state_dim, num_actions = source.state_dim, source.num_actions
+        num_samples = source.num_transitions
+        if reward_config is not None:
+            load_logged_episode = source.load_episode
 
-    dataset = TensorDataset(states, actions, rewards, next_states, dones)
-    dataloader = DataLoader(dataset, batch_size=batch_size, shuffle=True)
+            def load_episode(i: int) -> Dict[str, np.ndarray]:
+                episode = load_logged_episode(i)
+                episode["r"] = recompute_rewards(episode["s"], episode["ns"], episode["d"], reward_config)
+                return episode
 
-    device = torch.device(device)
-    model = DQN(state_dim, num_actions).to(device)
-    target_model = DQN(state_dim, num_actions).to(device)
+            source = source._replace(load_episode=load_episode)
+        buffer_capacity = buffer_capacity_for_budget(memory_budget_mb, state_dim, batch_size)
+        stream_rng = np.random.default_rng()
+    else:
+        if compacted_dir is not None:
+            with timer.phase("load"):
+                tensors, state_dim, num_actions = load_compacted_tensors(
+                    compacted_dir=compacted_dir,
+                    generations=generations,
+                    elite_fraction=elite_fraction,
+                    min_progress_threshold=min_progress_threshold,
+                )
+            states, actions, rewards, next_states, dones = tensors
+        elif store_dir is not None:
+            with timer.phase("load"):
+                tensors, state_dim, num_actions = load_store_tensors(
+                    store_dir=store_dir,
+                    elite_fraction=elite_fraction,
+                    min_progress_threshold=min_progress_threshold,
+                )
+            states, actions, rewards, next_states, dones = tensors
+        elif count_log_files(log_dir) >= PARALLEL_MIN_FILES:
+            with timer.phase("load"):
+                tensors, state_dim, num_actions = load_transitions_parallel(
+                    log_dir=log_dir,
+                    elite_fraction=elite_fraction,
+                    min_progress_threshold=min_progress_threshold,
+                    workers=load_workers,
+                    deterministic=deterministic_load,
+                )
+            states, actions, rewards, next_states, dones = tensors
+        else:
+            with timer.phase("load"):
+                transitions, state_dim, num_actions = load_transitions(
+                    log_dir=log_dir,
+                    elite_fraction=elite_fraction,
+                    min_progress_threshold=min_progress_threshold,
+                )
+            with timer.phase("tensorize"):
+                states, actions, rewards, next_states, dones = transitions_to_tensors(
+                    transitions, state_dim
+                )
+
+        if reward_config is not None:
+            with timer.phase("rewards"):
+                rewards = torch.from_numpy(
+                    recompute_rewards(states.numpy(), next_states.numpy(), dones.numpy() > 0.5, reward_config)
+                )
+
+        if multistep:
+            with timer.phase("multistep"):
+                ends = episode_ends(states.numpy(), next_states.numpy(), dones.numpy() > 0.5)
+                returns, boot_rows, boot_discounts = [
+                    torch.from_numpy(x)
+                    for x in multistep_targets(rewards.numpy(), dones.numpy() > 0.5, ends, gamma, n_step, td_lambda)
+                ]
+
+        # Whole dataset as contiguous tensors on the training device
+        with timer.phase("to_device"):
+            states, actions, rewards, next_states, dones = [
+                x.contiguous().to(device) for x in (states, actions, rewards, next_states, dones)
+            ]
+            if multistep:
+                returns, boot_rows, boot_discounts = [
+                    x.contiguous().to(device) for x in (returns, boot_rows, boot_discounts)
+                ]
+        num_samples = states.shape[0]
+
+    sampler = None
+    if prioritized_replay:
+        sampler = PrioritizedSampler(num_samples, alpha=per_alpha, eps=per_eps)
+    batches_per_epoch = math.ceil(num_samples / batch_size)
+
+    def epoch_batches(epoch: int):
+        """Yield (batch tensors, dataset indices or None, IS weights or None)."""
+        if stream:
+            for columns in stream_minibatches(
+                source.load_episode, source.num_episodes, state_dim, batch_size, buffer_capacity, stream_rng
+            ):
+                batch = [x.to(device) for x in columns_to_tensors(columns)]
+                yield batch, None, None
+            return
+
+        if sampler is None:
+            batches = ((idx, None) for idx in iterate_minibatch_indices(num_samples, batch_size))
+        else:
+            batches = prioritized_minibatch_indices(
+                sampler,
+                batches_per_epoch,
+                batch_size,
+                per_beta_start,
+                per_beta_end,
+                step=(epoch - 1) * batches_per_epoch,
+                total_steps=num_epochs * batches_per_epoch,
+            )
+        for idx, is_weights in batches:
+            idx = idx.to(device)
+            if multistep:
+                batch = [states[idx], actions[idx], returns[idx], next_states[boot_rows[idx]], boot_discounts[idx]]
+            else:
+                batch = [x[idx] for x in (states, actions, rewards, next_states, dones)]
+            yield batch, idx, is_weights
+
+    model = DQN(state_dim, num_actions, hidden_sizes).to(device)
+    target_model = DQN(state_dim, num_actions, hidden_sizes).to(device)
     target_model.load_state_dict(model.state_dict())
 
     optimizer = torch.optim.Adam(model.parameters(), lr=lr)
@@ -225,63 +807,152 @@ def train_dqn(
 
     print(f"\n=== Training Configuration ===")
     print(f"Device: {device}")
-    print(f"Architecture: {state_dim} -> 128 -> 128 -> {num_actions}")
-    print(f"Dataset size: {len(dataset)}")
+    print(f"Architecture: {' -> '.join(str(d) for d in (state_dim, *model.hidden_sizes, num_actions))}")
+    print(f"Dataset size: {num_samples}")
     print(f"Batch size: {batch_size}")
     print(f"Epochs: {num_epochs}")
     print(f"Learning rate: {lr}")
     print(f"Gamma: {gamma}")
     print(f"Double DQN: {use_double_dqn}")
+    if multistep:
+        target_kind = f"lambda={td_lambda} over 1..{n_step} steps" if td_lambda is not None else f"{n_step}-step"
+        print(f"TD targets: {target_kind} (precomputed)")
+    if prioritized_replay:
+        print(f"Prioritized replay: alpha={per_alpha}, beta={per_beta_start}->{per_beta_end}")
+    if reward_config is not None:
+        print(f"Rewards recomputed with: {reward_config}")
+    if stream:
+        print(f"Streaming: {source.num_episodes} episodes, shuffle buffer {buffer_capacity} transitions "
+              f"(budget {memory_budget_mb} MB)")
 
-    print(f"\n=== Dataset Statistics ===")
-    print(f"Rewards: min={rewards.min():.3f}, max={rewards.max():.3f}, mean={rewards.mean():.3f}, std={rewards.std():.3f}")
-    print(f"States: min={states.min():.3f}, max={states.max():.3f}")
-    print(f"Actions distribution: {torch.bincount(actions)}")
+    if not stream:
+        print(f"\n=== Dataset Statistics ===")
+        print(f"Rewards: min={rewards.min():.3f}, max={rewards.max():.3f}, mean={rewards.mean():.3f}, std={rewards.std():.3f}")
+        print(f"States: min={states.min():.3f}, max={states.max():.3f}")
+        print(f"Actions distribution: {torch.bincount(actions)}")
     print()
 
+    metrics.write(
+        "config",
+        device=str(device),
+        architecture=[state_dim, *model.hidden_sizes, num_actions],
+        num_samples=num_samples,
+        batch_size=batch_size,
+        num_epochs=num_epochs,
+        lr=lr,
+        gamma=gamma,
+        double_dqn=use_double_dqn,
+        prioritized_replay=prioritized_replay,
+        n_step=n_step,
+        td_lambda=td_lambda,
+        stream=stream,
+        reward_config=reward_config,
+        load_phases=timer.snapshot(),
+    )
+
+    profiler = None
+    if torch_profile_batches > 0:
+        activities = [torch.profiler.ProfilerActivity.CPU]
+        if device.type == "cuda":
+            activities.append(torch.profiler.ProfilerActivity.CUDA)
+        profiler = torch.profiler.profile(activities=activities, record_shapes=True)
+        profiler.start()
+    profiled_batches = 0
+
+    def stop_profiler():
+        profiler.stop()
+        profiler.export_chrome_trace(torch_profile_path)
+        print(profiler.key_averages().table(sort_by="self_cpu_time_total", row_limit=15))
+        print(f"Torch profiler trace ({profiled_batches} batches) written to {torch_profile_path}")
+
+    def make_checkpoint(epoch: int, loss: float) -> dict:
+        return {
+            "state_dim": state_dim,
+            "num_actions": num_actions,
+            "hidden_sizes": list(model.hidden_sizes),
+            "model_state_dict": model.state_dict(),
+            "epoch": epoch,
+            "loss": loss,
+            "gamma": gamma,
+            "double_dqn": use_double_dqn,
+            "prioritized_replay": prioritized_replay,
+            "n_step": n_step,
+            "td_lambda": td_lambda,
+            "reward_config": reward_config,
+        }
+
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
     model.train()
     target_model.eval()
 
     best_loss = float("inf")
+    train_seconds = 0.0
+    train_phases_start = timer.snapshot()
 
     for epoch in range(1, num_epochs + 1):
-        epoch_loss = 0.0
+        epoch_start = time.perf_counter()
+        epoch_phases_start = timer.snapshot()
+        epoch_loss = torch.zeros((), device=device)
+        batch_losses: List[torch.Tensor] = []
+        batch_grad_norms: List[torch.Tensor] = []
         num_batches = 0
+        batches = epoch_batches(epoch)
 
-        for batch in dataloader:
-            batch_states, batch_actions, batch_rewards, batch_next_states, batch_dones = [
-                x.to(device) for x in batch
-            ]
+        while True:
+            # In stream mode fetching a batch includes reading episodes from disk
+            with timer.phase("fetch"):
+                item = next(batches, None)
+            if item is None:
+                break
+            batch, idx, is_weights = item
 
-            # Q(s, a)
-            q_values = model(batch_states)
-            q_sa = q_values.gather(1, batch_actions.unsqueeze(1)).squeeze(1)
+            with timer.phase("forward"):
+                if multistep:
+                    q_sa, targets = q_and_multistep_targets(model, target_model, *batch, use_double_dqn)
+                else:
+                    q_sa, targets = q_and_targets(model, target_model, *batch, gamma, use_double_dqn)
 
-            # Target computation
-            with torch.no_grad():
-                if use_double_dqn:
-                    # Double DQN: use online network to select actions, target network to evaluate
-                    next_actions = model(batch_next_states).argmax(dim=1)
-                    max_next_q = target_model(batch_next_states).gather(1, next_actions.unsqueeze(1)).squeeze(1)
+                if is_weights is None:
+                    loss = loss_fn(q_sa, targets)
                 else:
-                    # Standard DQN: use target network for both selection and evaluation
-                    next_q_values = target_model(batch_next_states)
-                    max_next_q, _ = next_q_values.max(dim=1)
-                
-                targets = batch_rewards + gamma * (1.0 - batch_dones) * max_next_q
+                    # Importance-sampling weights correct the bias of prioritized sampling
+                    per_sample = F.smooth_l1_loss(q_sa, targets, reduction="none")
+                    loss = (per_sample * is_weights.to(device)).mean()
+
+            with timer.phase("backward"):
+                optimizer.zero_grad(set_to_none=True)
+                loss.backward()
 
-            loss = loss_fn(q_sa, targets)
+            with timer.phase("optimizer"):
+                grad_norm = torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+                optimizer.step()
 
-            optimizer.zero_grad()
-            loss.backward()
-            torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
-            optimizer.step()
+            if sampler is not None:
+                with timer.phase("priorities"):
+                    td_errors = (targets - q_sa).detach().cpu().numpy()
+                    sampler.update_priorities(idx.cpu().numpy(), td_errors)
 
-            epoch_loss += loss.item()
+            # Accumulate on-device; one sync per epoch instead of per batch
+            epoch_loss += loss.detach()
+            batch_losses.append(loss.detach())
+            batch_grad_norms.append(grad_norm.detach())
             num_batches += 1
 
-        avg_loss = epoch_loss / max(num_batches, 1)
-        print(f"Epoch {epoch}/{num_epochs} - avg loss: {avg_loss:.6f}")
+            if profiler is not None:
+                profiled_batches += 1
+                if profiled_batches >= torch_profile_batches:
+                    stop_profiler()
+                    profiler = None
+
+        avg_loss = epoch_loss.item() / max(num_batches, 1)
+        epoch_time = time.perf_counter() - epoch_start
+        train_seconds += epoch_time
+        print(
+            f"Epoch {epoch}/{num_epochs} - avg loss: {avg_loss:.6f} "
+            f"({epoch_time:.2f}s, {num_samples / max(epoch_time, 1e-9):,.0f} samples/sec)"
+        )
 
         # Update target network every epoch
         target_model.load_state_dict(model.state_dict())
@@ -289,35 +960,62 @@ def train_dqn(
         # Save best checkpoint
         if avg_loss < best_loss:
             best_loss = avg_loss
-            torch.save(
-                {
-                    "state_dim": state_dim,
-                    "num_actions": num_actions,
-                    "model_state_dict": model.state_dict(),
-                    "epoch": epoch,
-                    "loss": avg_loss,
-                    "gamma": gamma,
-                    "double_dqn": use_double_dqn,
-                },
-                best_save_path,
-            )
+            with timer.phase("checkpoint"):
+                torch.save(make_checkpoint(epoch, avg_loss), best_save_path)
             print(f"  → Saved new best model (loss: {avg_loss:.6f})")
 
+        if checkpoint_dir is not None:
+            with timer.phase("checkpoint"):
+                torch.save(make_checkpoint(epoch, avg_loss), os.path.join(checkpoint_dir, f"epoch_{epoch:03d}.pth"))
+
+        metrics.write(
+            "epoch",
+            epoch=epoch,
+            batches=num_batches,
+            seconds=epoch_time,
+            samples_per_sec=num_samples / max(epoch_time, 1e-9),
+            avg_loss=avg_loss,
+            loss=summarize_values(torch.stack(batch_losses).cpu().numpy() if batch_losses else []),
+            grad_norm=summarize_values(torch.stack(batch_grad_norms).cpu().numpy() if batch_grad_norms else []),
+            phases=PhaseTimer.since(timer.snapshot(), epoch_phases_start),
+            **peak_memory_mb(device),
+        )
+
+    if profiler is not None:
+        stop_profiler()
+
     # Save final weights
-    torch.save(
-        {
-            "state_dim": state_dim,
-            "num_actions": num_actions,
-            "model_state_dict": model.state_dict(),
-            "epoch": num_epochs,
-            "loss": avg_loss,
-            "gamma": gamma,
-            "double_dqn": use_double_dqn,
-        },
-        save_path,
-    )
-    
+    with timer.phase("checkpoint"):
+        torch.save(make_checkpoint(num_epochs, avg_loss), save_path)
+
+    phases = timer.snapshot()
+    memory = peak_memory_mb(device)
+    summary = {
+        "num_samples": num_samples,
+        "epochs": num_epochs,
+        "train_seconds": train_seconds,
+        "samples_per_sec": num_samples * num_epochs / max(train_seconds, 1e-9),
+        "final_loss": avg_loss,
+        "best_loss": best_loss,
+        "phases": phases,
+        **memory,
+    }
+    metrics.write("summary", train_phases=PhaseTimer.since(phases, train_phases_start), **summary)
+    metrics.close()
+    if trace_path is not None:
+        timer.write_chrome_trace(trace_path)
+
     print(f"\n=== Training Complete ===")
+    print_phase_table(phases, sum(t["wall_s"] for t in phases.values()))
+    rss = memory["peak_rss_mb"]
+    if rss is not None:
+        print(f"Peak RSS: {rss:.1f} MB")
+    if memory.get("cuda_peak_allocated_mb") is not None:
+        print(f"Peak CUDA allocated: {memory['cuda_peak_allocated_mb']:.1f} MB")
+    if metrics_path is not None:
+        print(f"Metrics written to: {metrics_path}")
+    if trace_path is not None:
+        print(f"Phase trace written to: {trace_path}")
     print(f"Final model saved to: {save_path}")
     print(f"Best model saved to: {best_save_path} (loss: {best_loss:.6f})")
     print(f"\nNext steps:")
@@ -325,6 +1023,79 @@ def train_dqn(
     print(f"2. Copy the generated DqnWeights.lua to your Roblox project")
     print(f"3. Test the updated bot in Roblox")
 
+    return summary
+
 
 if __name__ == "__main__":
-    train_dqn()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train the boat DQN from logged transitions")
+    parser.add_argument("--log-dir", default=None, help="JSON transition logs (default: logs)")
+    parser.add_argument("--store-dir", default=None,
+                        help="columnar episode store (default: ./store if it exists and --log-dir is not given)")
+    parser.add_argument("--compacted-dir", default=None,
+                        help="compacted shard set built by log_compaction.py")
+    parser.add_argument("--generations", nargs="+", default=None,
+                        help="generations to train on from --compacted-dir, e.g. logs old_logs8 (default: all)")
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--hidden-sizes", type=int, nargs="*", default=[128, 128],
+                        help="hidden layer widths, e.g. --hidden-sizes 64 32")
+    parser.add_argument("--prioritized-replay", action="store_true")
+    parser.add_argument("--n-step", type=int, default=1,
+                        help="bootstrap after n rewards instead of 1 (targets precomputed at load time)")
+    parser.add_argument("--td-lambda", type=float, default=None,
+                        help="use the truncated lambda-return over 1..n-step returns")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream episodes through a bounded shuffle buffer instead of loading everything")
+    parser.add_argument("--memory-budget-mb", type=float, default=512.0,
+                        help="shuffle buffer budget for --stream")
+    parser.add_argument("--reward-config", default=None,
+                        help="recompute rewards from a JSON reward config or Config.lua (see rewards.py)")
+    parser.add_argument("--metrics-out", default=None,
+                        help="write JSON-lines training metrics (per-epoch phases, loss/grad-norm histograms)")
+    parser.add_argument("--trace-out", default=None,
+                        help="write a Chrome trace of the timed training phases")
+    parser.add_argument("--torch-profile", type=int, default=0, metavar="N",
+                        help="run torch.profiler over the first N batches")
+    parser.add_argument("--torch-profile-out", default="torch_trace.json",
+                        help="Chrome trace written by --torch-profile")
+    parser.add_argument("--checkpoint-dir", default=None,
+                        help="also save every epoch's weights here, e.g. to score them with policy_eval.py")
+    args = parser.parse_args()
+
+    log_dir = args.log_dir or "logs"
+    store_dir = args.store_dir
+    if store_dir is None and args.log_dir is None and os.path.exists(os.path.join("store", "meta.json")):
+        # Prefer the columnar store when one has been built with episode_store.py,
+        # unless the logs were asked for explicitly
+        store_dir = "store"
+
+    if args.compacted_dir is not None:
+        print(f"Training data: compacted shards in {args.compacted_dir}")
+    elif store_dir is not None:
+        print(f"Training data: episode store in {store_dir}"
+              + ("" if args.store_dir else " (found ./store; pass --log-dir to train on JSON logs)"))
+    else:
+        print(f"Training data: JSON logs in {log_dir}")
+
+    train_dqn(
+        log_dir=log_dir,
+        store_dir=store_dir,
+        num_epochs=args.epochs,
+        batch_size=args.batch_size,
+        hidden_sizes=args.hidden_sizes,
+        prioritized_replay=args.prioritized_replay,
+        n_step=args.n_step,
+        td_lambda=args.td_lambda,
+        stream=args.stream,
+        memory_budget_mb=args.memory_budget_mb,
+        reward_config=load_reward_config(args.reward_config) if args.reward_config else None,
+        compacted_dir=args.compacted_dir,
+        generations=args.generations,
+        metrics_path=args.metrics_out,
+        trace_path=args.trace_out,
+        torch_profile_batches=args.torch_profile,
+        torch_profile_path=args.torch_profile_out,
+        checkpoint_dir=args.checkpoint_dir,
+    )
\ No newline at end of file
@@ -0,0 +1,151 @@
+# training_metrics.py
+#
+# Instrumentation for train_dqn: per-phase wall/CPU timers, per-batch value
+# histograms and a JSON-lines metrics file, with an optional Chrome trace of
+# the timed phases (load it in chrome://tracing or https://ui.perfetto.dev).
+#
+# CPU time is process-wide (time.process_time), so it includes PyTorch's
+# intra-op threads; a CPU/wall ratio above 1 means a phase ran in parallel.
+
+import contextlib
+import json
+import os
+import time
+from typing import Callable, ContextManager, Dict, List, Optional
+
+import numpy as np
+
+# Fixed log-spaced edges so histograms from different epochs and runs line up
+HISTOGRAM_EDGES = np.logspace(-6, 3, 19)
+
+
+class PhaseTimer:
+    """
+    Accumulates wall and CPU seconds per named phase.
+
+    `sync` is called before each clock read (e.g. torch.cuda.synchronize) so
+    asynchronous GPU work is charged to the phase that queued it. With
+    `trace=True` every phase is also kept as a Chrome trace "complete" event.
+    `annotate(name)` returns a context manager entered around each phase,
+    e.g. torch.profiler.record_function to label phases in a torch trace.
+    """
+
+    def __init__(
+        self,
+        sync: Optional[Callable[[], None]] = None,
+        trace: bool = False,
+        annotate: Optional[Callable[[str], ContextManager]] = None,
+    ):
+        self.sync = sync
+        self.trace = trace
+        self.annotate = annotate
+        self.wall: Dict[str, float] = {}
+        self.cpu: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.events: List[dict] = []
+        self._origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        if self.sync is not None:
+            self.sync()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            if self.annotate is None:
+                yield
+            else:
+                with self.annotate(name):
+                    yield
+        finally:
+            if self.sync is not None:
+                self.sync()
+            wall = time.perf_counter() - wall_start
+            self.wall[name] = self.wall.get(name, 0.0) + wall
+            self.cpu[name] = self.cpu.get(name, 0.0) + time.process_time() - cpu_start
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self.trace:
+                self.events.append({
+                    "name": name,
+                    "ph": "X",
+                    "ts": (wall_start - self._origin) * 1e6,
+                    "dur": wall * 1e6,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                })
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {
+            name: {"wall_s": self.wall[name], "cpu_s": self.cpu[name], "calls": self.calls[name]}
+            for name in self.wall
+        }
+
+    @staticmethod
+    def since(now: Dict[str, dict], before: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Per-phase totals accumulated between two snapshots.
+        """
+        zero = {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0}
+        delta = {}
+        for name, totals in now.items():
+            prev = before.get(name, zero)
+            if totals["calls"] > prev["calls"]:
+                delta[name] = {key: totals[key] - prev[key] for key in zero}
+        return delta
+
+    def write_chrome_trace(self, path: str):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+def summarize_values(values: np.ndarray, edges: np.ndarray = HISTOGRAM_EDGES) -> dict:
+    """
+    Distribution summary of per-batch values: moments, percentiles and counts
+    over `edges`. Values outside the edges fall into the first or last bin.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return {"count": 0}
+    counts, _ = np.histogram(np.clip(values, edges[0], edges[-1]), bins=edges)
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max()),
+        "hist_edges": edges.tolist(),
+        "hist_counts": counts.tolist(),
+    }
+
+
+class MetricsWriter:
+    """
+    Appends one JSON object per line: {"event": ..., "time": ..., **fields}.
+    Without a path every write is a no-op, so callers need no branches.
+    """
+
+    def __init__(self, path: Optional[str] = None, append: bool = False):
+        self.path = path
+        self._file = open(path, "a" if append else "w") if path else None
+
+    def write(self, event: str, **fields):
+        if self._file is None:
+            return
+        record = {"event": event, "time": time.time(), **fields}
+        self._file.write(json.dumps(record, default=float) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def print_phase_table(phases: Dict[str, dict], total_wall: float):
+    print(f"{'phase':<12} {'wall s':>9} {'cpu s':>9} {'cpu/wall':>9} {'share':>7} {'calls':>9}")
+    for name, t in sorted(phases.items(), key=lambda item: -item[1]["wall_s"]):
+        ratio = t["cpu_s"] / t["wall_s"] if t["wall_s"] > 0 else 0.0
+        share = t["wall_s"] / total_wall if total_wall > 0 else 0.0
+        print(f"{name:<12} {t['wall_s']:>9.3f} {t['cpu_s']:>9.3f} {ratio:>9.2f} {share:>7.1%} {t['calls']:>9}")
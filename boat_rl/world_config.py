@@ -0,0 +1,117 @@
+# world_config.py
+#
+# Course geometry shared by the offline tools (river_sim, raycast), mirrored
+# from shared/world/WorldConfig.lua, the BOAT block of shared/Constants.lua and
+# the world build in server/world/TerrainGen.lua. Keep in sync with the Lua
+# side when the course changes.
+
+from typing import Tuple
+
+import numpy as np
+
+# -----------------------------
+# WorldConfig.lua
+# -----------------------------
+WATER_SURFACE_Y = 20.0          # BASE_CENTER.Y + BASE_SIZE.Y / 2
+RIVER_WIDTH = 120.0
+RIVER_LENGTH = 2000.0
+RIVER_CENTER_X = 0.0
+RIVER_HALF_WIDTH = RIVER_WIDTH * 0.5
+
+SPAWN_X = 0.0
+SPAWN_Z = -RIVER_LENGTH * 0.5 + 120 + 20     # BOAT_WATER_SPAWN
+COURSE_START_Z = SPAWN_Z
+COURSE_FINISH_Z = RIVER_LENGTH * 0.5 - 80
+
+CURRENT_STRENGTH = 2000.0        # force along CURRENT_DIRECTION = +Z
+CURRENT_Z_RANGE = (-RIVER_LENGTH * 0.5, RIVER_LENGTH * 0.5)
+
+ROCK_COUNT = 16
+ROCK_RADIUS_RANGE = (4.0, 8.0)
+ROCK_MIN_SPACING = 35.0
+ROCK_SAFE_RADIUS = 120.0
+ROCK_REGION_X = (-RIVER_HALF_WIDTH + 10, RIVER_HALF_WIDTH - 10)
+ROCK_REGION_Z = (-RIVER_LENGTH * 0.5 + 80, RIVER_LENGTH * 0.5 - 80)
+ROCK_PLACEMENT_TRIES = 40
+ROCK_SINK = 0.4                  # rocks sit at surface - r * 0.4
+
+RIVER_WALL_HEIGHT = 20.0
+RIVER_WALL_THICKNESS = 4.0
+RIVER_WALL_EXTRA_LENGTH = 40.0
+
+FINISH_LINE_WIDTH = RIVER_WIDTH - 10
+FINISH_LINE_DEPTH = 4.0
+
+# Axis-aligned boxes the sensor rays can hit, as (min_xyz, max_xyz). The
+# finish gate and trigger are CanCollide=false but still answer raycasts.
+_WALL_Y = (WATER_SURFACE_Y, WATER_SURFACE_Y + RIVER_WALL_HEIGHT)
+_WALL_Z = (-(RIVER_LENGTH + RIVER_WALL_EXTRA_LENGTH) * 0.5, (RIVER_LENGTH + RIVER_WALL_EXTRA_LENGTH) * 0.5)
+STATIC_BOXES = np.array([
+    # right / left river walls
+    [[RIVER_HALF_WIDTH, _WALL_Y[0], _WALL_Z[0]],
+     [RIVER_HALF_WIDTH + RIVER_WALL_THICKNESS, _WALL_Y[1], _WALL_Z[1]]],
+    [[-RIVER_HALF_WIDTH - RIVER_WALL_THICKNESS, _WALL_Y[0], _WALL_Z[0]],
+     [-RIVER_HALF_WIDTH, _WALL_Y[1], _WALL_Z[1]]],
+    # finish gate (12 tall, centered 8 above the water)
+    [[-FINISH_LINE_WIDTH * 0.5, WATER_SURFACE_Y + 2, COURSE_FINISH_Z - FINISH_LINE_DEPTH * 0.5],
+     [FINISH_LINE_WIDTH * 0.5, WATER_SURFACE_Y + 14, COURSE_FINISH_Z + FINISH_LINE_DEPTH * 0.5]],
+    # finish trigger (20 tall, centered 5 above the water, 5 upstream of the gate)
+    [[-FINISH_LINE_WIDTH * 0.5, WATER_SURFACE_Y - 5, COURSE_FINISH_Z - 5 - FINISH_LINE_DEPTH],
+     [FINISH_LINE_WIDTH * 0.5, WATER_SURFACE_Y + 15, COURSE_FINISH_Z - 5 + FINISH_LINE_DEPTH]],
+])
+FINISH_TRIGGER = STATIC_BOXES[3]
+
+# -----------------------------
+# Constants.lua (BOAT.HullSize)
+# -----------------------------
+HULL_HALF_WIDTH = 6.0            # HullSize.X / 2, along RightVector
+HULL_HALF_LENGTH = 4.0           # HullSize.Z / 2, along LookVector
+HULL_HALF_HEIGHT = 0.75
+
+# The hull floats with its bottom at the water line
+BOAT_Y = WATER_SURFACE_Y + HULL_HALF_HEIGHT
+
+
+# -----------------------------
+# World generation
+# -----------------------------
+def scatter_rocks(
+    num_layouts: int,
+    rng: np.random.Generator,
+    rock_count: int = ROCK_COUNT,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TerrainGen.scatterRocks for `num_layouts` independent worlds at once.
+
+    Each rock gets up to ROCK_PLACEMENT_TRIES uniform candidates and takes the
+    first one that keeps ROCK_MIN_SPACING from earlier rocks and lies outside
+    ROCK_SAFE_RADIUS of the spawn; rocks that never find a spot are skipped.
+    Returns centers (L, rock_count, 3) and radii (L, rock_count), with a
+    radius of 0 marking a skipped rock.
+    """
+    centers = np.zeros((num_layouts, rock_count, 3))
+    radii = np.zeros((num_layouts, rock_count))
+    placed = np.zeros((num_layouts, rock_count), dtype=bool)
+
+    for k in range(rock_count):
+        pending = np.ones(num_layouts, dtype=bool)
+        for _ in range(ROCK_PLACEMENT_TRIES):
+            x = rng.uniform(*ROCK_REGION_X, size=num_layouts)
+            z = rng.uniform(*ROCK_REGION_Z, size=num_layouts)
+
+            dx = x[:, None] - centers[:, :k, 0]
+            dz = z[:, None] - centers[:, :k, 2]
+            too_close = ((dx * dx + dz * dz) < ROCK_MIN_SPACING ** 2) & placed[:, :k]
+            in_safe_zone = (x - SPAWN_X) ** 2 + (z - SPAWN_Z) ** 2 <= ROCK_SAFE_RADIUS ** 2
+
+            accept = pending & ~too_close.any(axis=1) & ~in_safe_zone
+            centers[accept, k, 0] = x[accept]
+            centers[accept, k, 2] = z[accept]
+            placed[accept, k] = True
+            pending &= ~accept
+            if not pending.any():
+                break
+
+    radii[placed] = rng.uniform(*ROCK_RADIUS_RANGE, size=int(placed.sum()))
+    centers[..., 1] = WATER_SURFACE_Y - radii * ROCK_SINK
+    return centers, radii
@@ -64,22 +64,43 @@ function Agent:qValues(state)
         local b = layer.b
         local out_dim = #b
         local in_dim = #x
+        -- Per-layer activation from the exporter; older exports imply ReLU on hidden layers
+        local activation = layer.activation or (layerIdx < #Weights.layers and "relu" or "linear")
+        local useRelu = activation == "relu"
 
         local y = table.create(out_dim, 0)
 
-        for j = 1, out_dim do
-            local sum = b[j]
-            local rowW = W[j]
+        if layer.inDim then
+            -- Flat row-major layout from export_weights.py --format flat
+            for j = 1, out_dim do
+                local sum = b[j]
+                local base = (j - 1) * in_dim
 
-            for i = 1, in_dim do
-                sum += rowW[i] * x[i]
-            end
+                for i = 1, in_dim do
+                    sum += W[base + i] * x[i]
+                end
+
+                if useRelu then
+                    sum = relu(sum)
+                end
 
-            if layerIdx < #Weights.layers then
-                sum = relu(sum)
+                y[j] = sum
             end
+        else
+            for j = 1, out_dim do
+                local sum = b[j]
+                local rowW = W[j]
+
+                for i = 1, in_dim do
+                    sum += rowW[i] * x[i]
+                end
+
+                if useRelu then
+                    sum = relu(sum)
+                end
 
-            y[j] = sum
+                y[j] = sum
+            end
         end
 
         x = y
@@ -313,6 +334,35 @@ end
 local HttpService = game:GetService("HttpService")
 local LOG_ENDPOINT = "http://127.0.0.1:5000/transitions"
 
+local function statesEqual(a, b)
+    if a == b then
+        return true
+    end
+    if #a ~= #b then
+        return false
+    end
+    for i = 1, #a do
+        if a[i] ~= b[i] then
+            return false
+        end
+    end
+    return true
+end
+
+-- Drop "ns" where the next transition's "s" carries the same state
+local function compactTransitions(transitions)
+    local out = table.create(#transitions)
+    for i, t in ipairs(transitions) do
+        local nextT = transitions[i + 1]
+        if nextT and statesEqual(t.ns, nextT.s) then
+            out[i] = { s = t.s, a = t.a, r = t.r, d = t.d }
+        else
+            out[i] = t
+        end
+    end
+    return out
+end
+
 function Agent:onEpisodeEnd()
     self.episodeCount += 1
 
@@ -339,7 +389,9 @@ function Agent:onEpisodeEnd()
     local payload = {
         episodeId = os.time(),
         episodeNum = self.episodeCount,
-        transitions = self.episodeTransitions,
+        transitions = Config.compactTransitionPayload
+            and compactTransitions(self.episodeTransitions)
+            or self.episodeTransitions,
         metadata = {
             totalSteps = self.totalSteps,
             epsilon = self.epsilon,
@@ -115,4 +115,8 @@ Config.debugTransitionHttp = false  -- verbose HTTP logging in Agent:onEpisodeEn
 -- IMPORTANT: Make sure Flask server (log_data.py) is running first!
 Config.enableTransitionLogging = false
 
+-- Omit each transition's "ns" when it equals the next transition's "s".
+-- log_data.py rebuilds "ns" on write; roughly halves the POST size.
+Config.compactTransitionPayload = false
+
 return Config
\ No newline at end of file
@@ -1,11 +1,1212 @@
-local HttpService = game:GetService("HttpService")
-
--- AUTO-GENERATED by boat_rl/export_weights.py. Do not edit by hand.
+-- AUTO-GENERATED by boat_rl/export_weights.py --format flat. Do not edit by hand.
 -- Model: 11-dim state, 5 actions
 -- Architecture: 11 -> 128 -> 128 -> 5
+-- Layout: flat row-major, W[(j - 1) * inDim + i]; encoding: none
+
+local layers = {}
+
+layers[1] = {
+    inDim = 11,
+    outDim = 128,
+    activation = "relu",
+    W = {
+        -0.17831577, 0.09382529, 0.027382135, 0.13471696, 0.13559781, -0.006045941, -0.14397329, -0.039369028, -0.004215193, -0.115536414, -0.06985763, 0.16415806, -0.011773362, 0.04334052, -0.06724022, 0.12621792,
+        -0.059807755, -0.037343584, 0.05404803, 0.11072502, -0.026564825, -0.20648515, -0.048577495, 0.01504774, 0.13714075, 0.19395529, -0.015480105, -0.16914812, 0.14002359, -0.07795801, 0.04283949, 0.052244663,
+        0.021349948, 0.008953172, 0.13642336, -0.10274191, 0.051426154, 0.074421726, 0.114434175, 0.12982039, -0.11127513, 0.18433884, -0.033579506, 0.14137693, -0.20462425, 0.058768198, 0.17136993, 0.19477864,
+        -0.024036102, 0.031232908, 0.007982159, -0.19842173, -0.10229094, -0.03285836, 0.066116, -0.07215805, -0.041781947, -0.11867949, -0.18922958, 0.16843991, 0.13922216, 0.10428291, -0.07637947, 0.14249928,
+        0.20150131, 0.10823946, 0.0070967884, -0.13263871, -0.103695676, -0.19543415, -0.099556506, -0.16452429, -0.05598929, 0.022415424, -0.20075938, -0.0057870653, 0.038234778, -0.12070887, -0.16450644, -0.09547918,
+        0.09521405, 0.025061002, 0.07517449, 0.05738302, -0.09601472, -0.0949078, -0.0825868, 0.20586613, -0.04706409, 0.03755135, -0.030326616, 0.060490336, 0.030396204, 0.19561799, 0.07495258, 0.04499306,
+        -0.03887797, 0.07698912, -0.030744076, -0.04994678, -0.1372579, 0.043685302, -0.10437698, 0.071860984, 0.077593274, -0.0052371477, -0.025477055, -0.028987339, 0.1764209, 0.0046862536, 0.036366254, 0.082172,
+        0.07152372, 0.14221731, -0.16859308, -0.12829906, 0.17799263, -0.1503553, -0.13012208, -0.0041134804, 0.17710641, -0.12784624, 0.109821014, -0.21699959, -0.093509845, -0.091352955, 0.20748089, 0.07921147,
+        -0.11599043, 0.07810949, -0.045946088, -0.0145643465, 0.061303232, 0.023696018, -0.20092304, -0.025674932, 0.20308034, 0.12655099, -0.0065266215, -0.18035042, -0.09790608, -0.019355152, 0.19605353, 0.06650832,
+        -0.08430601, 0.038143903, 0.18790904, -0.010841411, -0.0039123017, -0.08160806, 0.08203718, -0.08629489, 0.07612946, -0.12646577, 0.055956624, -0.13882828, 0.18709865, -0.1914368, -0.16952617, -0.02890497,
+        0.12934934, 0.1577232, 0.02454287, -0.17386213, 0.19734912, 0.030118613, 0.17194998, 0.08611281, -0.20176475, 0.12971167, 0.053683642, -0.19187143, 0.044799056, 0.03287997, 0.20689388, -0.20037004,
+        -0.10056123, -0.010468513, 0.090377964, -0.008660131, -0.123415165, -0.1109737, -0.0653552, 0.07312194, 0.1775357, -0.19626525, 0.03905724, 0.15149023, 0.012016534, 0.18836586, -0.1471337, 0.11813173,
+        -0.026922585, 0.08643203, 0.038177118, -0.04812885, 0.061797436, -0.18188967, -0.030773805, 0.19389448, 0.044275384, -0.12140114, -0.053852484, 0.092002265, -0.12795693, -0.15852031, -0.03683689, 0.13520122,
+        0.16251476, 0.063960984, -0.09063112, 0.09068166, 0.08993941, 0.107861415, 0.02825471, 0.15916094, 0.17770298, 0.07569716, -0.11507027, -0.040582452, 0.19122212, 0.044571646, 0.19709729, 0.010360205,
+        -0.0961705, -0.15919982, 0.08913558, -0.06506169, 0.08060099, 0.16394365, 0.18190128, 0.20026283, 0.053865384, 0.1679482, -0.09891857, -0.20939536, -0.0450873, 0.0425421, -0.05595252, 0.16914037,
+        0.17531598, -0.14579853, 0.10219087, -0.20408691, -0.14797486, -0.19076419, 0.19201922, 0.015871724, 0.19225068, -0.037061602, -0.07249417, 0.19546236, -0.10970836, 0.062007364, -0.10149275, -0.057768542,
+        -0.18734401, -0.042215135, -0.072757065, -0.058628846, 0.18451992, -0.019314066, 0.010630497, 0.1643536, 0.09348888, -0.087736756, 0.16251649, -0.1250231, -0.08944649, 0.09104209, -0.13640416, -0.09870225,
+        -0.19449891, 0.02885789, 0.034674544, 0.11585387, -0.040931262, -0.16564846, 0.13721211, -0.15578207, -0.15584813, 0.0072342376, -0.1204494, 0.15892501, 0.053222097, 0.16253395, -0.15606643, 0.013918173,
+        -0.032170355, -0.012979567, 0.2254772, 0.053133756, -0.0006868592, 0.13925603, 0.09207809, -0.1753543, -0.18139271, -0.19951059, -0.056472726, 0.13686663, -0.16949344, 0.15828243, 0.18043885, 0.0042905253,
+        0.041114766, 0.1540771, -0.18435392, -0.033198345, -0.042688876, 0.08406805, -0.19261394, -0.0975252, 0.03144661, 0.08726321, 0.15256655, 0.19064887, -0.0018442863, -0.06955544, -0.102171555, 0.11417067,
+        0.19656563, -0.08140415, 0.18375315, -0.19275373, -0.040426895, -0.15395127, 0.16142914, 0.030088518, -0.042339887, -0.088181846, 0.16040224, -0.011620372, 0.17784488, 0.010940024, 0.093659945, 0.021392211,
+        -0.13037314, 0.03135807, 0.002480322, 0.21534398, 0.03304211, -0.072832786, -0.026071843, -0.015304742, -0.026578717, -0.13937315, -0.11345513, 0.13102065, 0.07497873, -0.041845, -0.044122096, -0.12795171,
+        0.0016552019, -0.14511181, 0.12410923, 0.068855956, -0.19563183, 0.01878051, 0.029196892, -0.166423, -0.15428823, -0.15028884, 0.16649324, 0.2006948, 0.18523324, -0.0555941, 0.026859034, -0.036868516,
+        0.098818645, 0.08560558, -0.19353987, -0.08879728, 0.054800637, -0.10762325, -0.13578968, -0.045314707, -0.06494581, 0.17872833, -0.068432935, -0.00042561497, 0.19525217, 0.16180459, -0.11405481, -0.11383681,
+        -0.18384907, -0.10471458, -0.14309023, 0.051940236, -0.14710142, -0.022764308, 0.19396919, -0.105587654, 0.17037597, 0.17762674, 0.024374159, 0.12770578, 0.17766126, -0.068295404, -0.14697514, 0.009707786,
+        -0.06066944, 0.045247454, 0.02824023, -0.107376926, 0.188871, -0.07364606, -0.14318533, -0.07896556, 0.014217434, -0.13936713, 0.20051788, -0.019971969, -0.044777747, 0.18173078, 0.16117631, -0.19726457,
+        0.11964383, 0.044695497, 0.027668754, -0.07483531, 0.14643738, -0.19091311, 0.08544838, 0.13804495, -0.20767345, -0.19697066, 0.03590175, 0.027737495, -0.15115237, -0.063664645, 0.1652874, 0.16457126,
+        0.08626752, 0.0023483727, 0.1910133, -0.113630764, 0.1528915, 0.17304024, 0.0192021, 0.16495845, 0.19548231, -0.11470227, -0.06419721, 0.06468941, -0.09867467, -0.07738527, 0.07302805, -0.0843733,
+        -0.19545136, 0.09638947, 0.08116404, -0.0052166516, -0.18698822, -0.064667225, -0.07085988, 0.008466162, 0.18703984, 0.019513741, -0.061894923, 0.17213394, 0.11565607, 0.17955163, -0.06640163, -0.10940476,
+        -0.10195095, -0.20218831, -0.09496393, -0.054819014, -0.084352374, -0.023887023, 0.11093731, 0.081602834, 0.071955055, -0.12823732, 0.14637595, -0.10610375, 0.18239583, 0.15576461, 0.19679229, 0.091870345,
+        0.02478241, 0.022570934, 0.096022196, -0.019665178, -0.19823237, 0.05018971, -0.1780894, 0.19404273, 0.07000816, -0.14982535, 0.06720426, -0.19050623, 0.13823713, 0.10747886, -0.027959112, 0.16960964,
+        -0.13357559, -0.18598165, 0.06252516, -0.042973105, 0.1221583, 0.14721918, -0.018666634, -0.14956231, 0.1556577, -0.14420497, -0.15519321, -0.07444716, 0.030562093, -0.095414676, 0.19678552, -0.09289884,
+        -0.08304638, 0.057945255, 0.0114203105, 0.17764509, -0.040127233, -0.023048747, 0.12428357, -0.042039286, -0.020953389, 0.007453713, 0.024198217, 0.02182696, 0.038027, 0.16772225, 0.119649775, 0.02459661,
+        0.15168895, 0.10877461, 0.027763063, 0.1551739, 0.14046572, 0.18843779, 0.045865968, 0.16782136, -0.018611794, 0.030740866, 0.12794, 0.2118257, 0.16996193, 0.21334107, -0.051614195, 0.14707558,
+        0.20282674, -0.09214882, 0.08136761, 0.12835969, 0.19603287, 0.19265594, -0.06702445, 0.036126547, -0.105264485, -0.048977934, 0.031830765, -0.16208546, 0.0119905155, 0.18690781, 0.08800341, 0.15381244,
+        0.1423973, 0.20057513, 0.16012055, -0.15270941, -0.0059928596, -0.054604482, 0.2097433, -0.14874426, -0.016514413, 0.17869419, -0.0911194, -0.037902296, 0.14566442, 0.027822787, -0.20027843, -0.023123512,
+        -0.18879259, 0.06969233, 0.037678, 0.0038910913, 0.08679232, 0.16265653, 0.07472737, 0.06805113, 0.15864693, 0.19162236, 0.20813434, 0.13723059, 0.04030981, 0.12622726, -0.044197727, -0.111286335,
+        0.10804974, -0.15797924, 0.13869709, -0.07644218, -0.10744544, -0.08808772, -0.00804402, -0.13559543, -0.1645453, -0.10124871, -0.14470276, -0.09360938, -0.14448018, 0.11785357, -0.11583306, -0.056485422,
+        0.14691815, 0.2187809, -0.003470576, 0.14103688, -0.081208944, -0.15082139, -0.16673285, -0.083280385, -0.0067203464, 0.14056112, -0.045312554, -0.028433748, -0.06876479, -0.052819792, -0.1231584, -0.089464866,
+        -0.03543296, 0.16382253, 0.1250342, 0.06488568, 0.056475256, 0.09889313, -0.08724457, 0.09070353, 0.15750118, 0.16296187, 0.031538047, 0.10065848, 0.07691602, 0.15665619, 0.10144489, -0.18350112,
+        0.11794383, -0.08623597, -0.16288008, 0.11643282, 0.04359565, -0.06118955, 0.13639899, 0.010983232, -0.17484601, -0.10417265, 0.061803427, 0.16933143, 0.18147129, -0.059626233, -0.06234522, -0.09279663,
+        0.027553506, 0.18875805, 0.02414829, 0.069974385, 0.10377244, -0.10907987, -0.1546818, 0.15245242, -0.027145155, 0.034241587, -0.13544114, 0.10131103, -0.12438204, -0.08889285, 0.13187036, 0.043194685,
+        0.20743977, 0.028120292, -0.041263275, 0.033436295, 0.13039435, -0.14030482, 0.17711052, 0.15706804, 0.18138385, -0.01950868, -0.15409651, 0.021525135, 0.14357492, -0.009862628, -0.037306286, -0.07709965,
+        0.06595032, -0.04495442, -0.058346905, -0.18210284, 0.21537352, 0.012693795, -0.08834626, 0.18743135, -0.023577329, 0.021339612, 0.08369285, -0.1893801, -0.115935, -0.06176125, 0.20482069, -0.042314675,
+        -0.010562987, 0.11715615, 0.009241109, -1.9503763e-05, -0.18747877, -0.07312911, -0.006612828, -0.1247757, 0.19746996, 0.06726308, -0.071617045, -0.028202346, -0.16385956, 0.1843668, -0.13800925, -0.016391262,
+        0.15775241, -0.13871989, -0.127878, 0.04638132, -0.078149416, 0.068916306, -0.12912202, 0.028663991, 0.07686239, -0.106106, -0.18285342, -0.046777245, 0.06061275, -0.010998181, 0.15894382, -0.021866964,
+        0.07037124, 0.07912496, -0.033798683, 0.16332698, 0.05325327, 0.16451377, -0.04790288, 0.1565867, 0.12053978, -0.03624734, -0.061340917, 0.07252479, 0.0015431407, -0.036606263, 0.104657166, -0.09959435,
+        -0.21133861, 0.08008886, 0.18212993, -0.12337149, 0.097977474, 0.17518009, 0.014986322, 0.17466009, 0.07038605, -0.07123932, 0.19236492, 0.14975971, 0.017741805, -0.08035661, 0.0686266, -0.194276,
+        -0.008963577, 0.18629788, -0.11313399, -0.09079838, 0.12435012, 0.050393652, 0.1870661, -0.008664484, 0.0049700513, 0.03618653, 0.10884827, 0.10261873, 0.04369944, -0.15954083, -0.09270699, -0.16733441,
+        0.10322589, -0.008944058, -0.044397835, 0.20376892, 0.18041876, -0.12571359, 0.06527795, 0.18229826, -0.19824395, -0.02260529, -0.18450278, 0.120605744, -0.09471005, -0.108762264, 0.046879612, 0.060282916,
+        -0.045252956, -0.17503966, -0.07351423, 0.063219495, -0.023007594, 0.12000899, -0.045313057, 0.08198476, -0.13685831, -0.12655543, 0.16150676, -0.051437795, -0.023724113, 0.090924956, -0.0125552, -0.18567973,
+        -0.065174736, 0.0019785585, 0.13150243, 0.12698899, 0.19497906, -0.14365804, -0.03684095, 0.12184132, -0.09610083, -0.009320335, 0.15960582, -0.014045148, 0.12354082, -0.0050699115, 0.10386647, 0.027967911,
+        0.14477286, 0.04450255, -0.11324066, 0.020015653, 0.050459825, -0.035180576, -0.097371, -0.13176002, -0.21637875, -0.004564738, 0.07262168, 0.20568202, 0.08370137, -0.072683215, -0.10706248, 0.01457364,
+        0.05902487, 0.028992005, 0.0027820028, 0.034892872, 0.072715655, -0.012832097, -0.06593687, 0.041351706, -0.10429695, 0.036382727, -0.020937352, -0.037864346, -0.007173459, 0.14857267, -0.005948346, -0.081803225,
+        -0.026043797, -0.19689338, 0.1736971, -0.045848336, 6.984647e-05, 0.18354708, 0.102578074, 0.17255414, -0.119171105, -0.15722303, -0.20908934, 0.20286183, 0.19354768, 0.1150321, 0.17104223, 0.07089536,
+        0.07444525, 0.17958431, -0.033003733, 0.03676579, 0.054481898, 0.06361201, -0.08502284, -0.08856114, -0.14736487, 0.18008843, -0.029708028, 0.028278882, 0.011922604, -0.1400446, -0.20102653, -0.008763226,
+        -0.087386794, 0.20490785, -0.14562872, -0.036437273, -0.14896144, 0.0018002709, -0.16508386, 0.09216825, -0.090852305, 0.018238055, 0.1396352, -0.08858957, 0.071405284, -0.09627708, 0.20728399, -0.18716715,
+        0.16003804, -0.08386134, -0.12352204, -0.1744467, -0.1868852, -0.047843423, -0.08489922, 0.12273693, -0.13136347, 0.21081401, -0.081993885, -0.057083756, 0.00929389, 0.046404332, -0.1474027, -0.09394752,
+        0.108015895, 0.08011943, -0.111076295, -0.043608226, -0.18538682, 0.068426035, 0.07282209, -0.0436641, 0.104575835, -0.099282056, -0.040735364, 0.19185679, 0.1520544, 0.20124397, -0.16394015, 0.16235605,
+        0.04160114, 0.14757855, 0.089767426, -0.16419338, 0.05791786, 0.18165399, 0.12538053, -0.17804788, -0.0050742477, -0.123463504, 0.00093147106, -0.14897835, -0.19377385, -0.18101928, 0.1961757, 0.080223374,
+        -0.10916587, 0.1409456, 0.089674845, 0.122045875, 0.16804169, -0.15270868, 0.16352908, -0.031012937, -0.003848331, -0.15679342, -0.17165741, -0.03236576, -0.18792044, -0.16572334, -0.15734324, 0.1134162,
+        -0.11323348, 0.11955527, 0.12924089, 0.1617062, -0.052246753, -0.05876306, 0.1192775, 0.035553105, 0.084380604, -0.0636306, -0.19382213, -0.21210115, -0.06280624, -0.15350573, -0.05576768, 0.09303196,
+        -0.06888112, 0.10165086, -0.16554238, 0.15123008, -0.12273641, -0.112816, 0.17637348, -0.12608865, 0.051078, 0.13804175, -0.12043859, 0.18514726, 0.09769847, -0.15047838, -0.045860235, 0.06634217,
+        0.11925574, -0.13148177, -0.16261315, 0.17118269, 0.025075696, 0.14455736, 0.102227986, 0.0831579, -0.10193863, -0.038171295, 0.10151629, 0.06563823, -0.18161604, 0.09335589, 0.20477921, 0.17145865,
+        -0.041505966, 0.18140307, 0.0995299, -0.13601458, 0.1824358, 0.09699279, -0.045900684, 0.11120003, -0.052530553, -0.154142, -0.102768034, -0.15718465, -0.04421114, 0.16681972, -0.17287284, -0.13393086,
+        -0.090894274, -0.19065735, -0.18091227, -0.1922123, -0.049203645, 0.18348691, -0.10757586, 0.14738037, 0.13010713, 0.18200853, -0.007318395, -0.061999332, -0.19263574, -0.044706535, -0.19184518, 0.022879565,
+        -0.02453854, -0.1763207, -0.058430225, 0.10318602, 0.20759419, -0.15126784, 0.058468167, 0.12990694, 0.15507622, 0.20399754, -0.12903392, 0.11908913, -0.12158282, 0.15873298, 0.16763403, -0.21357286,
+        0.07415025, -0.0022095034, 0.10713872, -0.023354545, -0.1029568, 0.09468906, 0.012112126, -0.1765491, -0.16014066, 0.050715636, 0.083740965, -0.08334896, 0.19287117, -0.1240441, 0.1645251, 0.067730375,
+        -0.13052858, 0.10642721, -0.0229197, 0.12931137, -0.17622599, 0.122673996, 0.06286691, -0.14887373, -0.20112476, -0.075029925, 0.18679781, -0.051161256, -0.05143344, -0.14962292, -0.18104187, -0.11318359,
+        -0.032691088, 0.119343966, -0.08340429, 0.122184336, -0.04289495, -0.16614185, -0.12086268, -0.1926768, -0.20431425, -0.09013835, 0.17268004, 0.14297833, 0.0050178305, 0.048511356, -0.19034396, 0.16607285,
+        0.059126865, 0.038549405, -0.089618914, 0.0536946, 0.07688668, -0.043922078, -0.1692078, -0.054970916, -0.14677076, 0.072782196, -0.17970933, -0.021288885, -0.19801155, -0.08240486, -0.07796575, 0.06292905,
+        -0.060287766, -0.05558398, 0.09809078, 0.07345345, 0.18765938, 0.037535213, 0.2163165, 0.107983775, 0.026722332, -0.18922557, -0.09285172, 0.15891628, 0.19627555, -0.11273085, 0.10654429, 0.060320392,
+        -0.15514994, 0.15972449, -0.055931494, 0.16097727, -0.12117739, -0.06684495, -0.11976412, -0.089663126, 0.12623575, -0.16807468, 0.14719336, 0.19387461, -0.17862678, 0.18604088, 0.20397803, -0.13049008,
+        -0.023633676, -0.100138225, -0.17401527, 0.091398634, -0.16094467, -0.021745907, -0.16170935, 0.10270034, 0.081526905, 0.11073623, 0.08478237, -0.1531332, 0.14193028, -0.10658711, 0.1915125, 0.08424182,
+        -0.005786379, -0.201407, -0.111426994, -0.118384175, -0.1123, 0.13079998, -0.20656677, 0.06537897, -0.13111584, -0.13165802, -0.11105256, -0.1607139, -0.1424953, 0.16657, -0.0977183, 0.1785406,
+        -0.12445762, -0.19235235, 0.07487612, 0.035558272, 0.1547084, -0.045330364, -0.036669575, 0.009640469, -0.17523922, 0.020899806, 0.11379817, 0.09321491, -0.005274501, 0.099047765, -0.12570488, 0.1523821,
+        0.090957455, 0.10400101, -0.007233427, 0.19754027, -0.1534054, 0.13392787, 0.19716735, 0.013254083, -0.12175502, -0.20354019, 0.11203229, -0.11693404, -0.053226292, 0.0677379, 0.044390637, -0.17446595,
+        -0.19603902, -0.19510122, -0.05416189, 0.160033, 0.069863096, -0.1464215, 0.088796504, -0.17895229, 0.022534223, 0.17741716, -0.18180044, -0.12280031, 0.010339899, 0.028176975, 0.197822, -0.013516346,
+        0.057671584, -0.13961451, -0.10462287, -0.19205843, -0.0774222, -0.12010415, 0.026446542, 0.16798842, 0.07870596, -0.14569746, -0.06466651, 0.12340971, 0.0950897, -0.14141203, 0.0057975864, 0.055787865,
+        -0.14519317, -0.08519577, -0.18270318, -0.13312064, 0.10612586, 0.15109617, -0.18138763, -0.08393586, 0.0052861157, 0.16695994, 0.17947786, -0.14663541, -0.1001807, -0.18697877, -0.04928287, -0.12096364,
+        0.0314335, -0.03316164, 0.18276496, 0.014101143, -0.16280942, 0.19162938, -0.11518602, -0.024671543, -0.08041966, -0.008989836, -0.020183032, -0.014799855, 0.15376507, 0.18341416, 0.016894516, -0.10819325,
+        -0.08747997, -0.18094225, 0.10737246, -0.20445402, 0.11851943, -0.0876839, -0.18499196, -0.19773665, -0.07589877, 0.15181363, -0.08379096, -0.0065524727, -0.054138, -0.115669794, 0.00769843, -0.01685668,
+        0.03305385, -0.03785969, -0.005721982, -0.17628951, 0.17456205, 0.094468206, 0.08226416, 0.041978676, 0.20061605, -0.07538848, 0.08345269, -0.053115606, 0.035888128, -0.18836702, 0.016957209, -0.18745539,
+        0.03982364, 0.03828289, 0.060334865, 0.1499571, 0.11879443, -0.17922942, -0.1054576, 0.049378652, 0.123892345, -0.06097537, 0.09768119, -0.18096076, -0.059876982, -0.03121799, -0.13851038, -0.11336669,
+        0.055985127, -0.04400846, 0.12772828, 0.1565197, 0.18410617, -0.05168137, 0.0018952499, -0.12244187, 0.0059304703, -0.1712413, 0.10995573, -0.09890345, -0.039128613, 0.1867336, -0.1966814, 0.103503406,
+        -0.06584129, -0.12964116, -0.02305232, -0.18484591, -0.071597904, -0.1857573, -0.21660765, -0.11496531, 0.22722578, -0.12726346, 0.003262183, 0.16941631, 0.19664739, 0.018242113, -0.007261074, 0.190844,
+        -0.19585723, 0.122113146, 0.2230544, 0.010338872, 0.01898436, -0.19443862, -0.13674581, -0.017436301, -0.16736533, -0.0020328125, -0.020061836, 0.036182776, 0.07944864, 0.20798402, 0.030974684, -0.01274472,
+        0.013274153, 0.06939587, -0.10244156, -0.17415117, -0.06966662, 0.016232917, -0.18795583, 0.03208723, -0.06771294, 0.13990457, 0.10071365, 0.16470243, 0.03431204, -0.20879368, 0.02245026, -0.034315743,
+    },
+    b = {
+        0.0, -0.006042042, 0.01126922, 0.008917379, -0.0028057853, -0.005052719, -0.008223863, 0.0043479186, 0.0054972903, 0.010113502, 0.011596895, 0.008743172, 0.0037626333, -0.003416747, 0.009462064, 0.00062623183,
+        0.010720646, 0.012494368, 0.002804747, -0.00271429, 0.008209326, 0.016178466, 0.004115608, 0.011675972, 0.00057927315, -0.0072396523, 0.006807053, 0.004389083, 0.0035419255, 0.011077843, 0.011293517, -0.0032564255,
+        0.026133535, -0.0056483876, -0.0059184562, 0.011198874, -0.003198104, 0.0066917115, 0.0030238887, 0.002590037, 0.0223441, -0.0032741341, 0.011983026, 0.00856805, -0.0035551363, 0.005701115, 0.0144639835, 0.009762163,
+        -0.0108546885, 0.01860501, 0.011905108, 0.009177635, 0.00033869053, 0.014067069, -0.0022676724, 0.012053447, 0.007640187, 0.0043334286, -0.009738385, -0.0015836213, 0.005220878, 0.013181527, 0.011855587, 0.0037554565,
+        0.01605655, 0.014028525, 0.0021190592, 0.017018383, -0.010673758, 0.0037967523, 0.006866699, 0.0018821782, -0.013491007, 0.01071677, 0.004553552, 0.011713269, 0.014277074, -0.0025304614, -0.007239753, 0.0107671395,
+        -0.004728053, -0.0018866305, 0.01709808, 0.002185648, 0.0067441952, 0.0073540765, 0.008164173, -0.0063449503, 0.015199285, -0.0085872775, 0.014894019, 0.011849422, 0.011059803, 0.011177695, 0.006995506, 0.0009210519,
+        0.0021861868, 0.0074160006, -0.013288861, -0.015791703, 0.0067922845, 0.0021691485, -0.0020378483, 0.015138274, -0.008212537, -0.012419056, 0.01992254, -0.003845641, 0.004810995, -0.010132855, 0.008041865, -0.011133888,
+        0.011170792, 0.005924702, -0.0059606684, 0.00039964283, 0.0023914448, -0.011663902, 0.0072700963, 0.005718095, 0.00680563, -0.007752656, 0.010700434, 0.0, -0.010275116, 0.026115637, 0.009417905, -0.01220589,
+    },
+}
 
-local json = [=[{"state_dim":11,"num_actions":5,"layers":[{"W":[[-0.17831577360630035,0.09382528811693192,0.02738213539123535,0.1347169578075409,0.1355978101491928,-0.006045940797775984,-0.14397329092025757,-0.03936902806162834,-0.00421519298106432,-0.1155364140868187,-0.0698576271533966],[0.16415806114673615,-0.011773361824452877,0.043340519070625305,-0.06724022328853607,0.12621791660785675,-0.059807755053043365,-0.0373435840010643,0.05404803156852722,0.1107250228524208,-0.0265648253262043,-0.20648515224456787],[-0.04857749491930008,0.015047740191221237,0.13714075088500977,0.19395528733730316,-0.015480104833841324,-0.16914811730384827,0.1400235891342163,-0.07795801013708115,0.04283948987722397,0.05224466323852539,0.021349947899580002],[0.008953171782195568,0.13642336428165436,-0.10274191200733185,0.051426153630018234,0.074421726167202,0.11443417519330978,0.12982039153575897,-0.11127512902021408,0.18433883786201477,-0.0335795059800148,0.14137692749500275],[-0.2046242505311966,0.058768197894096375,0.17136992514133453,0.19477863609790802,-0.02403610199689865,0.031232908368110657,0.007982159033417702,-0.19842173159122467,-0.10229094326496124,-0.032858360558748245,0.06611599773168564],[-0.07215805351734161,-0.041781947016716,-0.11867949366569519,-0.1892295777797699,0.16843990981578827,0.1392221599817276,0.104282908141613,-0.07637947052717209,0.14249928295612335,0.20150130987167358,0.10823945701122284],[0.007096788380295038,-0.13263870775699615,-0.10369567573070526,-0.19543415307998657,-0.09955650568008423,-0.16452428698539734,-0.05598929151892662,0.02241542376577854,-0.2007593810558319,-0.005787065252661705,0.03823477774858475],[-0.12070886790752411,-0.1645064353942871,-0.09547918289899826,0.09521404653787613,0.025061002001166344,0.0751744881272316,0.05738301947712898,-0.09601472318172455,-0.09490779787302017,-0.08258680254220963,0.20586612820625305],[-0.04706408828496933,0.03755135089159012,-0.030326616019010544,0.060490336269140244,0.030396204441785812,0.19561798870563507,0.07495258003473282,0.04499306157231331,-0.03887797147035599,0.07698912173509598,-0.030744075775146484],[-0.04994678124785423,-0.1372579038143158,0.04368530213832855,-0.10437697917222977,0.07186098396778107,0.07759327441453934,-0.005237147677689791,-0.025477055460214615,-0.02898733876645565,0.1764208972454071,0.004686253610998392],[0.03636625409126282,0.08217199891805649,0.07152371853590012,0.14221730828285217,-0.16859307885169983,-0.1282990574836731,0.17799262702465057,-0.1503552943468094,-0.1301220804452896,-0.004113480448722839,0.17710641026496887],[-0.12784624099731445,0.10982101410627365,-0.2169995903968811,-0.09350984543561935,-0.09135295450687408,0.20748089253902435,0.07921147346496582,-0.11599043011665344,0.0781094878911972,-0.045946087688207626,-0.01456434652209282],[0.06130323186516762,0.023696018382906914,-0.20092304050922394,-0.025674931704998016,0.20308034121990204,0.12655098736286163,-0.006526621524244547,-0.1803504228591919,-0.09790608286857605,-0.019355151802301407,0.19605353474617004],[0.06650832295417786,-0.0843060091137886,0.03814390301704407,0.18790903687477112,-0.010841410607099533,-0.003912301734089851,-0.08160805702209473,0.08203718066215515,-0.08629488945007324,0.07612945884466171,-0.12646576762199402],[0.05595662444829941,-0.13882827758789062,0.1870986521244049,-0.1914367973804474,-0.16952617466449738,-0.028904970735311508,0.12934933602809906,0.15772320330142975,0.02454287000000477,-0.17386212944984436,0.19734911620616913],[0.030118612572550774,0.17194998264312744,0.08611281216144562,-0.20176474750041962,0.12971167266368866,0.05368364229798317,-0.19187143445014954,0.04479905590415001,0.03287997096776962,0.20689387619495392,-0.20037004351615906],[-0.1005612313747406,-0.010468512773513794,0.09037796407938004,-0.008660131134092808,-0.12341516464948654,-0.11097370088100433,-0.06535519659519196,0.07312194257974625,0.17753569781780243,-0.19626525044441223,0.03905723989009857],[0.1514902263879776,0.012016533873975277,0.1883658617734909,-0.1471336930990219,0.11813172698020935,-0.02692258544266224,0.08643203228712082,0.038177117705345154,-0.048128850758075714,0.06179743632674217,-0.18188966810703278],[-0.03077380545437336,0.19389447569847107,0.04427538439631462,-0.12140113860368729,-0.05385248363018036,0.0920022651553154,-0.12795692682266235,-0.15852031111717224,-0.036836888641119,0.13520121574401855,0.16251476109027863],[0.0639609843492508,-0.09063111990690231,0.09068165719509125,0.0899394080042839,0.10786141455173492,0.028254710137844086,0.15916094183921814,0.17770297825336456,0.075697161257267,-0.11507026851177216,-0.04058245196938515],[0.19122211635112762,0.0445716455578804,0.1970972865819931,0.010360204614698887,-0.09617049992084503,-0.1591998189687729,0.08913557976484299,-0.06506168842315674,0.08060099184513092,0.16394364833831787,0.18190127611160278],[0.20026282966136932,0.05386538431048393,0.16794820129871368,-0.09891857206821442,-0.2093953639268875,-0.0450873002409935,0.042542099952697754,-0.0559525191783905,0.16914036870002747,0.1753159761428833,-0.14579853415489197],[0.10219086706638336,-0.20408691465854645,-0.1479748636484146,-0.1907641887664795,0.19201922416687012,0.015871724113821983,0.19225068390369415,-0.037061601877212524,-0.07249417155981064,0.19546236097812653,-0.10970836132764816],[0.0620073638856411,-0.1014927476644516,-0.05776854231953621,-0.1873440146446228,-0.04221513494849205,-0.0727570652961731,-0.05862884595990181,0.1845199167728424,-0.01931406557559967,0.01063049677759409,0.16435359418392181],[0.09348887950181961,-0.08773675560951233,0.1625164896249771,-0.12502309679985046,-0.08944649249315262,0.09104208648204803,-0.1364041566848755,-0.09870225191116333,-0.1944989114999771,0.028857890516519547,0.034674543887376785],[0.11585386842489243,-0.04093126207590103,-0.1656484603881836,0.1372121125459671,-0.1557820737361908,-0.15584813058376312,0.007234237622469664,-0.12044940143823624,0.15892501175403595,0.05322209745645523,0.1625339537858963],[-0.156066432595253,0.01391817256808281,-0.03217035531997681,-0.012979567050933838,0.2254772037267685,0.053133755922317505,-0.0006868591881357133,0.13925603032112122,0.09207808971405029,-0.17535430192947388,-0.18139271438121796],[-0.1995105892419815,-0.05647272616624832,0.13686662912368774,-0.1694934368133545,0.15828242897987366,0.1804388463497162,0.004290525335818529,0.04111476615071297,0.15407709777355194,-0.18435391783714294,-0.03319834545254707],[-0.04268887639045715,0.08406805247068405,-0.19261394441127777,-0.0975252017378807,0.031446609646081924,0.08726321160793304,0.1525665521621704,0.1906488686800003,-0.0018442863365635276,-0.06955543905496597,-0.10217155516147614],[0.11417067050933838,0.1965656280517578,-0.08140414953231812,0.1837531477212906,-0.19275373220443726,-0.04042689502239227,-0.1539512723684311,0.16142913699150085,0.03008851781487465,-0.04233988747000694,-0.08818184584379196],[0.16040223836898804,-0.011620371602475643,0.17784488201141357,0.010940023697912693,0.09365994483232498,0.021392211318016052,-0.13037313520908356,0.03135807067155838,0.002480322029441595,0.21534398198127747,0.03304211050271988],[-0.07283278554677963,-0.02607184275984764,-0.015304742380976677,-0.026578716933727264,-0.13937315344810486,-0.11345513164997101,0.131020650267601,0.07497873157262802,-0.04184500128030777,-0.04412209615111351,-0.1279517114162445],[0.001655201893299818,-0.1451118141412735,0.12410923093557358,0.06885595619678497,-0.19563183188438416,0.018780510872602463,0.02919689193367958,-0.1664229929447174,-0.15428823232650757,-0.15028883516788483,0.1664932370185852],[0.20069479942321777,0.1852332353591919,-0.055594101548194885,0.026859033852815628,-0.036868516355752945,0.09881864488124847,0.08560557663440704,-0.19353987276554108,-0.08879727870225906,0.05480063706636429,-0.10762324929237366],[-0.1357896775007248,-0.04531470686197281,-0.06494580954313278,0.17872832715511322,-0.06843293458223343,-0.00042561496957205236,0.1952521651983261,0.16180458664894104,-0.11405480653047562,-0.11383680999279022,-0.18384906649589539],[-0.10471457988023758,-0.14309023320674896,0.05194023624062538,-0.14710141718387604,-0.022764308378100395,0.19396919012069702,-0.10558765381574631,0.1703759729862213,0.17762674391269684,0.024374159052968025,0.12770578265190125],[0.1776612550020218,-0.06829540431499481,-0.14697514474391937,0.00970778614282608,-0.060669440776109695,0.045247454196214676,0.028240229934453964,-0.10737692564725876,0.18887099623680115,-0.07364606112241745,-0.1431853324174881],[-0.07896555960178375,0.014217434450984001,-0.13936713337898254,0.20051787793636322,-0.019971968606114388,-0.04477774724364281,0.18173077702522278,0.16117630898952484,-0.19726456701755524,0.11964382976293564,0.044695496559143066],[0.027668753638863564,-0.07483530789613724,0.1464373767375946,-0.1909131109714508,0.08544837683439255,0.13804495334625244,-0.20767344534397125,-0.19697065651416779,0.0359017513692379,0.027737494558095932,-0.1511523723602295],[-0.06366464495658875,0.16528740525245667,0.16457125544548035,0.08626752346754074,0.0023483727127313614,0.19101330637931824,-0.1136307641863823,0.15289150178432465,0.1730402410030365,0.01920210011303425,0.16495844721794128],[0.1954823136329651,-0.1147022694349289,-0.06419721245765686,0.06468941271305084,-0.09867466986179352,-0.07738526910543442,0.07302805036306381,-0.08437330275774002,-0.19545136392116547,0.09638947248458862,0.08116403967142105],[-0.005216651596128941,-0.1869882196187973,-0.0646672248840332,-0.0708598792552948,0.008466161787509918,0.1870398372411728,0.01951374113559723,-0.06189492344856262,0.1721339374780655,0.11565607041120529,0.1795516312122345],[-0.06640163064002991,-0.10940475761890411,-0.10195095092058182,-0.20218831300735474,-0.0949639305472374,-0.0548190139234066,-0.08435237407684326,-0.023887023329734802,0.11093731224536896,0.08160283416509628,0.07195505499839783],[-0.12823732197284698,0.14637595415115356,-0.10610374808311462,0.1823958307504654,0.1557646095752716,0.19679228961467743,0.09187034517526627,0.024782409891486168,0.022570934146642685,0.09602219611406326,-0.019665177911520004],[-0.19823236763477325,0.05018971115350723,-0.17808939516544342,0.19404272735118866,0.07000815868377686,-0.1498253494501114,0.06720425933599472,-0.1905062347650528,0.1382371336221695,0.10747885704040527,-0.02795911207795143],[0.16960963606834412,-0.13357558846473694,-0.1859816461801529,0.06252516061067581,-0.0429731048643589,0.12215829640626907,0.14721918106079102,-0.01866663433611393,-0.1495623141527176,0.15565769374370575,-0.1442049741744995],[-0.15519320964813232,-0.0744471624493599,0.03056209348142147,-0.0954146757721901,0.19678552448749542,-0.09289883822202682,-0.08304637670516968,0.05794525519013405,0.011420310474932194,0.17764508724212646,-0.040127232670784],[-0.023048747330904007,0.124283567070961,-0.042039286345243454,-0.020953388884663582,0.007453713100403547,0.024198217317461967,0.021826960146427155,0.038026999682188034,0.16772225499153137,0.11964977532625198,0.02459660917520523],[0.15168894827365875,0.10877460986375809,0.027763063088059425,0.1551738977432251,0.14046572148799896,0.1884377896785736,0.045865967869758606,0.16782136261463165,-0.018611794337630272,0.03074086643755436,0.12793999910354614],[0.21182569861412048,0.16996192932128906,0.21334107220172882,-0.051614195108413696,0.1470755785703659,0.20282673835754395,-0.09214881807565689,0.0813676118850708,0.12835969030857086,0.19603286683559418,0.19265593588352203],[-0.06702444702386856,0.03612654656171799,-0.10526448488235474,-0.04897793382406235,0.031830765306949615,-0.16208545863628387,0.011990515515208244,0.1869078129529953,0.08800341188907623,0.153812438249588,0.14239729940891266],[0.20057512819766998,0.16012054681777954,-0.15270940959453583,-0.005992859601974487,-0.054604481905698776,0.20974330604076385,-0.14874425530433655,-0.016514413058757782,0.17869418859481812,-0.09111940115690231,-0.03790229558944702],[0.14566442370414734,0.027822786942124367,-0.20027843117713928,-0.02312351204454899,-0.18879258632659912,0.06969232857227325,0.03767799958586693,0.003891091328114271,0.08679232001304626,0.1626565307378769,0.0747273713350296],[0.06805112957954407,0.15864692628383636,0.19162236154079437,0.20813433825969696,0.13723058998584747,0.040309809148311615,0.1262272596359253,-0.044197726994752884,-0.11128633469343185,0.10804974287748337,-0.15797923505306244],[0.13869708776474,-0.0764421820640564,-0.10744544118642807,-0.08808772265911102,-0.008044020272791386,-0.1355954259634018,-0.16454529762268066,-0.10124871134757996,-0.1447027623653412,-0.09360937774181366,-0.14448018372058868],[0.1178535670042038,-0.11583305895328522,-0.05648542195558548,0.1469181478023529,0.21878090500831604,-0.0034705759026110172,0.14103688299655914,-0.08120894432067871,-0.15082138776779175,-0.16673284769058228,-0.08328038454055786],[-0.0067203463986516,0.14056111872196198,-0.0453125536441803,-0.028433747589588165,-0.06876479089260101,-0.05281979218125343,-0.12315840274095535,-0.08946486562490463,-0.03543296083807945,0.16382253170013428,0.12503419816493988],[0.0648856833577156,0.05647525563836098,0.09889312833547592,-0.08724457025527954,0.09070353209972382,0.15750117599964142,0.16296187043190002,0.03153804689645767,0.10065847635269165,0.07691601663827896,0.1566561907529831],[0.10144489258527756,-0.18350112438201904,0.11794383078813553,-0.08623597025871277,-0.162880077958107,0.11643282324075699,0.04359564930200577,-0.061189550906419754,0.13639898598194122,0.010983232408761978,-0.17484600841999054],[-0.10417264699935913,0.0618034265935421,0.16933143138885498,0.18147128820419312,-0.05962623283267021,-0.062345221638679504,-0.09279663115739822,0.027553506195545197,0.18875804543495178,0.02414828911423683,0.069974385201931],[0.10377243906259537,-0.10907986760139465,-0.15468180179595947,0.15245242416858673,-0.027145154774188995,0.03424158692359924,-0.1354411393404007,0.10131102800369263,-0.12438204139471054,-0.0888928472995758,0.1318703591823578],[0.04319468513131142,0.20743976533412933,0.028120292350649834,-0.04126327484846115,0.03343629464507103,0.1303943544626236,-0.1403048187494278,0.17711052298545837,0.15706804394721985,0.18138384819030762,-0.01950868032872677],[-0.15409651398658752,0.02152513526380062,0.14357492327690125,-0.00986262783408165,-0.0373062863945961,-0.07709965109825134,0.06595031917095184,-0.04495441913604736,-0.05834690481424332,-0.18210284411907196,0.21537351608276367],[0.012693795375525951,-0.08834625780582428,0.18743135035037994,-0.023577328771352768,0.02133961208164692,0.08369284868240356,-0.18938009440898895,-0.11593499779701233,-0.06176124885678291,0.2048206925392151,-0.04231467470526695],[-0.010562987066805363,0.11715614795684814,0.009241108782589436,-1.9503762814565562e-05,-0.18747876584529877,-0.07312911003828049,-0.006612828001379967,-0.12477570027112961,0.19746996462345123,0.06726308166980743,-0.07161704450845718],[-0.028202345594763756,-0.163859561085701,0.18436680734157562,-0.13800925016403198,-0.016391262412071228,0.1577524095773697,-0.13871988654136658,-0.12787799537181854,0.04638132080435753,-0.07814941555261612,0.06891630589962006],[-0.12912201881408691,0.028663991019129753,0.0768623873591423,-0.1061059981584549,-0.18285341560840607,-0.04677724465727806,0.0606127493083477,-0.010998181067407131,0.15894381701946259,-0.021866964176297188,0.07037124037742615],[0.07912495732307434,-0.03379868343472481,0.16332697868347168,0.05325327068567276,0.16451376676559448,-0.04790287837386131,0.15658670663833618,0.12053977698087692,-0.036247339099645615,-0.06134091690182686,0.072524793446064],[0.0015431407373398542,-0.03660626336932182,0.10465716570615768,-0.099594347178936,-0.211338609457016,0.08008886128664017,0.18212993443012238,-0.12337148934602737,0.09797747433185577,0.1751800924539566,0.01498632226139307],[0.1746600866317749,0.07038605213165283,-0.07123932242393494,0.1923649162054062,0.1497597098350525,0.01774180494248867,-0.08035661280155182,0.06862659752368927,-0.19427600502967834,-0.008963577449321747,0.18629787862300873],[-0.1131339892745018,-0.09079837799072266,0.12435012310743332,0.05039365217089653,0.18706609308719635,-0.00866448413580656,0.004970051348209381,0.03618653118610382,0.10884826630353928,0.1026187315583229,0.043699439615011215],[-0.1595408320426941,-0.09270699322223663,-0.1673344075679779,0.10322588682174683,-0.008944057859480381,-0.044397834688425064,0.20376892387866974,0.18041875958442688,-0.12571358680725098,0.06527794897556305,0.18229825794696808],[-0.19824394583702087,-0.02260529063642025,-0.18450278043746948,0.12060574442148209,-0.09471005201339722,-0.10876226425170898,0.046879611909389496,0.06028291583061218,-0.045252956449985504,-0.17503966391086578,-0.07351423054933548],[0.06321949511766434,-0.023007594048976898,0.12000899016857147,-0.04531305655837059,0.0819847583770752,-0.13685831427574158,-0.1265554279088974,0.1615067571401596,-0.05143779516220093,-0.023724112659692764,0.0909249559044838],[-0.012555199675261974,-0.18567973375320435,-0.06517473608255386,0.001978558488190174,0.1315024346113205,0.1269889920949936,0.19497905671596527,-0.14365804195404053,-0.03684094920754433,0.12184131890535355,-0.0961008295416832],[-0.0093203354626894,0.15960581600666046,-0.01404514815658331,0.12354081869125366,-0.005069911479949951,0.10386647284030914,0.0279679112136364,0.14477285742759705,0.04450254887342453,-0.11324065923690796,0.0200156532227993],[0.05045982450246811,-0.035180576145648956,-0.09737099707126617,-0.13176001608371735,-0.21637874841690063,-0.004564737901091576,0.07262168079614639,0.20568202435970306,0.08370137214660645,-0.07268321514129639,-0.10706248134374619],[0.014573640190064907,0.0590248703956604,0.028992004692554474,0.002782002789899707,0.03489287197589874,0.0727156549692154,-0.01283209677785635,-0.0659368708729744,0.04135170578956604,-0.10429695248603821,0.036382727324962616],[-0.020937351509928703,-0.03786434605717659,-0.00717345904558897,0.1485726684331894,-0.005948346108198166,-0.08180322498083115,-0.02604379691183567,-0.1968933790922165,0.1736970990896225,-0.045848336070775986,6.984647188801318e-05],[0.18354707956314087,0.1025780737400055,0.1725541353225708,-0.11917110532522202,-0.15722303092479706,-0.20908933877944946,0.20286183059215546,0.19354768097400665,0.11503209918737411,0.17104223370552063,0.07089535892009735],[0.07444524765014648,0.1795843094587326,-0.033003732562065125,0.03676579147577286,0.05448189750313759,0.06361200660467148,-0.08502283692359924,-0.08856114000082016,-0.14736486971378326,0.18008843064308167,-0.029708027839660645],[0.028278881683945656,0.011922604404389858,-0.14004459977149963,-0.2010265290737152,-0.008763225749135017,-0.08738679438829422,0.2049078494310379,-0.14562872052192688,-0.036437273025512695,-0.14896143972873688,0.0018002708675339818],[-0.1650838553905487,0.09216824918985367,-0.09085230529308319,0.01823805458843708,0.13963520526885986,-0.08858957141637802,0.07140528410673141,-0.09627708047628403,0.20728398859500885,-0.18716715276241302,0.1600380390882492],[-0.083861343562603,-0.12352204322814941,-0.174446702003479,-0.18688519299030304,-0.04784342274069786,-0.08489921689033508,0.12273693084716797,-0.13136346638202667,0.21081401407718658,-0.08199388533830643,-0.05708375573158264],[0.009293889626860619,0.04640433192253113,-0.14740270376205444,-0.09394752234220505,0.10801589488983154,0.08011943101882935,-0.11107629537582397,-0.043608225882053375,-0.18538682162761688,0.06842603534460068,0.07282208651304245],[-0.043664101511240005,0.10457583516836166,-0.09928205609321594,-0.04073536396026611,0.19185678660869598,0.15205439925193787,0.20124396681785583,-0.16394014656543732,0.16235604882240295,0.041601140052080154,0.14757855236530304],[0.08976742625236511,-0.16419337689876556,0.05791785940527916,0.18165399134159088,0.1253805309534073,-0.17804788053035736,-0.005074247717857361,-0.12346350401639938,0.0009314710623584688,-0.1489783525466919,-0.19377385079860687],[-0.18101927638053894,0.1961756944656372,0.08022337406873703,-0.10916586965322495,0.14094559848308563,0.08967484533786774,0.12204587459564209,0.16804169118404388,-0.15270867943763733,0.16352908313274384,-0.031012937426567078],[-0.0038483310490846634,-0.15679341554641724,-0.17165741324424744,-0.03236576169729233,-0.1879204362630844,-0.16572333872318268,-0.15734323859214783,0.11341620236635208,-0.11323347687721252,0.1195552721619606,0.12924088537693024],[0.16170619428157806,-0.05224675312638283,-0.058763060718774796,0.11927749961614609,0.03555310517549515,0.084380604326725,-0.0636306032538414,-0.19382213056087494,-0.21210114657878876,-0.06280624121427536,-0.15350572764873505],[-0.05576768144965172,0.09303195774555206,-0.06888111680746078,0.10165085643529892,-0.1655423790216446,0.1512300819158554,-0.12273640930652618,-0.11281599849462509,0.17637348175048828,-0.12608864903450012,0.05107799917459488],[0.13804174959659576,-0.1204385906457901,0.1851472556591034,0.09769847244024277,-0.15047837793827057,-0.04586023464798927,0.06634216755628586,0.11925573647022247,-0.13148176670074463,-0.1626131534576416,0.17118269205093384],[0.025075696408748627,0.14455735683441162,0.10222798585891724,0.08315789699554443,-0.1019386276602745,-0.03817129507660866,0.10151629149913788,0.0656382292509079,-0.18161603808403015,0.09335588663816452,0.20477920770645142],[0.1714586466550827,-0.04150596633553505,0.18140307068824768,0.09952989965677261,-0.13601458072662354,0.1824357956647873,0.09699279069900513,-0.04590068385004997,0.11120002716779709,-0.05253055319190025,-0.15414200723171234],[-0.10276803374290466,-0.1571846455335617,-0.044211141765117645,0.1668197214603424,-0.17287284135818481,-0.13393086194992065,-0.09089427441358566,-0.1906573474407196,-0.18091227114200592,-0.1922122985124588,-0.049203645437955856],[0.1834869086742401,-0.10757586359977722,0.14738036692142487,0.13010713458061218,0.1820085346698761,-0.007318395189940929,-0.061999332159757614,-0.19263574481010437,-0.04470653459429741,-0.19184517860412598,0.02287956513464451],[-0.024538539350032806,-0.17632070183753967,-0.058430224657058716,0.10318601876497269,0.20759418606758118,-0.15126784145832062,0.05846816673874855,0.12990693747997284,0.15507622063159943,0.20399753749370575,-0.1290339231491089],[0.11908912658691406,-0.12158282101154327,0.15873298048973083,0.1676340252161026,-0.21357285976409912,0.07415024936199188,-0.002209503436461091,0.1071387231349945,-0.02335454523563385,-0.10295680165290833,0.09468905627727509],[0.012112125754356384,-0.17654910683631897,-0.16014066338539124,0.05071563646197319,0.0837409645318985,-0.08334895968437195,0.19287116825580597,-0.12404409795999527,0.164525106549263,0.0677303746342659,-0.13052858412265778],[0.10642720758914948,-0.022919699549674988,0.12931136786937714,-0.17622599005699158,0.12267399579286575,0.06286691129207611,-0.1488737314939499,-0.20112475752830505,-0.07502992451190948,0.18679781258106232,-0.051161255687475204],[-0.051433440297842026,-0.14962291717529297,-0.1810418665409088,-0.11318358778953552,-0.03269108757376671,0.11934396624565125,-0.0834042876958847,0.12218433618545532,-0.04289494827389717,-0.16614185273647308,-0.120862677693367],[-0.19267679750919342,-0.2043142467737198,-0.09013835340738297,0.17268003523349762,0.14297832548618317,0.005017830524593592,0.048511356115341187,-0.1903439611196518,0.16607284545898438,0.05912686511874199,0.038549404591321945],[-0.08961891382932663,0.053694598376750946,0.07688668370246887,-0.04392207786440849,-0.16920779645442963,-0.054970916360616684,-0.14677076041698456,0.07278219610452652,-0.179709330201149,-0.021288884803652763,-0.19801154732704163],[-0.08240485936403275,-0.07796575129032135,0.06292904913425446,-0.06028776615858078,-0.055583979934453964,0.09809078276157379,0.07345344871282578,0.1876593828201294,0.03753521293401718,0.21631650626659393,0.1079837754368782],[0.02672233246266842,-0.18922556936740875,-0.09285172075033188,0.15891627967357635,0.19627554714679718,-0.11273085325956345,0.10654429346323013,0.06032039225101471,-0.1551499366760254,0.15972448885440826,-0.055931493639945984],[0.16097727417945862,-0.12117739021778107,-0.06684494763612747,-0.11976411938667297,-0.08966312557458878,0.1262357532978058,-0.16807468235492706,0.14719335734844208,0.19387461245059967,-0.17862677574157715,0.18604087829589844],[0.203978031873703,-0.13049007952213287,-0.023633675649762154,-0.10013822466135025,-0.17401526868343353,0.09139863401651382,-0.16094467043876648,-0.02174590714275837,-0.16170935332775116,0.10270033776760101,0.08152690529823303],[0.11073622852563858,0.08478236943483353,-0.15313319861888885,0.14193028211593628,-0.10658711194992065,0.19151249527931213,0.0842418223619461,-0.005786378867924213,-0.20140700042247772,-0.11142699420452118,-0.11838417500257492],[-0.11230000108480453,0.13079997897148132,-0.20656676590442657,0.06537897139787674,-0.1311158388853073,-0.13165801763534546,-0.11105255782604218,-0.16071389615535736,-0.1424953043460846,0.16656999289989471,-0.09771829843521118],[0.17854060232639313,-0.12445762008428574,-0.19235235452651978,0.07487612217664719,0.035558272153139114,0.1547084003686905,-0.045330364257097244,-0.03666957467794418,0.009640469215810299,-0.1752392202615738,0.020899806171655655],[0.11379817128181458,0.09321490675210953,-0.005274501163512468,0.09904776513576508,-0.12570488452911377,0.15238210558891296,0.09095745533704758,0.1040010079741478,-0.007233426906168461,0.1975402683019638,-0.15340539813041687],[0.1339278668165207,0.19716735184192657,0.013254082761704922,-0.12175501883029938,-0.20354019105434418,0.11203228682279587,-0.11693403869867325,-0.0532262921333313,0.06773789972066879,0.044390637427568436,-0.17446595430374146],[-0.19603902101516724,-0.19510121643543243,-0.05416189134120941,0.16003300249576569,0.06986309587955475,-0.14642150700092316,0.08879650384187698,-0.17895229160785675,0.022534223273396492,0.17741715908050537,-0.18180043995380402],[-0.122800312936306,0.010339898988604546,0.02817697450518608,0.19782200455665588,-0.013516345992684364,0.05767158418893814,-0.1396145075559616,-0.10462287068367004,-0.19205842912197113,-0.07742220163345337,-0.12010414898395538],[0.026446541771292686,0.16798841953277588,0.07870595902204514,-0.1456974595785141,-0.0646665096282959,0.1234097108244896,0.09508969634771347,-0.14141203463077545,0.005797586403787136,0.055787865072488785,-0.1451931744813919],[-0.08519577234983444,-0.1827031821012497,-0.13312064111232758,0.1061258614063263,0.1510961651802063,-0.18138763308525085,-0.08393585681915283,0.005286115687340498,0.1669599413871765,0.17947785556316376,-0.14663541316986084],[-0.10018070042133331,-0.1869787722826004,-0.049282871186733246,-0.12096364051103592,0.03143350034952164,-0.03316164016723633,0.1827649623155594,0.01410114299505949,-0.16280941665172577,0.19162937998771667,-0.11518602073192596],[-0.024671543389558792,-0.08041965961456299,-0.00898983608931303,-0.020183032378554344,-0.014799854718148708,0.15376506745815277,0.18341416120529175,0.016894515603780746,-0.10819324851036072,-0.08747997134923935,-0.18094225227832794],[0.1073724627494812,-0.20445401966571808,0.11851943284273148,-0.08768390119075775,-0.1849919557571411,-0.19773665070533752,-0.07589876651763916,0.15181362628936768,-0.08379095792770386,-0.006552472710609436,-0.054138001054525375],[-0.11566979438066483,0.007698430214077234,-0.016856679692864418,0.03305384889245033,-0.03785968944430351,-0.005721982102841139,-0.17628951370716095,0.17456205189228058,0.09446820616722107,0.08226416260004044,0.04197867587208748],[0.2006160467863083,-0.07538848370313644,0.08345268666744232,-0.0531156063079834,0.035888127982616425,-0.18836702406406403,0.016957208514213562,-0.18745538592338562,0.03982364013791084,0.03828288987278938,0.060334865003824234],[0.1499571055173874,0.11879442632198334,-0.17922942340373993,-0.1054575964808464,0.049378652125597,0.12389234453439713,-0.060975369065999985,0.0976811870932579,-0.1809607595205307,-0.05987698212265968,-0.031217990443110466],[-0.13851037621498108,-0.11336669325828552,0.05598512664437294,-0.04400845989584923,0.12772828340530396,0.15651969611644745,0.18410617113113403,-0.05168136954307556,0.0018952499376609921,-0.12244187295436859,0.005930470302700996],[-0.17124129831790924,0.10995572805404663,-0.09890344738960266,-0.039128612726926804,0.18673360347747803,-0.19668139517307281,0.10350340604782104,-0.06584128737449646,-0.12964116036891937,-0.023052319884300232,-0.1848459094762802],[-0.07159790396690369,-0.18575729429721832,-0.21660764515399933,-0.11496531218290329,0.22722578048706055,-0.12726345658302307,0.003262182930484414,0.16941630840301514,0.19664739072322845,0.018242113292217255,-0.007261074148118496],[0.19084399938583374,-0.1958572268486023,0.12211314588785172,0.22305439412593842,0.010338871739804745,0.018984360620379448,-0.1944386214017868,-0.13674581050872803,-0.017436301335692406,-0.16736532747745514,-0.002032812451943755],[-0.020061835646629333,0.03618277609348297,0.0794486403465271,0.20798401534557343,0.03097468428313732,-0.012744720093905926,0.013274152763187885,0.06939586997032166,-0.10244155675172806,-0.17415116727352142,-0.06966661661863327],[0.016232917085289955,-0.1879558265209198,0.03208722919225693,-0.0677129402756691,0.13990457355976105,0.10071364790201187,0.1647024303674698,0.034312039613723755,-0.20879368484020233,0.022450260818004608,-0.034315742552280426]],"b":[0.0,-0.006042041815817356,0.011269220151007175,0.008917379193007946,-0.0028057852759957314,-0.005052718799561262,-0.008223863318562508,0.004347918555140495,0.005497290287166834,0.01011350192129612,0.011596894823014736,0.008743171580135822,0.0037626333069056273,-0.003416747087612748,0.009462064132094383,0.0006262318347580731,0.010720646008849144,0.01249436754733324,0.0028047470841556787,-0.002714290050789714,0.008209326304495335,0.016178466379642487,0.004115608055144548,0.011675971560180187,0.0005792731535620987,-0.007239652331918478,0.006807052996009588,0.0043890830129384995,0.0035419254563748837,0.01107784267514944,0.011293517425656319,-0.003256425494328141,0.02613353542983532,-0.005648387596011162,-0.005918456241488457,0.01119887363165617,-0.003198103979229927,0.006691711489111185,0.0030238886829465628,0.002590036951005459,0.02234409935772419,-0.0032741341274231672,0.011983025819063187,0.008568050339818,-0.003555136267095804,0.005701114889234304,0.014463983476161957,0.009762163273990154,-0.010854688473045826,0.018605010583996773,0.011905107647180557,0.009177635423839092,0.00033869053004309535,0.014067068696022034,-0.002267672447487712,0.012053446844220161,0.0076401871629059315,0.00433342857286334,-0.009738384746015072,-0.0015836212551221251,0.005220877937972546,0.013181527145206928,0.011855587363243103,0.0037554565351456404,0.016056550666689873,0.014028524979948997,0.002119059208780527,0.017018383368849754,-0.010673757642507553,0.0037967523094266653,0.006866699084639549,0.0018821782432496548,-0.013491006568074226,0.010716769844293594,0.004553551785647869,0.011713269166648388,0.014277073554694653,-0.002530461410060525,-0.0072397529147565365,0.010767139494419098,-0.004728053230792284,-0.001886630547232926,0.0170980803668499,0.002185648074373603,0.006744195241481066,0.007354076486080885,0.008164172992110252,-0.006344950292259455,0.015199285000562668,-0.008587277494370937,0.01489401888102293,0.011849422007799149,0.011059802956879139,0.011177695356309414,0.00699550611898303,0.0009210518910549581,0.002186186844483018,0.007416000589728355,-0.013288861140608788,-0.015791703015565872,0.006792284548282623,0.0021691485308110714,-0.0020378483459353447,0.015138274058699608,-0.008212536573410034,-0.01241905614733696,0.019922539591789246,-0.0038456409238278866,0.004810994956642389,-0.01013285480439663,0.008041865192353725,-0.011133887805044651,0.011170792393386364,0.005924702156335115,-0.005960668437182903,0.00039964282768778503,0.0023914447519928217,-0.01166390161961317,0.007270096335560083,0.005718095228075981,0.006805629935115576,-0.007752656005322933,0.010700434446334839,0.0,-0.010275116190314293,0.02611563727259636,0.009417904540896416,-0.012205890379846096]},{"W":[[0.026539381593465805,-0.05344191566109657,0.11922238767147064,0.03495313227176666,0.0428134985268116,0.026216210797429085,0.11145303398370743,-0.020284980535507202,-0.01340440846979618,0.02405388467013836,0.07813429832458496,-0.03422626107931137,0.13670387864112854,-0.12682652473449707,0.14017800986766815,0.12605832517147064,0.003574820701032877,-0.1417485773563385,0.10886634886264801,0.08610131591558456,0.032786738127470016,-0.1101519986987114,0.08790726214647293,0.14177823066711426,-0.1445222645998001,-0.018927766010165215,-0.015380870550870895,0.06154973804950714,0.05166563391685486,0.0058006360195577145,0.12925231456756592,0.019870812073349953,0.06217943876981735,0.09146469086408615,0.13161395490169525,0.009062953293323517,0.05992898344993591,-0.11002608388662338,-0.03747215121984482,-0.10872595757246017,0.025383923202753067,0.06828013062477112,0.03898878023028374,0.07273317128419876,-0.07650654017925262,0.04297780618071556,-0.11967720091342926,-0.0076898569241166115,0.11884678900241852,-0.11809062957763672,0.012459881603717804,0.035953324288129807,-0.009548473171889782,-0.010174717754125595,0.12200725823640823,0.1267431378364563,-0.027124207466840744,-0.029136870056390762,0.05990871042013168,0.055339109152555466,0.16211563348770142,-0.04838547855615616,-0.07213420420885086,0.13379769027233124,0.01679741032421589,-0.022695284336805344,-0.1002492606639862,0.06537283957004547,0.10453610122203827,0.0788758248090744,-0.04381862282752991,-0.012069770134985447,-0.09100335091352463,-0.04070831462740898,-0.14527639746665955,0.08699149638414383,-0.0779145210981369,0.0854516252875328,0.05989093333482742,-0.026387901976704597,-0.10290800034999847,0.10395628958940506,-0.11553274095058441,-0.13083358108997345,0.003089775098487735,-0.1443832665681839,0.02268129214644432,-0.09250213950872421,-0.011299742385745049,0.12090195715427399,0.08182086795568466,-0.11133310943841934,-0.008942564018070698,0.04702730104327202,0.12940198183059692,0.06140686944127083,0.04488588124513626,0.13904039561748505,0.11425291001796722,0.13367511332035065,0.08820944279432297,-0.08145099878311157,0.1355358362197876,0.11034146696329117,-0.11011797934770584,0.10715408623218536,0.14231190085411072,0.0610739029943943,0.05146279186010361,-0.017212282866239548,0.001664070296101272,-0.01686660759150982,-0.03257359191775322,0.10483328998088837,-0.0744079053401947,-0.09529201686382294,0.12107750028371811,0.03777807950973511,0.08510376513004303,0.14906907081604004,0.07710050046443939,-0.017146944999694824,0.09838428348302841,0.033881258219480515,0.10969291627407074,-0.08025237917900085,2.7841917471960187e-05,0.1357235461473465],[0.05878543108701706,-0.1324605792760849,-0.06752262264490128,0.10634779930114746,-0.06682834029197693,0.024106578901410103,0.07426989078521729,-0.14906737208366394,-0.12507513165473938,-0.053251173347234726,0.05493456497788429,0.09115144610404968,0.05466306209564209,-0.07445140928030014,0.10314948856830597,-0.14561739563941956,-0.09633533656597137,0.008743289858102798,-0.06870312988758087,0.027517233043909073,0.09905101358890533,-0.08781316876411438,0.07470498979091644,0.015209147706627846,0.14037232100963593,0.07033748179674149,0.11267909407615662,0.06677509099245071,-0.06765225529670715,-0.15076284110546112,0.03680034726858139,0.010976407676935196,-0.10890417546033859,-0.1433148980140686,-0.1063346341252327,-0.13263972103595734,0.05624931678175926,0.025588493794202805,0.06281425803899765,-0.07479595392942429,-0.04819660261273384,-0.053975995630025864,0.032955724745988846,0.0986979678273201,0.09681199491024017,-0.03169308975338936,-0.11098045855760574,-0.10045330971479416,0.023244289681315422,0.0714995488524437,0.09640878438949585,-0.07870794832706451,-0.0391952320933342,0.02545190043747425,0.13800430297851562,-0.05015306547284126,-0.048427827656269073,-0.022828474640846252,-0.07932374626398087,0.12585850059986115,0.04303549975156784,-0.1175094023346901,-0.05371195450425148,-0.06603437662124634,0.0449691042304039,-0.10621330887079239,0.14390841126441956,-0.11078042536973953,-0.10518261790275574,-0.13085706532001495,0.08227507025003433,0.14765550196170807,0.1495683640241623,0.061124470084905624,-0.08904461562633514,-0.0023069027811288834,0.1126752570271492,-0.037527166306972504,-0.03935831040143967,0.15322676301002502,0.09341752529144287,-0.0897212103009224,0.012335491366684437,0.0649348646402359,-0.07610540091991425,0.004515433683991432,-0.07944060862064362,0.1382070630788803,-0.12163389474153519,0.06971325725317001,-0.080194391310215,0.005729422904551029,-0.09323729574680328,0.06918620318174362,0.11321920901536942,0.11711176484823227,-0.1055808886885643,0.08622267097234726,-0.004810207057744265,-0.10599309206008911,-0.01636701449751854,0.12109405547380447,0.059989023953676224,-0.09828776121139526,0.029219020158052444,0.0565783865749836,-0.017398327589035034,0.025001324713230133,-0.15179724991321564,0.011062315665185452,-0.11899662017822266,0.04466087743639946,0.09337210655212402,0.14369070529937744,-0.0932081863284111,-0.14736387133598328,-0.019542304798960686,-0.060233909636735916,0.02909141406416893,0.09416761994361877,0.07663602381944656,-0.14981646835803986,0.10947337746620178,0.048236459493637085,-0.13688470423221588,-0.05977243930101395,-0.038925450295209885,-0.014727320522069931],[-0.019174763932824135,-0.016775930300354958,0.07097097486257553,0.042158037424087524,-0.1619241088628769,0.05628751963376999,0.10324302315711975,-0.07826802134513855,0.018053924664855003,-0.03748047724366188,0.07002349942922592,-0.01101748552173376,-0.057011283934116364,0.0050670551136136055,-0.004158176947385073,-0.08198490738868713,0.05199189856648445,0.006819815840572119,0.03839317336678505,0.13665978610515594,-0.05733196437358856,0.14210255444049835,0.11551856249570847,0.17271916568279266,0.11737275123596191,0.056681931018829346,-0.15892598032951355,-0.09472320973873138,-0.1322704255580902,0.1209423840045929,-0.0537818968296051,0.12765617668628693,-0.020038073882460594,-0.0490470752120018,0.11136607080698013,0.0034287634771317244,0.01573028229176998,0.12444208562374115,-0.07580375671386719,0.11013062298297882,-0.0391637422144413,0.14025917649269104,-0.0007340027950704098,0.12508414685726166,0.12698031961917877,0.04435601457953453,0.1596171259880066,-0.10931845009326935,-0.09247097373008728,-0.10127623379230499,0.08978271484375,-0.06492383778095245,-0.04661038890480995,-0.09575968980789185,-0.07525167614221573,-0.09334956854581833,0.04953572154045105,0.11421295255422592,0.10650434345006943,0.061571553349494934,0.06137274205684662,0.08880005776882172,0.10218531638383865,0.11640740185976028,-0.06790368258953094,-0.09740861505270004,-0.11355537176132202,-0.043618831783533096,-0.13432210683822632,-0.09785535931587219,-0.12657910585403442,-0.10097124427556992,0.10734347999095917,-0.01752232015132904,0.0963023379445076,-0.0008703352068550885,0.1662934124469757,0.08657695353031158,0.030813129618763924,-0.033490341156721115,-0.08193378150463104,0.024813704192638397,0.14542603492736816,-0.0766395777463913,-0.12277301400899887,-0.13665089011192322,0.11597660928964615,-0.13311585783958435,0.06517274677753448,0.011510685086250305,-0.02160538360476494,0.13643601536750793,0.1492197960615158,-0.025227386504411697,-0.15308460593223572,0.08196781575679779,0.1583908349275589,0.11157669872045517,-0.07146231085062027,0.03682351112365723,0.07086213678121567,0.1433110237121582,0.130389004945755,-0.10160859674215317,0.0011510425247251987,0.11822070926427841,-0.11623337119817734,0.029982207342982292,0.11389310657978058,-0.030763758346438408,0.018749872222542763,0.11880499869585037,-0.08138716965913773,-0.000190887221833691,-0.08725117892026901,-0.019317418336868286,-0.041610151529312134,-0.14153391122817993,-0.01480519212782383,-0.09739426523447037,0.08652225881814957,-0.14206241071224213,0.04143231362104416,0.0970657542347908,-0.13738656044006348,0.12754295766353607,0.08114226907491684,-0.004738245625048876],[-0.05482993647456169,-0.10254395008087158,0.01613500341773033,-0.13569949567317963,-0.12391868233680725,0.056066952645778656,0.13505485653877258,0.035116713494062424,-0.020766351372003555,-0.051443010568618774,0.06425290554761887,-0.14429454505443573,0.05212423950433731,0.13668957352638245,-0.08722230046987534,0.12915672361850739,0.007829026319086552,-0.03321491554379463,-0.12345216423273087,0.15209044516086578,0.12141577154397964,0.00023469681036658585,-0.14297015964984894,0.056275874376297,0.10040494799613953,0.08803722262382507,-0.13147185742855072,0.008018715307116508,0.12236596643924713,-0.0857747495174408,0.1446925550699234,0.14445845782756805,0.005687261000275612,-0.12251005321741104,0.011214038357138634,0.09889879077672958,-0.09122533351182938,0.0005570257781073451,0.0250672847032547,0.06369026005268097,0.09948515892028809,0.1522485315799713,0.0705852210521698,-0.05966942384839058,0.12629567086696625,-0.053334128111600876,0.005866692867130041,-0.09897729009389877,-0.019701650366187096,0.13989710807800293,-0.012785288505256176,-0.018235063180327415,0.021158764138817787,-0.09683693945407867,0.0006036435370333493,-0.06021609157323837,-0.07045944035053253,0.14848637580871582,0.008679530583322048,-0.08560909330844879,0.012103205546736717,0.12953586876392365,0.08584058284759521,-0.035836197435855865,0.07189642637968063,0.11908908933401108,0.135104238986969,-0.013920734636485577,-0.08868703991174698,0.01625271886587143,0.1343679577112198,-0.027628328651189804,-0.09807978570461273,0.10157047212123871,0.017722727730870247,-0.018723953515291214,-0.06291449815034866,0.09296192228794098,0.14665590226650238,0.05342920124530792,0.010396982543170452,0.07649741321802139,-0.12961697578430176,0.07750362902879715,-0.01435995101928711,-0.03561340644955635,0.057464685291051865,-0.058785393834114075,-0.04746563732624054,-0.12621107697486877,0.004559838678687811,-0.010447945445775986,0.13660979270935059,0.06572476029396057,0.09779947251081467,0.09941647946834564,-0.09020949900150299,-0.11376067996025085,0.080330990254879,-0.07924183458089828,-0.0885903611779213,-0.1343819797039032,0.11128871142864227,0.05964319407939911,-0.1080876886844635,-0.051971957087516785,0.010149683803319931,-0.04620889946818352,0.14620454609394073,-0.1364733725786209,0.10950810462236404,0.09453702718019485,-0.032897334545850754,-0.10901162028312683,-0.1168978214263916,-0.11505758762359619,-0.02269073761999607,-0.0025588448625057936,0.11041881144046783,-0.0255426038056612,-0.12044999748468399,-0.08845493197441101,0.1374424695968628,0.13493500649929047,-0.05892053619027138,-0.002405440667644143,0.10391534864902496,0.10008271038532257],[-0.05958111584186554,0.004143702331930399,0.05857938528060913,-0.07142827659845352,0.04079115390777588,-0.13429585099220276,0.01465964037925005,-0.15700480341911316,-0.056198082864284515,0.1284157931804657,0.05893190577626228,-0.12602584064006805,0.12889790534973145,0.08206788450479507,0.11337478458881378,0.035747528076171875,0.1426895558834076,0.14175887405872345,-0.03168455511331558,-0.033214885741472244,0.07631979137659073,-0.044398851692676544,0.14316056668758392,0.13560287654399872,-0.06110990792512894,-0.007665013428777456,-0.11517134308815002,0.041011516004800797,-0.11135828495025635,-0.08326061815023422,-0.02235903963446617,-0.08639778196811676,0.08827026188373566,-0.09655850380659103,-0.12442363798618317,0.006039363332092762,-0.10281210392713547,0.1364324390888214,-0.07936856895685196,-0.008135358802974224,0.09833469986915588,0.00041616384987719357,0.10825103521347046,0.13252173364162445,0.024807335808873177,-0.0401570163667202,0.05656179413199425,-0.11509246379137039,-0.05853467062115669,0.1062692329287529,-0.024081915616989136,-0.12453752756118774,0.05484224110841751,0.055977713316679,0.02890320122241974,0.01713544689118862,0.10139400511980057,-0.11428625136613846,0.07001280784606934,0.09899801015853882,-0.09185894578695297,0.06947644799947739,-0.10949600487947464,0.007460445165634155,-0.05083726719021797,-0.0295331422239542,-0.06545460969209671,0.11093369126319885,0.10882123559713364,-0.14788596332073212,-0.017874183133244514,0.1520741730928421,0.00023213151143863797,0.15439623594284058,0.03714144974946976,-0.02880527637898922,-0.03093007020652294,0.06130189448595047,-0.12658976018428802,-0.10656150430440903,-0.07884211838245392,-0.14675623178482056,0.021399319171905518,0.0801181048154831,-0.11943289637565613,-0.12094484269618988,0.06665422767400742,0.12739698588848114,-0.010606025345623493,-0.1338670402765274,0.11004425585269928,-0.14718475937843323,0.02717272751033306,0.15693721175193787,0.06983502209186554,0.02854854427278042,0.04251749441027641,-0.03260393813252449,-0.1499336063861847,0.14358128607273102,0.11671236157417297,0.05734645575284958,-0.07543683797121048,0.09097059071063995,-0.03920356184244156,0.09560949355363846,0.09832961857318878,-0.02578805387020111,-0.06401090323925018,0.026400990784168243,0.11739124357700348,-0.11486908048391342,0.052479080855846405,-0.15636949241161346,-0.11469146609306335,-0.005627767648547888,0.12058701366186142,-0.03355782851576805,0.15322332084178925,-0.12429229170084,0.13471411168575287,0.08129172772169113,0.08801526576280594,0.07804832607507706,-0.12966462969779968,-0.15894095599651337,-0.03542400524020195,0.11033333837985992],[0.0008309097611345351,0.05393366143107414,-0.0533047616481781,-0.02240093983709812,-0.14312444627285004,-0.10598094761371613,-0.08716903626918793,0.1531519740819931,-0.13459423184394836,0.07575723528862,0.04577311873435974,-0.0026845757383853197,-0.11517974734306335,-0.08237317949533463,0.06712143868207932,-0.02331475168466568,0.07880852371454239,0.05172227323055267,-0.07586042582988739,0.15514948964118958,-0.05809931457042694,0.1324571669101715,-0.00419258326292038,-0.039089154452085495,0.006892424076795578,-0.03710314631462097,0.004375028423964977,-0.06865194439888,0.09469283372163773,-0.018536096438765526,-0.07294115424156189,-0.11154100298881531,-0.1420460194349289,0.07201466709375381,0.12652266025543213,0.0953863337635994,0.03847627714276314,-0.07192302495241165,0.11043799668550491,-0.11107886582612991,-0.08834406733512878,0.15699218213558197,-0.024542439728975296,0.14601966738700867,-0.0390167161822319,0.005373748484998941,0.11970194429159164,-0.03446027263998985,0.12580780684947968,-0.11930371075868607,-0.06367995589971542,-0.025256026536226273,-0.08266320824623108,-0.1316271722316742,-0.014507760293781757,-0.06363328546285629,0.078170545399189,-0.12044581025838852,-0.0032261714804917574,0.14612923562526703,-0.10086488723754883,0.15153497457504272,-0.1198926717042923,0.10651232302188873,-0.1259206086397171,0.11005916446447372,0.15945923328399658,-0.05735043063759804,-0.09706462919712067,0.0006194241577759385,0.12574853003025055,0.11023283004760742,-0.054072558879852295,-0.13021770119667053,-0.12701593339443207,-0.044440288096666336,0.12664824724197388,0.10013949126005173,0.12910984456539154,0.12011735886335373,0.06109786033630371,-0.0653788298368454,-0.08493408560752869,-0.06129246950149536,-0.1369510442018509,-0.04345778375864029,-0.03807668760418892,0.07897394150495529,0.12370067089796066,0.1332392394542694,-0.15480884909629822,-0.06864042580127716,-0.010619753040373325,-0.12912796437740326,0.022764956578612328,0.04514100030064583,-0.10062941163778305,-0.002871683333069086,0.10365097969770432,-0.13382163643836975,-0.04463671147823334,0.12807120382785797,0.03514614701271057,-0.1411050707101822,0.06246870011091232,0.0817352756857872,0.10912632942199707,0.03180569037795067,-0.07029423862695694,-0.06903348863124847,-0.11458873748779297,0.08852692693471909,0.10595148056745529,0.09942678362131119,0.10055132210254669,0.029603280127048492,0.0460241362452507,0.09245210140943527,0.14356833696365356,0.08124606311321259,0.12706908583641052,0.020539401099085808,0.0883360207080841,0.04722623899579048,0.13279075920581818,0.10216096043586731,0.09119188785552979,-0.10010802745819092],[0.001357352826744318,-0.1385805904865265,0.037026986479759216,0.13177019357681274,0.03227163478732109,-0.10378137230873108,-0.1422959417104721,0.08564898371696472,-0.02651832439005375,0.029866337776184082,-0.03662029281258583,0.10092364251613617,-0.017213249579072,0.15295609831809998,-0.12091152369976044,-0.13499704003334045,0.04504014551639557,-0.03454658389091492,-0.14448001980781555,0.05318768322467804,-0.0546882301568985,0.14673148095607758,-0.11315532773733139,0.10680456459522247,0.08662521839141846,0.12759923934936523,0.09681251645088196,-0.11457893997430801,-0.08167910575866699,-0.11180490255355835,0.05541475862264633,-0.10324911028146744,0.07182890176773071,-0.028827426955103874,-0.06971898674964905,-0.018782692030072212,0.14556580781936646,0.023878222331404686,-0.01840144582092762,0.04994608834385872,0.02135823667049408,-0.013373513706028461,-0.049837078899145126,0.01681123487651348,0.05697716027498245,0.0014185601612553,-0.09364040195941925,-0.1269533932209015,0.03674738481640816,-0.1369531750679016,-0.08827563375234604,-0.13904184103012085,-0.054895784705877304,-0.09113842993974686,0.07965615391731262,-0.08649887889623642,0.02955271676182747,-0.08561428636312485,0.03342800959944725,-0.12724149227142334,-0.0037335872184485197,-0.04785511642694473,0.07779315859079361,-0.05075570568442345,0.07801450788974762,0.014860866591334343,0.033228401094675064,0.08097610622644424,-0.07100722938776016,0.007834919728338718,0.156001016497612,-0.0010234435321763158,0.03742202743887901,-0.12398964166641235,0.09281254559755325,-0.059787578880786896,-0.1421441286802292,0.005640811286866665,-0.08535990864038467,0.13261054456233978,-0.09948340803384781,-0.12495606392621994,0.08935464173555374,-0.0478428453207016,0.13155800104141235,-0.052922531962394714,0.06885560601949692,-0.09725595265626907,-0.11384008824825287,-0.0152285723015666,0.07313644886016846,-0.08060194551944733,0.05776413530111313,-0.11611296236515045,-0.058999381959438324,-0.0030236488673835993,-0.08952607214450836,0.07596023380756378,0.1369680017232895,0.14472104609012604,0.05568593367934227,0.029292045161128044,-0.0688251480460167,0.091179758310318,-0.019177498295903206,0.004399112891405821,-0.024779070168733597,-0.03269755840301514,0.03999887406826019,-0.08904983103275299,0.029894426465034485,-0.13605864346027374,0.11481815576553345,-0.02890203893184662,0.1534527689218521,0.0872986912727356,0.04720158502459526,0.09647787362337112,-0.10359211266040802,0.06137698516249657,0.027744662016630173,-0.1609770655632019,0.0215473435819149,0.1500772386789322,0.035071853548288345,0.11938727647066116,-0.12548953294754028,0.11650454252958298],[-0.08491680771112442,0.019094349816441536,0.04199487715959549,-0.14083805680274963,-0.15763205289840698,-0.04741288349032402,0.12054146081209183,0.1318235695362091,0.09537208825349808,0.12567591667175293,-0.12481459975242615,0.010351559147238731,-0.11876595765352249,0.0764101967215538,-0.09686388820409775,-0.08814854919910431,0.16594843566417694,-0.09674129635095596,0.031720466911792755,0.13778597116470337,-0.010213497094810009,-0.00438660429790616,-0.0642407014966011,0.029145974665880203,0.014662212692201138,-0.06509020924568176,-0.06605242937803268,0.026712287217378616,-0.0591607391834259,-0.11915962398052216,-0.06286722421646118,0.07769384980201721,-0.12179934978485107,-0.11379766464233398,-0.048150863498449326,0.13331563770771027,-0.15059608221054077,0.08157096803188324,-0.1100846379995346,0.02160758525133133,0.1412273496389389,-0.06202651187777519,0.07155942916870117,0.02528347074985504,-0.13084430992603302,-0.11533521115779877,-0.017350565642118454,-0.1437142789363861,-0.09816902130842209,0.08617649227380753,0.09948266297578812,-0.14064094424247742,-0.09213288128376007,0.05032805725932121,-0.08622410148382187,-0.12354238331317902,0.10649968683719635,0.11141644418239594,-0.015177590772509575,0.04440668597817421,0.10416100919246674,-0.14646971225738525,0.024985115975141525,-0.004380062222480774,-0.11808225512504578,0.07430695742368698,-0.12903562188148499,-0.06748092919588089,0.12275213748216629,-0.040934301912784576,0.055461324751377106,-0.12563668191432953,-0.09464280307292938,0.0008848063298501074,-0.15006543695926666,0.09242506325244904,0.10517095774412155,0.1461292803287506,-0.14075279235839844,-0.09281335026025772,-0.02056260034441948,-0.07566922158002853,0.14402782917022705,0.06648413091897964,-0.14917699992656708,-0.0804314911365509,0.0020231802482157946,0.06792636960744858,0.12418536841869354,-0.11019809544086456,-0.003719795262441039,-0.1263096034526825,0.0008574171806685627,-0.019672894850373268,-0.14319002628326416,-0.09943389147520065,-0.1344008445739746,-0.04731794446706772,-0.09597953408956528,-0.15641354024410248,0.05226147174835205,0.028476109728217125,0.13096849620342255,0.022405875846743584,0.08325172960758209,0.0833011046051979,-0.10603293031454086,0.07662384957075119,-0.09768933802843094,-0.04361346364021301,0.04113956168293953,0.12782913446426392,0.09320689737796783,0.10803250968456268,0.09582396596670151,0.0020586608443409204,0.014571279287338257,0.010826126672327518,0.149863600730896,0.09516163170337677,0.13651485741138458,-0.09762560576200485,0.10322346538305283,-0.07912448048591614,0.035044245421886444,0.06219146028161049,-0.06756127625703812,-0.07184229046106339],[-0.10178892314434052,0.006561652757227421,0.0726425051689148,-0.042172033339738846,0.045794617384672165,-0.06222311034798622,-0.1474461853504181,-0.06259989738464355,0.14272192120552063,-0.08060469478368759,0.08915499597787857,0.06789840757846832,0.08654353022575378,-0.026663096621632576,-0.01715436391532421,-0.08944904804229736,0.12484391778707504,0.13957029581069946,-0.018642328679561615,0.08978807926177979,0.07096520811319351,0.08843031525611877,0.05147374048829079,0.11800508201122284,-0.02077091857790947,-0.12012659758329391,0.04901846498250961,0.0007978397188708186,-0.08752813190221786,-0.0634797215461731,0.09775593131780624,-0.050724875181913376,-0.12171261757612228,-0.02459607645869255,-0.14716699719429016,0.10820083320140839,0.09986275434494019,0.14586114883422852,-0.1373400092124939,0.002298551145941019,0.08786159008741379,0.0710473582148552,0.009778700768947601,0.1414235383272171,0.07170253247022629,0.02434276044368744,-0.12175054848194122,-0.019649460911750793,-0.008374661207199097,-0.0008361510117538273,0.13325370848178864,-0.05512036755681038,0.11185699701309204,0.03123762086033821,-0.027537792921066284,-0.15442097187042236,0.013621698133647442,-0.017918923869729042,-0.02309940941631794,-0.03373511880636215,-0.11063621938228607,-0.029587583616375923,0.13244803249835968,0.07391870021820068,0.12648837268352509,-0.1150183454155922,-0.039727162569761276,0.018622450530529022,-0.11845684051513672,0.06024349480867386,0.02492544613778591,0.08743176609277725,-0.099131740629673,0.07144569605588913,-0.020914630964398384,0.001982593908905983,-0.04356386139988899,-0.12107362598180771,-0.0029476583003997803,0.014026637189090252,0.09796208143234253,0.14546212553977966,0.02413487806916237,-0.08471179753541946,0.1451427936553955,0.11042937636375427,0.10075224936008453,0.09216494113206863,-0.029139772057533264,0.06641937792301178,0.008473698981106281,0.10749190300703049,0.08704748749732971,-0.0014960175612941384,0.15585929155349731,-0.0915880799293518,0.09758716076612473,0.1301434189081192,0.04347112029790878,0.08289733529090881,0.07287709414958954,0.14700764417648315,-0.049485351890325546,-0.0760980024933815,0.11212939023971558,0.1267104595899582,-0.018620453774929047,-0.03289336338639259,-0.002598147839307785,0.11693622916936874,0.10859379172325134,0.01594606786966324,0.08652196079492569,0.10837212949991226,0.1498289257287979,0.09887529909610748,0.09286438673734665,-0.102594293653965,0.13863219320774078,0.14729756116867065,0.1338111162185669,-0.1305333524942398,0.11066000163555145,-0.14678244292736053,-0.031420622020959854,-0.14255277812480927,-0.03338947892189026,-0.01532241702079773],[0.053844958543777466,0.14586755633354187,-0.0060579851269721985,0.07388792186975479,0.07675083726644516,0.10007083415985107,0.11933885514736176,-0.09345200657844543,-0.04167826101183891,-0.09654607623815536,-0.07117477804422379,0.14033354818820953,0.09973777085542679,0.06281174719333649,0.09803038835525513,0.02841036580502987,0.06727815419435501,-0.13801510632038116,-0.04823145270347595,-0.04660918563604355,0.09252259135246277,0.08474821597337723,-0.12833020091056824,0.07417477667331696,0.06056920439004898,-0.1473187953233719,0.030308222398161888,-0.020210523158311844,-0.057680122554302216,0.08256550133228302,0.07665575295686722,-0.13982148468494415,-0.03813115134835243,-0.0637320727109909,-0.094156913459301,-0.12981350719928741,-0.08189186453819275,-0.09822922945022583,-0.12871064245700836,-0.044242411851882935,-0.04106089472770691,0.1023692637681961,-0.11923319846391678,-0.1016324907541275,-0.03983355313539505,-0.009885733015835285,-0.010892647318542004,0.08712262660264969,0.006697806995362043,-0.05746399238705635,-0.11801113188266754,-0.08427917957305908,0.08851350098848343,0.031240884214639664,0.07114700227975845,0.11542366445064545,0.07385631650686264,-0.12305109947919846,-0.14450140297412872,-0.028234202414751053,-0.0945185124874115,-0.07819127291440964,0.058436982333660126,-0.061274297535419464,-0.04104597494006157,-0.0045521920546889305,-0.12853103876113892,-0.07644075900316238,0.11656630784273148,0.13343673944473267,-0.0968872606754303,0.07612404972314835,0.1478809267282486,0.12077316641807556,-0.11415520310401917,0.023863887414336205,0.12332018464803696,-0.13244949281215668,0.0057098339311778545,0.13264821469783783,-0.05246574804186821,-0.12801215052604675,0.013469853438436985,-0.11331591755151749,-0.05195092409849167,0.15355758368968964,0.1480744481086731,0.08458887785673141,0.013334183022379875,0.14852702617645264,0.002607942558825016,0.0942334458231926,-0.035883549600839615,0.0015311668394133449,-0.1115516796708107,-0.08553715795278549,0.09476052969694138,0.01588653400540352,0.056705541908741,0.1496187001466751,0.13520149886608124,0.08575823158025742,-0.049247972667217255,0.07349169254302979,-0.071773000061512,-0.05445851758122444,-0.08394496142864227,-0.13369935750961304,-0.07710679620504379,-0.015775468200445175,0.05287854000926018,-0.14252573251724243,0.14965815842151642,0.14596977829933167,0.03555801510810852,-0.12676849961280823,0.12937003374099731,-0.10991231352090836,-0.05985121428966522,-0.06360040605068207,0.047981880605220795,0.15504102408885956,0.1270759403705597,-0.06461360305547714,0.0025442077312618494,0.02065523900091648,-0.1364632397890091,0.12663474678993225],[-0.10207352787256241,0.012082708068192005,-0.07533907145261765,-0.022057244554162025,-0.09025166928768158,0.028977615758776665,0.10693856328725815,-0.05067574605345726,0.03531937301158905,0.1272009015083313,0.0031192784663289785,0.036170974373817444,-0.08346003293991089,0.07667513191699982,0.0017118423711508512,-0.12522515654563904,-0.08578751981258392,-0.03875639662146568,0.03949485719203949,-0.14343005418777466,0.12289922684431076,-0.07570911198854446,0.08265271782875061,0.12102669477462769,-0.0275812316685915,-0.14957347512245178,0.16056206822395325,0.08586867153644562,0.13749869167804718,0.02986748144030571,-0.06581929326057434,-0.06464314460754395,-0.014109001494944096,-0.04394743964076042,-0.05679427459836006,0.0008570289937779307,-0.13551728427410126,-0.09112907201051712,-0.1523500233888626,0.038936857134103775,0.03598138317465782,0.11537681519985199,0.023048169910907745,0.13273607194423676,0.01175825297832489,0.0670904815196991,0.13216038048267365,0.08543164283037186,-0.15399862825870514,0.046470366418361664,-0.019538514316082,-0.09325151145458221,0.0727337971329689,0.03506332263350487,-0.12996818125247955,0.13641536235809326,0.08755902200937271,0.10897477716207504,-0.02425242029130459,0.05553523451089859,-0.0494215153157711,0.05048743635416031,-0.04452366754412651,0.07259446382522583,-0.0634128749370575,0.07765219360589981,0.11096981912851334,0.13671328127384186,-0.014422109350562096,0.1322442889213562,-0.12592627108097076,0.01342888455837965,0.03486304357647896,-0.0925246849656105,-0.029132984578609467,-0.12930072844028473,-0.015758434310555458,0.01934225670993328,-0.11601894348859787,-0.030766384676098824,-0.008821967989206314,0.06500153988599777,-0.0836930125951767,-0.08729680627584457,-0.14765961468219757,0.04872286319732666,0.03065771609544754,0.024354275315999985,0.08984624594449997,-0.09362465888261795,-0.12953214347362518,0.1335829496383667,0.09392993152141571,0.11216336488723755,-0.07449759542942047,-0.12472791224718094,0.0593736432492733,-0.03990821912884712,-0.005397283472120762,0.03967878222465515,-0.145461305975914,-0.0888092964887619,-0.1131773442029953,-0.09125629812479019,0.12667123973369598,0.09959956258535385,-0.13747063279151917,0.05838988721370697,0.0520317405462265,-0.1571599245071411,-0.046731676906347275,-0.020940281450748444,0.1322421431541443,0.04733385890722275,-0.03809814155101776,0.015595213510096073,-0.09719351679086685,-0.11542221903800964,0.05356520786881447,-0.11400815844535828,-0.05685332417488098,0.1262177675962448,0.14811404049396515,0.12397154420614243,0.08369827270507812,-0.046502213925123215,0.12831439077854156,-0.06688930839300156],[-0.046017445623874664,0.05167681351304054,-0.0925629734992981,0.07979373633861542,-0.053710319101810455,0.016429245471954346,-0.09471233189105988,-0.12973123788833618,0.1538473516702652,-0.0018911707447841763,-0.002666052430868149,-0.03610677644610405,-0.03462471067905426,-0.007339402101933956,0.09425078332424164,-0.13919498026371002,-0.05909557268023491,-0.15278702974319458,0.04716538265347481,-0.09297320246696472,-0.008367642760276794,0.07978731393814087,0.008167080581188202,-0.06758054345846176,-0.06190282106399536,-0.09570679068565369,0.014874010346829891,0.04471262916922569,0.11965353041887283,-0.006988731678575277,-0.012007159180939198,0.01693577505648136,-0.041350074112415314,-0.11441411823034286,-0.10842259228229523,-0.06997111439704895,-0.09099693596363068,0.11503435671329498,0.13303953409194946,-0.1088167205452919,0.13284440338611603,0.14441369473934174,-0.022095423191785812,0.13488562405109406,-0.07684119790792465,0.13646861910820007,-0.0029910814482718706,0.0941232219338417,0.07229657471179962,0.023152301087975502,0.132309690117836,-0.011728569865226746,-0.09729979187250137,0.07399632036685944,0.07032538950443268,-0.0607217401266098,-0.0722149908542633,0.10080436617136002,0.11733302474021912,-0.15676583349704742,0.11613805592060089,-0.08673197031021118,-0.005171224009245634,-0.024241464212536812,-0.09598709642887115,0.05343502014875412,-0.08893129974603653,0.0393296554684639,-0.09099416434764862,0.022797098383307457,-0.14745649695396423,-0.03706524521112442,-0.12360803782939911,-0.12325004488229752,0.06838084757328033,0.05210981145501137,0.14585286378860474,0.10816981643438339,-0.1309809535741806,-0.08805215358734131,0.01953011564910412,-0.058508653193712234,0.07899196445941925,0.12921833992004395,0.1297174096107483,-0.1037653386592865,-0.04143369942903519,0.08409320563077927,-0.10265617817640305,-0.08858083933591843,-0.10962412506341934,-0.04492494463920593,-0.08631732314825058,0.03577910363674164,-0.08290684223175049,-0.16007910668849945,-0.13177764415740967,0.0423133410513401,0.08919721841812134,0.026382185518741608,0.009446414187550545,0.08127658814191818,-0.06800932437181473,0.11435175687074661,-0.05896718055009842,0.09680680185556412,-0.026086803525686264,0.11914560943841934,0.12630030512809753,0.11616182327270508,0.13078759610652924,0.08579666167497635,-0.12737873196601868,-0.1020655483007431,0.09454970806837082,-0.05004553496837616,-0.11866834759712219,0.08339612931013107,-0.14591224491596222,-0.00956313032656908,-0.15624111890792847,-0.0857371911406517,-0.04498278349637985,-0.07115348428487778,0.12365808337926865,0.0697455108165741,0.12786175310611725,-0.0012065956834703684],[0.10902730375528336,-0.15833543241024017,0.012173071503639221,0.09460882842540741,0.12330614775419235,-0.10145611315965652,-0.06721661984920502,0.09470604360103607,0.10088568925857544,0.13981026411056519,-0.1382724493741989,0.06793303042650223,-0.14674392342567444,0.03380678594112396,-0.117442287504673,0.10059397667646408,-0.15286117792129517,0.02121259644627571,-0.14121726155281067,0.07397235184907913,-0.0028363631572574377,0.0929562970995903,-0.009322895668447018,0.08604953438043594,-0.08901360630989075,0.10915493220090866,0.13116455078125,-0.11646877974271774,-0.07062089443206787,-0.06715187430381775,0.027211636304855347,0.12373273819684982,0.05450407415628433,0.06002425029873848,0.027012569829821587,0.11177774518728256,0.07921620458364487,-0.12537439167499542,-0.13843593001365662,0.15510286390781403,-0.03868746757507324,0.11269333213567734,-0.10311099886894226,-0.05200904980301857,-0.08943844586610794,-0.047499775886535645,0.03457736223936081,-0.04976057633757591,-0.04789560288190842,0.13822701573371887,-0.14596650004386902,0.07172036170959473,-0.0021117685828357935,0.026763686910271645,0.08734834939241409,-0.09387720376253128,-0.014943137764930725,-0.12243267893791199,-0.1252484768629074,-0.09508559852838516,-0.034064434468746185,0.1321122646331787,-0.0005890102474950254,0.020128479227423668,-0.0022166334092617035,0.05052557960152626,-0.1001911610364914,0.0625268742442131,-0.08630992472171783,0.01583484746515751,0.06127671152353287,-0.14494076371192932,0.03804710507392883,-0.07226526737213135,0.14114579558372498,-0.027862317860126495,0.0899672880768776,0.04314985126256943,0.11442672461271286,-0.058213550597429276,0.11480328440666199,-0.11699890345335007,-0.03136265277862549,-0.07983692735433578,0.004005507566034794,-0.06006215885281563,-0.011126621626317501,0.1491067111492157,0.10730572044849396,-0.16285742819309235,0.018194114789366722,0.10543151944875717,0.09425896406173706,0.015739496797323227,0.011477665975689888,-0.014450497925281525,-0.10226744413375854,-0.10510040819644928,-0.05946847423911095,-0.06998994201421738,-0.15173818171024323,-0.09391283243894577,-0.05693138763308525,-0.09016354382038116,0.05773065611720085,-0.08044424653053284,-0.06140870600938797,-0.11336817592382431,-0.12884372472763062,-0.07961619645357132,0.09751547873020172,0.07411510497331619,-0.15107549726963043,0.04197104647755623,-0.16001173853874207,-0.06388600915670395,0.008135786280035973,0.07942327111959457,-0.03460682928562164,-0.1250525414943695,-0.12700924277305603,-0.13454362750053406,-0.11201079934835434,-0.1030820682644844,0.13316687941551208,-0.11682065576314926,-0.1456802785396576,0.014343624003231525],[0.0752410888671875,-0.14229974150657654,0.14902491867542267,-0.06617913395166397,0.06606323271989822,0.07758966833353043,0.05921275541186333,0.018934305757284164,-0.15621782839298248,-0.13435988128185272,-0.04182000458240509,0.06609896570444107,-0.0034129233099520206,0.04453757405281067,-0.03951414301991463,-0.12695305049419403,0.03735760971903801,0.1070592999458313,0.06331660598516464,0.11814045161008835,0.027300182729959488,-0.04940907657146454,0.005625005811452866,-0.11901398003101349,0.10922606289386749,0.09650551527738571,-0.013918875716626644,0.007658070884644985,0.10839299112558365,0.07508338242769241,0.03864496573805809,-0.03382314741611481,0.11035967618227005,-0.12947477400302887,0.13397224247455597,0.004826577380299568,0.09798447787761688,0.11350038647651672,-0.04927302151918411,-0.040067050606012344,-0.14643187820911407,0.12405822426080704,-0.012028136290609837,0.13220706582069397,-0.1297910511493683,-0.01121894083917141,0.028027663007378578,-0.06014982610940933,-0.12708739936351776,-0.034198097884655,0.07266037166118622,-0.048465944826602936,0.0007641645497642457,-0.12969699501991272,-0.019957751035690308,-0.13660594820976257,-0.014913082122802734,0.11271033436059952,0.041972190141677856,0.07448503375053406,-0.011638515628874302,-0.009333327412605286,0.09538663923740387,-0.039994265884160995,-0.005134348291903734,-0.029776044189929962,0.0471627451479435,0.029870443046092987,0.10675515234470367,-0.04722529649734497,0.13632947206497192,-0.11167895048856735,0.14117777347564697,0.12749965488910675,-0.10150688141584396,-0.08168334513902664,-0.06766889244318008,-0.01536503154784441,0.12374741584062576,-0.000613834650721401,0.09766165912151337,-0.09890786558389664,-0.08626449108123779,0.1444801688194275,0.08526524156332016,0.0022021117620170116,0.000643158913590014,0.0010730177164077759,-0.044909071177244186,-0.1024690568447113,-0.0019864148925989866,0.08343181014060974,0.048799507319927216,-0.08762823045253754,0.08243605494499207,-0.0690130665898323,0.028002630919218063,0.1464807689189911,-0.024889979511499405,-0.09800297021865845,-0.08144228160381317,-0.08756910264492035,0.09912212193012238,0.13230043649673462,-0.017308343201875687,-0.13686804473400116,0.16537725925445557,-0.13004280626773834,-0.11374186724424362,0.016953064128756523,0.008551658131182194,-0.14555872976779938,0.09459864348173141,-0.0006001502042636275,-0.08813945204019547,-0.00042816196219064295,0.13056865334510803,-0.0502263568341732,-0.06455627083778381,-0.05276523903012276,-0.0711597353219986,0.1260964721441269,-0.10105927288532257,-0.04819703847169876,-0.14008823037147522,0.11629895120859146,-0.11762542277574539,0.0948813334107399],[0.11606502532958984,0.09881170839071274,0.024882210418581963,0.11572859436273575,0.08075471222400665,0.09334415197372437,0.10742112249135971,-0.1398029774427414,-0.03022903949022293,-0.014643332920968533,0.14842793345451355,-0.018961062654852867,0.028168119490146637,-0.017091423273086548,0.14832599461078644,-0.0060741109773516655,-0.09719136357307434,0.010531908832490444,0.059864744544029236,-0.06349807977676392,-0.09070537984371185,0.047555457800626755,0.13801327347755432,-0.038638800382614136,0.07264378666877747,0.05775216966867447,-0.12243618071079254,0.15778635442256927,0.12610113620758057,0.028935667127370834,0.12864620983600616,-0.1231672391295433,0.13512475788593292,-0.015107129700481892,0.14966946840286255,-0.06610684841871262,0.07121729850769043,-0.08152947574853897,-0.040496453642845154,0.15747830271720886,-0.02735229581594467,-0.026639988645911217,-0.10198548436164856,0.1267153024673462,-0.14662472903728485,0.0021828312892466784,-0.12532824277877808,0.130271777510643,-0.00964470487087965,0.13522027432918549,0.11129656434059143,-0.09356720745563507,-0.09645644575357437,0.03438935428857803,-0.07465166598558426,0.08921297639608383,-0.10363326966762543,-0.125435933470726,0.05420325696468353,-0.05308680608868599,-0.07183182239532471,0.03278080001473427,0.04999857395887375,0.09395924210548401,0.08354587107896805,-0.10159718245267868,0.05303582176566124,0.14007188379764557,0.04020919278264046,-0.04825349897146225,-0.031975723803043365,0.07473345100879669,-0.12328051030635834,-0.09170325100421906,-0.12560388445854187,-0.06129913777112961,0.03656261786818504,-0.042466457933187485,-0.07738443464040756,0.00465943431481719,0.06966972351074219,-0.14269207417964935,0.0778537467122078,0.12854088842868805,0.1604541838169098,-0.06562197208404541,-0.0005833330214954913,0.041595131158828735,0.13455608487129211,0.054088082164525986,0.0480567030608654,0.06258198618888855,0.027333054691553116,-0.027046920731663704,0.03196501359343529,-0.03515755012631416,0.09767898172140121,-0.0993470549583435,-0.05712065473198891,-0.06445544213056564,0.07033322006464005,0.013706600293517113,0.02028501220047474,-0.0752880796790123,0.1019650548696518,-0.14081798493862152,0.13027192652225494,0.1455717235803604,-0.12961891293525696,-0.14921161532402039,-0.006553948391228914,0.10555689036846161,-0.14426647126674652,0.04267276078462601,0.11967296898365021,-0.009788834489881992,-0.07283861935138702,-0.03848931938409805,-0.015367625281214714,-0.04265393689274788,0.04869784787297249,-0.12977463006973267,-0.0167310182005167,0.04529320448637009,0.13807421922683716,-0.11353813856840134,0.03584359586238861,-0.057897601276636124],[0.06320522725582123,-0.12198498845100403,-0.108303964138031,-0.07085011899471283,0.0018326921854168177,-0.09450133889913559,0.08743803203105927,0.050148725509643555,-0.09227582067251205,0.04507909715175629,-0.014958925545215607,0.1257021427154541,0.051141802221536636,-0.14353574812412262,-0.003295872826129198,-0.12606224417686462,0.11398179084062576,0.024541735649108887,0.13752266764640808,0.121620774269104,-0.034159522503614426,0.16542808711528778,-0.025981761515140533,0.09932130575180054,0.0769999548792839,-0.09915557503700256,-0.03158624470233917,0.11407192796468735,0.12906143069267273,-0.12670622766017914,0.05076641961932182,0.16919803619384766,0.15589730441570282,0.08210063725709915,0.02346033602952957,-0.13195651769638062,-0.12082702666521072,-0.01848992519080639,-0.10658145695924759,-0.029255447909235954,0.0663507804274559,-0.050179898738861084,-0.12694306671619415,0.011431440711021423,0.07504640519618988,0.0381302647292614,0.01613185741007328,0.06915467232465744,-0.04879431799054146,0.09360980242490768,-0.017742197960615158,-0.04897874593734741,-0.12845252454280853,0.04688805341720581,-0.046812646090984344,0.07578922808170319,-0.08769328147172928,0.003545291954651475,0.01982819475233555,-0.05033336579799652,0.143044576048851,0.10392502695322037,-0.013161085546016693,-0.05132046714425087,-0.01669696532189846,0.03417481482028961,-0.06662159413099289,-0.050159744918346405,-0.019891275092959404,-0.10081854462623596,-0.0009661174844950438,-0.06425163894891739,0.074674591422081,0.07987231016159058,-0.044645044952631,-0.12939289212226868,0.11276856809854507,0.0004502304072957486,0.05960569530725479,0.13212290406227112,-0.13341952860355377,-0.12434472143650055,0.10337810963392258,0.13738173246383667,0.06961777806282043,0.05520174652338028,0.055482424795627594,0.061013828963041306,-0.06193683668971062,0.08905886113643646,0.10963712632656097,0.16836507618427277,0.11773142218589783,-0.11405959725379944,-0.10563240945339203,0.12201560288667679,0.12393322587013245,0.09782517701387405,-0.13687776029109955,-0.10681010037660599,-0.008534468710422516,0.11104987561702728,0.0010631066979840398,0.1526038944721222,-0.03122117556631565,-0.12861144542694092,0.17185261845588684,-0.053951434791088104,-0.11789479106664658,-0.0249570831656456,0.04075230285525322,0.14113737642765045,0.02610151283442974,-0.019484393298625946,0.011047638021409512,-0.12643371522426605,-0.14795686304569244,-0.0037266742438077927,0.04452601820230484,-0.1349363923072815,-0.11291992664337158,-0.06697028875350952,-0.13549229502677917,-0.10729250311851501,-0.029321618378162384,-0.016780400648713112,0.07763335108757019,0.012833955697715282],[0.1265321671962738,0.019601771607995033,0.05488825961947441,0.1459677666425705,-0.06941254436969757,-0.07955635339021683,0.05780528485774994,0.12472791224718094,0.09198873490095139,0.010830062441527843,0.016677245497703552,0.14528556168079376,-0.05167781189084053,0.1018664613366127,0.1268075704574585,0.02963133528828621,-0.010029740631580353,0.038707103580236435,-0.03634300455451012,0.08726470172405243,-0.11301779001951218,0.06260214745998383,0.02875264547765255,0.10337737947702408,0.01127825491130352,-0.11414425075054169,-0.07202102243900299,0.08629162609577179,-0.10643509030342102,0.015502965077757835,0.02225310169160366,0.09604284912347794,-0.06890023499727249,-0.1018938273191452,0.10350657999515533,0.05932473763823509,0.12645354866981506,0.08390912413597107,-0.09958095103502274,-0.0990128144621849,-0.0819278433918953,-0.08115068823099136,0.09058326482772827,-0.13876858353614807,0.12480127811431885,0.0969822034239769,0.10619790852069855,-0.005252010188996792,0.05555376410484314,-0.13580964505672455,-0.0408707819879055,0.005348088685423136,0.0041895220056176186,-0.14695197343826294,-0.07002502679824829,-0.031415458768606186,0.12610171735286713,0.06722644716501236,-0.1254691779613495,-0.003440589178353548,0.04111127927899361,-0.04129081964492798,-0.07875664532184601,-0.04645379260182381,-0.044458914548158646,0.10748637467622757,0.022856036201119423,-0.11913923919200897,0.12622836232185364,-0.0111805135384202,0.119389608502388,0.12625107169151306,-0.01991625502705574,-0.08870024979114532,0.05827270820736885,0.025613801553845406,0.11996132880449295,0.04507867619395256,0.037708137184381485,-0.11984741687774658,-0.04207233712077141,0.017966222018003464,0.1419561803340912,-0.13741889595985413,-0.09704701602458954,0.08603744953870773,0.12134935706853867,0.026539253070950508,0.07916051894426346,-0.0651787519454956,0.11632021516561508,-0.11095845699310303,0.1389867067337036,-0.013117101974785328,0.06125615909695625,-0.11389297991991043,-0.13920725882053375,-0.020443787798285484,-0.03607340157032013,0.03330089896917343,-0.10952925682067871,0.16779761016368866,0.05297911539673805,-0.03046884760260582,0.08030996471643448,0.07276000827550888,0.08641304820775986,0.08368788659572601,0.15063393115997314,0.07204179465770721,-0.12415830045938492,-0.06881652772426605,0.01282653957605362,-0.044233184307813644,-0.09468461573123932,0.12797041237354279,0.08695335686206818,-0.08386020362377167,-0.08529618382453918,0.136224165558815,-0.1318371742963791,-0.1398962140083313,-0.13324794173240662,-0.10991779714822769,-0.07428416609764099,-0.10711736977100372,-0.03005484864115715,0.01900322362780571],[0.10327880829572678,0.13597121834754944,-0.09488660842180252,0.0783999040722847,-0.02010788396000862,-0.12007259577512741,-0.12241991609334946,0.023564377799630165,-0.05635319650173187,0.022715989500284195,0.11445946991443634,0.0018671005964279175,-0.03316664695739746,0.11261219531297684,-0.12723778188228607,-0.08373411744832993,1.2059270375175402e-05,-0.022923799231648445,-0.050945769995450974,0.00394137529656291,0.03791533783078194,0.05954812839627266,-0.08731821924448013,0.13155806064605713,-0.0419725701212883,-0.008178837597370148,0.09804833680391312,-0.043134819716215134,0.05105694383382797,-0.09342096000909805,-0.11850419640541077,-0.04077281057834625,0.03297039121389389,0.1618768721818924,0.13154536485671997,0.10559898614883423,-0.006833911407738924,-0.04433684051036835,-0.06363590061664581,0.06571890413761139,0.040974728763103485,-0.07327499985694885,0.06586218625307083,-0.13666853308677673,-0.12530338764190674,-0.08858691900968552,0.08400529623031616,-0.0009825961897149682,-0.010056118480861187,0.07122877240180969,-0.1033528670668602,0.1490725874900818,-0.02109014056622982,0.08369863778352737,-0.05740588530898094,0.10345698148012161,0.13058167695999146,0.04700995609164238,-0.05200809985399246,0.12499126046895981,0.16183865070343018,0.07302381843328476,-0.11095275729894638,-0.11549059301614761,0.11567910760641098,0.0522102452814579,-0.0299553070217371,0.1565091758966446,-0.02229308895766735,0.1095055416226387,-0.0645008236169815,0.05117597430944443,-0.055052001029253006,-0.10222834348678589,-0.13283783197402954,-0.05936119332909584,0.11155255883932114,-0.048156578093767166,0.08960594981908798,-0.030824048444628716,0.0190458744764328,-0.015043401159346104,-0.0876990556716919,-0.06908833235502243,-0.06552956998348236,-0.04276791587471962,-0.019673144444823265,0.15768346190452576,-0.015209220349788666,0.036377113312482834,-0.0983656570315361,-0.07712652534246445,0.10760760307312012,-0.0534224770963192,-0.09912700951099396,-0.05675571784377098,-0.07993858307600021,-0.08739437162876129,-0.12697258591651917,0.13632456958293915,4.288778654881753e-05,0.09797140955924988,0.050074297934770584,-0.039465148001909256,0.1145627498626709,-0.14085157215595245,-0.1005844697356224,-0.1000673845410347,-0.040153902024030685,-0.10253164172172546,-0.0333189032971859,-0.05141814425587654,-0.006380991078913212,-0.007152548059821129,0.09047621488571167,0.08725038915872574,0.07310240715742111,-0.10097607970237732,0.1384502649307251,0.055954914540052414,-0.10060860961675644,-0.011129355058073997,-0.009506011381745338,-0.10017219930887222,-0.08152297884225845,-0.042946215718984604,0.07904663681983948,-0.06588535755872726],[0.102287657558918,-0.13048671185970306,-0.08550678193569183,0.023345883935689926,0.09316127002239227,-0.07611382752656937,0.1117662638425827,-0.1329788714647293,0.08634724467992783,0.001667751930654049,-0.042740002274513245,-0.11634016782045364,0.013991962186992168,-0.13225193321704865,-0.0953490361571312,-0.05818001553416252,0.16400377452373505,0.02341254986822605,-0.14072741568088531,0.11199815571308136,3.848820415441878e-05,0.06747497618198395,0.08604928851127625,-0.051968298852443695,-0.09574601799249649,-0.06980609148740768,-0.007613720837980509,-0.10304071754217148,0.11616142094135284,-0.12965013086795807,0.004817139357328415,0.13661251962184906,-0.11282616853713989,-0.07760049402713776,0.08726927638053894,0.08655094355344772,-0.02972121350467205,-0.10520344972610474,0.06683769077062607,-0.024095797911286354,0.04323428124189377,-0.1225920170545578,0.0314229391515255,0.13060027360916138,0.041938744485378265,0.08508041501045227,0.1559780389070511,0.04241212457418442,0.03235461935400963,-0.12054960429668427,0.011678033508360386,-0.05288076400756836,-0.10800185799598694,0.03291000798344612,-0.09026004374027252,-0.07767470180988312,-0.09804161638021469,0.13573519885540009,-0.09147729724645615,0.14985360205173492,0.11843769997358322,0.11324367672204971,0.11838994175195694,0.10695916414260864,0.10774727165699005,0.1669713854789734,-0.011504851281642914,0.08285491168498993,0.1565530002117157,0.09252650290727615,-0.08154523372650146,0.028650743886828423,-0.05357614904642105,-0.13330411911010742,0.03012685477733612,0.04706573113799095,0.020237667486071587,-0.101392962038517,0.10200624912977219,-0.0063960254192352295,0.02761862426996231,0.059760626405477524,0.008918380364775658,0.0830211341381073,-0.07139595597982407,0.09375445544719696,-0.11806417256593704,0.04776545986533165,-0.0905521884560585,0.0767783522605896,0.03468671068549156,-0.010466543026268482,-0.03414905443787575,-0.015984592959284782,-0.025091946125030518,-0.06587851047515869,-0.06344196945428848,0.11378888040781021,0.10844489932060242,0.031062424182891846,0.026474250480532646,-0.08089902251958847,0.06262112408876419,-0.004356451332569122,-0.007968009449541569,-0.09716974198818207,-0.11745548248291016,0.03239423409104347,0.028913356363773346,0.024334289133548737,-0.09527989476919174,0.07259060442447662,0.13500164449214935,0.052365705370903015,-0.0030532442033290863,-0.13146072626113892,-0.00586629007011652,-0.10634864121675491,0.08259169012308121,-0.05385676771402359,0.13383111357688904,-0.10854338854551315,0.03790460526943207,-0.02326388657093048,-0.037395019084215164,-0.08857249468564987,0.06561122834682465,0.12459638714790344],[-0.1508985310792923,-0.0726848691701889,-0.0507509782910347,-0.14771300554275513,-0.11006953567266464,-0.11400032043457031,0.0707136020064354,-0.05932021513581276,0.010831592604517937,0.09414403885602951,0.03428429365158081,0.13628928363323212,0.04465401917695999,0.0774211660027504,0.08650170266628265,0.12345921993255615,-0.03539552539587021,-0.10970664024353027,-0.15227288007736206,-0.1091398149728775,0.13081184029579163,-0.15542596578598022,-0.11546950787305832,-0.1652539074420929,0.006512630730867386,-0.1395229548215866,0.0645059123635292,0.08657893538475037,-0.13150495290756226,-0.0384090356528759,0.02553069405257702,-0.09863085299730301,-0.13100877404212952,-0.1076170951128006,0.010233195498585701,-0.10446661710739136,0.0646647959947586,0.08842068165540695,0.017644209787249565,0.03581524267792702,-0.16428041458129883,-0.04720679298043251,0.02408854477107525,-0.11166419088840485,-0.09924046695232391,0.11304403096437454,0.03752497211098671,0.11891253292560577,0.027141500264406204,0.13196039199829102,-0.030378684401512146,0.06989455968141556,0.07188843190670013,0.036955904215574265,0.053584348410367966,0.12922430038452148,0.1359182745218277,-0.042314883321523666,0.11443708837032318,0.05967625603079796,0.10605591535568237,0.008715650998055935,-0.11978112906217575,-0.06859379261732101,-0.10199795663356781,0.05180160328745842,-0.13376186788082123,-0.09023641049861908,0.012295636348426342,0.02121652662754059,-0.11573947966098785,-0.09476260840892792,0.07630912959575653,-0.13262297213077545,-0.1578706055879593,-0.10490063577890396,-0.12959711253643036,0.039919354021549225,0.05540388822555542,0.11480113118886948,0.15546543896198273,0.1494985967874527,-0.08598767966032028,-0.1355329304933548,-0.14007239043712616,0.02225504443049431,0.016580551862716675,0.0893530622124672,-0.10010848194360733,-0.045626819133758545,0.06600498408079147,0.028756922110915184,-0.0009481179295107722,0.04071157053112984,-0.09901939332485199,0.09726595878601074,0.08221757411956787,0.11685777455568314,0.07608789950609207,0.08665275573730469,0.004590346943587065,0.12714090943336487,0.06678488105535507,-0.15346480906009674,0.01482344325631857,-0.06458767503499985,-0.15213140845298767,0.11260473728179932,-0.03900130093097687,0.08399209380149841,0.025279778987169266,0.1406686007976532,-0.040606774389743805,0.12689080834388733,0.038697246462106705,0.10596700012683868,-0.035195790231227875,0.11240795999765396,0.02187562733888626,-0.07545342296361923,-0.08050081133842468,0.09084970504045486,-0.15409430861473083,-0.10345428436994553,0.05462832376360893,-0.12118927389383316,-0.1174875795841217,0.09026454389095306],[-0.0025187174323946238,0.06067958101630211,0.11005507409572601,0.10402899980545044,-0.11987823992967606,0.0776057094335556,0.02632242441177368,0.011539774015545845,0.13919955492019653,0.0908280611038208,-0.023131394758820534,-0.01004157867282629,0.09777992218732834,-0.10029437392950058,0.14508406817913055,0.006032473407685757,-0.0524316243827343,0.05996602028608322,0.10331767797470093,0.05399562045931816,0.14011965692043304,-0.14328546822071075,-0.0012737647630274296,0.16437871754169464,0.020405156537890434,0.14743950963020325,-0.11189363151788712,-0.045321378856897354,-0.05984080955386162,0.043596528470516205,0.03449193015694618,-0.06950663775205612,-0.12163633108139038,0.1254398077726364,0.04901594668626785,-0.0017705647042021155,0.036853548139333725,0.10771241784095764,-0.06304604560136795,-0.08814120292663574,0.1316525638103485,-0.06979985535144806,0.11780305951833725,-0.005340487230569124,-0.09568232297897339,-0.1183631494641304,-0.05360153317451477,-0.025525370612740517,0.09176306426525116,-0.14583039283752441,-0.04521109163761139,-0.14359553158283234,0.018913723528385162,-0.05754958093166351,-0.005941180977970362,-0.07398838549852371,-0.057143617421388626,0.09692031145095825,-0.03550758585333824,0.10574845969676971,-0.1326959729194641,0.05023478344082832,-0.09953387826681137,0.056633658707141876,-0.1437317132949829,0.04118284210562706,0.062409408390522,-0.12774769961833954,-0.13084448873996735,-0.1509009450674057,-0.002209939295426011,-0.08200391381978989,-0.03218918666243553,0.11240727454423904,-0.01247722003608942,0.02680501528084278,0.1546846330165863,0.03908158466219902,-0.10259836912155151,-0.02201172150671482,0.04663458094000816,-0.022511767223477364,-0.11920314282178879,-0.018567286431789398,-0.15450072288513184,-0.007671022787690163,-0.07172542065382004,0.04215078055858612,-0.12795531749725342,0.06356529891490936,-0.09708433598279953,0.09973606467247009,0.13151943683624268,0.08612538129091263,0.07084556668996811,-0.007930041290819645,-0.06810298562049866,-0.1008380800485611,-0.06314314156770706,-0.12258197367191315,-0.08810243010520935,0.014400758780539036,-0.016868431121110916,0.02763235941529274,-0.05608704313635826,-0.12487803399562836,0.0801384449005127,0.13430000841617584,-0.10102403908967972,-0.038990557193756104,-0.0043398537673056126,0.0836741104722023,0.0591745525598526,0.0057565150782465935,-0.11104445904493332,0.0754464641213417,-0.004459310322999954,0.1135454922914505,-0.06919480115175247,-0.04175032302737236,-0.024578267708420753,-0.03374892473220825,-0.0860772356390953,-0.017173418775200844,-0.05817226693034172,-0.11204739660024643,0.07170501351356506,-0.051263585686683655],[-0.002254601800814271,-0.1301424652338028,0.04590151086449623,0.0781928226351738,-0.14444968104362488,-0.048811186105012894,0.06774330884218216,0.09868118166923523,0.13415385782718658,-0.046882130205631256,0.11705435067415237,-0.07173512130975723,-0.06694967299699783,-0.15575478971004486,0.06899130344390869,0.10161317139863968,0.011389641091227531,-0.0006414347444660962,0.04727650806307793,0.04382544383406639,-0.06380711495876312,0.1232667863368988,-0.04518020153045654,0.07357823848724365,-0.08228526264429092,0.11434967070817947,-0.03056807816028595,-0.024385588243603706,0.1466703712940216,-0.04978402331471443,-0.09525876492261887,0.007491931784898043,0.03546619787812233,0.03856882080435753,0.06544408202171326,0.12497169524431229,0.0003277075011283159,0.12888970971107483,0.07296579331159592,0.13257098197937012,-0.12648740410804749,0.07454187422990799,0.11141546815633774,0.10053051263093948,-0.10166173428297043,0.02767355367541313,-0.04797028377652168,0.11458653956651688,-0.11104083806276321,0.008614934980869293,-0.12386831641197205,0.11771145462989807,0.10265854001045227,-0.1245754137635231,-0.13214358687400818,-0.08392798900604248,0.1519003063440323,0.10836084932088852,0.08814579248428345,-0.10757952928543091,0.07948964834213257,0.10201981663703918,0.03276810050010681,-0.07253815233707428,-0.14619939029216766,0.09139107167720795,0.13635683059692383,0.05665895342826843,0.09938369691371918,0.0566672757267952,-0.003765272442251444,-0.0971265435218811,-0.0339093841612339,0.07542171329259872,0.04183303937315941,0.09948033094406128,0.09071458876132965,0.0019912123680114746,0.01440155878663063,0.06914587318897247,-0.012019283138215542,-0.12977778911590576,-0.09158279746770859,-0.15228140354156494,-0.02056172303855419,0.14564363658428192,-0.019312825053930283,-0.12765102088451385,0.10777980089187622,-0.1041499525308609,-0.14664168655872345,-0.03577950596809387,0.09597122669219971,-0.019362086430191994,0.03578382357954979,0.05872267857193947,-0.0004340654122643173,0.11931522935628891,0.0037662202958017588,-0.022186005488038063,0.05099363252520561,0.04001236334443092,0.1477402299642563,0.0427100770175457,0.03128307685256004,-0.1387859433889389,0.11976668238639832,0.12395509332418442,-0.07237465679645538,-0.08769010007381439,-0.0839620977640152,-0.032700058072805405,-0.14017455279827118,0.043502967804670334,-0.10456982254981995,-0.1492542177438736,-0.0925300121307373,0.047301389276981354,0.13775771856307983,-0.018490761518478394,0.12860271334648132,0.08650358766317368,-0.05878712981939316,-0.04643743485212326,-0.10974190384149551,-0.03825206682085991,0.08817362040281296,-0.01566697284579277],[-0.07132849842309952,0.04728158935904503,-0.023748058825731277,-0.11169548332691193,0.030616512522101402,0.10461998730897903,-0.06074143946170807,0.034751858562231064,-0.145038902759552,0.0258781760931015,-0.12807925045490265,-0.03343679755926132,0.06029064580798149,0.11777803301811218,-0.1274430751800537,-0.10101288557052612,-0.011922000907361507,0.06321529299020767,0.02013944648206234,0.14295311272144318,-0.029983343556523323,0.12308026850223541,-0.1187257394194603,0.0368523895740509,0.1379769742488861,0.00937182642519474,-0.007063946686685085,0.07836441695690155,-0.04315383732318878,-0.12668582797050476,0.016902094706892967,-0.15041345357894897,-0.062226127833127975,0.14689163863658905,-0.079046331346035,0.04021035507321358,0.059968579560518265,0.022409122437238693,-0.045034319162368774,0.027916891500353813,-0.10211768001317978,0.12070365250110626,0.03198125585913658,0.029404450207948685,-0.04665159806609154,-0.13710765540599823,-0.010003840550780296,-0.08607892692089081,-0.08746878057718277,0.03336326777935028,-0.01904057152569294,-0.15441514551639557,-0.12018430978059769,-0.13762754201889038,0.15118733048439026,-0.09032942354679108,0.0006002647569403052,0.041068144142627716,-0.15431766211986542,-0.1293925940990448,-0.061405811458826065,-0.14986923336982727,0.13910815119743347,0.048360567539930344,0.14720885455608368,-0.08209306746721268,-0.10738377273082733,-0.13826289772987366,-0.14632035791873932,0.006282141897827387,-0.11702747642993927,-0.0001950207952177152,-0.06296917796134949,-0.08724470436573029,-0.09790147095918655,0.004856649786233902,0.0740218535065651,0.04695969820022583,-0.0947185531258583,0.10744490474462509,0.11673535406589508,-0.1409061998128891,0.09737233817577362,-0.07909756153821945,0.014237558469176292,0.06008649989962578,0.1029028668999672,0.052744749933481216,-0.1272655576467514,-0.028770707547664642,0.11016541719436646,0.05518481507897377,-0.07016460597515106,-0.06259731203317642,-0.11124210059642792,0.11199843883514404,0.11918925493955612,0.08913769572973251,-0.14136198163032532,-0.07162345200777054,-0.034812454134225845,-0.12270848453044891,0.0578731968998909,-0.11402101814746857,0.019604600965976715,0.1360563039779663,-0.0025411839596927166,0.009822205640375614,0.002530926838517189,-0.09013407677412033,-0.07575763761997223,-0.023041410371661186,0.14025846123695374,0.12495781481266022,-0.10727708786725998,0.05635746940970421,0.11228078603744507,0.09231356531381607,-0.09677287191152573,-0.0888267382979393,-0.018602609634399414,-0.03939320892095566,-0.1236642375588417,0.023399557918310165,0.07803478091955185,0.12845757603645325,0.1378452181816101,0.007090971805155277],[-0.13350729644298553,0.07608368992805481,-0.09603355824947357,0.040097676217556,-0.11693094670772552,0.03734305500984192,-0.07690255343914032,0.11178341507911682,0.05578608065843582,0.027210984379053116,-0.014376416802406311,0.11328140646219254,-0.07738670706748962,-0.132828950881958,0.041244275867938995,0.0832272544503212,-0.061168961226940155,-0.03219132870435715,-0.06681563705205917,-0.1364452987909317,-0.03805218264460564,-0.09085693955421448,-0.06909065693616867,0.07856635004281998,0.013649477623403072,0.07691051810979843,-0.11936728656291962,0.11803379654884338,-0.04835586994886398,0.052738673985004425,0.07143370062112808,-0.12285372614860535,0.12905704975128174,0.10234285145998001,0.1312398463487625,0.15717069804668427,0.1101793497800827,0.1434960663318634,0.019939668476581573,0.015247653238475323,-0.132036492228508,0.1049477830529213,0.0471164733171463,0.0865250751376152,0.0569729208946228,0.03571241721510887,0.04141739755868912,0.03456463664770126,-0.10784145444631577,0.09095637500286102,0.04624386876821518,0.06965290755033493,0.04309700056910515,-0.07108048349618912,-0.034881364554166794,0.08301462978124619,-0.08744660764932632,-0.021595841273665428,0.0913621336221695,-0.023862244561314583,0.02364182285964489,0.14973512291908264,0.06521761417388916,-0.07581745088100433,0.12206137180328369,-0.14893794059753418,-0.11114068329334259,-0.025668568909168243,0.02172585017979145,-0.04479445517063141,-0.06864430755376816,-0.03854602575302124,-0.03898940235376358,-0.14247384667396545,-0.12932151556015015,0.1287394016981125,0.033310405910015106,-0.09020859748125076,-0.13299299776554108,-0.05943327397108078,0.14428313076496124,-0.046961911022663116,-0.025039153173565865,-0.031013282015919685,0.0809701606631279,0.11304514110088348,0.09419095516204834,-0.03764553368091583,-0.0500602051615715,0.13024619221687317,0.15444494783878326,-0.13890314102172852,-0.03213043138384819,-0.11346200853586197,-0.09801007807254791,-0.04311176761984825,0.05092250183224678,-0.08947732299566269,0.16511264443397522,0.03522825986146927,0.11533712595701218,-0.015128789469599724,-0.03300994262099266,0.02017500437796116,-0.09515455365180969,-0.007407695986330509,0.01367689948529005,0.057332031428813934,0.025218557566404343,0.03995656222105026,-0.01687091961503029,0.08824792504310608,0.03697436675429344,-0.00717793358489871,-0.1647704392671585,0.09562667459249496,0.10327059030532837,-0.05326618626713753,0.11806647479534149,-0.11080972850322723,0.11461871862411499,0.12720169126987457,0.16415905952453613,-0.13861438632011414,0.01750119961798191,-0.04605436697602272,-0.11610446125268936,-0.0737350583076477],[-0.0037586307153105736,0.05688080936670303,-0.005215932615101337,0.10768803209066391,-0.12170553207397461,-0.029472943395376205,-0.0053861504420638084,-0.0631677582859993,0.13728617131710052,-0.05158333480358124,0.09207553416490555,0.10130304098129272,0.0905393585562706,0.03788505494594574,0.03294519707560539,-0.1176677718758583,-0.01738358475267887,0.05055754631757736,-0.0810026079416275,0.1397801786661148,-0.11204514652490616,-0.021616779267787933,0.10532360523939133,-0.1335204392671585,-0.025945033878087997,0.016707366332411766,0.10494301468133926,-0.1459861397743225,0.02569161355495453,-0.0764511376619339,0.13164420425891876,-0.14246471226215363,0.16028110682964325,0.16191063821315765,-0.08058420568704605,0.005296539515256882,0.04717390611767769,0.03900621086359024,-0.10043104737997055,0.059227123856544495,-0.06604312360286713,-0.05194846913218498,0.11318694800138474,-0.054285164922475815,-0.1367618441581726,0.014767257496714592,0.11820956319570541,0.0047027431428432465,0.0938272476196289,-0.13033650815486908,0.009036244824528694,-0.11494439095258713,-0.11970382928848267,-0.030345581471920013,0.10598144680261612,0.05206293612718582,0.14530238509178162,0.03611188754439354,0.0036844557616859674,0.0929831936955452,0.08487029373645782,-0.05767356604337692,-0.11718300729990005,0.005293222144246101,-0.08004274219274521,0.1414160281419754,-0.10224538296461105,-0.12381982058286667,0.01509364414960146,-0.006577783729881048,-0.029173782095313072,-0.06344044208526611,0.07638842612504959,0.08659975975751877,0.0036450352054089308,-0.11988901346921921,-0.100031279027462,0.0797680914402008,-0.04377400502562523,0.07788830995559692,0.13440486788749695,-0.08571401238441467,-0.13447478413581848,-0.00551973981782794,0.0020347621757537127,-0.1290590912103653,-0.0917341411113739,-0.05043918266892433,-0.12155387550592422,-0.10127907246351242,-0.15305550396442413,0.059985555708408356,-0.07291091233491898,-0.03328508511185646,0.051637038588523865,0.01267231721431017,-0.14497750997543335,0.01468989159911871,-0.148832768201828,0.10363586246967316,-0.05432737246155739,0.048461899161338806,0.007212646305561066,0.15341567993164062,0.1189347431063652,-0.11400648951530457,-0.01979030668735504,0.0655539333820343,-0.04709286242723465,0.009829393588006496,-0.0446423664689064,0.09748583287000656,0.010225676000118256,0.030849173665046692,0.15825019776821136,-0.11541584134101868,-0.14599882066249847,-0.07115224003791809,0.08529294282197952,-0.062053363770246506,0.04637622460722923,0.16366757452487946,0.06417550891637802,-0.13074569404125214,-0.1387002319097519,0.0340106338262558,-0.11822154372930527,0.06926527619361877],[0.049875061959028244,-0.05668026581406593,0.03074088878929615,0.07400479912757874,-0.025645466521382332,-0.011500084772706032,0.04006040468811989,-0.016856394708156586,0.009077677503228188,-0.10403420776128769,0.03347761556506157,0.07396139949560165,-0.11452889442443848,0.031841907650232315,0.07088382542133331,-0.04292742908000946,-0.05196212977170944,-0.00895518809556961,-0.06982404738664627,0.106354720890522,-0.005595569498836994,0.15145070850849152,0.0805150717496872,-0.12052182853221893,-0.06254855543375015,-0.026923276484012604,-0.04777753725647926,0.05912066251039505,-0.06229959800839424,-0.14424371719360352,-0.13134312629699707,0.13356944918632507,0.04393673688173294,0.1051926463842392,-0.08293567597866058,0.15079279243946075,0.049563318490982056,-0.0666397288441658,-0.1369180530309677,-0.056787148118019104,0.16121062636375427,0.013005516491830349,-0.003949284553527832,-0.127102792263031,-0.08851123601198196,-0.012846986763179302,-0.02325056679546833,-0.12479984015226364,-0.11259757727384567,0.11871493607759476,-0.014400283806025982,-0.12137726694345474,-0.12209311872720718,0.14559735357761383,0.10169143974781036,-0.12342724204063416,0.08813107758760452,-0.04372229427099228,-0.10791411250829697,-0.03464308753609657,0.0746455267071724,-0.11291847378015518,0.11165717989206314,0.1138424500823021,0.15385913848876953,0.09279483556747437,0.05634555220603943,0.11464014649391174,0.13892726600170135,-0.13390237092971802,0.14468476176261902,0.11858589202165604,0.0800337865948677,-0.09303759783506393,0.0749097615480423,0.1582871675491333,0.09022286534309387,-0.042195938527584076,-0.093485027551651,0.05519350990653038,0.09765487164258957,0.015875069424510002,0.1507003903388977,-0.1106671467423439,0.047921426594257355,0.08670585602521896,-0.053931768983602524,0.016142219305038452,0.03907240554690361,-0.017310021445155144,0.08951346576213837,0.1310318410396576,0.13924647867679596,0.11010968685150146,0.03267202153801918,-0.09299509972333908,0.02033797837793827,0.16057752072811127,0.07394687831401825,0.07477891445159912,-0.10488896071910858,-0.10222861170768738,-0.1422228217124939,0.16260993480682373,0.09815464913845062,0.13489921391010284,0.09817923605442047,0.12033455818891525,-0.0054494356736540794,-0.06554368883371353,-0.007543167099356651,-0.08355498313903809,-0.015072626993060112,0.06890882551670074,0.0684276893734932,0.03452121093869209,-0.09896282106637955,0.017967669293284416,-0.07943636924028397,-0.1168171614408493,0.05737360194325447,-0.08901084959506989,-0.00832840334624052,-0.11732511967420578,0.06948043406009674,0.08520378172397614,-0.1240757554769516,-0.11396012455224991],[0.0525294691324234,-0.021323183551430702,0.033790670335292816,0.09484533965587616,0.013627130538225174,0.010713369585573673,-0.07963602989912033,-0.07848089188337326,-0.12611573934555054,0.1251688450574875,-0.019086988642811775,-0.0746258795261383,-0.06389638781547546,0.12748591601848602,0.11777088791131973,0.10660243779420853,0.047735027968883514,-0.09881603717803955,-0.002354887081310153,0.007538291160017252,-0.08507389575242996,-0.033298347145318985,-0.04597817361354828,0.06593698263168335,0.043201640248298645,0.029814938083291054,-0.13165591657161713,-0.007598865311592817,0.1157800629734993,-0.04402008280158043,0.06449290364980698,-0.07212285697460175,-0.08085647970438004,-0.052963417023420334,0.1489330530166626,0.006985839921981096,-0.10776086151599884,-0.029153864830732346,-0.01702885702252388,-0.008616628125309944,-0.1323762685060501,-0.12089254707098007,-0.1284603327512741,-0.10157641768455505,-0.09296693652868271,-0.07827664911746979,-0.15274544060230255,-0.05259222909808159,0.06996684521436691,-0.004665147978812456,-0.04092899337410927,0.10287779569625854,-0.001408828771673143,-0.0979529395699501,-0.14416679739952087,0.015450353734195232,0.10764053463935852,-0.09662142395973206,-0.09529978036880493,-0.015386456623673439,0.005779951345175505,-0.1485936939716339,-0.023397451266646385,-0.08428891003131866,0.015644097700715065,-0.02183808758854866,-0.03663519024848938,-0.04045417532324791,0.13911962509155273,0.10292041301727295,0.10612837970256805,0.12849390506744385,0.0491262786090374,-0.018164612352848053,0.03851699084043503,-0.13776634633541107,0.019866615533828735,0.09987574070692062,-0.021947680041193962,0.07698420435190201,0.07917245477437973,0.10437952727079391,-0.11692462861537933,-0.06456541270017624,0.1212802454829216,0.1164415180683136,-0.11218978464603424,-0.0845290943980217,0.13594014942646027,0.022268518805503845,0.0732383206486702,0.06760482490062714,-0.05721516162157059,-0.004461148753762245,-0.13183487951755524,-0.03724206984043121,-0.05140751972794533,0.13205616176128387,-0.0779782384634018,0.021647904068231583,-0.04634822532534599,0.03658842667937279,-0.04390205442905426,-0.1523302048444748,0.1342570036649704,-0.06550171971321106,-0.087343730032444,0.14222820103168488,0.14240063726902008,0.05191795155405998,0.025609508156776428,-0.07532720267772675,0.15012718737125397,-0.102890245616436,-0.05857473984360695,0.00800488330423832,-0.14644038677215576,-0.0025073974393308163,-0.03090818040072918,-0.10823629051446915,0.0476546548306942,-0.15224553644657135,0.08554449677467346,-0.13684311509132385,-0.13732817769050598,0.06770715862512589,-0.060907021164894104,0.025505073368549347],[-0.024966860190033913,0.06741905957460403,-0.07613535225391388,-0.005840624682605267,0.1499330997467041,0.0586758591234684,0.07390469312667847,-0.06486428529024124,-0.13764533400535583,0.09841995686292648,0.017521018162369728,-0.03128190338611603,-0.018248656764626503,-0.07024938613176346,0.11571072787046432,0.020976176485419273,-0.10421127080917358,0.1074477955698967,0.14337630569934845,0.13160361349582672,0.0456286258995533,0.10297689586877823,0.029679207131266594,0.0071235233917832375,-0.09948207437992096,0.0036267407704144716,0.011522584594786167,-0.14583219587802887,0.0803685337305069,0.07017261534929276,-0.027693577110767365,-0.01095607504248619,-0.002843237016350031,0.08249561488628387,-0.14513054490089417,-0.005153623875230551,-0.05252678319811821,-0.006079637911170721,-0.07995134592056274,0.10403336584568024,-0.1356515884399414,0.05169909819960594,0.1316928267478943,0.10721467435359955,0.06043777987360954,0.12398166954517365,0.059620581567287445,-0.03421713039278984,0.14311686158180237,-0.11979909241199493,-0.016837697476148605,-0.0626613050699234,-0.12313815206289291,-0.050836578011512756,0.03183050826191902,0.11752454936504364,-0.07642411440610886,0.1093040257692337,-0.122072234749794,0.06231248751282692,0.013667833060026169,0.08159966766834259,-0.04931076243519783,0.1299632042646408,-0.14808595180511475,-0.16193027794361115,-0.06441296637058258,-0.01674657315015793,0.009203417226672173,-0.05187823623418808,-0.15731015801429749,-0.031227294355630875,0.15120525658130646,-0.007316092029213905,-0.12031722813844681,-0.07187169045209885,-0.1209021657705307,-0.10485764592885971,-0.019959671422839165,-0.0698312371969223,-0.12197350710630417,-0.03890484198927879,-0.07423000782728195,-0.01513963844627142,0.10809583216905594,-0.040196310728788376,0.004198815673589706,0.05766965448856354,0.14529173076152802,0.029208345338702202,0.07884088903665543,0.09888974577188492,0.028453035280108452,0.019988015294075012,0.10871036350727081,-0.05737409368157387,0.03949512913823128,-0.013202741742134094,0.014791530556976795,0.11304229497909546,-0.10364130884408951,-0.053391750901937485,-0.14095677435398102,0.0026841233484447002,-0.08027781546115875,0.1296248883008957,0.06573386490345001,-0.08882065862417221,-0.118138387799263,0.07722290605306625,0.0718664601445198,-0.01701933704316616,0.07682232558727264,-0.05146222189068794,0.03856949880719185,-0.011248544789850712,0.036726102232933044,0.06765768676996231,0.03384275734424591,-0.03585324063897133,-0.10255727916955948,-0.015624203719198704,0.07257770746946335,0.012546264566481113,0.09518353641033173,0.09340309351682663,-0.01087856199592352,0.07749462872743607],[-0.005593497771769762,0.051061272621154785,0.017747042700648308,0.06795594096183777,0.04164699465036392,-0.06352132558822632,0.07969579845666885,0.1076699048280716,0.07217820733785629,0.05165257304906845,0.07936619222164154,0.048264287412166595,0.14423875510692596,-0.0034220435190945864,0.09655550122261047,0.0443369559943676,-0.11292461305856705,-0.09215760231018066,-0.10339564085006714,-0.0498453825712204,-0.0294029600918293,-0.09937367588281631,0.10162830352783203,0.09697102010250092,0.09052493423223495,0.044290393590927124,-0.08449862152338028,-0.05114177614450455,-0.07573399692773819,-0.10650444030761719,-0.03431329503655434,-0.027016496285796165,0.02911718375980854,-0.1522553265094757,0.14385177195072174,0.1325952410697937,0.08312597870826721,-0.024614103138446808,0.13794800639152527,0.1444147676229477,-0.15768061578273773,-0.13936924934387207,-0.06769825518131256,-0.1494787335395813,-0.07876135408878326,0.05614564195275307,-0.0596427246928215,-0.13165432214736938,-0.11587633192539215,0.05150019749999046,0.03374965861439705,0.028507716953754425,-0.11878181248903275,-0.1050228551030159,0.13170719146728516,0.14131440222263336,0.01403037365525961,-0.022545136511325836,0.1434585601091385,-0.026302877813577652,0.00485214963555336,0.13016477227210999,0.10729129612445831,0.05883321166038513,0.1382737010717392,-0.15639717876911163,0.13346339762210846,-0.05362166091799736,0.11148549616336823,0.09151507169008255,0.012820123694837093,-0.03875698894262314,-0.0587337464094162,0.03855869546532631,-0.07537573575973511,0.10672628879547119,0.034467846155166626,-0.11212655156850815,0.126598060131073,-0.054652974009513855,-0.0006546221557073295,0.03677134960889816,-0.09369133412837982,0.14516761898994446,0.14225132763385773,-0.04657707363367081,-0.09901539981365204,-0.07343398779630661,-0.08239327371120453,-0.07107862085103989,0.022123554721474648,0.13225340843200684,0.03730841353535652,0.011159619316458702,0.019260616973042488,-0.08220252394676208,-0.10643427073955536,-0.11439507454633713,0.00493778008967638,-0.13887591660022736,0.14106297492980957,-0.13089008629322052,0.010608813725411892,0.07587588578462601,-0.08866356313228607,-0.1315659135580063,0.03942982479929924,0.11220833659172058,0.0927819237112999,-0.03690549358725548,-0.08652015030384064,0.03430209308862686,0.14178180694580078,-0.029223445802927017,-0.05760570243000984,-0.09035775065422058,0.004103025421500206,-0.12064449489116669,0.02343079075217247,0.02906925417482853,0.12710224092006683,0.004107838962227106,-0.05328227952122688,-0.06807944923639297,0.04373306408524513,0.013834211975336075,-0.038829412311315536,-0.10252828896045685],[-0.11901433765888214,0.03813585638999939,-0.06035862863063812,0.09701679646968842,0.034692563116550446,0.13565807044506073,-0.03839001804590225,-0.11543141305446625,0.0045567406341433525,-0.04910474270582199,-0.0341055691242218,-0.07649850100278854,0.034143105149269104,-0.0018340179231017828,-0.005142544396221638,0.12034892290830612,-0.1428457647562027,-0.07782438397407532,-0.07552841305732727,-0.06994874775409698,0.02156660705804825,-0.0793975442647934,0.020481161773204803,-0.11478780210018158,-0.116566501557827,-0.05209139361977577,-0.0183635875582695,0.15020118653774261,0.0025988442357629538,0.058628521859645844,-0.09334578365087509,0.10863883793354034,-0.1260158270597458,0.1072058379650116,-0.14189162850379944,0.049926429986953735,0.043854352086782455,-0.10433977097272873,-0.0808887705206871,-0.048074886202812195,0.03166033327579498,-0.08597168326377869,0.1608542650938034,0.056553419679403305,0.008229647763073444,-0.1323525756597519,-0.03654319792985916,-0.06949181854724884,0.001335484441369772,-0.036254994571208954,-0.004050926771014929,-0.1092243567109108,0.11749662458896637,-0.13089990615844727,0.1415306180715561,-0.04894308000802994,-0.14574046432971954,0.08191369473934174,-0.01343643106520176,-0.03335581719875336,-0.029890377074480057,0.1472543179988861,0.09480274468660355,-0.0539277009665966,0.056324154138565063,0.04642590880393982,0.12645404040813446,-0.005550445523113012,-0.14092949032783508,-0.06136022508144379,0.10763805359601974,0.029535366222262383,-0.11959299445152283,-0.023909371346235275,-0.14058779180049896,-0.05349474772810936,0.1053917407989502,0.1457335203886032,-0.06412886083126068,0.09697169065475464,-0.0363161675632,0.03497064486145973,-0.06556342542171478,-0.07390932738780975,-0.07627205550670624,-0.05043983459472656,0.12269091606140137,0.12540751695632935,0.0912107452750206,0.00957554206252098,0.12247905135154724,0.04326700419187546,-0.1539657562971115,0.04886682331562042,0.12563681602478027,0.10574156045913696,-0.06398215144872665,0.08105018734931946,0.059121500700712204,0.1283455640077591,-0.03272488713264465,0.1336030215024948,0.1307700276374817,0.10826089978218079,0.05908750370144844,0.1273566037416458,-0.0034640717785805464,0.16129735112190247,-0.11653740704059601,-0.08880535513162613,-0.07885316759347916,0.07307112962007523,-0.09383906424045563,0.11995602399110794,0.017022324725985527,-0.01965116336941719,0.09273848682641983,-0.03877396136522293,0.13580358028411865,-0.14324156939983368,-0.10958171635866165,-0.0981443002820015,0.1433427631855011,-0.016652505844831467,0.08844490349292755,-0.1075034886598587,0.13448557257652283,0.06527438014745712],[0.09152895957231522,0.08074042946100235,0.06583201885223389,0.05528682470321655,0.04870523512363434,0.0138909462839365,0.022702490910887718,-0.12440378218889236,-0.1005488783121109,0.13548782467842102,0.1182439848780632,-0.060078807175159454,0.11741597950458527,0.12937770783901215,0.08938495814800262,0.09690438956022263,-0.09207924455404282,-0.004766662605106831,-0.0777808204293251,0.05791488662362099,-0.13136538863182068,0.13914082944393158,-0.0446573942899704,-0.06972053647041321,0.01590614952147007,0.14050273597240448,-0.1609429270029068,0.07349521666765213,0.028535237535834312,0.018754586577415466,-0.07222224771976471,-0.038360610604286194,-0.042316995561122894,-0.01895076036453247,0.03424331173300743,-0.0548274852335453,-0.09917186945676804,0.02831297740340233,0.08971663564443588,0.13137730956077576,0.07373256236314774,-0.09838007390499115,-0.03400077298283577,-0.01663728803396225,-0.04475870355963707,0.0411316342651844,0.014261064119637012,0.08677534759044647,0.00021728637511841953,0.08582183718681335,0.04885980114340782,-0.12805581092834473,0.06562834233045578,-0.09538181126117706,0.11631672829389572,0.05688222497701645,0.09193818271160126,0.10297572612762451,-0.10394897311925888,0.010653730481863022,-0.04970686510205269,0.09194368124008179,-0.091404490172863,0.027425944805145264,-0.10889475047588348,0.04644395411014557,-0.1274266242980957,0.013342558406293392,-0.06116461008787155,-0.006789287552237511,0.031090350821614265,-0.12338259816169739,0.04011918976902962,0.024175867438316345,0.0445818230509758,-0.08104157447814941,-0.0029229088686406612,0.12511801719665527,0.11379887163639069,-0.11688157171010971,-0.010045674629509449,0.01064336858689785,0.13454419374465942,0.13446497917175293,-0.06693390011787415,-0.01513764914125204,0.09956441074609756,-0.13963443040847778,-0.04085143283009529,0.018472880125045776,-0.05092744529247284,0.09228140115737915,0.04064325988292694,0.04540408030152321,0.08510061353445053,0.07232197374105453,-0.13412214815616608,-0.014415853656828403,-0.12434987723827362,-0.040988367050886154,-0.03241050988435745,-0.1258082240819931,-0.14394360780715942,0.13016413152217865,-0.062495723366737366,-0.13324671983718872,-0.020803308114409447,0.03456958755850792,0.05547196418046951,0.04180947318673134,0.05349155142903328,-0.09639282524585724,0.12729430198669434,-0.003919323906302452,-0.07094147056341171,0.038781020790338516,-0.1424553245306015,0.09535905718803406,-0.013391192071139812,0.06650703400373459,-0.009052169509232044,0.11183848232030869,0.11952938884496689,-0.11152612417936325,0.11652502417564392,-0.0569281131029129,0.004636091645807028,0.09329774230718613],[0.053072959184646606,0.06030837446451187,-0.026001714169979095,0.07429462671279907,0.042671412229537964,-0.06320682913064957,0.08833037316799164,0.04676495119929314,0.09271407127380371,0.10623583942651749,-0.14312365651130676,-0.029491296038031578,0.0898718386888504,0.11214368790388107,-0.13857726752758026,-0.08767637610435486,0.06068253144621849,0.11380815505981445,-0.10846775025129318,-0.07240933924913406,0.08509369194507599,-0.05118011683225632,0.0406922772526741,0.055628761649131775,-0.052304886281490326,0.12666389346122742,0.08794616907835007,-0.0787699893116951,0.06575341522693634,0.09005414694547653,-0.12261774390935898,0.018797149881720543,0.11890526860952377,0.14834143221378326,-0.07936480641365051,-0.041857875883579254,-0.13115377724170685,0.13576214015483856,-0.10069997608661652,0.13112099468708038,0.017292657867074013,-0.12188868969678879,0.04764947667717934,-0.07478147000074387,-0.09815254807472229,-0.029376128688454628,-0.10648732632398605,-0.04321891814470291,-0.10606428235769272,-0.11244724690914154,0.06849820166826248,-0.02254476025700569,-0.10341421514749527,-0.03689947724342346,0.05142420530319214,0.04034300893545151,-0.11272688210010529,-0.0066840555518865585,0.09726271033287048,-0.05605727434158325,-0.07511360943317413,0.09209053963422775,0.1110207736492157,-0.0034555564634501934,-0.006680146791040897,-0.01577959582209587,-0.05383311212062836,0.08332424610853195,-0.06765252351760864,-0.06177213042974472,0.004371517803519964,0.05663594976067543,0.143156036734581,-0.004895430989563465,-0.06935067474842072,-0.04944451525807381,-0.02399229258298874,-0.028873510658740997,-0.060599807649850845,-0.09219732135534286,0.0762968584895134,0.11589580029249191,0.11060822010040283,0.047237757593393326,-0.1239786222577095,-0.03873685002326965,0.08996614813804626,-0.12700682878494263,0.13059759140014648,-0.04453295096755028,0.035903412848711014,-0.12123070657253265,0.035020653158426285,-0.10174976289272308,-0.10991816967725754,-0.006665010470896959,-0.15038804709911346,0.0925835371017456,-0.10628829896450043,0.03341025859117508,0.03708532825112343,0.119207963347435,0.0743238776922226,0.03388657048344612,0.037079840898513794,-0.1042066216468811,-0.08005664497613907,0.10370927304029465,-0.08957571536302567,-0.04318299517035484,-0.13494914770126343,0.1046917736530304,0.0829748585820198,0.11595026403665543,0.04761946573853493,0.08191128075122833,0.08792934566736221,-0.08870356529951096,0.0901489406824112,0.11885784566402435,-0.09599914401769638,0.10044488310813904,-0.06546012312173843,0.0339408814907074,-0.1305244266986847,0.11145699769258499,-0.13392473757266998,0.1218133196234703],[0.12473969161510468,-0.08063065260648727,0.0536063089966774,-0.09171248972415924,-0.08869527280330658,-0.057405535131692886,0.10903052985668182,0.13465583324432373,-0.0980599969625473,-0.012226416729390621,-0.12666837871074677,0.08922658115625381,-0.07017866522073746,0.01700570061802864,0.053210653364658356,0.004273810889571905,-0.0032898192293941975,0.03454858437180519,0.1041933074593544,0.031467124819755554,0.02303795889019966,0.1020311564207077,-0.10849054902791977,-0.06860797852277756,-0.12440713495016098,0.04982895776629448,-0.002442030468955636,-0.0872405618429184,0.14294558763504028,-0.0465325191617012,-0.128715381026268,-0.1358221173286438,0.0865706205368042,0.02813372202217579,-0.025050239637494087,-0.06553467363119125,0.15078285336494446,-0.13171735405921936,-0.12478940188884735,-0.051878515630960464,-0.12201541662216187,-0.009866118431091309,-0.003063629614189267,0.11045973002910614,-0.026749733835458755,-0.04084077477455139,-0.11277860403060913,0.05839690566062927,0.05344224348664284,0.11674351990222931,-0.06085313484072685,-0.028635535389184952,0.07534302771091461,0.08252163976430893,0.13525696098804474,0.06934414803981781,0.022499874234199524,-0.09821637719869614,0.11887668073177338,0.04151645302772522,-0.048364803194999695,0.1464495062828064,0.1311282217502594,-0.03896341472864151,0.014943287707865238,0.05555509775876999,-0.11118015646934509,-0.14241130650043488,-0.02095613069832325,0.1570620983839035,-0.04430856928229332,-0.08673267066478729,-0.02305952087044716,0.06239506974816322,0.026988888159394264,-0.09340186417102814,-0.08032801747322083,-0.09185968339443207,-0.08878136426210403,-0.09581144154071808,-0.12612466514110565,0.023598849773406982,0.09293578565120697,-0.01738499291241169,-0.08872855454683304,0.04775872826576233,0.14707249402999878,0.1198369711637497,-0.03645709902048111,0.06396655738353729,-0.14179547131061554,-0.05240254104137421,0.13878817856311798,-0.12415273487567902,0.012529200874269009,-0.09027678519487381,0.09595338255167007,-0.08594940602779388,0.019547492265701294,0.13251014053821564,0.12164397537708282,0.13265401124954224,-0.1201016753911972,-0.10041047632694244,0.03696676716208458,0.014449849724769592,-0.060627713799476624,0.07467480003833771,-0.11896678060293198,0.049228716641664505,-0.11251530051231384,0.018293479457497597,-0.1519903540611267,-0.11445321887731552,-0.12875786423683167,0.0034200483933091164,-0.04735016077756882,0.0595020055770874,0.09167919307947159,-0.10246087610721588,-0.11719558387994766,0.06341003626585007,0.007470997516065836,-0.12840083241462708,-0.13013772666454315,-0.08248420804738998,0.08057878911495209,-0.11363394558429718],[-0.02586967498064041,0.1526251882314682,-0.058022044599056244,-0.01831974647939205,-0.11744221299886703,-0.14960339665412903,0.026143500581383705,-0.061131518334150314,0.024397218599915504,0.06764938682317734,-0.12722550332546234,0.1252608746290207,0.07056833058595657,-0.12282441556453705,-0.0844576358795166,-0.056841153651475906,0.08937288820743561,0.08580579608678818,-0.06454991549253464,-0.13977710902690887,-0.07195279747247696,-0.15097710490226746,-0.06833909451961517,-0.12185932695865631,0.12420658767223358,-0.13797199726104736,-0.09925001859664917,-0.12454152852296829,0.10053884238004684,-0.10571744292974472,-0.016059961169958115,-0.03962990269064903,0.02523849532008171,-0.1470946967601776,-0.13490153849124908,0.0434221476316452,0.012793827801942825,0.005650584120303392,0.11749826371669769,0.006851807236671448,-0.02641732431948185,0.04467131569981575,0.10982413589954376,0.13078777492046356,-0.056808486580848694,-0.11857419461011887,-0.041590239852666855,-0.08150704950094223,-0.13951660692691803,0.020047375932335854,-0.019312461838126183,0.13514676690101624,-0.0215262733399868,0.09227931499481201,-0.026469137519598007,-0.08435231447219849,0.008630354888737202,-0.055713094770908356,0.06963419914245605,0.10505656898021698,0.0738363042473793,0.05394044145941734,0.05869441479444504,-0.07754069566726685,0.11329330503940582,0.15089073777198792,-0.1410977691411972,-0.03694228082895279,0.0845695286989212,-0.13572967052459717,-0.11812577396631241,-0.10333302617073059,0.09651268273591995,-0.1331765204668045,0.0058574494905769825,-0.1439635157585144,-0.03436581790447235,-0.09915418922901154,0.08240125328302383,-0.01331572700291872,0.14727622270584106,-0.09901425987482071,0.05254173278808594,0.025335639715194702,0.07685215771198273,0.06884042173624039,-0.0009411770151928067,-0.08042556792497635,0.12685415148735046,-0.14880329370498657,-0.13440504670143127,0.07935227453708649,-0.11413927376270294,0.12411396205425262,0.07425041496753693,0.11830953508615494,0.07006345689296722,-0.02128666825592518,0.0876181423664093,0.08907408267259598,0.09287156164646149,-0.05883214995265007,-0.12648345530033112,-0.09686814248561859,-0.02783377096056938,0.007756374776363373,-0.05290202796459198,-0.0829600915312767,-0.017726963385939598,-0.10213322937488556,-0.10963355004787445,0.0389019213616848,0.030642738565802574,0.10713107883930206,0.08626281470060349,0.0985976830124855,-0.10413864254951477,-0.08277004957199097,0.08277353644371033,-0.021347112953662872,-0.03648338094353676,0.06845381110906601,-0.001091229496523738,0.014786740764975548,0.09226445853710175,-0.13481050729751587,0.08794710040092468,-0.1238856166601181],[0.11245694011449814,-0.04138104245066643,-0.08953353017568588,-0.03376707807183266,0.12722572684288025,-0.10445539653301239,0.019637130200862885,0.12917561829090118,-0.09467287361621857,0.05882894992828369,0.07295003533363342,0.14419497549533844,-0.057217784225940704,0.1513247936964035,-0.14034433662891388,0.08603426069021225,0.1448790282011032,-0.04167487099766731,-0.031347353011369705,0.01096265111118555,-0.027345675975084305,-0.14087459444999695,0.09531722217798233,0.14152483642101288,0.14730115234851837,-0.08533193171024323,-0.13758698105812073,0.026563148945569992,-0.07682910561561584,-0.14462076127529144,-0.11400565505027771,0.13805773854255676,-0.07957521826028824,0.1112334132194519,-0.1087062656879425,-0.08608998358249664,0.07732931524515152,-0.14948740601539612,0.08626554161310196,0.04582250490784645,0.15102113783359528,-0.06280836462974548,-0.16360430419445038,-0.11703106015920639,-0.1296810358762741,-0.11349180340766907,-0.03486614301800728,0.09538823366165161,-0.11134885996580124,0.13386215269565582,0.14080193638801575,0.08672744035720825,0.10064240545034409,0.020368564873933792,0.08460555225610733,0.08646944910287857,-0.09340503811836243,0.10668870806694031,0.04207245633006096,0.12937895953655243,-0.07877172529697418,-0.1112782433629036,-0.06077589467167854,-0.03928646817803383,0.14278027415275574,0.12923790514469147,0.14248931407928467,-0.0064513846300542355,-0.10768423974514008,-0.07311038672924042,0.1160183846950531,0.06142262741923332,-0.013316693715751171,0.09951487183570862,-0.1401650607585907,0.07845130562782288,-0.047322556376457214,0.021840838715434074,0.021173177286982536,-0.03520284220576286,-0.0825776606798172,-0.13821129500865936,-0.02186492085456848,0.09015758335590363,0.1451682448387146,-0.08151835948228836,-0.01565440744161606,-0.08371758460998535,0.1013825312256813,0.0018952711252495646,0.11973869800567627,0.023718127980828285,0.08595938980579376,-0.07930617779493332,0.04009168595075607,-0.12011656910181046,0.12893423438072205,-0.0017932791961356997,0.12228980660438538,0.0854213610291481,0.04477117583155632,0.10885927081108093,-0.019707102328538895,0.1491987109184265,-0.07324328273534775,-0.06753116846084595,-0.021979376673698425,-0.15266408026218414,-0.12170646339654922,-0.09773177653551102,-0.041089512407779694,0.016894109547138214,0.06760191917419434,0.14392226934432983,0.08219964057207108,0.10891541838645935,0.11555236577987671,0.1140836849808693,-0.07586020231246948,-0.08569824695587158,-0.029323557391762733,-0.09730643033981323,-0.11574091762304306,-0.04335801675915718,-0.13838042318820953,0.13488836586475372,-0.04843679070472717,0.10913160443305969],[-0.09077077358961105,0.12120921164751053,0.06568891555070877,-0.0888153538107872,-0.1364213228225708,0.14595796167850494,0.11983240395784378,0.13489098846912384,-0.08351550996303558,0.06316984444856644,-0.11399821192026138,0.006163772661238909,-0.015608474612236023,0.06846661120653152,-0.09687133878469467,0.04165756329894066,-0.10006225109100342,0.14396266639232635,0.11457294225692749,0.06301974505186081,0.07404818385839462,0.018247203901410103,0.02098604291677475,-0.14983844757080078,-0.13176168501377106,-0.046286530792713165,-0.1104983538389206,0.008131816051900387,-0.07284781336784363,0.05137583985924721,0.12859854102134705,-0.007998554967343807,-0.07220564782619476,-0.023268649354577065,-0.09991609305143356,0.012572603300213814,-0.001116352854296565,-0.07063976675271988,-0.02238054946064949,0.1337285190820694,0.03159739449620247,0.1244797557592392,-0.08975249528884888,0.1537414789199829,-0.053812652826309204,-0.015489278361201286,-0.055774424225091934,0.07694953680038452,-0.04285357519984245,0.0036021971609443426,0.07314656674861908,-0.025183500722050667,-0.04032447189092636,0.052884288132190704,0.01005338504910469,0.14611446857452393,0.07050449401140213,-0.14235754311084747,-0.12457262724637985,-0.10064060240983963,0.03791118413209915,-0.020882030948996544,0.14509247243404388,0.06895184516906738,-0.05817300081253052,0.16872335970401764,0.05036608502268791,-0.02662326768040657,-0.10698515921831131,-0.08841414749622345,-0.09522373229265213,0.006204162258654833,-0.06433136016130447,-0.08159007132053375,0.10640650987625122,-0.10546427220106125,0.1509379744529724,-0.05346836894750595,-0.04011593014001846,-0.08554499596357346,-0.03801180049777031,-0.14884255826473236,-0.07117567956447601,-0.10486838221549988,-0.05720112472772598,-0.13602644205093384,0.16341416537761688,-0.10481519252061844,0.012385222129523754,0.014142942614853382,-0.1546914428472519,0.022471092641353607,-0.05228650942444801,-0.08566242456436157,-0.10439670830965042,0.06904588639736176,0.04356778413057327,0.11254040896892548,-0.015976691618561745,-0.08639700710773468,0.13580766320228577,-0.07674811780452728,0.03763628751039505,0.14769883453845978,0.08087719976902008,0.10573288053274155,-0.03552136942744255,0.04570284113287926,0.08466614037752151,0.020880693569779396,0.14499413967132568,-0.03937226161360741,-0.09710271656513214,-0.10322960466146469,0.04874608665704727,-0.1253042370080948,0.136302649974823,-0.08289408683776855,-0.027546975761651993,-0.1401672065258026,0.14976909756660461,-0.08566737920045853,-0.12496156990528107,-0.12119962275028229,-0.07480984181165695,0.05999438092112541,-0.04295562952756882,0.1574612408876419],[-0.1447179764509201,0.07144706696271896,-0.044963572174310684,0.0505303218960762,0.04695184901356697,-0.016812918707728386,-0.041731007397174835,-0.02602975443005562,-0.03605402261018753,0.05615788325667381,-0.05275409668684006,0.03243571147322655,0.05652792006731033,-0.049613576382398605,-0.0020768633112311363,-0.00022719641856383532,-0.047385767102241516,-0.11947038769721985,0.059345636516809464,0.0725654661655426,0.13480189442634583,-0.054107293486595154,-0.08972086757421494,0.06779886037111282,-0.04555743932723999,-0.14225181937217712,0.08336581289768219,0.10202200710773468,-0.14899581670761108,-0.0013887862442061305,0.14460024237632751,-0.002246767282485962,-0.06496724486351013,0.12470328062772751,0.07896842062473297,0.02980891615152359,-0.0779326856136322,0.0016562067903578281,0.08086976408958435,0.06940620392560959,0.09487438946962357,0.018500041216611862,0.002042423002421856,-0.060504019260406494,0.04307515546679497,-0.0649893656373024,-0.13205315172672272,0.12228909879922867,-0.08841075003147125,0.032500069588422775,-0.050107985734939575,0.06321878731250763,-0.036362506449222565,-0.09750328212976456,0.10543334484100342,0.026995360851287842,0.06468982994556427,0.038701124489307404,-0.029000960290431976,-0.021138109266757965,0.1313493400812149,-0.0013896288583055139,-0.11591866612434387,0.13732746243476868,-0.10270833224058151,0.10876867175102234,0.13694560527801514,0.049419574439525604,0.0466812402009964,0.05815684050321579,0.03880475088953972,-0.050095148384571075,0.08824925124645233,-0.1177544966340065,-0.04677841067314148,-0.07298553735017776,0.03906887024641037,-0.07458389550447464,-0.010384239256381989,0.0973677858710289,0.006560356821864843,-0.10673242807388306,-0.0037062058690935373,-0.14676503837108612,0.05931831896305084,0.12552569806575775,-0.07871852815151215,-0.05815086141228676,0.1479426920413971,-0.014899559319019318,0.11876995116472244,0.13161040842533112,0.08161619305610657,-0.14906643331050873,-0.037233058363199234,0.10280448198318481,-0.14747273921966553,0.06918671727180481,-0.034211672842502594,-0.10249247401952744,0.10383522510528564,-0.07781621068716049,0.10023930668830872,-0.11602358520030975,0.003512914292514324,0.0922459065914154,0.029868828132748604,0.01370033249258995,0.1430833786725998,0.09488371759653091,-0.10697608441114426,-0.11885538697242737,-0.09688901156187057,-0.12996745109558105,0.15550430119037628,0.02132156677544117,-0.1485435664653778,0.07105104625225067,0.07734228670597076,-0.10658229142427444,-0.08359061181545258,0.12331604212522507,0.10499466955661774,0.12420452386140823,-0.11121825128793716,-0.042559362947940826,-0.02506309188902378,0.1417192816734314],[0.1286315619945526,-0.04045778512954712,-0.005218454636633396,-0.02023397386074066,0.0026396564207971096,-0.07473690062761307,0.085843525826931,-0.1309017390012741,0.021135475486516953,0.09452113509178162,0.03557705134153366,-0.061507049947977066,-0.15086089074611664,-0.12969760596752167,0.12862268090248108,-0.011254731565713882,0.0028855709824711084,0.07367805391550064,0.013543236069381237,-0.08378155529499054,0.014590337872505188,0.048042215406894684,-0.046238452196121216,-0.09588661044836044,0.026146262884140015,-0.12606345117092133,-0.07730331271886826,-0.09555437415838242,-0.05973731353878975,-0.1383960098028183,-0.038126394152641296,0.029725395143032074,0.056759633123874664,0.11033006757497787,-0.08149606734514236,0.06938809156417847,0.08323623239994049,0.04841126501560211,0.10143791139125824,0.044097043573856354,0.0882050022482872,-0.023242300376296043,0.023815805092453957,-0.036179594695568085,-0.007717818953096867,-0.07204339653253555,0.15733349323272705,0.10428766161203384,-0.048216622322797775,0.08845387399196625,0.1376093178987503,0.13387204706668854,0.1116676777601242,0.12285155057907104,0.08157067000865936,-0.11792211979627609,0.028600728139281273,0.12354109436273575,-0.04082941636443138,-0.12738676369190216,0.13567011058330536,0.08791342377662659,0.002369972877204418,0.04772239178419113,-0.004375957418233156,0.09388919919729233,0.07370642572641373,0.15164348483085632,0.08274941891431808,-0.06486009061336517,0.11550882458686829,0.1275031715631485,0.040335942059755325,-0.0997164249420166,0.07763079553842545,-0.06111894175410271,0.05382087081670761,0.06832027435302734,0.07792976498603821,-0.13805554807186127,-0.06619749218225479,-0.1475837677717209,0.05777904391288757,0.018803544342517853,0.13484330475330353,-0.10015273839235306,-0.16278137266635895,-0.06602880358695984,-0.13098283112049103,-0.12719248235225677,-0.08624494075775146,0.08996888995170593,0.006800225004553795,0.001541141071356833,-0.030885756015777588,-0.05035266652703285,-0.017468145117163658,0.11342554539442062,-0.02648688293993473,0.10519444197416306,0.0955130010843277,-0.0065889908000826836,0.10923223197460175,-0.062074948102235794,-0.03303838148713112,0.1160556823015213,-0.061738885939121246,-0.016054047271609306,0.08370675891637802,0.07947968691587448,-0.11090648174285889,-0.00033922932925634086,-0.088910773396492,0.1260536015033722,0.15820348262786865,0.03789599612355232,-0.08384083211421967,0.02212967537343502,-0.07158301770687103,0.06548630446195602,0.09392762184143066,0.0007024575024843216,0.005761501844972372,-0.030534442514181137,0.1353892982006073,-0.019981514662504196,-0.08141438663005829,-0.13795657455921173],[-0.10439010709524155,-0.024412639439105988,-0.06848499178886414,0.0186619833111763,0.11550921946763992,-0.07777862995862961,-0.05209736153483391,-0.11136322468519211,-0.07063034921884537,-0.1534132957458496,-0.10161477327346802,-0.08691734075546265,0.14867347478866577,0.020105725154280663,-0.09963012486696243,0.002919701859354973,0.03278656303882599,0.11729293316602707,-0.12341730296611786,0.11028572171926498,-0.09369600564241409,0.06865525245666504,-0.12754034996032715,-0.14887917041778564,-0.11961584538221359,0.1292409896850586,0.137485072016716,-0.029215920716524124,0.018968036398291588,-0.012501099146902561,-0.043011169880628586,-0.08819830417633057,0.16876283288002014,0.052109494805336,-0.149590402841568,0.025654923170804977,-0.1194569543004036,-0.00418244069442153,0.03316472843289375,-0.07439012825489044,0.008827583864331245,0.08325925469398499,-0.07536666840314865,-0.1529219150543213,-0.006030387245118618,0.1546083688735962,-0.0626741349697113,-0.013603412546217442,0.13108190894126892,0.0748542919754982,-0.11761703342199326,-0.12017518281936646,-0.14583636820316315,0.14542707800865173,-0.11733509600162506,0.03660941496491432,-0.02626895159482956,0.12486172467470169,-0.023748505860567093,-0.09906886518001556,-0.07407362759113312,0.13739687204360962,0.09798473119735718,0.09175117313861847,-0.038427550345659256,0.10937321931123734,-0.008109004236757755,-0.04647064581513405,0.06969286501407623,-0.07676651328802109,-0.03959191218018532,0.07187239080667496,0.15217818319797516,-0.10695759207010269,0.08326393365859985,-0.062983937561512,-0.11834651976823807,0.038662124425172806,0.02838560938835144,0.12346486747264862,-0.04818740114569664,0.13221514225006104,-0.03370458632707596,0.15260370075702667,-0.07432428002357483,-0.1406816691160202,0.0010967494454234838,0.11444045603275299,0.016806021332740784,-0.10144409537315369,-0.02423841506242752,0.11428109556436539,-0.1419401466846466,0.06577423959970474,-0.0152079863473773,0.14678718149662018,-0.03292524069547653,0.0013113185996189713,-0.12278297543525696,0.12436304241418839,0.08439796417951584,-0.03873547539114952,0.08674696832895279,-0.1282919943332672,0.006529324222356081,-0.07674193382263184,0.10627764463424683,-0.14924241602420807,-0.09576552361249924,-0.04840564355254173,0.03328605368733406,-0.007972819730639458,0.003972028847783804,-0.026811663061380386,-0.04794367402791977,0.03400756046175957,-0.1341831535100937,-0.03291149437427521,0.009071733802556992,-0.1439584195613861,0.0038379086181521416,0.11773896217346191,-0.030857224017381668,0.000560023239813745,0.0705147460103035,0.1233893409371376,-0.08954396843910217,-0.14792145788669586],[-0.10587231069803238,0.10011827200651169,-0.0874156653881073,0.08320806920528412,0.011620784178376198,0.06243833526968956,0.1408674120903015,0.1032773107290268,-0.0862513929605484,0.13931232690811157,-0.04937830567359924,0.047896891832351685,0.059189897030591965,-0.13836915791034698,-0.08108974993228912,-0.0906156450510025,-0.07567425072193146,0.12634941935539246,-0.09936101734638214,-0.10629131644964218,-0.10611513257026672,-0.09890693426132202,0.0014596962137147784,-0.05817190557718277,-0.0982934981584549,0.1580372303724289,-0.03799983486533165,0.035833027213811874,-0.020190490409731865,-0.021406348794698715,0.1544470638036728,0.1049112007021904,0.13534246385097504,0.09377652406692505,0.08573354035615921,-0.028796248137950897,0.1321985125541687,-0.14297740161418915,-0.026181858032941818,-0.11505264043807983,-0.014807124622166157,-0.006738950032740831,-0.04380878433585167,-0.036289870738983154,-0.014157304540276527,0.015096180140972137,0.023964760825037956,-0.0246584415435791,0.12596018612384796,0.10660258680582047,0.05308370292186737,-0.04755515977740288,0.02217533439397812,0.023284563794732094,0.1428363174200058,0.01775355637073517,0.08307366818189621,0.04743679240345955,0.038552239537239075,0.07035652548074722,-0.03867531567811966,-0.06400025635957718,0.0855313390493393,-0.10562679171562195,0.012461939826607704,0.13399738073349,0.01630397140979767,-0.14724770188331604,-0.051991820335388184,-0.07397019863128662,-0.12110655754804611,-0.010983843356370926,-0.04662356898188591,0.06772417575120926,-0.019419265910983086,0.12647122144699097,-0.09840110689401627,0.14996333420276642,-0.0673346295952797,-0.02391158603131771,0.10228996723890305,-0.025447184219956398,0.14873208105564117,-0.09142708033323288,-0.11002659052610397,0.07375473529100418,0.051179852336645126,-0.14188146591186523,-0.100618377327919,0.056984689086675644,0.06485920399427414,0.026455307379364967,0.16204018890857697,-0.023705722764134407,-0.14796793460845947,0.006153425667434931,0.06479545682668686,-0.09403202682733536,0.07096785306930542,-0.1155371218919754,0.037067558616399765,0.08982821553945541,-0.04851807653903961,-0.13561755418777466,-0.12125576287508011,0.06322183459997177,0.021266531199216843,0.010276252403855324,-0.02045310288667679,0.0013423821656033397,0.13384903967380524,0.00313541479408741,-0.0952039435505867,-0.042832210659980774,-0.07313832640647888,0.04958158731460571,-0.02439328283071518,0.019690699875354767,-0.15387983620166779,-0.03278175741434097,-0.05086198449134827,-0.14747531712055206,0.15547381341457367,-0.09821069240570068,0.15600745379924774,-0.13009653985500336,-0.13935530185699463,-0.1394372284412384],[0.14135347306728363,-0.10067661851644516,-0.026132578030228615,0.02227536030113697,-0.1503889262676239,-0.09373100101947784,0.09898240864276886,0.027596231549978256,-0.11550059169530869,0.1160772368311882,0.06334266066551208,-0.06186702474951744,-0.00040607055416330695,0.13263170421123505,-0.12539680302143097,-0.08239562809467316,-0.15299682319164276,0.07523836940526962,0.005450517404824495,-0.05252755805850029,-0.12840844690799713,-0.10713402926921844,-0.006292905658483505,0.09719736874103546,0.04399750009179115,-0.06085486337542534,0.12678328156471252,0.146051287651062,0.12532567977905273,-0.11625385284423828,0.07246700674295425,0.1298474669456482,-0.03504972904920578,-0.06277540326118469,0.06339952349662781,0.05840720981359482,0.051117293536663055,0.013346834108233452,-0.02379266545176506,-0.13412071764469147,0.018810240551829338,-0.06119680032134056,-0.08274073898792267,-0.031217148527503014,-0.11452790349721909,-0.16313934326171875,0.032691843807697296,-0.08089964091777802,-0.02068910002708435,-0.04066208377480507,0.03192358464002609,-0.014703374356031418,0.1365690380334854,0.08275461196899414,0.0287228524684906,0.08593852072954178,0.04051026701927185,-0.00939007755368948,0.14504429697990417,0.10805439203977585,0.06609117239713669,0.14280688762664795,-0.0711449682712555,0.09169984608888626,0.09793706238269806,-0.013481946662068367,-0.07130791991949081,0.03334886208176613,-0.07124873995780945,-0.0005048467428423464,-0.15073613822460175,-0.027135932818055153,0.10094291716814041,0.11445364356040955,-0.032273970544338226,-0.052137330174446106,-0.07424185425043106,-0.09718607366085052,-0.10420339554548264,-0.08846835792064667,0.11701337993144989,0.02722310461103916,0.05919096618890762,-0.07663009315729141,-0.05245223641395569,-0.10811709612607956,-0.10661090165376663,0.07656215876340866,0.052779421210289,0.034876514226198196,0.09340344369411469,-0.03605840727686882,0.022292664274573326,-0.14314690232276917,0.06053486093878746,-0.050501372665166855,0.10011281073093414,-0.06786687672138214,0.02897471934556961,-0.001553012290969491,-0.045014638453722,0.015862461179494858,0.014704798348248005,-0.08645223826169968,0.14100977778434753,-0.05934164300560951,0.0002328289410797879,0.09111910313367844,-0.025292400270700455,0.09345024079084396,0.10023962706327438,-0.14523014426231384,0.09098201990127563,0.089797243475914,0.008072320371866226,0.03571071848273277,0.037644047290086746,-0.0875144898891449,-0.08620009571313858,-0.13744010031223297,0.08549453318119049,-0.056113239377737045,0.11939965188503265,-0.10084597021341324,0.13301658630371094,0.12680067121982574,-0.03362159803509712,0.02783695049583912],[0.14548586308956146,0.082928866147995,0.1366136223077774,0.011055300943553448,-0.0489116907119751,-0.15632575750350952,-0.07914111018180847,-0.004385523032397032,-0.14702774584293365,-0.018414104357361794,-0.14321200549602509,0.042660266160964966,-0.09124404191970825,-0.08149616420269012,-0.021977879106998444,-0.07352405041456223,0.012455789372324944,0.14898112416267395,0.01238830853253603,0.06936119496822357,-0.07858135551214218,-0.010284103453159332,-0.1359693855047226,-0.12475976347923279,0.02868562936782837,-0.07577219605445862,-0.1458897590637207,-0.16103100776672363,0.1124863252043724,0.07838672399520874,-0.03299196437001228,-0.07391630858182907,-0.06092919036746025,0.1093376874923706,0.03245914727449417,0.01873069629073143,0.07079072296619415,-0.03613714873790741,-0.12411139160394669,-0.10909872502088547,0.01832008734345436,-0.14817215502262115,0.026583312079310417,-0.14916010200977325,-0.07055073976516724,0.045036133378744125,0.1329205185174942,-0.08826451748609543,0.000885241199284792,0.14102883636951447,0.014548046514391899,0.03482309728860855,0.07678629457950592,0.08977937698364258,-0.08851495385169983,-0.054428812116384506,0.14018890261650085,0.01484410185366869,-0.12467807531356812,0.023397771641612053,0.13379482924938202,0.15225352346897125,0.10167372226715088,-0.058108534663915634,-0.15757408738136292,-0.1310473084449768,-0.1037745401263237,0.006773228757083416,0.03192726895213127,0.041468795388936996,-0.042529910802841187,-0.09076209366321564,-0.09283503144979477,-0.014586853794753551,0.004699544049799442,0.07756422460079193,-0.03747439756989479,-0.006970220245420933,-0.021653959527611732,-0.11402785778045654,0.09478674829006195,-0.05565663054585457,0.023969868198037148,-0.11068995296955109,-0.04247485473752022,-0.0310809463262558,-0.1119656190276146,-0.12513400614261627,0.04301559180021286,0.07829555124044418,-0.007702934555709362,0.03991631045937538,0.1268416792154312,-0.1022808700799942,-0.07076765596866608,0.04000800848007202,-0.005869257263839245,0.15216420590877533,0.12055154889822006,-0.07144459336996078,0.0736474022269249,-0.06349669396877289,0.12375084310770035,-0.12526334822177887,0.07115153223276138,-0.04528697580099106,-0.14109855890274048,0.1492895632982254,-0.09551481157541275,0.14185915887355804,0.09320518374443054,-0.027970699593424797,0.018444564193487167,-0.025386925786733627,0.04759424924850464,0.08096352964639664,0.06505343317985535,0.1223626434803009,-0.10689245164394379,-0.09674392640590668,-0.005860296543687582,-0.11720994859933853,0.020246664062142372,0.0531320720911026,-0.0066952696070075035,-0.0028813499957323074,0.06107992306351662,0.07070179283618927],[-0.10923498868942261,-0.11501849442720413,-0.0935063287615776,0.08142676204442978,0.029980313032865524,0.02632301300764084,0.05226529762148857,-0.15684056282043457,0.0015800815308466554,0.12068548053503036,-0.11981802433729172,-0.14314764738082886,0.059095825999975204,0.00570934172719717,-0.14917978644371033,0.14677797257900238,-0.08791353553533554,-0.02495240606367588,-0.13465732336044312,0.009004814550280571,0.1340092271566391,0.12762457132339478,-0.02925766073167324,0.10389973968267441,0.00810358114540577,0.0684453621506691,0.01734362356364727,-0.017304126173257828,0.13936898112297058,-0.03631608933210373,0.1411280632019043,-0.08251866698265076,-0.01642882265150547,-0.0029394670855253935,0.024011479690670967,-0.10098227113485336,-0.09450192004442215,0.12780039012432098,-0.020814117044210434,0.0012515464331954718,0.06881055980920792,0.07156917452812195,0.06464651226997375,-0.09079760313034058,0.03769602254033089,-0.05910660699009895,0.07558366656303406,0.10913735628128052,-0.10912225395441055,-0.15868599712848663,0.03177464008331299,0.010587207973003387,-0.05978349223732948,0.04497501626610756,-0.036380935460329056,-0.12088391184806824,0.12077489495277405,0.0395829863846302,-0.15177254378795624,-0.08092508465051651,-0.10724935680627823,-0.10719918459653854,-0.05060970410704613,-0.07527326047420502,-0.12197551876306534,0.05131741240620613,-0.01903473772108555,-0.09406876564025879,-0.10351155698299408,-0.1542855203151703,-0.1206403374671936,-0.07554332166910172,0.10897178202867508,0.058330342173576355,0.017817296087741852,-0.08020959794521332,0.012931331060826778,-0.12184607982635498,-0.0881701111793518,-0.09414556622505188,-0.12367112934589386,0.13451968133449554,-0.09854025393724442,-0.05176328122615814,-0.07178204506635666,0.05663875862956047,0.13032439351081848,0.08367107063531876,0.10436312854290009,0.10938291251659393,-0.13086223602294922,-0.11291259527206421,0.06550177931785583,0.08083343505859375,0.04762706160545349,0.05621684715151787,-0.14018571376800537,0.027494387701153755,0.029437929391860962,-0.06944532692432404,-0.06674785912036896,0.12870138883590698,-0.08517539501190186,0.05227269232273102,-0.10817601531744003,0.003451464232057333,-0.07637353986501694,0.09274417906999588,0.03392507880926132,0.14096471667289734,0.11212316155433655,-0.04115406423807144,0.04860515892505646,-0.10973573476076126,0.11747250705957413,0.059297408908605576,-0.04838164523243904,0.01583585888147354,0.10134665668010712,0.14030008018016815,0.041183143854141235,0.036086730659008026,0.14352479577064514,-0.06858322769403458,-0.1097811833024025,0.11853506416082382,-0.005138741340488195,0.01834944076836109],[-0.060600876808166504,-0.03130688518285751,0.06203144043684006,0.026788480579853058,0.01210977416485548,0.058700352907180786,0.1379699558019638,-0.0003933109110221267,0.07198719680309296,-0.016013605520129204,-0.04866081103682518,0.10494723916053772,0.09185741096735,0.024926980957388878,0.05778522044420242,-0.04409099370241165,-0.0338636115193367,0.020118869841098785,-0.11496560275554657,0.11691997200250626,-0.01460831519216299,-0.12114962190389633,-0.0770115777850151,0.05890803411602974,0.04622731730341911,-0.14650020003318787,-0.052569109946489334,-0.13830189406871796,0.11676894128322601,-0.0971301719546318,0.016019171103835106,0.053834158927202225,0.07807143777608871,-0.05626273527741432,0.070175401866436,0.06265224516391754,0.07850899547338486,0.02256660722196102,-0.0377417616546154,-0.12528204917907715,-0.0751858726143837,0.009565375745296478,-0.06283779442310333,-0.14719073474407196,-0.023909756913781166,0.08400418609380722,0.008863317780196667,-0.061470258980989456,-0.132807657122612,-0.08863472938537598,-0.05800795555114746,-0.0743682011961937,-0.0220927894115448,0.12446990609169006,-0.10286817699670792,0.03802226483821869,0.07362233847379684,0.07220026850700378,0.03475569188594818,0.12213391065597534,-0.06710062175989151,-0.1280411332845688,0.1400400847196579,-0.09062911570072174,-0.1086418628692627,0.02558254264295101,-0.13064274191856384,-0.060142308473587036,0.0998058095574379,0.07654711604118347,0.012169367633759975,0.0851626917719841,0.04969358444213867,0.12274772673845291,0.05063176155090332,-0.008810410276055336,0.08590119332075119,0.04710015282034874,0.060330454260110855,-0.07388996332883835,0.1367620825767517,-0.041850510984659195,-0.1529911309480667,0.07630859315395355,0.021955491974949837,0.028431931510567665,-0.09425363689661026,0.13361291587352753,-0.03232846409082413,-0.0036157346330583096,-0.07426540553569794,-0.12191781401634216,-0.06770168989896774,-0.02051984705030918,0.03816430643200874,0.12726618349552155,-0.13159509003162384,-0.13752388954162598,-0.15510402619838715,0.06228901445865631,0.11697260290384293,0.07788212597370148,-0.07355132699012756,-0.04992130771279335,-0.05295540764927864,-0.07641296088695526,0.03397612273693085,0.11601930111646652,-0.08895348012447357,-0.09876997023820877,0.056621186435222626,0.043479058891534805,0.142964169383049,-0.15304112434387207,-0.008968088775873184,0.0018493578536435962,0.018101966008543968,0.03127121552824974,0.004774440545588732,-0.0448213666677475,-0.08660012483596802,0.08466862142086029,-0.13074205815792084,0.13954201340675354,-0.049516212195158005,0.11754538118839264,0.05423249304294586,-0.09837496280670166],[-0.0339796282351017,-0.06938517093658447,0.0689765140414238,0.002448381157591939,0.024578917771577835,-0.05227749049663544,-0.10139814764261246,0.1266225278377533,-0.02594652585685253,0.07230112701654434,-0.013260063715279102,-0.12208329141139984,0.019843585789203644,0.06580698490142822,0.13164755702018738,-0.1156105175614357,-0.018020937219262123,0.15029020607471466,0.026876546442508698,-0.03751096501946449,0.14557577669620514,-0.035812828689813614,-0.01580081693828106,0.15000081062316895,-0.057186149060726166,-0.0801081731915474,-0.07493007183074951,-0.016136672347784042,0.15144985914230347,-0.15869157016277313,0.06448299437761307,-0.05985702946782112,0.07184309512376785,0.0015794852515682578,0.04682090878486633,0.02466019243001938,0.0246287789195776,-0.08458670973777771,0.023225292563438416,0.025645380839705467,0.14381858706474304,-0.11042415350675583,-0.13054005801677704,-0.06688573956489563,0.04657582566142082,0.015455212444067001,0.03377562016248703,0.12566161155700684,0.06738363951444626,-0.06464462727308273,-0.039000317454338074,-0.11706794053316116,-0.02785491570830345,-0.10516790300607681,0.11323817819356918,0.1495128870010376,-0.12093330919742584,0.10977693647146225,-0.11267489194869995,-0.031296487897634506,-0.10781345516443253,-0.02801532857120037,0.06476230174303055,0.06912107020616531,0.11378362029790878,0.15019479393959045,-0.03811940178275108,0.14918865263462067,0.02855127491056919,-0.03083452768623829,0.12016383558511734,0.020850153639912605,0.012591966427862644,0.07225976884365082,0.06844168901443481,-0.08306509256362915,0.01030691247433424,0.05226072296500206,-0.11861756443977356,-0.12296650558710098,0.006754789501428604,-0.030329803004860878,0.02075401321053505,0.060465335845947266,0.11243151128292084,-0.061636291444301605,-0.02206626534461975,-0.04857081174850464,0.07983271777629852,0.010660352185368538,-0.1251436471939087,0.13226553797721863,-0.027894282713532448,0.15201617777347565,-0.020945673808455467,0.07524771988391876,-0.05329512432217598,0.08753607422113419,-0.11502767354249954,-0.07526327669620514,-0.0631796270608902,-0.09167451411485672,0.06366147100925446,0.10281349718570709,-0.069222591817379,0.0652291476726532,0.0999099537730217,0.014609615318477154,-0.04581450670957565,-0.06029297038912773,-0.023027654737234116,-0.12384231388568878,0.0014519053511321545,0.07414847612380981,-0.07311824709177017,-0.14443142712116241,0.1438836306333542,-0.03263150900602341,0.1296500563621521,0.13136611878871918,0.011998066678643227,0.018646996468305588,0.15078097581863403,0.010590947233140469,-0.1208975538611412,0.12136687338352203,-0.04452890157699585,0.08962147682905197],[0.12585042417049408,-0.013413858599960804,0.05801224336028099,0.11570558696985245,-0.021699979901313782,-0.031261805444955826,0.06545030325651169,-0.14177343249320984,-0.1306002289056778,0.05496300384402275,-0.09205586463212967,-0.1067272499203682,-0.09951401501893997,0.10674038529396057,0.10703431814908981,0.12411084026098251,0.08171217888593674,0.13157741725444794,-0.002765851328149438,-0.05837531015276909,0.14961382746696472,0.016751166433095932,-0.024937260895967484,0.004976000636816025,-0.12913653254508972,0.12032166123390198,0.14409156143665314,-0.06729666888713837,0.10665107518434525,-0.08526860177516937,0.09914354979991913,-0.12726038694381714,0.14015468955039978,-0.05615139752626419,-0.03831141069531441,0.11223220825195312,-0.11122692376375198,0.03470172733068466,0.1260058581829071,0.02254432626068592,-0.11573773622512817,-0.12020659446716309,-0.10996594280004501,0.1499457061290741,-0.00941725168377161,-0.008615341037511826,0.15769028663635254,0.1390368938446045,-0.10266795009374619,0.0819413810968399,-0.10056382417678833,-0.08950971066951752,-0.09892803430557251,0.1529642641544342,-0.10073750466108322,0.1537357121706009,0.10538487136363983,0.002240582602098584,0.1529671549797058,0.03457751125097275,-0.06482727080583572,0.04638708755373955,-0.0061514005064964294,-0.11324630677700043,0.13422995805740356,-0.0433228462934494,0.10700806230306625,0.06004440411925316,0.1056203544139862,-0.034762490540742874,-0.03469207510352135,0.0006177212344482541,0.07626396417617798,0.14571362733840942,0.001586236641742289,-0.039401039481163025,0.13171854615211487,0.03974611312150955,-0.02560502663254738,-0.028163036331534386,-0.033630065619945526,0.07103224843740463,0.007022436708211899,0.05246356502175331,-0.13361802697181702,0.09650232642889023,0.11324713379144669,-0.11209332197904587,0.06503394991159439,0.11781436204910278,-0.04863649979233742,0.07004213333129883,0.1232566237449646,-0.0971321165561676,0.019793789833784103,0.17692115902900696,-0.05227860435843468,-0.0046434663236141205,-0.0560428760945797,-0.13575276732444763,-0.0314202643930912,0.04129330813884735,0.03523998335003853,0.133717879652977,0.09332594275474548,0.0988214761018753,0.1274651736021042,0.01092482265084982,-0.14290902018547058,0.04394254460930824,-0.1427326202392578,-0.04936128854751587,0.013869949616491795,0.013535866513848305,0.09591232240200043,-0.10824242979288101,0.04285260662436485,-0.14321966469287872,-0.11820883303880692,0.14301063120365143,0.014594870619475842,-0.00461956113576889,-0.01866825483739376,0.10451468825340271,0.05133029818534851,0.03061462938785553,-0.016381895169615746,0.032772958278656006],[0.07753776013851166,0.11292651295661926,-0.07583827525377274,0.15474098920822144,0.024697210639715195,-0.04140045493841171,-0.019026068970561028,-0.07333201915025711,0.11627045273780823,0.08537827432155609,0.0790003091096878,0.15261328220367432,0.0292228851467371,0.04024292528629303,-0.09611392021179199,0.003263002960011363,0.07061503082513809,0.13185155391693115,0.0722661167383194,-0.1436464488506317,0.03084040805697441,-0.15407337248325348,0.054875753819942474,0.015193658880889416,0.11092498898506165,-0.06627754122018814,0.09125563502311707,0.0409977100789547,0.08179643005132675,-0.012010101228952408,-0.03555785119533539,0.07510123401880264,-0.0909026563167572,0.018970370292663574,-0.007908494211733341,-0.13906340301036835,-0.07208815962076187,0.061058592051267624,0.025254761800169945,0.13701415061950684,0.040197260677814484,-0.005419404245913029,0.0860663577914238,0.028342409059405327,-0.12113279849290848,0.0677499771118164,0.13286761939525604,-0.03485823795199394,-0.07496143132448196,-0.1145704984664917,0.09308841824531555,0.13263031840324402,-0.04631023481488228,-0.10011158883571625,0.08853276818990707,0.0590994767844677,0.017676712945103645,0.15313135087490082,0.08426910638809204,0.03224693238735199,0.06876201927661896,-0.028592117130756378,-0.07008259743452072,-0.13838596642017365,0.02666841447353363,0.14442580938339233,0.01137468684464693,-0.13651691377162933,-0.12361281365156174,0.07273530960083008,-0.0555364191532135,-0.10957331210374832,-0.013551490381360054,-0.14897088706493378,-0.11931399255990982,0.10609912872314453,-0.14495691657066345,0.08218515664339066,4.176382572040893e-05,0.13746896386146545,-0.00901059526950121,0.02439391054213047,-0.11503692716360092,-0.0438617542386055,0.02699512057006359,0.03007694147527218,-0.14247862994670868,0.012351300567388535,0.14581413567066193,-0.14278927445411682,-0.11202538758516312,0.008989110589027405,-0.012979895807802677,0.01848895475268364,-0.0202180203050375,0.13107268512248993,0.04140087962150574,-0.04363879933953285,0.010519236326217651,-0.14682048559188843,-0.13229618966579437,-0.05870913341641426,-0.028194010257720947,0.1208869144320488,-0.05488705635070801,0.032698266208171844,0.1668916493654251,-0.033923931419849396,0.15870337188243866,-0.1056951954960823,-0.0729132816195488,-0.0796850249171257,-0.019521230831742287,-0.13070514798164368,-0.10527908802032471,0.10304450243711472,-0.12104087322950363,0.1435604691505432,-0.1413632184267044,-0.042459867894649506,0.05175163224339485,-0.0663098394870758,0.11039996892213821,0.03514789044857025,-0.00973095279186964,0.030443161725997925,0.16670827567577362,0.1036943644285202],[0.12929517030715942,0.05963904410600662,0.06512098014354706,0.010707797482609749,0.09576885402202606,0.05717651918530464,0.14954277873039246,0.007962443865835667,-0.03078414686024189,-0.12393776327371597,0.09693998843431473,0.06032772734761238,0.10162564367055893,0.07972714304924011,0.10379990935325623,-0.13910484313964844,-0.14518855512142181,-0.08390089869499207,0.06923365592956543,0.014087528921663761,-0.12092234939336777,0.13887712359428406,-0.1332578808069229,-0.03225332871079445,0.053558021783828735,-0.0018510286463424563,-0.09695469588041306,0.09214752912521362,0.08548672497272491,0.08479241281747818,-0.09331952035427094,0.044269412755966187,-8.020669338293374e-05,0.06177028268575668,-0.13430707156658173,0.0809289962053299,-0.10883092880249023,-0.03998655825853348,0.1329718679189682,-0.060841064900159836,-0.10338232666254044,0.13080866634845734,-0.10093943774700165,-0.07865504920482635,0.11374466866254807,-0.12296910583972931,-0.06031728908419609,0.013931827619671822,-0.018283406272530556,-0.12178079038858414,0.11642956733703613,0.07288113236427307,-0.09673647582530975,0.11423229426145554,0.0025016171857714653,-0.09850971400737762,0.020510872825980186,0.07480278611183167,-0.037113554775714874,-0.12795934081077576,-0.030316753312945366,0.05383836105465889,-0.13132664561271667,0.14914874732494354,-0.014169491827487946,-0.10972029715776443,0.09173256903886795,0.1379755139350891,0.11089614033699036,0.08570721000432968,-0.023666447028517723,-0.046987321227788925,0.11778749525547028,0.09318868815898895,-0.11918923258781433,0.05881977826356888,-0.05827423930168152,0.11874754726886749,-0.00787811353802681,-0.11117732524871826,0.15679535269737244,-0.021430881693959236,0.01276526227593422,0.03542270138859749,0.03520722687244415,0.08713924139738083,-0.03869101405143738,0.12507300078868866,-0.1625739187002182,-0.11384003609418869,0.1469283103942871,0.07194320857524872,0.001771333976648748,0.13959099352359772,-0.0066379704512655735,0.03366456553339958,-0.020673109218478203,-0.06809052079916,0.006090551149100065,0.0884784683585167,0.0900292694568634,-0.0668441653251648,0.07704512774944305,-0.15432333946228027,0.06610744446516037,0.054414812475442886,0.06706386059522629,0.1146903708577156,-0.0967603474855423,-0.13656260073184967,0.035822752863168716,-0.12229674309492111,-0.08290345221757889,-0.02552005462348461,0.12930303812026978,-0.10982109606266022,0.05817105993628502,-0.08133028447628021,-0.11221222579479218,-0.12190482765436172,-0.09378668665885925,0.11752377450466156,-0.1414688676595688,-0.045177262276411057,0.1281379908323288,0.011867716908454895,-0.09426947683095932,0.0004177558294031769],[-0.04632608965039253,0.049661245197057724,0.022441979497671127,0.10415172576904297,0.14758430421352386,0.08459243923425674,-0.010638250969350338,0.14815157651901245,0.1201145201921463,-0.09591859579086304,-0.03898468241095543,0.11373317241668701,-0.08171115815639496,-0.09225845336914062,0.10341961681842804,0.14375974237918854,-0.09832479059696198,-0.14930717647075653,-0.022902438417077065,0.07138615846633911,-0.12797561287879944,-0.042308539152145386,-0.07968726009130478,0.11216367781162262,-0.07964330911636353,0.03241083025932312,-0.021170414984226227,-0.10284305363893509,0.12240246683359146,-0.03462336212396622,-0.051680248230695724,-0.11134807765483856,0.07795654982328415,-0.007394128013402224,0.004281788598746061,0.08928880840539932,0.016121044754981995,0.15131808817386627,0.07779554277658463,0.006470155902206898,-0.024720756337046623,-0.07561783492565155,-0.054632723331451416,-0.029351141303777695,-0.14577598869800568,-0.14511039853096008,-0.08123137801885605,0.032316163182258606,-0.04475012421607971,-0.12217529863119125,0.10698504000902176,-0.1430886685848236,-0.1303286999464035,-0.06874899566173553,0.05661625787615776,-0.07049277424812317,0.02782079204916954,0.06709425896406174,0.029377395287156105,0.08289321511983871,0.027566425502300262,0.14840003848075867,0.13854870200157166,-0.01675841212272644,0.09033887833356857,0.1414204090833664,0.1178780123591423,0.10090791434049606,-0.023052940145134926,0.10562800616025925,-0.08454857021570206,-0.12317266315221786,0.04136435687541962,-0.04661723971366882,-0.034852366894483566,-0.11316228657960892,-0.07439397275447845,-0.014106839895248413,-0.11230327934026718,-0.07616694271564484,-0.06167380511760712,0.0016398282023146749,0.06624765694141388,-0.04403241351246834,-0.013651492074131966,0.018148459494113922,0.10815519839525223,0.050243645906448364,-0.13789992034435272,-0.03227262198925018,-0.07146776467561722,-0.14490847289562225,-0.022183220833539963,-0.10500836372375488,0.04600821062922478,-0.007843774743378162,0.03414841368794441,-0.03311711177229881,-0.044097695499658585,-0.08107853680849075,-0.04154466837644577,-0.008536050096154213,-0.11385305225849152,-0.11929040402173996,-0.01116327103227377,0.06365540623664856,-0.1199369877576828,-0.06531158089637756,0.052089788019657135,-0.1255965679883957,-0.10876599699258804,-0.0994134321808815,-0.011350352317094803,-0.029396748170256615,-0.010834312066435814,-0.14208512008190155,0.06279569119215012,0.0064307404682040215,0.11667989194393158,0.08430780470371246,0.03640834614634514,-0.14031532406806946,0.07837966829538345,0.14235487580299377,-0.14508812129497528,0.12656989693641663,-0.013680984266102314,-0.0638427734375],[0.10774136334657669,-0.11050603538751602,0.04564262554049492,0.14790809154510498,-0.15729518234729767,-0.07239088416099548,0.010856201872229576,0.09206812083721161,0.05178896337747574,0.004740437958389521,0.018088534474372864,-0.05747507885098457,0.1405569612979889,-0.10029378533363342,0.03607555478811264,0.03469439968466759,-0.10988258570432663,0.09507038444280624,-0.01783095858991146,0.08729583024978638,0.02391797862946987,0.08306718617677689,-0.011270957998931408,-0.053514622151851654,0.02581275999546051,0.0012598356697708368,-0.006068267859518528,-0.07690424472093582,0.12728379666805267,-0.11739874631166458,0.10721983015537262,-0.06370813399553299,-0.005109110381454229,0.126027449965477,-0.07961549609899521,0.11977200210094452,-0.13682527840137482,-0.05982266366481781,0.022313786670565605,0.06218414008617401,-0.09065432101488113,-0.031050391495227814,-0.01007206179201603,0.048338714987039566,-0.15114623308181763,-0.07901708781719208,-0.07508830726146698,-0.03922360762953758,0.11737177520990372,0.04113835096359253,0.11999866366386414,0.025801341980695724,0.1309862732887268,-0.13642635941505432,-0.1283167600631714,-0.008403893560171127,0.07430484145879745,0.09776724129915237,0.013802548870444298,0.14579859375953674,-0.008852208033204079,0.1450560837984085,0.014165228232741356,-0.1509082019329071,-0.061662860214710236,-0.12044510245323181,0.1151694804430008,0.1333099603652954,-0.1313057541847229,-0.16805286705493927,0.040424708276987076,-0.06411285698413849,0.11847616732120514,0.10632139444351196,0.012711593881249428,-0.027942100539803505,0.032825443893671036,-0.14023025333881378,0.0777471661567688,-0.1255047768354416,0.004348800517618656,0.002962688449770212,-0.0033004169818013906,0.041095081716775894,-0.05938079208135605,-0.016699165105819702,-0.15108123421669006,0.11254601925611496,-0.08467502892017365,-0.017366573214530945,0.1087706983089447,-0.13685186207294464,-0.04390175640583038,-0.13040924072265625,-0.029902352020144463,0.09651987999677658,0.09344402700662613,0.05887328460812569,0.10178076475858688,0.13528160750865936,-0.03342531993985176,0.027514025568962097,-0.031306322664022446,0.10041576623916626,0.03776164725422859,0.1383836716413498,0.019308017566800117,0.0164005309343338,0.05803244933485985,-0.11439035832881927,0.10806624591350555,0.0014310866827145219,-0.07659997791051865,0.1300586760044098,0.06437239050865173,-0.16027571260929108,-0.1041918471455574,0.01684817671775818,0.04538551717996597,-0.03298809751868248,0.06007380411028862,-0.028272878378629684,0.08712254464626312,0.030583681538701057,-0.03597678244113922,0.033883921802043915,0.09029803425073624,-0.11002480238676071],[-0.1300814151763916,0.1408802568912506,0.14760303497314453,0.06328791379928589,0.09001878648996353,-0.01697777397930622,0.1122380942106247,-0.04368257150053978,-0.022062890231609344,0.1571100801229477,0.04774532839655876,-0.16512085497379303,-0.14190469682216644,-0.006938854698091745,0.05685155466198921,-0.10602770745754242,0.00828772597014904,-0.04218054190278053,0.1546679139137268,-0.05760999023914337,0.049694061279296875,0.11317531019449234,-0.07524982839822769,0.1563696712255478,0.041069064289331436,0.017770841717720032,0.09337421506643295,0.03235446289181709,0.11674187332391739,-0.011407813988626003,-0.04696013405919075,0.09361308813095093,-0.08586142957210541,0.05540870130062103,-0.0662563145160675,-0.10099785029888153,-0.09865575283765793,0.10610577464103699,-0.0011907403822988272,-0.06790630519390106,0.09009984880685806,0.03170754387974739,-0.07786207646131516,0.14626699686050415,-0.12504607439041138,-0.010079624131321907,0.10831223428249359,-0.10665721446275711,-0.03838769346475601,-0.12805865705013275,0.07145637273788452,0.031211238354444504,0.015468066558241844,-0.1220754012465477,-0.06804210692644119,0.10081519186496735,-0.12119955569505692,-0.06879300624132156,0.059115033596754074,0.10782766342163086,-0.09926123917102814,-0.031171074137091637,0.0047194212675094604,-0.13190092146396637,0.06441773474216461,0.07359620928764343,-0.11414924263954163,0.060691043734550476,-0.1006600633263588,0.03786541149020195,0.040167342871427536,-0.021371029317378998,-0.12863954901695251,0.03512204438447952,0.033145636320114136,-0.0617864616215229,0.06422074884176254,0.0830475240945816,-0.11573691666126251,0.057269804179668427,0.11670257896184921,0.07128594815731049,-0.087681844830513,-0.003419756656512618,0.1243879497051239,0.11613866686820984,0.14564542472362518,0.05498401075601578,-0.08166609704494476,0.1490810066461563,-0.10514925420284271,0.14852356910705566,0.0011016788193956017,0.06483916193246841,-0.019090713933110237,0.09885569661855698,0.049674224108457565,-0.0782686248421669,0.06801149994134903,0.10283233225345612,-0.09103658050298691,0.03971969708800316,-0.1396818608045578,0.042400650680065155,0.021055711433291435,0.02407628297805786,-0.01807033084332943,-0.08156359195709229,0.016668900847434998,0.09741334617137909,0.03448139503598213,-0.15257775783538818,-0.1523510068655014,0.15703502297401428,-0.09057483822107315,-0.022434359416365623,0.033865511417388916,-0.018637413159012794,-0.12818342447280884,0.13919652998447418,0.16386698186397552,0.1378433257341385,0.03378648683428764,-0.0028901805635541677,0.1514882892370224,0.01632237248122692,0.08913668245077133,-0.13569584488868713],[-0.07714027166366577,-0.1278294175863266,-0.015092556364834309,0.030970921739935875,0.011573386378586292,-0.04420147091150284,0.1428481489419937,0.12808211147785187,0.10651814937591553,0.10572398453950882,0.1159803569316864,0.027329739183187485,0.11423330008983612,-0.07467472553253174,0.006083167158067226,0.1088138148188591,0.1070873886346817,-0.07390442490577698,-0.06351868063211441,-0.07430405914783478,-0.10385966300964355,0.0033565242774784565,-0.137838676571846,0.005704295821487904,0.11379380524158478,-0.07498659938573837,0.03229273855686188,-0.1082344800233841,-0.10364467650651932,0.1596692055463791,-0.11114636808633804,0.12693500518798828,-0.08981642872095108,0.15395240485668182,0.12957324087619781,0.07109013944864273,-0.12822045385837555,-0.06418770551681519,-0.004488862119615078,-0.03629538044333458,-0.14393679797649384,-0.09251316636800766,0.028360901400446892,-0.133733868598938,0.058640070259571075,-0.12502892315387726,-0.1270764172077179,0.11832037568092346,0.12065151333808899,-0.12394864112138748,-0.08624879270792007,-0.08854545652866364,0.08288267999887466,0.01903686486184597,-0.06444798409938812,0.015490362420678139,-0.06103111431002617,0.14730776846408844,-0.008645322173833847,-0.08163144439458847,0.00949274655431509,0.01327111478894949,-0.07937341183423996,-0.1461138129234314,0.030903436243534088,0.056710317730903625,-0.05258232355117798,0.0023565541487187147,0.051243968307971954,-0.0028715028893202543,-0.034283239394426346,-0.02007579803466797,-0.09586994349956512,0.06874416023492813,-0.14607760310173035,0.01426660269498825,0.1254875808954239,-0.014833131805062294,0.019149338826537132,0.06711066514253616,0.031977999955415726,0.09721106290817261,0.1503731906414032,-0.0813203901052475,-0.1455954611301422,0.03900628164410591,0.07065941393375397,-0.025500714778900146,0.1133820042014122,0.050155628472566605,-0.08994362503290176,0.050034403800964355,0.11076522618532181,-0.038933638483285904,0.02816026285290718,0.1239376962184906,0.060761112719774246,-0.04151836410164833,-0.08815180510282516,0.10772282630205154,0.07925102114677429,-0.10896256566047668,-0.08681327104568481,-0.08263805508613586,0.007019699085503817,0.15233060717582703,-0.13554829359054565,-0.02503017522394657,-0.04941501468420029,0.11554424464702606,-0.0491909459233284,0.023732397705316544,0.1476820856332779,0.07433576881885529,0.10412206500768661,-0.006358034908771515,-0.023059142753481865,-0.13221004605293274,-0.15653052926063538,0.10551724582910538,-0.14252635836601257,-0.036266230046749115,0.10378827154636383,0.04570819437503815,0.02569093182682991,-0.12161996215581894,0.14431382715702057,-0.1235513761639595],[0.07965612411499023,-0.002864767098799348,-0.05869859457015991,-0.08907674252986908,-0.05963129550218582,0.15529035031795502,0.03707534074783325,0.00766068184748292,0.09052903950214386,-0.021905582398176193,0.11140619963407516,-0.10464256256818771,-0.1071297824382782,-0.13023094832897186,0.1167358011007309,-0.06315436214208603,0.1238415315747261,0.16011270880699158,-0.04703231528401375,0.16020911931991577,-0.06359748542308807,0.12261947244405746,0.13007131218910217,-0.11429152637720108,0.04702182486653328,-0.11973531544208527,-0.008886437863111496,-0.03580517694354057,0.0321701280772686,0.1379898339509964,-0.05931258201599121,0.12494100630283356,-0.07582323253154755,-0.008509507402777672,0.017080774530768394,0.13172011077404022,0.14344678819179535,-0.11792163550853729,-0.009334329515695572,-0.12286879122257233,0.002200855640694499,-0.14297662675380707,-0.1010223776102066,-0.04400381073355675,0.08379236608743668,-0.056841857731342316,-0.030322998762130737,-0.1260184496641159,0.0774097815155983,-0.07840797305107117,0.02992558479309082,-0.031037213280797005,-0.13308292627334595,0.00827112328261137,-0.08685557544231415,-0.10244288295507431,0.09493003040552139,-0.12260201573371887,-0.058469172567129135,0.04825775325298309,0.07427150756120682,-0.11708691716194153,0.033310722559690475,-0.07070329040288925,0.08037827163934708,0.05369241163134575,-0.05018410086631775,0.14212633669376373,-0.00899688620120287,-0.11307279020547867,-0.12812653183937073,0.1237180158495903,-0.12866611778736115,-0.13533984124660492,0.06547698378562927,0.06476879864931107,0.148039311170578,-0.04057524353265762,-0.057413820177316666,-0.09987448155879974,0.086898572742939,0.010736217722296715,0.016489755362272263,-0.03521529957652092,-0.01951531134545803,0.14687658846378326,-0.12061266601085663,-0.021868931129574776,-0.014373686164617538,0.0397237166762352,-0.08976227790117264,0.1274520456790924,-0.06599698215723038,0.010061703622341156,-0.05262928083539009,0.16768702864646912,0.04752938821911812,-0.11011078953742981,-0.12334101647138596,-0.13885806500911713,0.12553608417510986,-0.110902339220047,-0.05204859748482704,-0.049129318445920944,0.09421368688344955,0.034908030182123184,-0.04360166937112808,0.04226785525679588,0.10004057735204697,0.03063260205090046,-0.14080365002155304,0.06543585658073425,0.09073051065206528,0.09752629697322845,-0.04368801414966583,0.08667950332164764,0.05302472412586212,0.045093074440956116,0.06026025488972664,0.1540689617395401,0.14394617080688477,0.09437626600265503,0.0825752317905426,0.08168630301952362,-0.1183217242360115,-0.11435338854789734,-0.05069343373179436,-0.06905175000429153],[-0.0115558672696352,0.08077967911958694,0.00020707135263364762,-0.019599907100200653,-0.07866011559963226,0.012945079244673252,0.028833530843257904,0.07295437902212143,0.10336179286241531,0.016385817900300026,-0.07159685343503952,-0.034731924533843994,-0.04820646718144417,-0.1495445817708969,0.020134996622800827,-0.06838606297969818,-0.04448562487959862,0.1531442254781723,-0.01421397551894188,-0.08376772701740265,0.153121218085289,0.14040584862232208,0.041681960225105286,0.026796968653798103,0.10966979712247849,-0.13931038975715637,0.011350713670253754,0.10972195118665695,-0.10335860401391983,-0.02496751770377159,0.04060738533735275,0.16672973334789276,0.09853895008563995,-0.07729438692331314,0.13849282264709473,0.08109375089406967,-0.09113895148038864,0.11078865826129913,-0.056702062487602234,0.07851126790046692,0.07631103694438934,0.1235383152961731,-0.09938185662031174,0.05055912211537361,-0.0554199181497097,-0.1038028821349144,-0.11158104985952377,0.0649459958076477,-0.10780744254589081,0.14797711372375488,0.06806071102619171,-0.12612438201904297,-0.06231677904725075,-0.05272095650434494,-0.1426185667514801,0.13696373999118805,0.09589608758687973,-0.05037675425410271,0.01405161153525114,0.13145095109939575,-0.021549558266997337,0.0675746500492096,-0.09949939697980881,0.07104760408401489,0.07933357357978821,-0.07637877762317657,-0.11844020336866379,0.010179450735449791,0.0693277046084404,-0.1358470469713211,0.06239345669746399,0.006547695025801659,-0.12871919572353363,-0.047133833169937134,0.011396009474992752,0.022917265072464943,0.03012722358107567,-0.05767400562763214,0.16121283173561096,0.16022314131259918,-0.006295825354754925,-0.0766543447971344,0.04284244030714035,0.09770426154136658,0.037560708820819855,-0.07362961024045944,0.03950582072138786,-0.11563850939273834,0.11278809607028961,0.02644737996160984,-0.052100665867328644,0.07459580153226852,0.0545598529279232,0.056118179112672806,-0.054291751235723495,0.15489640831947327,0.14112037420272827,0.05953879654407501,-0.13193581998348236,-0.06601491570472717,-0.08505471050739288,-0.07864396274089813,-0.07767846435308456,0.05580543726682663,-0.14678211510181427,-0.06057903915643692,0.11847404390573502,-0.06590701639652252,0.045107703655958176,0.05983537808060646,-0.032248012721538544,-0.09477321803569794,-0.14870919287204742,-0.05501086637377739,-0.07664097845554352,0.0020019651856273413,-0.005633631721138954,-0.12188678234815598,0.07104141265153885,-0.09965375810861588,-0.020177029073238373,-0.03783883899450302,-0.07825671136379242,-0.06268449872732162,-0.01448851265013218,0.011621598154306412,-0.10315729677677155,-0.07484778016805649],[-0.12832097709178925,0.09128303825855255,0.060418978333473206,-0.02046847902238369,-0.14698055386543274,-0.0663817897439003,0.09062006324529648,-0.008450372144579887,0.04864971339702606,-0.097917340695858,0.04913819581270218,0.14176170527935028,0.12507863342761993,0.05808749049901962,0.013985743746161461,-0.1443735510110855,-0.056689221411943436,0.10210786014795303,0.09752653539180756,-0.03361624851822853,0.017928317189216614,-0.06213027611374855,0.05229596048593521,0.06903086602687836,-0.13434718549251556,-0.056974176317453384,-0.12983940541744232,0.006504744756966829,-0.07385291159152985,0.12583966553211212,-0.007190894801169634,-0.07763521373271942,0.09391052275896072,-0.09404674172401428,-0.016104765236377716,0.0004109562432859093,-0.017184605821967125,-0.014147256501019001,-0.13145962357521057,-0.027383923530578613,0.06202227249741554,-0.13706400990486145,0.11729440838098526,-0.09502387791872025,-0.1240272969007492,0.13221603631973267,0.014048049226403236,-0.06307271122932434,-0.13248896598815918,0.03517267480492592,-0.0669393464922905,-0.1027723103761673,-0.13734221458435059,-0.0006898546125739813,-0.02050136588513851,0.1322709619998932,-0.06364806741476059,-0.1510942131280899,-0.10426423698663712,-0.004589941818267107,0.004595398902893066,0.027023302391171455,-0.006948642432689667,0.05082564055919647,-0.019214749336242676,-0.13425695896148682,0.1271556168794632,0.0893307477235794,-0.13642270863056183,-0.08139559626579285,-0.06257685273885727,0.018973281607031822,-0.04076261445879936,-0.14360150694847107,-0.048646703362464905,0.11437495052814484,-0.0896664634346962,-0.10842227190732956,-0.10000938922166824,-0.02088812179863453,-0.08584713190793991,0.13048267364501953,-0.03278634324669838,0.0685672014951706,0.061442337930202484,0.0005437441286630929,0.02870696596801281,0.05841807276010513,-0.1439315378665924,-0.08836676180362701,0.1474018394947052,-0.11719437688589096,-0.050465673208236694,-0.1504223495721817,-0.017108796164393425,0.03170954808592796,0.11843487620353699,-0.05899214744567871,-0.12145601958036423,-0.12318406999111176,0.1379765421152115,-0.1421661227941513,-0.10473180562257767,0.012732909061014652,0.09439610689878464,-0.07332436740398407,0.042526669800281525,-0.08892178535461426,0.13028232753276825,-0.013966799713671207,-0.07429219037294388,-0.12284532934427261,0.14432767033576965,0.06522136926651001,-0.004458997398614883,0.01852763257920742,-0.09654317796230316,-0.14139840006828308,0.13403108716011047,-0.15113425254821777,0.14059950411319733,0.1023046150803566,0.00435400428250432,0.0019873834680765867,-0.033028941601514816,0.061493419110774994,0.06028042361140251,-0.07140852510929108],[0.061469219624996185,0.03927389904856682,0.05471628159284592,0.03934699296951294,0.08853863924741745,-0.15429195761680603,0.07194887846708298,0.0657012090086937,0.10892914980649948,0.14889107644557953,-0.05852825939655304,0.08209935575723648,-0.010264259763062,0.04408172145485878,-0.04617181420326233,0.17020170390605927,-0.1144079640507698,-0.037169210612773895,-0.09883206337690353,-0.08362601697444916,0.002786808181554079,-0.0058648367412388325,0.07373689860105515,0.04118235409259796,0.10266568511724472,-0.05358155444264412,-0.09442124515771866,-0.03396747633814812,0.028182607144117355,0.10984676331281662,-0.03275647759437561,-0.007605214137583971,-0.061555784195661545,-0.07373273372650146,0.03921576961874962,0.05392659828066826,-0.033886972814798355,0.020166361704468727,-0.064396932721138,0.10186681151390076,0.09755260497331619,-0.14961178600788116,-0.15216785669326782,0.042792219668626785,0.1101759746670723,0.10068292170763016,-0.0013690494233742356,0.06416022032499313,0.05661666765809059,0.02171671949326992,0.09061916172504425,0.04517907276749611,0.1280832290649414,-0.09656825661659241,-0.1310691237449646,0.11681395769119263,-0.09237047284841537,0.025295358151197433,0.02818426676094532,-0.07495037466287613,0.07835865020751953,-0.09017343819141388,0.11051703989505768,0.027794407680630684,0.12883922457695007,0.06774122267961502,0.0893976092338562,-0.03853356093168259,-0.10659786313772202,0.10130587965250015,-0.11404366791248322,-0.1397702991962433,0.1357964128255844,-0.0807144045829773,0.10000453889369965,-0.15570838749408722,-0.06584131717681885,0.10285326838493347,-0.13403859734535217,0.12037656456232071,0.011444838717579842,0.09831875562667847,-0.11348028481006622,-0.11964235454797745,0.036002691835165024,-0.1275123655796051,-0.11865339428186417,-0.010557371191680431,0.03809701278805733,0.08152207732200623,0.13044577836990356,-0.0744282454252243,0.004293294623494148,0.08761419355869293,0.10554105788469315,0.09276098757982254,0.1557142436504364,0.12536950409412384,-0.07514365017414093,0.06737259775400162,-0.13122834265232086,0.08986470103263855,-0.029273541644215584,-0.09450796991586685,-0.1201193705201149,-0.037854332476854324,0.09109668433666229,-0.01637103036046028,-0.09524501860141754,0.05109461024403572,-0.12199623137712479,-0.11536974459886551,-0.14468175172805786,0.004654623102396727,0.08480622619390488,0.11544786393642426,-0.1305401474237442,0.04635544493794441,0.016964729875326157,-0.13987605273723602,0.09584210067987442,0.1258300095796585,-0.14826294779777527,0.05381323769688606,0.061826419085264206,-0.1252816915512085,0.012180876918137074,0.08679237216711044],[0.1506800651550293,0.06015815585851669,-0.03729312866926193,0.09573549032211304,0.07200634479522705,0.07894362509250641,-0.05745280161499977,0.12244412302970886,-0.14200112223625183,-0.027948569506406784,-0.10931102931499481,0.09798058867454529,0.0014732929412275553,0.08225027471780777,0.042470309883356094,0.047886453568935394,0.05008158087730408,-0.09108593314886093,-0.03483441472053528,-0.12016404420137405,0.045883648097515106,0.15749548375606537,-0.11954956501722336,-0.11590569466352463,0.06434300541877747,0.0998128280043602,0.03399944677948952,0.1418767124414444,0.03654016554355621,0.06684982031583786,0.008546214550733566,-0.051314473152160645,0.12950867414474487,0.08949089050292969,-0.025451112538576126,0.12135805934667587,-0.14202381670475006,0.12311199307441711,-0.11992626637220383,-0.0800854042172432,-0.10596604645252228,-0.09471067786216736,-0.14641371369361877,-0.06651268899440765,-0.12257138639688492,0.1422681361436844,-0.010276476852595806,0.07122457772493362,0.1195865273475647,-0.11960024386644363,0.12455139309167862,0.057339027523994446,-0.09343648701906204,-0.04842623695731163,-0.0017234458355233073,-0.03312462940812111,-0.027905702590942383,-0.08434818685054779,-0.06271694600582123,0.0701071098446846,0.032107844948768616,0.054079122841358185,0.06286071985960007,-0.14472241699695587,0.10202036052942276,-0.10025350004434586,-0.05074012279510498,-0.032111331820487976,-0.10487774759531021,-0.025885099545121193,-0.1259080469608307,0.07383257150650024,0.010414310730993748,-0.10225807875394821,0.06097778305411339,-0.06437563896179199,0.07626611739397049,-0.060827989131212234,0.027824193239212036,-0.0238992590457201,-0.09511234611272812,-0.10146074742078781,-0.05398515984416008,-0.12428554892539978,-0.05915260314941406,0.15593713521957397,0.006537367589771748,-0.07563815265893936,-0.12854120135307312,-0.03501249477267265,0.02353592775762081,-0.03644614666700363,0.0868244394659996,0.12025594711303711,-0.030165957286953926,-0.04873431473970413,0.049371879547834396,0.09425653517246246,0.07946888357400894,0.06134539470076561,0.11228510737419128,0.10887272655963898,-0.06117894873023033,-0.010431385599076748,0.11450115591287613,0.1511111706495285,0.06723784655332565,0.10004884004592896,0.026578279212117195,0.08428701758384705,0.1414654701948166,0.10124190151691437,0.05203789845108986,-0.08886254578828812,-0.03887500986456871,0.0024584420025348663,0.0605364590883255,-0.10104874521493912,0.0320303849875927,0.08900969475507736,-0.04176340624690056,0.11880826205015182,0.01803663745522499,-0.10179204493761063,0.0585363544523716,0.02526283450424671,0.07777373492717743,-0.06993478536605835],[0.0588807687163353,-0.097481369972229,0.07564601302146912,-0.03917865455150604,-6.316959479590878e-05,-0.10601891577243805,-0.0616544745862484,0.07496748864650726,-0.10388682037591934,-0.12156078219413757,0.010434686206281185,0.10937533527612686,0.05270030349493027,-0.09852508455514908,-0.1441955417394638,-0.0768996998667717,0.007352115120738745,0.07604995369911194,-0.11474869400262833,0.06368350982666016,0.1007775068283081,0.014618846587836742,0.010008221492171288,-0.029126083478331566,-0.044346801936626434,0.08900813013315201,0.023245705291628838,-0.020008906722068787,0.04359333589673042,-0.061518292874097824,0.05586521327495575,0.01147422008216381,-0.04370497912168503,0.016313249245285988,0.1291324645280838,-0.14586372673511505,-0.14807872474193573,-0.129298597574234,0.058057911694049835,0.08263521641492844,-0.12033096700906754,0.09326152503490448,0.14598676562309265,0.0896662101149559,-0.038529012352228165,0.010574129410088062,0.06514677405357361,-0.05773952603340149,0.10710597783327103,0.14401376247406006,-0.021888507530093193,0.04821176454424858,0.06180404871702194,0.12625278532505035,-0.02383953146636486,-0.1094517633318901,-0.11361949890851974,-0.06349363923072815,-0.12234760820865631,0.016036786139011383,-0.10152893513441086,-0.14240756630897522,-0.14075709879398346,-0.0349649153649807,-0.11354024708271027,-0.07673247158527374,-0.010171936824917793,0.09755882620811462,-0.12702159583568573,0.08728944510221481,-0.11084740608930588,-0.035862576216459274,0.14101573824882507,0.09433786571025848,-0.026661792770028114,0.10944516956806183,0.1347256600856781,0.02072952874004841,0.0760214701294899,0.11429627984762192,-0.028366761282086372,0.0999077633023262,0.10072369873523712,0.010110868141055107,-0.05549835041165352,-0.11852720379829407,0.05174309387803078,0.12864795327186584,-0.04877644032239914,-0.10755171626806259,0.0019347111228853464,-0.071075439453125,-0.10185366868972778,-0.11905191093683243,0.1302904486656189,-0.13546422123908997,-0.13581536710262299,-0.022157592698931694,0.035156626254320145,-0.017542706802487373,0.006579836364835501,-0.09397120028734207,-0.12326465547084808,0.05046610161662102,-0.15505246818065643,0.14291787147521973,0.007878521457314491,0.03999374061822891,0.02750762365758419,-0.1542171686887741,-0.09832926094532013,0.08993222564458847,0.042582206428050995,0.13227961957454681,-0.01811728999018669,0.15080799162387848,-0.07923493534326553,0.11538764834403992,0.10139673948287964,0.017942912876605988,-0.11585462093353271,0.08502641320228577,-0.0844854786992073,-0.05299736559391022,0.07771965116262436,-0.12018923461437225,-0.13274706900119781,-0.0992819219827652],[0.08955798298120499,-0.13144449889659882,-0.07714977115392685,0.020414549857378006,-0.04613276571035385,-0.12901583313941956,-0.08529621362686157,0.06127173453569412,0.12799233198165894,-0.13591882586479187,-0.06371702253818512,0.025534613057971,0.01560763455927372,0.10558193922042847,-0.0003906773345079273,0.1420973539352417,-0.025585228577256203,-0.13621686398983002,0.019457368180155754,0.08285661786794662,-0.0691731870174408,-0.06921356916427612,0.1282525509595871,-0.056378740817308426,-0.04487808793783188,-0.06078394874930382,0.13546431064605713,0.013095921836793423,0.04047315940260887,-0.14065034687519073,-0.0418732576072216,0.14469078183174133,0.09315235912799835,0.15375521779060364,0.03514889255166054,-0.1337006688117981,-0.061452411115169525,-0.051274314522743225,0.15030917525291443,-0.10403160005807877,0.04034094884991646,-0.11206253618001938,0.013305872678756714,-0.03033132292330265,0.054869621992111206,-0.047869328409433365,0.035757847130298615,0.08126386255025864,0.0007928055711090565,-0.11504587531089783,0.1423894315958023,0.00635113101452589,0.0045474800281226635,0.053139764815568924,-0.1306799352169037,-0.13401728868484497,-0.0010939370840787888,-0.07839775085449219,0.03442408889532089,-0.11051458865404129,0.01672516018152237,0.1471191942691803,-0.003951954189687967,-0.13703612983226776,0.12096139788627625,0.12627772986888885,0.07120722532272339,0.09462049603462219,0.040914274752140045,0.06713349372148514,0.04232778772711754,-0.07588235288858414,-0.1419926881790161,-0.045955557376146317,-0.14872506260871887,-0.14120103418827057,0.012911489233374596,0.019288403913378716,-0.1248040646314621,-0.0136871924623847,0.13624069094657898,-0.07921411842107773,-0.12510882318019867,-0.05435391515493393,0.1143321692943573,0.11499006301164627,0.015219560824334621,0.12322889268398285,0.023958416655659676,-0.009685523808002472,0.026444708928465843,-0.1378481388092041,-0.11304327845573425,-0.020559141412377357,-0.01839628629386425,-0.07140079140663147,0.02389172837138176,0.03943589702248573,0.14758454263210297,-0.14048060774803162,-0.1360960453748703,0.0322084054350853,-0.10623917728662491,-0.1219392940402031,0.08232986927032471,0.06937988847494125,-0.08106166869401932,0.01847410388290882,0.09727870672941208,-0.027366995811462402,0.11757040023803711,0.06566186249256134,-0.09530229866504669,0.06203361600637436,0.0932164192199707,0.023502226918935776,-0.04039918631315231,0.1460229903459549,0.11915255337953568,-0.039672382175922394,-0.11637057363986969,-0.040917202830314636,0.037021439522504807,0.024654947221279144,0.08337090909481049,0.0759902074933052,0.08256753534078598,-0.03957939147949219],[0.12386944890022278,-0.06239788606762886,0.1269436627626419,0.04919511452317238,0.15831463038921356,-0.04786453768610954,0.0579511858522892,0.042238347232341766,-0.12982769310474396,-0.03693508356809616,-0.06343641877174377,0.009778544306755066,-0.13881894946098328,0.02294108457863331,0.04749803617596626,0.09841228276491165,-0.11629066616296768,-0.017900895327329636,-0.010365077294409275,-0.010307329706847668,0.13595037162303925,0.12824386358261108,-0.024878112599253654,-0.0878787487745285,0.03811218962073326,-0.13268963992595673,-0.04276050627231598,0.13839183747768402,-0.06686806678771973,0.11294366419315338,0.10504468530416489,-0.04302699491381645,0.0565006248652935,-0.09198350459337234,0.0999133288860321,0.1391817182302475,-0.1379212737083435,-0.09514755755662918,0.12470882385969162,0.07464490085840225,0.16497966647148132,0.09544190764427185,0.09226521104574203,-0.07869640737771988,0.10364703088998795,0.13811258971691132,-0.005894129630178213,-0.07652956247329712,-0.10744918882846832,-0.05633646622300148,0.07083490490913391,-0.08792539685964584,-0.08345530927181244,0.10774188488721848,-0.1267879158258438,-0.010603273287415504,0.07092927396297455,-0.11064588278532028,0.009073980152606964,-0.11374889314174652,0.031998373568058014,0.13548631966114044,-0.07885018736124039,-0.10302352905273438,0.019560154527425766,0.12213587015867233,0.13863472640514374,0.1092110425233841,-0.024146368727087975,0.01550496555864811,0.044500719755887985,-0.0955137386918068,-0.054976463317871094,-0.015516429208219051,-0.008415360935032368,0.07334567606449127,-0.07841094583272934,0.007137299980968237,-0.01800854317843914,0.037459880113601685,-0.13620856404304504,-0.05880601704120636,0.05882304534316063,0.14831343293190002,-0.02454765886068344,0.009459082968533039,-0.01002164464443922,-0.04531187191605568,-0.04555486515164375,0.065351702272892,0.13172121345996857,-0.06613386422395706,0.006139736622571945,0.07358764857053757,-0.07408372312784195,0.1406213641166687,-0.13926124572753906,-0.01743330992758274,-0.06807734072208405,0.08217194676399231,-0.1040341705083847,-0.08481571823358536,0.12766475975513458,-0.017959294840693474,-0.08422799408435822,-0.08563415706157684,-0.004678735509514809,-0.09961790591478348,0.0982675775885582,0.1592511385679245,0.11922712624073029,0.03958626464009285,0.013461222872138023,-0.029565362259745598,0.05240821838378906,-0.08404575288295746,-0.06057988852262497,-0.10365740954875946,0.056639302521944046,-0.029900984838604927,0.06552118808031082,0.04898162931203842,0.020949436351656914,0.0623631477355957,0.08386273682117462,-0.0155657809227705,0.1339690387248993,0.061541274189949036],[0.03398163616657257,0.1001676470041275,0.08672422915697098,-0.08075499534606934,-0.03181278705596924,-0.0647197738289833,0.10568390786647797,0.039375849068164825,-0.14793804287910461,0.042813997715711594,0.05534564331173897,-0.08766420185565948,-0.06120239570736885,-0.08349260687828064,0.03645315393805504,-0.037602510303258896,-0.03717280551791191,0.03425395488739014,-0.09258724004030228,-0.12131787091493607,-0.025267988443374634,0.1537245661020279,-0.034269481897354126,-0.001798087265342474,-0.08461519330739975,-0.08900055289268494,-0.0634649246931076,-0.007883702404797077,0.09969578683376312,-0.0001276676484849304,-0.019006134942173958,-0.13838519155979156,0.10665614157915115,-0.10980010032653809,-0.1447175294160843,-0.06772024184465408,0.13704359531402588,0.12473686039447784,0.15694274008274078,0.15421795845031738,-0.034171272069215775,-0.03822549805045128,0.09351019561290741,0.048819832503795624,0.1300310343503952,0.04866549372673035,0.13390834629535675,0.09622178226709366,-0.06613194197416306,0.08271414786577225,0.12028833478689194,0.11967684328556061,0.10917813330888748,0.034161195158958435,0.14645858108997345,0.11519717425107956,0.07910596579313278,0.020655563101172447,-0.01295296661555767,0.14549818634986877,0.014812636189162731,-0.005009890533983707,0.04210880398750305,0.003441928420215845,0.15398655831813812,0.1598730832338333,0.009882284328341484,-0.02278711088001728,0.09491018205881119,0.09691568464040756,0.129850372672081,0.14852094650268555,-0.11610796302556992,0.140437051653862,0.06097673624753952,0.11564769595861435,0.02169792540371418,0.10308347642421722,0.005049829371273518,0.0972256064414978,-0.09736378490924835,-0.009008439257740974,0.16293150186538696,0.11069918423891068,-0.057349447160959244,0.04226710647344589,0.002569664502516389,0.01467946358025074,0.10961676388978958,0.061945971101522446,0.04475626349449158,0.008536526933312416,0.027384379878640175,0.06150282546877861,0.02446662075817585,0.08632941544055939,-0.10455960780382156,-0.01174137182533741,0.07045963406562805,-0.026602888479828835,-0.06489863246679306,-0.03500640392303467,-0.14839781820774078,0.04319501668214798,-0.045569416135549545,-0.06917236000299454,-0.01767777092754841,-0.04878475144505501,-0.11117248982191086,0.030288023874163628,-0.05419290065765381,0.16589757800102234,0.13499821722507477,0.11517228186130524,0.08086075633764267,0.13914836943149567,0.10834012180566788,-0.06285177916288376,-0.1476416289806366,-0.046458326280117035,0.10398358106613159,0.039140619337558746,-0.09022551774978638,-0.041454676538705826,0.11353293806314468,-0.10358140617609024,-0.08789926022291183,0.13238582015037537],[-0.12487656623125076,-0.028299136087298393,0.016097890213131905,-0.12700967490673065,0.1272071897983551,-0.05825788527727127,0.13836669921875,-0.08159904181957245,-0.0015308879083022475,0.011829799972474575,0.116875059902668,-0.09739834070205688,-0.09497156739234924,-0.08258675038814545,0.13963207602500916,-0.05982939898967743,-0.06810060888528824,-0.07081431895494461,-0.02409123070538044,0.09209909290075302,0.00559096597135067,0.11632846295833588,0.13501951098442078,0.1567697823047638,0.10843231528997421,-0.05666201561689377,0.023648444563150406,0.0019971299916505814,-0.042828500270843506,-0.12824495136737823,0.13254424929618835,-0.06709045171737671,0.102506123483181,0.010898108594119549,0.051959142088890076,0.0598670095205307,-0.08537249267101288,0.07259969413280487,0.06510698795318604,0.06354880332946777,-0.12972459197044373,0.129202201962471,-0.021046124398708344,0.12082414329051971,0.13131287693977356,-0.012123928405344486,0.14405077695846558,0.07194337248802185,-0.10731682926416397,-0.10312800109386444,0.00661857333034277,-0.13579317927360535,0.005269876681268215,0.11701949685811996,-0.02422763779759407,-0.13719074428081512,9.362101263832301e-05,0.1597117930650711,-0.07249080389738083,0.016745606437325478,0.05721265450119972,-0.043535999953746796,-0.1370011866092682,-0.14243300259113312,0.11394954472780228,0.08324719965457916,0.07915377616882324,0.036685243248939514,0.059770163148641586,0.02078797109425068,-0.14300361275672913,-0.009054807014763355,-0.07102393358945847,0.018698476254940033,-0.14013133943080902,0.04716695472598076,0.09968376159667969,0.024475647136569023,-0.08166123181581497,-0.07321782410144806,-0.14282959699630737,0.03332669287919998,0.09748020768165588,0.03954877331852913,-0.098516084253788,-0.13724862039089203,-0.13992391526699066,-0.02408163622021675,-0.09758397936820984,-0.12044402211904526,0.05032945051789284,-0.05651402473449707,0.08259901404380798,-0.04996662959456444,-0.1012447401881218,-0.04105203598737717,0.039801813662052155,-0.05068861320614815,0.021562501788139343,0.11459723860025406,0.05885853245854378,0.07803665101528168,-0.14470814168453217,0.0977398008108139,0.12232856452465057,0.12057894468307495,-0.0978669673204422,0.034950558096170425,-0.10952367633581161,0.0018030795035883784,0.14173643290996552,-0.05250982195138931,-0.04825423285365105,0.05105612054467201,0.0994095727801323,-0.1106031984090805,-0.11530445516109467,-0.13145820796489716,0.0014195716939866543,0.057523131370544434,0.00785909779369831,0.0965186208486557,-0.11131143569946289,-0.06880277395248413,-0.027799131348729134,0.03259943798184395,-0.0998726487159729,-0.13366711139678955],[-0.12126853317022324,0.05146392062306404,-0.05403565242886543,-0.148696169257164,0.135712131857872,0.1339743286371231,0.05942918360233307,-0.14052559435367584,-0.07843679189682007,-0.09825564920902252,0.08163134008646011,0.023127485066652298,-0.04865969717502594,0.0479661263525486,-0.07383880019187927,-0.04474817216396332,-0.09605170041322708,-0.07395274937152863,-0.03683328256011009,-0.016274096444249153,0.10792214423418045,-0.054349031299352646,0.016881685703992844,-0.07102788984775543,0.05701298639178276,0.029079057276248932,-0.0990690365433693,0.027071397751569748,-0.060958653688430786,-0.12283862382173538,-0.12250960618257523,-0.12535548210144043,0.13424944877624512,-0.15973839163780212,0.11884615570306778,0.05159861966967583,-0.15128204226493835,-0.010739403776824474,-0.10734476894140244,-0.02351144514977932,-0.0951698049902916,-0.0768851712346077,0.07163887470960617,0.12723232805728912,-0.06300248950719833,0.1117946207523346,0.08671526610851288,-0.06060891970992088,-0.03511543944478035,0.09003720432519913,-0.0772322565317154,-0.08198319375514984,-0.015056418254971504,-0.032575201243162155,0.05163846164941788,0.026901045814156532,0.05432529374957085,0.06689384579658508,-0.04874512180685997,-0.03236077353358269,-0.03985929489135742,-0.15565219521522522,-0.04670456424355507,0.030933480709791183,-0.013738581910729408,0.056202180683612823,0.10152578353881836,0.14818446338176727,0.12060166895389557,0.008239539340138435,0.13624207675457,-0.12657701969146729,-0.07701359689235687,0.008075705729424953,-0.08924221247434616,0.013775674626231194,-0.03928466886281967,-0.15543290972709656,0.1426626443862915,-0.012457618489861488,-0.046130698174238205,-0.0914536565542221,-0.0005792692536488175,0.13029421865940094,-0.021379726007580757,-0.15531006455421448,0.12365799397230148,-0.1064496859908104,-0.11935476958751678,0.06312340497970581,-0.11702005565166473,-0.13129553198814392,-0.05507231131196022,0.11855705827474594,0.017928171902894974,-0.13559065759181976,0.11447080224752426,0.009222990833222866,-0.056465934962034225,-0.07592784613370895,0.11358008533716202,0.009349197149276733,0.08930016309022903,-0.14041145145893097,-0.09174638241529465,0.02743382193148136,-0.05726022645831108,-0.02899336628615856,0.11480417847633362,0.01325967162847519,0.06064652279019356,0.1398293524980545,-0.13682962954044342,0.050435394048690796,0.03690309077501297,0.07719988375902176,0.05035838857293129,0.0025812163949012756,-0.028912492096424103,-0.13016866147518158,0.0999426543712616,-0.021655775606632233,0.05919062718749046,0.12757977843284607,-0.11465443670749664,-0.035636577755212784,0.03868987038731575,0.1501036435365677],[-0.01708010584115982,0.144517719745636,0.06513093411922455,-0.14287503063678741,0.08879099786281586,0.10686980187892914,0.0846506804227829,0.1008632704615593,0.15489038825035095,-0.14005395770072937,0.08255734294652939,0.04943060874938965,0.13137264549732208,-0.08506565541028976,0.09465666860342026,0.0870426818728447,-0.1515474170446396,-0.12897999584674835,0.03290264680981636,0.05405835807323456,-0.002339195692911744,-0.043130822479724884,-0.057691946625709534,0.08584146201610565,0.05180320516228676,0.09621627628803253,-0.04930402711033821,0.04536968469619751,-0.10024022310972214,-0.09379566460847855,0.06484661996364594,-0.1481228768825531,0.02627170830965042,-0.020075375214219093,-0.13272839784622192,0.1576925367116928,0.03223501890897751,0.13719932734966278,0.05048162117600441,0.08767037093639374,0.010610346682369709,-0.02269602008163929,-0.08775947242975235,0.10696525871753693,0.02334659732878208,-0.04829110950231552,-0.0733049288392067,-0.09386658668518066,0.003244203981012106,-0.07432883977890015,0.13271914422512054,-0.09270099550485611,0.007970001548528671,0.12446117401123047,0.027082886546850204,-0.01919523812830448,-0.022133583202958107,-0.0013000188628211617,0.006841832306236029,0.023240428417921066,-0.12215936183929443,0.029859865084290504,-0.04418930783867836,-0.03532997891306877,0.0797414556145668,0.0646137148141861,0.15016119182109833,0.02876598946750164,0.0011033352930098772,-0.013807950541377068,-0.14061415195465088,-0.12484540790319443,-0.11423566937446594,-0.04693097621202469,-0.05143783614039421,-0.06295649707317352,0.03956997022032738,-0.012904259376227856,-0.004794610198587179,0.0891234278678894,0.016621986404061317,-0.06833616644144058,-0.006643751636147499,0.11357484012842178,0.03873073309659958,0.08186357468366623,0.1270349770784378,0.08433102816343307,-0.07900863885879517,-0.0381028950214386,-0.0798569992184639,0.0742323026061058,-0.01616288349032402,0.02171860635280609,0.07389113306999207,-0.06368403136730194,0.04380428418517113,-0.04350634291768074,-0.11595520377159119,0.0658201053738594,0.04131893441081047,-0.046517085283994675,0.05462777614593506,-0.10308495908975601,-0.1274474561214447,0.13482698798179626,-0.05879278481006622,-0.02290956862270832,-0.037666793912649155,0.061642907559871674,-0.06516692042350769,0.09866398572921753,-0.13051602244377136,0.026362162083387375,0.1284342259168625,0.00823210645467043,0.039170779287815094,-0.006256873719394207,0.0824051946401596,0.03408413752913475,-0.09933306276798248,0.12660910189151764,0.13926714658737183,-0.11989036202430725,-0.038652777671813965,0.00883497204631567,-0.07693818211555481,0.00021528854267671704],[0.12008587270975113,-0.11204616725444794,-0.1435326784849167,0.11018715798854828,-0.05210276320576668,0.025515161454677582,0.11911666393280029,0.03602050989866257,-0.0009577881428413093,-0.00918025616556406,0.014262142591178417,0.13167957961559296,-0.023606518283486366,-0.06720727682113647,-0.04503139480948448,0.1382090300321579,0.10415690392255783,0.14687636494636536,0.08447844535112381,0.0753704160451889,0.012768460437655449,0.039038654416799545,0.1189543604850769,0.12138555943965912,-0.10629547387361526,0.0911274254322052,-0.09794314205646515,-0.1444202959537506,0.07480080425739288,-0.1757431924343109,-0.08553790301084518,0.029169883579015732,0.14422382414340973,-0.12104963511228561,0.05540607497096062,-0.003645779564976692,-0.1339574158191681,-0.14036618173122406,0.05478794872760773,-0.03924819454550743,0.07438511401414871,0.12122073024511337,0.05090603232383728,-0.008518931455910206,-0.14460836350917816,-0.07141528278589249,-0.03165373578667641,-0.13514167070388794,0.0064856987446546555,0.11170169711112976,0.04770898073911667,0.045279256999492645,-0.0823959931731224,0.10961348563432693,0.002598484279587865,-0.1509770005941391,-0.1052526980638504,0.11137636005878448,0.006160103715956211,0.09975260496139526,0.005648455582559109,-0.03411199152469635,0.09672347456216812,-0.04956071078777313,-0.017367040738463402,-0.12818396091461182,-0.02149515599012375,0.014995262026786804,-0.10351906716823578,-0.11438652873039246,0.019004706293344498,-0.03623484447598457,0.07217033952474594,-0.13162820041179657,-0.1326674073934555,0.04340134188532829,-0.004583105910569429,0.13118955492973328,-0.1010492742061615,0.011607075110077858,-0.0010040021734312177,0.11915548145771027,0.14155130088329315,-0.10403840243816376,-0.11896925419569016,-0.13967250287532806,-0.017123812809586525,-0.10127446800470352,0.03675615414977074,0.06496892869472504,-0.06359259784221649,0.12414469569921494,0.021885117515921593,0.04276174679398537,0.07752998918294907,-0.01725102961063385,0.1355835348367691,-0.12005313485860825,0.057010531425476074,0.056305766105651855,0.009296001866459846,0.10901803523302078,-0.13940392434597015,-0.12830732762813568,-0.09695649892091751,0.039639655500650406,0.0622970275580883,-0.08344073593616486,0.000252193451160565,-0.001777307246811688,0.055133894085884094,-0.13788734376430511,0.09929700195789337,0.06487279385328293,-0.12317083030939102,-0.10907198488712311,-0.06390459090471268,-0.06283437460660934,0.05376219376921654,-0.0406438410282135,0.06575985252857208,0.09223759174346924,-0.031243469566106796,0.12651774287223816,0.04278626665472984,0.011065092869102955,0.021650509908795357,0.07702437043190002],[0.0320734940469265,0.05807682126760483,0.11518118530511856,-0.13747018575668335,0.1286771297454834,-0.06955760717391968,-0.11629592627286911,-0.08553379029035568,-0.12306902557611465,0.14155222475528717,-0.05461858585476875,0.08997563272714615,0.058405421674251556,-0.027192985638976097,-0.05046200379729271,0.01269889809191227,-0.00037541723577305675,-0.025363976135849953,0.01062790397554636,0.09780533611774445,0.08634742349386215,0.03631028160452843,0.1137874573469162,-0.12078025192022324,0.06497549265623093,0.005785177927464247,0.08113131672143936,-0.06403724104166031,-0.15276877582073212,-0.11581044644117355,-0.012271556071937084,-0.013962973840534687,-0.05025952309370041,0.15091708302497864,-0.1389448642730713,0.005112511105835438,-0.15384598076343536,0.14524079859256744,0.11459214240312576,0.14824636280536652,-0.0900048092007637,-0.06858914345502853,0.1297888457775116,-0.14231982827186584,-0.0050880745984613895,-0.053334664553403854,-0.10915876924991608,-0.08248551934957504,0.07645443826913834,-0.1107318177819252,0.0739729106426239,-0.09110666066408157,-0.043809227645397186,-0.00656737620010972,0.10264632850885391,-0.1478446125984192,0.11838014423847198,0.02667723223567009,0.052632007747888565,-0.11072210967540741,0.047972746193408966,-0.09596733748912811,-0.128567174077034,-0.13618740439414978,-0.06387448310852051,0.09109226614236832,0.04219815507531166,-0.05590163543820381,0.06537742167711258,-0.09342262148857117,0.05848676338791847,-0.1561615914106369,-0.04969106614589691,-0.0014222438912838697,0.09732821583747864,-0.006615872960537672,0.11146856099367142,0.015577234327793121,0.0669466182589531,0.0892709419131279,0.08346536010503769,-0.0997319146990776,0.006178198382258415,-0.10021667182445526,-0.06464855372905731,0.02022901549935341,0.052361492067575455,0.11319304257631302,0.09296867996454239,-0.10197922587394714,0.09583766758441925,0.0656723827123642,0.028830137103796005,0.1132131814956665,0.012194476090371609,-0.02300858497619629,-0.07090584933757782,0.10047079622745514,-0.10396696627140045,-0.014172459952533245,-0.12783117592334747,0.03772368282079697,0.06396320462226868,-0.04827982187271118,-0.15046177804470062,0.08551964163780212,-0.10299667716026306,0.025272438302636147,-0.13316163420677185,-0.08158798515796661,-0.06142863631248474,0.07265661656856537,-0.040718190371990204,0.148443341255188,-0.07750795781612396,0.07717588543891907,-0.15088984370231628,-0.0864064022898674,-0.06975425779819489,-0.117983378469944,0.074247807264328,0.04467529430985451,-0.020004520192742348,-0.0913408175110817,0.0649171769618988,0.12776708602905273,0.1487625241279602,0.012120947241783142],[0.08132363855838776,0.0569017268717289,-0.03187771514058113,0.019639670848846436,-0.045169372111558914,0.12923046946525574,0.08665331453084946,-0.03412110358476639,-0.08934199064970016,-0.03405110538005829,-0.13482904434204102,0.10123639553785324,-0.1007462665438652,0.1472383290529251,-0.1534285992383957,0.059348687529563904,0.1364573985338211,-0.10989728569984436,-0.05501534417271614,0.013086332939565182,-0.01750991865992546,0.046977438032627106,-0.11892374604940414,0.11713685840368271,-0.12930983304977417,-0.01297854259610176,0.1403580754995346,0.0011384313693270087,0.07381141930818558,-0.08010641485452652,-0.0015475397231057286,-0.12518469989299774,0.002916328376159072,0.10854275524616241,0.05695495009422302,0.01905621401965618,-0.09780344367027283,0.12196507304906845,-0.09757756441831589,0.06276718527078629,0.04195977747440338,-0.04489946365356445,0.006351508665829897,-0.03971380367875099,0.08153872191905975,-0.020052658393979073,0.042276911437511444,-0.011296168901026249,-0.06862449645996094,0.04854757711291313,0.10781083256006241,0.0030568146612495184,0.07421837747097015,0.11727824062108994,0.12699942290782928,-0.13815723359584808,0.056492019444704056,-0.10134333372116089,0.13566482067108154,-0.07299397140741348,0.10240138322114944,-0.034006182104349136,0.061908215284347534,0.12054485082626343,-0.0022361045703291893,0.007962663657963276,-0.09512995928525925,-0.09356282651424408,-0.06469283998012543,-0.07569831609725952,0.10950333625078201,0.12094918638467789,-0.0159259345382452,0.05966482311487198,0.15533487498760223,-0.13731986284255981,-0.051330700516700745,-0.0872131958603859,0.1086021140217781,-0.004677757155150175,0.03718305379152298,-0.11654770374298096,-0.035614319145679474,-0.08621836453676224,-0.12278927862644196,-0.03550378233194351,0.06137074530124664,-0.04959210380911827,0.08995390683412552,0.07843498140573502,0.13803471624851227,0.03770284354686737,0.11396802961826324,0.10571511089801788,-0.025716790929436684,-0.09273851662874222,-0.023972906172275543,-0.00653825281187892,0.07776094228029251,0.04696052148938179,0.125051349401474,-0.032436732202768326,0.020726989954710007,-0.10564917325973511,-0.01898127608001232,0.06983742117881775,-0.018305137753486633,-0.0860234722495079,0.05977359414100647,-0.03601115196943283,0.018697179853916168,-0.03713241592049599,-0.01779606193304062,0.10468238592147827,-0.028955958783626556,-0.09070268273353577,-0.11641769111156464,-0.000852429773658514,-0.0041774422861635685,0.07309626042842865,0.0807071179151535,0.004998904652893543,-0.106458880007267,0.1469494253396988,0.09066417813301086,-0.1002492681145668,0.12350873649120331,-0.1388532668352127],[0.013815013691782951,-0.025144048035144806,0.09079505503177643,0.10753269493579865,0.13276053965091705,0.04279695078730583,-0.03408961370587349,0.03986242786049843,-0.02623153291642666,-0.10795106738805771,0.06706588715314865,-0.1508720964193344,0.07318932563066483,0.08470792323350906,-0.012136431410908699,0.12328905612230301,0.024547329172492027,-0.09800442308187485,0.0922686755657196,0.04526066407561302,0.13189497590065002,-0.1053653210401535,0.0015164073556661606,-0.10980523377656937,-0.03128921613097191,0.059341125190258026,0.07499971985816956,-0.14390818774700165,-0.0903172567486763,0.1529894322156906,0.07584399729967117,0.09204443544149399,0.08628757297992706,0.07756468653678894,0.02918095514178276,-0.12591053545475006,-0.05414942279458046,-0.012532871216535568,-0.14841650426387787,-0.05684347078204155,-0.03802736476063728,-0.10861881077289581,-0.036187876015901566,0.1465199738740921,-0.05277614668011665,-0.10717540979385376,-0.12412191182374954,0.038769859820604324,-0.14659088850021362,0.06320594996213913,0.133467897772789,-0.06776436418294907,0.0344022698700428,0.03476662188768387,0.1461804062128067,-0.10037554800510406,-0.13058611750602722,-0.05252302065491676,-0.040058426558971405,0.07089713215827942,0.09339877963066101,0.041770320385694504,-0.09409108757972717,-0.04659850522875786,-0.12544681131839752,-0.0012066509807482362,-0.010152204893529415,-0.14797285199165344,0.09057852625846863,0.12958699464797974,-0.00025319651467725635,-0.002097429009154439,0.015939565375447273,-0.07145610451698303,0.1536836177110672,-0.0012158461613580585,0.058211565017700195,0.11253124475479126,0.13845627009868622,0.08233008533716202,-0.10654343664646149,0.15142236649990082,0.006719405762851238,-0.03322197496891022,-0.03429161384701729,-0.1257411539554596,-0.05942055955529213,-0.148588165640831,-0.04648984223604202,-0.11605999618768692,-0.059678785502910614,-0.05893196165561676,0.038598500192165375,-0.11102139949798584,0.01921292394399643,-0.07699566334486008,-0.0508674792945385,0.09073822945356369,-0.05215224251151085,-0.03402704745531082,0.1094089150428772,-0.09607498347759247,0.02152256667613983,0.08105101436376572,0.05866386741399765,-0.025767795741558075,-0.10448192059993744,0.01246917899698019,0.12445927411317825,0.08513597398996353,-0.038857873529195786,-0.016608426347374916,0.13111422955989838,0.12806151807308197,0.07151925563812256,-0.051845308393239975,0.06922462582588196,-0.06861596554517746,0.09624835848808289,0.08442161232233047,-0.12269800901412964,-0.06296923756599426,-0.1516670435667038,0.014606977812945843,-0.09282184392213821,0.13570789992809296,-0.042451631277799606,0.0034705374855548143],[0.019215809181332588,0.023516112938523293,0.1549796611070633,-0.02114979550242424,0.06696585565805435,-0.08740436285734177,-0.06901071965694427,0.11670351773500443,0.04943690821528435,0.0661655068397522,0.11295279860496521,0.13671262562274933,-0.11336639523506165,-0.12515980005264282,0.10890738666057587,0.023627430200576782,-0.10599804669618607,-0.05218237265944481,0.06754597276449203,0.013884092681109905,-0.12699250876903534,-0.051268965005874634,0.04935590922832489,0.13276351988315582,-0.0545865036547184,0.11490499973297119,0.09156065434217453,0.010799416340887547,-0.11752545088529587,-0.01158338226377964,-0.13055376708507538,-0.043871309608221054,0.05248891934752464,-0.08327822387218475,0.023442387580871582,0.1331949383020401,-0.10129571706056595,0.074627585709095,-0.035734787583351135,0.14541123807430267,-0.051064617931842804,0.012981235049664974,-0.17321407794952393,0.12217678129673004,0.1208682507276535,-0.08439000695943832,0.015443417243659496,-0.09550929814577103,-0.06450072675943375,0.13867247104644775,0.09062034636735916,-0.03196648508310318,-0.11845680326223373,0.09191406518220901,0.1427617371082306,-0.06582086533308029,0.026114165782928467,-0.11760849505662918,-0.09883444011211395,-0.1318701058626175,0.055145539343357086,-0.009459399618208408,0.15766189992427826,0.03852067515254021,-0.07224220037460327,-0.022081850096583366,-0.12453586608171463,-0.03694845736026764,-0.14370489120483398,0.12895816564559937,-0.023759886622428894,0.018673093989491463,0.11723820865154266,0.027088971808552742,-0.15122197568416595,-0.08193180710077286,-0.08061201870441437,-0.05410369485616684,-0.018261851742863655,0.05928073078393936,-0.008073568344116211,-0.000704303674865514,0.06050703674554825,0.11710948497056961,-0.03659624233841896,-0.017136728391051292,-0.04739585518836975,-0.03251746669411659,0.08494574576616287,-0.12565594911575317,-0.12813861668109894,0.12121175229549408,0.04342310130596161,0.12800735235214233,-0.024280032142996788,-0.08191835880279541,0.12262166291475296,-0.07005715370178223,-0.07528510689735413,0.11668814718723297,0.08142409473657608,-0.11513032019138336,0.07040489464998245,0.07293925434350967,-0.07907503843307495,0.12674948573112488,0.13395936787128448,0.04328824207186699,0.018795663490891457,0.07942961156368256,0.13116900622844696,0.13986536860466003,0.13037972152233124,0.12839601933956146,-0.005657064262777567,0.05749432370066643,0.12242621183395386,0.10534004122018814,-0.018805228173732758,0.07500327378511429,-0.1039431095123291,0.1010046973824501,0.019512929022312164,0.11610137671232224,-0.028166603296995163,-0.00465993769466877,-0.08033112436532974,-0.06950751692056656],[0.15094785392284393,-0.10441888868808746,0.08407428860664368,-0.13060623407363892,-0.013592545874416828,0.12182775139808655,0.08469349890947342,-0.03213915973901749,0.048461537808179855,0.06056032329797745,0.08468551933765411,0.02347608655691147,0.06329881399869919,0.08440052717924118,-0.12231393903493881,0.028895191848278046,0.023092908784747124,0.1670176237821579,-0.07177616655826569,-0.0056354813277721405,-0.023169701918959618,-0.05985700339078903,0.01655704341828823,0.02544090896844864,0.031484879553318024,-0.03668723627924919,-0.10394580662250519,0.045240405946969986,-0.08004333078861237,0.046631887555122375,0.08886416256427765,0.10993478447198868,0.029202328994870186,0.1079549789428711,-0.11121951043605804,-0.03579073026776314,0.0037543787620961666,0.10174480825662613,0.08402755856513977,0.03283980116248131,0.09716368466615677,-0.13431218266487122,0.06904643028974533,0.14603756368160248,-0.015471438877284527,-0.09524103254079819,-0.09775768220424652,-0.04035850986838341,-0.11330536007881165,0.1542719602584839,-0.08816415071487427,0.025311369448900223,-0.033419057726860046,0.06252411752939224,0.01569395326077938,-0.1094566062092781,-0.03775111213326454,-0.03633131831884384,0.05906658247113228,0.11122507601976395,-0.013420794159173965,-0.044215455651283264,0.01906292513012886,0.14966833591461182,0.09483762830495834,0.1638057678937912,-0.13642241060733795,0.01713334023952484,-0.0954982340335846,0.044180192053318024,0.09041506052017212,-0.04773792624473572,-0.04969199746847153,-0.05161869898438454,-0.13836733996868134,0.08642778545618057,0.05823204293847084,0.12064982950687408,0.06362195312976837,-0.0046495175920426846,-0.10328400880098343,0.08970589935779572,0.1018272414803505,-0.048748236149549484,-0.0790868028998375,-0.040580470114946365,-0.05968143418431282,0.027656931430101395,0.08053897321224213,0.009589051827788353,0.014954757876694202,0.06532789766788483,-0.11150095611810684,-0.011546983383595943,-0.08141182363033295,-0.04694712907075882,0.10063297301530838,-0.13703259825706482,-0.14425350725650787,-0.07022763788700104,0.1246250569820404,0.15491585433483124,-0.057697225362062454,0.14688806235790253,-0.13111820816993713,-0.026190396398305893,0.1414147913455963,-0.01361090037971735,-0.01591147482395172,-0.09159087389707565,0.05672895163297653,-0.12780798971652985,0.12483587861061096,-0.08607818186283112,0.13745227456092834,-0.12961658835411072,-0.014622409828007221,-0.09880197048187256,-0.02302909642457962,-0.09445008635520935,0.09701693803071976,0.08025498688220978,-8.542903378838673e-05,-0.11679152399301529,-0.09941831976175308,0.10737356543540955,0.08404611796140671,-0.01583232544362545],[-0.0136774443089962,0.03016650304198265,-0.09879427403211594,-0.02353942021727562,0.0059646847657859325,-0.07434577494859695,0.0590350516140461,0.10772116482257843,0.020333202555775642,0.02807815931737423,-0.12438461929559708,0.0823804959654808,0.08609490841627121,0.08723621070384979,-0.054673951119184494,0.13390739262104034,-0.15471521019935608,-0.10880760103464127,0.14254233241081238,-0.04734504595398903,-0.12144999951124191,-0.13528794050216675,-0.0005910414620302618,-0.02609529346227646,0.14804358780384064,0.007736216764897108,0.057215023785829544,-0.09937237203121185,-0.07028458267450333,0.08424094319343567,-0.010852240957319736,-0.12122027575969696,-0.1414075493812561,-0.12061978876590729,0.0874629020690918,-0.09570865333080292,0.09957823157310486,0.05486082285642624,-0.0398300439119339,-0.1041628047823906,0.09372793138027191,0.11349423229694366,0.12058325111865997,0.07124456763267517,-0.12598146498203278,-0.054183635860681534,0.04646129906177521,0.0006217774352990091,-0.06139533221721649,0.006202138960361481,-0.11576784402132034,-0.13396243751049042,-0.03026752360165119,0.0006641735089942813,-0.07624892145395279,-0.07468286156654358,-0.1297486424446106,0.09059511125087738,0.12199606001377106,-0.008990748785436153,-0.13842938840389252,-0.004795748740434647,-0.026632359251379967,0.1448943316936493,0.07167975604534149,-0.050863102078437805,0.11993370205163956,-0.04483340308070183,-0.04238036274909973,0.006294882856309414,0.13314954936504364,0.15277449786663055,-0.1087377518415451,0.025316162034869194,-0.025306461378932,0.10816080868244171,-0.0560327023267746,0.011360988952219486,0.019514944404363632,0.08094219118356705,-0.119054414331913,0.12503308057785034,0.10733172297477722,0.05789823830127716,-0.09769206494092941,-0.029501596465706825,0.014753872528672218,-0.09427224099636078,0.11328341066837311,-0.06464304774999619,0.12950430810451508,0.018184930086135864,-0.010855377651751041,-0.10242102295160294,-0.09557266533374786,-0.10282457619905472,0.012152866460382938,-0.040746185928583145,-0.048359114676713943,0.10105792433023453,0.004196130204945803,0.04714342579245567,-0.1346752792596817,0.05912238359451294,-0.04378810152411461,-0.012322353199124336,0.10663874447345734,-0.004597633145749569,-0.13229741156101227,-0.04592568427324295,0.1466984748840332,0.08843868225812912,0.011356350034475327,-0.030686702579259872,0.13633540272712708,0.007405622396618128,-0.030124308541417122,-0.019372425973415375,-0.09834323078393936,0.024834448471665382,0.07303915917873383,0.12197978049516678,0.13568806648254395,-0.0020821928046643734,-0.04892035201191902,-0.08643350005149841,-0.12271615117788315,-0.042483389377593994],[0.05038398504257202,-0.028441766276955605,-0.10741247981786728,-0.027698958292603493,0.09138060361146927,-0.014375022612512112,0.1045021116733551,0.1192578598856926,-0.05048210546374321,-0.03208933770656586,0.12373504787683487,-0.10179252922534943,-0.10814763605594635,0.0034376324620097876,0.11036068946123123,-0.09427843987941742,-0.03167764097452164,-0.06478104740381241,-0.07649391144514084,-0.07926824688911438,0.04193878918886185,-0.078276626765728,0.09312968701124191,0.07800698280334473,-0.0930522009730339,-0.08350027352571487,-0.08600574731826782,0.0824519619345665,0.006995317991822958,0.06550361216068268,0.03868332505226135,0.09509888291358948,0.14917008578777313,0.14595311880111694,0.09029638767242432,0.15296287834644318,-0.11984232068061829,0.10266946256160736,-0.08455944806337357,0.1126682236790657,0.08960873633623123,-0.03567536547780037,-0.020998770371079445,-0.11912629753351212,0.027287153527140617,-0.09511514753103256,0.09483939409255981,0.15118230879306793,0.12138187885284424,0.0692899152636528,0.12952834367752075,-0.10832811892032623,-0.07174592465162277,-0.12304338812828064,-0.10239177197217941,-0.06514319777488708,-0.027859194204211235,-0.010070008225739002,-0.07803749293088913,0.040863145142793655,0.08923573791980743,0.04435335472226143,0.08921755105257034,-0.03659260272979736,-0.05037911981344223,0.08010724186897278,0.04155285656452179,0.037563156336545944,0.01366383396089077,0.04768712446093559,-0.08527125418186188,-0.028415389358997345,0.12165401130914688,0.09697271138429642,-0.15477515757083893,0.15768800675868988,0.06604807823896408,0.02888604626059532,-0.12742897868156433,-0.01539231650531292,0.14936132729053497,0.04908011481165886,0.04304400458931923,0.05333242565393448,0.013327011838555336,0.024371135979890823,0.07262156903743744,0.12062539905309677,-0.10810478776693344,-0.06956516951322556,-0.06097283959388733,0.03912044316530228,-0.04430830478668213,0.05159548297524452,-0.03768817335367203,-0.03545527905225754,0.12196676433086395,0.16123805940151215,-0.10568336397409439,0.10568786412477493,-0.03222530707716942,-0.14033915102481842,0.04775761812925339,0.07426788657903671,0.02599669247865677,-0.08323050290346146,-0.10157342255115509,-0.03994601219892502,-0.06400130689144135,-0.0980934202671051,-0.006915077567100525,-0.11192506551742554,-0.06836884468793869,-0.050134845077991486,0.07484593242406845,-0.07072236388921738,0.03991419076919556,-0.01119858119636774,0.012488018721342087,0.07011004537343979,0.027401695027947426,0.09997320920228958,0.05343062803149223,-0.09438517689704895,0.06328171491622925,0.11712028086185455,-0.05775264650583267,0.03094244748353958],[0.10984087735414505,0.061490755528211594,0.06551694124937057,0.04839267209172249,-0.12333592027425766,-0.03179334104061127,-0.13522160053253174,0.07395587861537933,-0.10062044858932495,0.049572572112083435,0.06245870143175125,-0.15046243369579315,-0.16351117193698883,0.09411678463220596,0.14659349620342255,0.14603617787361145,0.016147958114743233,-0.05759157985448837,-0.11774790287017822,-0.1290493607521057,0.14597448706626892,0.06891852617263794,-0.13789497315883636,-0.11934752762317657,0.011568021960556507,0.11002279818058014,-0.062283121049404144,0.1675274670124054,-0.03865621238946915,0.0005897470400668681,-0.03698150813579559,0.08284564316272736,0.13195237517356873,-0.1378624439239502,0.043652404099702835,0.06718119978904724,-0.08719916641712189,-0.06617759168148041,-0.10943998396396637,0.09589803218841553,-0.12893462181091309,0.016625668853521347,-0.17120753228664398,0.026905253529548645,-0.09778858721256256,-0.03374363109469414,0.006886922288686037,0.1440945267677307,0.03005927801132202,0.10595954954624176,0.16438591480255127,0.10872427374124527,0.05363049730658531,0.019073760136961937,0.010754923336207867,0.1407966911792755,-0.02542736753821373,-0.12642060220241547,-0.002955675357952714,-0.09495024383068085,0.0906645804643631,-0.07393164932727814,0.05942380428314209,-0.12988537549972534,-0.08216715604066849,0.11975853145122528,-0.0332602933049202,-0.033930908888578415,-0.03565376624464989,-0.04492836445569992,0.11789026856422424,0.09162673354148865,0.024955471977591515,0.041970252990722656,-0.12707142531871796,0.08232017606496811,0.058043722063302994,-0.10170917212963104,0.017476407811045647,-0.01986190490424633,0.1123720034956932,0.13181765377521515,0.10833731293678284,-0.10332132130861282,0.08920036256313324,0.10935769230127335,0.10426539927721024,-0.008792145177721977,0.0448920875787735,0.022277075797319412,0.1123519092798233,-0.06313733756542206,0.03770298510789871,-0.07406633347272873,-0.1539752036333084,0.014569825492799282,-0.1173330619931221,-0.06871641427278519,-0.06891326606273651,-0.07094111293554306,-0.12669368088245392,0.14604787528514862,-0.0778728500008583,0.1422167718410492,-0.1465650051832199,-0.028837261721491814,0.10945931822061539,0.13810977339744568,-0.05276541784405708,-0.07400014996528625,-0.13906435668468475,0.017202679067850113,0.10729073733091354,-0.07885882258415222,-0.031043529510498047,-0.08388707786798477,-0.08188554644584656,-0.11497128009796143,0.1680852323770523,-0.06412786990404129,0.12113573402166367,-0.05478950962424278,0.14401663839817047,0.05848902836441994,-0.00556001253426075,0.11006037890911102,-0.02939043566584587,0.05773467943072319],[0.0866047814488411,0.1413593888282776,-0.07703273743391037,0.03116399049758911,-0.15319111943244934,-0.06569088995456696,0.0830770879983902,0.02298448607325554,0.08519840985536575,-0.12802964448928833,-0.15193575620651245,-0.1013447567820549,-0.11118205636739731,-0.05294274538755417,0.08328982442617416,-0.13417400419712067,-0.04863862693309784,0.014305032789707184,0.021080300211906433,-0.15198636054992676,0.02735266089439392,0.1107092797756195,-0.14494463801383972,0.01969536766409874,0.04204081371426582,-0.15672361850738525,0.0006261231028474867,0.04627899453043938,-0.08489198237657547,-0.03354262188076973,0.033075977116823196,0.0019221839029341936,0.0141300642862916,0.002653315896168351,0.0854344591498375,0.12799081206321716,0.11457853764295578,-0.08234483003616333,-0.10866671800613403,0.12329094856977463,-0.028040051460266113,-0.00926258135586977,-0.08027341961860657,0.004993341863155365,-0.04184788465499878,0.08134438097476959,-0.03672470897436142,0.012295865453779697,0.10422973334789276,-0.09898387640714645,-0.021922362968325615,-0.07369723916053772,-0.1555236577987671,-0.08932600915431976,-0.04596362262964249,-0.07626089453697205,0.0789497047662735,-0.15132398903369904,-0.09070109575986862,-0.0782272219657898,0.0821886733174324,-0.08307415246963501,0.014195982366800308,-0.05273664370179176,0.12309890985488892,-0.07225677371025085,-0.02975894883275032,0.139906108379364,0.08767401427030563,-0.04400986433029175,0.06386885792016983,0.04860031232237816,0.05974263697862625,0.009094910696148872,0.11394976824522018,-0.08297711610794067,-0.12486269325017929,-0.0025660069659352303,0.09989555925130844,-0.11789199709892273,-0.009144902229309082,0.007969791069626808,0.1313440352678299,-0.10258865356445312,0.14705416560173035,-0.013704027980566025,0.0690917819738388,0.13194507360458374,-0.11686612665653229,-0.010615182109177113,-0.03734247386455536,0.005249362904578447,-0.12641477584838867,-0.08941343426704407,0.06323514133691788,-0.1221299022436142,0.13175229728221893,-0.06934304535388947,0.063360296189785,0.10183179378509521,-0.12022028863430023,0.023494502529501915,-0.08747237920761108,0.053609736263751984,-0.10365596413612366,0.009153719991445541,-0.1427868902683258,-0.03986899182200432,0.022548772394657135,0.024984508752822876,0.14203152060508728,-0.10879954695701599,-0.08398433774709702,-0.12544485926628113,0.10349827259778976,-0.1565382033586502,0.0699148178100586,0.037241850048303604,-0.04434540867805481,0.009624128229916096,-0.1115659698843956,0.009342696517705917,0.00932982936501503,-0.08540759235620499,0.1133471131324768,0.1341949999332428,0.14066118001937866,-0.11253493279218674],[0.11405438929796219,0.016535906121134758,0.08630699664354324,0.006220879033207893,0.145335853099823,-0.09139811992645264,0.11951328068971634,0.11806389689445496,0.09435639530420303,0.0820218175649643,-0.06456703692674637,-0.07697734236717224,0.12104306370019913,-0.031597740948200226,-0.030406245961785316,-0.06171971932053566,0.10700416564941406,0.021103261038661003,0.06892644613981247,-0.12221881002187729,0.08995247632265091,0.05225331708788872,0.06736984103918076,0.01581437513232231,0.026959097012877464,-0.13489452004432678,0.0804416611790657,-0.1317303329706192,0.08418038487434387,0.07733181118965149,0.06915359944105148,-0.11248213797807693,-0.05895474553108215,-0.11636097729206085,0.0354115292429924,0.027216104790568352,0.09977462887763977,0.09980402141809464,0.02218620479106903,-0.06087524816393852,0.07985025644302368,-0.04119464010000229,0.06392109394073486,-0.0681379958987236,-0.038832321763038635,-0.06063972786068916,0.16392679512500763,-0.0803460031747818,0.08116321265697479,0.01933342032134533,0.11011870205402374,-0.08741886168718338,0.10656312853097916,0.15416619181632996,-0.12555167078971863,0.09392551332712173,0.0844261646270752,0.06126284971833229,-0.03033626638352871,0.10773298144340515,0.09489057213068008,-0.12791363894939423,-0.1016838327050209,-0.03798367828130722,-0.023561814799904823,0.05358721315860748,-0.09298253059387207,-0.0005762080545537174,-0.04593634605407715,0.006406248081475496,0.10363515466451645,-0.11318515241146088,0.007176318671554327,-0.10895728319883347,0.0960138812661171,-0.025756152346730232,-0.04975111410021782,-0.0921272411942482,0.12731099128723145,0.04613117128610611,-0.030799657106399536,0.037135154008865356,0.026493988931179047,-0.1398162692785263,0.040163394063711166,-0.04782269895076752,0.09837070107460022,0.13671281933784485,-0.08291154354810715,-0.10077274590730667,-0.09776326268911362,0.03388012573122978,0.06717844307422638,0.13548220694065094,-0.019984181970357895,-0.14993467926979065,-0.12332159280776978,-0.06057385355234146,0.0070813805796206,0.15916545689105988,-0.0345429889857769,-0.007016769610345364,-0.13143107295036316,0.06408354640007019,-0.12179973721504211,0.06160721182823181,0.0767262876033783,-0.06197154149413109,-0.12785570323467255,0.08493848890066147,0.08565129339694977,-0.10504653304815292,-0.11189204454421997,0.1087627112865448,0.03159615769982338,-0.1486104130744934,0.012843216769397259,-0.03610392287373543,0.10598012059926987,-0.13144412636756897,-0.03432973846793175,0.08854886144399643,0.08421751111745834,-0.09384872764348984,-0.1405373066663742,-0.11797542870044708,-0.05409974232316017,0.02626408264040947],[0.06374093890190125,-0.1310354471206665,0.058795392513275146,0.08643758296966553,-0.09857991337776184,-0.0683782622218132,0.07770604640245438,-0.0019582603126764297,-0.10881228744983673,-0.1135830357670784,-0.0074095092713832855,-0.01883571408689022,-0.131576806306839,0.05027803033590317,0.014844482764601707,-0.06853732466697693,-0.14625073969364166,-0.05694233253598213,0.00683532003313303,-0.005545018706470728,-0.11844443529844284,0.1415918916463852,-0.0363103449344635,0.023890100419521332,-0.14132629334926605,0.014760644175112247,-0.040544331073760986,0.13801074028015137,0.1198461651802063,-0.0060501485131680965,-0.063350148499012,0.13442692160606384,-0.029768899083137512,0.019872870296239853,-0.04275176674127579,0.035819169133901596,0.10564283281564713,0.1432378739118576,-0.05436503142118454,-0.09313683956861496,0.14437972009181976,0.047160737216472626,0.15588940680027008,0.049403440207242966,0.12844890356063843,0.11898201704025269,-0.023342041298747063,-0.08650384098291397,-0.12578457593917847,-0.025861216709017754,-0.07569153606891632,0.10158655047416687,-0.11844980716705322,0.034214191138744354,0.12298551946878433,-0.05044761300086975,-0.09074774384498596,0.12506262958049774,0.009500726126134396,-0.12084703892469406,0.12966972589492798,-0.0006872547091916203,0.010728342458605766,0.06790492683649063,0.09276488423347473,0.12055650353431702,-0.1562371701002121,0.07302779704332352,-0.12333358824253082,-0.00680202804505825,0.02722666971385479,-0.021131619811058044,0.03521473705768585,0.006687643006443977,-0.14230653643608093,-0.04514795169234276,-0.12658502161502838,-0.07642674446105957,0.14784687757492065,-0.0677909106016159,0.09938333928585052,-6.661294173682109e-05,0.07992426306009293,0.038815632462501526,-0.11397017538547516,0.0901404395699501,0.12289385497570038,0.11702727526426315,0.1386592835187912,0.06763386726379395,-0.10877589881420135,-0.10058536380529404,-0.11695829033851624,0.045325908809900284,0.04901298135519028,0.0813811868429184,-0.05205611139535904,0.027091048657894135,-0.14454285800457,0.07374133169651031,0.09802311658859253,-0.11912810057401657,0.02189113013446331,0.09489073604345322,-0.09201668947935104,0.10046316683292389,-0.08057346940040588,-0.13189862668514252,0.1325240284204483,0.03880821540951729,-0.08737009018659592,0.11182591319084167,-0.11049522459506989,0.0027152711991220713,0.10138190537691116,-0.05335681140422821,-0.09570863097906113,-0.07792055606842041,-0.10894398391246796,0.10396860539913177,-0.06365786492824554,-0.10820329934358597,0.10920336842536926,0.025522155687212944,0.11576975136995316,-0.03842708840966225,0.04224032536149025,0.06294959038496017],[0.01921122707426548,-0.13680517673492432,0.08494681119918823,-0.02390201948583126,-0.10320761054754257,-0.11429373174905777,-0.08450161665678024,-0.06128867343068123,0.054200779646635056,-0.05292563512921333,-0.024785535410046577,-0.1612159013748169,0.13922250270843506,0.06253320723772049,-0.13045990467071533,-0.12478514015674591,-0.046486180275678635,0.07621291279792786,-0.010300111025571823,0.020644864067435265,0.017348673194646835,0.03199205920100212,0.1371479630470276,0.09287330508232117,0.04250016435980797,-0.14369797706604004,0.08139646053314209,-0.00639719795435667,0.0252878125756979,0.08528534322977066,0.0072974651120603085,0.12373670935630798,0.12039759755134583,0.05630835145711899,0.06649770587682724,-0.00503303250297904,0.01453228760510683,0.020185915753245354,0.10766510665416718,-0.13131767511367798,0.15531626343727112,0.052926983684301376,-0.12894928455352783,0.027945157140493393,-0.02414489910006523,0.1284627914428711,-0.13994964957237244,0.011928814463317394,-0.0758686512708664,0.004438306204974651,-0.1259792447090149,-0.03934121131896973,0.12116701155900955,0.09309365600347519,0.03271810710430145,-0.003911791834980249,0.017943106591701508,-0.09024070203304291,0.10887139290571213,-0.08964638411998749,-0.11340870708227158,0.019696202129125595,-0.14301548898220062,-0.0346272848546505,0.015144727192819118,0.043961748480796814,0.12637263536453247,-0.11134756356477737,0.02714727632701397,0.13165633380413055,0.08842995017766953,0.08767426013946533,-0.10027195513248444,-0.1422588974237442,0.0027984101325273514,-0.15099065005779266,-0.14168979227542877,0.09475110471248627,-0.08434668928384781,0.0637931078672409,-0.12291895598173141,-0.10455838590860367,-0.05469733476638794,-0.0005723979556933045,0.002230854472145438,-0.116386279463768,0.09935062378644943,-0.08155573159456253,-0.056578103452920914,0.08068026602268219,-0.09603753685951233,0.0890822559595108,0.13949866592884064,0.027859816327691078,-0.15653494000434875,-0.0664236918091774,0.1081501692533493,0.14080801606178284,0.03650528937578201,-0.052314482629299164,-0.11460871994495392,-0.11165077984333038,-0.10100080817937851,0.05359101668000221,0.10862203687429428,-0.12335143983364105,-0.0006964492495171726,0.03972604498267174,-0.0018502315506339073,0.07174476236104965,0.018040796741843224,1.8113320038537495e-05,0.10546404868364334,0.15815304219722748,0.05126926675438881,-0.056346576660871506,0.07700305432081223,0.13690009713172913,-0.0632849633693695,0.11245401203632355,0.04209364205598831,-0.008411234244704247,-0.017893696203827858,-0.024038968607783318,-0.1571408212184906,-0.02051546610891819,0.16778039932250977,0.11091583967208862],[0.04041615128517151,0.04369856417179108,0.054124459624290466,-0.10880685597658157,0.025602128356695175,-0.0803966373205185,-0.02980082482099533,0.008919564075767994,0.004082369618117809,-0.05229298397898674,0.03924975171685219,-0.15202564001083374,-0.04587463662028313,0.057794008404016495,0.014443912543356419,0.04198179394006729,-0.019138537347316742,0.08281392604112625,-0.10546465963125229,0.14004580676555634,0.1054321900010109,0.0981045514345169,0.12678803503513336,0.04179394617676735,0.06609345227479935,-0.12805292010307312,-0.1387282758951187,-0.12384074181318283,-0.06691863387823105,-0.006505493074655533,0.07880210876464844,0.10267235338687897,0.07192252576351166,-0.09293549507856369,-0.13624507188796997,-0.02785966731607914,0.07514600455760956,-0.014909984543919563,0.07386218011379242,0.08173517882823944,0.10846616327762604,-0.07975824922323227,-0.03375816345214844,0.0935831367969513,0.001949313678778708,-0.11968756467103958,0.042713843286037445,0.01639346405863762,-0.07414904236793518,0.02090243063867092,0.05853835865855217,0.09252875298261642,-0.10034192353487015,-0.10590364784002304,-0.10063100606203079,-0.05569979175925255,0.04435659199953079,-0.15226300060749054,-0.1293681561946869,0.017047218978405,0.016995808109641075,-0.1442619115114212,-0.025721775367856026,0.00317079434171319,-0.06269195675849915,0.026028377935290337,-0.07068337500095367,-0.0876736044883728,-0.019829122349619865,-0.13566653430461884,0.1259789764881134,-0.0003997141611762345,-0.005615452770143747,-0.15073339641094208,0.06490093469619751,-0.1410624384880066,-0.06209308281540871,0.07369343936443329,-0.007595682051032782,-0.08331955969333649,0.0010323910973966122,0.09934265911579132,0.012864911928772926,-0.0864437073469162,-0.08984485268592834,0.04602797329425812,0.11062402278184891,0.04135926440358162,0.07210218161344528,-0.1065358892083168,-0.12221261113882065,0.08209085464477539,0.028548574075102806,-0.14325560629367828,-0.11254063248634338,-0.08834022283554077,-0.116421177983284,-0.024782277643680573,-0.03959685191512108,0.10880662500858307,-0.08630277961492538,0.09896967560052872,-0.06010138988494873,-0.027023302391171455,-0.03322131559252739,-0.04190288111567497,0.027525965124368668,-0.0013271123170852661,0.01631210371851921,-0.06649362295866013,-0.11802513897418976,-0.034751590341329575,-0.016085894778370857,-0.0599675253033638,0.1296277642250061,-0.09119903296232224,-0.007747067138552666,0.11801044642925262,0.10554061830043793,0.11732517927885056,0.04117393493652344,-0.03821341693401337,-0.10316773504018784,0.1328269988298416,-0.04513627290725708,-0.14293085038661957,0.02903534099459648,-0.09884443134069443],[0.05105309188365936,0.0004632836498785764,-0.0979016050696373,-0.004828500095754862,0.08188188076019287,0.08494822680950165,0.050202690064907074,-0.10850204527378082,-0.1176702231168747,-0.03023645281791687,-0.03922464698553085,0.0691629946231842,0.01576324552297592,-0.08500289916992188,-0.07061576098203659,-0.0655563473701477,0.06323109567165375,0.08652772009372711,0.05766361206769943,-0.09921544045209885,-0.04325605556368828,-0.04668043553829193,-0.09962982684373856,0.028703510761260986,0.05318007618188858,-0.11419876664876938,0.03936406970024109,-0.10990039259195328,-0.044187240302562714,0.041744641959667206,0.11006475985050201,-0.0310039259493351,0.03905421122908592,0.06656457483768463,0.08766097575426102,0.08108855038881302,-0.012588480487465858,0.10830102115869522,-0.024259336292743683,-0.026709310710430145,-0.087068110704422,0.05822935327887535,0.05470666661858559,-0.13271817564964294,0.01914121024310589,-0.15214920043945312,0.08953337371349335,0.0012931183446198702,0.071030393242836,0.02372221276164055,0.030991550534963608,-0.13311979174613953,-0.038926709443330765,-0.011292092502117157,-0.02286132425069809,-0.0922212079167366,0.11601224541664124,0.11436530947685242,-0.07358728349208832,-0.0545341782271862,0.12504231929779053,0.026144735515117645,0.02984313853085041,-0.03319350257515907,0.00813997257500887,0.15033897757530212,0.02893134020268917,-0.03425820544362068,0.0744902715086937,-0.060452744364738464,0.13553455471992493,0.041243776679039,-0.09223268181085587,-0.11827590316534042,-0.1023527979850769,-0.1522810310125351,-0.18092691898345947,0.027372587472200394,0.0754925012588501,-0.11935410648584366,-0.04436463862657547,0.09127489477396011,0.036416541785001755,-0.13794521987438202,-0.023016970604658127,0.05682624876499176,0.08032555878162384,0.09435025602579117,-0.0238295067101717,-0.0740400031208992,-0.132780060172081,-0.020454145967960358,-0.011855674907565117,0.10773356258869171,0.0023366359528154135,0.056229256093502045,-0.14080031216144562,-0.0241728313267231,0.0035579148679971695,-0.01865542121231556,0.057082291692495346,0.06616568565368652,-0.10472285002470016,0.05569930374622345,-0.06728075444698334,-0.03703255206346512,0.06330154091119766,0.025407517328858376,0.13086633384227753,-0.14815093576908112,-0.030663948506116867,-0.13238953053951263,-0.10430688410997391,0.12500326335430145,0.008394618518650532,0.06305871158838272,-0.00030467312899418175,0.08512349426746368,-0.061740316450595856,-0.12794837355613708,-0.008020694367587566,-0.10177197307348251,-0.08558408915996552,0.11741647869348526,-0.0024060497526079416,0.08374738693237305,0.05534413456916809,-0.025231285020709038],[-0.031127789989113808,-0.103886179625988,0.03167881816625595,-0.031634166836738586,-0.13893109560012817,-0.043350011110305786,-0.10209554433822632,-0.114945188164711,0.07672476768493652,-0.0907302126288414,-0.05102579668164253,0.03650496155023575,-0.09419778734445572,0.00672038272023201,-0.05630192533135414,0.02534916251897812,-0.1164882704615593,-0.022050688043236732,0.06827793270349503,0.015243446454405785,0.1420508176088333,0.1223176121711731,0.003614061279222369,0.12292925268411636,0.07210328429937363,0.04446243494749069,0.015229417011141777,0.03853025287389755,0.14269205927848816,0.06206629052758217,0.02076166868209839,-0.0841921716928482,-0.015595962293446064,-0.14832466840744019,0.08463723957538605,0.14724473655223846,-0.08027268201112747,-0.10494689643383026,-0.005886570550501347,-0.06441587209701538,-0.01723634824156761,-0.008340812288224697,-0.10903781652450562,-0.059773996472358704,-0.08664657175540924,0.043630391359329224,0.11865071207284927,0.009253843687474728,-0.028987454250454903,-0.022735388949513435,-0.03153860569000244,-0.10337845236063004,-0.03446268290281296,-0.09336744993925095,-0.05578133091330528,0.13980025053024292,0.043820034712553024,-0.03377367928624153,-0.04213050752878189,0.14357121288776398,-0.1239553838968277,0.009786161594092846,0.12412606924772263,0.08397679775953293,0.009845399297773838,-0.16091091930866241,-0.1528373509645462,-0.12621814012527466,-0.14322087168693542,0.10984454303979874,-0.14375224709510803,-0.09484614431858063,-0.038765065371990204,0.04529912397265434,-0.11739056557416916,-0.08372057229280472,0.04178454726934433,0.02640422061085701,0.009345099329948425,0.1233779713511467,0.04259137436747551,-0.14882586896419525,-0.027535205706954002,-0.14620506763458252,0.024965891614556313,0.12333738058805466,-0.038308095186948776,0.02777736634016037,-0.142600879073143,0.09449087083339691,0.04754667356610298,-0.050929777324199677,-0.14033928513526917,0.12861810624599457,0.010044502094388008,-0.014798411168158054,-0.15193334221839905,0.07012220472097397,0.13644836843013763,0.02713407203555107,0.12851352989673615,-0.1293356716632843,-0.032463520765304565,0.04102431982755661,0.08866002410650253,-0.028337374329566956,0.09293784201145172,0.039091531187295914,-0.10463446378707886,-0.15777727961540222,-0.002105160616338253,-0.09170300513505936,0.08543416112661362,0.04086676612496376,-0.058345746248960495,-0.0132592199370265,-0.14585508406162262,-0.07640057802200317,-0.06266409158706665,-0.08240765333175659,-0.016711615025997162,0.026979023590683937,-0.08004152029752731,-0.02488843910396099,0.008727832697331905,-0.09165237098932266,-0.030221683904528618,-0.13882635533809662],[-0.07252875715494156,0.018202384933829308,-0.11862392723560333,0.03579317778348923,-0.023293286561965942,0.007744493894279003,0.013598986901342869,-0.0006148100947029889,-0.0636313259601593,-0.08475861698389053,-0.04094403237104416,0.10175014287233353,0.09814829379320145,-0.03210584074258804,-0.042936623096466064,-0.13361792266368866,0.009786317124962807,0.08485246449708939,-0.10210990160703659,0.04274316132068634,-0.1106417253613472,0.08453741669654846,-0.08988243341445923,0.13838855922222137,-0.10168816894292831,-0.1213158443570137,-0.13960252702236176,-0.12873198091983795,0.040121085941791534,-0.13528533279895782,0.11421074718236923,0.09016837179660797,-0.14591872692108154,-0.011560093611478806,-0.04481680691242218,-0.11392442882061005,0.051161207258701324,-0.011684337630867958,-0.12846291065216064,0.038960039615631104,0.13417765498161316,-0.039419885724782944,0.08418957889080048,-0.0933755487203598,0.060340046882629395,0.09160444140434265,-0.034573815762996674,-0.018444320186972618,-0.05628408119082451,-0.0009722699760459363,-0.1250176578760147,0.06050584092736244,-0.06485825031995773,-0.08228220790624619,-0.111455537378788,-0.009894099086523056,-0.030597059056162834,-0.15555518865585327,0.09864430129528046,0.005535919219255447,0.0955263152718544,0.02652152068912983,0.042530592530965805,0.12579473853111267,0.13367591798305511,-0.12685488164424896,-0.09822335839271545,0.1153692975640297,-0.1324758380651474,-0.03213774412870407,-0.1040385290980339,-0.15009115636348724,-0.0019318300765007734,0.10143670439720154,-0.05191881209611893,-0.10802548378705978,-0.026673467829823494,0.09012673050165176,0.05248146504163742,-0.0792102962732315,-0.02896975725889206,0.10932987183332443,-0.027772925794124603,0.0576297789812088,-0.09630202502012253,0.03969370573759079,0.06341692060232162,-0.0428883321583271,0.0873916894197464,-0.11669957637786865,-0.026617929339408875,0.01885896734893322,0.10136668384075165,-0.07401216775178909,-0.0440576896071434,0.12556901574134827,-0.1448238343000412,0.1263897567987442,0.12643618881702423,0.1312117725610733,-0.06895624101161957,-0.05347880348563194,0.09527932107448578,0.14383628964424133,-0.08945846557617188,-0.10935351997613907,-0.021154481917619705,-0.05275769159197807,-0.07267800718545914,-0.07813415676355362,-0.02758735790848732,-0.08343720436096191,-0.08830742537975311,0.10970129817724228,0.07542024552822113,-0.085666723549366,-0.009153202176094055,0.03890892118215561,-0.13008764386177063,-0.007773785386234522,-0.02558932639658451,0.030796943232417107,0.13497287034988403,-0.040676966309547424,0.016629930585622787,0.008326496928930283,-0.0760212317109108,0.12310172617435455],[0.1056797206401825,0.10251273214817047,-0.15123017132282257,0.03085402213037014,0.003495311364531517,-0.13670770823955536,0.13784001767635345,0.14503058791160583,-0.08823776990175247,-0.13453467190265656,0.14088383316993713,0.02350487746298313,0.13515670597553253,0.1192813366651535,-0.059211261570453644,0.04398694261908531,-0.035944581031799316,0.13639488816261292,-0.003640945302322507,0.08983144909143448,0.12557031214237213,0.09082008898258209,-0.05482969060540199,0.005264854524284601,0.14881455898284912,0.09331147372722626,-0.11894136667251587,-0.03168514743447304,0.13561059534549713,-0.09496590495109558,-0.1049358993768692,0.047831322997808456,-0.1414453387260437,-0.027090974152088165,-0.10732860118150711,0.058874085545539856,-0.0026224188040941954,-0.01870807260274887,-0.1333727240562439,-0.14782589673995972,0.06019444018602371,-0.12285088747739792,-0.12969133257865906,-0.1020515114068985,0.13896065950393677,-0.011190250515937805,-0.06155114248394966,-0.1011832058429718,-0.06002805382013321,-0.10634994506835938,-0.007634552661329508,-0.13104571402072906,-0.011300073936581612,0.09254723787307739,0.1200345978140831,-0.14753124117851257,0.07342088967561722,-0.10825465619564056,0.07643594592809677,-0.0007336016860790551,0.012109708972275257,-0.040422968566417694,-0.06316084414720535,-0.02157447300851345,0.1445745974779129,-0.09392403066158295,-0.026261067017912865,0.14716669917106628,-0.09283819794654846,0.14432288706302643,-0.012015284039080143,0.006098079960793257,-0.028959712013602257,0.039884235709905624,0.07362867891788483,0.03966790810227394,-0.08040698617696762,0.0408342219889164,-0.01580195315182209,-0.0187063030898571,0.07945209741592407,0.032741229981184006,0.12241148948669434,-0.024690739810466766,-0.11419863253831863,-0.07355964183807373,0.11186137050390244,0.0787273645401001,0.04422595724463463,-0.12998585402965546,-0.0348048210144043,-0.13376757502555847,-0.013183130882680416,-0.07022358477115631,-0.09291981905698776,0.10425874590873718,0.006539586931467056,-0.022945327684283257,0.09367211908102036,-0.04576633870601654,0.023494116961956024,0.12468559294939041,-0.009109838865697384,-0.04384539648890495,-0.09417415410280228,-0.03278651088476181,0.03941400721669197,-0.04755428060889244,-0.024299580603837967,-0.04659157618880272,0.050038956105709076,0.02520425245165825,-0.04009803384542465,0.10393819212913513,0.045147206634283066,-0.14131514728069305,-0.027061879634857178,0.07057680189609528,-0.03280878812074661,-0.13403776288032532,-0.12510274350643158,-0.06512666493654251,0.015414140187203884,-0.11498779058456421,0.018650488927960396,0.13722556829452515,0.08844459056854248,-0.014462643302977085],[-0.11682778596878052,-0.021815745159983635,0.06201514974236488,0.03396809473633766,-0.15019966661930084,0.04295729845762253,0.138681560754776,-0.10519548505544662,-0.041304703801870346,-0.056597836315631866,-0.1139770895242691,-0.029314005747437477,0.043585073202848434,0.13223621249198914,-0.02992347814142704,-0.02347937412559986,-0.14869438111782074,0.10508402436971664,0.009980263188481331,0.03197215870022774,-0.10668566823005676,-0.08308715373277664,0.009185198694467545,0.12772603332996368,-0.1439289003610611,0.127125546336174,-0.0036809034645557404,0.1520262509584427,0.15081757307052612,-0.1498921662569046,-0.01867006905376911,-0.13131330907344818,-0.10212764143943787,0.08981958776712418,0.06737463921308517,-0.07348095625638962,-0.04989752918481827,0.1340499073266983,0.14941924810409546,-0.15126623213291168,0.10724566876888275,-0.1162736788392067,-0.1077275425195694,0.03959696739912033,-0.11425390839576721,0.051771655678749084,-0.06706245988607407,-0.05131910368800163,-0.07338383048772812,0.056519098579883575,-0.11833702772855759,0.013946530409157276,-0.013553611002862453,-0.050237227231264114,0.023970235139131546,-0.08610929548740387,0.13076050579547882,-0.0059652249328792095,-0.030171101912856102,-0.0028185711707919836,0.10796103626489639,0.034184351563453674,-0.13487373292446136,-0.13705095648765564,-0.1521795690059662,0.07382699847221375,-0.14572517573833466,0.1403961032629013,0.03781190887093544,-0.08767830580472946,0.1232108399271965,-0.11958087235689163,-0.012109237723052502,0.1484271138906479,6.456595656345598e-06,0.06468835473060608,-0.12454237788915634,-0.13865487277507782,0.0919613465666771,-0.13513076305389404,-0.14490266144275665,0.028490612283349037,0.11047577857971191,0.013434178195893764,0.07874620705842972,0.10529253631830215,0.000887376896571368,0.021661587059497833,0.0816507413983345,0.04356931895017624,0.13016381859779358,0.08196864277124405,0.05919589102268219,0.026062406599521637,0.003958181012421846,-0.032427482306957245,0.06482838094234467,-0.03917858004570007,-0.09448758512735367,0.1513930857181549,-0.021094350144267082,-0.12188036739826202,0.06296023726463318,-0.04964577034115791,-0.13167910277843475,0.10552902519702911,-0.12366538494825363,0.13542303442955017,0.13572441041469574,0.08147218823432922,-0.10668797791004181,-0.09344811737537384,-0.035505447536706924,0.014128215610980988,0.08559724688529968,0.11431571841239929,-0.07939668744802475,0.04183736816048622,-0.06315554678440094,0.10320702940225601,0.0592692568898201,0.09145999699831009,-0.1408281922340393,0.10479168593883514,-0.030209504067897797,-0.017016952857375145,-0.049001164734363556,0.05814378336071968],[-0.09113532304763794,0.08943889290094376,-0.011921945959329605,-0.03148365020751953,-0.012533106841146946,-0.022497326135635376,-0.025707047432661057,0.11825509369373322,-0.11093127727508545,0.08140341192483902,-0.09819486737251282,-0.0774388387799263,0.08544984459877014,-0.14895136654376984,-0.06702795624732971,0.051895879209041595,-0.09908553957939148,0.12252143025398254,0.14656557142734528,-0.0007838506135158241,0.04366004467010498,0.060544028878211975,-0.08577868342399597,-0.05143973231315613,-0.020793896168470383,-0.03239557147026062,0.07183541357517242,0.09283821284770966,0.09320128709077835,-0.059085387736558914,-0.07806900143623352,0.15024462342262268,-0.09431319683790207,0.000563654990401119,0.058168500661849976,-0.05266178771853447,0.042727768421173096,0.019492536783218384,0.038806308060884476,-0.03722156584262848,-0.06000871583819389,-0.08860304206609726,0.1318817138671875,-0.0014264940982684493,-0.09496968984603882,-0.11631400138139725,0.1213279739022255,-0.05482002720236778,-0.11130505800247192,-0.1403951644897461,0.13374686241149902,0.07699098438024521,-0.03635628521442413,0.08789530396461487,-0.031732071191072464,0.0019138536881655455,-0.15119992196559906,-0.0741504356265068,0.07554231584072113,-0.04429921880364418,-0.13784348964691162,-0.05236561596393585,-0.0018959101289510727,-0.11865449696779251,-0.08216934651136398,0.030661171302199364,0.1257440447807312,-0.003851560642942786,0.01185805443674326,0.11515171080827713,-0.13782022893428802,-0.1310194581747055,0.04731135815382004,-0.11464705318212509,0.040764253586530685,0.029054872691631317,0.01890680566430092,0.06290140002965927,0.0011424211552366614,0.1193210557103157,0.11046785861253738,0.1260821521282196,-0.05383262038230896,0.10070212930440903,-0.07459840923547745,-0.0408945269882679,-0.09549468755722046,-0.10539037734270096,-0.12116973102092743,-0.0003740909742191434,-0.012098626233637333,-0.010265287943184376,-0.0328223891556263,-0.0017019481165334582,-0.0523863360285759,-0.14957910776138306,0.0343896746635437,-0.06479261070489883,-0.045938748866319656,-0.04554896429181099,-0.07225436717271805,0.104812853038311,0.030558878555893898,-0.04421081393957138,0.06740206480026245,0.07147339731454849,0.09560167044401169,-0.15006475150585175,0.09368889778852463,-0.06757704168558121,0.11324407160282135,-0.02720901556313038,0.11412673443555832,0.11085043102502823,-0.09367655962705612,0.058851566165685654,-0.08327963203191757,-0.05055808275938034,0.129140704870224,-0.030641790479421616,-0.12575000524520874,-0.0545833557844162,0.08079537749290466,0.14645104110240936,0.08879516273736954,-0.04116683453321457,0.012944500893354416,0.04542919248342514],[-0.012155311182141304,0.018968814983963966,-0.130828857421875,0.04930926859378815,-0.1282161921262741,-0.07082869857549667,-0.05394870787858963,-0.12550291419029236,0.03927801921963692,-0.012304655276238918,-0.02582401968538761,0.1069582924246788,-0.059064656496047974,-0.05843466892838478,0.14298589527606964,-0.05606035888195038,-0.11636816710233688,-0.09803217649459839,-0.041603513062000275,0.09581838548183441,-0.018318988382816315,-0.0091540003195405,-0.019467735663056374,-0.046102382242679596,-0.12432263046503067,0.0410505086183548,0.0571499764919281,-0.1184241995215416,-0.032525744289159775,-0.023451445624232292,0.0642489641904831,0.038959141820669174,-0.09482034295797348,-0.023797357454895973,0.06927584856748581,-0.11664647608995438,0.06456385552883148,0.034668195992708206,-0.03783037140965462,0.0011585104512050748,0.09422072768211365,0.0733046904206276,-0.009641259908676147,0.02119569666683674,0.07487593591213226,0.08136633038520813,-0.007648183964192867,-0.12077497690916061,0.13598383963108063,-0.14336974918842316,-0.10098133981227875,-0.037096451967954636,-0.07299001514911652,0.08552856743335724,0.12256781756877899,0.14413659274578094,0.02884727343916893,-0.03226166591048241,0.005355834495276213,-0.006101356819272041,-0.01753910630941391,-0.12461654096841812,0.12578849494457245,-0.13613684475421906,-0.14298014342784882,0.06397198885679245,0.12628011405467987,-0.028612403199076653,0.058348990976810455,-0.11748368293046951,0.021025096997618675,0.13440659642219543,-0.07448356598615646,-0.07724466919898987,0.07131081074476242,0.0557086281478405,-0.06893410533666611,-0.12712953984737396,0.033908843994140625,-0.01963398978114128,0.13432762026786804,0.11828377842903137,-0.014589685946702957,0.03104586713016033,-0.020259825512766838,-0.11459466069936752,0.17366868257522583,0.013259857892990112,-0.12170086801052094,-0.08007985353469849,-0.12410243600606918,0.06496617943048477,0.06273847073316574,-0.10501553118228912,-0.12248017638921738,-0.09986786544322968,0.057809192687273026,0.0397772379219532,0.1262660175561905,-0.0924496278166771,-0.14666587114334106,-0.1303682029247284,0.07179800420999527,-0.0602869838476181,0.012388576753437519,0.10697626322507858,-0.05129263177514076,0.1125948503613472,0.08654282242059708,-0.093843974173069,-0.09338156133890152,-0.047188568860292435,-0.1095045953989029,-0.12937651574611664,0.08658286184072495,-0.05240907892584801,0.015033053234219551,0.11948583275079727,0.13259051740169525,-0.08430949598550797,0.13220147788524628,-0.09039120376110077,-0.12998685240745544,-0.07998927682638168,0.1367274820804596,-0.11766383051872253,-0.10493139177560806,0.08672638982534409],[0.08925041556358337,0.08149764686822891,-0.05464724078774452,0.08394966274499893,-0.10217692703008652,-0.117534339427948,-0.03009895235300064,0.006032310426235199,0.11841066926717758,0.09589972347021103,-0.058981578797101974,0.039616093039512634,0.011090802028775215,-0.1319235861301422,-0.06046130508184433,-0.0003779727849178016,-0.10750087350606918,0.01294093206524849,0.07007180899381638,0.07773862034082413,0.09924404323101044,0.09297836571931839,0.07269566506147385,-0.13703374564647675,0.09397029131650925,-0.11686748266220093,-0.07191415876150131,-0.11640924215316772,-0.10293963551521301,0.11695754528045654,0.04782145470380783,-0.03218686953186989,0.10234719514846802,0.059074804186820984,0.0675966888666153,-0.09368855506181717,-0.08406370133161545,0.11449646949768066,-0.14133839309215546,0.07864704728126526,0.0954122319817543,0.05753648653626442,-0.10469865053892136,0.06143311411142349,0.04033006355166435,-0.04721521586179733,-0.10032721608877182,-0.04546144977211952,0.038196295499801636,0.024069134145975113,0.10948529094457626,0.05301409587264061,-0.1316935271024704,-0.0290593970566988,0.04623650759458542,-0.03765689209103584,0.11809024959802628,0.1392047107219696,0.15101785957813263,-0.00044054907630197704,-0.013249484822154045,0.013839028775691986,0.11421092599630356,0.10710325837135315,0.02028265781700611,0.16512729227542877,-0.07196998596191406,-0.01858290657401085,-0.12915167212486267,-0.015256104990839958,-0.056978292763233185,-0.11520136892795563,-0.10347510129213333,0.08816152811050415,-0.08871425688266754,0.09113387763500214,0.023432031273841858,0.05589637532830238,-0.005963482894003391,0.007048900239169598,-0.03310609981417656,0.07372014224529266,-0.02272540144622326,-0.03774575516581535,-0.14061668515205383,0.0038409170228987932,-0.015443851239979267,-0.12609192728996277,-0.14461404085159302,0.07550077140331268,-0.08664517104625702,0.11745849251747131,-0.12684345245361328,0.1428166925907135,0.019212059676647186,0.15469053387641907,-0.10760688036680222,0.035468194633722305,0.12600697576999664,0.14703336358070374,-0.09511487931013107,0.1334719955921173,-0.08907236903905869,0.10913731157779694,0.04613613337278366,-0.11625675112009048,0.09486359357833862,-0.030870618298649788,-0.09087493270635605,-0.16239312291145325,0.0674891546368599,-0.10881003737449646,-0.04357868432998657,-0.15505166351795197,-0.0142187075689435,0.09740494191646576,0.021252252161502838,-0.1239992156624794,0.11138808727264404,-0.008227751590311527,-0.05973353981971741,-0.13631556928157806,0.12975795567035675,-0.09576698392629623,0.03392116352915764,-0.1505221426486969,0.10190239548683167,-0.08093515783548355],[0.08874373137950897,0.08728809654712677,0.09203846007585526,-0.09428372234106064,-0.0907750204205513,0.12098248302936554,-0.11546611040830612,0.0020139191765338182,-0.07078047096729279,-0.07748767733573914,-0.05285152792930603,0.021112831309437752,-0.10275398939847946,0.0569801926612854,0.07387127727270126,0.033064670860767365,-0.12435508519411087,-0.0404905304312706,0.14355115592479706,-0.12718939781188965,0.12098796665668488,0.08443450927734375,-0.012412091717123985,0.10589322447776794,-0.07451354712247849,0.04692289978265762,-0.09277969598770142,-0.03219841420650482,0.04269726201891899,0.0770687609910965,0.0896163135766983,-0.0882156491279602,0.12250149250030518,-0.08494733273983002,-0.07420708984136581,0.061801809817552567,0.019789233803749084,0.002650480018928647,0.032818615436553955,-0.03083346225321293,-0.12967975437641144,-0.11954988539218903,0.1434789001941681,0.0841057226061821,0.06499110162258148,-0.1387704610824585,-0.022882258519530296,-0.11057645827531815,0.09569422155618668,-0.13925385475158691,0.09429199248552322,0.01081367302685976,-0.03063545748591423,0.0596281960606575,-0.05348840355873108,-0.01885693147778511,0.09962178766727448,-0.14010755717754364,0.04596633091568947,-0.014246463775634766,-0.006025146692991257,0.03429156914353371,-0.05073252692818642,0.027888603508472443,-0.13173536956310272,0.06254956871271133,-0.12903954088687897,0.019800202921032906,0.06034174934029579,0.11816766858100891,-0.1421269029378891,-0.11848508566617966,-0.0875294953584671,0.10910441726446152,-0.05259184166789055,-0.035912927240133286,0.03528182581067085,0.06815925240516663,0.110817089676857,-0.07736045867204666,0.09151987731456757,0.011774875223636627,-0.055999621748924255,-0.08860081434249878,0.1384279727935791,-0.0288771353662014,0.1315203607082367,0.034763846546411514,-0.1393406093120575,0.06025872752070427,0.10113386809825897,-0.1456029862165451,-0.12824968993663788,-0.06719052791595459,0.1260286271572113,0.0015173905994743109,-0.06231721118092537,0.15388797223567963,0.07051568478345871,-0.10413341224193573,0.10720451921224594,-0.07260739803314209,0.05781640484929085,-0.0883822962641716,0.05139625817537308,-0.04450952261686325,-0.05969042330980301,0.12981969118118286,0.0855853334069252,-0.011285095475614071,0.03639785572886467,-0.01620674878358841,0.05109911784529686,-0.0028779045678675175,-0.0614091157913208,-0.08453881740570068,0.061103250831365585,0.023811159655451775,-0.057185184210538864,0.10759259015321732,-0.15254133939743042,0.14714042842388153,0.06272099167108536,0.13533031940460205,-0.09374136477708817,-0.11615370959043503,-0.06621608138084412,0.05763185769319534],[0.13820868730545044,0.08063206821680069,0.052080243825912476,0.008446285501122475,-0.09379387646913528,0.057213496416807175,0.03983624279499054,0.1107516959309578,-0.14162521064281464,-0.03142126649618149,0.07035891711711884,0.06917930394411087,-0.06709247827529907,0.08812826871871948,0.09351041167974472,0.003744125599041581,-0.04282403364777565,-0.09785927832126617,0.07964124530553818,0.030129799619317055,0.1411661058664322,-0.10007074475288391,0.14242462813854218,0.06599836051464081,-0.025600356981158257,0.07887323945760727,0.16743022203445435,0.05031702667474747,-0.14201436936855316,-0.028849342837929726,-0.039395857602357864,0.08850008994340897,-0.13877375423908234,0.10729289054870605,-0.08838064223527908,0.03388330712914467,0.13000734150409698,-0.013384024612605572,-0.014547820203006268,0.11971832811832428,0.08705446869134903,0.1157553419470787,0.10006438940763474,-0.05729663744568825,-0.10229993611574173,-0.11371099948883057,-0.039023853838443756,-0.0931398794054985,0.02493918128311634,-0.06295216828584671,-0.07915676385164261,-0.045378778129816055,-0.13683070242404938,-0.09350580722093582,-0.11835130304098129,-0.002359772566705942,-0.08224586397409439,0.1438664346933365,0.09665379673242569,-0.10142996162176132,-0.07566269487142563,-0.04895685240626335,-0.045205336064100266,0.055019982159137726,-0.09279323369264603,0.017554080113768578,-0.07764244079589844,0.004081456456333399,-0.004525468219071627,0.03480597957968712,0.059653524309396744,0.06278586387634277,-0.002796387067064643,0.02146100252866745,-0.037230271846055984,-0.02991705946624279,-0.09338124841451645,-0.12295406311750412,0.052320029586553574,-0.054499365389347076,-0.1394127756357193,-0.002133238362148404,-0.16380423307418823,0.023071078583598137,0.05587516352534294,-0.13919372856616974,-0.08238843083381653,-0.1367020457983017,0.10909959673881531,-0.06132298335433006,-0.08513527363538742,-0.13751628994941711,-0.01294177770614624,0.07558402419090271,-0.00939447246491909,-0.10374345630407333,-0.03299931436777115,0.0836963951587677,0.13936007022857666,-0.15337446331977844,0.07337494939565659,-0.062339067459106445,-0.08553355187177658,0.07531148940324783,-0.03458782285451889,-0.10750135034322739,0.10656265169382095,-0.014226172119379044,0.019862694665789604,0.09436642378568649,0.10726567357778549,0.028712574392557144,0.00856371596455574,0.09361808001995087,0.06163880228996277,0.12140566110610962,-0.011307399719953537,0.04333619400858879,0.12968884408473969,-0.12821458280086517,-0.07011250406503677,0.07578180730342865,0.0425359345972538,-0.07867366075515747,-0.09117491543292999,0.05052899941802025,0.04438445344567299,0.08831524848937988],[0.1306227743625641,-0.020919369533658028,0.10516666620969772,0.06090635433793068,-0.06543153524398804,0.028053641319274902,0.03890474513173103,-0.01698901318013668,0.0802018865942955,0.07049918174743652,-0.09231171011924744,-0.1622045338153839,-0.1579628437757492,0.09769370406866074,-0.02942316047847271,0.04142450913786888,0.1495535671710968,0.016600677743554115,-0.05490415170788765,0.054487328976392746,-0.1237872764468193,0.15831318497657776,-0.0044773356057703495,0.07664819061756134,0.12398286163806915,0.05122510716319084,-0.1278565675020218,-0.029533665627241135,0.011268144473433495,0.12234809249639511,0.0579419806599617,0.0775752067565918,0.009624285623431206,-0.08056504279375076,-0.003273398382589221,0.03271762654185295,-0.05498967692255974,-0.08336875587701797,0.12850622832775116,-0.07902445644140244,0.011501739732921124,0.14408035576343536,-0.07262450456619263,-0.082220159471035,0.01751188561320305,-0.14560337364673615,0.1135307028889656,0.004851182922720909,-0.08385375142097473,0.1360894739627838,0.03263791278004646,-0.07809057831764221,-0.010358283296227455,-0.006020206958055496,0.08022765815258026,0.11744754016399384,-0.13319171965122223,-0.010883972980082035,-0.11921817809343338,-0.11537709832191467,0.10270555317401886,0.09974054992198944,-0.05604609474539757,0.05638827756047249,0.11635906249284744,-0.10088130086660385,0.05821167305111885,0.07981214672327042,0.09802432358264923,0.04879582300782204,-0.047630392014980316,0.12680737674236298,-0.07060787081718445,-0.01684916950762272,-0.07497985661029816,0.1199507787823677,0.08768825232982635,0.011315065436065197,-0.07307665795087814,0.059381209313869476,-0.15149128437042236,0.11153649538755417,0.11670026928186417,0.1101614460349083,-0.08649458736181259,-0.016253069043159485,0.06083061546087265,0.12446442246437073,-0.11803790926933289,-0.05709260702133179,0.06595482677221298,0.02530907280743122,0.11832292377948761,0.1490287482738495,0.047383490949869156,0.12044847011566162,0.040296319872140884,0.14102593064308167,0.05509017035365105,0.10918783396482468,0.06608573347330093,-0.021547183394432068,-0.09389442950487137,0.09814474731683731,0.0765361562371254,-0.004673738963901997,0.14037154614925385,-0.06742771714925766,0.09063228964805603,0.10862374305725098,-0.009751860052347183,-0.11446229368448257,-0.136353000998497,0.0060970778577029705,0.008946903981268406,-0.05501637980341911,-0.13717789947986603,-0.1460663229227066,-0.04140063375234604,0.027066491544246674,0.012373083271086216,-0.10802819579839706,-0.13318131864070892,0.05892922356724739,-0.057102132588624954,0.14799724519252777,-0.13531842827796936,-0.08211436122655869],[0.02208087593317032,0.11375579237937927,-0.03441314771771431,-0.11913657933473587,0.1250161975622177,0.11761880666017532,-0.1316063553094864,-0.031126616522669792,-0.04516121745109558,-0.005524378269910812,-0.0693555399775505,0.09151436388492584,0.14435885846614838,-0.056283555924892426,0.132088765501976,-0.1244080439209938,-0.13084672391414642,0.048159170895814896,0.10395177453756332,-0.1244678646326065,-0.005909714847803116,-0.1346314251422882,-0.050012219697237015,0.11207123100757599,-0.030993681401014328,-0.0121630122885108,0.1297411173582077,0.1347169727087021,0.029548469930887222,-0.022777030244469643,0.05678577721118927,0.11521004140377045,-0.11943040788173676,0.0021118512377142906,0.03470129147171974,0.043061938136816025,0.0781744047999382,-0.10884138196706772,-0.0862119197845459,-0.024634385481476784,-0.1010810062289238,0.04888054355978966,-0.048762667924165726,-0.13174982368946075,0.07580528408288956,0.11805086582899094,-0.07902756333351135,0.060642339289188385,-0.07090913504362106,0.039884552359580994,-0.08382340520620346,-0.034745607525110245,0.13964447379112244,-0.08571984618902206,-0.10237555205821991,0.12344793230295181,-0.12675903737545013,0.13944877684116364,-0.07394209504127502,0.07110477238893509,0.04123581573367119,-0.09773749113082886,-0.1064189001917839,-0.091657355427742,-0.1216365322470665,0.11999046802520752,0.03951190784573555,0.0062775202095508575,-0.08818121254444122,-0.0882505476474762,0.12622122466564178,-0.03692479059100151,-0.08295932412147522,0.10942819714546204,0.06790053844451904,-0.06489218026399612,-0.0125912856310606,-0.0313849113881588,-0.07933879643678665,0.030759014189243317,-0.15323475003242493,-0.12480661273002625,-0.05830880254507065,-0.03324731066823006,0.015261027961969376,0.09763754159212112,0.10324623435735703,-0.11009589582681656,-0.14229044318199158,-0.04578038305044174,-0.01032316405326128,0.07444678992033005,0.011654124595224857,0.07067687064409256,0.06636430323123932,-0.050768427550792694,-0.010753135196864605,-0.12999556958675385,-0.06314707547426224,0.1427975296974182,0.10383515059947968,-0.0638810470700264,0.029904047027230263,-0.14176204800605774,0.04129794239997864,0.12488463521003723,-0.02966499514877796,0.07723753154277802,0.06725706160068512,-0.0874725729227066,-0.15112130343914032,0.036444734781980515,0.10304070264101028,0.106136754155159,-0.1022031307220459,-0.15071319043636322,0.030971411615610123,-0.07745303958654404,0.06763190776109695,-0.037411417812108994,-0.13707739114761353,0.09535016119480133,0.05761047452688217,-0.10792183876037598,0.08773329108953476,0.03435433283448219,-0.002551164710894227,-0.10376596450805664],[0.022535596042871475,-0.10047011077404022,-0.018108807504177094,-0.10726115107536316,-0.13037890195846558,0.044956058263778687,-0.12201757729053497,-0.002615622477605939,0.06665738672018051,0.12625201046466827,-0.018465084955096245,0.1410331428050995,0.15373075008392334,-0.06494292616844177,-0.15446612238883972,-0.018540190532803535,0.09458039700984955,0.07722078263759613,-0.06761832535266876,0.047481462359428406,-0.008215720765292645,0.02872505411505699,-0.07852993160486221,-0.049236323684453964,-0.11318802833557129,-0.010030114091932774,-0.10515990108251572,0.017043713480234146,-0.009113759733736515,0.08070298284292221,-0.05100032314658165,0.023953069001436234,0.06959111243486404,0.1031731441617012,0.13031528890132904,0.018951406702399254,0.03803413361310959,-0.06592697650194168,0.052282191812992096,-0.049943625926971436,0.04387371614575386,0.047748297452926636,-0.03930020332336426,-0.020577415823936462,0.05945802107453346,0.027611369267106056,0.04642928019165993,-0.10317958891391754,0.1343303620815277,0.12358855456113815,0.12511976063251495,-0.023864323273301125,-0.10957595705986023,-0.09621937572956085,-0.12392769753932953,-0.1311589628458023,-0.1150209829211235,0.0990947037935257,-0.0017834811005741358,0.14231516420841217,0.01502090785652399,-0.0300934799015522,-0.10117509216070175,-0.13316142559051514,-0.1376698911190033,0.010008901357650757,-0.007471814285963774,0.009698500856757164,-0.10200086236000061,-0.007772357668727636,0.047691889107227325,-0.0825071707367897,-0.12945948541164398,-0.07762660831212997,0.046589016914367676,-0.1280137598514557,-0.14568296074867249,0.07857941091060638,-0.11925623565912247,-0.08226542174816132,-0.0331338569521904,0.0743769034743309,-0.1515258550643921,-0.034644898027181625,0.1391410082578659,0.06199029088020325,0.040468838065862656,0.14492064714431763,0.049156296998262405,-0.004614466801285744,-0.04469018802046776,-0.10609615594148636,-0.137356236577034,0.0789712592959404,-0.02897888980805874,-0.13655011355876923,-0.009584148414433002,0.032095737755298615,0.09970353543758392,0.06902957707643509,0.0307958722114563,-0.05764263868331909,-0.1479303240776062,0.05647867172956467,-0.07315908372402191,-0.08712826669216156,0.06516025960445404,0.03484222665429115,0.14111857116222382,0.01704203337430954,-0.15437787771224976,0.009767009876668453,0.07272785156965256,0.02447904273867607,-0.07456770539283752,-0.14058302342891693,-0.05724731460213661,-0.14892961084842682,-0.12901970744132996,-0.10566266626119614,-0.03577660024166107,0.10554184019565582,-0.14178290963172913,0.06787621974945068,-0.020509464666247368,0.0668419674038887,0.0988907665014267,0.13480587303638458],[-0.07329493016004562,0.11629224568605423,0.02740839123725891,0.040155842900276184,-0.03996337577700615,0.14771851897239685,-0.014700463972985744,0.012330829165875912,-0.11135715991258621,0.0010649521136656404,-0.1276153028011322,0.051244232803583145,0.008995259180665016,0.07170423120260239,-0.008023472502827644,0.1249835267663002,-0.09719977527856827,0.030325081199407578,0.06676122546195984,-0.05386193096637726,-0.12387266755104065,-0.0888056755065918,0.10324890911579132,0.12166188657283783,0.08442068099975586,-0.06011952832341194,-0.0850152000784874,0.0031175590120255947,0.046251729130744934,0.004553953185677528,0.08756712824106216,0.014353702776134014,-0.13553215563297272,0.09901611506938934,0.05791541188955307,-0.05132216960191727,0.1532859057188034,0.06817109137773514,-0.08517788350582123,0.087444007396698,-0.09524553269147873,0.06282119452953339,0.05998927727341652,0.08433831483125687,0.14466789364814758,0.13208362460136414,0.15135513246059418,0.04672760143876076,-0.018085751682519913,0.024233344942331314,-0.035988956689834595,0.042339783161878586,-0.005809409078210592,-0.1135551705956459,0.08485148847103119,-0.0012099319137632847,0.09656310826539993,-0.12798048555850983,-0.12994608283042908,0.14013075828552246,0.09304746985435486,-0.04697241261601448,0.1307545304298401,0.038953304290771484,0.09688880294561386,0.0807027593255043,-0.0334017276763916,-0.05696718022227287,0.15170042216777802,-0.10996383428573608,-0.08585385978221893,-0.06477859616279602,0.1490834802389145,0.02146669290959835,-0.03960674628615379,0.025272144004702568,0.145224466919899,0.09698423743247986,-0.0025301072746515274,0.001081379596143961,0.06548821181058884,0.14700189232826233,-0.10677788406610489,0.153970405459404,0.03571610525250435,0.04013608396053314,-0.019677771255373955,0.01779659278690815,0.06669743359088898,-0.05092374607920647,-0.12074583023786545,-0.09681862592697144,-0.12286660820245743,-0.1448974609375,0.1156596839427948,-0.000761260453145951,0.0003224340616725385,0.07535412907600403,0.06008773669600487,0.11880729347467422,0.15326055884361267,-0.12294717133045197,0.06158209592103958,0.05917702615261078,0.0741952657699585,0.13124051690101624,0.14485995471477509,-0.07305852323770523,0.12787844240665436,-0.12878669798374176,-0.07849637418985367,-0.13590076565742493,-0.10255631059408188,0.12685389816761017,-0.015902280807495117,-0.02340412139892578,-0.1232094019651413,0.15788671374320984,-0.05946690961718559,0.024326147511601448,-0.09919492155313492,-0.013285402208566666,0.11654382199048996,-0.05550188571214676,-0.13048551976680756,0.10908566415309906,-0.11442895233631134,-0.06971970945596695],[-0.09026262164115906,0.10371854901313782,0.11952243000268936,0.011774715967476368,0.0968855768442154,-0.12048715353012085,-0.0356910340487957,0.08456383645534515,0.113980732858181,-0.09251009672880173,0.12339016050100327,0.08998925238847733,0.030742403119802475,0.053327832370996475,-0.06872772425413132,0.141087606549263,0.022595200687646866,-0.07437015324831009,-0.15014711022377014,0.02833225019276142,-0.045422572642564774,0.05998944118618965,-0.002487728837877512,-0.06225309893488884,0.061974912881851196,0.07929527014493942,0.0806298553943634,-0.010967173613607883,0.11240693181753159,-0.07014395296573639,0.04232677072286606,0.09214238077402115,0.13210386037826538,0.030530640855431557,-0.04558694362640381,0.09528042376041412,0.022725950926542282,-0.04562331363558769,0.12623515725135803,-0.12385960668325424,-0.03048343025147915,0.07165024429559708,-0.07121966034173965,-0.06237364560365677,0.014377554878592491,-0.019561313092708588,0.05137941986322403,0.04871004819869995,-0.09303785860538483,0.010329634882509708,0.06626705080270767,0.013708648271858692,-0.12804852426052094,0.019258566200733185,-0.06812328845262527,0.06636905670166016,0.0057433792389929295,-0.14804817736148834,-0.16084972023963928,0.12245889008045197,-0.000797031621914357,0.00018561528122518212,0.0006705651758238673,-0.01735011115670204,-0.03227422013878822,0.11562302708625793,0.12850205600261688,0.08255705237388611,-0.12823335826396942,-0.06104851886630058,-0.15178419649600983,-0.09206346422433853,-0.11060883849859238,0.07675646245479584,-0.13264484703540802,0.05666464939713478,0.14423711597919464,0.1414092630147934,0.12712129950523376,0.01767309196293354,0.1417434811592102,-0.15153728425502777,0.07736846804618835,-0.1025398001074791,0.04766913503408432,-0.11844620108604431,-0.0029897757340222597,0.02617005445063114,-0.0017986954189836979,-0.09056776016950607,0.07903862744569778,-0.11543869227170944,-0.021724581718444824,-0.02430361695587635,-0.13928642868995667,-0.03543183580040932,-0.09473112225532532,0.07199285924434662,-0.11367890983819962,-0.006009596399962902,-0.027281777933239937,0.0187990665435791,-0.10722764581441879,-0.153627410531044,-0.11366289854049683,0.04472427815198898,0.08608247339725494,-0.020793529227375984,0.08067004382610321,-0.02672768570482731,-0.0029250476509332657,-0.060098569840192795,-0.024187671020627022,-0.024760063737630844,-0.03170238062739372,0.13028235733509064,0.06529192626476288,-0.10561910271644592,-0.13101479411125183,-0.145927295088768,0.09681537747383118,0.009099108166992664,0.11720580607652664,-0.14634357392787933,-0.037687286734580994,-0.004098803270608187,0.0015545861097052693,-0.0325375571846962],[0.14403140544891357,0.010647298768162727,0.06468746066093445,-0.08790222555398941,0.13210918009281158,-0.05135885626077652,-0.021652070805430412,-0.11137617379426956,-0.028631364926695824,0.041560541838407516,-0.08569817245006561,0.08298253268003464,0.12386558204889297,0.005086860153824091,0.13391391932964325,0.03203722462058067,0.07049732655286789,-0.0998942032456398,0.017929403111338615,0.04243925213813782,0.06161264330148697,-0.016063887625932693,-0.07329340279102325,-0.04621834307909012,0.14458534121513367,-0.010968784801661968,0.10378199815750122,-0.14930413663387299,-0.05376756563782692,-0.06426525861024857,0.059326767921447754,0.010360056534409523,0.029321953654289246,-0.02910996973514557,0.026604419574141502,-0.10390978306531906,0.10154008120298386,0.07773307710886002,-0.024790754541754723,-0.12386178225278854,0.09127835184335709,0.12501125037670135,-0.07525159418582916,0.11702974140644073,-0.03917583450675011,0.03790412098169327,-0.005405124742537737,-0.025019118562340736,0.013354235328733921,-0.04255080223083496,0.09722036123275757,0.10638683289289474,0.08431380987167358,0.0231315940618515,0.10646294802427292,-0.0664997398853302,-0.13125935196876526,-0.07647326588630676,-0.1416880041360855,0.07071762531995773,0.07009003311395645,-0.13159285485744476,0.03438059985637665,0.168458491563797,0.039418332278728485,0.10981892794370651,0.06879346817731857,-0.08533833175897598,-0.09653256833553314,0.12211000919342041,-0.04266216233372688,0.08159475028514862,-0.139688640832901,-0.06169545650482178,0.02491931803524494,-0.05618519335985184,0.013347922824323177,0.12297747284173965,0.10250551253557205,-0.057145118713378906,-0.0014040145324543118,0.005129250232130289,-0.02289373055100441,0.034541286528110504,0.11834324896335602,-0.08514118194580078,-0.04868198186159134,-0.025184020400047302,0.06973019987344742,0.029111023992300034,0.023017456755042076,0.09003237634897232,0.039917849004268646,-0.08908917754888535,0.07127168029546738,0.06927524507045746,0.07302460819482803,0.14136606454849243,-0.09671488404273987,-0.03657648339867592,-0.15748821198940277,0.07730879634618759,0.10748336464166641,-0.12708407640457153,-0.06369002163410187,-0.04084668308496475,0.012869655154645443,0.08956675976514816,-0.04484804347157478,0.06375060230493546,-0.057953838258981705,0.03551573306322098,-0.06464558839797974,0.03747514635324478,-0.12465415149927139,-0.03461018204689026,0.08366653323173523,-0.024879805743694305,-0.015782617032527924,-0.025735020637512207,0.0842549055814743,-0.016224421560764313,0.04143417254090309,0.1444350630044937,0.0009107136284001172,0.05090165510773659,0.0996861681342125,-0.10289184749126434],[-0.15092779695987701,-0.11649240553379059,-0.13273105025291443,0.01208154484629631,-0.02425564080476761,-0.09161265194416046,0.08983328193426132,0.015113094821572304,0.09784994274377823,-0.05614764988422394,-0.14103499054908752,-0.1388482004404068,-0.08469688147306442,-0.0947112888097763,-0.1069166287779808,0.05068677291274071,-0.08649097383022308,-0.1299668699502945,0.08798383176326752,-0.08794011920690536,0.03353000059723854,0.14123953878879547,0.026888243854045868,0.01691565290093422,-0.1446545273065567,0.06718824058771133,0.06794485449790955,0.01232675090432167,0.007467843592166901,-0.09557626396417618,0.11420862376689911,0.0048308707773685455,0.032358184456825256,0.023296590894460678,-0.0780460387468338,-0.11452586203813553,0.026524195447564125,-0.0011473135091364384,0.09540537744760513,-0.07880286127328873,-0.047540370374917984,-0.06941286474466324,-0.13192741572856903,0.14004814624786377,-0.0351940281689167,0.08984237164258957,-0.04707074165344238,-0.08867856115102768,-0.13723929226398468,-0.13657207787036896,-0.14471060037612915,-0.13566738367080688,-0.036702413111925125,0.06493878364562988,-0.15293754637241364,0.1007903516292572,0.016621608287096024,0.014252981171011925,0.03916546329855919,-0.0846957415342331,-0.14670836925506592,-0.04567902907729149,0.05594915896654129,-0.11907675862312317,0.05186505615711212,-0.14857280254364014,-0.10391640663146973,-0.025650475174188614,0.09530121088027954,-0.15827910602092743,-0.11031496524810791,0.060836754739284515,0.06268024444580078,-0.0056833853013813496,-0.09042689949274063,0.12785789370536804,-0.12129557132720947,0.14383812248706818,-0.07376586645841599,0.10506657510995865,0.0645369216799736,0.06356396526098251,-0.1257701814174652,-0.0005578879499807954,-0.10953129827976227,-0.11249809712171555,-0.07263175398111343,0.13016237318515778,-0.14443491399288177,-0.031101994216442108,0.10889586806297302,0.04333988204598427,0.04954532906413078,0.05833791568875313,0.057891957461833954,0.03599216789007187,-0.07058803737163544,-0.055382151156663895,-0.03841104730963707,-0.09056949615478516,-0.03738957270979881,-0.1281697303056717,-0.12436389923095703,0.08159422874450684,0.12532362341880798,-0.003622072748839855,-0.048854950815439224,-0.04970502480864525,-0.010156137868762016,0.012230711989104748,-0.06230084225535393,-0.02717933990061283,0.1433650255203247,-0.09987085312604904,-0.03849649801850319,-0.10737612098455429,0.07728147506713867,0.07406884431838989,0.13221855461597443,-0.04914791136980057,0.008146150037646294,-0.09184025228023529,0.09381832182407379,0.00990795437246561,-0.06638883799314499,0.05169174075126648,-0.07291824370622635,0.10810777544975281],[0.13971252739429474,0.03928225859999657,0.045426640659570694,0.11271432042121887,0.09147802740335464,-0.07631608098745346,-0.022125305607914925,0.11929769068956375,0.015078163705766201,-0.02032947540283203,0.09173411130905151,-0.06857842206954956,0.0011888382723554969,0.11266014724969864,0.14611899852752686,0.13244768977165222,-0.06562807410955429,-0.03139514848589897,0.09115174412727356,-0.024234816431999207,0.05121693015098572,-0.07595647871494293,0.1163661926984787,-0.02259019762277603,-0.07115015387535095,0.08756598830223083,0.13949717581272125,0.09708228707313538,-0.01557067595422268,0.06499050557613373,0.14656871557235718,-0.04808503016829491,0.11381576955318451,0.02751382626593113,-0.01118294708430767,0.148046612739563,0.06031890958547592,-0.04502826929092407,0.019807016476988792,-0.08661342412233353,-0.11009689420461655,-0.1169469803571701,-0.009217655286192894,-0.008879363536834717,-0.049411870539188385,0.07157798111438751,0.041965264827013016,-0.034753069281578064,0.03282129019498825,-0.0031515590380877256,-0.13307209312915802,-0.05385151132941246,0.02022288739681244,0.04699471592903137,-0.022423604503273964,0.08890380710363388,-0.11141029000282288,-0.11663104593753815,-0.012782946228981018,-0.05966177210211754,0.07944332808256149,0.05720382183790207,0.1644134819507599,-0.12740883231163025,-0.15009355545043945,0.02564697153866291,-0.06373576819896698,0.005801800638437271,0.1514745056629181,0.01862269826233387,-0.09021446108818054,-0.08738056570291519,0.09954870492219925,-0.1427406668663025,0.0938773974776268,0.08852622658014297,0.05548729747533798,0.09078723937273026,0.16118599474430084,0.04228087142109871,0.06497188657522202,-0.09467814117670059,0.16554711759090424,-0.07741067558526993,0.03616930544376373,0.08624617755413055,0.041436970233917236,-0.03845354542136192,0.019563445821404457,0.09586484730243683,-0.1453392058610916,0.1450875997543335,0.13527746498584747,-0.08207133412361145,0.11220400035381317,-0.03177405893802643,-0.12661418318748474,-0.05313357338309288,0.11414536088705063,0.08075855672359467,-0.026478836312890053,-0.10606091469526291,0.04816613346338272,-0.056441910564899445,0.07373297214508057,-0.10851281136274338,-0.09653563052415848,0.05162991210818291,-0.0087985098361969,0.08439673483371735,-0.0494554378092289,0.07387746870517731,0.11583150178194046,-0.11789166182279587,-0.017076881602406502,-0.10938961803913116,0.04761688411235809,-0.13533534109592438,0.011487972922623158,-0.05117330327630043,-0.11309686303138733,-0.08388213813304901,0.11364523321390152,0.0011259230086579919,0.1358565390110016,0.08470200002193451,-0.056854523718357086,0.08392183482646942],[-0.08215038478374481,-0.12445338070392609,0.05857149884104729,0.10332246869802475,0.06604675203561783,0.1255885809659958,0.11759204417467117,-0.023183470591902733,0.09102369099855423,0.007285133935511112,0.02370351366698742,0.054123058915138245,-0.15101084113121033,-0.07251030206680298,0.0230281800031662,0.15186873078346252,0.12132419645786285,-0.07224436849355698,-0.09831902384757996,-0.037543755024671555,-0.04741106927394867,-0.021852122619748116,0.12935984134674072,0.1400003582239151,0.08005202561616898,-0.02481844834983349,-0.1432115137577057,-0.02699720300734043,0.0927356481552124,-0.08739199489355087,-0.028130151331424713,-0.13714998960494995,-0.027589932084083557,-0.10622067004442215,-0.15139715373516083,0.00864572636783123,0.13218514621257782,0.05211671069264412,0.09254833310842514,0.14192333817481995,-0.11795812845230103,-0.06768468022346497,-0.0331299863755703,-0.11693772673606873,0.08623737841844559,0.09307464957237244,0.007946902886033058,-0.07191013544797897,-0.007734529674053192,0.0002396464260527864,0.07763317227363586,0.10771231353282928,-0.10971621423959732,-0.11943992972373962,0.1138807013630867,-0.1204792931675911,0.04479483142495155,-0.14948846399784088,-0.09815510362386703,-0.14244653284549713,0.13399562239646912,0.0763668492436409,0.10386817157268524,-0.12711672484874725,0.02375916577875614,-0.1391051560640335,0.11292672902345657,-0.11140935868024826,-0.11382928490638733,0.03283281996846199,-0.10776663571596146,0.03269323706626892,0.05939040705561638,-0.03461093455553055,0.04616681858897209,-0.08460263162851334,-0.14288878440856934,0.08832889050245285,0.1496139019727707,0.038566090166568756,0.08303602039813995,-0.08025826513767242,0.13936565816402435,0.10666456073522568,-0.09813737869262695,-0.027135610580444336,0.05835450813174248,0.06523275375366211,0.0012011724757030606,-0.001196842989884317,-0.13756555318832397,0.03894192725419998,-0.13077467679977417,-0.06379151344299316,-0.09759359806776047,-0.09010030329227448,-0.13533258438110352,-0.09179505705833435,-0.08974777907133102,0.10054269433021545,-0.05386446788907051,-0.06847581267356873,-0.0734875276684761,-0.03532211109995842,-0.05642165616154671,0.14194919168949127,-0.06135358288884163,0.10171785205602646,0.03021661564707756,-0.14579002559185028,-0.13134725391864777,0.01050274446606636,0.11977232247591019,0.08174273371696472,0.147381991147995,-0.0782642662525177,0.0405883826315403,-0.06842633336782455,-0.12037402391433716,0.04189881682395935,0.10180862993001938,-0.11100134998559952,-0.05551319196820259,0.109048031270504,0.015793567523360252,0.0659404844045639,-0.14154204726219177,-0.12431406229734421],[-0.06280627846717834,0.06559354066848755,0.0685153603553772,-0.12386486679315567,-0.11794405430555344,-0.029718011617660522,0.10821888595819473,0.07113438099622726,-0.11619868129491806,0.13860543072223663,0.005644277669489384,0.10711206495761871,-0.1468726098537445,-0.13662849366664886,0.15434707701206207,-0.09125154465436935,-0.0012829143088310957,-0.08441967517137527,-0.06799954921007156,0.04663917422294617,0.01667303964495659,-0.07242360711097717,0.15455201268196106,0.09293551743030548,-0.05357012152671814,-0.11429647356271744,-0.1192789226770401,-0.007832054980099201,0.012161558493971825,0.1101936623454094,0.10137929022312164,-0.03526962548494339,0.024942660704255104,-0.003027415368705988,-0.028447017073631287,-0.03149423003196716,0.0630459263920784,0.02983173355460167,-0.018400799483060837,-0.052665919065475464,0.03209549933671951,0.1405327022075653,0.033254362642765045,0.05212360993027687,0.0382254458963871,-0.018750639632344246,-0.008031635545194149,-0.09131196141242981,0.08161311596632004,-0.13232927024364471,-0.052076250314712524,-0.12194555252790451,-0.07589099556207657,-0.07179400324821472,0.08848529309034348,0.14210820198059082,0.11203791946172714,0.161692813038826,0.09863562136888504,-0.03141472861170769,-0.04759196564555168,0.1248660609126091,-0.1255079209804535,0.10463088750839233,0.10945869982242584,0.058153752237558365,0.0027533292304724455,0.01827397570014,-0.121392160654068,0.1196051612496376,-0.07685830444097519,0.0978032648563385,-0.02568751759827137,-0.04615730419754982,-0.01264132745563984,0.004701198078691959,0.06355758756399155,0.04372931271791458,-0.0896608829498291,0.11325398832559586,-0.12552553415298462,-0.04460681974887848,-0.08051521331071854,0.12695565819740295,-0.015860602259635925,0.15429945290088654,0.06383844465017319,0.07542811334133148,0.024320410564541817,0.10539737343788147,-0.03285164013504982,-0.10728050023317337,-0.0008570319041609764,-0.05560426786541939,0.08025664836168289,-0.10232609510421753,0.045859623700380325,-0.12623387575149536,0.1467801332473755,0.13158395886421204,0.03717436268925667,-0.12566430866718292,-0.07018771767616272,-0.05683933570981026,-0.1082015112042427,0.10562512278556824,0.005760631058365107,-0.018737073987722397,-0.04598497226834297,-0.10715529322624207,-0.03781978413462639,0.08823840320110321,-0.10605896264314651,-0.13107873499393463,0.13444143533706665,-0.10844654589891434,0.04915055260062218,0.10962230712175369,-0.029997533187270164,-0.031233416870236397,0.13969114422798157,-0.1469397395849228,0.021725913509726524,-0.05472448468208313,0.05299291014671326,-0.019401585683226585,0.0777202621102333,-0.03492446616292],[-0.11779635399580002,0.026181379333138466,0.036434125155210495,-0.05748972296714783,-0.04530233144760132,0.020761655643582344,-0.008787071332335472,0.017204558476805687,-0.0664573535323143,-0.0035278077702969313,0.004507878329604864,0.04254637286067009,-0.12340097874403,0.024408208206295967,-0.11248358339071274,-0.11522198468446732,-0.08889102935791016,-0.01020080503076315,-0.11527121067047119,0.007258322089910507,-0.13337568938732147,-0.11709318310022354,-0.002642081119120121,0.01571943610906601,0.1427437961101532,-0.059550970792770386,-0.06572796404361725,-0.09910160303115845,-0.11793718487024307,-0.022610468789935112,-0.1465713381767273,0.06720738857984543,-0.08044768869876862,0.09967824816703796,-0.06618240475654602,-0.09901300072669983,0.13321679830551147,-0.07507824152708054,-0.11656902730464935,-0.010501942597329617,0.03673667460680008,-0.007783350069075823,0.12466272711753845,0.07882487028837204,0.10778523236513138,-0.13733161985874176,0.1001066267490387,-0.006896002218127251,0.08655255287885666,0.08679842203855515,-0.005320927128195763,0.13117863237857819,0.058403391391038895,-0.09076928347349167,-0.028221869841217995,0.054829247295856476,0.004791887477040291,0.14686693251132965,-0.07520033419132233,0.051224254071712494,-0.11010349541902542,-0.05742461606860161,0.03362829610705376,0.05961602181196213,-0.14566299319267273,0.109117791056633,-0.1250333935022354,0.009071840904653072,0.027661068364977837,0.08820360153913498,0.034132398664951324,0.11072389036417007,0.01578512415289879,-0.15621636807918549,-0.13329824805259705,0.018876338377594948,-0.12750528752803802,-0.14940759539604187,0.0726611316204071,-0.11542452126741409,0.06549864262342453,-0.07146035879850388,0.10661078989505768,0.09487754851579666,-0.10316484421491623,0.11111666262149811,0.14409321546554565,0.09165339916944504,-0.11079666018486023,-0.10657050460577011,0.13340801000595093,0.08034849166870117,-0.08281032741069794,0.13502399623394012,0.09701689332723618,-0.12256036698818207,-0.03404778987169266,0.05497491732239723,-0.08363694697618484,-0.05629932880401611,0.11809457093477249,-0.1486859768629074,0.005670276004821062,-0.018165763467550278,-0.008321352303028107,0.0637458935379982,0.14536799490451813,-0.022986602038145065,-0.05592666193842888,-0.06071875989437103,-0.15685176849365234,0.13110877573490143,-0.041246626526117325,0.035939764231443405,-0.06089495122432709,-0.08559469878673553,-0.15685032308101654,-0.0774473324418068,0.10880766808986664,-0.13294382393360138,-0.0011694758431985974,-0.09739989787340164,0.13781054317951202,0.07978951185941696,-0.06360805034637451,-0.11444378644227982,-0.11715590208768845,0.024569358676671982],[-0.031091034412384033,0.09675755351781845,0.09877489507198334,-0.09802036732435226,-0.14625927805900574,-0.1465981900691986,0.09671678394079208,-0.01799081452190876,-0.07634282857179642,-0.09863656759262085,-0.038568731397390366,0.116285540163517,-0.019131049513816833,-0.032822806388139725,-0.058450352400541306,0.06347320228815079,0.03436657041311264,-0.03066674992442131,0.005881164222955704,0.049274466931819916,0.1526147574186325,-0.04113851860165596,0.06002170592546463,-0.1333727091550827,0.09632926434278488,0.1307746320962906,-0.06049680337309837,0.11493932455778122,-0.06462392956018448,-0.11463789641857147,-0.12366380542516708,-0.01877017132937908,-0.08438743650913239,0.034966859966516495,-0.12433306127786636,-0.06753834336996078,-0.13479751348495483,-0.007068840321153402,0.07126140594482422,0.07854428142309189,0.01660606823861599,0.09277457743883133,0.02657034993171692,0.07555854320526123,0.12591134011745453,0.045259155333042145,0.12941525876522064,0.07906466722488403,0.12380019575357437,0.03452077880501747,0.10211965441703796,0.08861777931451797,0.05213656648993492,-0.05758373811841011,0.1525927186012268,-0.004795563407242298,0.13161806762218475,-0.152313232421875,-0.03772285208106041,0.12469787150621414,0.024301797151565552,-0.0412173867225647,-0.07416021823883057,0.09092462062835693,-0.06307581812143326,-0.002467743819579482,-0.08203679323196411,0.010166795924305916,-0.048009250313043594,-0.035859208554029465,-0.11018627882003784,0.11102139949798584,0.018000708892941475,-0.057468004524707794,-0.15891356766223907,0.024173930287361145,0.0547696053981781,0.08773321658372879,-0.1368778645992279,0.04966309666633606,0.13214220106601715,-0.07359067350625992,0.1291847974061966,-0.05299905687570572,0.047303520143032074,-0.09339135140180588,0.038367703557014465,0.1278357356786728,0.04978441074490547,-0.009110980667173862,-0.15041077136993408,0.008448241278529167,0.025173859670758247,-0.09832338243722916,0.09470104426145554,-0.1322920024394989,-0.09961898624897003,-0.07374179363250732,-0.08069510757923126,-0.14100021123886108,-0.12439622730016708,0.04810917004942894,-0.140968456864357,0.0713965967297554,-0.028898240998387337,0.034822478890419006,0.10506004095077515,0.1261880099773407,0.028837095946073532,-0.15810111165046692,-0.006782867480069399,0.020911451429128647,0.0966767817735672,-0.02394193410873413,0.050099510699510574,0.03094366192817688,0.04609185829758644,0.028942996636033058,-0.009810138493776321,0.09129743278026581,0.11386360228061676,-0.021638022735714912,-0.09799572080373764,0.06645228713750839,0.11559373885393143,-0.09985484182834625,-0.1280629187822342,-0.1247035339474678],[0.0949103981256485,-0.16018235683441162,0.1316029578447342,-0.038714032620191574,-0.10398022085428238,-0.12790533900260925,-0.13085439801216125,0.1268080174922943,-0.11011093109846115,-0.1543649435043335,-0.044649600982666016,0.08947357535362244,-0.024534525349736214,0.0929226279258728,0.1216571033000946,0.09523841738700867,-0.0057191927917301655,0.11601641774177551,0.045771390199661255,-0.13215194642543793,0.06433235853910446,0.12294397503137589,0.022886287420988083,-0.05551369860768318,-0.0426965057849884,-0.00879291258752346,0.11995518952608109,0.06873026490211487,-0.1103018969297409,-0.13532425463199615,0.12315154075622559,0.0814196914434433,0.12125507742166519,0.03414223715662956,0.07840386778116226,-0.10858266055583954,-0.06407902389764786,0.12736545503139496,0.08926328271627426,-0.09460942447185516,0.040203869342803955,0.10838744044303894,0.002863344270735979,0.011606347747147083,0.14772699773311615,-0.035799603909254074,-0.09009705483913422,-0.011628077365458012,-0.09389988332986832,0.06520300358533859,0.11638043075799942,-0.07214471697807312,-0.09657442569732666,0.09125968813896179,-0.12525592744350433,-0.022230874747037888,0.05020252987742424,0.005898803006857634,0.08406797051429749,0.08938974887132645,-0.02331252209842205,-0.13000239431858063,-0.041941698640584946,0.1243281215429306,0.12017597258090973,0.0790601596236229,-0.11100084334611893,0.04511413723230362,-0.07782506942749023,-0.023319365456700325,0.10370901226997375,-0.03986939415335655,0.07837414741516113,-0.10283170640468597,-0.1104506105184555,-0.10962715744972229,0.013592875562608242,0.1223316416144371,0.06987140327692032,0.0396929606795311,-0.10562355071306229,-0.1135764941573143,-0.07433028519153595,-0.14011183381080627,0.039871472865343094,-0.13203933835029602,-0.017247870564460754,-0.09451714903116226,0.0982949361205101,0.10992366820573807,-0.0518563874065876,0.02918187715113163,-0.12441565096378326,0.0440693199634552,0.06424810737371445,0.10377994179725647,-0.08288339525461197,0.02701234072446823,0.0431397370994091,-0.05284528806805611,-0.039820145815610886,0.12557825446128845,0.0402631014585495,-0.12067224830389023,-0.026294950395822525,0.1312643438577652,0.06611015647649765,-0.013298136182129383,0.12437903136014938,0.0481063649058342,0.006920219399034977,0.07585835456848145,0.037052761763334274,-0.046405501663684845,-0.05026310309767723,0.11022376269102097,-0.14523524045944214,-0.01076875813305378,-0.11301716417074203,0.014200502075254917,-0.13705922663211823,-0.1448850929737091,0.10778582841157913,0.005199532490223646,0.06870856136083603,0.1290276199579239,-0.14966854453086853,0.021536676213145256],[-0.03827283903956413,0.0013777329586446285,-0.11671925336122513,-0.004095518961548805,0.1226784884929657,-0.11514861136674881,0.11513958126306534,0.03151434287428856,-0.15268655121326447,-0.12075697630643845,0.13737814128398895,0.11697233468294144,0.04227886348962784,-0.13549429178237915,-0.05054871365427971,-0.11036118119955063,0.010020836256444454,0.05367060750722885,0.03367404267191887,0.07315085083246231,0.0007859215256758034,0.1457570195198059,-0.065496064722538,0.1204950213432312,0.011117981746792793,-0.10156145691871643,0.07982366532087326,0.05218135192990303,0.038747869431972504,-0.04208612069487572,0.1341497004032135,0.10355055332183838,-0.13738778233528137,0.11298438161611557,0.06385733187198639,0.1424364149570465,0.12803515791893005,-0.10480114072561264,0.07552822679281235,0.03303694352507591,0.026230813935399055,-0.08142665773630142,0.08047862350940704,-0.0929526761174202,0.009442586451768875,0.15605583786964417,-0.021423138678073883,-0.017466383054852486,-0.013854773715138435,-0.0655321255326271,0.032997146248817444,-0.015801042318344116,-0.07525886595249176,-0.0836247056722641,0.0367761105298996,0.08443848043680191,0.1336711198091507,-0.08978661149740219,-0.11598655581474304,0.14809384942054749,-0.09009250998497009,0.08261408656835556,0.002341229235753417,-0.04749660566449165,0.15008008480072021,-0.14139582216739655,-0.041445016860961914,0.10899288952350616,0.0931001678109169,0.08317235112190247,0.03739836812019348,0.14856092631816864,-0.03168153762817383,-0.15609566867351532,-0.13114199042320251,0.11684001237154007,-0.09956039488315582,0.04564829543232918,-0.10333402454853058,0.05360978841781616,0.11345908045768738,0.0491466261446476,0.09859440475702286,-0.1520376205444336,0.10410182178020477,0.02077343687415123,0.0947999581694603,0.1186051145195961,-0.12059150636196136,0.09692704677581787,-0.13576406240463257,0.003601635806262493,0.10552402585744858,0.07796570658683777,0.05233016237616539,-0.12829554080963135,0.13595271110534668,-0.08314098417758942,-0.020792722702026367,-0.03472365811467171,-0.12198913842439651,0.14514589309692383,-0.015543774701654911,0.030004678294062614,0.11624936759471893,0.13606275618076324,-0.004375393968075514,-0.022725310176610947,0.1135648712515831,-0.04427040368318558,0.009582866914570332,-0.01643172837793827,-0.08651822060346603,-0.13171729445457458,-0.00725935585796833,-0.0472659170627594,-0.06720758974552155,-0.0779588595032692,0.04489821568131447,-0.12791359424591064,-0.08279497921466827,0.08235989511013031,0.03848431259393692,-0.11398923397064209,-0.13710418343544006,-0.05479218438267708,0.02232479862868786,-0.04509285092353821],[0.019251450896263123,-0.019545624032616615,-0.12771494686603546,0.029740871861577034,0.038748495280742645,0.05358153581619263,-0.06810231506824493,-0.06429090350866318,-0.08748935163021088,0.10781752318143845,-0.014143588952720165,-0.12498559057712555,-0.07734167575836182,0.03132673352956772,-0.05379093810915947,0.12115463614463806,0.1324150264263153,0.0612739622592926,0.046311382204294205,-0.08004282414913177,-0.02159631811082363,0.04165113717317581,-0.11958395689725876,0.06384053081274033,0.053476832807064056,-0.06796649843454361,-0.1063748300075531,-0.1256009340286255,0.11142215877771378,-0.04581909999251366,-0.0488237664103508,-0.05784469097852707,0.012579498812556267,-0.10398906469345093,0.0696883425116539,0.11815095692873001,-0.14122597873210907,-0.06196330487728119,-0.01766953058540821,-0.029263431206345558,-0.10398939251899719,-0.07281685620546341,-0.11102116107940674,0.08789680153131485,0.12273328751325607,0.044664014130830765,0.041752610355615616,-0.010056364350020885,-0.12828461825847626,-0.024232037365436554,0.12075424939393997,-0.13595432043075562,-0.13700877130031586,-0.001710328389890492,-0.05826020985841751,0.07443078607320786,-0.14391084015369415,0.123832568526268,-0.016146648675203323,-0.08857908099889755,-0.05100728198885918,0.10562058538198471,0.06949660927057266,-0.12531840801239014,-0.11001043766736984,0.107542984187603,0.04738058149814606,-0.026488792151212692,-0.06568504869937897,-0.1362636238336563,0.08987829089164734,-0.053383976221084595,0.09175916761159897,-0.02243606001138687,0.12260586768388748,0.09932581335306168,-0.04189972206950188,0.07653467357158661,0.02929631806910038,-0.03828134387731552,-0.011282225139439106,-0.07400257885456085,0.10090968757867813,0.10079744458198547,-0.029848163947463036,0.0646151751279831,0.087002232670784,-0.0590575747191906,0.12866608798503876,0.12061014026403427,0.0797644555568695,0.12477469444274902,-0.043795693665742874,0.003383444854989648,0.06317191570997238,0.14775443077087402,-0.1015394777059555,-0.14050772786140442,-0.13930857181549072,0.09259802848100662,-0.025692977011203766,-0.09723055362701416,-0.06810109317302704,-0.13871479034423828,-0.11386393010616302,0.1377267688512802,-0.01977784000337124,0.0642850324511528,-0.13164635002613068,-0.09288211166858673,0.024331992492079735,-0.04834252595901489,-0.11699773371219635,0.12344778329133987,-0.12507541477680206,0.14151990413665771,0.11049165576696396,0.016799893230199814,-0.035924725234508514,-0.08025564253330231,0.015439347364008427,0.09620849043130875,0.0769558697938919,0.12285967171192169,-0.1189408227801323,-0.14351707696914673,0.06682176142930984,-0.031179364770650864],[-0.14605557918548584,-0.13088293373584747,-0.10478571802377701,0.14503081142902374,0.12582556903362274,-0.13940021395683289,-0.0645798072218895,0.02770848385989666,-0.12829594314098358,0.05267775431275368,-0.025610268115997314,0.11501770466566086,-0.029093321412801743,0.11011569947004318,0.12984172999858856,0.15248286724090576,-0.043374188244342804,-0.11185501515865326,-0.14358997344970703,0.027010051533579826,-0.11956906318664551,-0.12360946089029312,0.043244171887636185,0.1435283124446869,0.110507532954216,-0.050054825842380524,-0.12039561569690704,0.021033264696598053,-0.1479572355747223,-0.14391635358333588,-0.1357862502336502,-0.05049490928649902,0.06246425211429596,-0.1391582041978836,0.10627171397209167,0.07047134637832642,-0.02843538671731949,-0.10622125118970871,-0.026436012238264084,0.07711730897426605,-0.033287547528743744,-0.021918194368481636,0.029814256355166435,-0.011705591343343258,0.08612392842769623,-0.05460049584507942,0.13066443800926208,-0.13340497016906738,0.018013345077633858,-0.1073143258690834,-0.04357512295246124,0.03573176637291908,0.017034389078617096,0.11116626858711243,-0.11627300083637238,-0.0011074903886765242,0.09937524795532227,-0.12810753285884857,-0.031807608902454376,0.10187071561813354,-0.09912325441837311,0.14289887249469757,-0.053006675094366074,-0.013662642799317837,0.1460530012845993,-0.038689855486154556,0.09624827653169632,0.028365014120936394,0.11421535164117813,0.04853004589676857,-0.03632548078894615,0.07031406462192535,-0.0007131782476790249,-0.11721885204315186,-0.09032390266656876,0.008798694238066673,0.04971294850111008,-0.09643197804689407,0.08408026397228241,-0.144041508436203,-0.02732059545814991,-0.05512671917676926,-0.12038504332304001,-0.13607168197631836,0.09286614507436752,0.12531253695487976,0.05937209725379944,-0.010715467855334282,0.002690889174118638,0.011772679165005684,-0.09234019368886948,-0.08963076025247574,0.0132459020242095,0.0978797972202301,-0.07458776980638504,-0.1476556360721588,-0.06534700840711594,-0.15054385364055634,-0.11655281484127045,0.05659475922584534,0.09171775728464127,-0.030544042587280273,0.09782464802265167,-0.13578903675079346,0.0687217265367508,-0.09748238325119019,-0.02859843336045742,-0.0383065864443779,-0.0154099827632308,0.025870971381664276,0.009863241575658321,0.04489922150969505,-0.025211283937096596,-0.023145606741309166,-0.09066663682460785,-0.05434316769242287,0.09067974239587784,0.14790073037147522,0.01384695153683424,-0.12823988497257233,0.14409077167510986,0.008372224867343903,0.03465179726481438,-0.042342543601989746,-0.0003794200310949236,-0.09765399247407913,-0.1239733099937439,0.1341387778520584],[0.1481730043888092,0.14325714111328125,-0.1552947610616684,-0.14707227051258087,0.08646467328071594,0.07761439681053162,0.11108776926994324,-0.05585631728172302,-0.13126015663146973,0.10619789361953735,0.05893094465136528,-0.0721404105424881,-0.09346653521060944,-0.044019609689712524,0.10060767829418182,0.04243152216076851,0.06216380000114441,-0.1399552971124649,0.08024679869413376,0.05050388351082802,-0.14452846348285675,0.03397577255964279,-0.12120136618614197,-0.09587141871452332,0.009104724042117596,0.0002549461496528238,0.1240105852484703,-0.0187052171677351,0.05399680137634277,0.12520428001880646,0.04972527548670769,-0.07965318858623505,-0.0866999477148056,-0.12753887474536896,0.04456402361392975,0.1455439329147339,-0.03628341108560562,0.041052304208278656,-0.12769359350204468,0.12524458765983582,-0.016935551539063454,-0.09349703043699265,-0.10943435877561569,-0.14649219810962677,0.03713647648692131,0.09066575765609741,-0.1389503926038742,-0.04713674262166023,0.07940346002578735,0.14929598569869995,-0.14611384272575378,0.029288869351148605,0.12124966084957123,-0.15039631724357605,-0.12679778039455414,0.04456280544400215,-0.11471432447433472,0.136228546500206,-0.11804520338773727,0.11709138005971909,-0.07988418638706207,-0.07005516439676285,0.13607965409755707,-0.01253843866288662,0.057183489203453064,-0.0745495855808258,0.07468125969171524,0.11554574966430664,0.012134511023759842,-0.10133641213178635,-0.019934261217713356,0.004817834589630365,-0.11864834278821945,0.005649859085679054,-0.0203178059309721,0.13803014159202576,-0.1146857813000679,-0.037349633872509,0.1390296369791031,0.07957049459218979,0.07554459571838379,0.09533606469631195,-0.09845642000436783,0.0717739537358284,0.09206800162792206,0.09373874217271805,0.11317012459039688,-0.1407352238893509,-0.05623691901564598,-0.0951915830373764,-0.0161046851426363,0.1300053596496582,0.08728241175413132,0.11776604503393173,-0.034291431307792664,0.02024976909160614,0.08775842189788818,-0.1013399139046669,0.04420282691717148,-0.036291491240262985,-0.0745047852396965,0.14828255772590637,0.06221792846918106,0.10998651385307312,-0.04353044182062149,-0.12149880826473236,-0.0475400909781456,-0.08452841639518738,0.14182443916797638,-0.04369830712676048,-0.14135213196277618,0.06391530483961105,0.12660343945026398,-0.12844298779964447,0.062403492629528046,-0.020276350900530815,0.010626012459397316,-0.10336901247501373,-0.045598745346069336,-0.13967053592205048,-0.06037234887480736,0.03684837743639946,0.11505729705095291,0.1311275213956833,0.14489658176898956,-0.10336404293775558,0.14183109998703003,0.024856841191649437],[0.06685181707143784,-0.021652916446328163,-0.08434966951608658,0.11761415004730225,-0.1302124410867691,-0.0013054365990683436,0.04125978425145149,-0.11282987147569656,-0.11799830943346024,0.12262817472219467,-0.004799069836735725,-0.04453906789422035,0.10718332976102829,-0.12935370206832886,0.024422701448202133,0.008442150428891182,0.13483260571956635,0.06261077523231506,-0.013873269781470299,-0.07928244769573212,-0.05862465873360634,-0.00630117766559124,-0.03338368982076645,-0.06893878430128098,-0.0819506049156189,-0.09554807841777802,-0.1676902323961258,0.1690884232521057,-0.07452452182769775,-0.07701060175895691,-0.09379064291715622,-0.04229068011045456,0.11913266032934189,0.06250666826963425,-0.08648218959569931,0.09527714550495148,0.13205043971538544,0.12332421541213989,0.11869580298662186,0.09023750573396683,-0.023370051756501198,-0.02623087912797928,0.03493405133485794,-0.0925622507929802,-0.09226509183645248,0.017463909462094307,0.05595776438713074,0.051980018615722656,0.021307308226823807,0.08142883330583572,0.10269524157047272,0.03808460384607315,0.061041347682476044,0.08142396807670593,-0.0005083846626803279,0.1164713129401207,-0.019425315782427788,0.025695351883769035,0.0362212099134922,0.12405557930469513,0.08013588190078735,-0.0844368189573288,-0.012731820344924927,0.04934588447213173,0.0872250646352768,0.16157948970794678,0.09708544611930847,0.1114000529050827,-0.05777664855122566,-0.033242061734199524,-0.07373304665088654,-0.04003681242465973,-0.06019353121519089,-0.05730336904525757,-0.04553646221756935,0.1473741978406906,-0.0998484417796135,-0.06541085243225098,0.08957664668560028,-0.11295579373836517,-0.014750474132597446,-0.11797360330820084,0.08352936804294586,0.09122828394174576,0.04523926228284836,-0.017861681059002876,-0.03154532238841057,-0.10381748527288437,0.03799278661608696,-0.0654071792960167,-0.11425076425075531,0.07420091331005096,-0.0712587907910347,0.027773089706897736,0.08394492417573929,0.1646757423877716,0.046373412013053894,-0.04773924499750137,-0.14953763782978058,-0.08358672261238098,-0.03638472780585289,-0.140835240483284,0.027706487104296684,-0.04212338104844093,-0.010242311283946037,-0.07685805857181549,0.06999966502189636,0.13168157637119293,0.14121277630329132,-0.1510484367609024,0.10714947432279587,-0.12565737962722778,0.07920128107070923,0.11250823736190796,-0.038231492042541504,-0.13759629428386688,0.14359311759471893,0.125336691737175,-0.07484284788370132,0.14791227877140045,0.17981316149234772,0.12617363035678864,0.05884799733757973,0.030752457678318024,-0.0039074234664440155,-0.07523836940526962,0.14333023130893707,-0.06946063041687012],[0.07309035211801529,0.06389325857162476,-0.007543622981756926,0.08603663742542267,-0.044249556958675385,0.1162557452917099,0.09703747183084488,-0.11100799590349197,-0.15165644884109497,-0.10487758368253708,0.011296269483864307,0.0684431791305542,-0.09534543007612228,-0.12597836554050446,0.08328515291213989,0.09136182814836502,0.07615575939416885,0.13906635344028473,0.14170439541339874,0.12534835934638977,0.062203098088502884,0.15872754156589508,-0.08827751129865646,0.10619664937257767,0.14639906585216522,0.05844501033425331,0.12135455012321472,0.08723284304141998,-0.011591739021241665,-0.06457716226577759,0.05184114724397659,-0.096134252846241,-0.017814157530665398,-0.06086476519703865,-0.12564916908740997,0.027211852371692657,-0.11899713426828384,0.1319192796945572,0.14913608133792877,-0.0627150908112526,0.11559760570526123,-0.07999740540981293,-0.0335727259516716,0.020552316680550575,-0.14578832685947418,-0.00029762432677671313,0.15748251974582672,0.02103058435022831,0.04832640290260315,-0.07857473939657211,-0.13606351613998413,0.0197319183498621,0.0909249484539032,0.06510809063911438,-0.03323926776647568,-0.09397485852241516,-0.14416532218456268,0.1436249315738678,0.03804861009120941,0.0278454776853323,-0.021141625940799713,0.1534285694360733,0.013995466753840446,0.02670249156653881,0.09096130728721619,-0.08701872080564499,-0.03029194101691246,0.13162381947040558,-0.09498867392539978,-0.0688822865486145,-0.007142053917050362,-0.054900821298360825,-0.12610048055648804,0.12121148407459259,0.13359934091567993,-0.014890049584209919,-0.041691578924655914,0.05957712233066559,0.11861299723386765,0.15376892685890198,-0.13883301615715027,-0.10059383511543274,-0.09577411413192749,0.031343989074230194,0.14043810963630676,0.10152044892311096,-0.1447543352842331,0.0761740654706955,-0.11341892182826996,-0.019677625969052315,0.09693518280982971,0.047654613852500916,0.045678433030843735,0.15739241242408752,0.02171754091978073,-0.09736383706331253,0.059865135699510574,0.10758797079324722,0.017665430903434753,-0.10482361912727356,-0.018947310745716095,-0.020063770934939384,0.012559723109006882,0.005066137760877609,-0.100968137383461,0.06384318321943283,-0.1198824942111969,0.09311914443969727,0.008377469144761562,0.12435602396726608,-0.0052191875874996185,-0.009658894501626492,0.061572588980197906,0.0932949110865593,-0.11596987396478653,0.14794515073299408,-0.03459380567073822,-0.09146193414926529,-0.10913924872875214,-0.1327095329761505,0.09638865292072296,0.05382363498210907,0.002898158971220255,-0.06407447904348373,-0.028213201090693474,0.1512237787246704,-0.06450575590133667,-0.07329844683408737],[-0.059735529124736786,-0.009403975680470467,-0.1325257122516632,-0.08049403131008148,0.04890512675046921,0.04394029453396797,-0.10793791711330414,0.005904010031372309,-0.04764702171087265,0.1203303337097168,0.07380913197994232,0.06318782269954681,-0.1482885628938675,0.11992179602384567,0.09330639243125916,-0.04915096238255501,-0.13448095321655273,0.13187536597251892,-0.08301853388547897,0.07483188807964325,0.0004820080939680338,-0.052696678787469864,0.13170701265335083,-0.004929020535200834,-0.02755865454673767,0.13432951271533966,0.06541498005390167,-0.06906358897686005,-0.11300769448280334,-0.12280882894992828,0.003922465723007917,0.10094430297613144,-0.09049344807863235,0.1009489968419075,-0.09292412549257278,-0.09009122848510742,0.06951691210269928,0.1078510731458664,0.12241453677415848,0.013975881971418858,0.01982933096587658,0.10580018162727356,0.1347780078649521,-0.14233599603176117,0.1053628996014595,-0.046805281192064285,0.1380133479833603,0.08448183536529541,-0.10460316389799118,-0.08365476876497269,0.1427617073059082,0.09644901007413864,-0.11135905981063843,-0.12403751909732819,0.06356363743543625,-0.06699201464653015,-0.038785334676504135,0.05964014679193497,-0.07871051877737045,-0.029893286526203156,-0.08818110823631287,0.13274353742599487,0.027039017528295517,0.025502629578113556,0.14246132969856262,0.06550569832324982,-0.044121671468019485,-0.02524395100772381,0.11539134383201599,-0.04182588309049606,-0.0811210423707962,-0.1383071094751358,0.036028679460287094,0.006298387888818979,-0.038044966757297516,-0.11515667289495468,0.14348329603672028,-0.01969650574028492,-0.14420928061008453,0.10226208716630936,-0.10190850496292114,-0.11604385077953339,-0.004030581563711166,-0.026813358068466187,0.09640701115131378,-0.1374025195837021,-0.07936582714319229,0.006139256991446018,0.1103009581565857,0.006789896171540022,0.011112404987215996,-0.009667460806667805,-0.10767565667629242,0.06843964755535126,-0.0927201434969902,-0.08611543476581573,-0.03215884044766426,-0.09963595122098923,0.07270900160074234,-0.09276488423347473,-0.14840984344482422,-0.15339557826519012,0.07203824818134308,-0.11450619250535965,-0.036993514746427536,0.00734985014423728,0.12901803851127625,-0.1503499150276184,0.031062031164765358,0.008362216874957085,-0.014262340031564236,0.03232255578041077,0.024672070518136024,-0.14895787835121155,0.1064627543091774,-0.06717038154602051,-0.06550808995962143,0.06719131022691727,-0.007796328980475664,0.01892978511750698,-0.004561756271868944,0.06858409941196442,0.08691120147705078,-0.0004351194074843079,-0.1472722589969635,0.1344011127948761,-0.12746456265449524,0.07022112607955933],[0.010057605803012848,0.03624361753463745,0.14744530618190765,-0.07021404802799225,0.017426293343305588,0.13426573574543,-0.09948568046092987,-0.07916408032178879,-0.07061244547367096,0.06115410104393959,-0.12551119923591614,-0.040992774069309235,0.03305637091398239,-0.07111334800720215,-0.003969315905123949,0.1299893856048584,0.1073518693447113,-0.03482845425605774,0.10769042372703552,-0.0012570819817483425,-0.1358097493648529,-0.07282888889312744,-0.08560821413993835,0.144836887717247,-0.11466420441865921,-0.13278846442699432,-0.07353974133729935,-0.09124971181154251,-0.021492183208465576,-0.08632735908031464,0.08313415944576263,-0.13445453345775604,-0.1113705262541771,0.12719495594501495,-0.08113440871238708,-0.009512064047157764,-0.03031258098781109,-0.07851449400186539,-0.09309883415699005,-0.13282936811447144,0.12930892407894135,0.14813534915447235,-0.14450734853744507,-0.05617127940058708,-0.023585963994264603,0.1104888841509819,0.024484673514962196,0.03242691978812218,-0.1217055693268776,-0.05042175203561783,-0.15248358249664307,0.11443761736154556,-0.007300336845219135,-0.09573854506015778,0.04352191463112831,-0.0369483083486557,0.05872419849038124,-0.01445244625210762,-0.06031883880496025,-0.0679563358426094,0.0944669246673584,-0.0026375858578830957,0.12024804204702377,-0.09659451246261597,-0.12568874657154083,0.01914965733885765,0.012721046805381775,-0.014417504891753197,0.06084970012307167,0.1306651383638382,-0.05923503637313843,-0.13113930821418762,-0.09902125597000122,-0.14576275646686554,-0.13164860010147095,0.10738500207662582,-0.05637077987194061,-0.02835254557430744,0.008157105185091496,-0.0829879492521286,-0.06884399801492691,0.15044595301151276,-0.1365324854850769,-0.14944911003112793,0.12279801070690155,-0.14193792641162872,-0.04436187073588371,-0.02954701893031597,-0.09560737013816833,0.11422514915466309,-0.11548119783401489,0.10564209520816803,-0.10639072209596634,0.0053035179153084755,0.09300018101930618,-0.09267054498195648,0.05636624991893768,0.046592481434345245,-0.020741742104291916,-0.05947555974125862,0.07342878729104996,0.0039055864326655865,-0.14323481917381287,0.005244635511189699,-0.01954718679189682,0.017744451761245728,-0.07331458479166031,0.11124199628829956,-0.09843026101589203,0.034256625920534134,0.07471343874931335,-0.07359688729047775,-0.07144267112016678,0.06304612010717392,-0.12947116792201996,-0.12344100326299667,0.07114499062299728,0.09543389081954956,0.1467665433883667,-0.060464970767498016,0.07467162609100342,-0.14052894711494446,0.07874056696891785,-0.11549527198076248,0.017999816685914993,-0.0021432482171803713,-0.06341636925935745,-0.12892921268939972],[-0.11928890645503998,0.0035820684861391783,0.053240206092596054,0.009493374265730381,-0.0751187652349472,0.09486808627843857,0.14969801902770996,-0.09291846305131912,0.041474416851997375,0.15434043109416962,-0.09995392709970474,0.11304271966218948,-0.08546356111764908,0.07921960204839706,-0.01277212519198656,0.07132404297590256,0.09430786222219467,0.12760764360427856,0.10430938005447388,-0.10378052294254303,0.03642257675528526,0.05528261512517929,-0.08490711450576782,0.1595790684223175,0.14875413477420807,-0.05921117216348648,-0.16455115377902985,-0.019656971096992493,-0.07614705711603165,-0.11559411883354187,0.06951075047254562,0.028903283178806305,-0.05348823219537735,-0.05042001232504845,-0.03763558715581894,0.0816400796175003,-0.0930909812450409,-0.0989980697631836,0.07584476470947266,0.12137111276388168,0.02749200165271759,-0.0231646541506052,-0.10108526796102524,0.0602913536131382,-0.10352703183889389,0.02425205335021019,-0.05931064859032631,0.11258327215909958,0.08269857615232468,0.08180715143680573,-0.029634879902005196,-0.08496157824993134,-0.07900633662939072,-0.03713792562484741,-0.12829552590847015,-0.09660827368497849,-0.08116444200277328,-0.03850391134619713,0.05182727798819542,-0.12917020916938782,0.12526920437812805,-0.1386592984199524,0.10906857997179031,-0.029903173446655273,0.143939808011055,0.07465071976184845,0.033975910395383835,0.14629961550235748,-0.1281615048646927,-0.029616113752126694,0.032278917729854584,0.03149031102657318,0.08721982687711716,-0.10009626299142838,0.1281326860189438,-0.10533691942691803,0.09671247005462646,0.05426812171936035,-0.058652326464653015,0.11782132089138031,-0.15961183607578278,-0.1389007866382599,0.1366424262523651,-0.05307883769273758,-0.05483566224575043,-0.13190025091171265,-0.07810548692941666,0.0014322733040899038,-0.04134802147746086,-0.060133472084999084,-0.1109132170677185,0.018471142277121544,0.14067423343658447,-0.04894286394119263,0.12686234712600708,0.08777491003274918,0.09444430470466614,-0.13392546772956848,0.10056692361831665,0.13435371220111847,0.013679749332368374,0.01699422486126423,0.01588873751461506,0.10294734686613083,-0.10305464267730713,0.03091750293970108,-0.10544358938932419,0.06609903275966644,0.11373376846313477,0.031143177300691605,0.12409460544586182,0.09087689220905304,0.008190088905394077,-0.04466349631547928,-0.002396007999777794,-0.09527146071195602,-0.0909530371427536,-0.024243401363492012,-0.01144520565867424,0.14391745626926422,-0.09464515745639801,-0.0840773731470108,-0.059347402304410934,0.11181589961051941,-0.14786288142204285,0.06875009089708328,-0.13707400858402252,-0.11867688596248627],[0.08527814596891403,-0.10486852377653122,0.029909608885645866,0.08750887960195541,0.1239946037530899,-0.04868881404399872,-0.14245393872261047,-0.06366922706365585,0.09156614542007446,0.13012832403182983,0.023123210296034813,0.05137660726904869,0.08785171806812286,-0.1549646258354187,-0.07846251130104065,0.004372545052319765,-0.0207368154078722,0.13175764679908752,0.09397287666797638,-0.01898415945470333,-0.010502594523131847,0.14636769890785217,0.14161542057991028,-0.10556855797767639,-0.08094702661037445,-0.13302192091941833,-0.06747028231620789,-0.05185182765126228,0.15297316014766693,-0.05339987203478813,0.05581356957554817,0.09225891530513763,-0.05778588727116585,0.10754717141389847,0.05435813590884209,0.12240616977214813,0.05078859627246857,-0.04816008731722832,-0.03218619152903557,-0.03508737310767174,0.0007113385363481939,0.14176557958126068,-0.0992196723818779,0.0765405148267746,0.0005803355015814304,0.1216328889131546,0.08328120410442352,0.04810144007205963,-0.14709565043449402,-0.025771552696824074,-0.10637561231851578,-0.14723797142505646,0.05589337646961212,-0.018142061308026314,-0.10267642140388489,0.03231526166200638,-0.09102527797222137,0.008974120952188969,-0.098551444709301,0.06977444887161255,-0.11168723553419113,-0.038282014429569244,-0.08009140193462372,0.12391598522663116,-0.0409766361117363,0.06673935055732727,0.11919060349464417,0.10667844861745834,-0.041237518191337585,-0.09228512644767761,-0.027380891144275665,0.11856812238693237,-0.0999411791563034,-0.004040025174617767,-0.1427692323923111,0.06585570424795151,-0.1352061629295349,-0.12502923607826233,0.10897593200206757,0.0610235370695591,-0.0049551804549992085,0.055767081677913666,0.032354503870010376,0.006464716512709856,-0.02012510411441326,0.0006315920036286116,0.013729263097047806,-0.04888682812452316,0.016112230718135834,-0.04143949970602989,-0.13431988656520844,0.008504202589392662,-0.023129496723413467,-0.14145921170711517,0.08368115872144699,0.041936397552490234,-0.13370700180530548,-0.028114797547459602,0.018173780292272568,-0.134190633893013,0.12364666163921356,0.10164918750524521,-0.04761222377419472,-0.08188256621360779,-0.02843116782605648,0.05069009214639664,0.046855662018060684,-0.0492280013859272,-0.10290835797786713,-0.11089310795068741,0.04202863946557045,0.11146631091833115,0.09995164722204208,0.06661896407604218,-0.020650768652558327,-0.04227645322680473,-0.13636521995067596,0.03689785301685333,-0.017481455579400063,0.15515151619911194,0.08982841670513153,0.12513332068920135,0.045298982411623,-0.11753744632005692,0.09160372614860535,-0.06945176422595978,0.026453573256731033,-0.009274417534470558],[-0.004161374643445015,0.1424783170223236,0.12273619323968887,-0.0344327948987484,-0.1175728514790535,-0.03682001307606697,-0.042394738644361496,-0.06683854758739471,0.10006381571292877,0.03224986046552658,-0.02999008260667324,0.0786573588848114,-0.09876260161399841,-0.1266709566116333,0.013626381754875183,-0.09061913192272186,0.004116844851523638,-0.07028520107269287,-0.13133831322193146,0.11688856035470963,-0.1480388045310974,0.03553956747055054,-0.10241056233644485,0.011087542399764061,-0.12109828740358353,0.01152090821415186,-0.011197630316019058,0.003945046104490757,-0.1123974472284317,-0.0023051039315760136,-0.1462324559688568,-0.13491493463516235,0.1272975355386734,-0.12610483169555664,0.03679358586668968,-0.01762217842042446,0.07430153340101242,-0.06976703554391861,0.02928801439702511,-0.11350111663341522,0.08528453856706619,0.09706724435091019,0.026268253102898598,-0.07967069745063782,0.11862965673208237,-0.10825865715742111,-0.07416679710149765,0.03652501106262207,0.031575944274663925,0.0397673137485981,-0.12684735655784607,0.13224753737449646,0.010041121393442154,0.036768440157175064,-0.07017409056425095,0.1105438768863678,0.0935366153717041,0.12188247591257095,-0.04699910432100296,-0.09694025665521622,-0.11574587225914001,-0.06725328415632248,0.04810577258467674,0.09363041818141937,-0.11514263600111008,0.15804655849933624,-0.15752869844436646,-0.1301465928554535,-0.033109985291957855,-0.1086510643362999,0.02156161516904831,-0.0966101884841919,-0.0028485155198723078,-0.060904935002326965,-0.10258714854717255,-0.008340872824192047,0.13224312663078308,0.004244840703904629,-0.12149254232645035,-0.10831350833177567,-0.034734051674604416,-0.08966314047574997,-0.14552642405033112,-0.03330530598759651,-0.021400731056928635,0.1330149918794632,-0.04800381883978844,0.0820651575922966,-0.11008422821760178,-0.08739753067493439,0.04138152301311493,0.13236945867538452,0.046450965106487274,0.0031514326110482216,-0.09190618991851807,-0.11828191578388214,0.14747022092342377,0.13917744159698486,-0.10086864978075027,0.13426296412944794,0.05279742181301117,0.04401041194796562,-0.0967983677983284,0.11936156451702118,-0.051985833793878555,-0.07235591113567352,-0.09473565220832825,0.009285221807658672,0.020229492336511612,-0.14270034432411194,-0.009613188914954662,0.13818521797657013,-0.12004737555980682,-0.14426027238368988,-0.10384067893028259,-0.1436230093240738,0.03798546642065048,0.0736759677529335,0.04372285678982735,0.05268317461013794,-0.12832485139369965,-0.14047130942344666,-0.03973303735256195,-0.10435379296541214,-0.1111503541469574,-0.06252206116914749,0.0870160460472107,-0.06566466391086578],[-0.10753278434276581,-0.016449399292469025,-0.0077539836056530476,-0.0021869668271392584,-0.09391045570373535,0.11635233461856842,-0.13062267005443573,-0.14197735488414764,0.07737027853727341,-0.14199304580688477,0.0744657889008522,-0.027921024709939957,-0.043939102441072464,0.10223975032567978,0.1360381543636322,0.07208989560604095,0.08936958760023117,-0.07691539078950882,-0.13551130890846252,-0.07633742690086365,-0.12066241353750229,0.04026903957128525,-0.020278001204133034,-0.008121869526803493,0.0679539293050766,0.012965615838766098,-0.09283091872930527,-0.04749579355120659,0.05823317915201187,-0.019810104742646217,-0.15175309777259827,0.11643115431070328,-0.053937122225761414,-0.1333475261926651,-0.04068119823932648,0.08111810684204102,-0.028329335153102875,-0.11156958341598511,-0.014002880081534386,0.00474169198423624,-0.02249203436076641,-0.11705830693244934,-0.14515911042690277,-0.12206707149744034,-0.11346578598022461,0.011794725432991982,-0.05547870695590973,-0.14011500775814056,0.08226853609085083,0.06039739027619362,-0.08158028870820999,0.12834155559539795,0.04935482516884804,-0.11874589323997498,-0.10087165236473083,-0.06892590969800949,0.0301070436835289,0.093512162566185,0.03588521480560303,-0.07853236794471741,0.03707512095570564,-0.11197847127914429,-0.09113901108503342,-0.0587751530110836,0.06786966323852539,0.10404445230960846,0.004871723707765341,0.0784248411655426,-0.07230955362319946,0.028926223516464233,-0.08067413419485092,0.10980738699436188,-0.03288635239005089,-0.11653443425893784,-0.08605761080980301,0.1271953135728836,-0.11367464065551758,0.08352366834878922,0.14040923118591309,-0.04637932404875755,-0.0195250753313303,0.14438669383525848,0.0962199866771698,0.014987310394644737,-0.09156385064125061,-0.10802561044692993,-0.0988025963306427,-0.12803786993026733,-0.13822627067565918,-0.017392730340361595,0.09028561413288116,-0.12501029670238495,0.13258793950080872,-0.13864824175834656,0.020077817142009735,0.01775185577571392,0.12171787023544312,-0.11075113713741302,-0.025752820074558258,-0.03601707145571709,-0.005234262440353632,0.11756589263677597,-0.026807894930243492,-0.15058735013008118,-0.15033355355262756,-0.13133345544338226,0.11950480937957764,0.016190869733691216,0.0700770914554596,-0.03618685156106949,-0.0736195296049118,-0.024065431207418442,0.13571219146251678,-0.0947655439376831,0.12378909438848495,0.12255606055259705,0.09525524824857712,0.07676848024129868,-0.05546503886580467,0.058735717087984085,0.06855764240026474,0.11927828937768936,0.10549575835466385,-0.08059875667095184,-0.09528269618749619,-0.0004219793190713972,-0.026655688881874084,-0.03274836391210556],[-0.07277558743953705,-0.04584186151623726,-0.013520026579499245,0.051577500998973846,-0.08385225385427475,0.008873099461197853,0.026950335130095482,0.016938284039497375,0.02323809638619423,0.007134422659873962,0.039813969284296036,0.05360658839344978,-0.07098925858736038,-0.02664310857653618,-0.0626421868801117,0.0858430564403534,0.0861009955406189,-0.030695147812366486,0.06114973872900009,0.06571859866380692,0.09457861632108688,0.0429425910115242,-0.11356420814990997,-0.15909482538700104,-0.13799193501472473,-0.10155565291643143,-0.0477878674864769,-0.009324929676949978,-0.08916551619768143,0.07305908203125,0.08340476453304291,-0.060090359300374985,0.06529927253723145,-0.03748071566224098,0.012156213633716106,-0.059931181371212006,-0.032584886997938156,-0.0913267731666565,-0.057401977479457855,-0.00288509507663548,0.047997646033763885,-0.07531799376010895,0.04896664246916771,-0.03159671276807785,-0.012607223354279995,-0.09459943324327469,-0.16244608163833618,0.06652434170246124,0.11913766711950302,-0.006267336662858725,0.007615446578711271,0.04258900135755539,0.1445484161376953,0.09367742389440536,-0.02650601416826248,0.15985216200351715,0.11024308949708939,0.04714467003941536,-0.08299240469932556,0.1320822536945343,0.08476084470748901,-0.1508147418498993,-0.14632245898246765,-0.1311824917793274,0.11615540832281113,-0.07691889256238937,-0.10460276901721954,0.08410494774580002,-0.07291100174188614,0.11691801995038986,0.09562622755765915,0.1379200965166092,-0.11361788958311081,-0.07367799431085587,-0.045749131590127945,0.13785770535469055,0.06079725921154022,-0.015731029212474823,0.08883648365736008,-0.10513218492269516,0.1021512970328331,-0.07006831467151642,-0.04577244445681572,-0.11376713216304779,0.013415711000561714,-0.04940427839756012,0.0021424840670078993,-0.08024550974369049,-0.14049425721168518,0.05129785090684891,0.09253144264221191,0.08361119031906128,-0.09175008535385132,0.04250088706612587,0.0250913817435503,0.08478856086730957,-0.09971445798873901,-0.08227766305208206,0.011273113079369068,-0.024707922711968422,-0.03190586715936661,0.1446678638458252,0.01523829996585846,-0.01960509829223156,-0.13615690171718597,0.020004764199256897,-0.12524297833442688,0.08733963221311569,0.03904002159833908,0.06772813946008682,0.10170571506023407,0.04507702216506004,0.15876491367816925,0.09932441264390945,-0.0795971155166626,0.09770802408456802,0.07716881483793259,0.08097688853740692,-0.12011800706386566,-0.13081716001033783,-0.1647750735282898,-0.13475686311721802,-0.02404850348830223,-0.0501856803894043,0.11227535456418991,-0.12633273005485535,0.05185076966881752,0.1212567463517189],[-0.013384456746280193,0.11261057108640671,0.10988170653581619,-0.00015414651716127992,-0.10297609120607376,0.13587547838687897,0.08931347727775574,-0.05091281235218048,0.10891921073198318,0.04677557572722435,0.00832425057888031,0.08454582095146179,0.11348073929548264,-0.03011287748813629,0.11454451829195023,0.1057366356253624,0.13361915946006775,-0.1512576937675476,0.006602350156754255,-0.0015487701166421175,-0.012133431620895863,0.08529181033372879,0.14230161905288696,0.10207522660493851,-0.026439301669597626,0.037418246269226074,-0.08275526762008667,-0.1265256404876709,-0.002345235552638769,0.07531104981899261,-0.11493474990129471,-0.0016282760770991445,-0.009357337839901447,0.05859309434890747,-0.04281950369477272,0.13955985009670258,-0.03354929760098457,0.12281960994005203,-0.03323490545153618,0.10969240963459015,0.0009132219711318612,0.0835781991481781,-0.032322440296411514,-0.039490021765232086,-0.06627439707517624,-0.041552670300006866,0.013334461487829685,-0.1253989040851593,0.14130201935768127,0.1016652062535286,0.056124985218048096,0.04239106923341751,-0.12837617099285126,0.03202958405017853,0.0921766385436058,0.0025999085046350956,-0.09293048083782196,-0.005856716074049473,0.023198597133159637,0.09308841079473495,-0.07922238856554031,0.020798001438379288,-0.10838231444358826,-0.03758379817008972,0.14302627742290497,0.1423514038324356,-0.058763474225997925,0.05501142889261246,-0.09807043522596359,-0.024158678948879242,-0.015360058285295963,-0.08273346722126007,0.10638228803873062,-0.14802004396915436,0.097987599670887,-0.0018193947616964579,0.06644036620855331,0.023614536970853806,0.04759788513183594,0.05210001394152641,-0.08689615875482559,0.08063771575689316,0.12826919555664062,-0.09722091257572174,0.10738514363765717,-0.12709294259548187,-0.03514727205038071,-0.014242252334952354,-0.11603350937366486,0.039608705788850784,0.1320364624261856,-0.055622633546590805,0.0107066435739398,0.020568443462252617,0.11237550526857376,-0.046989765018224716,0.13836941123008728,-0.005420345813035965,-0.025903426110744476,-0.11020008474588394,-0.04332725331187248,0.028247777372598648,-0.14598841965198517,-0.040416110306978226,-0.09130088239908218,-0.07752467691898346,0.06769565492868423,0.0030015127267688513,-0.12635819613933563,0.03589256480336189,0.015573251992464066,-0.07779792696237564,-0.11156118661165237,0.008207856677472591,-0.017516979947686195,-0.0004815708671230823,0.0051946272142231464,0.04009588435292244,-0.09053617715835571,-0.1266026794910431,-0.12752047181129456,-0.11470171809196472,-0.017231494188308716,0.05456620082259178,-0.06949698179960251,-0.08684787154197693,0.11164195090532303,0.10078184306621552],[-0.11008033156394958,-0.04076563939452171,0.10813301056623459,0.1309337317943573,0.14114490151405334,-0.09535552561283112,-0.1325184851884842,-0.06741965562105179,-0.11206593364477158,-0.08925174176692963,0.13342763483524323,-0.012561473995447159,0.08780872821807861,0.15439146757125854,0.04740424454212189,0.09799075126647949,-0.07488543540239334,0.10222607851028442,-0.0784873440861702,0.044046130031347275,-0.04889218509197235,0.015352701768279076,0.1295790672302246,-0.12649232149124146,-0.07023215293884277,-0.06649438291788101,0.004160554148256779,0.05310095101594925,-0.021818814799189568,0.06238451600074768,-0.028753571212291718,0.1046375036239624,-0.07251214236021042,-0.07744840532541275,0.012687984853982925,0.08215806633234024,0.10155809670686722,0.001582833006978035,0.09754223376512527,-0.08390940725803375,0.13648074865341187,-0.14125759899616241,0.0333029106259346,0.1466723531484604,-0.11188198626041412,-0.14518776535987854,-0.12959103286266327,0.09773559868335724,0.11732379347085953,-0.023271918296813965,0.08130519092082977,-0.004445221275091171,-0.10450319945812225,0.06001197174191475,0.03556395694613457,-0.05887077748775482,0.004159316420555115,0.12583541870117188,0.026122424751520157,0.005728681571781635,-0.07038187980651855,0.09386219084262848,0.13184374570846558,-0.08787550032138824,0.044039685279130936,-0.1543009877204895,-0.04819750040769577,-0.1332624852657318,0.0007711381767876446,-0.12102608382701874,0.15552428364753723,-0.04845377802848816,-0.12924110889434814,0.09728629887104034,-0.09190671890974045,0.10044214874505997,-0.11790883541107178,0.15372158586978912,0.12882742285728455,-0.009544418193399906,-0.1567557007074356,-0.09880511462688446,-0.05970321223139763,0.061242472380399704,-0.035602062940597534,0.13779078423976898,-0.011288697831332684,0.06229451671242714,0.1238129660487175,-0.13759614527225494,-0.14684471487998962,0.11377992480993271,0.14435948431491852,-0.11480389535427094,-0.0020246137864887714,-0.02472560666501522,0.06363897025585175,-0.024406107142567635,0.14268192648887634,0.07139590382575989,-0.1143326535820961,-0.052218977361917496,0.009951393119990826,-0.11036063730716705,0.057847436517477036,-0.08269426226615906,0.12028735131025314,0.13774891197681427,0.08067300915718079,-0.0643078163266182,0.06980784237384796,0.05207622051239014,0.00399143248796463,0.09073244035243988,-0.01958298124372959,0.07643689215183258,0.06312855333089828,0.12629181146621704,-0.08098722994327545,0.03800132870674133,-0.0007431292906403542,-0.09755925834178925,-0.043453361839056015,-0.009252610616385937,0.1408863067626953,0.1097644716501236,0.1426205337047577,0.07137524336576462],[-0.019490107893943787,0.010969188064336777,-0.1373416632413864,0.0612478032708168,-0.08544140309095383,0.04683135449886322,-0.0431646890938282,-0.01167853083461523,-0.00031510836561210454,-0.05012400448322296,-0.01682530716061592,-0.132601797580719,-0.04215417429804802,0.10745781660079956,-0.12347570061683655,0.16691982746124268,-0.030234886333346367,-0.07567732781171799,-0.07703373581171036,-0.01034258957952261,-0.08916498720645905,0.08575503528118134,0.021810857579112053,0.02504841797053814,-0.1333117038011551,0.023656852543354034,-0.12688033282756805,-0.010037141852080822,-0.033546462655067444,-0.10658666491508484,0.09839330613613129,0.014182220213115215,-0.1317860186100006,-0.027461238205432892,-0.011123116128146648,-0.12422779202461243,-0.08158302307128906,0.04988204315304756,0.012822315096855164,-0.12222909927368164,-0.034580983221530914,0.08335912227630615,-0.12144681811332703,0.11107998341321945,-0.129480242729187,-0.08710118383169174,0.17477811872959137,-0.019971702247858047,-0.047291163355112076,0.15748003125190735,-0.02588140405714512,-0.06431727111339569,0.07314293086528778,0.142489954829216,-0.04755701497197151,0.12187023460865021,0.038917310535907745,0.05554326996207237,0.13234223425388336,-0.025046341121196747,-0.08157949894666672,0.01608647219836712,-0.051884058862924576,0.01580222137272358,0.058986544609069824,0.1210300624370575,0.13507668673992157,0.019520090892910957,0.02532103843986988,-0.12056176364421844,-0.0025135742034763098,0.008758794516324997,0.06165354326367378,0.007804247550666332,0.11743966490030289,-0.10654350370168686,0.10835133492946625,0.1326635777950287,0.09818249940872192,-0.10755397379398346,-0.10313345491886139,-0.016514552757143974,-0.1232963278889656,0.1439703404903412,-0.10985291749238968,0.1179792582988739,-0.0999533012509346,0.008149022236466408,-0.10040419548749924,0.13869470357894897,-0.029292182996869087,-0.12817423045635223,-0.12402001768350601,-0.05735352635383606,-0.10352671146392822,0.061191167682409286,-0.09476444870233536,-0.06949128210544586,-0.03888170048594475,-0.06826436519622803,0.011582888662815094,0.09588051587343216,3.612315049394965e-05,0.11312874406576157,-0.026010705158114433,-0.06091723591089249,-0.007072965148836374,0.07333434373140335,0.15183468163013458,-0.00571439228951931,0.039452992379665375,0.1337195634841919,0.08639439940452576,0.019906647503376007,0.16707757115364075,0.02896462008357048,0.043271031230688095,0.11125611513853073,0.05493803322315216,-0.04460354149341583,0.07019294798374176,-0.1350456178188324,-0.09999683499336243,0.15165522694587708,-0.10504647344350815,0.12539218366146088,-0.08286266028881073,0.038469940423965454],[0.07298403978347778,-0.11792565137147903,-0.07181085646152496,-0.1359708458185196,-0.03861675038933754,0.1036023423075676,-0.15995274484157562,0.06724757701158524,0.10108327120542526,-0.009869130328297615,-0.04061054810881615,-0.04430887848138809,0.04022225737571716,-0.14841897785663605,0.004798486363142729,0.041765231639146805,0.1599058210849762,0.09857069700956345,-0.05825871601700783,0.14131580293178558,-0.10839885473251343,0.08996745944023132,-0.07822409272193909,0.15892289578914642,-0.039404988288879395,-0.08182384073734283,-0.05810409039258957,0.1373700648546219,-0.12954571843147278,0.08585056662559509,0.12219691276550293,-0.05492420122027397,-0.08827628940343857,0.02948588877916336,0.10205408185720444,-0.10912151634693146,0.024075349792838097,-0.012171892449259758,0.11449925601482391,-0.09405253827571869,-0.13004717230796814,0.10989886522293091,0.06653760373592377,0.0421580970287323,-0.10540714859962463,0.0699082612991333,0.03946107253432274,-0.14378955960273743,-0.13215306401252747,0.12338650226593018,-0.002256779931485653,0.1169341653585434,-0.12564566731452942,0.15244583785533905,0.053875699639320374,-0.024616742506623268,-0.04945093020796776,0.007478024810552597,-0.07425221800804138,0.06361380219459534,0.10023821890354156,-0.007783017586916685,-0.08939622342586517,0.05776715278625488,-0.03525395691394806,-0.08604807406663895,0.15070414543151855,0.07501547038555145,0.15057311952114105,-0.06179638206958771,-0.1137421727180481,0.0935085266828537,0.11312244087457657,0.02742394059896469,-0.07090302556753159,-0.13770191371440887,0.01543455570936203,-0.03107861615717411,-0.053270626813173294,0.04016707465052605,-0.03003029152750969,-0.021000871434807777,0.1529448926448822,0.06150437146425247,-0.14180049300193787,-0.13367128372192383,0.007442505564540625,-0.09275635331869125,-0.08643187582492828,0.14821147918701172,0.018742190673947334,0.1317138373851776,0.051224734634160995,-0.06360885500907898,0.11852993071079254,0.0090269660577178,-0.14461219310760498,0.13254787027835846,0.09514188766479492,-0.06805264949798584,-0.11159377545118332,0.06284835189580917,-0.08959361910820007,-0.03108704462647438,0.09872975945472717,0.015720171853899956,0.09154299646615982,0.05482662096619606,0.14679308235645294,-0.12987889349460602,0.06779869645833969,0.03143085911870003,0.0021673880983144045,0.06743976473808289,-0.11787638813257217,-0.10750701278448105,0.08493845909833908,-0.07844343036413193,-0.010499315336346626,0.002958154771476984,-0.039178166538476944,0.05222879722714424,0.02951476350426674,-0.015486067160964012,-0.030129170045256615,0.012001048773527145,-0.10181773453950882,-0.1288708746433258],[-0.1289314180612564,-0.012349921278655529,-0.12648621201515198,-0.07494045048952103,0.06438439339399338,-0.0711778998374939,0.0682833194732666,0.03949954733252525,-0.05569866672158241,-0.10739686340093613,-0.02679387666285038,0.06814500689506531,0.15372855961322784,-0.01344437524676323,0.10542790591716766,0.05188619717955589,0.12300486862659454,-0.13158681988716125,0.12324655801057816,0.0698806568980217,0.08925801515579224,0.037763334810733795,0.09015387296676636,0.05725079029798508,-0.08534621447324753,-0.11931135505437851,-0.08067331463098526,-0.11608169227838516,0.10400725156068802,0.09459182620048523,0.043123044073581696,0.09648125618696213,-0.10204897820949554,0.08636260777711868,0.13093027472496033,-0.025481553748250008,0.09274445474147797,0.10272930562496185,0.12460015714168549,0.14282946288585663,-0.11312993615865707,0.049548499286174774,0.05392730236053467,0.012456722557544708,0.12623745203018188,0.012377113103866577,-0.10345331579446793,0.07248023897409439,-0.12850995361804962,-0.04976841062307358,-0.08307629078626633,-0.05723654478788376,0.07379468530416489,-0.04757663607597351,0.05058959126472473,-0.12427519261837006,-0.06020864099264145,-0.05797009915113449,-0.09580375254154205,-0.03455732390284538,0.036572910845279694,-0.1295994073152542,0.12855160236358643,0.012806590646505356,-0.11297515034675598,0.15226007997989655,-0.09986770153045654,0.08425942063331604,-0.06167192384600639,0.0977586880326271,0.024091219529509544,-0.13876278698444366,-0.0807458758354187,0.0028750477358698845,-0.08344221115112305,-0.05275988578796387,-0.12460633367300034,0.0044188424944877625,0.029428798705339432,0.041558507829904556,-0.025498006492853165,0.04665037617087364,-0.08984014391899109,0.11046002805233002,-0.022050587460398674,0.011573659256100655,0.12942877411842346,0.1248098611831665,0.0011232219403609633,-0.08531969785690308,-0.09390269964933395,0.09493698179721832,0.11110743135213852,0.06774867326021194,0.13973455131053925,0.1332273930311203,-0.12288475781679153,-0.045354343950748444,0.06552109867334366,0.03388889878988266,0.12878164649009705,0.055447351187467575,-0.023119328543543816,-0.1230318620800972,0.008031950332224369,-0.049692634493112564,-0.023797612637281418,-0.13294218480587006,0.1033017486333847,-0.03456885367631912,-0.0978638157248497,-0.033028241246938705,-0.10230615735054016,0.05798797681927681,0.03566012531518936,0.13069786131381989,-0.15367679297924042,0.13868071138858795,0.13759489357471466,-0.11030971258878708,-0.03957051783800125,-0.10572798550128937,-0.08833625167608261,-0.05475257337093353,0.05005167797207832,-0.06317897886037827,0.14512969553470612,0.08962878584861755],[-0.020318735390901566,0.08637328445911407,0.09581666439771652,-0.12280581891536713,-0.09212188422679901,-0.06982120871543884,-0.09355849027633667,-0.03535762056708336,-0.006033682730048895,0.07072000205516815,0.008213971741497517,-0.04052675887942314,-0.10840746760368347,-0.12007217109203339,0.052973274141550064,0.059830885380506516,-0.08208847045898438,0.06506842374801636,0.05740940198302269,0.048910874873399734,0.010231148451566696,0.15606054663658142,-0.012103589251637459,0.014243156649172306,-0.10845675319433212,-0.04111247509717941,-0.08750103414058685,0.12111888825893402,0.006261675618588924,-0.00545544596388936,-0.12122572213411331,0.030841397121548653,-0.04433856159448624,-0.13944897055625916,0.002266707830131054,0.1258423924446106,0.0556432269513607,0.13554303348064423,0.08649171888828278,0.09348832070827484,0.045507919043302536,0.1431577503681183,-0.12163273245096207,0.0740635022521019,-0.13204503059387207,-0.15862339735031128,0.1453835368156433,-0.027096828445792198,0.1513865441083908,-0.04455052316188812,0.01752837747335434,-0.0890478566288948,-0.0036487735342234373,0.1396102011203766,-0.11876582354307175,-0.10285881906747818,0.10708337277173996,-0.1062377467751503,-0.0020517439115792513,-0.02754427306354046,-0.11155831068754196,-0.0509704127907753,-0.10673508793115616,-0.05015074089169502,-0.10894129425287247,-0.021552545949816704,-0.03971053287386894,0.040631767362356186,-0.051985643804073334,0.0011074524372816086,0.11122780293226242,0.14013200998306274,0.04691879078745842,-0.027488138526678085,0.08708345890045166,-0.04163548722863197,0.0027728150598704815,-0.009168917313218117,-0.01427817065268755,0.12923763692378998,0.040626879781484604,0.14335452020168304,-0.03852446749806404,0.12041383981704712,0.009056919254362583,-0.11690568923950195,-0.045350488275289536,-0.013910387642681599,-0.09232320636510849,-0.028004270046949387,-0.13714031875133514,0.11759047955274582,0.011029830202460289,-0.047839172184467316,-0.13524030148983002,-0.005369905848056078,-0.04497784003615379,0.012827946804463863,-0.14577144384384155,-0.0020161408465355635,0.11552096158266068,0.053189102560281754,0.08980816602706909,-0.14322857558727264,-0.11731061339378357,0.10449828952550888,0.03912491723895073,0.12256883084774017,0.03176431730389595,-0.1360146552324295,0.09033948928117752,-0.01570320501923561,-0.07246925681829453,0.06541211158037186,0.02444850653409958,-0.12687774002552032,0.08344854414463043,-0.08121326565742493,0.10442043840885162,0.10054287314414978,-0.08273673802614212,-0.12672284245491028,-0.13173602521419525,0.0878562480211258,0.01689535565674305,0.14607511460781097,-0.00254121795296669,0.13704410195350647],[-0.13358913362026215,-0.14753730595111847,0.042774710804224014,-0.038864266127347946,0.11725310236215591,0.13014259934425354,0.1339762806892395,0.10807610303163528,0.02248154766857624,-0.14947794377803802,-0.08402398973703384,-0.13309024274349213,0.1436852365732193,-0.14274293184280396,0.08430619537830353,-0.1366722732782364,-0.0932653397321701,0.028716763481497765,0.014012651517987251,-0.04281770810484886,-0.006858912296593189,-0.009079307317733765,0.03167350962758064,-0.034640293568372726,0.009362681768834591,-0.08001966774463654,-0.11906871199607849,0.026198020204901695,0.0277399979531765,-0.0677737444639206,-0.13187181949615479,-0.0005884146085008979,-0.008745167404413223,0.08409180492162704,-0.08647814393043518,-0.02811974287033081,0.021990561857819557,-0.09007464349269867,0.1135856956243515,0.12188243120908737,0.09333517402410507,-0.030140288174152374,0.13509513437747955,-0.1407995969057083,-0.14727097749710083,-0.02924908883869648,0.1116379126906395,0.053441356867551804,0.043603405356407166,-0.0036514669191092253,-0.12313936650753021,-0.0826541855931282,0.011539711616933346,-0.14024871587753296,-0.011007719673216343,0.06759189069271088,-0.11477576941251755,-0.1333940476179123,-0.08163115382194519,-0.09579642117023468,-0.002858112333342433,-0.06454429775476456,-0.05333152040839195,0.1307832896709442,0.11327746510505676,0.10576463490724564,0.051614198833703995,-0.10463796555995941,0.12708336114883423,0.1440945714712143,0.052692923694849014,-0.09340029954910278,0.0063377185724675655,0.04077170416712761,-0.039795614778995514,-0.007651190739125013,-0.10702838003635406,-0.05491001158952713,-0.08287187665700912,0.11657488346099854,0.1128038763999939,-0.12948143482208252,-0.016931496560573578,-0.0838385745882988,-0.05266687273979187,0.09913448989391327,-0.11394175887107849,0.09657944738864899,0.15080171823501587,0.11031360179185867,0.12194108963012695,0.01989971287548542,-0.08814217895269394,-0.16080231964588165,0.13135617971420288,-0.05052277818322182,0.057906463742256165,-0.0784497857093811,0.017185848206281662,-0.03597074747085571,0.024186765775084496,0.10803969949483871,-0.14237764477729797,0.07633855938911438,-0.1296459436416626,0.1261914074420929,0.1100478544831276,-0.0749751478433609,0.152425155043602,0.07521188259124756,-0.030025068670511246,0.11018890142440796,0.08399995416402817,0.09289541840553284,-0.055255480110645294,-0.15663360059261322,0.0696663036942482,-0.022015513852238655,0.12866085767745972,-0.08467908203601837,0.02821296826004982,-0.06013825908303261,0.09794136136770248,-0.13286429643630981,0.034866683185100555,-0.007060535717755556,0.09538053721189499,-0.11344463378190994],[-0.011300365440547466,0.13745631277561188,-0.0940517783164978,0.02706979028880596,-0.11557280272245407,-0.11949633806943893,0.05251669883728027,-0.06549011170864105,-0.014348759315907955,-0.020875396206974983,-0.02236810326576233,0.09176555275917053,-0.047839876264333725,-0.06507784873247147,0.1428968757390976,-0.11848922818899155,-0.04458247870206833,-0.06572093069553375,-0.06282974034547806,0.07717178016901016,0.042304810136556625,0.14049725234508514,-0.1070612445473671,0.030565226450562477,-0.13692884147167206,-0.11204109340906143,0.1429091840982437,0.13200929760932922,-0.06141386926174164,-0.12847381830215454,0.13547857105731964,0.12202382832765579,0.018189938738942146,0.03111792542040348,-0.03405787795782089,-0.100235715508461,0.09655158221721649,0.09276077896356583,-0.14350475370883942,0.08365558087825775,-0.02649545483291149,-0.055470533668994904,0.018555665388703346,-0.14339418709278107,0.09826447069644928,-0.0028191583696752787,-0.08786411583423615,0.13128536939620972,0.04036923125386238,0.14660711586475372,0.06047432869672775,-0.041140757501125336,-0.06360430270433426,-0.08740724623203278,-0.03977947309613228,-0.13363151252269745,0.03362281993031502,-0.1498287171125412,0.06169838830828667,-0.15055887401103973,0.12043250352144241,-0.1423356682062149,-0.12127524614334106,0.05047997087240219,0.014107946306467056,0.07527299225330353,-0.08236894011497498,0.0898270532488823,-0.14908932149410248,0.1081332415342331,-0.09250316023826599,-0.017490847036242485,0.020767319947481155,-0.13309508562088013,0.12181737273931503,0.0180752482265234,0.0282471664249897,0.0928877666592598,-0.0865192711353302,-0.020720504224300385,0.06395094841718674,-0.11995067447423935,0.06739795207977295,-0.12543050944805145,0.13101191818714142,-0.120728999376297,0.0319313183426857,0.00012144850916229188,0.15684382617473602,-0.10593385994434357,-0.025428680703043938,-0.09213024377822876,0.02269141934812069,-0.15108902752399445,0.07813265174627304,-0.10673423856496811,0.11755058169364929,0.040810998529195786,0.13997724652290344,0.04192190244793892,0.08013800531625748,-0.10356117784976959,-0.017912739887833595,0.10155466198921204,-0.004893346223980188,0.14514987170696259,0.0778813362121582,-0.06687299907207489,-0.09693434089422226,-0.04670111462473869,-0.04129175469279289,0.014629398472607136,0.08167803287506104,-0.044980812817811966,0.09877312183380127,-0.009976246394217014,-0.0704086646437645,-0.0003946157521568239,0.0517379492521286,0.016316328197717667,-0.11173950880765915,0.10881717503070831,0.12337508052587509,-0.11248396337032318,-0.06993936002254486,0.07292750477790833,-0.08099371194839478,0.0018461678409948945],[0.07950227707624435,0.14249269664287567,0.11155250668525696,0.007784165907651186,-0.01933390647172928,0.1106102392077446,-0.057667460292577744,0.11308016628026962,0.09976276755332947,0.08959189802408218,0.11495738476514816,-0.16118448972702026,-0.043142132461071014,0.08265261352062225,0.05775652825832367,0.048614997416734695,0.12471610307693481,0.15288057923316956,0.05992252379655838,-0.006627193186432123,0.13157488405704498,0.07825378328561783,-0.14693811535835266,0.038392871618270874,-0.0953652560710907,0.05251118168234825,-0.12875594198703766,0.0024990492966026068,-0.025412719696760178,0.0939687117934227,0.08707310259342194,-0.03035762906074524,-0.026621324941515923,-0.1101871058344841,-0.1370091587305069,0.06576956063508987,-0.038324613124132156,-0.10736187547445297,-0.05374973267316818,-0.05472806841135025,0.0001933226885739714,0.14272083342075348,0.03713250905275345,-0.01262220460921526,0.06767111271619797,0.07071013748645782,-0.024970944970846176,-0.09893886744976044,-0.02193976193666458,0.10088444501161575,0.12342752516269684,-0.016217924654483795,0.15725985169410706,-0.025946447625756264,0.09417367726564407,-0.045079682022333145,0.1444670408964157,0.010059203021228313,-0.11123812943696976,0.1313353180885315,-0.03845210000872612,0.13173352181911469,0.0909779816865921,0.11374207586050034,-0.10987690091133118,-0.020128676667809486,-0.07892900705337524,0.011334197595715523,-0.0761551782488823,-0.11770812422037125,-0.07628577947616577,0.06398236751556396,0.08209468424320221,0.11326584219932556,-0.10646730661392212,0.16165746748447418,0.051707085222005844,0.009248347952961922,0.09476489573717117,-0.12028735876083374,-0.10421478003263474,-0.09288988262414932,-0.012565278448164463,-0.14921534061431885,0.05701901391148567,0.09135501086711884,-0.0786953717470169,0.08943764120340347,0.07693963497877121,-0.12157724052667618,-0.08162084966897964,-0.09196705371141434,0.11425339430570602,-0.043487902730703354,0.14540457725524902,-0.020469343289732933,0.07864595949649811,-0.06301195919513702,-0.0712568610906601,-0.017216859385371208,-0.15147243440151215,0.0788237676024437,-0.03772071748971939,0.1535336971282959,0.12240348756313324,0.06141888350248337,-0.1086956188082695,0.0825226679444313,-0.032752327620983124,-0.10626082867383957,0.06878829747438431,-0.04710648953914642,-0.1405419111251831,-0.13401788473129272,-0.09950434416532516,0.07780798524618149,0.15268217027187347,-0.13473553955554962,-0.110236756503582,-0.11811686307191849,-0.06471522152423859,-0.05488397181034088,0.014334388077259064,0.08640903234481812,-0.048848774284124374,0.13826195895671844,-0.0032194273080676794,-0.08997945487499237],[0.09049016237258911,0.058910518884658813,-0.04947847127914429,0.07714527100324631,-0.13934385776519775,-0.0452982559800148,0.03980317711830139,-0.07062098383903503,0.025688081979751587,-0.11551301926374435,-0.07760164141654968,0.01954708807170391,-0.1055980697274208,0.09648768603801727,0.08109612762928009,0.03850705921649933,0.1263694018125534,0.041341811418533325,-0.06984511762857437,0.09739646315574646,0.11194968223571777,-0.0384366475045681,-0.020248422399163246,0.05652701482176781,-0.13273996114730835,-0.01168464682996273,0.035030025988817215,-0.12838250398635864,0.019372940063476562,0.005034470930695534,-0.11511095613241196,-0.0014078861568123102,-0.12659882009029388,-0.03263130784034729,0.11453769356012344,-0.09377474337816238,-0.005719696171581745,-0.14236129820346832,0.11265572160482407,0.10284043848514557,0.02486446499824524,0.12581567466259003,-0.022932518273591995,0.14640744030475616,0.06505952030420303,0.08307721465826035,-0.11192304641008377,0.09108436852693558,0.10016752779483795,-0.053610119968652725,0.1336788684129715,-0.057865824550390244,-0.10030493140220642,-0.03326965495944023,-0.09384476393461227,0.12809216976165771,-0.06403682380914688,-0.011157937347888947,-0.03736968711018562,-0.023662572726607323,0.0862673968076706,0.09177996218204498,0.09546622633934021,-0.07615657895803452,-0.02060120739042759,-0.013017621822655201,0.020945705473423004,0.11840149015188217,-0.1240256279706955,-0.0544360876083374,0.03264486417174339,-0.093104787170887,-0.02437232993543148,-0.0414583645761013,0.07888733595609665,0.06521572917699814,0.09306787699460983,-0.10672520846128464,-0.15416154265403748,-0.10805410146713257,-0.13016413152217865,0.024308854714035988,-0.09311855584383011,-0.08673814684152603,0.012791668996214867,-0.10027729719877243,0.15427254140377045,-0.10451307892799377,-0.01653222180902958,0.06191130355000496,0.11241035163402557,0.07932469248771667,0.12436287850141525,-0.11281431466341019,0.07161267101764679,0.04470882564783096,0.1111341044306755,0.013795017264783382,0.11653883755207062,0.021683532744646072,0.05770581215620041,0.09333885461091995,-0.10266545414924622,-0.07438734918832779,0.15285445749759674,0.10673549026250839,-0.11448531597852707,0.10765347629785538,-0.12892061471939087,-0.14582696557044983,0.0023257117718458176,-0.141270712018013,-0.08718302100896835,0.05611509084701538,-0.03356980159878731,0.12822532653808594,-0.15040968358516693,-0.0664638876914978,-0.13523708283901215,0.13721062242984772,0.003068717895075679,-0.029897531494498253,-0.010167199186980724,-0.028352495282888412,-0.020253866910934448,-0.14548002183437347,0.08681055903434753,0.07214835286140442],[-0.09396929293870926,0.03794780746102333,-0.01491873525083065,-0.04841218888759613,0.14026550948619843,-0.10538671910762787,-0.08624008297920227,-0.03898103907704353,0.11839776486158371,0.07767832279205322,-0.009130212478339672,-0.09643835574388504,-0.15249532461166382,-0.034781280905008316,0.0850130021572113,0.09898752719163895,-0.05004928261041641,0.10250481963157654,0.14288222789764404,0.09444344788789749,-0.01387249119579792,-0.018157295882701874,-0.01706424541771412,-0.13457410037517548,0.04981062188744545,-0.02399938553571701,0.06940338015556335,0.0448298379778862,-0.08474916964769363,-0.03391731157898903,0.03893539682030678,0.09233146905899048,-0.13239751756191254,-0.023797614499926567,0.08151040226221085,-0.14450283348560333,0.026304468512535095,-0.15456709265708923,-0.024061141535639763,0.13562846183776855,-0.153909370303154,-0.15687665343284607,-0.1027827337384224,0.0011400114744901657,-0.017274359241127968,-0.05031779035925865,0.06064391881227493,0.01266441773623228,0.12519417703151703,0.08497655391693115,0.06847473233938217,0.004367329645901918,-0.048889677971601486,-0.1276707500219345,0.1441727876663208,0.04763282462954521,0.14326626062393188,-0.04846978560090065,-0.13272017240524292,-0.03389272466301918,-0.108182393014431,-0.11540155112743378,-0.0049587334506213665,-0.10769481956958771,0.08877720683813095,0.09816448390483856,0.10976472496986389,0.03829111531376839,-0.10907720774412155,0.13529369235038757,0.09892264008522034,0.13063287734985352,0.014622336253523827,0.12569200992584229,-0.00673268549144268,-0.00285276398062706,-0.15740177035331726,-0.08611822873353958,0.002829301869496703,-0.14978694915771484,-0.11771790683269501,-0.07981088012456894,-0.02487190067768097,-0.11963215470314026,-0.11348041146993637,-0.024327874183654785,-0.04342624172568321,-0.04653390496969223,0.1277576982975006,-0.14197850227355957,0.011983130127191544,0.11864645779132843,-0.014806020073592663,-0.11212436109781265,0.14166414737701416,-0.024481479078531265,0.0740678608417511,-0.06223991885781288,-0.07380747050046921,0.13453234732151031,0.06075039878487587,0.13004425168037415,0.12206678092479706,0.09239562600851059,0.09819702804088593,-0.1331811100244522,0.02604212798178196,-0.08995034545660019,0.1416071653366089,0.09542861580848694,0.00685078464448452,-0.10885415971279144,0.10018964856863022,0.10801901668310165,0.005769993644207716,0.13214828073978424,0.07981397211551666,-0.10167775303125381,0.09211347252130508,0.03360092267394066,-0.12780706584453583,0.10947252064943314,-0.10407085716724396,-0.04699862375855446,0.0922737568616867,0.12680844962596893,-0.11065364629030228,-0.10773437470197678],[0.11165852844715118,-0.14402957260608673,0.088907390832901,-0.09580255299806595,0.10927432775497437,0.04725639522075653,-0.012918609194457531,-0.05762562155723572,0.0061366502195596695,-0.1467968374490738,-0.10457519441843033,-0.07138779759407043,0.05481304973363876,0.026273129507899284,-0.01781804859638214,0.1346239596605301,0.021239357069134712,0.12859675288200378,-0.043431852012872696,-0.06231895089149475,-0.021022368222475052,-0.007500485051423311,0.06709612905979156,0.06476637721061707,0.01290601771324873,0.14117638766765594,0.046901918947696686,0.00990939512848854,0.0076291817240417,0.02128225937485695,0.0426146499812603,-0.06226777285337448,-0.14608757197856903,-0.08209069073200226,-0.1430383324623108,0.04546119645237923,-0.020092293620109558,-0.06905348598957062,-0.054453104734420776,0.023941608145833015,-0.06528079509735107,-0.00718432804569602,-0.018820367753505707,-0.03878452628850937,0.04210754111409187,0.11525289714336395,0.11079628020524979,0.044055622071027756,0.026926714926958084,-0.03856493532657623,0.023560214787721634,0.11259227991104126,-0.032069191336631775,0.1340649574995041,-0.031566258519887924,0.12606942653656006,-0.04973522573709488,-0.029158808290958405,-0.12468186765909195,0.07460708916187286,-0.113639697432518,-0.09136355668306351,0.06660642474889755,0.0026669008657336235,-0.04419942572712898,0.00036007107701152563,0.08250662684440613,-0.05144980177283287,-0.11712702363729477,0.0958675742149353,-0.060763608664274216,-0.020884225144982338,-0.08061971515417099,0.08296643197536469,0.05306857451796532,0.12098082900047302,-0.11254162341356277,0.08396744728088379,-0.08324021846055984,-0.033472731709480286,0.042765986174345016,-0.0990106388926506,-0.07794002443552017,0.13568875193595886,-0.022101018577814102,0.0512850396335125,-0.12925201654434204,0.09300291538238525,0.08068284392356873,0.12746194005012512,0.10797510296106339,-0.08291731029748917,0.0027332077734172344,-0.04834985360503197,-0.04354572296142578,0.1141587644815445,0.15914346277713776,-0.12823514640331268,0.06675039976835251,0.10444725304841995,0.0054772039875388145,0.07117924839258194,-0.10252901166677475,-0.13631610572338104,-0.10700754076242447,0.09857494384050369,0.10272740572690964,-0.06683450937271118,-0.07764624059200287,0.06829442083835602,-0.10016337037086487,0.12591774761676788,-0.14046511054039001,-0.1089572012424469,-0.11620643734931946,0.04404951632022858,0.08523193746805191,-0.135226309299469,-0.03452200070023537,0.15639518201351166,0.14953692257404327,0.05036170780658722,-0.053788922727108,0.09763957560062408,-0.1029675230383873,-0.1443978101015091,-0.07677249610424042,-0.14285564422607422],[0.0777055099606514,0.09448659420013428,0.04329986497759819,0.006369855720549822,-0.05986470356583595,-0.02703951671719551,-0.0960826650261879,0.0963536724448204,-0.09666994214057922,-0.0201965793967247,-0.11942832916975021,-0.04333417862653732,0.009001772850751877,-0.12313037365674973,-0.06859620660543442,0.12718433141708374,-0.05899003520607948,-0.06408748030662537,-0.1053713858127594,0.049920909106731415,-0.0014581253053620458,-0.08609695732593536,0.02200748771429062,0.1504371166229248,-0.1287633180618286,0.07341767102479935,-0.14276638627052307,0.01958467997610569,0.16063901782035828,-0.03585730865597725,0.11800295114517212,0.04468463361263275,0.12073837220668793,-0.013875055126845837,-0.08059021085500717,0.002716724295169115,-0.07629062235355377,0.04352204501628876,0.013010149821639061,-0.03985001891851425,-0.11870776861906052,-0.11999009549617767,0.12545225024223328,0.06532105058431625,-0.09401821345090866,0.058338187634944916,-0.09922439604997635,0.013613469898700714,0.0678180381655693,0.03970854729413986,-0.038676511496305466,0.010421071201562881,-0.13447131216526031,-0.12421774864196777,0.008316604420542717,0.10129418224096298,0.02185441367328167,-0.0998648926615715,0.05646109580993652,-0.09932354837656021,0.17305755615234375,0.1024274155497551,-0.12928572297096252,0.12183069437742233,-0.05049390345811844,-0.06684710830450058,-0.07698636502027512,-0.13051119446754456,-0.067039355635643,-0.008969105780124664,0.16001752018928528,0.16491635143756866,-0.0503733791410923,-0.013858587481081486,0.17379818856716156,-0.10270640254020691,-0.0633012056350708,-0.0907382220029831,0.09877658635377884,-0.06879108399152756,-0.021470973268151283,0.0632757619023323,-0.13341428339481354,-0.08423031866550446,0.09094461798667908,0.020766930654644966,-0.05529336631298065,0.08907129615545273,-0.016957256942987442,0.12082303315401077,0.03909812867641449,0.15536190569400787,0.012575612403452396,0.10129010677337646,0.10316108912229538,0.14572130143642426,0.064651258289814,-0.12452340871095657,0.16041986644268036,0.05720273032784462,0.023759877309203148,0.08743605762720108,0.052324648946523666,0.14712630212306976,0.055269159376621246,0.0714731365442276,-0.04653003439307213,-0.06737761944532394,0.04955392703413963,0.14771771430969238,-0.07131042331457138,0.08194665610790253,0.057608988136053085,0.0917195975780487,0.10145677626132965,-0.06732121109962463,0.08616743236780167,-0.028766458854079247,0.14873085916042328,0.09415972977876663,-0.12499121576547623,0.06131599470973015,-0.1204763725399971,0.08663535118103027,0.07143903523683548,0.053388215601444244,-0.11732596158981323,-0.08729378879070282],[0.07634861767292023,-0.10864605009555817,0.12201933562755585,0.15549996495246887,-0.13932378590106964,0.04403354600071907,-0.007100038696080446,-0.06513518840074539,0.024415364488959312,-0.12172792106866837,0.13389518857002258,0.12529724836349487,-0.12993361055850983,-0.06865480542182922,-0.1366993635892868,0.10919840633869171,-0.055379193276166916,-0.02938275970518589,-0.027818413451313972,0.025405308231711388,-0.051932305097579956,0.08713126927614212,0.014070067554712296,-0.06250089406967163,-0.11455127596855164,-0.12579014897346497,0.128254696726799,0.011316553689539433,-0.04343751072883606,-0.004419011529535055,-0.05078069865703583,0.02260213904082775,-0.00039363966789096594,-0.11737857758998871,0.05518769845366478,-0.09640617668628693,-0.07765694707632065,-0.036749742925167084,0.12956580519676208,0.11463932693004608,-0.04966071993112564,0.031070910394191742,0.037317708134651184,-0.002349575748667121,0.0934072807431221,-0.001419814652763307,0.03148527070879936,0.14623945951461792,-0.037402231246232986,-0.11457835882902145,0.15560117363929749,-0.134419783949852,0.10201562196016312,0.05720440670847893,-0.045128390192985535,0.012007047422230244,-0.044757530093193054,0.1259469985961914,-0.0973818227648735,0.004216982517391443,0.14173710346221924,0.0747564360499382,0.12956608831882477,0.15298229455947876,-0.10252528637647629,-0.10242573916912079,-0.11596540361642838,-0.12346362322568893,0.11590594798326492,0.11597085744142532,0.05673552677035332,-0.07904448360204697,0.14485327899456024,-0.0017999457195401192,-0.002085695741698146,0.06224372610449791,0.002084031468257308,0.042429424822330475,0.117444708943367,0.10756412893533707,-0.019606852903962135,-0.081855408847332,0.1357915848493576,0.05957021191716194,0.15714596211910248,0.12470559030771255,-0.04544755071401596,0.10494045913219452,0.09315172582864761,-0.0638769343495369,-0.14056336879730225,0.14826911687850952,-0.14403501152992249,0.1553603559732437,-0.030352110043168068,-0.03862464800477028,-0.03287424147129059,0.12445465475320816,0.01452737394720316,-0.1405360847711563,-0.12954743206501007,-0.0020917635411024094,-0.15084074437618256,-0.007119595538824797,-0.11184145510196686,0.014820179902017117,-0.04951101168990135,-0.002156952628865838,-0.14493729174137115,-0.13467441499233246,-0.11242125183343887,0.14543798565864563,0.10729800164699554,-0.1465727835893631,-0.04839308187365532,0.04017023742198944,-0.1285834014415741,0.011093270033597946,0.07081574946641922,0.07885061949491501,-0.08554995059967041,-0.120078906416893,0.09596296399831772,0.09168308228254318,-0.03689591959118843,-0.0822904035449028,-0.16312329471111298,0.042672883719205856]],"b":[-0.003988353535532951,0.004217910580337048,0.017508462071418762,0.012491284869611263,0.007144044153392315,0.007117222063243389,0.0028939160984009504,0.006073723081499338,0.0063980924896895885,0.0032022425439208746,-0.008069065399467945,-0.004893399775028229,-9.004694584291428e-05,-0.0008793299202807248,0.013215114362537861,0.016561130061745644,0.01469427440315485,0.002078101271763444,0.009379207156598568,-0.01187998615205288,0.008680573664605618,0.00854034535586834,-0.0037934829015284777,0.0010609523160383105,0.016098590567708015,0.014362665824592113,-0.006489817518740892,-0.010501865297555923,-0.004222786985337734,-0.00342788384296,0.0067481775768101215,-0.005520505830645561,0.0022975075989961624,0.0,0.008903618901968002,0.00600093137472868,0.0039497553370893,0.007815609686076641,-0.006061100866645575,0.005216344725340605,-0.010628588497638702,0.0037674743216484785,-0.004144077654927969,-0.004896185826510191,0.011260268278419971,0.01079542376101017,0.008511973544955254,-0.003106594318524003,-0.0035293379332870245,-0.0011410402366891503,0.007323223631829023,0.005392490886151791,0.00813255924731493,0.01588844321668148,0.0,0.0028940027114003897,0.005897168070077896,-0.007066062651574612,-0.0007455524755641818,0.004224164877086878,0.007792948745191097,0.010498625226318836,-0.0016769003123044968,0.010779685340821743,0.005429410375654697,-0.004905014764517546,-0.002125795464962721,-0.0026695518754422665,0.00864588562399149,0.019661981612443924,0.0034299660474061966,0.014054113999009132,0.01515523623675108,-0.006903541274368763,0.009361605159938335,0.006828770041465759,-0.0021502331364899874,0.0,0.004847128875553608,-0.004066452383995056,-0.003224164480343461,-0.00273770815692842,0.0043052262626588345,-0.0013343582395464182,-0.0008394181495532393,0.009068512357771397,0.00042341998778283596,-0.009076863527297974,0.009198968298733234,-0.008238664828240871,-0.005610007792711258,0.011937560513615608,-0.007704998832195997,0.009374985471367836,0.0006646330584771931,0.001914877793751657,-0.002485634759068489,0.007515056524425745,-0.004861382767558098,-0.0017716855509206653,-0.008831730112433434,-0.004382861778140068,0.0,0.0,-0.005144744645804167,0.019830914214253426,0.008728607557713985,0.0010687917238101363,-0.004076800774782896,0.010110375471413136,0.008010325022041798,-0.0022426967043429613,0.0,-0.006491741165518761,-0.002731512999162078,0.0036585573107004166,0.010777616873383522,0.012331665493547916,-0.002857460640370846,0.006440924480557442,-0.0111708277836442,-0.009176697582006454,0.015619665384292603,-0.00831423420459032,-0.00824915710836649,0.0009362974087707698,0.009734222665429115,0.008439508266746998]},{"W":[[-0.08564996719360352,-0.053776707500219345,0.11664527654647827,0.1428881734609604,0.041968394070863724,-0.06234152615070343,-0.07387710362672806,0.11386450380086899,0.0748482495546341,-0.13904760777950287,-0.10878115892410278,0.05845000222325325,-0.0583973303437233,0.14873448014259338,0.14155429601669312,0.12740622460842133,-0.027840808033943176,-0.11198551952838898,0.07999962568283081,-0.131632462143898,-0.012609018012881279,-0.009329108521342278,-0.16609209775924683,-0.2107432782649994,-0.16625259816646576,0.00364159164018929,0.1369696855545044,-0.10911975800991058,-0.18834830820560455,-0.12668554484844208,0.12578465044498444,0.17065227031707764,-0.023926911875605583,-0.201381117105484,0.1907503753900528,-0.07958099246025085,0.04714799299836159,0.18850715458393097,-0.07093554735183716,0.10935521125793457,0.03795930743217468,0.12722660601139069,0.19536444544792175,0.16618219017982483,-0.0036694135051220655,0.14816798269748688,-0.15725550055503845,0.07008093595504761,-0.08347555994987488,0.11834970116615295,0.1694895625114441,-0.14013837277889252,-0.1320788562297821,0.01885821484029293,-0.20963916182518005,-0.08687133342027664,-0.19112399220466614,-0.10207705199718475,-0.14912493526935577,-0.03106110170483589,0.03892222046852112,0.15089771151542664,0.04855146259069443,0.1866995096206665,0.16702765226364136,0.12558181583881378,0.012273627333343029,0.039211127907037735,0.2126120775938034,-0.07678961753845215,0.07684072107076645,0.1401357501745224,0.07686379551887512,0.20491111278533936,0.08423515409231186,-0.11158032715320587,-0.13275335729122162,-0.19312337040901184,0.12719029188156128,0.06518761813640594,0.11732228100299835,-0.08045470714569092,0.09065885841846466,-0.20649710297584534,0.05291971564292908,0.10032549500465393,-0.001981323352083564,-0.146339550614357,-0.20107872784137726,-0.13727152347564697,0.15644225478172302,-0.02909519150853157,0.08847368508577347,-0.2071949541568756,0.17379553616046906,-0.18225030601024628,0.1414390206336975,0.04349210485816002,-0.12121857702732086,0.04432211071252823,-0.035936277359724045,-0.11468502879142761,0.10905534774065018,0.05447135120630264,-0.04341454803943634,-0.04810374602675438,0.0884687602519989,0.013754580169916153,0.015682943165302277,0.0026512376498430967,-0.1123242974281311,-0.014722999185323715,0.11909306794404984,-0.14200501143932343,0.17094361782073975,-0.1273229569196701,-0.08137589693069458,-0.00700403330847621,-0.09390132874250412,0.19923868775367737,0.06374707072973251,0.1219446137547493,0.011260665021836758,0.022802885621786118,-0.014839166775345802,0.11339415609836578,-0.1555003672838211,0.20721936225891113],[0.08716551959514618,0.21426616609096527,0.06436245888471603,0.1593230962753296,0.07365426421165466,0.09120168536901474,-0.17516650259494781,0.2045547068119049,0.18281418085098267,0.06091443821787834,-0.09574134647846222,-0.10437344759702682,-0.1719660609960556,-0.04561753571033478,0.041574787348508835,0.11416809260845184,0.1533689796924591,0.03649734705686569,0.07419416308403015,-0.06333887577056885,0.17768709361553192,0.08195125311613083,-0.0649557113647461,-0.165652796626091,0.0062595997005701065,0.1533687710762024,-0.021423935890197754,0.007835092954337597,-0.06779932975769043,0.16076533496379852,0.1050446629524231,0.09629294276237488,-0.1644236296415329,-0.1782570332288742,0.1473090797662735,-0.1384415179491043,0.16155914962291718,0.17768828570842743,-0.16514553129673004,-0.13150356709957123,-0.049580223858356476,0.056869179010391235,-0.20410260558128357,0.1754467934370041,0.1263323575258255,-0.10057412832975388,0.10346885025501251,-0.14297690987586975,-0.1266842782497406,-0.042191602289676666,-0.18498173356056213,-0.09720620512962341,-0.10159021615982056,0.09875530004501343,-0.172324538230896,0.14609023928642273,0.0223191250115633,-0.11458329111337662,0.2116927057504654,-0.042931899428367615,0.05215774103999138,-0.018114490434527397,-0.17024561762809753,-0.17759285867214203,-0.07728123664855957,-0.164114311337471,-0.0464976504445076,-0.18628832697868347,-0.07072335481643677,0.047482896596193314,-0.11904782801866531,0.042035967111587524,0.009940470568835735,-0.19354669749736786,0.20874370634555817,0.0023012023884803057,-0.028683165088295937,0.19804930686950684,-0.02057792991399765,0.046554356813430786,-0.11711397767066956,-0.19883057475090027,-0.12042364478111267,-0.02532423473894596,-0.047674212604761124,-0.0369153693318367,0.11737312376499176,-0.11975206434726715,0.20002341270446777,-0.06368206441402435,-0.18778888881206512,0.11048610508441925,0.2119179666042328,0.14632216095924377,0.11989348381757736,0.17194350063800812,-0.01125366147607565,-0.1262357383966446,0.11997538805007935,-0.13179247081279755,0.009905083104968071,-0.16856072843074799,-0.211896613240242,0.15665443241596222,-0.0700790137052536,0.16383370757102966,0.1707705557346344,0.1805778592824936,0.028931643813848495,0.17157821357250214,0.1368681788444519,-0.18548202514648438,0.20309637486934662,-0.18489249050617218,-0.09461426734924316,0.0846061185002327,0.2147437483072281,-0.024082224816083908,0.05832606554031372,-0.02129795216023922,-0.010124714113771915,0.004702090285718441,0.05360468849539757,-0.2059592306613922,-0.10701118409633636,-0.13334813714027405,-0.1442624181509018,0.18393780291080475],[-0.16480377316474915,-0.04047577828168869,0.03682509437203407,-0.014713801443576813,0.032088350504636765,0.05276887118816376,0.0455138199031353,0.18858785927295685,0.17959794402122498,0.08573022484779358,0.055077262222766876,-0.14778558909893036,-0.06276685744524002,-0.04932311177253723,-0.08337393403053284,0.17396806180477142,-0.16149598360061646,-0.10367890447378159,0.059144046157598495,-0.10224992781877518,0.18288765847682953,0.10277018696069717,0.11818844825029373,-0.04901915416121483,0.1956375241279602,-0.07176370173692703,-0.05191393196582794,-0.1635868400335312,0.1489482969045639,-0.07482804358005524,-0.060353219509124756,0.049475912004709244,-0.15236444771289825,0.012443481013178825,0.17938274145126343,0.11845927685499191,-0.03469926863908768,-0.009040748700499535,-0.15204761922359467,-0.0624181292951107,0.10114208608865738,0.2043401598930359,0.19231803715229034,-0.01893623173236847,0.18630367517471313,0.20482832193374634,-0.2051062285900116,-0.13516759872436523,-0.12413781136274338,-0.006270507350564003,0.1620786339044571,0.11852718144655228,-0.0745902881026268,0.025924881920218468,0.15001626312732697,0.14148284494876862,0.19076119363307953,-0.17492398619651794,0.16084560751914978,-0.07350976765155792,0.00857838150113821,-0.06328454613685608,0.026231473311781883,0.04076353833079338,0.12843607366085052,-0.016535593196749687,-0.06560216844081879,0.034671198576688766,0.20374442636966705,0.09607969969511032,-0.07971221953630447,0.10971851646900177,0.08259179443120956,-0.021994642913341522,0.10476493835449219,-0.03491730988025665,0.0968932956457138,-0.13693714141845703,0.21610388159751892,-0.20594199001789093,0.10894723236560822,0.1057407334446907,-0.059316541999578476,-0.14277201890945435,-0.07326778024435043,0.20245112478733063,-0.12910273671150208,-0.1472403109073639,0.08147303760051727,-0.08815008401870728,-0.08124097436666489,-0.17677897214889526,0.17239239811897278,0.1889093518257141,-0.03134646639227867,0.13138101994991302,-0.14095176756381989,0.08964833617210388,0.18043853342533112,0.03622471168637276,-0.08861298859119415,0.2052811235189438,0.1782723069190979,-0.20883634686470032,-0.12893328070640564,0.17775805294513702,0.1721557080745697,-0.07174625992774963,0.1106274276971817,0.17813844978809357,0.14499296247959137,0.12887315452098846,0.06820069998502731,0.02946525812149048,-0.13036306202411652,0.052341219037771225,0.15454496443271637,0.19710318744182587,-0.08517662435770035,-0.07995416969060898,-0.11590903997421265,-0.09674627333879471,0.06873999536037445,-0.02025601826608181,0.07092870026826859,-0.028605369850993156,-0.18711784482002258,-0.08427350223064423],[0.10354399681091309,0.17909187078475952,0.05699186027050018,0.13769367337226868,-0.015146090649068356,0.12977290153503418,0.07602430880069733,-0.16687418520450592,-0.08834655582904816,0.10547049343585968,0.14673104882240295,-0.0016413209959864616,-0.09093894064426422,-0.14567725360393524,0.2109360694885254,0.12885385751724243,0.07601295411586761,0.09694254398345947,-0.13605761528015137,-0.18664921820163727,-0.08614294230937958,-0.15178579092025757,0.19287165999412537,-0.0018161727348342538,0.10129516571760178,0.1528743952512741,-0.11337807774543762,-0.03218154236674309,-0.08020756393671036,0.07326836884021759,-0.12054794281721115,0.0006837219698354602,0.041080642491579056,-0.08878278732299805,-0.09498284012079239,0.12036529183387756,-0.17221684753894806,-0.022436242550611496,0.12519051134586334,-0.11689572781324387,0.07935023307800293,-0.19556231796741486,-0.03567749261856079,-0.17157118022441864,0.159247025847435,0.0033428946044296026,-0.06007574871182442,0.10428961366415024,-0.0744667574763298,0.046175144612789154,-0.0955059677362442,-0.011844944208860397,0.0708429291844368,0.21624653041362762,-0.01274800207465887,-0.07855033129453659,0.18221743404865265,0.18255411088466644,-0.042609188705682755,0.1901642084121704,-0.12011317163705826,0.05878579616546631,-0.09067691117525101,0.14773045480251312,-0.13016332685947418,-0.12645184993743896,0.17715997993946075,-0.20567616820335388,-0.08355101197957993,0.0807502493262291,-0.15876172482967377,0.2292148470878601,0.2090410590171814,-0.16524642705917358,0.050888173282146454,-0.2041119635105133,-0.018496910110116005,-0.04621480032801628,-0.09549576044082642,-0.18794198334217072,-0.0461108572781086,0.11067838221788406,0.10514690726995468,-0.055009875446558,0.03700912743806839,0.14234605431556702,-0.1732664555311203,0.08586250990629196,0.21954457461833954,0.08758006244897842,-0.13978640735149384,0.08649633079767227,-0.18383048474788666,-0.014621204696595669,0.001658867346122861,-0.01159170176833868,0.1031653881072998,0.1345924437046051,0.07959888130426407,-0.024393200874328613,-0.03989466279745102,0.13049043715000153,0.1840616762638092,-0.14732776582241058,0.222898468375206,0.08641290664672852,-0.09417816996574402,-0.1031499058008194,-0.11958049982786179,0.08495648950338364,-0.06033112853765488,0.03710898011922836,-0.10952150821685791,0.05780322849750519,-0.10810746252536774,0.16179534792900085,-0.056299373507499695,-0.11621983349323273,-0.15708346664905548,-0.1491849422454834,0.15626151859760284,-0.1698136031627655,0.20338588953018188,-0.08539771288633347,0.05175689235329628,0.03425123170018196,0.039726369082927704,-0.12884986400604248],[0.0717541053891182,-0.11388534307479858,0.025583889335393906,0.06799791753292084,-0.04671130329370499,-0.1852235198020935,0.03268514201045036,-0.01886160299181938,-0.17866863310337067,-0.04590591788291931,-0.14394336938858032,-0.14106005430221558,-0.07678280025720596,0.10924316942691803,-0.05553418770432472,0.1532762348651886,-0.19018489122390747,0.12697972357273102,0.2220529317855835,-0.007016748655587435,0.034150149673223495,0.20809556543827057,-0.14529317617416382,-0.07788704335689545,0.058417368680238724,0.15979349613189697,-0.19805139303207397,-0.06629043072462082,0.007803561165928841,-0.10054653882980347,0.07554055750370026,0.022274285554885864,0.10328537225723267,-0.126254141330719,-0.06944367289543152,0.07023081928491592,0.07895711809396744,-0.11425167322158813,0.12251639366149902,0.08826059103012085,0.08071645349264145,0.1546214371919632,-0.1631375402212143,0.0689651221036911,-0.032575272023677826,0.1801464855670929,0.07300755381584167,0.2020397037267685,0.1541588306427002,-0.13599416613578796,0.08803755789995193,0.14779363572597504,0.2056252658367157,0.19455258548259735,0.07380558550357819,-0.07596555352210999,-0.09535136818885803,-0.17850874364376068,0.18666787445545197,0.1987290233373642,0.1425386369228363,0.02219187282025814,-0.14207404851913452,0.055895980447530746,-0.018043413758277893,0.14720657467842102,-0.16592884063720703,-0.00026596448151394725,0.09540954977273941,0.12853854894638062,0.18568547070026398,0.15489192306995392,0.026207678020000458,-0.12291676551103592,-0.08328810334205627,-0.08406674861907959,0.1888534426689148,0.1654759645462036,-0.03736265376210213,0.0976250097155571,-0.11700805276632309,0.009202293120324612,-0.12670327723026276,-0.053621288388967514,-0.0643802285194397,-0.13772989809513092,0.13653457164764404,0.10089954733848572,-0.015240569598972797,0.19618849456310272,-0.07657962292432785,-0.10878410190343857,-0.10820925235748291,0.10322443395853043,-0.18870531022548676,-0.17901505529880524,-0.15892896056175232,0.010835672728717327,-0.17550712823867798,0.11565876007080078,-0.1746300309896469,-0.14272673428058624,-0.12145811319351196,0.09326691925525665,-0.015467406250536442,0.1073894202709198,0.04012788459658623,0.06552234292030334,0.021098380908370018,-0.007622310426086187,0.10918045043945312,0.012398370541632175,-0.1551922857761383,-0.166961207985878,0.1901799440383911,-0.11034715175628662,0.21077537536621094,0.18552225828170776,0.12325964868068695,0.20914602279663086,-0.2047404944896698,-0.1305743306875229,0.1839948147535324,0.10814369469881058,-0.11170069873332977,0.19221462309360504,-0.1847611665725708,0.12344080209732056]],"b":[0.009790523909032345,0.008545746095478535,0.008289601653814316,0.01743120513856411,0.015088782645761967]}]}]=]
+layers[2] = {
+    inDim = 128,
+    outDim = 128,
+    activation = "relu",
+    W = {
+        0.026539382, -0.053441916, 0.11922239, 0.034953132, 0.0428135, 0.02621621, 0.111453034, -0.02028498, -0.0134044085, 0.024053885, 0.0781343, -0.03422626, 0.13670388, -0.12682652, 0.14017801, 0.12605833,
+        0.0035748207, -0.14174858, 0.10886635, 0.086101316, 0.032786738, -0.110152, 0.08790726, 0.14177823, -0.14452226, -0.018927766, -0.015380871, 0.061549738, 0.051665634, 0.005800636, 0.12925231, 0.019870812,
+        0.06217944, 0.09146469, 0.13161395, 0.009062953, 0.059928983, -0.110026084, -0.03747215, -0.10872596, 0.025383923, 0.06828013, 0.03898878, 0.07273317, -0.07650654, 0.042977806, -0.1196772, -0.007689857,
+        0.11884679, -0.11809063, 0.012459882, 0.035953324, -0.009548473, -0.010174718, 0.12200726, 0.12674314, -0.027124207, -0.02913687, 0.05990871, 0.05533911, 0.16211563, -0.04838548, -0.072134204, 0.13379769,
+        0.01679741, -0.022695284, -0.10024926, 0.06537284, 0.1045361, 0.078875825, -0.043818623, -0.01206977, -0.09100335, -0.040708315, -0.1452764, 0.0869915, -0.07791452, 0.085451625, 0.059890933, -0.026387902,
+        -0.102908, 0.10395629, -0.11553274, -0.13083358, 0.003089775, -0.14438327, 0.022681292, -0.09250214, -0.011299742, 0.12090196, 0.08182087, -0.11133311, -0.008942564, 0.0470273, 0.12940198, 0.06140687,
+        0.04488588, 0.1390404, 0.11425291, 0.13367511, 0.08820944, -0.081451, 0.13553584, 0.11034147, -0.11011798, 0.107154086, 0.1423119, 0.061073903, 0.05146279, -0.017212283, 0.0016640703, -0.016866608,
+        -0.032573592, 0.10483329, -0.074407905, -0.09529202, 0.1210775, 0.03777808, 0.085103765, 0.14906907, 0.0771005, -0.017146945, 0.09838428, 0.03388126, 0.109692916, -0.08025238, 2.7841917e-05, 0.13572355,
+        0.05878543, -0.13246058, -0.06752262, 0.1063478, -0.06682834, 0.024106579, 0.07426989, -0.14906737, -0.12507513, -0.053251173, 0.054934565, 0.091151446, 0.054663062, -0.07445141, 0.10314949, -0.1456174,
+        -0.09633534, 0.00874329, -0.06870313, 0.027517233, 0.09905101, -0.08781317, 0.07470499, 0.015209148, 0.14037232, 0.07033748, 0.112679094, 0.06677509, -0.067652255, -0.15076284, 0.036800347, 0.010976408,
+        -0.108904175, -0.1433149, -0.106334634, -0.13263972, 0.056249317, 0.025588494, 0.06281426, -0.074795954, -0.048196603, -0.053975996, 0.032955725, 0.09869797, 0.096811995, -0.03169309, -0.11098046, -0.10045331,
+        0.02324429, 0.07149955, 0.096408784, -0.07870795, -0.039195232, 0.0254519, 0.1380043, -0.050153065, -0.048427828, -0.022828475, -0.079323746, 0.1258585, 0.0430355, -0.1175094, -0.053711955, -0.06603438,
+        0.044969104, -0.10621331, 0.14390841, -0.110780425, -0.10518262, -0.13085707, 0.08227507, 0.1476555, 0.14956836, 0.06112447, -0.089044616, -0.0023069028, 0.11267526, -0.037527166, -0.03935831, 0.15322676,
+        0.093417525, -0.08972121, 0.012335491, 0.064934865, -0.0761054, 0.0045154337, -0.07944061, 0.13820706, -0.121633895, 0.06971326, -0.08019439, 0.005729423, -0.093237296, 0.0691862, 0.11321921, 0.117111765,
+        -0.10558089, 0.08622267, -0.004810207, -0.10599309, -0.016367014, 0.121094055, 0.059989024, -0.09828776, 0.02921902, 0.056578387, -0.017398328, 0.025001325, -0.15179725, 0.011062316, -0.11899662, 0.044660877,
+        0.09337211, 0.1436907, -0.09320819, -0.14736387, -0.019542305, -0.06023391, 0.029091414, 0.09416762, 0.076636024, -0.14981647, 0.10947338, 0.04823646, -0.1368847, -0.05977244, -0.03892545, -0.0147273205,
+        -0.019174764, -0.01677593, 0.070970975, 0.042158037, -0.16192411, 0.05628752, 0.10324302, -0.07826802, 0.018053925, -0.037480477, 0.0700235, -0.0110174855, -0.057011284, 0.005067055, -0.004158177, -0.08198491,
+        0.0519919, 0.006819816, 0.038393173, 0.13665979, -0.057331964, 0.14210255, 0.11551856, 0.17271917, 0.11737275, 0.05668193, -0.15892598, -0.09472321, -0.13227043, 0.120942384, -0.053781897, 0.12765618,
+        -0.020038074, -0.049047075, 0.11136607, 0.0034287635, 0.015730282, 0.124442086, -0.07580376, 0.11013062, -0.039163742, 0.14025918, -0.0007340028, 0.12508415, 0.12698032, 0.044356015, 0.15961713, -0.10931845,
+        -0.092470974, -0.101276234, 0.089782715, -0.06492384, -0.04661039, -0.09575969, -0.075251676, -0.09334957, 0.04953572, 0.11421295, 0.10650434, 0.061571553, 0.061372742, 0.08880006, 0.10218532, 0.1164074,
+        -0.06790368, -0.097408615, -0.11355537, -0.04361883, -0.1343221, -0.09785536, -0.1265791, -0.100971244, 0.10734348, -0.01752232, 0.09630234, -0.0008703352, 0.16629341, 0.08657695, 0.03081313, -0.03349034,
+        -0.08193378, 0.024813704, 0.14542603, -0.07663958, -0.122773014, -0.13665089, 0.11597661, -0.13311586, 0.06517275, 0.011510685, -0.021605384, 0.13643602, 0.1492198, -0.025227387, -0.1530846, 0.081967816,
+        0.15839083, 0.1115767, -0.07146231, 0.03682351, 0.07086214, 0.14331102, 0.130389, -0.1016086, 0.0011510425, 0.11822071, -0.11623337, 0.029982207, 0.11389311, -0.030763758, 0.018749872, 0.118805,
+        -0.08138717, -0.00019088722, -0.08725118, -0.019317418, -0.04161015, -0.14153391, -0.014805192, -0.097394265, 0.08652226, -0.14206241, 0.041432314, 0.097065754, -0.13738656, 0.12754296, 0.08114227, -0.0047382456,
+        -0.054829936, -0.10254395, 0.016135003, -0.1356995, -0.12391868, 0.056066953, 0.13505486, 0.035116713, -0.020766351, -0.05144301, 0.064252906, -0.14429455, 0.05212424, 0.13668957, -0.0872223, 0.12915672,
+        0.007829026, -0.033214916, -0.123452164, 0.15209045, 0.12141577, 0.00023469681, -0.14297016, 0.056275874, 0.10040495, 0.08803722, -0.13147186, 0.008018715, 0.12236597, -0.08577475, 0.14469256, 0.14445846,
+        0.005687261, -0.12251005, 0.011214038, 0.09889879, -0.09122533, 0.0005570258, 0.025067285, 0.06369026, 0.09948516, 0.15224853, 0.07058522, -0.059669424, 0.12629567, -0.053334128, 0.005866693, -0.09897729,
+        -0.01970165, 0.13989711, -0.0127852885, -0.018235063, 0.021158764, -0.09683694, 0.00060364354, -0.06021609, -0.07045944, 0.14848638, 0.008679531, -0.08560909, 0.012103206, 0.12953587, 0.08584058, -0.035836197,
+        0.07189643, 0.11908909, 0.13510424, -0.013920735, -0.08868704, 0.016252719, 0.13436796, -0.027628329, -0.098079786, 0.10157047, 0.017722728, -0.018723954, -0.0629145, 0.09296192, 0.1466559, 0.0534292,
+        0.010396983, 0.07649741, -0.12961698, 0.07750363, -0.014359951, -0.035613406, 0.057464685, -0.058785394, -0.047465637, -0.12621108, 0.0045598387, -0.010447945, 0.1366098, 0.06572476, 0.09779947, 0.09941648,
+        -0.0902095, -0.11376068, 0.08033099, -0.079241835, -0.08859036, -0.13438198, 0.11128871, 0.059643194, -0.10808769, -0.051971957, 0.010149684, -0.0462089, 0.14620455, -0.13647337, 0.109508105, 0.09453703,
+        -0.032897335, -0.10901162, -0.11689782, -0.11505759, -0.022690738, -0.0025588449, 0.11041881, -0.025542604, -0.12045, -0.08845493, 0.13744247, 0.134935, -0.058920536, -0.0024054407, 0.10391535, 0.10008271,
+        -0.059581116, 0.0041437023, 0.058579385, -0.07142828, 0.040791154, -0.13429585, 0.01465964, -0.1570048, -0.056198083, 0.1284158, 0.058931906, -0.12602584, 0.1288979, 0.082067885, 0.113374785, 0.035747528,
+        0.14268956, 0.14175887, -0.031684555, -0.033214886, 0.07631979, -0.04439885, 0.14316057, 0.13560288, -0.061109908, -0.0076650134, -0.11517134, 0.041011516, -0.111358285, -0.08326062, -0.02235904, -0.08639778,
+        0.08827026, -0.096558504, -0.12442364, 0.0060393633, -0.102812104, 0.13643244, -0.07936857, -0.008135359, 0.0983347, 0.00041616385, 0.108251035, 0.13252173, 0.024807336, -0.040157016, 0.056561794, -0.115092464,
+        -0.05853467, 0.10626923, -0.024081916, -0.12453753, 0.05484224, 0.055977713, 0.028903201, 0.017135447, 0.101394005, -0.11428625, 0.07001281, 0.09899801, -0.091858946, 0.06947645, -0.109496005, 0.007460445,
+        -0.050837267, -0.029533142, -0.06545461, 0.11093369, 0.108821236, -0.14788596, -0.017874183, 0.15207417, 0.00023213151, 0.15439624, 0.03714145, -0.028805276, -0.03093007, 0.061301894, -0.12658976, -0.106561504,
+        -0.07884212, -0.14675623, 0.02139932, 0.080118105, -0.1194329, -0.12094484, 0.06665423, 0.12739699, -0.010606025, -0.13386704, 0.110044256, -0.14718476, 0.027172728, 0.15693721, 0.06983502, 0.028548544,
+        0.042517494, -0.032603938, -0.1499336, 0.14358129, 0.11671236, 0.057346456, -0.07543684, 0.09097059, -0.03920356, 0.09560949, 0.09832962, -0.025788054, -0.0640109, 0.02640099, 0.11739124, -0.11486908,
+        0.05247908, -0.15636949, -0.114691466, -0.0056277676, 0.12058701, -0.03355783, 0.15322332, -0.12429229, 0.13471411, 0.08129173, 0.088015266, 0.078048326, -0.12966463, -0.15894096, -0.035424005, 0.11033334,
+        0.00083090976, 0.05393366, -0.05330476, -0.02240094, -0.14312445, -0.10598095, -0.087169036, 0.15315197, -0.13459423, 0.075757235, 0.04577312, -0.0026845757, -0.11517975, -0.08237318, 0.06712144, -0.023314752,
+        0.07880852, 0.051722273, -0.075860426, 0.15514949, -0.058099315, 0.13245717, -0.0041925833, -0.039089154, 0.006892424, -0.037103146, 0.0043750284, -0.068651944, 0.09469283, -0.018536096, -0.072941154, -0.111541,
+        -0.14204602, 0.07201467, 0.12652266, 0.095386334, 0.038476277, -0.071923025, 0.110438, -0.111078866, -0.08834407, 0.15699218, -0.02454244, 0.14601967, -0.039016716, 0.0053737485, 0.119701944, -0.034460273,
+        0.1258078, -0.11930371, -0.063679956, -0.025256027, -0.08266321, -0.13162717, -0.01450776, -0.063633285, 0.078170545, -0.12044581, -0.0032261715, 0.14612924, -0.10086489, 0.15153497, -0.11989267, 0.10651232,
+        -0.12592061, 0.110059164, 0.15945923, -0.05735043, -0.09706463, 0.00061942416, 0.12574853, 0.11023283, -0.05407256, -0.1302177, -0.12701593, -0.044440288, 0.12664825, 0.10013949, 0.12910984, 0.12011736,
+        0.06109786, -0.06537883, -0.084934086, -0.06129247, -0.13695104, -0.043457784, -0.038076688, 0.07897394, 0.12370067, 0.13323924, -0.15480885, -0.068640426, -0.010619753, -0.12912796, 0.022764957, 0.045141,
+        -0.10062941, -0.0028716833, 0.10365098, -0.13382164, -0.04463671, 0.1280712, 0.035146147, -0.14110507, 0.0624687, 0.081735276, 0.10912633, 0.03180569, -0.07029424, -0.06903349, -0.11458874, 0.08852693,
+        0.10595148, 0.09942678, 0.10055132, 0.02960328, 0.046024136, 0.0924521, 0.14356834, 0.08124606, 0.12706909, 0.020539401, 0.08833602, 0.04722624, 0.13279076, 0.10216096, 0.09119189, -0.10010803,
+        0.0013573528, -0.13858059, 0.037026986, 0.1317702, 0.032271635, -0.10378137, -0.14229594, 0.08564898, -0.026518324, 0.029866338, -0.036620293, 0.10092364, -0.01721325, 0.1529561, -0.12091152, -0.13499704,
+        0.045040146, -0.034546584, -0.14448002, 0.053187683, -0.05468823, 0.14673148, -0.11315533, 0.106804565, 0.08662522, 0.12759924, 0.09681252, -0.11457894, -0.081679106, -0.1118049, 0.05541476, -0.10324911,
+        0.0718289, -0.028827427, -0.06971899, -0.018782692, 0.14556581, 0.023878222, -0.018401446, 0.04994609, 0.021358237, -0.013373514, -0.04983708, 0.016811235, 0.05697716, 0.0014185602, -0.0936404, -0.1269534,
+        0.036747385, -0.13695318, -0.088275634, -0.13904184, -0.054895785, -0.09113843, 0.079656154, -0.08649888, 0.029552717, -0.08561429, 0.03342801, -0.12724149, -0.0037335872, -0.047855116, 0.07779316, -0.050755706,
+        0.07801451, 0.014860867, 0.0332284, 0.080976106, -0.07100723, 0.00783492, 0.15600102, -0.0010234435, 0.037422027, -0.12398964, 0.092812546, -0.05978758, -0.14214413, 0.0056408113, -0.08535991, 0.13261054,
+        -0.09948341, -0.124956064, 0.08935464, -0.047842845, 0.131558, -0.052922532, 0.068855606, -0.09725595, -0.11384009, -0.015228572, 0.07313645, -0.080601946, 0.057764135, -0.11611296, -0.058999382, -0.0030236489,
+        -0.08952607, 0.075960234, 0.136968, 0.14472105, 0.055685934, 0.029292045, -0.06882515, 0.09117976, -0.019177498, 0.004399113, -0.02477907, -0.03269756, 0.039998874, -0.08904983, 0.029894426, -0.13605864,
+        0.114818156, -0.028902039, 0.15345277, 0.08729869, 0.047201585, 0.09647787, -0.10359211, 0.061376985, 0.027744662, -0.16097707, 0.021547344, 0.15007724, 0.035071854, 0.11938728, -0.12548953, 0.11650454,
+        -0.08491681, 0.01909435, 0.041994877, -0.14083806, -0.15763205, -0.047412883, 0.12054146, 0.13182357, 0.09537209, 0.12567592, -0.1248146, 0.010351559, -0.11876596, 0.0764102, -0.09686389, -0.08814855,
+        0.16594844, -0.0967413, 0.031720467, 0.13778597, -0.010213497, -0.0043866043, -0.0642407, 0.029145975, 0.014662213, -0.06509021, -0.06605243, 0.026712287, -0.05916074, -0.119159624, -0.062867224, 0.07769385,
+        -0.12179935, -0.113797665, -0.048150863, 0.13331564, -0.15059608, 0.08157097, -0.11008464, 0.021607585, 0.14122735, -0.062026512, 0.07155943, 0.02528347, -0.13084431, -0.11533521, -0.017350566, -0.14371428,
+        -0.09816902, 0.08617649, 0.09948266, -0.14064094, -0.09213288, 0.050328057, -0.0862241, -0.12354238, 0.10649969, 0.111416444, -0.015177591, 0.044406686, 0.10416101, -0.14646971, 0.024985116, -0.004380062,
+        -0.118082255, 0.07430696, -0.12903562, -0.06748093, 0.12275214, -0.040934302, 0.055461325, -0.12563668, -0.0946428, 0.00088480633, -0.15006544, 0.09242506, 0.10517096, 0.14612928, -0.14075279, -0.09281335,
+        -0.0205626, -0.07566922, 0.14402783, 0.06648413, -0.149177, -0.08043149, 0.0020231802, 0.06792637, 0.12418537, -0.110198095, -0.0037197953, -0.1263096, 0.0008574172, -0.019672895, -0.14319003, -0.09943389,
+        -0.13440084, -0.047317944, -0.095979534, -0.15641354, 0.05226147, 0.02847611, 0.1309685, 0.022405876, 0.08325173, 0.083301105, -0.10603293, 0.07662385, -0.09768934, -0.043613464, 0.04113956, 0.12782913,
+        0.0932069, 0.10803251, 0.095823966, 0.0020586608, 0.014571279, 0.010826127, 0.1498636, 0.09516163, 0.13651486, -0.097625606, 0.103223465, -0.07912448, 0.035044245, 0.06219146, -0.067561276, -0.07184229,
+        -0.10178892, 0.0065616528, 0.072642505, -0.042172033, 0.045794617, -0.06222311, -0.14744619, -0.0625999, 0.14272192, -0.080604695, 0.089154996, 0.06789841, 0.08654353, -0.026663097, -0.017154364, -0.08944905,
+        0.12484392, 0.1395703, -0.018642329, 0.08978808, 0.07096521, 0.088430315, 0.05147374, 0.11800508, -0.020770919, -0.1201266, 0.049018465, 0.0007978397, -0.08752813, -0.06347972, 0.09775593, -0.050724875,
+        -0.12171262, -0.024596076, -0.147167, 0.10820083, 0.099862754, 0.14586115, -0.13734001, 0.0022985511, 0.08786159, 0.07104736, 0.009778701, 0.14142354, 0.07170253, 0.02434276, -0.12175055, -0.01964946,
+        -0.008374661, -0.000836151, 0.13325371, -0.055120368, 0.111857, 0.03123762, -0.027537793, -0.15442097, 0.013621698, -0.017918924, -0.02309941, -0.03373512, -0.11063622, -0.029587584, 0.13244803, 0.0739187,
+        0.12648837, -0.115018345, -0.039727163, 0.01862245, -0.11845684, 0.060243495, 0.024925446, 0.087431766, -0.09913174, 0.071445696, -0.020914631, 0.001982594, -0.04356386, -0.121073626, -0.0029476583, 0.014026637,
+        0.09796208, 0.14546213, 0.024134878, -0.0847118, 0.1451428, 0.11042938, 0.10075225, 0.09216494, -0.029139772, 0.06641938, 0.008473699, 0.1074919, 0.08704749, -0.0014960176, 0.15585929, -0.09158808,
+        0.09758716, 0.13014342, 0.04347112, 0.082897335, 0.072877094, 0.14700764, -0.049485352, -0.076098, 0.11212939, 0.12671046, -0.018620454, -0.032893363, -0.0025981478, 0.11693623, 0.10859379, 0.015946068,
+        0.08652196, 0.10837213, 0.14982893, 0.0988753, 0.09286439, -0.10259429, 0.1386322, 0.14729756, 0.13381112, -0.13053335, 0.11066, -0.14678244, -0.031420622, -0.14255278, -0.03338948, -0.015322417,
+        0.05384496, 0.14586756, -0.006057985, 0.07388792, 0.07675084, 0.100070834, 0.119338855, -0.09345201, -0.04167826, -0.096546076, -0.07117478, 0.14033355, 0.09973777, 0.06281175, 0.09803039, 0.028410366,
+        0.067278154, -0.1380151, -0.048231453, -0.046609186, 0.09252259, 0.084748216, -0.1283302, 0.07417478, 0.060569204, -0.1473188, 0.030308222, -0.020210523, -0.057680123, 0.0825655, 0.07665575, -0.13982148,
+        -0.03813115, -0.06373207, -0.09415691, -0.1298135, -0.081891865, -0.09822923, -0.12871064, -0.04424241, -0.041060895, 0.102369264, -0.1192332, -0.10163249, -0.039833553, -0.009885733, -0.010892647, 0.08712263,
+        0.006697807, -0.057463992, -0.11801113, -0.08427918, 0.0885135, 0.031240884, 0.071147, 0.115423664, 0.07385632, -0.1230511, -0.1445014, -0.028234202, -0.09451851, -0.07819127, 0.058436982, -0.061274298,
+        -0.041045975, -0.004552192, -0.12853104, -0.07644076, 0.11656631, 0.13343674, -0.09688726, 0.07612405, 0.14788093, 0.12077317, -0.1141552, 0.023863887, 0.123320185, -0.1324495, 0.005709834, 0.13264821,
+        -0.052465748, -0.12801215, 0.013469853, -0.11331592, -0.051950924, 0.15355758, 0.14807445, 0.08458888, 0.013334183, 0.14852703, 0.0026079426, 0.094233446, -0.03588355, 0.0015311668, -0.11155168, -0.08553716,
+        0.09476053, 0.015886534, 0.056705542, 0.1496187, 0.1352015, 0.08575823, -0.049247973, 0.07349169, -0.071773, -0.054458518, -0.08394496, -0.13369936, -0.077106796, -0.015775468, 0.05287854, -0.14252573,
+        0.14965816, 0.14596978, 0.035558015, -0.1267685, 0.12937003, -0.10991231, -0.059851214, -0.063600406, 0.04798188, 0.15504102, 0.12707594, -0.0646136, 0.0025442077, 0.020655239, -0.13646324, 0.12663475,
+        -0.10207353, 0.012082708, -0.07533907, -0.022057245, -0.09025167, 0.028977616, 0.10693856, -0.050675746, 0.035319373, 0.1272009, 0.0031192785, 0.036170974, -0.08346003, 0.07667513, 0.0017118424, -0.12522516,
+        -0.08578752, -0.038756397, 0.039494857, -0.14343005, 0.12289923, -0.07570911, 0.08265272, 0.121026695, -0.027581232, -0.14957348, 0.16056207, 0.08586867, 0.13749869, 0.029867481, -0.06581929, -0.064643145,
+        -0.0141090015, -0.04394744, -0.056794275, 0.000857029, -0.13551728, -0.09112907, -0.15235002, 0.038936857, 0.035981383, 0.115376815, 0.02304817, 0.13273607, 0.011758253, 0.06709048, 0.13216038, 0.08543164,
+        -0.15399863, 0.046470366, -0.019538514, -0.09325151, 0.0727338, 0.035063323, -0.12996818, 0.13641536, 0.08755902, 0.10897478, -0.02425242, 0.055535235, -0.049421515, 0.050487436, -0.044523668, 0.072594464,
+        -0.063412875, 0.07765219, 0.11096982, 0.13671328, -0.014422109, 0.13224429, -0.12592627, 0.013428885, 0.034863044, -0.092524685, -0.029132985, -0.12930073, -0.015758434, 0.019342257, -0.11601894, -0.030766385,
+        -0.008821968, 0.06500154, -0.08369301, -0.08729681, -0.14765961, 0.048722863, 0.030657716, 0.024354275, 0.089846246, -0.09362466, -0.12953214, 0.13358295, 0.09392993, 0.112163365, -0.074497595, -0.12472791,
+        0.059373643, -0.03990822, -0.0053972835, 0.039678782, -0.1454613, -0.0888093, -0.113177344, -0.0912563, 0.12667124, 0.09959956, -0.13747063, 0.058389887, 0.05203174, -0.15715992, -0.046731677, -0.020940281,
+        0.13224214, 0.04733386, -0.03809814, 0.0155952135, -0.09719352, -0.11542222, 0.053565208, -0.11400816, -0.056853324, 0.12621777, 0.14811404, 0.123971544, 0.08369827, -0.046502214, 0.12831439, -0.06688931,
+        -0.046017446, 0.051676814, -0.09256297, 0.07979374, -0.05371032, 0.016429245, -0.09471233, -0.12973124, 0.15384735, -0.0018911707, -0.0026660524, -0.036106776, -0.03462471, -0.007339402, 0.09425078, -0.13919498,
+        -0.059095573, -0.15278703, 0.047165383, -0.0929732, -0.008367643, 0.079787314, 0.008167081, -0.06758054, -0.06190282, -0.09570679, 0.01487401, 0.04471263, 0.11965353, -0.0069887317, -0.012007159, 0.016935775,
+        -0.041350074, -0.11441412, -0.10842259, -0.069971114, -0.090996936, 0.11503436, 0.13303953, -0.10881672, 0.1328444, 0.1444137, -0.022095423, 0.13488562, -0.0768412, 0.13646862, -0.0029910814, 0.09412322,
+        0.072296575, 0.023152301, 0.13230969, -0.01172857, -0.09729979, 0.07399632, 0.07032539, -0.06072174, -0.07221499, 0.100804366, 0.117333025, -0.15676583, 0.116138056, -0.08673197, -0.005171224, -0.024241464,
+        -0.0959871, 0.05343502, -0.0889313, 0.039329655, -0.090994164, 0.022797098, -0.1474565, -0.037065245, -0.12360804, -0.123250045, 0.06838085, 0.05210981, 0.14585286, 0.10816982, -0.13098095, -0.08805215,
+        0.019530116, -0.058508653, 0.078991964, 0.12921834, 0.12971741, -0.10376534, -0.0414337, 0.084093206, -0.10265618, -0.08858084, -0.109624125, -0.044924945, -0.08631732, 0.035779104, -0.08290684, -0.1600791,
+        -0.13177764, 0.04231334, 0.08919722, 0.026382186, 0.009446414, 0.08127659, -0.068009324, 0.11435176, -0.05896718, 0.0968068, -0.026086804, 0.11914561, 0.1263003, 0.11616182, 0.1307876, 0.08579666,
+        -0.12737873, -0.10206555, 0.09454971, -0.050045535, -0.11866835, 0.08339613, -0.14591224, -0.00956313, -0.15624112, -0.08573719, -0.044982783, -0.071153484, 0.12365808, 0.06974551, 0.12786175, -0.0012065957,
+        0.109027304, -0.15833543, 0.0121730715, 0.09460883, 0.12330615, -0.10145611, -0.06721662, 0.09470604, 0.10088569, 0.13981026, -0.13827245, 0.06793303, -0.14674392, 0.033806786, -0.11744229, 0.10059398,
+        -0.15286118, 0.021212596, -0.14121726, 0.07397235, -0.0028363632, 0.0929563, -0.009322896, 0.086049534, -0.08901361, 0.10915493, 0.13116455, -0.11646878, -0.070620894, -0.067151874, 0.027211636, 0.12373274,
+        0.054504074, 0.06002425, 0.02701257, 0.111777745, 0.079216205, -0.12537439, -0.13843593, 0.15510286, -0.038687468, 0.11269333, -0.103111, -0.05200905, -0.089438446, -0.047499776, 0.034577362, -0.049760576,
+        -0.047895603, 0.13822702, -0.1459665, 0.07172036, -0.0021117686, 0.026763687, 0.08734835, -0.093877204, -0.014943138, -0.12243268, -0.12524848, -0.0950856, -0.034064434, 0.13211226, -0.00058901025, 0.02012848,
+        -0.0022166334, 0.05052558, -0.10019116, 0.062526874, -0.086309925, 0.015834847, 0.06127671, -0.14494076, 0.038047105, -0.07226527, 0.1411458, -0.027862318, 0.08996729, 0.04314985, 0.114426725, -0.05821355,
+        0.114803284, -0.1169989, -0.031362653, -0.07983693, 0.0040055076, -0.06006216, -0.011126622, 0.14910671, 0.10730572, -0.16285743, 0.018194115, 0.10543152, 0.094258964, 0.015739497, 0.011477666, -0.014450498,
+        -0.102267444, -0.10510041, -0.059468474, -0.06998994, -0.15173818, -0.09391283, -0.056931388, -0.090163544, 0.057730656, -0.08044425, -0.061408706, -0.113368176, -0.12884372, -0.0796162, 0.09751548, 0.074115105,
+        -0.1510755, 0.041971046, -0.16001174, -0.06388601, 0.008135786, 0.07942327, -0.03460683, -0.12505254, -0.12700924, -0.13454363, -0.1120108, -0.10308207, 0.13316688, -0.116820656, -0.14568028, 0.014343624,
+        0.07524109, -0.14229974, 0.14902492, -0.066179134, 0.06606323, 0.07758967, 0.059212755, 0.018934306, -0.15621783, -0.13435988, -0.041820005, 0.066098966, -0.0034129233, 0.044537574, -0.039514143, -0.12695305,
+        0.03735761, 0.1070593, 0.063316606, 0.11814045, 0.027300183, -0.049409077, 0.005625006, -0.11901398, 0.10922606, 0.096505515, -0.013918876, 0.007658071, 0.10839299, 0.07508338, 0.038644966, -0.033823147,
+        0.110359676, -0.12947477, 0.13397224, 0.0048265774, 0.09798448, 0.11350039, -0.04927302, -0.04006705, -0.14643188, 0.124058224, -0.012028136, 0.13220707, -0.12979105, -0.011218941, 0.028027663, -0.060149826,
+        -0.1270874, -0.034198098, 0.07266037, -0.048465945, 0.00076416455, -0.129697, -0.019957751, -0.13660595, -0.014913082, 0.112710334, 0.04197219, 0.074485034, -0.011638516, -0.009333327, 0.09538664, -0.039994266,
+        -0.0051343483, -0.029776044, 0.047162745, 0.029870443, 0.10675515, -0.047225296, 0.13632947, -0.11167895, 0.14117777, 0.12749965, -0.10150688, -0.081683345, -0.06766889, -0.015365032, 0.123747416, -0.00061383465,
+        0.09766166, -0.098907866, -0.08626449, 0.14448017, 0.08526524, 0.0022021118, 0.0006431589, 0.0010730177, -0.04490907, -0.10246906, -0.001986415, 0.08343181, 0.048799507, -0.08762823, 0.082436055, -0.06901307,
+        0.02800263, 0.14648077, -0.02488998, -0.09800297, -0.08144228, -0.0875691, 0.09912212, 0.13230044, -0.017308343, -0.13686804, 0.16537726, -0.1300428, -0.11374187, 0.016953064, 0.008551658, -0.14555873,
+        0.09459864, -0.0006001502, -0.08813945, -0.00042816196, 0.13056865, -0.050226357, -0.06455627, -0.05276524, -0.071159735, 0.12609647, -0.10105927, -0.04819704, -0.14008823, 0.11629895, -0.11762542, 0.09488133,
+        0.116065025, 0.09881171, 0.02488221, 0.115728594, 0.08075471, 0.09334415, 0.10742112, -0.13980298, -0.03022904, -0.014643333, 0.14842793, -0.018961063, 0.02816812, -0.017091423, 0.148326, -0.006074111,
+        -0.09719136, 0.010531909, 0.059864745, -0.06349808, -0.09070538, 0.047555458, 0.13801327, -0.0386388, 0.07264379, 0.05775217, -0.12243618, 0.15778635, 0.12610114, 0.028935667, 0.12864621, -0.12316724,
+        0.13512476, -0.01510713, 0.14966947, -0.06610685, 0.0712173, -0.081529476, -0.040496454, 0.1574783, -0.027352296, -0.026639989, -0.101985484, 0.1267153, -0.14662473, 0.0021828313, -0.12532824, 0.13027178,
+        -0.009644705, 0.13522027, 0.111296564, -0.09356721, -0.096456446, 0.034389354, -0.074651666, 0.08921298, -0.10363327, -0.12543593, 0.054203257, -0.053086806, -0.07183182, 0.0327808, 0.049998574, 0.09395924,
+        0.08354587, -0.10159718, 0.05303582, 0.14007188, 0.040209193, -0.0482535, -0.031975724, 0.07473345, -0.12328051, -0.09170325, -0.12560388, -0.061299138, 0.036562618, -0.042466458, -0.077384435, 0.0046594343,
+        0.06966972, -0.14269207, 0.07785375, 0.12854089, 0.16045418, -0.06562197, -0.000583333, 0.04159513, 0.13455608, 0.054088082, 0.048056703, 0.062581986, 0.027333055, -0.02704692, 0.031965014, -0.03515755,
+        0.09767898, -0.099347055, -0.057120655, -0.06445544, 0.07033322, 0.0137066, 0.020285012, -0.07528808, 0.101965055, -0.14081798, 0.13027193, 0.14557172, -0.12961891, -0.14921162, -0.0065539484, 0.10555689,
+        -0.14426647, 0.04267276, 0.11967297, -0.0097888345, -0.07283862, -0.03848932, -0.015367625, -0.042653937, 0.048697848, -0.12977463, -0.016731018, 0.045293204, 0.13807422, -0.11353814, 0.035843596, -0.0578976,
+        0.06320523, -0.12198499, -0.108303964, -0.07085012, 0.0018326922, -0.09450134, 0.08743803, 0.050148726, -0.09227582, 0.045079097, -0.014958926, 0.12570214, 0.051141802, -0.14353575, -0.0032958728, -0.12606224,
+        0.11398179, 0.024541736, 0.13752267, 0.121620774, -0.034159523, 0.16542809, -0.025981762, 0.099321306, 0.076999955, -0.099155575, -0.031586245, 0.11407193, 0.12906143, -0.12670623, 0.05076642, 0.16919804,
+        0.1558973, 0.08210064, 0.023460336, -0.13195652, -0.12082703, -0.018489925, -0.10658146, -0.029255448, 0.06635078, -0.0501799, -0.12694307, 0.011431441, 0.075046405, 0.038130265, 0.016131857, 0.06915467,
+        -0.048794318, 0.0936098, -0.017742198, -0.048978746, -0.12845252, 0.046888053, -0.046812646, 0.07578923, -0.08769328, 0.003545292, 0.019828195, -0.050333366, 0.14304458, 0.10392503, -0.013161086, -0.051320467,
+        -0.016696965, 0.034174815, -0.066621594, -0.050159745, -0.019891275, -0.100818545, -0.0009661175, -0.06425164, 0.07467459, 0.07987231, -0.044645045, -0.12939289, 0.11276857, 0.0004502304, 0.059605695, 0.1321229,
+        -0.13341953, -0.12434472, 0.10337811, 0.13738173, 0.06961778, 0.055201747, 0.055482425, 0.06101383, -0.061936837, 0.08905886, 0.10963713, 0.16836508, 0.11773142, -0.1140596, -0.10563241, 0.1220156,
+        0.123933226, 0.09782518, -0.13687776, -0.1068101, -0.008534469, 0.111049876, 0.0010631067, 0.1526039, -0.031221176, -0.12861145, 0.17185262, -0.053951435, -0.11789479, -0.024957083, 0.040752303, 0.14113738,
+        0.026101513, -0.019484393, 0.011047638, -0.12643372, -0.14795686, -0.0037266742, 0.04452602, -0.13493639, -0.11291993, -0.06697029, -0.1354923, -0.1072925, -0.029321618, -0.0167804, 0.07763335, 0.012833956,
+        0.12653217, 0.019601772, 0.05488826, 0.14596777, -0.069412544, -0.07955635, 0.057805285, 0.12472791, 0.091988735, 0.010830062, 0.016677245, 0.14528556, -0.051677812, 0.10186646, 0.12680757, 0.029631335,
+        -0.010029741, 0.038707104, -0.036343005, 0.0872647, -0.11301779, 0.06260215, 0.028752645, 0.10337738, 0.011278255, -0.11414425, -0.07202102, 0.086291626, -0.10643509, 0.015502965, 0.022253102, 0.09604285,
+        -0.068900235, -0.10189383, 0.10350658, 0.059324738, 0.12645355, 0.083909124, -0.09958095, -0.099012814, -0.08192784, -0.08115069, 0.090583265, -0.13876858, 0.12480128, 0.0969822, 0.10619791, -0.00525201,
+        0.055553764, -0.13580965, -0.040870782, 0.0053480887, 0.004189522, -0.14695197, -0.07002503, -0.03141546, 0.12610172, 0.06722645, -0.12546918, -0.0034405892, 0.04111128, -0.04129082, -0.078756645, -0.046453793,
+        -0.044458915, 0.107486375, 0.022856036, -0.11913924, 0.12622836, -0.011180514, 0.11938961, 0.12625107, -0.019916255, -0.08870025, 0.05827271, 0.025613802, 0.11996133, 0.045078676, 0.037708137, -0.11984742,
+        -0.042072337, 0.017966222, 0.14195618, -0.1374189, -0.097047016, 0.08603745, 0.12134936, 0.026539253, 0.07916052, -0.06517875, 0.116320215, -0.11095846, 0.1389867, -0.013117102, 0.06125616, -0.11389298,
+        -0.13920726, -0.020443788, -0.0360734, 0.0333009, -0.10952926, 0.16779761, 0.052979115, -0.030468848, 0.080309965, 0.07276001, 0.08641305, 0.08368789, 0.15063393, 0.072041795, -0.1241583, -0.06881653,
+        0.01282654, -0.044233184, -0.094684616, 0.12797041, 0.08695336, -0.0838602, -0.085296184, 0.13622417, -0.13183717, -0.13989621, -0.13324794, -0.1099178, -0.074284166, -0.10711737, -0.030054849, 0.019003224,
+        0.10327881, 0.13597122, -0.09488661, 0.078399904, -0.020107884, -0.120072596, -0.122419916, 0.023564378, -0.056353197, 0.02271599, 0.11445947, 0.0018671006, -0.033166647, 0.112612195, -0.12723778, -0.08373412,
+        1.205927e-05, -0.0229238, -0.05094577, 0.0039413753, 0.037915338, 0.05954813, -0.08731822, 0.13155806, -0.04197257, -0.008178838, 0.09804834, -0.04313482, 0.051056944, -0.09342096, -0.1185042, -0.04077281,
+        0.03297039, 0.16187687, 0.13154536, 0.105598986, -0.0068339114, -0.04433684, -0.0636359, 0.065718904, 0.04097473, -0.073275, 0.065862186, -0.13666853, -0.12530339, -0.08858692, 0.084005296, -0.0009825962,
+        -0.0100561185, 0.07122877, -0.10335287, 0.14907259, -0.02109014, 0.08369864, -0.057405885, 0.10345698, 0.13058168, 0.047009956, -0.0520081, 0.12499126, 0.16183865, 0.07302382, -0.11095276, -0.11549059,
+        0.11567911, 0.052210245, -0.029955307, 0.15650918, -0.022293089, 0.10950554, -0.06450082, 0.051175974, -0.055052, -0.10222834, -0.13283783, -0.059361193, 0.11155256, -0.048156578, 0.08960595, -0.030824048,
+        0.019045874, -0.015043401, -0.087699056, -0.06908833, -0.06552957, -0.042767916, -0.019673144, 0.15768346, -0.01520922, 0.036377113, -0.09836566, -0.077126525, 0.1076076, -0.053422477, -0.09912701, -0.056755718,
+        -0.07993858, -0.08739437, -0.12697259, 0.13632457, 4.2887787e-05, 0.09797141, 0.050074298, -0.039465148, 0.11456275, -0.14085157, -0.10058447, -0.100067385, -0.040153902, -0.10253164, -0.033318903, -0.051418144,
+        -0.006380991, -0.007152548, 0.090476215, 0.08725039, 0.07310241, -0.10097608, 0.13845026, 0.055954915, -0.10060861, -0.011129355, -0.009506011, -0.1001722, -0.08152298, -0.042946216, 0.07904664, -0.06588536,
+        0.10228766, -0.13048671, -0.08550678, 0.023345884, 0.09316127, -0.07611383, 0.111766264, -0.13297887, 0.086347245, 0.0016677519, -0.042740002, -0.11634017, 0.013991962, -0.13225193, -0.095349036, -0.058180016,
+        0.16400377, 0.02341255, -0.14072742, 0.111998156, 3.8488204e-05, 0.067474976, 0.08604929, -0.0519683, -0.09574602, -0.06980609, -0.007613721, -0.10304072, 0.11616142, -0.12965013, 0.0048171394, 0.13661252,
+        -0.11282617, -0.077600494, 0.08726928, 0.08655094, -0.029721214, -0.10520345, 0.06683769, -0.024095798, 0.04323428, -0.12259202, 0.03142294, 0.13060027, 0.041938744, 0.085080415, 0.15597804, 0.042412125,
+        0.03235462, -0.120549604, 0.0116780335, -0.052880764, -0.10800186, 0.032910008, -0.090260044, -0.0776747, -0.09804162, 0.1357352, -0.0914773, 0.1498536, 0.1184377, 0.11324368, 0.11838994, 0.106959164,
+        0.10774727, 0.16697139, -0.011504851, 0.08285491, 0.156553, 0.0925265, -0.081545234, 0.028650744, -0.05357615, -0.13330412, 0.030126855, 0.04706573, 0.020237667, -0.10139296, 0.10200625, -0.0063960254,
+        0.027618624, 0.059760626, 0.00891838, 0.083021134, -0.071395956, 0.093754455, -0.11806417, 0.04776546, -0.09055219, 0.07677835, 0.03468671, -0.010466543, -0.034149054, -0.015984593, -0.025091946, -0.06587851,
+        -0.06344197, 0.11378888, 0.1084449, 0.031062424, 0.02647425, -0.08089902, 0.062621124, -0.0043564513, -0.007968009, -0.09716974, -0.11745548, 0.032394234, 0.028913356, 0.02433429, -0.095279895, 0.072590604,
+        0.13500164, 0.052365705, -0.0030532442, -0.13146073, -0.00586629, -0.10634864, 0.08259169, -0.053856768, 0.13383111, -0.10854339, 0.037904605, -0.023263887, -0.03739502, -0.088572495, 0.06561123, 0.12459639,
+        -0.15089853, -0.07268487, -0.05075098, -0.147713, -0.110069536, -0.11400032, 0.0707136, -0.059320215, 0.010831593, 0.09414404, 0.034284294, 0.13628928, 0.04465402, 0.077421166, 0.0865017, 0.12345922,
+        -0.035395525, -0.10970664, -0.15227288, -0.109139815, 0.13081184, -0.15542597, -0.11546951, -0.1652539, 0.0065126307, -0.13952295, 0.06450591, 0.086578935, -0.13150495, -0.038409036, 0.025530694, -0.09863085,
+        -0.13100877, -0.107617095, 0.0102331955, -0.10446662, 0.064664796, 0.08842068, 0.01764421, 0.035815243, -0.16428041, -0.047206793, 0.024088545, -0.11166419, -0.09924047, 0.11304403, 0.037524972, 0.11891253,
+        0.0271415, 0.13196039, -0.030378684, 0.06989456, 0.07188843, 0.036955904, 0.05358435, 0.1292243, 0.13591827, -0.042314883, 0.11443709, 0.059676256, 0.106055915, 0.008715651, -0.11978113, -0.06859379,
+        -0.10199796, 0.051801603, -0.13376187, -0.09023641, 0.012295636, 0.021216527, -0.11573948, -0.09476261, 0.07630913, -0.13262297, -0.1578706, -0.104900636, -0.12959711, 0.039919354, 0.05540389, 0.11480113,
+        0.15546544, 0.1494986, -0.08598768, -0.13553293, -0.14007239, 0.022255044, 0.016580552, 0.08935306, -0.10010848, -0.04562682, 0.066004984, 0.028756922, -0.00094811793, 0.04071157, -0.09901939, 0.09726596,
+        0.082217574, 0.116857775, 0.0760879, 0.086652756, 0.004590347, 0.12714091, 0.06678488, -0.15346481, 0.014823443, -0.064587675, -0.15213141, 0.11260474, -0.0390013, 0.083992094, 0.025279779, 0.1406686,
+        -0.040606774, 0.12689081, 0.038697246, 0.105967, -0.03519579, 0.11240796, 0.021875627, -0.07545342, -0.08050081, 0.090849705, -0.15409431, -0.103454284, 0.054628324, -0.121189274, -0.11748758, 0.090264544,
+        -0.0025187174, 0.06067958, 0.110055074, 0.104029, -0.11987824, 0.07760571, 0.026322424, 0.011539774, 0.13919955, 0.09082806, -0.023131395, -0.010041579, 0.09777992, -0.100294374, 0.14508407, 0.0060324734,
+        -0.052431624, 0.05996602, 0.10331768, 0.05399562, 0.14011966, -0.14328547, -0.0012737648, 0.16437872, 0.020405157, 0.14743951, -0.11189363, -0.04532138, -0.05984081, 0.04359653, 0.03449193, -0.06950664,
+        -0.12163633, 0.12543981, 0.049015947, -0.0017705647, 0.03685355, 0.10771242, -0.063046046, -0.0881412, 0.13165256, -0.069799855, 0.11780306, -0.005340487, -0.09568232, -0.11836315, -0.053601533, -0.02552537,
+        0.091763064, -0.1458304, -0.04521109, -0.14359553, 0.018913724, -0.05754958, -0.005941181, -0.073988385, -0.057143617, 0.09692031, -0.035507586, 0.10574846, -0.13269597, 0.050234783, -0.09953388, 0.05663366,
+        -0.14373171, 0.041182842, 0.06240941, -0.1277477, -0.13084449, -0.15090095, -0.0022099393, -0.082003914, -0.032189187, 0.112407275, -0.01247722, 0.026805015, 0.15468463, 0.039081585, -0.10259837, -0.022011722,
+        0.04663458, -0.022511767, -0.11920314, -0.018567286, -0.15450072, -0.007671023, -0.07172542, 0.04215078, -0.12795532, 0.0635653, -0.097084336, 0.099736065, 0.13151944, 0.08612538, 0.07084557, -0.007930041,
+        -0.068102986, -0.10083808, -0.06314314, -0.12258197, -0.08810243, 0.014400759, -0.016868431, 0.02763236, -0.056087043, -0.124878034, 0.080138445, 0.13430001, -0.10102404, -0.038990557, -0.004339854, 0.08367411,
+        0.059174553, 0.005756515, -0.11104446, 0.075446464, -0.0044593103, 0.11354549, -0.0691948, -0.041750323, -0.024578268, -0.033748925, -0.086077236, -0.017173419, -0.058172267, -0.1120474, 0.07170501, -0.051263586,
+        -0.0022546018, -0.13014247, 0.04590151, 0.07819282, -0.14444968, -0.048811186, 0.06774331, 0.09868118, 0.13415386, -0.04688213, 0.11705435, -0.07173512, -0.06694967, -0.15575479, 0.0689913, 0.10161317,
+        0.011389641, -0.00064143474, 0.047276508, 0.043825444, -0.063807115, 0.12326679, -0.0451802, 0.07357824, -0.08228526, 0.11434967, -0.030568078, -0.024385588, 0.14667037, -0.049784023, -0.095258765, 0.007491932,
+        0.035466198, 0.03856882, 0.06544408, 0.124971695, 0.0003277075, 0.12888971, 0.07296579, 0.13257098, -0.1264874, 0.074541874, 0.11141547, 0.10053051, -0.101661734, 0.027673554, -0.047970284, 0.11458654,
+        -0.11104084, 0.008614935, -0.12386832, 0.117711455, 0.10265854, -0.124575414, -0.13214359, -0.08392799, 0.1519003, 0.10836085, 0.08814579, -0.10757953, 0.07948965, 0.10201982, 0.0327681, -0.07253815,
+        -0.14619939, 0.09139107, 0.13635683, 0.056658953, 0.0993837, 0.056667276, -0.0037652724, -0.09712654, -0.033909384, 0.07542171, 0.04183304, 0.09948033, 0.09071459, 0.0019912124, 0.014401559, 0.06914587,
+        -0.012019283, -0.12977779, -0.0915828, -0.1522814, -0.020561723, 0.14564364, -0.019312825, -0.12765102, 0.1077798, -0.10414995, -0.14664169, -0.035779506, 0.09597123, -0.019362086, 0.035783824, 0.05872268,
+        -0.0004340654, 0.11931523, 0.0037662203, -0.022186005, 0.050993633, 0.040012363, 0.14774023, 0.042710077, 0.031283077, -0.13878594, 0.11976668, 0.12395509, -0.07237466, -0.0876901, -0.0839621, -0.032700058,
+        -0.14017455, 0.043502968, -0.10456982, -0.14925422, -0.09253001, 0.04730139, 0.13775772, -0.018490762, 0.12860271, 0.08650359, -0.05878713, -0.046437435, -0.109741904, -0.038252067, 0.08817362, -0.015666973,
+        -0.0713285, 0.04728159, -0.023748059, -0.11169548, 0.030616513, 0.10461999, -0.06074144, 0.03475186, -0.1450389, 0.025878176, -0.12807925, -0.033436798, 0.060290646, 0.11777803, -0.12744308, -0.101012886,
+        -0.011922001, 0.06321529, 0.020139446, 0.14295311, -0.029983344, 0.12308027, -0.11872574, 0.03685239, 0.13797697, 0.009371826, -0.0070639467, 0.07836442, -0.043153837, -0.12668583, 0.016902095, -0.15041345,
+        -0.062226128, 0.14689164, -0.07904633, 0.040210355, 0.05996858, 0.022409122, -0.04503432, 0.027916892, -0.10211768, 0.12070365, 0.031981256, 0.02940445, -0.046651598, -0.13710766, -0.010003841, -0.08607893,
+        -0.08746878, 0.033363268, -0.019040572, -0.15441515, -0.12018431, -0.13762754, 0.15118733, -0.09032942, 0.00060026476, 0.041068144, -0.15431766, -0.1293926, -0.06140581, -0.14986923, 0.13910815, 0.048360568,
+        0.14720885, -0.08209307, -0.10738377, -0.1382629, -0.14632036, 0.006282142, -0.11702748, -0.0001950208, -0.06296918, -0.087244704, -0.09790147, 0.00485665, 0.07402185, 0.0469597, -0.09471855, 0.107444905,
+        0.116735354, -0.1409062, 0.09737234, -0.07909756, 0.0142375585, 0.0600865, 0.10290287, 0.05274475, -0.12726556, -0.028770708, 0.11016542, 0.055184815, -0.070164606, -0.06259731, -0.1112421, 0.11199844,
+        0.119189255, 0.089137696, -0.14136198, -0.07162345, -0.034812454, -0.122708485, 0.057873197, -0.11402102, 0.019604601, 0.1360563, -0.002541184, 0.009822206, 0.0025309268, -0.09013408, -0.07575764, -0.02304141,
+        0.14025846, 0.124957815, -0.10727709, 0.05635747, 0.112280786, 0.092313565, -0.09677287, -0.08882674, -0.01860261, -0.03939321, -0.12366424, 0.023399558, 0.07803478, 0.12845758, 0.13784522, 0.007090972,
+        -0.1335073, 0.07608369, -0.09603356, 0.040097676, -0.11693095, 0.037343055, -0.07690255, 0.111783415, 0.05578608, 0.027210984, -0.014376417, 0.11328141, -0.07738671, -0.13282895, 0.041244276, 0.083227254,
+        -0.06116896, -0.03219133, -0.06681564, -0.1364453, -0.038052183, -0.09085694, -0.06909066, 0.07856635, 0.013649478, 0.07691052, -0.11936729, 0.1180338, -0.04835587, 0.052738674, 0.0714337, -0.122853726,
+        0.12905705, 0.10234285, 0.13123985, 0.1571707, 0.11017935, 0.14349607, 0.019939668, 0.015247653, -0.13203649, 0.10494778, 0.047116473, 0.086525075, 0.05697292, 0.035712417, 0.041417398, 0.034564637,
+        -0.107841454, 0.090956375, 0.04624387, 0.06965291, 0.043097, -0.07108048, -0.034881365, 0.08301463, -0.08744661, -0.021595841, 0.09136213, -0.023862245, 0.023641823, 0.14973512, 0.065217614, -0.07581745,
+        0.12206137, -0.14893794, -0.11114068, -0.025668569, 0.02172585, -0.044794455, -0.06864431, -0.038546026, -0.038989402, -0.14247385, -0.12932152, 0.1287394, 0.033310406, -0.0902086, -0.132993, -0.059433274,
+        0.14428313, -0.04696191, -0.025039153, -0.031013282, 0.08097016, 0.11304514, 0.094190955, -0.037645534, -0.050060205, 0.13024619, 0.15444495, -0.13890314, -0.03213043, -0.11346201, -0.09801008, -0.043111768,
+        0.0509225, -0.08947732, 0.16511264, 0.03522826, 0.115337126, -0.0151287895, -0.033009943, 0.020175004, -0.09515455, -0.007407696, 0.0136768995, 0.05733203, 0.025218558, 0.039956562, -0.01687092, 0.088247925,
+        0.036974367, -0.0071779336, -0.16477044, 0.095626675, 0.10327059, -0.053266186, 0.118066475, -0.11080973, 0.11461872, 0.12720169, 0.16415906, -0.13861439, 0.0175012, -0.046054367, -0.11610446, -0.07373506,
+        -0.0037586307, 0.05688081, -0.0052159326, 0.10768803, -0.12170553, -0.029472943, -0.0053861504, -0.06316776, 0.13728617, -0.051583335, 0.092075534, 0.10130304, 0.09053936, 0.037885055, 0.032945197, -0.11766777,
+        -0.017383585, 0.050557546, -0.08100261, 0.13978018, -0.11204515, -0.02161678, 0.105323605, -0.13352044, -0.025945034, 0.016707366, 0.104943015, -0.14598614, 0.025691614, -0.07645114, 0.1316442, -0.14246471,
+        0.1602811, 0.16191064, -0.080584206, 0.0052965395, 0.047173906, 0.03900621, -0.10043105, 0.059227124, -0.06604312, -0.05194847, 0.11318695, -0.054285165, -0.13676184, 0.0147672575, 0.11820956, 0.004702743,
+        0.09382725, -0.13033651, 0.009036245, -0.11494439, -0.11970383, -0.030345581, 0.10598145, 0.052062936, 0.14530239, 0.036111888, 0.0036844558, 0.09298319, 0.084870294, -0.057673566, -0.11718301, 0.005293222,
+        -0.08004274, 0.14141603, -0.10224538, -0.12381982, 0.015093644, -0.0065777837, -0.029173782, -0.06344044, 0.076388426, 0.08659976, 0.0036450352, -0.11988901, -0.10003128, 0.07976809, -0.043774005, 0.07788831,
+        0.13440487, -0.08571401, -0.13447478, -0.00551974, 0.0020347622, -0.12905909, -0.09173414, -0.050439183, -0.121553876, -0.10127907, -0.1530555, 0.059985556, -0.07291091, -0.033285085, 0.05163704, 0.012672317,
+        -0.14497751, 0.014689892, -0.14883277, 0.10363586, -0.054327372, 0.0484619, 0.0072126463, 0.15341568, 0.11893474, -0.11400649, -0.019790307, 0.06555393, -0.047092862, 0.009829394, -0.044642366, 0.09748583,
+        0.010225676, 0.030849174, 0.1582502, -0.11541584, -0.14599882, -0.07115224, 0.08529294, -0.062053364, 0.046376225, 0.16366757, 0.06417551, -0.1307457, -0.13870023, 0.034010634, -0.118221544, 0.069265276,
+        0.049875062, -0.056680266, 0.030740889, 0.0740048, -0.025645467, -0.011500085, 0.040060405, -0.016856395, 0.0090776775, -0.10403421, 0.033477616, 0.0739614, -0.114528894, 0.031841908, 0.070883825, -0.04292743,
+        -0.05196213, -0.008955188, -0.06982405, 0.10635472, -0.0055955695, 0.15145071, 0.08051507, -0.12052183, -0.062548555, -0.026923276, -0.047777537, 0.059120663, -0.062299598, -0.14424372, -0.13134313, 0.13356945,
+        0.043936737, 0.10519265, -0.082935676, 0.15079279, 0.04956332, -0.06663973, -0.13691805, -0.056787148, 0.16121063, 0.0130055165, -0.0039492846, -0.12710279, -0.088511236, -0.012846987, -0.023250567, -0.12479984,
+        -0.11259758, 0.118714936, -0.014400284, -0.12137727, -0.12209312, 0.14559735, 0.10169144, -0.12342724, 0.08813108, -0.043722294, -0.10791411, -0.034643088, 0.07464553, -0.112918474, 0.11165718, 0.11384245,
+        0.15385914, 0.092794836, 0.056345552, 0.11464015, 0.13892727, -0.13390237, 0.14468476, 0.11858589, 0.08003379, -0.0930376, 0.07490976, 0.15828717, 0.090222865, -0.04219594, -0.09348503, 0.05519351,
+        0.09765487, 0.01587507, 0.15070039, -0.11066715, 0.047921427, 0.086705856, -0.05393177, 0.01614222, 0.039072406, -0.017310021, 0.089513466, 0.13103184, 0.13924648, 0.11010969, 0.03267202, -0.0929951,
+        0.020337978, 0.16057752, 0.07394688, 0.074778914, -0.10488896, -0.10222861, -0.14222282, 0.16260993, 0.09815465, 0.13489921, 0.098179236, 0.12033456, -0.0054494357, -0.06554369, -0.007543167, -0.08355498,
+        -0.015072627, 0.068908826, 0.06842769, 0.03452121, -0.09896282, 0.01796767, -0.07943637, -0.11681716, 0.057373602, -0.08901085, -0.008328403, -0.11732512, 0.069480434, 0.08520378, -0.124075755, -0.113960125,
+        0.05252947, -0.021323184, 0.03379067, 0.09484534, 0.013627131, 0.01071337, -0.07963603, -0.07848089, -0.12611574, 0.12516885, -0.019086989, -0.07462588, -0.06389639, 0.12748592, 0.11777089, 0.10660244,
+        0.047735028, -0.09881604, -0.002354887, 0.007538291, -0.085073896, -0.033298347, -0.045978174, 0.06593698, 0.04320164, 0.029814938, -0.13165592, -0.0075988653, 0.11578006, -0.044020083, 0.0644929, -0.07212286,
+        -0.08085648, -0.052963417, 0.14893305, 0.00698584, -0.10776086, -0.029153865, -0.017028857, -0.008616628, -0.13237627, -0.12089255, -0.12846033, -0.10157642, -0.09296694, -0.07827665, -0.15274544, -0.05259223,
+        0.069966845, -0.004665148, -0.040928993, 0.102877796, -0.0014088288, -0.09795294, -0.1441668, 0.015450354, 0.107640535, -0.096621424, -0.09529978, -0.015386457, 0.0057799513, -0.1485937, -0.023397451, -0.08428891,
+        0.015644098, -0.021838088, -0.03663519, -0.040454175, 0.13911963, 0.10292041, 0.10612838, 0.1284939, 0.04912628, -0.018164612, 0.03851699, -0.13776635, 0.019866616, 0.09987574, -0.02194768, 0.076984204,
+        0.079172455, 0.10437953, -0.11692463, -0.06456541, 0.121280245, 0.11644152, -0.112189785, -0.084529094, 0.13594015, 0.022268519, 0.07323832, 0.067604825, -0.05721516, -0.0044611488, -0.13183488, -0.03724207,
+        -0.05140752, 0.13205616, -0.07797824, 0.021647904, -0.046348225, 0.036588427, -0.043902054, -0.1523302, 0.134257, -0.06550172, -0.08734373, 0.1422282, 0.14240064, 0.05191795, 0.025609508, -0.0753272,
+        0.15012719, -0.102890246, -0.05857474, 0.008004883, -0.14644039, -0.0025073974, -0.03090818, -0.10823629, 0.047654655, -0.15224554, 0.0855445, -0.13684312, -0.13732818, 0.06770716, -0.06090702, 0.025505073,
+        -0.02496686, 0.06741906, -0.07613535, -0.0058406247, 0.1499331, 0.05867586, 0.07390469, -0.064864285, -0.13764533, 0.09841996, 0.017521018, -0.031281903, -0.018248657, -0.070249386, 0.11571073, 0.020976176,
+        -0.10421127, 0.107447796, 0.1433763, 0.13160361, 0.045628626, 0.102976896, 0.029679207, 0.0071235234, -0.099482074, 0.0036267408, 0.011522585, -0.1458322, 0.080368534, 0.070172615, -0.027693577, -0.010956075,
+        -0.002843237, 0.082495615, -0.14513054, -0.005153624, -0.052526783, -0.006079638, -0.079951346, 0.104033366, -0.13565159, 0.0516991, 0.13169283, 0.107214674, 0.06043778, 0.12398167, 0.05962058, -0.03421713,
+        0.14311686, -0.11979909, -0.016837697, -0.062661305, -0.12313815, -0.050836578, 0.03183051, 0.11752455, -0.076424114, 0.109304026, -0.122072235, 0.062312488, 0.013667833, 0.08159967, -0.049310762, 0.1299632,
+        -0.14808595, -0.16193028, -0.06441297, -0.016746573, 0.009203417, -0.051878236, -0.15731016, -0.031227294, 0.15120526, -0.007316092, -0.12031723, -0.07187169, -0.120902166, -0.104857646, -0.019959671, -0.06983124,
+        -0.12197351, -0.038904842, -0.07423001, -0.015139638, 0.10809583, -0.04019631, 0.0041988157, 0.057669654, 0.14529173, 0.029208345, 0.07884089, 0.098889746, 0.028453035, 0.019988015, 0.10871036, -0.057374094,
+        0.03949513, -0.013202742, 0.014791531, 0.113042295, -0.10364131, -0.05339175, -0.14095677, 0.0026841233, -0.080277815, 0.12962489, 0.065733865, -0.08882066, -0.11813839, 0.077222906, 0.07186646, -0.017019337,
+        0.076822326, -0.051462222, 0.0385695, -0.011248545, 0.036726102, 0.06765769, 0.033842757, -0.03585324, -0.10255728, -0.015624204, 0.07257771, 0.012546265, 0.09518354, 0.09340309, -0.010878562, 0.07749463,
+        -0.005593498, 0.051061273, 0.017747043, 0.06795594, 0.041646995, -0.063521326, 0.0796958, 0.107669905, 0.07217821, 0.051652573, 0.07936619, 0.048264287, 0.14423876, -0.0034220435, 0.0965555, 0.044336956,
+        -0.11292461, -0.0921576, -0.10339564, -0.049845383, -0.02940296, -0.099373676, 0.1016283, 0.09697102, 0.090524934, 0.044290394, -0.08449862, -0.051141776, -0.075734, -0.10650444, -0.034313295, -0.027016496,
+        0.029117184, -0.15225533, 0.14385177, 0.13259524, 0.08312598, -0.024614103, 0.137948, 0.14441477, -0.15768062, -0.13936925, -0.067698255, -0.14947873, -0.078761354, 0.056145642, -0.059642725, -0.13165432,
+        -0.11587633, 0.051500197, 0.03374966, 0.028507717, -0.11878181, -0.105022855, 0.13170719, 0.1413144, 0.014030374, -0.022545137, 0.14345856, -0.026302878, 0.0048521496, 0.13016477, 0.107291296, 0.05883321,
+        0.1382737, -0.15639718, 0.1334634, -0.05362166, 0.111485496, 0.09151507, 0.012820124, -0.03875699, -0.058733746, 0.038558695, -0.075375736, 0.10672629, 0.034467846, -0.11212655, 0.12659806, -0.054652974,
+        -0.00065462216, 0.03677135, -0.093691334, 0.14516762, 0.14225133, -0.046577074, -0.0990154, -0.07343399, -0.08239327, -0.07107862, 0.022123555, 0.13225341, 0.037308414, 0.011159619, 0.019260617, -0.082202524,
+        -0.10643427, -0.114395075, 0.00493778, -0.13887592, 0.14106297, -0.13089009, 0.010608814, 0.075875886, -0.08866356, -0.13156591, 0.039429825, 0.11220834, 0.09278192, -0.036905494, -0.08652015, 0.034302093,
+        0.1417818, -0.029223446, -0.057605702, -0.09035775, 0.0041030254, -0.120644495, 0.02343079, 0.029069254, 0.12710224, 0.004107839, -0.05328228, -0.06807945, 0.043733064, 0.013834212, -0.038829412, -0.10252829,
+        -0.11901434, 0.038135856, -0.06035863, 0.0970168, 0.034692563, 0.13565807, -0.038390018, -0.11543141, 0.0045567406, -0.049104743, -0.03410557, -0.0764985, 0.034143105, -0.0018340179, -0.0051425444, 0.12034892,
+        -0.14284576, -0.077824384, -0.07552841, -0.06994875, 0.021566607, -0.079397544, 0.020481162, -0.1147878, -0.1165665, -0.052091394, -0.018363588, 0.15020119, 0.0025988442, 0.05862852, -0.09334578, 0.10863884,
+        -0.12601583, 0.10720584, -0.14189163, 0.04992643, 0.043854352, -0.10433977, -0.08088877, -0.048074886, 0.031660333, -0.08597168, 0.16085427, 0.05655342, 0.008229648, -0.13235258, -0.036543198, -0.06949182,
+        0.0013354844, -0.036254995, -0.004050927, -0.10922436, 0.117496625, -0.1308999, 0.14153062, -0.04894308, -0.14574046, 0.081913695, -0.013436431, -0.033355817, -0.029890377, 0.14725432, 0.094802745, -0.0539277,
+        0.056324154, 0.04642591, 0.12645404, -0.0055504455, -0.14092949, -0.061360225, 0.10763805, 0.029535366, -0.119592994, -0.023909371, -0.14058779, -0.053494748, 0.10539174, 0.14573352, -0.06412886, 0.09697169,
+        -0.036316168, 0.034970645, -0.065563425, -0.07390933, -0.076272056, -0.050439835, 0.122690916, 0.12540752, 0.091210745, 0.009575542, 0.12247905, 0.043267004, -0.15396576, 0.048866823, 0.12563682, 0.10574156,
+        -0.06398215, 0.08105019, 0.0591215, 0.12834556, -0.032724887, 0.13360302, 0.13077003, 0.1082609, 0.059087504, 0.1273566, -0.0034640718, 0.16129735, -0.11653741, -0.088805355, -0.07885317, 0.07307113,
+        -0.093839064, 0.119956024, 0.017022325, -0.019651163, 0.09273849, -0.03877396, 0.13580358, -0.14324157, -0.10958172, -0.0981443, 0.14334276, -0.016652506, 0.0884449, -0.10750349, 0.13448557, 0.06527438,
+        0.09152896, 0.08074043, 0.06583202, 0.055286825, 0.048705235, 0.013890946, 0.02270249, -0.12440378, -0.10054888, 0.13548782, 0.118243985, -0.060078807, 0.11741598, 0.12937771, 0.08938496, 0.09690439,
+        -0.092079245, -0.0047666626, -0.07778082, 0.057914887, -0.13136539, 0.13914083, -0.044657394, -0.06972054, 0.01590615, 0.14050274, -0.16094293, 0.07349522, 0.028535238, 0.018754587, -0.07222225, -0.03836061,
+        -0.042316996, -0.01895076, 0.03424331, -0.054827485, -0.09917187, 0.028312977, 0.089716636, 0.13137731, 0.07373256, -0.098380074, -0.034000773, -0.016637288, -0.044758704, 0.041131634, 0.014261064, 0.08677535,
+        0.00021728638, 0.08582184, 0.0488598, -0.12805581, 0.06562834, -0.09538181, 0.11631673, 0.056882225, 0.09193818, 0.102975726, -0.10394897, 0.0106537305, -0.049706865, 0.09194368, -0.09140449, 0.027425945,
+        -0.10889475, 0.046443954, -0.12742662, 0.013342558, -0.06116461, -0.0067892876, 0.03109035, -0.1233826, 0.04011919, 0.024175867, 0.044581823, -0.081041574, -0.0029229089, 0.12511802, 0.11379887, -0.11688157,
+        -0.010045675, 0.010643369, 0.1345442, 0.13446498, -0.0669339, -0.015137649, 0.09956441, -0.13963443, -0.040851433, 0.01847288, -0.050927445, 0.0922814, 0.04064326, 0.04540408, 0.08510061, 0.072321974,
+        -0.13412215, -0.014415854, -0.12434988, -0.040988367, -0.03241051, -0.12580822, -0.14394361, 0.13016413, -0.062495723, -0.13324672, -0.020803308, 0.034569588, 0.055471964, 0.041809473, 0.05349155, -0.096392825,
+        0.1272943, -0.003919324, -0.07094147, 0.03878102, -0.14245532, 0.09535906, -0.013391192, 0.066507034, -0.0090521695, 0.11183848, 0.11952939, -0.111526124, 0.116525024, -0.056928113, 0.0046360916, 0.09329774,
+        0.05307296, 0.060308374, -0.026001714, 0.07429463, 0.042671412, -0.06320683, 0.08833037, 0.04676495, 0.09271407, 0.10623584, -0.14312366, -0.029491296, 0.08987184, 0.11214369, -0.13857727, -0.087676376,
+        0.06068253, 0.113808155, -0.10846775, -0.07240934, 0.08509369, -0.051180117, 0.040692277, 0.05562876, -0.052304886, 0.1266639, 0.08794617, -0.07876999, 0.065753415, 0.09005415, -0.122617744, 0.01879715,
+        0.11890527, 0.14834143, -0.07936481, -0.041857876, -0.13115378, 0.13576214, -0.100699976, 0.131121, 0.017292658, -0.12188869, 0.047649477, -0.07478147, -0.09815255, -0.029376129, -0.10648733, -0.04321892,
+        -0.10606428, -0.11244725, 0.0684982, -0.02254476, -0.103414215, -0.036899477, 0.051424205, 0.04034301, -0.11272688, -0.0066840556, 0.09726271, -0.056057274, -0.07511361, 0.09209054, 0.11102077, -0.0034555565,
+        -0.006680147, -0.015779596, -0.053833112, 0.083324246, -0.06765252, -0.06177213, 0.004371518, 0.05663595, 0.14315604, -0.004895431, -0.069350675, -0.049444515, -0.023992293, -0.02887351, -0.060599808, -0.09219732,
+        0.07629686, 0.1158958, 0.11060822, 0.047237758, -0.12397862, -0.03873685, 0.08996615, -0.12700683, 0.13059759, -0.04453295, 0.035903413, -0.12123071, 0.035020653, -0.10174976, -0.10991817, -0.0066650105,
+        -0.15038805, 0.09258354, -0.1062883, 0.03341026, 0.03708533, 0.11920796, 0.07432388, 0.03388657, 0.03707984, -0.10420662, -0.080056645, 0.10370927, -0.089575715, -0.043182995, -0.13494915, 0.10469177,
+        0.08297486, 0.115950264, 0.047619466, 0.08191128, 0.087929346, -0.088703565, 0.09014894, 0.118857846, -0.095999144, 0.10044488, -0.06546012, 0.03394088, -0.13052443, 0.111457, -0.13392474, 0.12181332,
+        0.12473969, -0.08063065, 0.05360631, -0.09171249, -0.08869527, -0.057405535, 0.10903053, 0.13465583, -0.09806, -0.012226417, -0.12666838, 0.08922658, -0.070178665, 0.0170057, 0.053210653, 0.004273811,
+        -0.0032898192, 0.034548584, 0.10419331, 0.031467125, 0.023037959, 0.10203116, -0.10849055, -0.06860798, -0.124407135, 0.049828958, -0.0024420305, -0.08724056, 0.14294559, -0.04653252, -0.12871538, -0.13582212,
+        0.08657062, 0.028133722, -0.02505024, -0.06553467, 0.15078285, -0.13171735, -0.1247894, -0.051878516, -0.12201542, -0.009866118, -0.0030636296, 0.11045973, -0.026749734, -0.040840775, -0.112778604, 0.058396906,
+        0.053442243, 0.11674352, -0.060853135, -0.028635535, 0.07534303, 0.08252164, 0.13525696, 0.06934415, 0.022499874, -0.09821638, 0.11887668, 0.041516453, -0.048364803, 0.1464495, 0.13112822, -0.038963415,
+        0.014943288, 0.055555098, -0.11118016, -0.1424113, -0.02095613, 0.1570621, -0.04430857, -0.08673267, -0.02305952, 0.06239507, 0.026988888, -0.093401864, -0.08032802, -0.09185968, -0.088781364, -0.09581144,
+        -0.12612467, 0.02359885, 0.092935786, -0.017384993, -0.088728555, 0.04775873, 0.1470725, 0.11983697, -0.0364571, 0.06396656, -0.14179547, -0.05240254, 0.13878818, -0.124152735, 0.012529201, -0.090276785,
+        0.09595338, -0.085949406, 0.019547492, 0.13251014, 0.121643975, 0.13265401, -0.120101675, -0.10041048, 0.036966767, 0.01444985, -0.060627714, 0.0746748, -0.11896678, 0.049228717, -0.1125153, 0.01829348,
+        -0.15199035, -0.11445322, -0.12875786, 0.0034200484, -0.04735016, 0.059502006, 0.09167919, -0.102460876, -0.117195584, 0.063410036, 0.0074709975, -0.12840083, -0.13013773, -0.08248421, 0.08057879, -0.113633946,
+        -0.025869675, 0.15262519, -0.058022045, -0.018319746, -0.11744221, -0.1496034, 0.0261435, -0.06113152, 0.024397219, 0.06764939, -0.1272255, 0.12526087, 0.07056833, -0.122824416, -0.084457636, -0.056841154,
+        0.08937289, 0.085805796, -0.064549915, -0.13977711, -0.0719528, -0.1509771, -0.068339095, -0.12185933, 0.12420659, -0.137972, -0.09925002, -0.12454153, 0.10053884, -0.10571744, -0.016059961, -0.039629903,
+        0.025238495, -0.1470947, -0.13490154, 0.043422148, 0.012793828, 0.005650584, 0.11749826, 0.0068518072, -0.026417324, 0.044671316, 0.109824136, 0.13078777, -0.056808487, -0.118574195, -0.04159024, -0.08150705,
+        -0.1395166, 0.020047376, -0.019312462, 0.13514677, -0.021526273, 0.092279315, -0.026469138, -0.084352314, 0.008630355, -0.055713095, 0.0696342, 0.10505657, 0.073836304, 0.05394044, 0.058694415, -0.077540696,
+        0.113293305, 0.15089074, -0.14109777, -0.03694228, 0.08456953, -0.13572967, -0.118125774, -0.103333026, 0.09651268, -0.13317652, 0.0058574495, -0.14396352, -0.034365818, -0.09915419, 0.08240125, -0.013315727,
+        0.14727622, -0.09901426, 0.052541733, 0.02533564, 0.07685216, 0.06884042, -0.000941177, -0.08042557, 0.12685415, -0.1488033, -0.13440505, 0.079352275, -0.114139274, 0.12411396, 0.074250415, 0.118309535,
+        0.07006346, -0.021286668, 0.08761814, 0.08907408, 0.09287156, -0.05883215, -0.12648346, -0.09686814, -0.027833771, 0.007756375, -0.052902028, -0.08296009, -0.017726963, -0.10213323, -0.10963355, 0.03890192,
+        0.030642739, 0.10713108, 0.086262815, 0.09859768, -0.10413864, -0.08277005, 0.08277354, -0.021347113, -0.03648338, 0.06845381, -0.0010912295, 0.014786741, 0.09226446, -0.1348105, 0.0879471, -0.12388562,
+        0.11245694, -0.041381042, -0.08953353, -0.033767078, 0.12722573, -0.1044554, 0.01963713, 0.12917562, -0.09467287, 0.05882895, 0.072950035, 0.14419498, -0.057217784, 0.1513248, -0.14034434, 0.08603426,
+        0.14487903, -0.04167487, -0.031347353, 0.010962651, -0.027345676, -0.1408746, 0.09531722, 0.14152484, 0.14730115, -0.08533193, -0.13758698, 0.026563149, -0.076829106, -0.14462076, -0.114005655, 0.13805774,
+        -0.07957522, 0.11123341, -0.108706266, -0.08608998, 0.077329315, -0.1494874, 0.08626554, 0.045822505, 0.15102114, -0.062808365, -0.1636043, -0.11703106, -0.12968104, -0.1134918, -0.034866143, 0.09538823,
+        -0.11134886, 0.13386215, 0.14080194, 0.08672744, 0.100642405, 0.020368565, 0.08460555, 0.08646945, -0.09340504, 0.10668871, 0.042072456, 0.12937896, -0.078771725, -0.11127824, -0.060775895, -0.03928647,
+        0.14278027, 0.1292379, 0.14248931, -0.0064513846, -0.10768424, -0.07311039, 0.116018385, 0.061422627, -0.013316694, 0.09951487, -0.14016506, 0.078451306, -0.047322556, 0.021840839, 0.021173177, -0.035202842,
+        -0.08257766, -0.1382113, -0.02186492, 0.09015758, 0.14516824, -0.08151836, -0.015654407, -0.083717585, 0.10138253, 0.0018952711, 0.1197387, 0.023718128, 0.08595939, -0.07930618, 0.040091686, -0.12011657,
+        0.12893423, -0.0017932792, 0.12228981, 0.08542136, 0.044771176, 0.10885927, -0.019707102, 0.14919871, -0.07324328, -0.06753117, -0.021979377, -0.15266408, -0.12170646, -0.09773178, -0.041089512, 0.01689411,
+        0.06760192, 0.14392227, 0.08219964, 0.10891542, 0.115552366, 0.114083685, -0.0758602, -0.08569825, -0.029323557, -0.09730643, -0.11574092, -0.043358017, -0.13838042, 0.13488837, -0.04843679, 0.109131604,
+        -0.09077077, 0.12120921, 0.065688916, -0.088815354, -0.13642132, 0.14595796, 0.119832404, 0.13489099, -0.08351551, 0.063169844, -0.11399821, 0.0061637727, -0.015608475, 0.06846661, -0.09687134, 0.041657563,
+        -0.10006225, 0.14396267, 0.11457294, 0.063019745, 0.074048184, 0.018247204, 0.020986043, -0.14983845, -0.13176169, -0.04628653, -0.110498354, 0.008131816, -0.07284781, 0.05137584, 0.12859854, -0.007998555,
+        -0.07220565, -0.02326865, -0.09991609, 0.012572603, -0.0011163529, -0.07063977, -0.02238055, 0.13372852, 0.031597394, 0.124479756, -0.089752495, 0.15374148, -0.053812653, -0.015489278, -0.055774424, 0.07694954,
+        -0.042853575, 0.0036021972, 0.07314657, -0.0251835, -0.040324472, 0.052884288, 0.010053385, 0.14611447, 0.070504494, -0.14235754, -0.12457263, -0.1006406, 0.037911184, -0.020882031, 0.14509247, 0.068951845,
+        -0.058173, 0.16872336, 0.050366085, -0.026623268, -0.10698516, -0.08841415, -0.09522373, 0.0062041623, -0.06433136, -0.08159007, 0.10640651, -0.10546427, 0.15093797, -0.05346837, -0.04011593, -0.085544996,
+        -0.0380118, -0.14884256, -0.07117568, -0.10486838, -0.057201125, -0.13602644, 0.16341417, -0.10481519, 0.012385222, 0.014142943, -0.15469144, 0.022471093, -0.05228651, -0.085662425, -0.10439671, 0.06904589,
+        0.043567784, 0.11254041, -0.015976692, -0.08639701, 0.13580766, -0.07674812, 0.037636288, 0.14769883, 0.0808772, 0.10573288, -0.03552137, 0.04570284, 0.08466614, 0.020880694, 0.14499414, -0.03937226,
+        -0.09710272, -0.103229605, 0.048746087, -0.12530424, 0.13630265, -0.08289409, -0.027546976, -0.1401672, 0.1497691, -0.08566738, -0.12496157, -0.12119962, -0.07480984, 0.05999438, -0.04295563, 0.15746124,
+        -0.14471798, 0.07144707, -0.044963572, 0.050530322, 0.04695185, -0.016812919, -0.041731007, -0.026029754, -0.036054023, 0.056157883, -0.052754097, 0.03243571, 0.05652792, -0.049613576, -0.0020768633, -0.00022719642,
+        -0.047385767, -0.11947039, 0.059345637, 0.072565466, 0.1348019, -0.054107293, -0.08972087, 0.06779886, -0.04555744, -0.14225182, 0.08336581, 0.10202201, -0.14899582, -0.0013887862, 0.14460024, -0.0022467673,
+        -0.064967245, 0.12470328, 0.07896842, 0.029808916, -0.077932686, 0.0016562068, 0.080869764, 0.069406204, 0.09487439, 0.018500041, 0.002042423, -0.06050402, 0.043075155, -0.064989366, -0.13205315, 0.1222891,
+        -0.08841075, 0.03250007, -0.050107986, 0.06321879, -0.036362506, -0.09750328, 0.105433345, 0.02699536, 0.06468983, 0.038701124, -0.02900096, -0.02113811, 0.13134934, -0.0013896289, -0.115918666, 0.13732746,
+        -0.10270833, 0.10876867, 0.1369456, 0.049419574, 0.04668124, 0.05815684, 0.03880475, -0.05009515, 0.08824925, -0.1177545, -0.04677841, -0.07298554, 0.03906887, -0.074583896, -0.010384239, 0.097367786,
+        0.006560357, -0.10673243, -0.0037062059, -0.14676504, 0.05931832, 0.1255257, -0.07871853, -0.05815086, 0.14794269, -0.014899559, 0.11876995, 0.13161041, 0.08161619, -0.14906643, -0.03723306, 0.10280448,
+        -0.14747274, 0.06918672, -0.034211673, -0.102492474, 0.103835225, -0.07781621, 0.10023931, -0.116023585, 0.0035129143, 0.09224591, 0.029868828, 0.0137003325, 0.14308338, 0.09488372, -0.106976084, -0.11885539,
+        -0.09688901, -0.12996745, 0.1555043, 0.021321567, -0.14854357, 0.071051046, 0.07734229, -0.10658229, -0.08359061, 0.12331604, 0.10499467, 0.124204524, -0.11121825, -0.042559363, -0.025063092, 0.14171928,
+        0.12863156, -0.040457785, -0.0052184546, -0.020233974, 0.0026396564, -0.0747369, 0.085843526, -0.13090174, 0.021135475, 0.094521135, 0.03557705, -0.06150705, -0.15086089, -0.1296976, 0.12862268, -0.011254732,
+        0.002885571, 0.073678054, 0.013543236, -0.083781555, 0.014590338, 0.048042215, -0.046238452, -0.09588661, 0.026146263, -0.12606345, -0.07730331, -0.095554374, -0.059737314, -0.13839601, -0.038126394, 0.029725395,
+        0.056759633, 0.11033007, -0.08149607, 0.06938809, 0.08323623, 0.048411265, 0.10143791, 0.044097044, 0.088205, -0.0232423, 0.023815805, -0.036179595, -0.007717819, -0.0720434, 0.1573335, 0.10428766,
+        -0.048216622, 0.088453874, 0.13760932, 0.13387205, 0.11166768, 0.12285155, 0.08157067, -0.11792212, 0.028600728, 0.123541094, -0.040829416, -0.12738676, 0.13567011, 0.087913424, 0.0023699729, 0.04772239,
+        -0.0043759574, 0.0938892, 0.073706426, 0.15164348, 0.08274942, -0.06486009, 0.115508825, 0.12750317, 0.040335942, -0.099716425, 0.077630796, -0.06111894, 0.05382087, 0.068320274, 0.077929765, -0.13805555,
+        -0.06619749, -0.14758377, 0.057779044, 0.018803544, 0.1348433, -0.10015274, -0.16278137, -0.0660288, -0.13098283, -0.12719248, -0.08624494, 0.08996889, 0.006800225, 0.0015411411, -0.030885756, -0.050352667,
+        -0.017468145, 0.113425545, -0.026486883, 0.10519444, 0.095513, -0.006588991, 0.10923223, -0.062074948, -0.03303838, 0.11605568, -0.061738886, -0.016054047, 0.08370676, 0.07947969, -0.11090648, -0.00033922933,
+        -0.08891077, 0.1260536, 0.15820348, 0.037895996, -0.08384083, 0.022129675, -0.07158302, 0.065486304, 0.09392762, 0.0007024575, 0.005761502, -0.030534443, 0.1353893, -0.019981515, -0.08141439, -0.13795657,
+        -0.10439011, -0.02441264, -0.06848499, 0.018661983, 0.11550922, -0.07777863, -0.05209736, -0.111363225, -0.07063035, -0.1534133, -0.10161477, -0.08691734, 0.14867347, 0.020105725, -0.099630125, 0.0029197019,
+        0.032786563, 0.11729293, -0.1234173, 0.11028572, -0.093696006, 0.06865525, -0.12754035, -0.14887917, -0.119615845, 0.12924099, 0.13748507, -0.02921592, 0.018968036, -0.012501099, -0.04301117, -0.088198304,
+        0.16876283, 0.052109495, -0.1495904, 0.025654923, -0.119456954, -0.0041824407, 0.03316473, -0.07439013, 0.008827584, 0.083259255, -0.07536667, -0.15292192, -0.0060303872, 0.15460837, -0.062674135, -0.013603413,
+        0.13108191, 0.07485429, -0.11761703, -0.12017518, -0.14583637, 0.14542708, -0.117335096, 0.036609415, -0.026268952, 0.124861725, -0.023748506, -0.099068865, -0.07407363, 0.13739687, 0.09798473, 0.09175117,
+        -0.03842755, 0.10937322, -0.008109004, -0.046470646, 0.069692865, -0.07676651, -0.039591912, 0.07187239, 0.15217818, -0.10695759, 0.08326393, -0.06298394, -0.11834652, 0.038662124, 0.02838561, 0.12346487,
+        -0.0481874, 0.13221514, -0.033704586, 0.1526037, -0.07432428, -0.14068167, 0.0010967494, 0.114440456, 0.016806021, -0.101444095, -0.024238415, 0.114281096, -0.14194015, 0.06577424, -0.015207986, 0.14678718,
+        -0.03292524, 0.0013113186, -0.122782975, 0.12436304, 0.084397964, -0.038735475, 0.08674697, -0.128292, 0.006529324, -0.076741934, 0.106277645, -0.14924242, -0.09576552, -0.048405644, 0.033286054, -0.00797282,
+        0.003972029, -0.026811663, -0.047943674, 0.03400756, -0.13418315, -0.032911494, 0.009071734, -0.14395842, 0.0038379086, 0.11773896, -0.030857224, 0.00056002324, 0.070514746, 0.12338934, -0.08954397, -0.14792146,
+        -0.10587231, 0.10011827, -0.087415665, 0.08320807, 0.011620784, 0.062438335, 0.14086741, 0.10327731, -0.08625139, 0.13931233, -0.049378306, 0.04789689, 0.059189897, -0.13836916, -0.08108975, -0.090615645,
+        -0.07567425, 0.12634942, -0.09936102, -0.10629132, -0.10611513, -0.098906934, 0.0014596962, -0.058171906, -0.0982935, 0.15803723, -0.037999835, 0.035833027, -0.02019049, -0.021406349, 0.15444706, 0.1049112,
+        0.13534246, 0.093776524, 0.08573354, -0.028796248, 0.13219851, -0.1429774, -0.026181858, -0.11505264, -0.014807125, -0.00673895, -0.043808784, -0.03628987, -0.014157305, 0.01509618, 0.02396476, -0.024658442,
+        0.12596019, 0.10660259, 0.053083703, -0.04755516, 0.022175334, 0.023284564, 0.14283632, 0.017753556, 0.08307367, 0.047436792, 0.03855224, 0.070356525, -0.038675316, -0.06400026, 0.08553134, -0.10562679,
+        0.01246194, 0.13399738, 0.016303971, -0.1472477, -0.05199182, -0.0739702, -0.12110656, -0.010983843, -0.04662357, 0.067724176, -0.019419266, 0.12647122, -0.09840111, 0.14996333, -0.06733463, -0.023911586,
+        0.10228997, -0.025447184, 0.14873208, -0.09142708, -0.11002659, 0.073754735, 0.051179852, -0.14188147, -0.10061838, 0.05698469, 0.064859204, 0.026455307, 0.16204019, -0.023705723, -0.14796793, 0.0061534257,
+        0.06479546, -0.09403203, 0.07096785, -0.11553712, 0.03706756, 0.089828216, -0.048518077, -0.13561755, -0.12125576, 0.063221835, 0.021266531, 0.010276252, -0.020453103, 0.0013423822, 0.13384904, 0.0031354148,
+        -0.09520394, -0.04283221, -0.07313833, 0.049581587, -0.024393283, 0.0196907, -0.15387984, -0.032781757, -0.050861984, -0.14747532, 0.15547381, -0.09821069, 0.15600745, -0.13009654, -0.1393553, -0.13943723,
+        0.14135347, -0.10067662, -0.026132578, 0.02227536, -0.15038893, -0.093731, 0.09898241, 0.027596232, -0.11550059, 0.11607724, 0.06334266, -0.061867025, -0.00040607055, 0.1326317, -0.1253968, -0.08239563,
+        -0.15299682, 0.07523837, 0.0054505174, -0.052527558, -0.12840845, -0.10713403, -0.0062929057, 0.09719737, 0.0439975, -0.060854863, 0.12678328, 0.14605129, 0.12532568, -0.11625385, 0.07246701, 0.12984747,
+        -0.03504973, -0.0627754, 0.06339952, 0.05840721, 0.051117294, 0.013346834, -0.023792665, -0.13412072, 0.01881024, -0.0611968, -0.08274074, -0.031217149, -0.1145279, -0.16313934, 0.032691844, -0.08089964,
+        -0.0206891, -0.040662084, 0.031923585, -0.014703374, 0.13656904, 0.08275461, 0.028722852, 0.08593852, 0.040510267, -0.009390078, 0.1450443, 0.10805439, 0.06609117, 0.14280689, -0.07114497, 0.091699846,
+        0.09793706, -0.013481947, -0.07130792, 0.033348862, -0.07124874, -0.00050484674, -0.15073614, -0.027135933, 0.10094292, 0.11445364, -0.03227397, -0.05213733, -0.074241854, -0.09718607, -0.104203396, -0.08846836,
+        0.11701338, 0.027223105, 0.059190966, -0.07663009, -0.052452236, -0.108117096, -0.1066109, 0.07656216, 0.05277942, 0.034876514, 0.09340344, -0.036058407, 0.022292664, -0.1431469, 0.06053486, -0.050501373,
+        0.10011281, -0.06786688, 0.02897472, -0.0015530123, -0.04501464, 0.015862461, 0.014704798, -0.08645224, 0.14100978, -0.059341643, 0.00023282894, 0.0911191, -0.0252924, 0.09345024, 0.10023963, -0.14523014,
+        0.09098202, 0.08979724, 0.00807232, 0.03571072, 0.037644047, -0.08751449, -0.086200096, -0.1374401, 0.08549453, -0.05611324, 0.11939965, -0.10084597, 0.13301659, 0.12680067, -0.033621598, 0.02783695,
+        0.14548586, 0.082928866, 0.13661362, 0.011055301, -0.04891169, -0.15632576, -0.07914111, -0.004385523, -0.14702775, -0.018414104, -0.143212, 0.042660266, -0.09124404, -0.081496164, -0.02197788, -0.07352405,
+        0.012455789, 0.14898112, 0.0123883085, 0.069361195, -0.078581356, -0.010284103, -0.13596939, -0.12475976, 0.02868563, -0.075772196, -0.14588976, -0.16103101, 0.112486325, 0.078386724, -0.032991964, -0.07391631,
+        -0.06092919, 0.10933769, 0.032459147, 0.018730696, 0.07079072, -0.03613715, -0.12411139, -0.109098725, 0.018320087, -0.14817216, 0.026583312, -0.1491601, -0.07055074, 0.045036133, 0.13292052, -0.08826452,
+        0.0008852412, 0.14102884, 0.0145480465, 0.034823097, 0.076786295, 0.08977938, -0.088514954, -0.054428812, 0.1401889, 0.014844102, -0.124678075, 0.023397772, 0.13379483, 0.15225352, 0.10167372, -0.058108535,
+        -0.15757409, -0.13104731, -0.10377454, 0.0067732288, 0.03192727, 0.041468795, -0.04252991, -0.09076209, -0.09283503, -0.014586854, 0.004699544, 0.077564225, -0.037474398, -0.0069702202, -0.02165396, -0.11402786,
+        0.09478675, -0.05565663, 0.023969868, -0.11068995, -0.042474855, -0.031080946, -0.11196562, -0.125134, 0.04301559, 0.07829555, -0.0077029346, 0.03991631, 0.12684168, -0.10228087, -0.070767656, 0.04000801,
+        -0.0058692573, 0.1521642, 0.12055155, -0.07144459, 0.0736474, -0.063496694, 0.12375084, -0.12526335, 0.07115153, -0.045286976, -0.14109856, 0.14928956, -0.09551481, 0.14185916, 0.093205184, -0.0279707,
+        0.018444564, -0.025386926, 0.04759425, 0.08096353, 0.06505343, 0.12236264, -0.10689245, -0.09674393, -0.0058602965, -0.11720995, 0.020246664, 0.053132072, -0.0066952696, -0.00288135, 0.061079923, 0.07070179,
+        -0.10923499, -0.115018494, -0.09350633, 0.08142676, 0.029980313, 0.026323013, 0.052265298, -0.15684056, 0.0015800815, 0.12068548, -0.119818024, -0.14314765, 0.059095826, 0.0057093417, -0.14917979, 0.14677797,
+        -0.087913536, -0.024952406, -0.13465732, 0.009004815, 0.13400923, 0.12762457, -0.02925766, 0.10389974, 0.008103581, 0.06844536, 0.017343624, -0.017304126, 0.13936898, -0.03631609, 0.14112806, -0.08251867,
+        -0.016428823, -0.002939467, 0.02401148, -0.10098227, -0.09450192, 0.12780039, -0.020814117, 0.0012515464, 0.06881056, 0.071569175, 0.06464651, -0.0907976, 0.037696023, -0.059106607, 0.07558367, 0.10913736,
+        -0.109122254, -0.158686, 0.03177464, 0.010587208, -0.059783492, 0.044975016, -0.036380935, -0.12088391, 0.120774895, 0.039582986, -0.15177254, -0.080925085, -0.10724936, -0.107199185, -0.050609704, -0.07527326,
+        -0.12197552, 0.051317412, -0.019034738, -0.094068766, -0.10351156, -0.15428552, -0.12064034, -0.07554332, 0.10897178, 0.058330342, 0.017817296, -0.0802096, 0.012931331, -0.12184608, -0.08817011, -0.094145566,
+        -0.12367113, 0.13451968, -0.098540254, -0.05176328, -0.071782045, 0.05663876, 0.1303244, 0.08367107, 0.10436313, 0.10938291, -0.13086224, -0.112912595, 0.06550178, 0.080833435, 0.04762706, 0.056216847,
+        -0.14018571, 0.027494388, 0.02943793, -0.06944533, -0.06674786, 0.12870139, -0.085175395, 0.052272692, -0.108176015, 0.0034514642, -0.07637354, 0.09274418, 0.03392508, 0.14096472, 0.11212316, -0.041154064,
+        0.04860516, -0.109735735, 0.11747251, 0.05929741, -0.048381645, 0.015835859, 0.10134666, 0.14030008, 0.041183144, 0.03608673, 0.1435248, -0.06858323, -0.10978118, 0.118535064, -0.0051387413, 0.01834944,
+        -0.060600877, -0.031306885, 0.06203144, 0.02678848, 0.012109774, 0.058700353, 0.13796996, -0.0003933109, 0.0719872, -0.016013606, -0.04866081, 0.10494724, 0.09185741, 0.024926981, 0.05778522, -0.044090994,
+        -0.03386361, 0.02011887, -0.1149656, 0.11691997, -0.014608315, -0.12114962, -0.07701158, 0.058908034, 0.046227317, -0.1465002, -0.05256911, -0.1383019, 0.11676894, -0.09713017, 0.016019171, 0.05383416,
+        0.07807144, -0.056262735, 0.0701754, 0.062652245, 0.078508995, 0.022566607, -0.03774176, -0.12528205, -0.07518587, 0.009565376, -0.062837794, -0.14719073, -0.023909757, 0.084004186, 0.008863318, -0.06147026,
+        -0.13280766, -0.08863473, -0.058007956, -0.0743682, -0.02209279, 0.124469906, -0.10286818, 0.038022265, 0.07362234, 0.07220027, 0.034755692, 0.12213391, -0.06710062, -0.12804113, 0.14004008, -0.090629116,
+        -0.10864186, 0.025582543, -0.13064274, -0.06014231, 0.09980581, 0.076547116, 0.012169368, 0.08516269, 0.049693584, 0.12274773, 0.05063176, -0.00881041, 0.08590119, 0.047100153, 0.060330454, -0.07388996,
+        0.13676208, -0.04185051, -0.15299113, 0.07630859, 0.021955492, 0.028431932, -0.09425364, 0.13361292, -0.032328464, -0.0036157346, -0.074265406, -0.121917814, -0.06770169, -0.020519847, 0.038164306, 0.12726618,
+        -0.13159509, -0.13752389, -0.15510403, 0.062289014, 0.1169726, 0.077882126, -0.07355133, -0.049921308, -0.052955408, -0.07641296, 0.033976123, 0.1160193, -0.08895348, -0.09876997, 0.056621186, 0.04347906,
+        0.14296417, -0.15304112, -0.008968089, 0.0018493579, 0.018101966, 0.031271216, 0.0047744405, -0.044821367, -0.086600125, 0.08466862, -0.13074206, 0.13954201, -0.049516212, 0.11754538, 0.054232493, -0.09837496,
+        -0.03397963, -0.06938517, 0.068976514, 0.0024483812, 0.024578918, -0.05227749, -0.10139815, 0.12662253, -0.025946526, 0.07230113, -0.013260064, -0.12208329, 0.019843586, 0.065806985, 0.13164756, -0.11561052,
+        -0.018020937, 0.1502902, 0.026876546, -0.037510965, 0.14557578, -0.03581283, -0.015800817, 0.15000081, -0.05718615, -0.08010817, -0.07493007, -0.016136672, 0.15144986, -0.15869157, 0.064482994, -0.05985703,
+        0.071843095, 0.0015794853, 0.04682091, 0.024660192, 0.024628779, -0.08458671, 0.023225293, 0.02564538, 0.14381859, -0.11042415, -0.13054006, -0.06688574, 0.046575826, 0.015455212, 0.03377562, 0.12566161,
+        0.06738364, -0.06464463, -0.039000317, -0.11706794, -0.027854916, -0.1051679, 0.11323818, 0.14951289, -0.12093331, 0.10977694, -0.11267489, -0.031296488, -0.107813455, -0.028015329, 0.0647623, 0.06912107,
+        0.11378362, 0.1501948, -0.0381194, 0.14918865, 0.028551275, -0.030834528, 0.120163836, 0.020850154, 0.012591966, 0.07225977, 0.06844169, -0.08306509, 0.0103069125, 0.052260723, -0.118617564, -0.122966506,
+        0.0067547895, -0.030329803, 0.020754013, 0.060465336, 0.11243151, -0.06163629, -0.022066265, -0.04857081, 0.07983272, 0.010660352, -0.12514365, 0.13226554, -0.027894283, 0.15201618, -0.020945674, 0.07524772,
+        -0.053295124, 0.087536074, -0.11502767, -0.07526328, -0.06317963, -0.091674514, 0.06366147, 0.1028135, -0.06922259, 0.06522915, 0.099909954, 0.014609615, -0.045814507, -0.06029297, -0.023027655, -0.123842314,
+        0.0014519054, 0.074148476, -0.07311825, -0.14443143, 0.14388363, -0.03263151, 0.12965006, 0.13136612, 0.011998067, 0.018646996, 0.15078098, 0.010590947, -0.120897554, 0.12136687, -0.0445289, 0.08962148,
+        0.12585042, -0.013413859, 0.058012243, 0.11570559, -0.02169998, -0.031261805, 0.0654503, -0.14177343, -0.13060023, 0.054963004, -0.092055865, -0.10672725, -0.099514015, 0.106740385, 0.10703432, 0.12411084,
+        0.08171218, 0.13157742, -0.0027658513, -0.05837531, 0.14961383, 0.016751166, -0.02493726, 0.0049760006, -0.12913653, 0.12032166, 0.14409156, -0.06729667, 0.106651075, -0.0852686, 0.09914355, -0.12726039,
+        0.14015469, -0.056151398, -0.03831141, 0.11223221, -0.111226924, 0.034701727, 0.12600586, 0.022544326, -0.115737736, -0.120206594, -0.10996594, 0.1499457, -0.009417252, -0.008615341, 0.15769029, 0.1390369,
+        -0.10266795, 0.08194138, -0.100563824, -0.08950971, -0.098928034, 0.15296426, -0.100737505, 0.15373571, 0.10538487, 0.0022405826, 0.15296715, 0.03457751, -0.06482727, 0.046387088, -0.0061514005, -0.11324631,
+        0.13422996, -0.043322846, 0.10700806, 0.060044404, 0.105620354, -0.03476249, -0.034692075, 0.00061772123, 0.076263964, 0.14571363, 0.0015862366, -0.03940104, 0.13171855, 0.039746113, -0.025605027, -0.028163036,
+        -0.033630066, 0.07103225, 0.0070224367, 0.052463565, -0.13361803, 0.09650233, 0.113247134, -0.11209332, 0.06503395, 0.11781436, -0.0486365, 0.07004213, 0.123256624, -0.09713212, 0.01979379, 0.17692116,
+        -0.052278604, -0.0046434663, -0.056042876, -0.13575277, -0.031420264, 0.04129331, 0.035239983, 0.13371788, 0.09332594, 0.098821476, 0.12746517, 0.010924823, -0.14290902, 0.043942545, -0.14273262, -0.04936129,
+        0.01386995, 0.0135358665, 0.09591232, -0.10824243, 0.042852607, -0.14321966, -0.11820883, 0.14301063, 0.014594871, -0.004619561, -0.018668255, 0.10451469, 0.0513303, 0.03061463, -0.016381895, 0.03277296,
+        0.07753776, 0.11292651, -0.075838275, 0.15474099, 0.02469721, -0.041400455, -0.019026069, -0.07333202, 0.11627045, 0.085378274, 0.07900031, 0.15261328, 0.029222885, 0.040242925, -0.09611392, 0.003263003,
+        0.07061503, 0.13185155, 0.07226612, -0.14364645, 0.030840408, -0.15407337, 0.054875754, 0.015193659, 0.11092499, -0.06627754, 0.091255635, 0.04099771, 0.08179643, -0.012010101, -0.03555785, 0.075101234,
+        -0.09090266, 0.01897037, -0.007908494, -0.1390634, -0.07208816, 0.061058592, 0.025254762, 0.13701415, 0.04019726, -0.0054194042, 0.08606636, 0.028342409, -0.1211328, 0.06774998, 0.13286762, -0.034858238,
+        -0.07496143, -0.1145705, 0.09308842, 0.13263032, -0.046310235, -0.10011159, 0.08853277, 0.059099477, 0.017676713, 0.15313135, 0.08426911, 0.032246932, 0.06876202, -0.028592117, -0.0700826, -0.13838597,
+        0.026668414, 0.14442581, 0.011374687, -0.13651691, -0.12361281, 0.07273531, -0.05553642, -0.10957331, -0.01355149, -0.14897089, -0.11931399, 0.10609913, -0.14495692, 0.08218516, 4.1763826e-05, 0.13746896,
+        -0.009010595, 0.02439391, -0.11503693, -0.043861754, 0.02699512, 0.030076941, -0.14247863, 0.012351301, 0.14581414, -0.14278927, -0.11202539, 0.008989111, -0.012979896, 0.018488955, -0.02021802, 0.13107269,
+        0.04140088, -0.0436388, 0.010519236, -0.14682049, -0.13229619, -0.058709133, -0.02819401, 0.120886914, -0.054887056, 0.032698266, 0.16689165, -0.03392393, 0.15870337, -0.105695195, -0.07291328, -0.079685025,
+        -0.01952123, -0.13070515, -0.10527909, 0.1030445, -0.12104087, 0.14356047, -0.14136322, -0.042459868, 0.051751632, -0.06630984, 0.11039997, 0.03514789, -0.009730953, 0.030443162, 0.16670828, 0.103694364,
+        0.12929517, 0.059639044, 0.06512098, 0.0107077975, 0.095768854, 0.05717652, 0.14954278, 0.007962444, -0.030784147, -0.12393776, 0.09693999, 0.060327727, 0.10162564, 0.07972714, 0.10379991, -0.13910484,
+        -0.14518856, -0.0839009, 0.069233656, 0.014087529, -0.12092235, 0.13887712, -0.13325788, -0.03225333, 0.05355802, -0.0018510286, -0.096954696, 0.09214753, 0.085486725, 0.08479241, -0.09331952, 0.044269413,
+        -8.020669e-05, 0.061770283, -0.13430707, 0.080928996, -0.10883093, -0.03998656, 0.13297187, -0.060841065, -0.10338233, 0.13080867, -0.10093944, -0.07865505, 0.11374467, -0.122969106, -0.06031729, 0.013931828,
+        -0.018283406, -0.12178079, 0.11642957, 0.07288113, -0.096736476, 0.114232294, 0.0025016172, -0.098509714, 0.020510873, 0.074802786, -0.037113555, -0.12795934, -0.030316753, 0.05383836, -0.13132665, 0.14914875,
+        -0.014169492, -0.1097203, 0.09173257, 0.13797551, 0.11089614, 0.08570721, -0.023666447, -0.04698732, 0.117787495, 0.09318869, -0.11918923, 0.05881978, -0.05827424, 0.11874755, -0.007878114, -0.111177325,
+        0.15679535, -0.021430882, 0.012765262, 0.0354227, 0.035207227, 0.08713924, -0.038691014, 0.125073, -0.16257392, -0.113840036, 0.14692831, 0.07194321, 0.001771334, 0.139591, -0.0066379705, 0.033664566,
+        -0.02067311, -0.06809052, 0.006090551, 0.08847847, 0.09002927, -0.066844165, 0.07704513, -0.15432334, 0.066107444, 0.054414812, 0.06706386, 0.11469037, -0.09676035, -0.1365626, 0.035822753, -0.12229674,
+        -0.08290345, -0.025520055, 0.12930304, -0.109821096, 0.05817106, -0.081330284, -0.112212226, -0.12190483, -0.09378669, 0.117523775, -0.14146887, -0.045177262, 0.12813799, 0.011867717, -0.09426948, 0.00041775583,
+        -0.04632609, 0.049661245, 0.02244198, 0.104151726, 0.1475843, 0.08459244, -0.010638251, 0.14815158, 0.12011452, -0.095918596, -0.038984682, 0.11373317, -0.08171116, -0.09225845, 0.10341962, 0.14375974,
+        -0.09832479, -0.14930718, -0.022902438, 0.07138616, -0.12797561, -0.04230854, -0.07968726, 0.11216368, -0.07964331, 0.03241083, -0.021170415, -0.10284305, 0.12240247, -0.034623362, -0.05168025, -0.11134808,
+        0.07795655, -0.007394128, 0.0042817886, 0.08928881, 0.016121045, 0.15131809, 0.07779554, 0.006470156, -0.024720756, -0.075617835, -0.054632723, -0.029351141, -0.14577599, -0.1451104, -0.08123138, 0.032316163,
+        -0.044750124, -0.1221753, 0.10698504, -0.14308867, -0.1303287, -0.068748996, 0.056616258, -0.070492774, 0.027820792, 0.06709426, 0.029377395, 0.082893215, 0.027566426, 0.14840004, 0.1385487, -0.016758412,
+        0.09033888, 0.14142041, 0.11787801, 0.100907914, -0.02305294, 0.105628006, -0.08454857, -0.12317266, 0.041364357, -0.04661724, -0.034852367, -0.11316229, -0.07439397, -0.01410684, -0.11230328, -0.07616694,
+        -0.061673805, 0.0016398282, 0.06624766, -0.044032414, -0.013651492, 0.01814846, 0.1081552, 0.050243646, -0.13789992, -0.032272622, -0.071467765, -0.14490847, -0.02218322, -0.10500836, 0.04600821, -0.007843775,
+        0.034148414, -0.03311711, -0.044097695, -0.08107854, -0.04154467, -0.00853605, -0.11385305, -0.119290404, -0.011163271, 0.063655406, -0.11993699, -0.06531158, 0.052089788, -0.12559657, -0.108766, -0.09941343,
+        -0.011350352, -0.029396748, -0.010834312, -0.14208512, 0.06279569, 0.0064307405, 0.11667989, 0.084307805, 0.036408346, -0.14031532, 0.07837967, 0.14235488, -0.14508812, 0.1265699, -0.013680984, -0.06384277,
+        0.10774136, -0.110506035, 0.045642626, 0.14790809, -0.15729518, -0.072390884, 0.010856202, 0.09206812, 0.051788963, 0.004740438, 0.018088534, -0.05747508, 0.14055696, -0.100293785, 0.036075555, 0.0346944,
+        -0.109882586, 0.095070384, -0.017830959, 0.08729583, 0.023917979, 0.083067186, -0.011270958, -0.053514622, 0.02581276, 0.0012598357, -0.006068268, -0.076904245, 0.1272838, -0.11739875, 0.10721983, -0.063708134,
+        -0.0051091104, 0.12602745, -0.079615496, 0.119772, -0.13682528, -0.059822664, 0.022313787, 0.06218414, -0.09065432, -0.031050391, -0.010072062, 0.048338715, -0.15114623, -0.07901709, -0.07508831, -0.039223608,
+        0.117371775, 0.04113835, 0.11999866, 0.025801342, 0.13098627, -0.13642636, -0.12831676, -0.008403894, 0.07430484, 0.09776724, 0.013802549, 0.1457986, -0.008852208, 0.14505608, 0.014165228, -0.1509082,
+        -0.06166286, -0.1204451, 0.11516948, 0.13330996, -0.13130575, -0.16805287, 0.04042471, -0.06411286, 0.11847617, 0.106321394, 0.012711594, -0.0279421, 0.032825444, -0.14023025, 0.077747166, -0.12550478,
+        0.0043488005, 0.0029626884, -0.003300417, 0.04109508, -0.059380792, -0.016699165, -0.15108123, 0.11254602, -0.08467503, -0.017366573, 0.1087707, -0.13685186, -0.043901756, -0.13040924, -0.029902352, 0.09651988,
+        0.09344403, 0.058873285, 0.101780765, 0.13528161, -0.03342532, 0.027514026, -0.031306323, 0.100415766, 0.037761647, 0.13838367, 0.019308018, 0.016400531, 0.05803245, -0.11439036, 0.108066246, 0.0014310867,
+        -0.07659998, 0.13005868, 0.06437239, -0.16027571, -0.10419185, 0.016848177, 0.045385517, -0.032988098, 0.060073804, -0.028272878, 0.087122545, 0.030583682, -0.035976782, 0.03388392, 0.090298034, -0.1100248,
+        -0.13008142, 0.14088026, 0.14760303, 0.063287914, 0.09001879, -0.016977774, 0.112238094, -0.04368257, -0.02206289, 0.15711008, 0.04774533, -0.16512085, -0.1419047, -0.0069388547, 0.056851555, -0.10602771,
+        0.008287726, -0.042180542, 0.15466791, -0.05760999, 0.04969406, 0.11317531, -0.07524983, 0.15636967, 0.041069064, 0.017770842, 0.093374215, 0.032354463, 0.11674187, -0.011407814, -0.046960134, 0.09361309,
+        -0.08586143, 0.0554087, -0.066256315, -0.10099785, -0.09865575, 0.106105775, -0.0011907404, -0.067906305, 0.09009985, 0.031707544, -0.07786208, 0.146267, -0.12504607, -0.010079624, 0.108312234, -0.106657214,
+        -0.038387693, -0.12805866, 0.07145637, 0.031211238, 0.015468067, -0.1220754, -0.06804211, 0.10081519, -0.121199556, -0.068793006, 0.059115034, 0.10782766, -0.09926124, -0.031171074, 0.0047194213, -0.13190092,
+        0.064417735, 0.07359621, -0.11414924, 0.060691044, -0.10066006, 0.03786541, 0.040167343, -0.02137103, -0.12863955, 0.035122044, 0.033145636, -0.06178646, 0.06422075, 0.083047524, -0.11573692, 0.057269804,
+        0.11670258, 0.07128595, -0.087681845, -0.0034197567, 0.12438795, 0.11613867, 0.14564542, 0.05498401, -0.0816661, 0.149081, -0.105149254, 0.14852357, 0.0011016788, 0.06483916, -0.019090714, 0.0988557,
+        0.049674224, -0.078268625, 0.0680115, 0.10283233, -0.09103658, 0.039719697, -0.13968186, 0.04240065, 0.021055711, 0.024076283, -0.01807033, -0.08156359, 0.0166689, 0.097413346, 0.034481395, -0.15257776,
+        -0.152351, 0.15703502, -0.09057484, -0.02243436, 0.03386551, -0.018637413, -0.12818342, 0.13919653, 0.16386698, 0.13784333, 0.033786487, -0.0028901806, 0.15148829, 0.016322372, 0.08913668, -0.13569584,
+        -0.07714027, -0.12782942, -0.015092556, 0.030970922, 0.011573386, -0.04420147, 0.14284815, 0.12808211, 0.10651815, 0.105723985, 0.11598036, 0.02732974, 0.1142333, -0.074674726, 0.006083167, 0.108813815,
+        0.10708739, -0.073904425, -0.06351868, -0.07430406, -0.10385966, 0.0033565243, -0.13783868, 0.005704296, 0.113793805, -0.0749866, 0.03229274, -0.10823448, -0.10364468, 0.1596692, -0.11114637, 0.126935,
+        -0.08981643, 0.1539524, 0.12957324, 0.07109014, -0.12822045, -0.064187706, -0.004488862, -0.03629538, -0.1439368, -0.09251317, 0.028360901, -0.13373387, 0.05864007, -0.12502892, -0.12707642, 0.118320376,
+        0.12065151, -0.12394864, -0.08624879, -0.08854546, 0.08288268, 0.019036865, -0.064447984, 0.015490362, -0.061031114, 0.14730777, -0.008645322, -0.081631444, 0.009492747, 0.013271115, -0.07937341, -0.14611381,
+        0.030903436, 0.056710318, -0.052582324, 0.0023565541, 0.05124397, -0.002871503, -0.03428324, -0.020075798, -0.09586994, 0.06874416, -0.1460776, 0.014266603, 0.12548758, -0.014833132, 0.019149339, 0.067110665,
+        0.031978, 0.09721106, 0.15037319, -0.08132039, -0.14559546, 0.03900628, 0.070659414, -0.025500715, 0.113382004, 0.05015563, -0.089943625, 0.050034404, 0.110765226, -0.03893364, 0.028160263, 0.123937696,
+        0.060761113, -0.041518364, -0.088151805, 0.10772283, 0.07925102, -0.108962566, -0.08681327, -0.082638055, 0.007019699, 0.1523306, -0.1355483, -0.025030175, -0.049415015, 0.115544245, -0.049190946, 0.023732398,
+        0.14768209, 0.07433577, 0.104122065, -0.006358035, -0.023059143, -0.13221005, -0.15653053, 0.105517246, -0.14252636, -0.03626623, 0.10378827, 0.045708194, 0.025690932, -0.12161996, 0.14431383, -0.123551376,
+        0.079656124, -0.002864767, -0.058698595, -0.08907674, -0.059631296, 0.15529035, 0.03707534, 0.007660682, 0.09052904, -0.021905582, 0.1114062, -0.10464256, -0.10712978, -0.13023095, 0.1167358, -0.06315436,
+        0.12384153, 0.16011271, -0.047032315, 0.16020912, -0.063597485, 0.12261947, 0.13007131, -0.11429153, 0.047021825, -0.119735315, -0.008886438, -0.035805177, 0.032170128, 0.13798983, -0.059312582, 0.12494101,
+        -0.07582323, -0.008509507, 0.017080775, 0.13172011, 0.14344679, -0.117921636, -0.0093343295, -0.12286879, 0.0022008556, -0.14297663, -0.10102238, -0.04400381, 0.083792366, -0.056841858, -0.030322999, -0.12601845,
+        0.07740978, -0.07840797, 0.029925585, -0.031037213, -0.13308293, 0.008271123, -0.086855575, -0.10244288, 0.09493003, -0.122602016, -0.058469173, 0.048257753, 0.07427151, -0.11708692, 0.033310723, -0.07070329,
+        0.08037827, 0.05369241, -0.0501841, 0.14212634, -0.008996886, -0.11307279, -0.12812653, 0.123718016, -0.12866612, -0.13533984, 0.065476984, 0.0647688, 0.14803931, -0.040575244, -0.05741382, -0.09987448,
+        0.08689857, 0.010736218, 0.016489755, -0.0352153, -0.019515311, 0.14687659, -0.120612666, -0.021868931, -0.014373686, 0.039723717, -0.08976228, 0.12745205, -0.06599698, 0.010061704, -0.05262928, 0.16768703,
+        0.04752939, -0.11011079, -0.12334102, -0.13885807, 0.12553608, -0.11090234, -0.052048597, -0.04912932, 0.09421369, 0.03490803, -0.04360167, 0.042267855, 0.10004058, 0.030632602, -0.14080365, 0.06543586,
+        0.09073051, 0.0975263, -0.043688014, 0.0866795, 0.053024724, 0.045093074, 0.060260255, 0.15406896, 0.14394617, 0.094376266, 0.08257523, 0.0816863, -0.118321724, -0.11435339, -0.050693434, -0.06905175,
+        -0.011555867, 0.08077968, 0.00020707135, -0.019599907, -0.078660116, 0.012945079, 0.02883353, 0.07295438, 0.10336179, 0.016385818, -0.07159685, -0.034731925, -0.048206467, -0.14954458, 0.020134997, -0.06838606,
+        -0.044485625, 0.15314423, -0.0142139755, -0.08376773, 0.15312122, 0.14040585, 0.04168196, 0.026796969, 0.1096698, -0.13931039, 0.011350714, 0.10972195, -0.103358604, -0.024967518, 0.040607385, 0.16672973,
+        0.09853895, -0.07729439, 0.13849282, 0.08109375, -0.09113895, 0.11078866, -0.056702062, 0.07851127, 0.07631104, 0.123538315, -0.09938186, 0.050559122, -0.05541992, -0.10380288, -0.11158105, 0.064945996,
+        -0.10780744, 0.14797711, 0.06806071, -0.12612438, -0.06231678, -0.052720957, -0.14261857, 0.13696374, 0.09589609, -0.050376754, 0.014051612, 0.13145095, -0.021549558, 0.06757465, -0.0994994, 0.071047604,
+        0.07933357, -0.07637878, -0.1184402, 0.010179451, 0.069327705, -0.13584705, 0.062393457, 0.006547695, -0.1287192, -0.047133833, 0.0113960095, 0.022917265, 0.030127224, -0.057674006, 0.16121283, 0.16022314,
+        -0.0062958254, -0.076654345, 0.04284244, 0.09770426, 0.03756071, -0.07362961, 0.03950582, -0.11563851, 0.112788096, 0.02644738, -0.052100666, 0.0745958, 0.054559853, 0.05611818, -0.05429175, 0.15489641,
+        0.14112037, 0.059538797, -0.13193582, -0.066014916, -0.08505471, -0.07864396, -0.077678464, 0.055805437, -0.14678212, -0.06057904, 0.118474044, -0.06590702, 0.045107704, 0.059835378, -0.032248013, -0.09477322,
+        -0.1487092, -0.055010866, -0.07664098, 0.0020019652, -0.0056336317, -0.12188678, 0.07104141, -0.09965376, -0.02017703, -0.03783884, -0.07825671, -0.0626845, -0.014488513, 0.011621598, -0.1031573, -0.07484778,
+        -0.12832098, 0.09128304, 0.06041898, -0.020468479, -0.14698055, -0.06638179, 0.09062006, -0.008450372, 0.048649713, -0.09791734, 0.049138196, 0.1417617, 0.12507863, 0.05808749, 0.013985744, -0.14437355,
+        -0.05668922, 0.10210786, 0.097526535, -0.03361625, 0.017928317, -0.062130276, 0.05229596, 0.069030866, -0.13434719, -0.056974176, -0.1298394, 0.0065047448, -0.07385291, 0.12583967, -0.007190895, -0.077635214,
+        0.09391052, -0.09404674, -0.016104765, 0.00041095624, -0.017184606, -0.0141472565, -0.13145962, -0.027383924, 0.062022272, -0.13706401, 0.11729441, -0.09502388, -0.1240273, 0.13221604, 0.014048049, -0.06307271,
+        -0.13248897, 0.035172675, -0.06693935, -0.10277231, -0.13734221, -0.0006898546, -0.020501366, 0.13227096, -0.06364807, -0.15109421, -0.10426424, -0.004589942, 0.004595399, 0.027023302, -0.0069486424, 0.05082564,
+        -0.01921475, -0.13425696, 0.12715562, 0.08933075, -0.13642271, -0.081395596, -0.06257685, 0.018973282, -0.040762614, -0.1436015, -0.048646703, 0.11437495, -0.08966646, -0.10842227, -0.10000939, -0.020888122,
+        -0.08584713, 0.13048267, -0.032786343, 0.0685672, 0.061442338, 0.0005437441, 0.028706966, 0.058418073, -0.14393154, -0.08836676, 0.14740184, -0.11719438, -0.050465673, -0.15042235, -0.017108796, 0.031709548,
+        0.118434876, -0.058992147, -0.12145602, -0.12318407, 0.13797654, -0.14216612, -0.104731806, 0.012732909, 0.09439611, -0.07332437, 0.04252667, -0.088921785, 0.13028233, -0.0139668, -0.07429219, -0.12284533,
+        0.14432767, 0.06522137, -0.0044589974, 0.018527633, -0.09654318, -0.1413984, 0.13403109, -0.15113425, 0.1405995, 0.102304615, 0.0043540043, 0.0019873835, -0.03302894, 0.06149342, 0.060280424, -0.071408525,
+        0.06146922, 0.0392739, 0.05471628, 0.039346993, 0.08853864, -0.15429196, 0.07194888, 0.06570121, 0.10892915, 0.14889108, -0.05852826, 0.082099356, -0.01026426, 0.04408172, -0.046171814, 0.1702017,
+        -0.114407964, -0.03716921, -0.09883206, -0.08362602, 0.0027868082, -0.0058648367, 0.0737369, 0.041182354, 0.102665685, -0.053581554, -0.094421245, -0.033967476, 0.028182607, 0.10984676, -0.032756478, -0.007605214,
+        -0.061555784, -0.073732734, 0.03921577, 0.0539266, -0.033886973, 0.020166362, -0.06439693, 0.10186681, 0.097552605, -0.14961179, -0.15216786, 0.04279222, 0.110175975, 0.10068292, -0.0013690494, 0.06416022,
+        0.056616668, 0.02171672, 0.09061916, 0.045179073, 0.12808323, -0.09656826, -0.13106912, 0.11681396, -0.09237047, 0.025295358, 0.028184267, -0.074950375, 0.07835865, -0.09017344, 0.11051704, 0.027794408,
+        0.12883922, 0.06774122, 0.08939761, -0.03853356, -0.10659786, 0.10130588, -0.11404367, -0.1397703, 0.13579641, -0.080714405, 0.10000454, -0.15570839, -0.06584132, 0.10285327, -0.1340386, 0.120376565,
+        0.011444839, 0.098318756, -0.113480285, -0.119642355, 0.03600269, -0.12751237, -0.118653394, -0.010557371, 0.038097013, 0.08152208, 0.13044578, -0.074428245, 0.0042932946, 0.08761419, 0.10554106, 0.09276099,
+        0.15571424, 0.1253695, -0.07514365, 0.0673726, -0.13122834, 0.0898647, -0.029273542, -0.09450797, -0.12011937, -0.037854332, 0.091096684, -0.01637103, -0.09524502, 0.05109461, -0.12199623, -0.115369745,
+        -0.14468175, 0.004654623, 0.084806226, 0.115447864, -0.13054015, 0.046355445, 0.01696473, -0.13987605, 0.0958421, 0.12583001, -0.14826295, 0.053813238, 0.06182642, -0.12528169, 0.012180877, 0.08679237,
+        0.15068007, 0.060158156, -0.03729313, 0.09573549, 0.072006345, 0.078943625, -0.0574528, 0.12244412, -0.14200112, -0.02794857, -0.10931103, 0.09798059, 0.0014732929, 0.082250275, 0.04247031, 0.047886454,
+        0.05008158, -0.09108593, -0.034834415, -0.120164044, 0.045883648, 0.15749548, -0.119549565, -0.115905695, 0.064343005, 0.09981283, 0.033999447, 0.14187671, 0.036540166, 0.06684982, 0.008546215, -0.051314473,
+        0.12950867, 0.08949089, -0.025451113, 0.12135806, -0.14202382, 0.12311199, -0.11992627, -0.080085404, -0.10596605, -0.09471068, -0.14641371, -0.06651269, -0.12257139, 0.14226814, -0.010276477, 0.07122458,
+        0.11958653, -0.119600244, 0.12455139, 0.057339028, -0.09343649, -0.048426237, -0.0017234458, -0.03312463, -0.027905703, -0.08434819, -0.062716946, 0.07010711, 0.032107845, 0.054079123, 0.06286072, -0.14472242,
+        0.10202036, -0.1002535, -0.050740123, -0.03211133, -0.10487775, -0.0258851, -0.12590805, 0.07383257, 0.010414311, -0.10225808, 0.060977783, -0.06437564, 0.07626612, -0.06082799, 0.027824193, -0.023899259,
+        -0.095112346, -0.10146075, -0.05398516, -0.12428555, -0.059152603, 0.15593714, 0.0065373676, -0.07563815, -0.1285412, -0.035012495, 0.023535928, -0.036446147, 0.08682444, 0.12025595, -0.030165957, -0.048734315,
+        0.04937188, 0.094256535, 0.07946888, 0.061345395, 0.11228511, 0.10887273, -0.06117895, -0.010431386, 0.114501156, 0.15111117, 0.06723785, 0.10004884, 0.02657828, 0.08428702, 0.14146547, 0.1012419,
+        0.0520379, -0.088862546, -0.03887501, 0.002458442, 0.06053646, -0.101048745, 0.032030385, 0.089009695, -0.041763406, 0.11880826, 0.018036637, -0.101792045, 0.058536354, 0.025262835, 0.077773735, -0.069934785,
+        0.05888077, -0.09748137, 0.07564601, -0.039178655, -6.3169595e-05, -0.106018916, -0.061654475, 0.07496749, -0.10388682, -0.12156078, 0.010434686, 0.109375335, 0.052700303, -0.098525085, -0.14419554, -0.0768997,
+        0.007352115, 0.07604995, -0.114748694, 0.06368351, 0.10077751, 0.014618847, 0.0100082215, -0.029126083, -0.044346802, 0.08900813, 0.023245705, -0.020008907, 0.043593336, -0.061518293, 0.055865213, 0.01147422,
+        -0.04370498, 0.01631325, 0.12913246, -0.14586373, -0.14807872, -0.1292986, 0.05805791, 0.08263522, -0.12033097, 0.093261525, 0.14598677, 0.08966621, -0.038529012, 0.010574129, 0.065146774, -0.057739526,
+        0.10710598, 0.14401376, -0.021888508, 0.048211765, 0.06180405, 0.12625279, -0.023839531, -0.10945176, -0.1136195, -0.06349364, -0.12234761, 0.016036786, -0.101528935, -0.14240757, -0.1407571, -0.034964915,
+        -0.11354025, -0.07673247, -0.010171937, 0.097558826, -0.1270216, 0.087289445, -0.110847406, -0.035862576, 0.14101574, 0.094337866, -0.026661793, 0.10944517, 0.13472566, 0.020729529, 0.07602147, 0.11429628,
+        -0.028366761, 0.09990776, 0.1007237, 0.010110868, -0.05549835, -0.118527204, 0.051743094, 0.12864795, -0.04877644, -0.107551716, 0.0019347111, -0.07107544, -0.10185367, -0.11905191, 0.13029045, -0.13546422,
+        -0.13581537, -0.022157593, 0.035156626, -0.017542707, 0.0065798364, -0.0939712, -0.123264655, 0.0504661, -0.15505247, 0.14291787, 0.007878521, 0.03999374, 0.027507624, -0.15421717, -0.09832926, 0.089932226,
+        0.042582206, 0.13227962, -0.01811729, 0.15080799, -0.079234935, 0.11538765, 0.10139674, 0.017942913, -0.11585462, 0.08502641, -0.08448548, -0.052997366, 0.07771965, -0.120189235, -0.13274707, -0.09928192,
+        0.08955798, -0.1314445, -0.07714977, 0.02041455, -0.046132766, -0.12901583, -0.08529621, 0.061271735, 0.12799233, -0.13591883, -0.06371702, 0.025534613, 0.015607635, 0.10558194, -0.00039067733, 0.14209735,
+        -0.025585229, -0.13621686, 0.019457368, 0.08285662, -0.06917319, -0.06921357, 0.12825255, -0.05637874, -0.044878088, -0.06078395, 0.13546431, 0.013095922, 0.04047316, -0.14065035, -0.041873258, 0.14469078,
+        0.09315236, 0.15375522, 0.035148893, -0.13370067, -0.06145241, -0.051274315, 0.15030918, -0.1040316, 0.04034095, -0.112062536, 0.013305873, -0.030331323, 0.054869622, -0.04786933, 0.035757847, 0.08126386,
+        0.0007928056, -0.115045875, 0.14238943, 0.006351131, 0.00454748, 0.053139765, -0.13067994, -0.13401729, -0.0010939371, -0.07839775, 0.03442409, -0.11051459, 0.01672516, 0.1471192, -0.003951954, -0.13703613,
+        0.1209614, 0.12627773, 0.071207225, 0.094620496, 0.040914275, 0.06713349, 0.042327788, -0.07588235, -0.14199269, -0.045955557, -0.14872506, -0.14120103, 0.012911489, 0.019288404, -0.124804065, -0.013687192,
+        0.13624069, -0.07921412, -0.12510882, -0.054353915, 0.11433217, 0.11499006, 0.015219561, 0.12322889, 0.023958417, -0.009685524, 0.026444709, -0.13784814, -0.11304328, -0.020559141, -0.018396286, -0.07140079,
+        0.023891728, 0.039435897, 0.14758454, -0.14048061, -0.13609605, 0.032208405, -0.10623918, -0.121939294, 0.08232987, 0.06937989, -0.08106167, 0.018474104, 0.09727871, -0.027366996, 0.1175704, 0.06566186,
+        -0.0953023, 0.062033616, 0.09321642, 0.023502227, -0.040399186, 0.14602299, 0.11915255, -0.039672382, -0.11637057, -0.040917203, 0.03702144, 0.024654947, 0.08337091, 0.07599021, 0.082567535, -0.03957939,
+        0.12386945, -0.062397886, 0.12694366, 0.049195115, 0.15831463, -0.047864538, 0.057951186, 0.042238347, -0.1298277, -0.036935084, -0.06343642, 0.009778544, -0.13881895, 0.022941085, 0.047498036, 0.09841228,
+        -0.116290666, -0.017900895, -0.010365077, -0.01030733, 0.13595037, 0.12824386, -0.024878113, -0.08787875, 0.03811219, -0.13268964, -0.042760506, 0.13839184, -0.06686807, 0.112943664, 0.105044685, -0.043026995,
+        0.056500625, -0.091983505, 0.09991333, 0.13918172, -0.13792127, -0.09514756, 0.124708824, 0.0746449, 0.16497967, 0.09544191, 0.09226521, -0.07869641, 0.10364703, 0.13811259, -0.0058941296, -0.07652956,
+        -0.10744919, -0.056336466, 0.070834905, -0.0879254, -0.08345531, 0.107741885, -0.12678792, -0.010603273, 0.070929274, -0.11064588, 0.00907398, -0.11374889, 0.031998374, 0.13548632, -0.07885019, -0.10302353,
+        0.019560155, 0.12213587, 0.13863473, 0.10921104, -0.024146369, 0.015504966, 0.04450072, -0.09551374, -0.054976463, -0.015516429, -0.008415361, 0.073345676, -0.078410946, 0.0071373, -0.018008543, 0.03745988,
+        -0.13620856, -0.058806017, 0.058823045, 0.14831343, -0.024547659, 0.009459083, -0.010021645, -0.045311872, -0.045554865, 0.0653517, 0.13172121, -0.066133864, 0.0061397366, 0.07358765, -0.07408372, 0.14062136,
+        -0.13926125, -0.01743331, -0.06807734, 0.08217195, -0.10403417, -0.08481572, 0.12766476, -0.017959295, -0.084227994, -0.08563416, -0.0046787355, -0.099617906, 0.09826758, 0.15925114, 0.119227126, 0.039586265,
+        0.013461223, -0.029565362, 0.05240822, -0.08404575, -0.06057989, -0.10365741, 0.056639303, -0.029900985, 0.06552119, 0.04898163, 0.020949436, 0.062363148, 0.08386274, -0.015565781, 0.13396904, 0.061541274,
+        0.033981636, 0.10016765, 0.08672423, -0.080754995, -0.031812787, -0.064719774, 0.10568391, 0.03937585, -0.14793804, 0.042813998, 0.055345643, -0.0876642, -0.061202396, -0.08349261, 0.036453154, -0.03760251,
+        -0.037172806, 0.034253955, -0.09258724, -0.12131787, -0.025267988, 0.15372457, -0.034269482, -0.0017980873, -0.08461519, -0.08900055, -0.063464925, -0.007883702, 0.09969579, -0.00012766765, -0.019006135, -0.13838519,
+        0.10665614, -0.1098001, -0.14471753, -0.06772024, 0.1370436, 0.12473686, 0.15694274, 0.15421796, -0.034171272, -0.038225498, 0.093510196, 0.048819833, 0.13003103, 0.048665494, 0.13390835, 0.09622178,
+        -0.06613194, 0.08271415, 0.120288335, 0.11967684, 0.10917813, 0.034161195, 0.14645858, 0.115197174, 0.079105966, 0.020655563, -0.012952967, 0.14549819, 0.014812636, -0.0050098905, 0.042108804, 0.0034419284,
+        0.15398656, 0.15987308, 0.009882284, -0.02278711, 0.09491018, 0.096915685, 0.12985037, 0.14852095, -0.11610796, 0.14043705, 0.060976736, 0.115647696, 0.021697925, 0.10308348, 0.0050498294, 0.09722561,
+        -0.097363785, -0.009008439, 0.1629315, 0.110699184, -0.057349447, 0.042267106, 0.0025696645, 0.014679464, 0.109616764, 0.06194597, 0.044756263, 0.008536527, 0.02738438, 0.061502825, 0.02446662, 0.086329415,
+        -0.10455961, -0.011741372, 0.070459634, -0.026602888, -0.06489863, -0.035006404, -0.14839782, 0.043195017, -0.045569416, -0.06917236, -0.01767777, -0.04878475, -0.11117249, 0.030288024, -0.0541929, 0.16589758,
+        0.13499822, 0.11517228, 0.08086076, 0.13914837, 0.10834012, -0.06285178, -0.14764163, -0.046458326, 0.10398358, 0.03914062, -0.09022552, -0.041454677, 0.11353294, -0.103581406, -0.08789926, 0.13238582,
+        -0.124876566, -0.028299136, 0.01609789, -0.12700967, 0.12720719, -0.058257885, 0.1383667, -0.08159904, -0.0015308879, 0.0118298, 0.11687506, -0.09739834, -0.09497157, -0.08258675, 0.13963208, -0.0598294,
+        -0.06810061, -0.07081432, -0.02409123, 0.09209909, 0.005590966, 0.11632846, 0.13501951, 0.15676978, 0.108432315, -0.056662016, 0.023648445, 0.00199713, -0.0428285, -0.12824495, 0.13254425, -0.06709045,
+        0.10250612, 0.010898109, 0.051959142, 0.05986701, -0.08537249, 0.072599694, 0.06510699, 0.0635488, -0.12972459, 0.1292022, -0.021046124, 0.12082414, 0.13131288, -0.012123928, 0.14405078, 0.07194337,
+        -0.10731683, -0.103128, 0.0066185733, -0.13579318, 0.0052698767, 0.1170195, -0.024227638, -0.13719074, 9.362101e-05, 0.1597118, -0.072490804, 0.016745606, 0.057212655, -0.043536, -0.13700119, -0.142433,
+        0.113949545, 0.0832472, 0.079153776, 0.036685243, 0.059770163, 0.020787971, -0.14300361, -0.009054807, -0.07102393, 0.018698476, -0.14013134, 0.047166955, 0.09968376, 0.024475647, -0.08166123, -0.073217824,
+        -0.1428296, 0.033326693, 0.09748021, 0.039548773, -0.098516084, -0.13724862, -0.13992392, -0.024081636, -0.09758398, -0.12044402, 0.05032945, -0.056514025, 0.082599014, -0.04996663, -0.10124474, -0.041052036,
+        0.039801814, -0.050688613, 0.021562502, 0.11459724, 0.058858532, 0.07803665, -0.14470814, 0.0977398, 0.122328565, 0.120578945, -0.09786697, 0.034950558, -0.10952368, 0.0018030795, 0.14173643, -0.052509822,
+        -0.048254233, 0.05105612, 0.09940957, -0.1106032, -0.115304455, -0.13145821, 0.0014195717, 0.05752313, 0.007859098, 0.09651862, -0.111311436, -0.068802774, -0.027799131, 0.032599438, -0.09987265, -0.13366711,
+        -0.12126853, 0.05146392, -0.054035652, -0.14869617, 0.13571213, 0.13397433, 0.059429184, -0.1405256, -0.07843679, -0.09825565, 0.08163134, 0.023127485, -0.048659697, 0.047966126, -0.0738388, -0.044748172,
+        -0.0960517, -0.07395275, -0.036833283, -0.016274096, 0.107922144, -0.05434903, 0.016881686, -0.07102789, 0.057012986, 0.029079057, -0.09906904, 0.027071398, -0.060958654, -0.122838624, -0.122509606, -0.12535548,
+        0.13424945, -0.15973839, 0.118846156, 0.05159862, -0.15128204, -0.010739404, -0.10734477, -0.023511445, -0.095169805, -0.07688517, 0.071638875, 0.12723233, -0.06300249, 0.11179462, 0.086715266, -0.06060892,
+        -0.03511544, 0.090037204, -0.07723226, -0.081983194, -0.015056418, -0.0325752, 0.05163846, 0.026901046, 0.054325294, 0.066893846, -0.04874512, -0.032360774, -0.039859295, -0.1556522, -0.046704564, 0.03093348,
+        -0.013738582, 0.05620218, 0.10152578, 0.14818446, 0.12060167, 0.008239539, 0.13624208, -0.12657702, -0.0770136, 0.008075706, -0.08924221, 0.013775675, -0.03928467, -0.15543291, 0.14266264, -0.0124576185,
+        -0.0461307, -0.09145366, -0.00057926925, 0.13029422, -0.021379726, -0.15531006, 0.123657994, -0.106449686, -0.11935477, 0.063123405, -0.117020056, -0.13129553, -0.05507231, 0.11855706, 0.017928172, -0.13559066,
+        0.1144708, 0.009222991, -0.056465935, -0.075927846, 0.113580085, 0.009349197, 0.08930016, -0.14041145, -0.09174638, 0.027433822, -0.057260226, -0.028993366, 0.11480418, 0.013259672, 0.060646523, 0.13982935,
+        -0.13682963, 0.050435394, 0.03690309, 0.077199884, 0.05035839, 0.0025812164, -0.028912492, -0.13016866, 0.099942654, -0.021655776, 0.059190627, 0.12757978, -0.11465444, -0.035636578, 0.03868987, 0.15010364,
+        -0.017080106, 0.14451772, 0.065130934, -0.14287503, 0.088791, 0.1068698, 0.08465068, 0.10086327, 0.15489039, -0.14005396, 0.08255734, 0.04943061, 0.13137265, -0.085065655, 0.09465667, 0.08704268,
+        -0.15154742, -0.12898, 0.032902647, 0.054058358, -0.0023391957, -0.043130822, -0.057691947, 0.08584146, 0.051803205, 0.09621628, -0.049304027, 0.045369685, -0.10024022, -0.093795665, 0.06484662, -0.14812288,
+        0.026271708, -0.020075375, -0.1327284, 0.15769254, 0.03223502, 0.13719933, 0.05048162, 0.08767037, 0.010610347, -0.02269602, -0.08775947, 0.10696526, 0.023346597, -0.04829111, -0.07330493, -0.09386659,
+        0.003244204, -0.07432884, 0.13271914, -0.092700996, 0.007970002, 0.124461174, 0.027082887, -0.019195238, -0.022133583, -0.0013000189, 0.0068418323, 0.023240428, -0.12215936, 0.029859865, -0.044189308, -0.03532998,
+        0.079741456, 0.064613715, 0.15016119, 0.02876599, 0.0011033353, -0.013807951, -0.14061415, -0.12484541, -0.11423567, -0.046930976, -0.051437836, -0.0629565, 0.03956997, -0.012904259, -0.00479461, 0.08912343,
+        0.016621986, -0.06833617, -0.0066437516, 0.11357484, 0.038730733, 0.081863575, 0.12703498, 0.08433103, -0.07900864, -0.038102895, -0.079857, 0.0742323, -0.016162883, 0.021718606, 0.07389113, -0.06368403,
+        0.043804284, -0.043506343, -0.115955204, 0.065820105, 0.041318934, -0.046517085, 0.054627776, -0.10308496, -0.12744746, 0.13482699, -0.058792785, -0.022909569, -0.037666794, 0.061642908, -0.06516692, 0.098663986,
+        -0.13051602, 0.026362162, 0.12843423, 0.008232106, 0.03917078, -0.0062568737, 0.082405195, 0.034084138, -0.09933306, 0.1266091, 0.13926715, -0.11989036, -0.038652778, 0.008834972, -0.07693818, 0.00021528854,
+        0.12008587, -0.11204617, -0.14353268, 0.11018716, -0.052102763, 0.025515161, 0.119116664, 0.03602051, -0.00095778814, -0.009180256, 0.014262143, 0.13167958, -0.023606518, -0.06720728, -0.045031395, 0.13820903,
+        0.104156904, 0.14687636, 0.084478445, 0.075370416, 0.01276846, 0.039038654, 0.11895436, 0.12138556, -0.106295474, 0.091127425, -0.09794314, -0.1444203, 0.074800804, -0.17574319, -0.0855379, 0.029169884,
+        0.14422382, -0.121049635, 0.055406075, -0.0036457796, -0.13395742, -0.14036618, 0.05478795, -0.039248195, 0.074385114, 0.12122073, 0.050906032, -0.008518931, -0.14460836, -0.07141528, -0.031653736, -0.13514167,
+        0.0064856987, 0.1117017, 0.04770898, 0.045279257, -0.08239599, 0.109613486, 0.0025984843, -0.150977, -0.1052527, 0.11137636, 0.0061601037, 0.099752605, 0.0056484556, -0.03411199, 0.096723475, -0.04956071,
+        -0.01736704, -0.12818396, -0.021495156, 0.014995262, -0.10351907, -0.11438653, 0.019004706, -0.036234844, 0.07217034, -0.1316282, -0.1326674, 0.043401342, -0.004583106, 0.13118955, -0.101049274, 0.011607075,
+        -0.0010040022, 0.11915548, 0.1415513, -0.1040384, -0.118969254, -0.1396725, -0.017123813, -0.10127447, 0.036756154, 0.06496893, -0.0635926, 0.124144696, 0.021885118, 0.042761747, 0.07752999, -0.01725103,
+        0.13558353, -0.120053135, 0.05701053, 0.056305766, 0.009296002, 0.109018035, -0.13940392, -0.12830733, -0.0969565, 0.039639656, 0.062297028, -0.083440736, 0.00025219345, -0.0017773072, 0.055133894, -0.13788734,
+        0.099297, 0.064872794, -0.12317083, -0.109071985, -0.06390459, -0.062834375, 0.053762194, -0.04064384, 0.06575985, 0.09223759, -0.03124347, 0.12651774, 0.042786267, 0.011065093, 0.02165051, 0.07702437,
+        0.032073494, 0.05807682, 0.115181185, -0.13747019, 0.12867713, -0.06955761, -0.116295926, -0.08553379, -0.123069026, 0.14155222, -0.054618586, 0.08997563, 0.05840542, -0.027192986, -0.050462004, 0.012698898,
+        -0.00037541724, -0.025363976, 0.010627904, 0.097805336, 0.08634742, 0.03631028, 0.11378746, -0.12078025, 0.06497549, 0.005785178, 0.08113132, -0.06403724, -0.15276878, -0.11581045, -0.012271556, -0.013962974,
+        -0.050259523, 0.15091708, -0.13894486, 0.005112511, -0.15384598, 0.1452408, 0.11459214, 0.14824636, -0.09000481, -0.06858914, 0.12978885, -0.14231983, -0.0050880746, -0.053334665, -0.10915877, -0.08248552,
+        0.07645444, -0.11073182, 0.07397291, -0.09110666, -0.043809228, -0.006567376, 0.10264633, -0.14784461, 0.118380144, 0.026677232, 0.052632008, -0.11072211, 0.047972746, -0.09596734, -0.12856717, -0.1361874,
+        -0.06387448, 0.091092266, 0.042198155, -0.055901635, 0.06537742, -0.09342262, 0.058486763, -0.15616159, -0.049691066, -0.0014222439, 0.097328216, -0.006615873, 0.11146856, 0.015577234, 0.06694662, 0.08927094,
+        0.08346536, -0.099731915, 0.0061781984, -0.10021667, -0.064648554, 0.020229015, 0.052361492, 0.11319304, 0.09296868, -0.101979226, 0.09583767, 0.06567238, 0.028830137, 0.11321318, 0.012194476, -0.023008585,
+        -0.07090585, 0.100470796, -0.103966966, -0.01417246, -0.12783118, 0.037723683, 0.063963205, -0.048279822, -0.15046178, 0.08551964, -0.10299668, 0.025272438, -0.13316163, -0.081587985, -0.061428636, 0.07265662,
+        -0.04071819, 0.14844334, -0.07750796, 0.077175885, -0.15088984, -0.0864064, -0.06975426, -0.11798338, 0.07424781, 0.044675294, -0.02000452, -0.09134082, 0.06491718, 0.12776709, 0.14876252, 0.012120947,
+        0.08132364, 0.056901727, -0.031877715, 0.01963967, -0.045169372, 0.12923047, 0.086653315, -0.034121104, -0.08934199, -0.034051105, -0.13482904, 0.101236396, -0.10074627, 0.14723833, -0.1534286, 0.059348688,
+        0.1364574, -0.109897286, -0.055015344, 0.013086333, -0.017509919, 0.046977438, -0.118923746, 0.11713686, -0.12930983, -0.012978543, 0.14035808, 0.0011384314, 0.07381142, -0.080106415, -0.0015475397, -0.1251847,
+        0.0029163284, 0.108542755, 0.05695495, 0.019056214, -0.09780344, 0.12196507, -0.097577564, 0.062767185, 0.041959777, -0.044899464, 0.0063515087, -0.039713804, 0.08153872, -0.020052658, 0.04227691, -0.011296169,
+        -0.0686245, 0.048547577, 0.10781083, 0.0030568147, 0.07421838, 0.11727824, 0.12699942, -0.13815723, 0.05649202, -0.10134333, 0.13566482, -0.07299397, 0.10240138, -0.034006182, 0.061908215, 0.12054485,
+        -0.0022361046, 0.007962664, -0.09512996, -0.09356283, -0.06469284, -0.075698316, 0.109503336, 0.12094919, -0.015925935, 0.059664823, 0.15533487, -0.13731986, -0.0513307, -0.087213196, 0.108602114, -0.004677757,
+        0.037183054, -0.116547704, -0.03561432, -0.086218365, -0.12278928, -0.035503782, 0.061370745, -0.049592104, 0.08995391, 0.07843498, 0.13803472, 0.037702844, 0.11396803, 0.10571511, -0.02571679, -0.09273852,
+        -0.023972906, -0.006538253, 0.07776094, 0.04696052, 0.12505135, -0.032436732, 0.02072699, -0.10564917, -0.018981276, 0.06983742, -0.018305138, -0.08602347, 0.059773594, -0.036011152, 0.01869718, -0.037132416,
+        -0.017796062, 0.104682386, -0.028955959, -0.09070268, -0.11641769, -0.0008524298, -0.0041774423, 0.07309626, 0.08070712, 0.0049989047, -0.10645888, 0.14694943, 0.09066418, -0.10024927, 0.12350874, -0.13885327,
+        0.013815014, -0.025144048, 0.090795055, 0.107532695, 0.13276054, 0.04279695, -0.034089614, 0.039862428, -0.026231533, -0.10795107, 0.06706589, -0.1508721, 0.073189326, 0.08470792, -0.012136431, 0.123289056,
+        0.02454733, -0.09800442, 0.092268676, 0.045260664, 0.13189498, -0.10536532, 0.0015164074, -0.109805234, -0.031289216, 0.059341125, 0.07499972, -0.14390819, -0.09031726, 0.15298943, 0.075844, 0.092044435,
+        0.08628757, 0.07756469, 0.029180955, -0.12591054, -0.054149423, -0.012532871, -0.1484165, -0.05684347, -0.038027365, -0.10861881, -0.036187876, 0.14651997, -0.052776147, -0.10717541, -0.12412191, 0.03876986,
+        -0.14659089, 0.06320595, 0.1334679, -0.067764364, 0.03440227, 0.034766622, 0.1461804, -0.10037555, -0.13058612, -0.05252302, -0.040058427, 0.07089713, 0.09339878, 0.04177032, -0.09409109, -0.046598505,
+        -0.12544681, -0.001206651, -0.010152205, -0.14797285, 0.090578526, 0.129587, -0.00025319651, -0.002097429, 0.015939565, -0.071456105, 0.15368362, -0.0012158462, 0.058211565, 0.112531245, 0.13845627, 0.082330085,
+        -0.10654344, 0.15142237, 0.0067194058, -0.033221975, -0.034291614, -0.12574115, -0.05942056, -0.14858817, -0.046489842, -0.116059996, -0.059678786, -0.05893196, 0.0385985, -0.1110214, 0.019212924, -0.07699566,
+        -0.05086748, 0.09073823, -0.052152243, -0.034027047, 0.109408915, -0.09607498, 0.021522567, 0.081051014, 0.058663867, -0.025767796, -0.10448192, 0.012469179, 0.124459274, 0.085135974, -0.038857874, -0.016608426,
+        0.13111423, 0.12806152, 0.071519256, -0.05184531, 0.069224626, -0.068615966, 0.09624836, 0.08442161, -0.12269801, -0.06296924, -0.15166704, 0.014606978, -0.092821844, 0.1357079, -0.04245163, 0.0034705375,
+        0.01921581, 0.023516113, 0.15497966, -0.021149796, 0.066965856, -0.08740436, -0.06901072, 0.11670352, 0.04943691, 0.06616551, 0.1129528, 0.13671263, -0.113366395, -0.1251598, 0.10890739, 0.02362743,
+        -0.10599805, -0.052182373, 0.06754597, 0.013884093, -0.12699251, -0.051268965, 0.04935591, 0.13276352, -0.054586504, 0.114905, 0.091560654, 0.010799416, -0.11752545, -0.011583382, -0.13055377, -0.04387131,
+        0.05248892, -0.083278224, 0.023442388, 0.13319494, -0.10129572, 0.074627586, -0.035734788, 0.14541124, -0.051064618, 0.012981235, -0.17321408, 0.12217678, 0.12086825, -0.08439001, 0.015443417, -0.0955093,
+        -0.06450073, 0.13867247, 0.09062035, -0.031966485, -0.1184568, 0.091914065, 0.14276174, -0.065820865, 0.026114166, -0.117608495, -0.09883444, -0.1318701, 0.05514554, -0.0094594, 0.1576619, 0.038520675,
+        -0.0722422, -0.02208185, -0.124535866, -0.036948457, -0.14370489, 0.12895817, -0.023759887, 0.018673094, 0.11723821, 0.027088972, -0.15122198, -0.08193181, -0.08061202, -0.054103695, -0.018261852, 0.05928073,
+        -0.008073568, -0.0007043037, 0.060507037, 0.117109485, -0.036596242, -0.017136728, -0.047395855, -0.032517467, 0.084945746, -0.12565595, -0.12813862, 0.12121175, 0.0434231, 0.12800735, -0.024280032, -0.08191836,
+        0.12262166, -0.07005715, -0.07528511, 0.11668815, 0.081424095, -0.11513032, 0.070404895, 0.072939254, -0.07907504, 0.12674949, 0.13395937, 0.043288242, 0.018795663, 0.07942961, 0.131169, 0.13986537,
+        0.13037972, 0.12839602, -0.0056570643, 0.057494324, 0.12242621, 0.10534004, -0.018805228, 0.075003274, -0.10394311, 0.1010047, 0.019512929, 0.11610138, -0.028166603, -0.0046599377, -0.080331124, -0.06950752,
+        0.15094785, -0.10441889, 0.08407429, -0.13060623, -0.013592546, 0.12182775, 0.0846935, -0.03213916, 0.048461538, 0.060560323, 0.08468552, 0.023476087, 0.063298814, 0.08440053, -0.12231394, 0.028895192,
+        0.023092909, 0.16701762, -0.07177617, -0.0056354813, -0.023169702, -0.059857003, 0.016557043, 0.025440909, 0.03148488, -0.036687236, -0.10394581, 0.045240406, -0.08004333, 0.046631888, 0.08886416, 0.109934784,
+        0.029202329, 0.10795498, -0.11121951, -0.03579073, 0.0037543788, 0.10174481, 0.08402756, 0.0328398, 0.097163685, -0.13431218, 0.06904643, 0.14603756, -0.015471439, -0.09524103, -0.09775768, -0.04035851,
+        -0.11330536, 0.15427196, -0.08816415, 0.02531137, -0.033419058, 0.06252412, 0.015693953, -0.109456606, -0.037751112, -0.03633132, 0.059066582, 0.111225076, -0.013420794, -0.044215456, 0.019062925, 0.14966834,
+        0.09483763, 0.16380577, -0.13642241, 0.01713334, -0.095498234, 0.044180192, 0.09041506, -0.047737926, -0.049691997, -0.0516187, -0.13836734, 0.086427785, 0.058232043, 0.12064983, 0.06362195, -0.0046495176,
+        -0.10328401, 0.0897059, 0.10182724, -0.048748236, -0.0790868, -0.04058047, -0.059681434, 0.027656931, 0.08053897, 0.009589052, 0.014954758, 0.0653279, -0.111500956, -0.011546983, -0.08141182, -0.04694713,
+        0.10063297, -0.1370326, -0.1442535, -0.07022764, 0.12462506, 0.15491585, -0.057697225, 0.14688806, -0.13111821, -0.026190396, 0.14141479, -0.0136109, -0.015911475, -0.091590874, 0.05672895, -0.12780799,
+        0.12483588, -0.08607818, 0.13745227, -0.12961659, -0.01462241, -0.09880197, -0.023029096, -0.09445009, 0.09701694, 0.08025499, -8.5429034e-05, -0.116791524, -0.09941832, 0.107373565, 0.08404612, -0.015832325,
+        -0.013677444, 0.030166503, -0.098794274, -0.02353942, 0.0059646848, -0.074345775, 0.05903505, 0.107721165, 0.020333203, 0.02807816, -0.12438462, 0.082380496, 0.08609491, 0.08723621, -0.05467395, 0.1339074,
+        -0.15471521, -0.1088076, 0.14254233, -0.047345046, -0.12145, -0.13528794, -0.00059104146, -0.026095293, 0.14804359, 0.0077362168, 0.057215024, -0.09937237, -0.07028458, 0.08424094, -0.010852241, -0.121220276,
+        -0.14140755, -0.12061979, 0.0874629, -0.09570865, 0.09957823, 0.054860823, -0.039830044, -0.104162805, 0.09372793, 0.11349423, 0.12058325, 0.07124457, -0.12598146, -0.054183636, 0.0464613, 0.00062177744,
+        -0.061395332, 0.006202139, -0.115767844, -0.13396244, -0.030267524, 0.0006641735, -0.07624892, -0.07468286, -0.12974864, 0.09059511, 0.12199606, -0.008990749, -0.13842939, -0.0047957487, -0.02663236, 0.14489433,
+        0.071679756, -0.050863102, 0.1199337, -0.044833403, -0.042380363, 0.006294883, 0.13314955, 0.1527745, -0.10873775, 0.025316162, -0.025306461, 0.10816081, -0.056032702, 0.011360989, 0.019514944, 0.08094219,
+        -0.119054414, 0.12503308, 0.10733172, 0.05789824, -0.097692065, -0.029501596, 0.0147538725, -0.09427224, 0.11328341, -0.06464305, 0.12950431, 0.01818493, -0.010855378, -0.10242102, -0.095572665, -0.102824576,
+        0.012152866, -0.040746186, -0.048359115, 0.101057924, 0.00419613, 0.047143426, -0.13467528, 0.059122384, -0.0437881, -0.012322353, 0.106638744, -0.004597633, -0.13229741, -0.045925684, 0.14669847, 0.08843868,
+        0.01135635, -0.030686703, 0.1363354, 0.0074056224, -0.030124309, -0.019372426, -0.09834323, 0.024834448, 0.07303916, 0.12197978, 0.13568807, -0.0020821928, -0.048920352, -0.0864335, -0.12271615, -0.04248339,
+        0.050383985, -0.028441766, -0.10741248, -0.027698958, 0.0913806, -0.014375023, 0.10450211, 0.11925786, -0.050482105, -0.032089338, 0.12373505, -0.10179253, -0.108147636, 0.0034376325, 0.11036069, -0.09427844,
+        -0.03167764, -0.06478105, -0.07649391, -0.07926825, 0.04193879, -0.07827663, 0.09312969, 0.07800698, -0.0930522, -0.08350027, -0.08600575, 0.08245196, 0.006995318, 0.06550361, 0.038683325, 0.09509888,
+        0.14917009, 0.14595312, 0.09029639, 0.15296288, -0.11984232, 0.10266946, -0.08455945, 0.11266822, 0.08960874, -0.035675365, -0.02099877, -0.1191263, 0.027287154, -0.09511515, 0.094839394, 0.15118231,
+        0.12138188, 0.069289915, 0.12952834, -0.10832812, -0.071745925, -0.12304339, -0.10239177, -0.0651432, -0.027859194, -0.010070008, -0.07803749, 0.040863145, 0.08923574, 0.044353355, 0.08921755, -0.036592603,
+        -0.05037912, 0.08010724, 0.041552857, 0.037563156, 0.013663834, 0.047687124, -0.085271254, -0.02841539, 0.12165401, 0.09697271, -0.15477516, 0.157688, 0.06604808, 0.028886046, -0.12742898, -0.0153923165,
+        0.14936133, 0.049080115, 0.043044005, 0.053332426, 0.013327012, 0.024371136, 0.07262157, 0.1206254, -0.10810479, -0.06956517, -0.06097284, 0.039120443, -0.044308305, 0.051595483, -0.037688173, -0.03545528,
+        0.121966764, 0.16123806, -0.105683364, 0.105687864, -0.032225307, -0.14033915, 0.047757618, 0.07426789, 0.025996692, -0.0832305, -0.10157342, -0.039946012, -0.06400131, -0.09809342, -0.0069150776, -0.111925066,
+        -0.068368845, -0.050134845, 0.07484593, -0.070722364, 0.03991419, -0.011198581, 0.012488019, 0.070110045, 0.027401695, 0.09997321, 0.053430628, -0.09438518, 0.063281715, 0.11712028, -0.057752647, 0.030942447,
+        0.10984088, 0.061490756, 0.06551694, 0.048392672, -0.12333592, -0.03179334, -0.1352216, 0.07395588, -0.10062045, 0.049572572, 0.0624587, -0.15046243, -0.16351117, 0.094116785, 0.1465935, 0.14603618,
+        0.016147958, -0.05759158, -0.1177479, -0.12904936, 0.14597449, 0.068918526, -0.13789497, -0.11934753, 0.011568022, 0.1100228, -0.06228312, 0.16752747, -0.038656212, 0.00058974704, -0.036981508, 0.08284564,
+        0.13195238, -0.13786244, 0.043652404, 0.0671812, -0.08719917, -0.06617759, -0.109439984, 0.09589803, -0.12893462, 0.016625669, -0.17120753, 0.026905254, -0.09778859, -0.03374363, 0.0068869223, 0.14409453,
+        0.030059278, 0.10595955, 0.16438591, 0.108724274, 0.053630497, 0.01907376, 0.010754923, 0.14079669, -0.025427368, -0.1264206, -0.0029556754, -0.094950244, 0.09066458, -0.07393165, 0.059423804, -0.12988538,
+        -0.082167156, 0.11975853, -0.033260293, -0.03393091, -0.035653766, -0.044928364, 0.11789027, 0.09162673, 0.024955472, 0.041970253, -0.12707143, 0.082320176, 0.058043722, -0.10170917, 0.017476408, -0.019861905,
+        0.112372, 0.13181765, 0.10833731, -0.10332132, 0.08920036, 0.10935769, 0.1042654, -0.008792145, 0.044892088, 0.022277076, 0.11235191, -0.06313734, 0.037702985, -0.07406633, -0.1539752, 0.0145698255,
+        -0.11733306, -0.068716414, -0.068913266, -0.07094111, -0.12669368, 0.14604788, -0.07787285, 0.14221677, -0.146565, -0.028837262, 0.10945932, 0.13810977, -0.052765418, -0.07400015, -0.13906436, 0.017202679,
+        0.10729074, -0.07885882, -0.03104353, -0.08388708, -0.08188555, -0.11497128, 0.16808523, -0.06412787, 0.121135734, -0.05478951, 0.14401664, 0.05848903, -0.0055600125, 0.11006038, -0.029390436, 0.05773468,
+        0.08660478, 0.14135939, -0.07703274, 0.03116399, -0.15319112, -0.06569089, 0.08307709, 0.022984486, 0.08519841, -0.12802964, -0.15193576, -0.10134476, -0.11118206, -0.052942745, 0.083289824, -0.134174,
+        -0.048638627, 0.014305033, 0.0210803, -0.15198636, 0.02735266, 0.11070928, -0.14494464, 0.019695368, 0.042040814, -0.15672362, 0.0006261231, 0.046278995, -0.08489198, -0.033542622, 0.033075977, 0.0019221839,
+        0.014130064, 0.002653316, 0.08543446, 0.12799081, 0.11457854, -0.08234483, -0.10866672, 0.12329095, -0.028040051, -0.009262581, -0.08027342, 0.004993342, -0.041847885, 0.08134438, -0.03672471, 0.012295865,
+        0.10422973, -0.09898388, -0.021922363, -0.07369724, -0.15552366, -0.08932601, -0.045963623, -0.076260895, 0.078949705, -0.15132399, -0.090701096, -0.07822722, 0.08218867, -0.08307415, 0.014195982, -0.052736644,
+        0.12309891, -0.07225677, -0.029758949, 0.13990611, 0.087674014, -0.044009864, 0.06386886, 0.048600312, 0.059742637, 0.009094911, 0.11394977, -0.082977116, -0.12486269, -0.002566007, 0.09989556, -0.117892,
+        -0.009144902, 0.007969791, 0.13134404, -0.10258865, 0.14705417, -0.013704028, 0.06909178, 0.13194507, -0.11686613, -0.010615182, -0.037342474, 0.005249363, -0.12641478, -0.089413434, 0.06323514, -0.1221299,
+        0.1317523, -0.069343045, 0.063360296, 0.101831794, -0.12022029, 0.023494503, -0.08747238, 0.053609736, -0.103655964, 0.00915372, -0.14278689, -0.03986899, 0.022548772, 0.024984509, 0.14203152, -0.10879955,
+        -0.08398434, -0.12544486, 0.10349827, -0.1565382, 0.06991482, 0.03724185, -0.04434541, 0.009624128, -0.11156597, 0.0093426965, 0.009329829, -0.08540759, 0.11334711, 0.134195, 0.14066118, -0.11253493,
+        0.11405439, 0.016535906, 0.086307, 0.006220879, 0.14533585, -0.09139812, 0.11951328, 0.1180639, 0.094356395, 0.08202182, -0.06456704, -0.07697734, 0.12104306, -0.03159774, -0.030406246, -0.06171972,
+        0.107004166, 0.021103261, 0.068926446, -0.12221881, 0.08995248, 0.052253317, 0.06736984, 0.015814375, 0.026959097, -0.13489452, 0.08044166, -0.13173033, 0.084180385, 0.07733181, 0.0691536, -0.11248214,
+        -0.058954746, -0.11636098, 0.03541153, 0.027216105, 0.09977463, 0.09980402, 0.022186205, -0.06087525, 0.07985026, -0.04119464, 0.063921094, -0.068137996, -0.03883232, -0.060639728, 0.1639268, -0.080346,
+        0.08116321, 0.01933342, 0.1101187, -0.08741886, 0.10656313, 0.15416619, -0.12555167, 0.09392551, 0.084426165, 0.06126285, -0.030336266, 0.10773298, 0.09489057, -0.12791364, -0.10168383, -0.03798368,
+        -0.023561815, 0.053587213, -0.09298253, -0.00057620805, -0.045936346, 0.006406248, 0.103635155, -0.11318515, 0.0071763187, -0.10895728, 0.09601388, -0.025756152, -0.049751114, -0.09212724, 0.12731099, 0.04613117,
+        -0.030799657, 0.037135154, 0.026493989, -0.13981627, 0.040163394, -0.0478227, 0.0983707, 0.13671282, -0.08291154, -0.100772746, -0.09776326, 0.033880126, 0.06717844, 0.1354822, -0.019984182, -0.14993468,
+        -0.12332159, -0.060573854, 0.0070813806, 0.15916546, -0.03454299, -0.0070167696, -0.13143107, 0.06408355, -0.12179974, 0.06160721, 0.07672629, -0.06197154, -0.1278557, 0.08493849, 0.08565129, -0.10504653,
+        -0.111892045, 0.10876271, 0.031596158, -0.14861041, 0.012843217, -0.036103923, 0.10598012, -0.13144413, -0.03432974, 0.08854886, 0.08421751, -0.09384873, -0.1405373, -0.11797543, -0.054099742, 0.026264083,
+        0.06374094, -0.13103545, 0.058795393, 0.08643758, -0.09857991, -0.06837826, 0.07770605, -0.0019582603, -0.10881229, -0.113583036, -0.0074095093, -0.018835714, -0.1315768, 0.05027803, 0.014844483, -0.068537325,
+        -0.14625074, -0.056942333, 0.00683532, -0.0055450187, -0.118444435, 0.14159189, -0.036310345, 0.0238901, -0.1413263, 0.014760644, -0.04054433, 0.13801074, 0.119846165, -0.0060501485, -0.06335015, 0.13442692,
+        -0.0297689, 0.01987287, -0.042751767, 0.03581917, 0.10564283, 0.14323787, -0.05436503, -0.09313684, 0.14437972, 0.047160737, 0.1558894, 0.04940344, 0.1284489, 0.11898202, -0.023342041, -0.08650384,
+        -0.12578458, -0.025861217, -0.075691536, 0.10158655, -0.11844981, 0.03421419, 0.12298552, -0.050447613, -0.090747744, 0.12506263, 0.009500726, -0.12084704, 0.12966973, -0.0006872547, 0.010728342, 0.06790493,
+        0.092764884, 0.1205565, -0.15623717, 0.0730278, -0.12333359, -0.006802028, 0.02722667, -0.02113162, 0.035214737, 0.006687643, -0.14230654, -0.04514795, -0.12658502, -0.076426744, 0.14784688, -0.06779091,
+        0.09938334, -6.661294e-05, 0.07992426, 0.038815632, -0.113970175, 0.09014044, 0.122893855, 0.117027275, 0.13865928, 0.06763387, -0.1087759, -0.100585364, -0.11695829, 0.04532591, 0.04901298, 0.08138119,
+        -0.05205611, 0.027091049, -0.14454286, 0.07374133, 0.09802312, -0.1191281, 0.02189113, 0.094890736, -0.09201669, 0.10046317, -0.08057347, -0.13189863, 0.13252403, 0.038808215, -0.08737009, 0.11182591,
+        -0.110495225, 0.0027152712, 0.101381905, -0.05335681, -0.09570863, -0.077920556, -0.108943984, 0.103968605, -0.063657865, -0.1082033, 0.10920337, 0.025522156, 0.11576975, -0.03842709, 0.042240325, 0.06294959,
+        0.019211227, -0.13680518, 0.08494681, -0.02390202, -0.10320761, -0.11429373, -0.08450162, -0.061288673, 0.05420078, -0.052925635, -0.024785535, -0.1612159, 0.1392225, 0.06253321, -0.1304599, -0.12478514,
+        -0.04648618, 0.07621291, -0.010300111, 0.020644864, 0.017348673, 0.03199206, 0.13714796, 0.092873305, 0.042500164, -0.14369798, 0.08139646, -0.006397198, 0.025287813, 0.08528534, 0.007297465, 0.12373671,
+        0.1203976, 0.05630835, 0.066497706, -0.0050330325, 0.014532288, 0.020185916, 0.10766511, -0.13131768, 0.15531626, 0.052926984, -0.12894928, 0.027945157, -0.0241449, 0.12846279, -0.13994965, 0.011928814,
+        -0.07586865, 0.004438306, -0.12597924, -0.03934121, 0.12116701, 0.093093656, 0.032718107, -0.003911792, 0.017943107, -0.0902407, 0.10887139, -0.089646384, -0.11340871, 0.019696202, -0.14301549, -0.034627285,
+        0.015144727, 0.04396175, 0.12637264, -0.11134756, 0.027147276, 0.13165633, 0.08842995, 0.08767426, -0.100271955, -0.1422589, 0.0027984101, -0.15099065, -0.14168979, 0.094751105, -0.08434669, 0.06379311,
+        -0.122918956, -0.104558386, -0.054697335, -0.00057239796, 0.0022308545, -0.11638628, 0.099350624, -0.08155573, -0.056578103, 0.080680266, -0.09603754, 0.089082256, 0.13949867, 0.027859816, -0.15653494, -0.06642369,
+        0.10815017, 0.14080802, 0.03650529, -0.052314483, -0.11460872, -0.11165078, -0.10100081, 0.053591017, 0.10862204, -0.12335144, -0.00069644925, 0.039726045, -0.0018502316, 0.07174476, 0.018040797, 1.811332e-05,
+        0.10546405, 0.15815304, 0.051269267, -0.056346577, 0.077003054, 0.1369001, -0.06328496, 0.11245401, 0.042093642, -0.008411234, -0.017893696, -0.024038969, -0.15714082, -0.020515466, 0.1677804, 0.11091584,
+        0.04041615, 0.043698564, 0.05412446, -0.108806856, 0.025602128, -0.08039664, -0.029800825, 0.008919564, 0.0040823696, -0.052292984, 0.03924975, -0.15202564, -0.045874637, 0.05779401, 0.014443913, 0.041981794,
+        -0.019138537, 0.082813926, -0.10546466, 0.1400458, 0.10543219, 0.09810455, 0.12678804, 0.041793946, 0.06609345, -0.12805292, -0.13872828, -0.12384074, -0.066918634, -0.006505493, 0.07880211, 0.10267235,
+        0.071922526, -0.092935495, -0.13624507, -0.027859667, 0.075146005, -0.014909985, 0.07386218, 0.08173518, 0.10846616, -0.07975825, -0.033758163, 0.09358314, 0.0019493137, -0.119687565, 0.042713843, 0.016393464,
+        -0.07414904, 0.02090243, 0.05853836, 0.09252875, -0.10034192, -0.10590365, -0.100631006, -0.05569979, 0.044356592, -0.152263, -0.12936816, 0.017047219, 0.016995808, -0.14426191, -0.025721775, 0.0031707943,
+        -0.06269196, 0.026028378, -0.070683375, -0.087673604, -0.019829122, -0.13566653, 0.12597898, -0.00039971416, -0.005615453, -0.1507334, 0.064900935, -0.14106244, -0.062093083, 0.07369344, -0.007595682, -0.08331956,
+        0.0010323911, 0.09934266, 0.012864912, -0.08644371, -0.08984485, 0.046027973, 0.11062402, 0.041359264, 0.07210218, -0.10653589, -0.12221261, 0.082090855, 0.028548574, -0.1432556, -0.11254063, -0.08834022,
+        -0.11642118, -0.024782278, -0.039596852, 0.108806625, -0.08630278, 0.098969676, -0.06010139, -0.027023302, -0.033221316, -0.04190288, 0.027525965, -0.0013271123, 0.016312104, -0.06649362, -0.11802514, -0.03475159,
+        -0.016085895, -0.059967525, 0.12962776, -0.09119903, -0.007747067, 0.11801045, 0.10554062, 0.11732518, 0.041173935, -0.038213417, -0.103167735, 0.132827, -0.045136273, -0.14293085, 0.029035341, -0.09884443,
+        0.051053092, 0.00046328365, -0.097901605, -0.0048285, 0.08188188, 0.08494823, 0.05020269, -0.108502045, -0.11767022, -0.030236453, -0.039224647, 0.069162995, 0.015763246, -0.0850029, -0.07061576, -0.06555635,
+        0.063231096, 0.08652772, 0.057663612, -0.09921544, -0.043256056, -0.046680436, -0.09962983, 0.02870351, 0.053180076, -0.11419877, 0.03936407, -0.10990039, -0.04418724, 0.041744642, 0.11006476, -0.031003926,
+        0.03905421, 0.066564575, 0.087660976, 0.08108855, -0.0125884805, 0.10830102, -0.024259336, -0.02670931, -0.08706811, 0.058229353, 0.054706667, -0.13271818, 0.01914121, -0.1521492, 0.08953337, 0.0012931183,
+        0.07103039, 0.023722213, 0.03099155, -0.13311979, -0.03892671, -0.0112920925, -0.022861324, -0.09222121, 0.116012245, 0.11436531, -0.07358728, -0.05453418, 0.12504232, 0.026144736, 0.029843139, -0.033193503,
+        0.008139973, 0.15033898, 0.02893134, -0.034258205, 0.07449027, -0.060452744, 0.13553455, 0.041243777, -0.09223268, -0.1182759, -0.1023528, -0.15228103, -0.18092692, 0.027372587, 0.0754925, -0.11935411,
+        -0.04436464, 0.091274895, 0.03641654, -0.13794522, -0.02301697, 0.05682625, 0.08032556, 0.094350256, -0.023829507, -0.07404, -0.13278006, -0.020454146, -0.011855675, 0.10773356, 0.002336636, 0.056229256,
+        -0.14080031, -0.024172831, 0.0035579149, -0.018655421, 0.05708229, 0.066165686, -0.10472285, 0.055699304, -0.067280754, -0.037032552, 0.06330154, 0.025407517, 0.13086633, -0.14815094, -0.030663949, -0.13238953,
+        -0.104306884, 0.12500326, 0.0083946185, 0.06305871, -0.00030467313, 0.085123494, -0.061740316, -0.12794837, -0.008020694, -0.10177197, -0.08558409, 0.11741648, -0.0024060498, 0.08374739, 0.055344135, -0.025231285,
+        -0.03112779, -0.10388618, 0.03167882, -0.031634167, -0.1389311, -0.04335001, -0.102095544, -0.11494519, 0.07672477, -0.09073021, -0.051025797, 0.03650496, -0.09419779, 0.0067203827, -0.056301925, 0.025349163,
+        -0.11648827, -0.022050688, 0.06827793, 0.015243446, 0.14205082, 0.12231761, 0.0036140613, 0.12292925, 0.072103284, 0.044462435, 0.015229417, 0.038530253, 0.14269206, 0.06206629, 0.020761669, -0.08419217,
+        -0.015595962, -0.14832467, 0.08463724, 0.14724474, -0.08027268, -0.1049469, -0.0058865706, -0.06441587, -0.017236348, -0.008340812, -0.10903782, -0.059773996, -0.08664657, 0.04363039, 0.11865071, 0.009253844,
+        -0.028987454, -0.022735389, -0.031538606, -0.10337845, -0.034462683, -0.09336745, -0.05578133, 0.13980025, 0.043820035, -0.03377368, -0.042130508, 0.14357121, -0.123955384, 0.009786162, 0.12412607, 0.0839768,
+        0.009845399, -0.16091092, -0.15283735, -0.12621814, -0.14322087, 0.10984454, -0.14375225, -0.094846144, -0.038765065, 0.045299124, -0.117390566, -0.08372057, 0.041784547, 0.02640422, 0.009345099, 0.12337797,
+        0.042591374, -0.14882587, -0.027535206, -0.14620507, 0.024965892, 0.12333738, -0.038308095, 0.027777366, -0.14260088, 0.09449087, 0.047546674, -0.050929777, -0.14033929, 0.1286181, 0.010044502, -0.014798411,
+        -0.15193334, 0.070122205, 0.13644837, 0.027134072, 0.12851353, -0.12933567, -0.03246352, 0.04102432, 0.088660024, -0.028337374, 0.09293784, 0.03909153, -0.104634464, -0.15777728, -0.0021051606, -0.091703005,
+        0.08543416, 0.040866766, -0.058345746, -0.01325922, -0.14585508, -0.07640058, -0.06266409, -0.08240765, -0.016711615, 0.026979024, -0.08004152, -0.02488844, 0.008727833, -0.09165237, -0.030221684, -0.13882636,
+        -0.07252876, 0.018202385, -0.11862393, 0.035793178, -0.023293287, 0.007744494, 0.013598987, -0.0006148101, -0.063631326, -0.08475862, -0.040944032, 0.10175014, 0.098148294, -0.03210584, -0.042936623, -0.13361792,
+        0.009786317, 0.084852464, -0.1021099, 0.04274316, -0.110641725, 0.08453742, -0.08988243, 0.13838856, -0.10168817, -0.121315844, -0.13960253, -0.12873198, 0.040121086, -0.13528533, 0.11421075, 0.09016837,
+        -0.14591873, -0.011560094, -0.044816807, -0.11392443, 0.051161207, -0.011684338, -0.12846291, 0.03896004, 0.13417765, -0.039419886, 0.08418958, -0.09337555, 0.060340047, 0.09160444, -0.034573816, -0.01844432,
+        -0.05628408, -0.00097227, -0.12501766, 0.06050584, -0.06485825, -0.08228221, -0.11145554, -0.009894099, -0.030597059, -0.15555519, 0.0986443, 0.005535919, 0.095526315, 0.02652152, 0.042530593, 0.12579474,
+        0.13367592, -0.12685488, -0.09822336, 0.1153693, -0.13247584, -0.032137744, -0.10403853, -0.15009116, -0.0019318301, 0.101436704, -0.051918812, -0.108025484, -0.026673468, 0.09012673, 0.052481465, -0.079210296,
+        -0.028969757, 0.10932987, -0.027772926, 0.05762978, -0.096302025, 0.039693706, 0.06341692, -0.042888332, 0.08739169, -0.11669958, -0.02661793, 0.018858967, 0.101366684, -0.07401217, -0.04405769, 0.12556902,
+        -0.14482383, 0.12638976, 0.12643619, 0.13121177, -0.06895624, -0.053478803, 0.09527932, 0.14383629, -0.089458466, -0.10935352, -0.021154482, -0.05275769, -0.07267801, -0.07813416, -0.027587358, -0.083437204,
+        -0.088307425, 0.1097013, 0.075420246, -0.08566672, -0.009153202, 0.03890892, -0.13008764, -0.0077737854, -0.025589326, 0.030796943, 0.13497287, -0.040676966, 0.01662993, 0.008326497, -0.07602123, 0.123101726,
+        0.10567972, 0.10251273, -0.15123017, 0.030854022, 0.0034953114, -0.13670771, 0.13784002, 0.14503059, -0.08823777, -0.13453467, 0.14088383, 0.023504877, 0.1351567, 0.11928134, -0.05921126, 0.043986943,
+        -0.03594458, 0.13639489, -0.0036409453, 0.08983145, 0.12557031, 0.09082009, -0.05482969, 0.0052648545, 0.14881456, 0.093311474, -0.11894137, -0.031685147, 0.1356106, -0.094965905, -0.1049359, 0.047831323,
+        -0.14144534, -0.027090974, -0.1073286, 0.058874086, -0.0026224188, -0.018708073, -0.13337272, -0.1478259, 0.06019444, -0.12285089, -0.12969133, -0.10205151, 0.13896066, -0.0111902505, -0.061551142, -0.101183206,
+        -0.060028054, -0.106349945, -0.0076345527, -0.13104571, -0.011300074, 0.09254724, 0.1200346, -0.14753124, 0.07342089, -0.108254656, 0.076435946, -0.0007336017, 0.012109709, -0.04042297, -0.063160844, -0.021574473,
+        0.1445746, -0.09392403, -0.026261067, 0.1471667, -0.0928382, 0.14432289, -0.012015284, 0.00609808, -0.028959712, 0.039884236, 0.07362868, 0.039667908, -0.080406986, 0.040834222, -0.015801953, -0.018706303,
+        0.0794521, 0.03274123, 0.12241149, -0.02469074, -0.11419863, -0.07355964, 0.11186137, 0.078727365, 0.044225957, -0.12998585, -0.03480482, -0.13376758, -0.013183131, -0.070223585, -0.09291982, 0.104258746,
+        0.006539587, -0.022945328, 0.09367212, -0.04576634, 0.023494117, 0.12468559, -0.009109839, -0.043845396, -0.094174154, -0.03278651, 0.039414007, -0.04755428, -0.02429958, -0.046591576, 0.050038956, 0.025204252,
+        -0.040098034, 0.10393819, 0.045147207, -0.14131515, -0.02706188, 0.0705768, -0.032808788, -0.13403776, -0.12510274, -0.065126665, 0.01541414, -0.11498779, 0.018650489, 0.13722557, 0.08844459, -0.014462643,
+        -0.116827786, -0.021815745, 0.06201515, 0.033968095, -0.15019967, 0.0429573, 0.13868156, -0.105195485, -0.041304704, -0.056597836, -0.11397709, -0.029314006, 0.043585073, 0.13223621, -0.029923478, -0.023479374,
+        -0.14869438, 0.105084024, 0.009980263, 0.03197216, -0.10668567, -0.083087154, 0.009185199, 0.12772603, -0.1439289, 0.12712555, -0.0036809035, 0.15202625, 0.15081757, -0.14989217, -0.018670069, -0.13131331,
+        -0.10212764, 0.08981959, 0.06737464, -0.073480956, -0.04989753, 0.1340499, 0.14941925, -0.15126623, 0.10724567, -0.11627368, -0.10772754, 0.039596967, -0.11425391, 0.051771656, -0.06706246, -0.051319104,
+        -0.07338383, 0.0565191, -0.11833703, 0.01394653, -0.013553611, -0.050237227, 0.023970235, -0.086109295, 0.1307605, -0.005965225, -0.030171102, -0.0028185712, 0.107961036, 0.03418435, -0.13487373, -0.13705096,
+        -0.15217957, 0.073827, -0.14572518, 0.1403961, 0.03781191, -0.087678306, 0.12321084, -0.11958087, -0.012109238, 0.14842711, 6.4565957e-06, 0.064688355, -0.12454238, -0.13865487, 0.09196135, -0.13513076,
+        -0.14490266, 0.028490612, 0.11047578, 0.013434178, 0.07874621, 0.10529254, 0.0008873769, 0.021661587, 0.08165074, 0.04356932, 0.13016382, 0.08196864, 0.05919589, 0.026062407, 0.003958181, -0.032427482,
+        0.06482838, -0.03917858, -0.094487585, 0.15139309, -0.02109435, -0.12188037, 0.06296024, -0.04964577, -0.1316791, 0.105529025, -0.123665385, 0.13542303, 0.13572441, 0.08147219, -0.10668798, -0.09344812,
+        -0.035505448, 0.014128216, 0.08559725, 0.11431572, -0.07939669, 0.04183737, -0.06315555, 0.10320703, 0.059269257, 0.09146, -0.14082819, 0.104791686, -0.030209504, -0.017016953, -0.049001165, 0.058143783,
+        -0.09113532, 0.08943889, -0.011921946, -0.03148365, -0.012533107, -0.022497326, -0.025707047, 0.11825509, -0.11093128, 0.08140341, -0.09819487, -0.07743884, 0.085449845, -0.14895137, -0.067027956, 0.05189588,
+        -0.09908554, 0.12252143, 0.14656557, -0.0007838506, 0.043660045, 0.06054403, -0.08577868, -0.051439732, -0.020793896, -0.03239557, 0.07183541, 0.09283821, 0.09320129, -0.059085388, -0.078069, 0.15024462,
+        -0.0943132, 0.000563655, 0.0581685, -0.052661788, 0.04272777, 0.019492537, 0.038806308, -0.037221566, -0.060008716, -0.08860304, 0.13188171, -0.0014264941, -0.09496969, -0.116314, 0.121327974, -0.054820027,
+        -0.11130506, -0.14039516, 0.13374686, 0.076990984, -0.036356285, 0.087895304, -0.03173207, 0.0019138537, -0.15119992, -0.074150436, 0.075542316, -0.04429922, -0.13784349, -0.052365616, -0.0018959101, -0.1186545,
+        -0.08216935, 0.030661171, 0.12574404, -0.0038515606, 0.011858054, 0.11515171, -0.13782023, -0.13101946, 0.04731136, -0.11464705, 0.040764254, 0.029054873, 0.018906806, 0.0629014, 0.0011424212, 0.119321056,
+        0.11046786, 0.12608215, -0.05383262, 0.10070213, -0.07459841, -0.040894527, -0.09549469, -0.10539038, -0.12116973, -0.00037409097, -0.012098626, -0.010265288, -0.03282239, -0.0017019481, -0.052386336, -0.14957911,
+        0.034389675, -0.06479261, -0.04593875, -0.045548964, -0.07225437, 0.10481285, 0.030558879, -0.044210814, 0.067402065, 0.0714734, 0.09560167, -0.15006475, 0.0936889, -0.06757704, 0.11324407, -0.027209016,
+        0.114126734, 0.11085043, -0.09367656, 0.058851566, -0.08327963, -0.050558083, 0.1291407, -0.03064179, -0.12575, -0.054583356, 0.08079538, 0.14645104, 0.08879516, -0.041166835, 0.012944501, 0.045429192,
+        -0.012155311, 0.018968815, -0.13082886, 0.04930927, -0.12821619, -0.0708287, -0.053948708, -0.12550291, 0.03927802, -0.012304655, -0.02582402, 0.10695829, -0.059064656, -0.05843467, 0.1429859, -0.05606036,
+        -0.11636817, -0.09803218, -0.041603513, 0.095818385, -0.018318988, -0.009154, -0.019467736, -0.046102382, -0.12432263, 0.04105051, 0.057149976, -0.1184242, -0.032525744, -0.023451446, 0.064248964, 0.03895914,
+        -0.09482034, -0.023797357, 0.06927585, -0.116646476, 0.064563856, 0.034668196, -0.03783037, 0.0011585105, 0.09422073, 0.07330469, -0.00964126, 0.021195697, 0.074875936, 0.08136633, -0.007648184, -0.12077498,
+        0.13598384, -0.14336975, -0.10098134, -0.037096452, -0.072990015, 0.08552857, 0.12256782, 0.1441366, 0.028847273, -0.032261666, 0.0053558345, -0.006101357, -0.017539106, -0.12461654, 0.1257885, -0.13613684,
+        -0.14298014, 0.06397199, 0.12628011, -0.028612403, 0.05834899, -0.11748368, 0.021025097, 0.1344066, -0.074483566, -0.07724467, 0.07131081, 0.05570863, -0.068934105, -0.12712954, 0.033908844, -0.01963399,
+        0.13432762, 0.11828378, -0.014589686, 0.031045867, -0.020259826, -0.11459466, 0.17366868, 0.013259858, -0.12170087, -0.08007985, -0.124102436, 0.06496618, 0.06273847, -0.10501553, -0.12248018, -0.099867865,
+        0.057809193, 0.039777238, 0.12626602, -0.09244963, -0.14666587, -0.1303682, 0.071798004, -0.060286984, 0.012388577, 0.10697626, -0.05129263, 0.11259485, 0.08654282, -0.093843974, -0.09338156, -0.04718857,
+        -0.109504595, -0.12937652, 0.08658286, -0.05240908, 0.015033053, 0.11948583, 0.13259052, -0.084309496, 0.13220148, -0.090391204, -0.12998685, -0.07998928, 0.13672748, -0.11766383, -0.10493139, 0.08672639,
+        0.089250416, 0.08149765, -0.05464724, 0.08394966, -0.10217693, -0.11753434, -0.030098952, 0.0060323104, 0.11841067, 0.09589972, -0.05898158, 0.039616093, 0.011090802, -0.13192359, -0.060461305, -0.00037797278,
+        -0.10750087, 0.012940932, 0.07007181, 0.07773862, 0.09924404, 0.092978366, 0.072695665, -0.13703375, 0.09397029, -0.11686748, -0.07191416, -0.11640924, -0.102939636, 0.116957545, 0.047821455, -0.03218687,
+        0.102347195, 0.059074804, 0.06759669, -0.093688555, -0.0840637, 0.11449647, -0.1413384, 0.07864705, 0.09541223, 0.057536487, -0.10469865, 0.061433114, 0.040330064, -0.047215216, -0.100327216, -0.04546145,
+        0.038196295, 0.024069134, 0.10948529, 0.053014096, -0.13169353, -0.029059397, 0.046236508, -0.037656892, 0.11809025, 0.13920471, 0.15101786, -0.00044054908, -0.013249485, 0.013839029, 0.114210926, 0.10710326,
+        0.020282658, 0.16512729, -0.071969986, -0.018582907, -0.12915167, -0.015256105, -0.056978293, -0.11520137, -0.1034751, 0.08816153, -0.08871426, 0.09113388, 0.023432031, 0.055896375, -0.005963483, 0.0070489002,
+        -0.0331061, 0.07372014, -0.022725401, -0.037745755, -0.14061669, 0.003840917, -0.015443851, -0.12609193, -0.14461404, 0.07550077, -0.08664517, 0.11745849, -0.12684345, 0.1428167, 0.01921206, 0.15469053,
+        -0.10760688, 0.035468195, 0.12600698, 0.14703336, -0.09511488, 0.133472, -0.08907237, 0.10913731, 0.046136133, -0.11625675, 0.09486359, -0.030870618, -0.09087493, -0.16239312, 0.067489155, -0.10881004,
+        -0.043578684, -0.15505166, -0.014218708, 0.09740494, 0.021252252, -0.123999216, 0.11138809, -0.008227752, -0.05973354, -0.13631557, 0.12975796, -0.095766984, 0.033921164, -0.15052214, 0.101902395, -0.08093516,
+        0.08874373, 0.0872881, 0.09203846, -0.09428372, -0.09077502, 0.12098248, -0.11546611, 0.0020139192, -0.07078047, -0.07748768, -0.052851528, 0.021112831, -0.10275399, 0.056980193, 0.07387128, 0.03306467,
+        -0.124355085, -0.04049053, 0.14355116, -0.1271894, 0.12098797, 0.08443451, -0.012412092, 0.105893224, -0.07451355, 0.0469229, -0.092779696, -0.032198414, 0.042697262, 0.07706876, 0.08961631, -0.08821565,
+        0.12250149, -0.08494733, -0.07420709, 0.06180181, 0.019789234, 0.00265048, 0.032818615, -0.030833462, -0.12967975, -0.119549885, 0.1434789, 0.08410572, 0.0649911, -0.13877046, -0.022882259, -0.11057646,
+        0.09569422, -0.13925385, 0.09429199, 0.010813673, -0.030635457, 0.059628196, -0.053488404, -0.018856931, 0.09962179, -0.14010756, 0.04596633, -0.014246464, -0.0060251467, 0.03429157, -0.050732527, 0.027888604,
+        -0.13173537, 0.06254957, -0.12903954, 0.019800203, 0.06034175, 0.11816767, -0.1421269, -0.118485086, -0.087529495, 0.10910442, -0.05259184, -0.035912927, 0.035281826, 0.06815925, 0.11081709, -0.07736046,
+        0.09151988, 0.011774875, -0.05599962, -0.088600814, 0.13842797, -0.028877135, 0.13152036, 0.034763847, -0.13934061, 0.060258728, 0.10113387, -0.14560299, -0.12824969, -0.06719053, 0.12602863, 0.0015173906,
+        -0.06231721, 0.15388797, 0.070515685, -0.10413341, 0.10720452, -0.0726074, 0.057816405, -0.088382296, 0.05139626, -0.044509523, -0.059690423, 0.12981969, 0.08558533, -0.0112850955, 0.036397856, -0.016206749,
+        0.051099118, -0.0028779046, -0.061409116, -0.08453882, 0.06110325, 0.02381116, -0.057185184, 0.10759259, -0.15254134, 0.14714043, 0.06272099, 0.13533032, -0.093741365, -0.11615371, -0.06621608, 0.057631858,
+        0.13820869, 0.08063207, 0.052080244, 0.0084462855, -0.09379388, 0.057213496, 0.039836243, 0.110751696, -0.14162521, -0.031421266, 0.07035892, 0.069179304, -0.06709248, 0.08812827, 0.09351041, 0.0037441256,
+        -0.042824034, -0.09785928, 0.079641245, 0.0301298, 0.1411661, -0.100070745, 0.14242463, 0.06599836, -0.025600357, 0.07887324, 0.16743022, 0.050317027, -0.14201437, -0.028849343, -0.039395858, 0.08850009,
+        -0.13877375, 0.10729289, -0.08838064, 0.033883307, 0.13000734, -0.013384025, -0.01454782, 0.11971833, 0.08705447, 0.11575534, 0.10006439, -0.057296637, -0.102299936, -0.113711, -0.039023854, -0.09313988,
+        0.024939181, -0.06295217, -0.079156764, -0.045378778, -0.1368307, -0.09350581, -0.1183513, -0.0023597726, -0.082245864, 0.14386643, 0.0966538, -0.10142996, -0.075662695, -0.048956852, -0.045205336, 0.055019982,
+        -0.09279323, 0.01755408, -0.07764244, 0.0040814565, -0.004525468, 0.03480598, 0.059653524, 0.062785864, -0.002796387, 0.021461003, -0.03723027, -0.02991706, -0.09338125, -0.12295406, 0.05232003, -0.054499365,
+        -0.13941278, -0.0021332384, -0.16380423, 0.023071079, 0.055875164, -0.13919373, -0.08238843, -0.13670205, 0.1090996, -0.061322983, -0.08513527, -0.13751629, -0.012941778, 0.075584024, -0.009394472, -0.10374346,
+        -0.032999314, 0.083696395, 0.13936007, -0.15337446, 0.07337495, -0.062339067, -0.08553355, 0.07531149, -0.034587823, -0.10750135, 0.10656265, -0.014226172, 0.019862695, 0.094366424, 0.10726567, 0.028712574,
+        0.008563716, 0.09361808, 0.061638802, 0.12140566, -0.0113074, 0.043336194, 0.12968884, -0.12821458, -0.070112504, 0.07578181, 0.042535935, -0.07867366, -0.091174915, 0.050529, 0.044384453, 0.08831525,
+        0.13062277, -0.02091937, 0.105166666, 0.060906354, -0.065431535, 0.028053641, 0.038904745, -0.016989013, 0.08020189, 0.07049918, -0.09231171, -0.16220453, -0.15796284, 0.097693704, -0.02942316, 0.04142451,
+        0.14955357, 0.016600678, -0.05490415, 0.05448733, -0.12378728, 0.15831318, -0.0044773356, 0.07664819, 0.12398286, 0.051225107, -0.12785657, -0.029533666, 0.0112681445, 0.12234809, 0.05794198, 0.07757521,
+        0.009624286, -0.08056504, -0.0032733984, 0.032717627, -0.054989677, -0.083368756, 0.12850623, -0.07902446, 0.01150174, 0.14408036, -0.072624505, -0.08222016, 0.017511886, -0.14560337, 0.1135307, 0.004851183,
+        -0.08385375, 0.13608947, 0.032637913, -0.07809058, -0.010358283, -0.006020207, 0.08022766, 0.11744754, -0.13319172, -0.010883973, -0.11921818, -0.1153771, 0.10270555, 0.09974055, -0.056046095, 0.056388278,
+        0.11635906, -0.1008813, 0.058211673, 0.07981215, 0.09802432, 0.048795823, -0.047630392, 0.12680738, -0.07060787, -0.01684917, -0.07497986, 0.11995078, 0.08768825, 0.011315065, -0.07307666, 0.05938121,
+        -0.15149128, 0.111536495, 0.11670027, 0.110161446, -0.08649459, -0.016253069, 0.060830615, 0.12446442, -0.11803791, -0.057092607, 0.06595483, 0.025309073, 0.118322924, 0.14902875, 0.04738349, 0.12044847,
+        0.04029632, 0.14102593, 0.05509017, 0.109187834, 0.06608573, -0.021547183, -0.09389443, 0.09814475, 0.076536156, -0.004673739, 0.14037155, -0.06742772, 0.09063229, 0.10862374, -0.00975186, -0.11446229,
+        -0.136353, 0.006097078, 0.008946904, -0.05501638, -0.1371779, -0.14606632, -0.041400634, 0.027066492, 0.012373083, -0.108028196, -0.13318132, 0.058929224, -0.057102133, 0.14799725, -0.13531843, -0.08211436,
+        0.022080876, 0.11375579, -0.034413148, -0.11913658, 0.1250162, 0.11761881, -0.13160636, -0.031126617, -0.045161217, -0.0055243783, -0.06935554, 0.091514364, 0.14435886, -0.056283556, 0.13208877, -0.124408044,
+        -0.13084672, 0.04815917, 0.103951775, -0.124467865, -0.005909715, -0.13463143, -0.05001222, 0.11207123, -0.030993681, -0.012163012, 0.12974112, 0.13471697, 0.02954847, -0.02277703, 0.056785777, 0.11521004,
+        -0.11943041, 0.0021118512, 0.03470129, 0.043061938, 0.078174405, -0.10884138, -0.08621192, -0.024634385, -0.101081006, 0.048880544, -0.048762668, -0.13174982, 0.075805284, 0.118050866, -0.07902756, 0.06064234,
+        -0.070909135, 0.039884552, -0.083823405, -0.034745608, 0.13964447, -0.085719846, -0.10237555, 0.12344793, -0.12675904, 0.13944878, -0.073942095, 0.07110477, 0.041235816, -0.09773749, -0.1064189, -0.091657355,
+        -0.12163653, 0.11999047, 0.039511908, 0.00627752, -0.08818121, -0.08825055, 0.12622122, -0.03692479, -0.082959324, 0.1094282, 0.06790054, -0.06489218, -0.012591286, -0.03138491, -0.0793388, 0.030759014,
+        -0.15323475, -0.12480661, -0.058308803, -0.03324731, 0.015261028, 0.09763754, 0.103246234, -0.110095896, -0.14229044, -0.045780383, -0.010323164, 0.07444679, 0.011654125, 0.07067687, 0.0663643, -0.050768428,
+        -0.010753135, -0.12999557, -0.063147075, 0.14279753, 0.10383515, -0.06388105, 0.029904047, -0.14176205, 0.041297942, 0.124884635, -0.029664995, 0.07723753, 0.06725706, -0.08747257, -0.1511213, 0.036444735,
+        0.1030407, 0.106136754, -0.10220313, -0.15071319, 0.030971412, -0.07745304, 0.06763191, -0.037411418, -0.13707739, 0.09535016, 0.057610475, -0.10792184, 0.08773329, 0.034354333, -0.0025511647, -0.103765965,
+        0.022535596, -0.10047011, -0.018108808, -0.10726115, -0.1303789, 0.04495606, -0.12201758, -0.0026156225, 0.06665739, 0.12625201, -0.018465085, 0.14103314, 0.15373075, -0.064942926, -0.15446612, -0.01854019,
+        0.0945804, 0.07722078, -0.067618325, 0.047481462, -0.008215721, 0.028725054, -0.07852993, -0.049236324, -0.11318803, -0.010030114, -0.1051599, 0.017043713, -0.00911376, 0.08070298, -0.051000323, 0.023953069,
+        0.06959111, 0.103173144, 0.13031529, 0.018951407, 0.038034134, -0.06592698, 0.05228219, -0.049943626, 0.043873716, 0.047748297, -0.039300203, -0.020577416, 0.05945802, 0.02761137, 0.04642928, -0.10317959,
+        0.13433036, 0.123588555, 0.12511976, -0.023864323, -0.10957596, -0.096219376, -0.1239277, -0.13115896, -0.11502098, 0.099094704, -0.0017834811, 0.14231516, 0.015020908, -0.03009348, -0.10117509, -0.13316143,
+        -0.13766989, 0.010008901, -0.0074718143, 0.009698501, -0.10200086, -0.0077723577, 0.04769189, -0.08250717, -0.12945949, -0.07762661, 0.046589017, -0.12801376, -0.14568296, 0.07857941, -0.119256236, -0.08226542,
+        -0.033133857, 0.0743769, -0.15152586, -0.034644898, 0.13914101, 0.06199029, 0.040468838, 0.14492065, 0.049156297, -0.004614467, -0.044690188, -0.106096156, -0.13735624, 0.07897126, -0.02897889, -0.13655011,
+        -0.009584148, 0.032095738, 0.099703535, 0.06902958, 0.030795872, -0.05764264, -0.14793032, 0.05647867, -0.07315908, -0.08712827, 0.06516026, 0.034842227, 0.14111857, 0.017042033, -0.15437788, 0.00976701,
+        0.07272785, 0.024479043, -0.074567705, -0.14058302, -0.057247315, -0.14892961, -0.1290197, -0.105662666, -0.0357766, 0.10554184, -0.14178291, 0.06787622, -0.020509465, 0.06684197, 0.09889077, 0.13480587,
+        -0.07329493, 0.116292246, 0.027408391, 0.040155843, -0.039963376, 0.14771852, -0.014700464, 0.012330829, -0.11135716, 0.0010649521, -0.1276153, 0.051244233, 0.008995259, 0.07170423, -0.0080234725, 0.12498353,
+        -0.097199775, 0.030325081, 0.066761225, -0.05386193, -0.12387267, -0.088805676, 0.10324891, 0.12166189, 0.08442068, -0.06011953, -0.0850152, 0.003117559, 0.04625173, 0.004553953, 0.08756713, 0.014353703,
+        -0.13553216, 0.099016115, 0.057915412, -0.05132217, 0.1532859, 0.06817109, -0.08517788, 0.08744401, -0.09524553, 0.062821195, 0.059989277, 0.084338315, 0.1446679, 0.13208362, 0.15135513, 0.0467276,
+        -0.018085752, 0.024233345, -0.035988957, 0.042339783, -0.005809409, -0.11355517, 0.08485149, -0.0012099319, 0.09656311, -0.12798049, -0.12994608, 0.14013076, 0.09304747, -0.046972413, 0.13075453, 0.038953304,
+        0.0968888, 0.08070276, -0.033401728, -0.05696718, 0.15170042, -0.109963834, -0.08585386, -0.064778596, 0.14908348, 0.021466693, -0.039606746, 0.025272144, 0.14522447, 0.09698424, -0.0025301073, 0.0010813796,
+        0.06548821, 0.14700189, -0.106777884, 0.1539704, 0.035716105, 0.040136084, -0.019677771, 0.017796593, 0.06669743, -0.050923746, -0.12074583, -0.096818626, -0.12286661, -0.14489746, 0.115659684, -0.00076126045,
+        0.00032243406, 0.07535413, 0.060087737, 0.11880729, 0.15326056, -0.12294717, 0.061582096, 0.059177026, 0.074195266, 0.13124052, 0.14485995, -0.07305852, 0.12787844, -0.1287867, -0.078496374, -0.13590077,
+        -0.10255631, 0.1268539, -0.01590228, -0.023404121, -0.1232094, 0.15788671, -0.05946691, 0.024326148, -0.09919492, -0.013285402, 0.11654382, -0.055501886, -0.13048552, 0.109085664, -0.11442895, -0.06971971,
+        -0.09026262, 0.10371855, 0.11952243, 0.011774716, 0.09688558, -0.12048715, -0.035691034, 0.08456384, 0.11398073, -0.0925101, 0.12339016, 0.08998925, 0.030742403, 0.053327832, -0.068727724, 0.1410876,
+        0.0225952, -0.07437015, -0.15014711, 0.02833225, -0.045422573, 0.05998944, -0.0024877288, -0.0622531, 0.061974913, 0.07929527, 0.080629855, -0.010967174, 0.11240693, -0.07014395, 0.04232677, 0.09214238,
+        0.13210386, 0.03053064, -0.045586944, 0.095280424, 0.02272595, -0.045623314, 0.12623516, -0.12385961, -0.03048343, 0.071650244, -0.07121966, -0.062373646, 0.014377555, -0.019561313, 0.05137942, 0.04871005,
+        -0.09303786, 0.010329635, 0.06626705, 0.013708648, -0.12804852, 0.019258566, -0.06812329, 0.06636906, 0.0057433792, -0.14804818, -0.16084972, 0.12245889, -0.0007970316, 0.00018561528, 0.0006705652, -0.017350111,
+        -0.03227422, 0.11562303, 0.12850206, 0.08255705, -0.12823336, -0.06104852, -0.1517842, -0.092063464, -0.11060884, 0.07675646, -0.13264485, 0.05666465, 0.14423712, 0.14140926, 0.1271213, 0.017673092,
+        0.14174348, -0.15153728, 0.07736847, -0.1025398, 0.047669135, -0.1184462, -0.0029897757, 0.026170054, -0.0017986954, -0.09056776, 0.07903863, -0.11543869, -0.021724582, -0.024303617, -0.13928643, -0.035431836,
+        -0.09473112, 0.07199286, -0.11367891, -0.0060095964, -0.027281778, 0.018799067, -0.107227646, -0.15362741, -0.1136629, 0.04472428, 0.08608247, -0.02079353, 0.080670044, -0.026727686, -0.0029250477, -0.06009857,
+        -0.024187671, -0.024760064, -0.03170238, 0.13028236, 0.065291926, -0.1056191, -0.1310148, -0.1459273, 0.09681538, 0.009099108, 0.117205806, -0.14634357, -0.037687287, -0.0040988033, 0.0015545861, -0.032537557,
+        0.1440314, 0.010647299, 0.06468746, -0.087902226, 0.13210918, -0.051358856, -0.02165207, -0.111376174, -0.028631365, 0.04156054, -0.08569817, 0.08298253, 0.12386558, 0.00508686, 0.13391392, 0.032037225,
+        0.07049733, -0.0998942, 0.017929403, 0.042439252, 0.061612643, -0.016063888, -0.0732934, -0.046218343, 0.14458534, -0.010968785, 0.103782, -0.14930414, -0.053767566, -0.06426526, 0.059326768, 0.010360057,
+        0.029321954, -0.02910997, 0.02660442, -0.10390978, 0.10154008, 0.07773308, -0.024790755, -0.12386178, 0.09127835, 0.12501125, -0.075251594, 0.11702974, -0.039175835, 0.03790412, -0.0054051247, -0.025019119,
+        0.013354235, -0.042550802, 0.09722036, 0.10638683, 0.08431381, 0.023131594, 0.10646295, -0.06649974, -0.13125935, -0.076473266, -0.141688, 0.070717625, 0.07009003, -0.13159285, 0.0343806, 0.16845849,
+        0.039418332, 0.10981893, 0.06879347, -0.08533833, -0.09653257, 0.12211001, -0.042662162, 0.08159475, -0.13968864, -0.061695457, 0.024919318, -0.056185193, 0.013347923, 0.12297747, 0.10250551, -0.05714512,
+        -0.0014040145, 0.00512925, -0.02289373, 0.034541287, 0.11834325, -0.08514118, -0.04868198, -0.02518402, 0.0697302, 0.029111024, 0.023017457, 0.09003238, 0.03991785, -0.08908918, 0.07127168, 0.069275245,
+        0.07302461, 0.14136606, -0.096714884, -0.036576483, -0.15748821, 0.0773088, 0.107483365, -0.12708408, -0.06369002, -0.040846683, 0.012869655, 0.08956676, -0.044848043, 0.0637506, -0.05795384, 0.035515733,
+        -0.06464559, 0.037475146, -0.12465415, -0.034610182, 0.08366653, -0.024879806, -0.015782617, -0.02573502, 0.084254906, -0.016224422, 0.041434173, 0.14443506, 0.0009107136, 0.050901655, 0.09968617, -0.10289185,
+        -0.1509278, -0.116492406, -0.13273105, 0.012081545, -0.02425564, -0.09161265, 0.08983328, 0.015113095, 0.09784994, -0.05614765, -0.14103499, -0.1388482, -0.08469688, -0.09471129, -0.10691663, 0.050686773,
+        -0.086490974, -0.12996687, 0.08798383, -0.08794012, 0.03353, 0.14123954, 0.026888244, 0.016915653, -0.14465453, 0.06718824, 0.067944854, 0.012326751, 0.0074678436, -0.095576264, 0.114208624, 0.004830871,
+        0.032358184, 0.02329659, -0.07804604, -0.11452586, 0.026524195, -0.0011473135, 0.09540538, -0.07880286, -0.04754037, -0.069412865, -0.13192742, 0.14004815, -0.03519403, 0.08984237, -0.04707074, -0.08867856,
+        -0.13723929, -0.13657208, -0.1447106, -0.13566738, -0.036702413, 0.06493878, -0.15293755, 0.10079035, 0.016621608, 0.014252981, 0.039165463, -0.08469574, -0.14670837, -0.04567903, 0.05594916, -0.11907676,
+        0.051865056, -0.1485728, -0.10391641, -0.025650475, 0.09530121, -0.1582791, -0.110314965, 0.060836755, 0.062680244, -0.0056833853, -0.0904269, 0.1278579, -0.12129557, 0.14383812, -0.07376587, 0.105066575,
+        0.06453692, 0.063563965, -0.12577018, -0.00055788795, -0.1095313, -0.1124981, -0.072631754, 0.13016237, -0.14443491, -0.031101994, 0.10889587, 0.043339882, 0.04954533, 0.058337916, 0.057891957, 0.035992168,
+        -0.07058804, -0.05538215, -0.038411047, -0.090569496, -0.037389573, -0.12816973, -0.1243639, 0.08159423, 0.12532362, -0.0036220727, -0.04885495, -0.049705025, -0.010156138, 0.012230712, -0.062300842, -0.02717934,
+        0.14336503, -0.09987085, -0.038496498, -0.10737612, 0.077281475, 0.074068844, 0.13221855, -0.04914791, 0.00814615, -0.09184025, 0.09381832, 0.009907954, -0.06638884, 0.05169174, -0.07291824, 0.108107775,
+        0.13971253, 0.03928226, 0.04542664, 0.11271432, 0.09147803, -0.07631608, -0.022125306, 0.11929769, 0.015078164, -0.020329475, 0.09173411, -0.06857842, 0.0011888383, 0.11266015, 0.146119, 0.13244769,
+        -0.065628074, -0.03139515, 0.091151744, -0.024234816, 0.05121693, -0.07595648, 0.11636619, -0.022590198, -0.071150154, 0.08756599, 0.13949718, 0.09708229, -0.015570676, 0.064990506, 0.14656872, -0.04808503,
+        0.11381577, 0.027513826, -0.011182947, 0.14804661, 0.06031891, -0.04502827, 0.019807016, -0.086613424, -0.110096894, -0.11694698, -0.009217655, -0.008879364, -0.04941187, 0.07157798, 0.041965265, -0.03475307,
+        0.03282129, -0.003151559, -0.1330721, -0.05385151, 0.020222887, 0.046994716, -0.022423605, 0.08890381, -0.11141029, -0.116631046, -0.012782946, -0.059661772, 0.07944333, 0.05720382, 0.16441348, -0.12740883,
+        -0.15009356, 0.025646972, -0.06373577, 0.0058018006, 0.1514745, 0.018622698, -0.09021446, -0.087380566, 0.099548705, -0.14274067, 0.0938774, 0.08852623, 0.055487297, 0.09078724, 0.161186, 0.04228087,
+        0.06497189, -0.09467814, 0.16554712, -0.077410676, 0.036169305, 0.08624618, 0.04143697, -0.038453545, 0.019563446, 0.09586485, -0.1453392, 0.1450876, 0.13527746, -0.082071334, 0.112204, -0.03177406,
+        -0.12661418, -0.053133573, 0.11414536, 0.08075856, -0.026478836, -0.106060915, 0.048166133, -0.05644191, 0.07373297, -0.10851281, -0.09653563, 0.051629912, -0.00879851, 0.084396735, -0.049455438, 0.07387747,
+        0.1158315, -0.11789166, -0.017076882, -0.10938962, 0.047616884, -0.13533534, 0.011487973, -0.051173303, -0.11309686, -0.08388214, 0.11364523, 0.001125923, 0.13585654, 0.084702, -0.056854524, 0.083921835,
+        -0.082150385, -0.12445338, 0.0585715, 0.10332247, 0.06604675, 0.12558858, 0.117592044, -0.02318347, 0.09102369, 0.007285134, 0.023703514, 0.05412306, -0.15101084, -0.0725103, 0.02302818, 0.15186873,
+        0.1213242, -0.07224437, -0.098319024, -0.037543755, -0.04741107, -0.021852123, 0.12935984, 0.14000036, 0.080052026, -0.024818448, -0.14321151, -0.026997203, 0.09273565, -0.087391995, -0.028130151, -0.13714999,
+        -0.027589932, -0.10622067, -0.15139715, 0.008645726, 0.13218515, 0.05211671, 0.09254833, 0.14192334, -0.11795813, -0.06768468, -0.033129986, -0.11693773, 0.08623738, 0.09307465, 0.007946903, -0.071910135,
+        -0.0077345297, 0.00023964643, 0.07763317, 0.10771231, -0.109716214, -0.11943993, 0.1138807, -0.12047929, 0.04479483, -0.14948846, -0.0981551, -0.14244653, 0.13399562, 0.07636685, 0.10386817, -0.12711672,
+        0.023759166, -0.13910516, 0.11292673, -0.11140936, -0.113829285, 0.03283282, -0.107766636, 0.032693237, 0.059390407, -0.034610935, 0.04616682, -0.08460263, -0.14288878, 0.08832889, 0.1496139, 0.03856609,
+        0.08303602, -0.080258265, 0.13936566, 0.10666456, -0.09813738, -0.02713561, 0.058354508, 0.065232754, 0.0012011725, -0.001196843, -0.13756555, 0.038941927, -0.13077468, -0.06379151, -0.0975936, -0.0901003,
+        -0.13533258, -0.09179506, -0.08974778, 0.100542694, -0.053864468, -0.06847581, -0.07348753, -0.03532211, -0.056421656, 0.14194919, -0.061353583, 0.10171785, 0.030216616, -0.14579003, -0.13134725, 0.0105027445,
+        0.11977232, 0.08174273, 0.14738199, -0.078264266, 0.040588383, -0.06842633, -0.120374024, 0.041898817, 0.10180863, -0.11100135, -0.055513192, 0.10904803, 0.015793568, 0.065940484, -0.14154205, -0.12431406,
+        -0.06280628, 0.06559354, 0.06851536, -0.12386487, -0.117944054, -0.029718012, 0.108218886, 0.07113438, -0.11619868, 0.13860543, 0.0056442777, 0.107112065, -0.14687261, -0.1366285, 0.15434708, -0.091251545,
+        -0.0012829143, -0.084419675, -0.06799955, 0.046639174, 0.01667304, -0.07242361, 0.15455201, 0.09293552, -0.05357012, -0.11429647, -0.11927892, -0.007832055, 0.0121615585, 0.11019366, 0.10137929, -0.035269625,
+        0.02494266, -0.0030274154, -0.028447017, -0.03149423, 0.06304593, 0.029831734, -0.0184008, -0.05266592, 0.0320955, 0.1405327, 0.033254363, 0.05212361, 0.038225446, -0.01875064, -0.008031636, -0.09131196,
+        0.081613116, -0.13232927, -0.05207625, -0.12194555, -0.075890996, -0.071794, 0.08848529, 0.1421082, 0.11203792, 0.16169281, 0.09863562, -0.03141473, -0.047591966, 0.12486606, -0.12550792, 0.10463089,
+        0.1094587, 0.058153752, 0.0027533292, 0.018273976, -0.12139216, 0.11960516, -0.076858304, 0.097803265, -0.025687518, -0.046157304, -0.012641327, 0.004701198, 0.06355759, 0.043729313, -0.08966088, 0.11325399,
+        -0.12552553, -0.04460682, -0.08051521, 0.12695566, -0.015860602, 0.15429945, 0.063838445, 0.07542811, 0.02432041, 0.10539737, -0.03285164, -0.1072805, -0.0008570319, -0.055604268, 0.08025665, -0.102326095,
+        0.045859624, -0.12623388, 0.14678013, 0.13158396, 0.037174363, -0.12566431, -0.07018772, -0.056839336, -0.10820151, 0.10562512, 0.005760631, -0.018737074, -0.045984972, -0.10715529, -0.037819784, 0.0882384,
+        -0.10605896, -0.13107873, 0.13444144, -0.108446546, 0.049150553, 0.10962231, -0.029997533, -0.031233417, 0.13969114, -0.14693974, 0.021725914, -0.054724485, 0.05299291, -0.019401586, 0.07772026, -0.034924466,
+        -0.117796354, 0.02618138, 0.036434125, -0.057489723, -0.04530233, 0.020761656, -0.008787071, 0.017204558, -0.06645735, -0.0035278078, 0.0045078783, 0.042546373, -0.12340098, 0.024408208, -0.11248358, -0.115221985,
+        -0.08889103, -0.010200805, -0.11527121, 0.007258322, -0.13337569, -0.11709318, -0.0026420811, 0.015719436, 0.1427438, -0.05955097, -0.065727964, -0.0991016, -0.117937185, -0.022610469, -0.14657134, 0.06720739,
+        -0.08044769, 0.09967825, -0.066182405, -0.099013, 0.1332168, -0.07507824, -0.11656903, -0.010501943, 0.036736675, -0.00778335, 0.12466273, 0.07882487, 0.10778523, -0.13733162, 0.10010663, -0.006896002,
+        0.08655255, 0.08679842, -0.005320927, 0.13117863, 0.05840339, -0.09076928, -0.02822187, 0.054829247, 0.0047918875, 0.14686693, -0.075200334, 0.051224254, -0.110103495, -0.057424616, 0.033628296, 0.05961602,
+        -0.145663, 0.10911779, -0.1250334, 0.009071841, 0.027661068, 0.0882036, 0.0341324, 0.11072389, 0.015785124, -0.15621637, -0.13329825, 0.018876338, -0.12750529, -0.1494076, 0.07266113, -0.11542452,
+        0.06549864, -0.07146036, 0.10661079, 0.09487755, -0.103164844, 0.11111666, 0.14409322, 0.0916534, -0.11079666, -0.106570505, 0.13340801, 0.08034849, -0.08281033, 0.135024, 0.09701689, -0.12256037,
+        -0.03404779, 0.054974917, -0.08363695, -0.05629933, 0.11809457, -0.14868598, 0.005670276, -0.018165763, -0.008321352, 0.06374589, 0.145368, -0.022986602, -0.055926662, -0.06071876, -0.15685177, 0.13110878,
+        -0.041246627, 0.035939764, -0.06089495, -0.0855947, -0.15685032, -0.07744733, 0.10880767, -0.13294382, -0.0011694758, -0.0973999, 0.13781054, 0.07978951, -0.06360805, -0.11444379, -0.1171559, 0.024569359,
+        -0.031091034, 0.09675755, 0.098774895, -0.09802037, -0.14625928, -0.14659819, 0.096716784, -0.017990815, -0.07634283, -0.09863657, -0.03856873, 0.11628554, -0.01913105, -0.032822806, -0.058450352, 0.0634732,
+        0.03436657, -0.03066675, 0.005881164, 0.049274467, 0.15261476, -0.04113852, 0.060021706, -0.13337271, 0.096329264, 0.13077463, -0.060496803, 0.114939325, -0.06462393, -0.1146379, -0.123663805, -0.018770171,
+        -0.08438744, 0.03496686, -0.12433306, -0.06753834, -0.13479751, -0.0070688403, 0.071261406, 0.07854428, 0.016606068, 0.09277458, 0.02657035, 0.07555854, 0.12591134, 0.045259155, 0.12941526, 0.07906467,
+        0.123800196, 0.03452078, 0.102119654, 0.08861778, 0.052136566, -0.057583738, 0.15259272, -0.0047955634, 0.13161807, -0.15231323, -0.037722852, 0.12469787, 0.024301797, -0.041217387, -0.07416022, 0.09092462,
+        -0.06307582, -0.0024677438, -0.08203679, 0.010166796, -0.04800925, -0.03585921, -0.11018628, 0.1110214, 0.018000709, -0.057468005, -0.15891357, 0.02417393, 0.054769605, 0.08773322, -0.13687786, 0.049663097,
+        0.1321422, -0.07359067, 0.1291848, -0.052999057, 0.04730352, -0.09339135, 0.038367704, 0.12783574, 0.04978441, -0.009110981, -0.15041077, 0.008448241, 0.02517386, -0.09832338, 0.094701044, -0.132292,
+        -0.099618986, -0.07374179, -0.08069511, -0.14100021, -0.12439623, 0.04810917, -0.14096846, 0.0713966, -0.028898241, 0.03482248, 0.10506004, 0.12618801, 0.028837096, -0.15810111, -0.0067828675, 0.020911451,
+        0.09667678, -0.023941934, 0.05009951, 0.030943662, 0.04609186, 0.028942997, -0.0098101385, 0.09129743, 0.1138636, -0.021638023, -0.09799572, 0.06645229, 0.11559374, -0.09985484, -0.12806292, -0.124703534,
+        0.0949104, -0.16018236, 0.13160296, -0.038714033, -0.10398022, -0.12790534, -0.1308544, 0.12680802, -0.11011093, -0.15436494, -0.0446496, 0.089473575, -0.024534525, 0.09292263, 0.1216571, 0.09523842,
+        -0.005719193, 0.11601642, 0.04577139, -0.13215195, 0.06433236, 0.122943975, 0.022886287, -0.0555137, -0.042696506, -0.008792913, 0.11995519, 0.068730265, -0.1103019, -0.13532425, 0.12315154, 0.08141969,
+        0.12125508, 0.034142237, 0.07840387, -0.10858266, -0.064079024, 0.12736546, 0.08926328, -0.094609424, 0.04020387, 0.10838744, 0.0028633443, 0.011606348, 0.147727, -0.035799604, -0.090097055, -0.011628077,
+        -0.09389988, 0.065203, 0.11638043, -0.07214472, -0.096574426, 0.09125969, -0.12525593, -0.022230875, 0.05020253, 0.005898803, 0.08406797, 0.08938975, -0.023312522, -0.1300024, -0.0419417, 0.12432812,
+        0.12017597, 0.07906016, -0.11100084, 0.045114137, -0.07782507, -0.023319365, 0.10370901, -0.039869394, 0.07837415, -0.10283171, -0.11045061, -0.10962716, 0.013592876, 0.12233164, 0.0698714, 0.03969296,
+        -0.10562355, -0.113576494, -0.074330285, -0.14011183, 0.039871473, -0.13203934, -0.01724787, -0.09451715, 0.098294936, 0.10992367, -0.051856387, 0.029181877, -0.12441565, 0.04406932, 0.06424811, 0.10377994,
+        -0.082883395, 0.02701234, 0.043139737, -0.052845288, -0.039820146, 0.12557825, 0.0402631, -0.12067225, -0.02629495, 0.13126434, 0.06611016, -0.013298136, 0.12437903, 0.048106365, 0.0069202194, 0.075858355,
+        0.03705276, -0.0464055, -0.050263103, 0.11022376, -0.14523524, -0.010768758, -0.113017164, 0.014200502, -0.13705923, -0.1448851, 0.10778583, 0.0051995325, 0.06870856, 0.12902762, -0.14966854, 0.021536676,
+        -0.03827284, 0.001377733, -0.11671925, -0.004095519, 0.12267849, -0.11514861, 0.11513958, 0.031514343, -0.15268655, -0.12075698, 0.13737814, 0.116972335, 0.042278863, -0.13549429, -0.050548714, -0.11036118,
+        0.010020836, 0.053670608, 0.033674043, 0.07315085, 0.0007859215, 0.14575702, -0.065496065, 0.12049502, 0.011117982, -0.10156146, 0.079823665, 0.052181352, 0.03874787, -0.04208612, 0.1341497, 0.10355055,
+        -0.13738778, 0.11298438, 0.06385733, 0.14243641, 0.12803516, -0.10480114, 0.07552823, 0.033036944, 0.026230814, -0.08142666, 0.08047862, -0.092952676, 0.009442586, 0.15605584, -0.021423139, -0.017466383,
+        -0.013854774, -0.065532126, 0.032997146, -0.015801042, -0.075258866, -0.083624706, 0.03677611, 0.08443848, 0.13367112, -0.08978661, -0.115986556, 0.14809385, -0.09009251, 0.08261409, 0.0023412292, -0.047496606,
+        0.15008008, -0.14139582, -0.041445017, 0.10899289, 0.09310017, 0.08317235, 0.037398368, 0.14856093, -0.031681538, -0.15609567, -0.13114199, 0.11684001, -0.099560395, 0.045648295, -0.103334025, 0.05360979,
+        0.11345908, 0.049146626, 0.098594405, -0.15203762, 0.10410182, 0.020773437, 0.09479996, 0.118605115, -0.12059151, 0.09692705, -0.13576406, 0.0036016358, 0.105524026, 0.07796571, 0.052330162, -0.12829554,
+        0.13595271, -0.083140984, -0.020792723, -0.034723658, -0.12198914, 0.1451459, -0.015543775, 0.030004678, 0.11624937, 0.13606276, -0.004375394, -0.02272531, 0.11356487, -0.044270404, 0.009582867, -0.016431728,
+        -0.08651822, -0.1317173, -0.007259356, -0.047265917, -0.06720759, -0.07795886, 0.044898216, -0.1279136, -0.08279498, 0.082359895, 0.038484313, -0.113989234, -0.13710418, -0.054792184, 0.022324799, -0.04509285,
+        0.01925145, -0.019545624, -0.12771495, 0.029740872, 0.038748495, 0.053581536, -0.068102315, -0.0642909, -0.08748935, 0.10781752, -0.014143589, -0.12498559, -0.077341676, 0.031326734, -0.053790938, 0.121154636,
+        0.13241503, 0.061273962, 0.046311382, -0.080042824, -0.021596318, 0.041651137, -0.11958396, 0.06384053, 0.053476833, -0.0679665, -0.10637483, -0.12560093, 0.11142216, -0.0458191, -0.048823766, -0.05784469,
+        0.012579499, -0.103989065, 0.06968834, 0.11815096, -0.14122598, -0.061963305, -0.01766953, -0.029263431, -0.10398939, -0.072816856, -0.11102116, 0.0878968, 0.12273329, 0.044664014, 0.04175261, -0.010056364,
+        -0.12828462, -0.024232037, 0.12075425, -0.13595432, -0.13700877, -0.0017103284, -0.05826021, 0.074430786, -0.14391084, 0.12383257, -0.016146649, -0.08857908, -0.051007282, 0.105620585, 0.06949661, -0.12531841,
+        -0.11001044, 0.107542984, 0.04738058, -0.026488792, -0.06568505, -0.13626362, 0.08987829, -0.053383976, 0.09175917, -0.02243606, 0.12260587, 0.09932581, -0.041899722, 0.07653467, 0.029296318, -0.038281344,
+        -0.011282225, -0.07400258, 0.10090969, 0.100797445, -0.029848164, 0.064615175, 0.08700223, -0.059057575, 0.12866609, 0.12061014, 0.079764456, 0.124774694, -0.043795694, 0.0033834449, 0.063171916, 0.14775443,
+        -0.10153948, -0.14050773, -0.13930857, 0.09259803, -0.025692977, -0.09723055, -0.06810109, -0.13871479, -0.11386393, 0.13772677, -0.01977784, 0.06428503, -0.13164635, -0.09288211, 0.024331992, -0.048342526,
+        -0.11699773, 0.12344778, -0.12507541, 0.1415199, 0.110491656, 0.016799893, -0.035924725, -0.08025564, 0.015439347, 0.09620849, 0.07695587, 0.12285967, -0.11894082, -0.14351708, 0.06682176, -0.031179365,
+        -0.14605558, -0.13088293, -0.10478572, 0.14503081, 0.12582557, -0.13940021, -0.06457981, 0.027708484, -0.12829594, 0.052677754, -0.025610268, 0.115017705, -0.029093321, 0.1101157, 0.12984173, 0.15248287,
+        -0.04337419, -0.111855015, -0.14358997, 0.027010052, -0.11956906, -0.12360946, 0.043244172, 0.14352831, 0.11050753, -0.050054826, -0.120395616, 0.021033265, -0.14795724, -0.14391635, -0.13578625, -0.05049491,
+        0.062464252, -0.1391582, 0.106271714, 0.07047135, -0.028435387, -0.10622125, -0.026436012, 0.07711731, -0.033287548, -0.021918194, 0.029814256, -0.011705591, 0.08612393, -0.054600496, 0.13066444, -0.13340497,
+        0.018013345, -0.107314326, -0.043575123, 0.035731766, 0.01703439, 0.11116627, -0.116273, -0.0011074904, 0.09937525, -0.12810753, -0.03180761, 0.101870716, -0.099123254, 0.14289887, -0.053006675, -0.013662643,
+        0.146053, -0.038689855, 0.09624828, 0.028365014, 0.11421535, 0.048530046, -0.03632548, 0.070314065, -0.00071317825, -0.11721885, -0.0903239, 0.008798694, 0.04971295, -0.09643198, 0.084080264, -0.14404151,
+        -0.027320595, -0.05512672, -0.12038504, -0.13607168, 0.092866145, 0.12531254, 0.059372097, -0.010715468, 0.0026908892, 0.011772679, -0.09234019, -0.08963076, 0.013245902, 0.0978798, -0.07458777, -0.14765564,
+        -0.06534701, -0.15054385, -0.116552815, 0.05659476, 0.09171776, -0.030544043, 0.09782465, -0.13578904, 0.06872173, -0.09748238, -0.028598433, -0.038306586, -0.015409983, 0.025870971, 0.009863242, 0.04489922,
+        -0.025211284, -0.023145607, -0.09066664, -0.054343168, 0.09067974, 0.14790073, 0.013846952, -0.12823988, 0.14409077, 0.008372225, 0.034651797, -0.042342544, -0.00037942003, -0.09765399, -0.12397331, 0.13413878,
+        0.148173, 0.14325714, -0.15529476, -0.14707227, 0.08646467, 0.0776144, 0.11108777, -0.055856317, -0.13126016, 0.10619789, 0.058930945, -0.07214041, -0.093466535, -0.04401961, 0.10060768, 0.042431522,
+        0.0621638, -0.1399553, 0.0802468, 0.050503884, -0.14452846, 0.033975773, -0.121201366, -0.09587142, 0.009104724, 0.00025494615, 0.124010585, -0.018705217, 0.0539968, 0.12520428, 0.049725275, -0.07965319,
+        -0.08669995, -0.12753887, 0.044564024, 0.14554393, -0.03628341, 0.041052304, -0.1276936, 0.12524459, -0.016935552, -0.09349703, -0.10943436, -0.1464922, 0.037136476, 0.09066576, -0.1389504, -0.047136743,
+        0.07940346, 0.14929599, -0.14611384, 0.02928887, 0.12124966, -0.15039632, -0.12679778, 0.044562805, -0.114714324, 0.13622855, -0.1180452, 0.11709138, -0.07988419, -0.070055164, 0.13607965, -0.012538439,
+        0.05718349, -0.074549586, 0.07468126, 0.11554575, 0.012134511, -0.10133641, -0.019934261, 0.0048178346, -0.11864834, 0.005649859, -0.020317806, 0.13803014, -0.11468578, -0.037349634, 0.13902964, 0.079570495,
+        0.075544596, 0.095336065, -0.09845642, 0.071773954, 0.092068, 0.09373874, 0.113170125, -0.14073522, -0.05623692, -0.09519158, -0.016104685, 0.13000536, 0.08728241, 0.117766045, -0.03429143, 0.02024977,
+        0.08775842, -0.101339914, 0.044202827, -0.03629149, -0.074504785, 0.14828256, 0.06221793, 0.109986514, -0.04353044, -0.12149881, -0.04754009, -0.08452842, 0.14182444, -0.043698307, -0.14135213, 0.063915305,
+        0.12660344, -0.12844299, 0.062403493, -0.02027635, 0.010626012, -0.10336901, -0.045598745, -0.13967054, -0.06037235, 0.036848377, 0.1150573, 0.13112752, 0.14489658, -0.10336404, 0.1418311, 0.024856841,
+        0.06685182, -0.021652916, -0.08434967, 0.11761415, -0.13021244, -0.0013054366, 0.041259784, -0.11282987, -0.11799831, 0.122628175, -0.00479907, -0.044539068, 0.10718333, -0.1293537, 0.024422701, 0.00844215,
+        0.1348326, 0.062610775, -0.01387327, -0.07928245, -0.05862466, -0.0063011777, -0.03338369, -0.068938784, -0.081950605, -0.09554808, -0.16769023, 0.16908842, -0.07452452, -0.0770106, -0.09379064, -0.04229068,
+        0.11913266, 0.06250667, -0.08648219, 0.095277146, 0.13205044, 0.123324215, 0.1186958, 0.090237506, -0.023370052, -0.02623088, 0.03493405, -0.09256225, -0.09226509, 0.01746391, 0.055957764, 0.05198002,
+        0.021307308, 0.08142883, 0.10269524, 0.038084604, 0.061041348, 0.08142397, -0.00050838466, 0.11647131, -0.019425316, 0.025695352, 0.03622121, 0.12405558, 0.08013588, -0.08443682, -0.01273182, 0.049345884,
+        0.087225065, 0.16157949, 0.097085446, 0.11140005, -0.05777665, -0.03324206, -0.07373305, -0.040036812, -0.06019353, -0.05730337, -0.045536462, 0.1473742, -0.09984844, -0.06541085, 0.08957665, -0.112955794,
+        -0.014750474, -0.1179736, 0.08352937, 0.091228284, 0.045239262, -0.017861681, -0.031545322, -0.103817485, 0.037992787, -0.06540718, -0.114250764, 0.07420091, -0.07125879, 0.02777309, 0.083944924, 0.16467574,
+        0.046373412, -0.047739245, -0.14953764, -0.08358672, -0.036384728, -0.14083524, 0.027706487, -0.04212338, -0.010242311, -0.07685806, 0.069999665, 0.13168158, 0.14121278, -0.15104844, 0.107149474, -0.12565738,
+        0.07920128, 0.11250824, -0.038231492, -0.1375963, 0.14359312, 0.12533669, -0.07484285, 0.14791228, 0.17981316, 0.12617363, 0.058847997, 0.030752458, -0.0039074235, -0.07523837, 0.14333023, -0.06946063,
+        0.07309035, 0.06389326, -0.007543623, 0.08603664, -0.044249557, 0.116255745, 0.09703747, -0.111007996, -0.15165645, -0.10487758, 0.0112962695, 0.06844318, -0.09534543, -0.12597837, 0.08328515, 0.09136183,
+        0.07615576, 0.13906635, 0.1417044, 0.12534836, 0.062203098, 0.15872754, -0.08827751, 0.10619665, 0.14639907, 0.05844501, 0.12135455, 0.08723284, -0.011591739, -0.06457716, 0.051841147, -0.09613425,
+        -0.017814158, -0.060864765, -0.12564917, 0.027211852, -0.118997134, 0.13191928, 0.14913608, -0.06271509, 0.115597606, -0.079997405, -0.033572726, 0.020552317, -0.14578833, -0.00029762433, 0.15748252, 0.021030584,
+        0.048326403, -0.07857474, -0.13606352, 0.019731918, 0.09092495, 0.06510809, -0.033239268, -0.09397486, -0.14416532, 0.14362493, 0.03804861, 0.027845478, -0.021141626, 0.15342857, 0.013995467, 0.026702492,
+        0.09096131, -0.08701872, -0.030291941, 0.13162382, -0.094988674, -0.06888229, -0.007142054, -0.05490082, -0.12610048, 0.121211484, 0.13359934, -0.01489005, -0.04169158, 0.059577122, 0.118613, 0.15376893,
+        -0.13883302, -0.100593835, -0.095774114, 0.03134399, 0.14043811, 0.10152045, -0.14475434, 0.076174065, -0.11341892, -0.019677626, 0.09693518, 0.047654614, 0.045678433, 0.15739241, 0.02171754, -0.09736384,
+        0.059865136, 0.10758797, 0.01766543, -0.10482362, -0.01894731, -0.020063771, 0.012559723, 0.0050661378, -0.10096814, 0.06384318, -0.119882494, 0.093119144, 0.008377469, 0.124356024, -0.0052191876, -0.0096588945,
+        0.06157259, 0.09329491, -0.115969874, 0.14794515, -0.034593806, -0.091461934, -0.10913925, -0.13270953, 0.09638865, 0.053823635, 0.002898159, -0.06407448, -0.028213201, 0.15122378, -0.064505756, -0.07329845,
+        -0.05973553, -0.009403976, -0.13252571, -0.08049403, 0.048905127, 0.043940295, -0.10793792, 0.00590401, -0.04764702, 0.12033033, 0.07380913, 0.06318782, -0.14828856, 0.119921796, 0.09330639, -0.049150962,
+        -0.13448095, 0.13187537, -0.083018534, 0.07483189, 0.0004820081, -0.05269668, 0.13170701, -0.0049290205, -0.027558655, 0.13432951, 0.06541498, -0.06906359, -0.113007694, -0.12280883, 0.0039224657, 0.1009443,
+        -0.09049345, 0.100949, -0.092924125, -0.09009123, 0.06951691, 0.10785107, 0.12241454, 0.013975882, 0.019829331, 0.10580018, 0.13477801, -0.142336, 0.1053629, -0.04680528, 0.13801335, 0.084481835,
+        -0.104603164, -0.08365477, 0.1427617, 0.09644901, -0.11135906, -0.12403752, 0.06356364, -0.066992015, -0.038785335, 0.059640147, -0.07871052, -0.029893287, -0.08818111, 0.13274354, 0.027039018, 0.02550263,
+        0.14246133, 0.0655057, -0.04412167, -0.025243951, 0.115391344, -0.041825883, -0.08112104, -0.13830711, 0.03602868, 0.006298388, -0.038044967, -0.11515667, 0.1434833, -0.019696506, -0.14420928, 0.10226209,
+        -0.101908505, -0.11604385, -0.0040305816, -0.026813358, 0.09640701, -0.13740252, -0.07936583, 0.006139257, 0.11030096, 0.006789896, 0.011112405, -0.009667461, -0.10767566, 0.06843965, -0.09272014, -0.086115435,
+        -0.03215884, -0.09963595, 0.072709, -0.092764884, -0.14840984, -0.15339558, 0.07203825, -0.11450619, -0.036993515, 0.00734985, 0.12901804, -0.15034992, 0.031062031, 0.008362217, -0.01426234, 0.032322556,
+        0.02467207, -0.14895788, 0.106462754, -0.06717038, -0.06550809, 0.06719131, -0.007796329, 0.018929785, -0.0045617563, 0.0685841, 0.0869112, -0.0004351194, -0.14727226, 0.13440111, -0.12746456, 0.070221126,
+        0.010057606, 0.036243618, 0.1474453, -0.07021405, 0.017426293, 0.13426574, -0.09948568, -0.07916408, -0.070612445, 0.0611541, -0.1255112, -0.040992774, 0.03305637, -0.07111335, -0.003969316, 0.12998939,
+        0.10735187, -0.034828454, 0.107690424, -0.001257082, -0.13580975, -0.07282889, -0.085608214, 0.14483689, -0.114664204, -0.13278846, -0.07353974, -0.09124971, -0.021492183, -0.08632736, 0.08313416, -0.13445453,
+        -0.111370526, 0.12719496, -0.08113441, -0.009512064, -0.030312581, -0.078514494, -0.093098834, -0.13282937, 0.12930892, 0.14813535, -0.14450735, -0.05617128, -0.023585964, 0.110488884, 0.024484674, 0.03242692,
+        -0.12170557, -0.050421752, -0.15248358, 0.11443762, -0.007300337, -0.095738545, 0.043521915, -0.03694831, 0.0587242, -0.014452446, -0.06031884, -0.067956336, 0.094466925, -0.0026375859, 0.12024804, -0.09659451,
+        -0.12568875, 0.019149657, 0.012721047, -0.014417505, 0.0608497, 0.13066514, -0.059235036, -0.13113931, -0.099021256, -0.14576276, -0.1316486, 0.107385, -0.05637078, -0.028352546, 0.008157105, -0.08298795,
+        -0.068844, 0.15044595, -0.13653249, -0.14944911, 0.12279801, -0.14193793, -0.04436187, -0.029547019, -0.09560737, 0.11422515, -0.1154812, 0.105642095, -0.10639072, 0.005303518, 0.09300018, -0.092670545,
+        0.05636625, 0.04659248, -0.020741742, -0.05947556, 0.07342879, 0.0039055864, -0.14323482, 0.0052446355, -0.019547187, 0.017744452, -0.073314585, 0.111242, -0.09843026, 0.034256626, 0.07471344, -0.07359689,
+        -0.07144267, 0.06304612, -0.12947117, -0.123441, 0.07114499, 0.09543389, 0.14676654, -0.06046497, 0.074671626, -0.14052895, 0.07874057, -0.11549527, 0.017999817, -0.0021432482, -0.06341637, -0.12892921,
+        -0.11928891, 0.0035820685, 0.053240206, 0.009493374, -0.075118765, 0.09486809, 0.14969802, -0.09291846, 0.041474417, 0.15434043, -0.09995393, 0.11304272, -0.08546356, 0.0792196, -0.012772125, 0.07132404,
+        0.09430786, 0.12760764, 0.10430938, -0.10378052, 0.036422577, 0.055282615, -0.084907115, 0.15957907, 0.14875413, -0.059211172, -0.16455115, -0.019656971, -0.07614706, -0.11559412, 0.06951075, 0.028903283,
+        -0.053488232, -0.050420012, -0.037635587, 0.08164008, -0.09309098, -0.09899807, 0.075844765, 0.12137111, 0.027492002, -0.023164654, -0.10108527, 0.060291354, -0.10352703, 0.024252053, -0.05931065, 0.11258327,
+        0.082698576, 0.08180715, -0.02963488, -0.08496158, -0.07900634, -0.037137926, -0.12829553, -0.09660827, -0.08116444, -0.03850391, 0.051827278, -0.12917021, 0.1252692, -0.1386593, 0.10906858, -0.029903173,
+        0.14393981, 0.07465072, 0.03397591, 0.14629962, -0.1281615, -0.029616114, 0.032278918, 0.03149031, 0.08721983, -0.10009626, 0.12813269, -0.10533692, 0.09671247, 0.05426812, -0.058652326, 0.11782132,
+        -0.15961184, -0.13890079, 0.13664243, -0.053078838, -0.054835662, -0.13190025, -0.07810549, 0.0014322733, -0.04134802, -0.060133472, -0.11091322, 0.018471142, 0.14067423, -0.048942864, 0.12686235, 0.08777491,
+        0.094444305, -0.13392547, 0.10056692, 0.13435371, 0.013679749, 0.016994225, 0.015888738, 0.10294735, -0.10305464, 0.030917503, -0.10544359, 0.06609903, 0.11373377, 0.031143177, 0.124094605, 0.09087689,
+        0.008190089, -0.044663496, -0.002396008, -0.09527146, -0.09095304, -0.024243401, -0.011445206, 0.14391746, -0.09464516, -0.08407737, -0.059347402, 0.1118159, -0.14786288, 0.06875009, -0.13707401, -0.118676886,
+        0.085278146, -0.104868524, 0.029909609, 0.08750888, 0.123994604, -0.048688814, -0.14245394, -0.06366923, 0.091566145, 0.13012832, 0.02312321, 0.051376607, 0.08785172, -0.15496463, -0.07846251, 0.004372545,
+        -0.020736815, 0.13175765, 0.09397288, -0.01898416, -0.0105025945, 0.1463677, 0.14161542, -0.10556856, -0.08094703, -0.13302192, -0.06747028, -0.051851828, 0.15297316, -0.053399872, 0.05581357, 0.092258915,
+        -0.057785887, 0.10754717, 0.054358136, 0.12240617, 0.050788596, -0.048160087, -0.03218619, -0.035087373, 0.00071133854, 0.14176558, -0.09921967, 0.076540515, 0.0005803355, 0.12163289, 0.083281204, 0.04810144,
+        -0.14709565, -0.025771553, -0.10637561, -0.14723797, 0.055893376, -0.018142061, -0.10267642, 0.03231526, -0.09102528, 0.008974121, -0.098551445, 0.06977445, -0.111687236, -0.038282014, -0.0800914, 0.123915985,
+        -0.040976636, 0.06673935, 0.1191906, 0.10667845, -0.04123752, -0.09228513, -0.027380891, 0.11856812, -0.09994118, -0.004040025, -0.14276923, 0.065855704, -0.13520616, -0.12502924, 0.10897593, 0.061023537,
+        -0.0049551805, 0.05576708, 0.032354504, 0.0064647165, -0.020125104, 0.000631592, 0.013729263, -0.048886828, 0.01611223, -0.0414395, -0.13431989, 0.008504203, -0.023129497, -0.14145921, 0.08368116, 0.041936398,
+        -0.133707, -0.028114798, 0.01817378, -0.13419063, 0.12364666, 0.10164919, -0.047612224, -0.081882566, -0.028431168, 0.050690092, 0.046855662, -0.049228, -0.10290836, -0.11089311, 0.04202864, 0.11146631,
+        0.09995165, 0.066618964, -0.020650769, -0.042276453, -0.13636522, 0.036897853, -0.017481456, 0.15515152, 0.08982842, 0.12513332, 0.045298982, -0.11753745, 0.091603726, -0.069451764, 0.026453573, -0.009274418,
+        -0.0041613746, 0.14247832, 0.12273619, -0.034432795, -0.11757285, -0.036820013, -0.04239474, -0.06683855, 0.100063816, 0.03224986, -0.029990083, 0.07865736, -0.0987626, -0.12667096, 0.013626382, -0.09061913,
+        0.004116845, -0.0702852, -0.13133831, 0.11688856, -0.1480388, 0.035539567, -0.10241056, 0.011087542, -0.12109829, 0.011520908, -0.01119763, 0.003945046, -0.11239745, -0.002305104, -0.14623246, -0.13491493,
+        0.12729754, -0.12610483, 0.036793586, -0.017622178, 0.07430153, -0.069767036, 0.029288014, -0.11350112, 0.08528454, 0.097067244, 0.026268253, -0.0796707, 0.11862966, -0.10825866, -0.0741668, 0.03652501,
+        0.031575944, 0.039767314, -0.12684736, 0.13224754, 0.010041121, 0.03676844, -0.07017409, 0.11054388, 0.093536615, 0.121882476, -0.046999104, -0.09694026, -0.11574587, -0.067253284, 0.048105773, 0.09363042,
+        -0.115142636, 0.15804656, -0.1575287, -0.1301466, -0.033109985, -0.108651064, 0.021561615, -0.09661019, -0.0028485155, -0.060904935, -0.10258715, -0.008340873, 0.13224313, 0.0042448407, -0.12149254, -0.10831351,
+        -0.03473405, -0.08966314, -0.14552642, -0.033305306, -0.021400731, 0.13301499, -0.04800382, 0.08206516, -0.11008423, -0.08739753, 0.041381523, 0.13236946, 0.046450965, 0.0031514326, -0.09190619, -0.118281916,
+        0.14747022, 0.13917744, -0.10086865, 0.13426296, 0.05279742, 0.044010412, -0.09679837, 0.119361565, -0.051985834, -0.07235591, -0.09473565, 0.009285222, 0.020229492, -0.14270034, -0.009613189, 0.13818522,
+        -0.120047376, -0.14426027, -0.10384068, -0.14362301, 0.037985466, 0.07367597, 0.043722857, 0.052683175, -0.12832485, -0.14047131, -0.039733037, -0.10435379, -0.111150354, -0.06252206, 0.087016046, -0.065664664,
+        -0.107532784, -0.0164494, -0.0077539836, -0.0021869668, -0.093910456, 0.116352335, -0.13062267, -0.14197735, 0.07737028, -0.14199305, 0.07446579, -0.027921025, -0.043939102, 0.10223975, 0.13603815, 0.072089896,
+        0.08936959, -0.07691539, -0.13551131, -0.07633743, -0.12066241, 0.04026904, -0.020278001, -0.0081218695, 0.06795393, 0.012965616, -0.09283092, -0.047495794, 0.05823318, -0.019810105, -0.1517531, 0.116431154,
+        -0.053937122, -0.13334753, -0.0406812, 0.08111811, -0.028329335, -0.11156958, -0.01400288, 0.004741692, -0.022492034, -0.11705831, -0.14515911, -0.12206707, -0.113465786, 0.011794725, -0.055478707, -0.14011501,
+        0.082268536, 0.06039739, -0.08158029, 0.12834156, 0.049354825, -0.11874589, -0.10087165, -0.06892591, 0.030107044, 0.09351216, 0.035885215, -0.07853237, 0.03707512, -0.11197847, -0.09113901, -0.058775153,
+        0.06786966, 0.10404445, 0.0048717237, 0.07842484, -0.07230955, 0.028926224, -0.080674134, 0.10980739, -0.032886352, -0.116534434, -0.08605761, 0.12719531, -0.11367464, 0.08352367, 0.14040923, -0.046379324,
+        -0.019525075, 0.1443867, 0.09621999, 0.01498731, -0.09156385, -0.10802561, -0.0988026, -0.12803787, -0.13822627, -0.01739273, 0.090285614, -0.1250103, 0.13258794, -0.13864824, 0.020077817, 0.017751856,
+        0.12171787, -0.11075114, -0.02575282, -0.03601707, -0.0052342624, 0.11756589, -0.026807895, -0.15058735, -0.15033355, -0.13133346, 0.11950481, 0.01619087, 0.07007709, -0.03618685, -0.07361953, -0.024065431,
+        0.13571219, -0.094765544, 0.123789094, 0.12255606, 0.09525525, 0.07676848, -0.05546504, 0.058735717, 0.06855764, 0.11927829, 0.10549576, -0.08059876, -0.095282696, -0.00042197932, -0.026655689, -0.032748364,
+        -0.07277559, -0.04584186, -0.013520027, 0.0515775, -0.083852254, 0.008873099, 0.026950335, 0.016938284, 0.023238096, 0.0071344227, 0.03981397, 0.05360659, -0.07098926, -0.026643109, -0.06264219, 0.08584306,
+        0.086100996, -0.030695148, 0.06114974, 0.0657186, 0.09457862, 0.04294259, -0.11356421, -0.15909483, -0.13799194, -0.10155565, -0.047787867, -0.00932493, -0.089165516, 0.07305908, 0.083404765, -0.06009036,
+        0.06529927, -0.037480716, 0.012156214, -0.05993118, -0.032584887, -0.09132677, -0.057401977, -0.002885095, 0.047997646, -0.075317994, 0.048966642, -0.031596713, -0.012607223, -0.09459943, -0.16244608, 0.06652434,
+        0.11913767, -0.0062673367, 0.0076154466, 0.042589, 0.14454842, 0.093677424, -0.026506014, 0.15985216, 0.11024309, 0.04714467, -0.082992405, 0.13208225, 0.084760845, -0.15081474, -0.14632246, -0.13118249,
+        0.11615541, -0.07691889, -0.10460277, 0.08410495, -0.072911, 0.11691802, 0.09562623, 0.1379201, -0.11361789, -0.073677994, -0.04574913, 0.1378577, 0.06079726, -0.01573103, 0.08883648, -0.105132185,
+        0.1021513, -0.070068315, -0.045772444, -0.11376713, 0.013415711, -0.04940428, 0.002142484, -0.08024551, -0.14049426, 0.05129785, 0.09253144, 0.08361119, -0.091750085, 0.042500887, 0.025091382, 0.08478856,
+        -0.09971446, -0.08227766, 0.011273113, -0.024707923, -0.031905867, 0.14466786, 0.0152383, -0.019605098, -0.1361569, 0.020004764, -0.12524298, 0.08733963, 0.03904002, 0.06772814, 0.101705715, 0.045077022,
+        0.15876491, 0.09932441, -0.079597116, 0.097708024, 0.077168815, 0.08097689, -0.12011801, -0.13081716, -0.16477507, -0.13475686, -0.024048503, -0.05018568, 0.112275355, -0.12633273, 0.05185077, 0.12125675,
+        -0.013384457, 0.11261057, 0.10988171, -0.00015414652, -0.10297609, 0.13587548, 0.08931348, -0.050912812, 0.10891921, 0.046775576, 0.008324251, 0.08454582, 0.11348074, -0.030112877, 0.11454452, 0.105736636,
+        0.13361916, -0.1512577, 0.00660235, -0.0015487701, -0.012133432, 0.08529181, 0.14230162, 0.10207523, -0.026439302, 0.037418246, -0.08275527, -0.12652564, -0.0023452356, 0.07531105, -0.11493475, -0.0016282761,
+        -0.009357338, 0.058593094, -0.042819504, 0.13955985, -0.033549298, 0.12281961, -0.033234905, 0.10969241, 0.000913222, 0.0835782, -0.03232244, -0.03949002, -0.0662744, -0.04155267, 0.0133344615, -0.1253989,
+        0.14130202, 0.101665206, 0.056124985, 0.04239107, -0.12837617, 0.032029584, 0.09217664, 0.0025999085, -0.09293048, -0.005856716, 0.023198597, 0.09308841, -0.07922239, 0.020798001, -0.108382314, -0.0375838,
+        0.14302628, 0.1423514, -0.058763474, 0.05501143, -0.098070435, -0.024158679, -0.015360058, -0.08273347, 0.10638229, -0.14802004, 0.0979876, -0.0018193948, 0.066440366, 0.023614537, 0.047597885, 0.052100014,
+        -0.08689616, 0.080637716, 0.1282692, -0.09722091, 0.10738514, -0.12709294, -0.035147272, -0.014242252, -0.11603351, 0.039608706, 0.13203646, -0.055622634, 0.010706644, 0.020568443, 0.112375505, -0.046989765,
+        0.13836941, -0.005420346, -0.025903426, -0.110200085, -0.043327253, 0.028247777, -0.14598842, -0.04041611, -0.09130088, -0.07752468, 0.067695655, 0.0030015127, -0.1263582, 0.035892565, 0.015573252, -0.07779793,
+        -0.11156119, 0.008207857, -0.01751698, -0.00048157087, 0.005194627, 0.040095884, -0.09053618, -0.12660268, -0.12752047, -0.11470172, -0.017231494, 0.0545662, -0.06949698, -0.08684787, 0.11164195, 0.10078184,
+        -0.11008033, -0.04076564, 0.10813301, 0.13093373, 0.1411449, -0.095355526, -0.13251849, -0.067419656, -0.11206593, -0.08925174, 0.13342763, -0.012561474, 0.08780873, 0.15439147, 0.047404245, 0.09799075,
+        -0.074885435, 0.10222608, -0.078487344, 0.04404613, -0.048892185, 0.015352702, 0.12957907, -0.12649232, -0.07023215, -0.06649438, 0.004160554, 0.05310095, -0.021818815, 0.062384516, -0.028753571, 0.1046375,
+        -0.07251214, -0.077448405, 0.012687985, 0.08215807, 0.1015581, 0.001582833, 0.097542234, -0.08390941, 0.13648075, -0.1412576, 0.03330291, 0.14667235, -0.111881986, -0.14518777, -0.12959103, 0.0977356,
+        0.11732379, -0.023271918, 0.08130519, -0.0044452213, -0.1045032, 0.06001197, 0.035563957, -0.058870777, 0.0041593164, 0.12583542, 0.026122425, 0.0057286816, -0.07038188, 0.09386219, 0.13184375, -0.0878755,
+        0.044039685, -0.15430099, -0.0481975, -0.13326249, 0.0007711382, -0.121026084, 0.15552428, -0.048453778, -0.12924111, 0.0972863, -0.09190672, 0.10044215, -0.117908835, 0.15372159, 0.12882742, -0.009544418,
+        -0.1567557, -0.098805115, -0.059703212, 0.061242472, -0.035602063, 0.13779078, -0.011288698, 0.062294517, 0.123812966, -0.13759615, -0.14684471, 0.113779925, 0.14435948, -0.114803895, -0.0020246138, -0.024725607,
+        0.06363897, -0.024406107, 0.14268193, 0.071395904, -0.11433265, -0.052218977, 0.009951393, -0.11036064, 0.057847437, -0.08269426, 0.12028735, 0.13774891, 0.08067301, -0.06430782, 0.06980784, 0.05207622,
+        0.0039914325, 0.09073244, -0.019582981, 0.07643689, 0.06312855, 0.12629181, -0.08098723, 0.03800133, -0.0007431293, -0.09755926, -0.04345336, -0.009252611, 0.1408863, 0.10976447, 0.14262053, 0.07137524,
+        -0.019490108, 0.010969188, -0.13734166, 0.061247803, -0.0854414, 0.046831354, -0.04316469, -0.011678531, -0.00031510837, -0.050124004, -0.016825307, -0.1326018, -0.042154174, 0.10745782, -0.1234757, 0.16691983,
+        -0.030234886, -0.07567733, -0.077033736, -0.01034259, -0.08916499, 0.085755035, 0.021810858, 0.025048418, -0.1333117, 0.023656853, -0.12688033, -0.010037142, -0.033546463, -0.106586665, 0.098393306, 0.01418222,
+        -0.13178602, -0.027461238, -0.011123116, -0.12422779, -0.08158302, 0.049882043, 0.012822315, -0.1222291, -0.034580983, 0.08335912, -0.12144682, 0.11107998, -0.12948024, -0.087101184, 0.17477812, -0.019971702,
+        -0.047291163, 0.15748003, -0.025881404, -0.06431727, 0.07314293, 0.14248995, -0.047557015, 0.121870235, 0.03891731, 0.05554327, 0.13234223, -0.025046341, -0.0815795, 0.016086472, -0.05188406, 0.015802221,
+        0.058986545, 0.12103006, 0.13507669, 0.01952009, 0.025321038, -0.12056176, -0.0025135742, 0.0087587945, 0.061653543, 0.0078042476, 0.117439665, -0.1065435, 0.108351335, 0.13266358, 0.0981825, -0.107553974,
+        -0.103133455, -0.016514553, -0.12329633, 0.14397034, -0.10985292, 0.11797926, -0.0999533, 0.008149022, -0.100404195, 0.1386947, -0.029292183, -0.12817423, -0.12402002, -0.057353526, -0.10352671, 0.061191168,
+        -0.09476445, -0.06949128, -0.0388817, -0.068264365, 0.011582889, 0.095880516, 3.612315e-05, 0.113128744, -0.026010705, -0.060917236, -0.007072965, 0.073334344, 0.15183468, -0.0057143923, 0.039452992, 0.13371956,
+        0.0863944, 0.019906648, 0.16707757, 0.02896462, 0.04327103, 0.111256115, 0.054938033, -0.04460354, 0.07019295, -0.13504562, -0.099996835, 0.15165523, -0.10504647, 0.12539218, -0.08286266, 0.03846994,
+        0.07298404, -0.11792565, -0.07181086, -0.13597085, -0.03861675, 0.10360234, -0.15995274, 0.06724758, 0.10108327, -0.00986913, -0.040610548, -0.04430888, 0.040222257, -0.14841898, 0.0047984864, 0.04176523,
+        0.15990582, 0.0985707, -0.058258716, 0.1413158, -0.108398855, 0.08996746, -0.07822409, 0.1589229, -0.03940499, -0.08182384, -0.05810409, 0.13737006, -0.12954572, 0.08585057, 0.12219691, -0.0549242,
+        -0.08827629, 0.029485889, 0.10205408, -0.10912152, 0.02407535, -0.012171892, 0.114499256, -0.09405254, -0.13004717, 0.109898865, 0.066537604, 0.042158097, -0.10540715, 0.06990826, 0.039461073, -0.14378956,
+        -0.13215306, 0.1233865, -0.00225678, 0.116934165, -0.12564567, 0.15244584, 0.0538757, -0.024616743, -0.04945093, 0.007478025, -0.07425222, 0.0636138, 0.10023822, -0.0077830176, -0.08939622, 0.057767153,
+        -0.035253957, -0.086048074, 0.15070415, 0.07501547, 0.15057312, -0.061796382, -0.11374217, 0.09350853, 0.11312244, 0.02742394, -0.070903026, -0.13770191, 0.015434556, -0.031078616, -0.053270627, 0.040167075,
+        -0.030030292, -0.021000871, 0.1529449, 0.06150437, -0.1418005, -0.13367128, 0.0074425056, -0.09275635, -0.086431876, 0.14821148, 0.01874219, 0.13171384, 0.051224735, -0.063608855, 0.11852993, 0.009026966,
+        -0.1446122, 0.13254787, 0.09514189, -0.06805265, -0.111593775, 0.06284835, -0.08959362, -0.031087045, 0.09872976, 0.015720172, 0.091543, 0.05482662, 0.14679308, -0.1298789, 0.0677987, 0.03143086,
+        0.002167388, 0.067439765, -0.11787639, -0.10750701, 0.08493846, -0.07844343, -0.010499315, 0.0029581548, -0.039178167, 0.052228797, 0.029514764, -0.015486067, -0.03012917, 0.012001049, -0.101817735, -0.12887087,
+        -0.12893142, -0.012349921, -0.12648621, -0.07494045, 0.06438439, -0.0711779, 0.06828332, 0.039499547, -0.055698667, -0.10739686, -0.026793877, 0.06814501, 0.15372856, -0.013444375, 0.105427906, 0.051886197,
+        0.12300487, -0.13158682, 0.12324656, 0.06988066, 0.089258015, 0.037763335, 0.09015387, 0.05725079, -0.085346214, -0.119311355, -0.080673315, -0.11608169, 0.10400725, 0.094591826, 0.043123044, 0.096481256,
+        -0.10204898, 0.08636261, 0.13093027, -0.025481554, 0.092744455, 0.102729306, 0.12460016, 0.14282946, -0.113129936, 0.0495485, 0.053927302, 0.012456723, 0.12623745, 0.012377113, -0.103453316, 0.07248024,
+        -0.12850995, -0.04976841, -0.08307629, -0.057236545, 0.073794685, -0.047576636, 0.05058959, -0.12427519, -0.06020864, -0.0579701, -0.09580375, -0.034557324, 0.03657291, -0.1295994, 0.1285516, 0.012806591,
+        -0.11297515, 0.15226008, -0.0998677, 0.08425942, -0.061671924, 0.09775869, 0.02409122, -0.13876279, -0.080745876, 0.0028750477, -0.08344221, -0.052759886, -0.12460633, 0.0044188425, 0.029428799, 0.041558508,
+        -0.025498006, 0.046650376, -0.089840144, 0.11046003, -0.022050587, 0.011573659, 0.12942877, 0.12480986, 0.0011232219, -0.0853197, -0.0939027, 0.09493698, 0.11110743, 0.06774867, 0.13973455, 0.1332274,
+        -0.12288476, -0.045354344, 0.0655211, 0.0338889, 0.12878165, 0.05544735, -0.023119329, -0.12303186, 0.00803195, -0.049692634, -0.023797613, -0.13294218, 0.10330175, -0.034568854, -0.097863816, -0.03302824,
+        -0.10230616, 0.057987977, 0.035660125, 0.13069786, -0.1536768, 0.13868071, 0.1375949, -0.11030971, -0.039570518, -0.105727986, -0.08833625, -0.054752573, 0.050051678, -0.06317898, 0.1451297, 0.089628786,
+        -0.020318735, 0.086373284, 0.095816664, -0.12280582, -0.092121884, -0.06982121, -0.09355849, -0.03535762, -0.0060336827, 0.07072, 0.008213972, -0.04052676, -0.10840747, -0.12007217, 0.052973274, 0.059830885,
+        -0.08208847, 0.065068424, 0.057409402, 0.048910875, 0.010231148, 0.15606055, -0.012103589, 0.014243157, -0.10845675, -0.041112475, -0.087501034, 0.12111889, 0.0062616756, -0.005455446, -0.12122572, 0.030841397,
+        -0.04433856, -0.13944897, 0.0022667078, 0.12584239, 0.055643227, 0.13554303, 0.08649172, 0.09348832, 0.04550792, 0.14315775, -0.12163273, 0.0740635, -0.13204503, -0.1586234, 0.14538354, -0.027096828,
+        0.15138654, -0.044550523, 0.017528377, -0.08904786, -0.0036487735, 0.1396102, -0.11876582, -0.10285882, 0.10708337, -0.10623775, -0.002051744, -0.027544273, -0.11155831, -0.050970413, -0.10673509, -0.05015074,
+        -0.108941294, -0.021552546, -0.039710533, 0.040631767, -0.051985644, 0.0011074524, 0.1112278, 0.14013201, 0.04691879, -0.027488139, 0.08708346, -0.041635487, 0.002772815, -0.009168917, -0.014278171, 0.12923764,
+        0.04062688, 0.14335452, -0.038524467, 0.12041384, 0.009056919, -0.11690569, -0.04535049, -0.013910388, -0.09232321, -0.02800427, -0.13714032, 0.11759048, 0.01102983, -0.047839172, -0.1352403, -0.005369906,
+        -0.04497784, 0.012827947, -0.14577144, -0.0020161408, 0.11552096, 0.053189103, 0.089808166, -0.14322858, -0.11731061, 0.10449829, 0.039124917, 0.12256883, 0.031764317, -0.13601466, 0.09033949, -0.015703205,
+        -0.07246926, 0.06541211, 0.024448507, -0.12687774, 0.083448544, -0.081213266, 0.10442044, 0.10054287, -0.08273674, -0.12672284, -0.13173603, 0.08785625, 0.016895356, 0.14607511, -0.002541218, 0.1370441,
+        -0.13358913, -0.1475373, 0.04277471, -0.038864266, 0.1172531, 0.1301426, 0.13397628, 0.1080761, 0.022481548, -0.14947794, -0.08402399, -0.13309024, 0.14368524, -0.14274293, 0.084306195, -0.13667227,
+        -0.09326534, 0.028716763, 0.0140126515, -0.042817708, -0.0068589123, -0.009079307, 0.03167351, -0.034640294, 0.009362682, -0.08001967, -0.11906871, 0.02619802, 0.027739998, -0.067773744, -0.13187182, -0.0005884146,
+        -0.008745167, 0.084091805, -0.086478144, -0.028119743, 0.021990562, -0.09007464, 0.113585696, 0.12188243, 0.093335174, -0.030140288, 0.13509513, -0.1407996, -0.14727098, -0.029249089, 0.11163791, 0.053441357,
+        0.043603405, -0.003651467, -0.12313937, -0.082654186, 0.011539712, -0.14024872, -0.01100772, 0.06759189, -0.11477577, -0.13339405, -0.081631154, -0.09579642, -0.0028581123, -0.0645443, -0.05333152, 0.13078329,
+        0.113277465, 0.105764635, 0.0516142, -0.104637966, 0.12708336, 0.14409457, 0.052692924, -0.0934003, 0.0063377186, 0.040771704, -0.039795615, -0.0076511907, -0.10702838, -0.05491001, -0.08287188, 0.11657488,
+        0.11280388, -0.12948143, -0.016931497, -0.083838575, -0.052666873, 0.09913449, -0.11394176, 0.09657945, 0.15080172, 0.1103136, 0.12194109, 0.019899713, -0.08814218, -0.16080232, 0.13135618, -0.05052278,
+        0.057906464, -0.078449786, 0.017185848, -0.035970747, 0.024186766, 0.1080397, -0.14237764, 0.07633856, -0.12964594, 0.1261914, 0.110047854, -0.07497515, 0.15242516, 0.07521188, -0.030025069, 0.1101889,
+        0.083999954, 0.09289542, -0.05525548, -0.1566336, 0.0696663, -0.022015514, 0.12866086, -0.08467908, 0.028212968, -0.06013826, 0.09794136, -0.1328643, 0.034866683, -0.0070605357, 0.09538054, -0.113444634,
+        -0.011300365, 0.13745631, -0.09405178, 0.02706979, -0.1155728, -0.11949634, 0.0525167, -0.06549011, -0.014348759, -0.020875396, -0.022368103, 0.09176555, -0.047839876, -0.06507785, 0.14289688, -0.11848923,
+        -0.04458248, -0.06572093, -0.06282974, 0.07717178, 0.04230481, 0.14049725, -0.107061245, 0.030565226, -0.13692884, -0.11204109, 0.14290918, 0.1320093, -0.06141387, -0.12847382, 0.13547857, 0.12202383,
+        0.018189939, 0.031117925, -0.034057878, -0.100235716, 0.09655158, 0.09276078, -0.14350475, 0.08365558, -0.026495455, -0.055470534, 0.018555665, -0.14339419, 0.09826447, -0.0028191584, -0.087864116, 0.13128537,
+        0.04036923, 0.14660712, 0.06047433, -0.041140758, -0.0636043, -0.087407246, -0.039779473, -0.13363151, 0.03362282, -0.14982872, 0.06169839, -0.15055887, 0.1204325, -0.14233567, -0.121275246, 0.05047997,
+        0.014107946, 0.07527299, -0.08236894, 0.08982705, -0.14908932, 0.10813324, -0.09250316, -0.017490847, 0.02076732, -0.13309509, 0.12181737, 0.018075248, 0.028247166, 0.09288777, -0.08651927, -0.020720504,
+        0.06395095, -0.119950674, 0.06739795, -0.12543051, 0.13101192, -0.120729, 0.03193132, 0.00012144851, 0.15684383, -0.10593386, -0.02542868, -0.092130244, 0.02269142, -0.15108903, 0.07813265, -0.10673424,
+        0.11755058, 0.040811, 0.13997725, 0.041921902, 0.080138005, -0.10356118, -0.01791274, 0.10155466, -0.004893346, 0.14514987, 0.077881336, -0.066873, -0.09693434, -0.046701115, -0.041291755, 0.0146293985,
+        0.08167803, -0.044980813, 0.09877312, -0.009976246, -0.070408665, -0.00039461575, 0.05173795, 0.016316328, -0.11173951, 0.108817175, 0.12337508, -0.11248396, -0.06993936, 0.072927505, -0.08099371, 0.0018461678,
+        0.07950228, 0.1424927, 0.11155251, 0.007784166, -0.019333906, 0.11061024, -0.05766746, 0.11308017, 0.09976277, 0.0895919, 0.114957385, -0.16118449, -0.043142132, 0.08265261, 0.05775653, 0.048614997,
+        0.1247161, 0.15288058, 0.059922524, -0.006627193, 0.13157488, 0.07825378, -0.14693812, 0.03839287, -0.095365256, 0.05251118, -0.12875594, 0.0024990493, -0.02541272, 0.09396871, 0.0870731, -0.030357629,
+        -0.026621325, -0.110187106, -0.13700916, 0.06576956, -0.038324613, -0.107361875, -0.053749733, -0.05472807, 0.00019332269, 0.14272083, 0.03713251, -0.012622205, 0.06767111, 0.07071014, -0.024970945, -0.09893887,
+        -0.021939762, 0.100884445, 0.123427525, -0.016217925, 0.15725985, -0.025946448, 0.09417368, -0.045079682, 0.14446704, 0.010059203, -0.11123813, 0.13133532, -0.0384521, 0.13173352, 0.09097798, 0.113742076,
+        -0.1098769, -0.020128677, -0.07892901, 0.011334198, -0.07615518, -0.117708124, -0.07628578, 0.06398237, 0.082094684, 0.11326584, -0.10646731, 0.16165747, 0.051707085, 0.009248348, 0.094764896, -0.12028736,
+        -0.10421478, -0.09288988, -0.012565278, -0.14921534, 0.057019014, 0.09135501, -0.07869537, 0.08943764, 0.076939635, -0.12157724, -0.08162085, -0.09196705, 0.114253394, -0.043487903, 0.14540458, -0.020469343,
+        0.07864596, -0.06301196, -0.07125686, -0.01721686, -0.15147243, 0.07882377, -0.037720717, 0.1535337, 0.12240349, 0.061418884, -0.10869562, 0.08252267, -0.032752328, -0.10626083, 0.0687883, -0.04710649,
+        -0.14054191, -0.13401788, -0.099504344, 0.077807985, 0.15268217, -0.13473554, -0.11023676, -0.11811686, -0.06471522, -0.05488397, 0.014334388, 0.08640903, -0.048848774, 0.13826196, -0.0032194273, -0.089979455,
+        0.09049016, 0.05891052, -0.04947847, 0.07714527, -0.13934386, -0.045298256, 0.039803177, -0.070620984, 0.025688082, -0.11551302, -0.07760164, 0.019547088, -0.10559807, 0.096487686, 0.08109613, 0.03850706,
+        0.1263694, 0.04134181, -0.06984512, 0.09739646, 0.11194968, -0.038436648, -0.020248422, 0.056527015, -0.13273996, -0.011684647, 0.035030026, -0.1283825, 0.01937294, 0.005034471, -0.115110956, -0.0014078862,
+        -0.12659882, -0.032631308, 0.11453769, -0.09377474, -0.005719696, -0.1423613, 0.11265572, 0.10284044, 0.024864465, 0.12581567, -0.022932518, 0.14640744, 0.06505952, 0.083077215, -0.11192305, 0.09108437,
+        0.10016753, -0.05361012, 0.13367887, -0.057865825, -0.10030493, -0.033269655, -0.093844764, 0.12809217, -0.064036824, -0.011157937, -0.037369687, -0.023662573, 0.0862674, 0.09177996, 0.09546623, -0.07615658,
+        -0.020601207, -0.013017622, 0.020945705, 0.11840149, -0.12402563, -0.054436088, 0.032644864, -0.09310479, -0.02437233, -0.041458365, 0.078887336, 0.06521573, 0.09306788, -0.10672521, -0.15416154, -0.1080541,
+        -0.13016413, 0.024308855, -0.093118556, -0.08673815, 0.012791669, -0.1002773, 0.15427254, -0.10451308, -0.016532222, 0.061911304, 0.11241035, 0.07932469, 0.12436288, -0.112814315, 0.07161267, 0.044708826,
+        0.111134104, 0.013795017, 0.11653884, 0.021683533, 0.057705812, 0.093338855, -0.102665454, -0.07438735, 0.15285446, 0.10673549, -0.114485316, 0.10765348, -0.12892061, -0.14582697, 0.0023257118, -0.14127071,
+        -0.08718302, 0.05611509, -0.0335698, 0.12822533, -0.15040968, -0.06646389, -0.13523708, 0.13721062, 0.003068718, -0.029897531, -0.010167199, -0.028352495, -0.020253867, -0.14548002, 0.08681056, 0.07214835,
+        -0.09396929, 0.037947807, -0.014918735, -0.04841219, 0.14026551, -0.10538672, -0.08624008, -0.03898104, 0.118397765, 0.07767832, -0.0091302125, -0.096438356, -0.15249532, -0.03478128, 0.085013, 0.09898753,
+        -0.050049283, 0.10250482, 0.14288223, 0.09444345, -0.013872491, -0.018157296, -0.017064245, -0.1345741, 0.049810622, -0.023999386, 0.06940338, 0.044829838, -0.08474917, -0.03391731, 0.038935397, 0.09233147,
+        -0.13239752, -0.023797614, 0.0815104, -0.14450283, 0.026304469, -0.1545671, -0.024061142, 0.13562846, -0.15390937, -0.15687665, -0.102782734, 0.0011400115, -0.01727436, -0.05031779, 0.06064392, 0.012664418,
+        0.12519418, 0.084976554, 0.06847473, 0.0043673296, -0.048889678, -0.12767075, 0.14417279, 0.047632825, 0.14326626, -0.048469786, -0.13272017, -0.033892725, -0.10818239, -0.11540155, -0.0049587335, -0.10769482,
+        0.08877721, 0.098164484, 0.109764725, 0.038291115, -0.10907721, 0.13529369, 0.09892264, 0.13063288, 0.014622336, 0.12569201, -0.0067326855, -0.002852764, -0.15740177, -0.08611823, 0.0028293019, -0.14978695,
+        -0.11771791, -0.07981088, -0.0248719, -0.119632155, -0.11348041, -0.024327874, -0.04342624, -0.046533905, 0.1277577, -0.1419785, 0.01198313, 0.11864646, -0.01480602, -0.11212436, 0.14166415, -0.02448148,
+        0.07406786, -0.06223992, -0.07380747, 0.13453235, 0.0607504, 0.13004425, 0.12206678, 0.092395626, 0.09819703, -0.13318111, 0.026042128, -0.089950345, 0.14160717, 0.095428616, 0.0068507846, -0.10885416,
+        0.10018965, 0.10801902, 0.0057699936, 0.13214828, 0.07981397, -0.10167775, 0.09211347, 0.033600923, -0.12780707, 0.10947252, -0.10407086, -0.046998624, 0.09227376, 0.12680845, -0.11065365, -0.107734375,
+        0.11165853, -0.14402957, 0.08890739, -0.09580255, 0.10927433, 0.047256395, -0.012918609, -0.05762562, 0.00613665, -0.14679684, -0.104575194, -0.0713878, 0.05481305, 0.02627313, -0.017818049, 0.13462396,
+        0.021239357, 0.12859675, -0.043431852, -0.06231895, -0.021022368, -0.007500485, 0.06709613, 0.06476638, 0.012906018, 0.14117639, 0.04690192, 0.009909395, 0.0076291817, 0.02128226, 0.04261465, -0.062267773,
+        -0.14608757, -0.08209069, -0.14303833, 0.045461196, -0.020092294, -0.069053486, -0.054453105, 0.023941608, -0.065280795, -0.007184328, -0.018820368, -0.038784526, 0.04210754, 0.1152529, 0.11079628, 0.044055622,
+        0.026926715, -0.038564935, 0.023560215, 0.11259228, -0.03206919, 0.13406496, -0.03156626, 0.12606943, -0.049735226, -0.029158808, -0.12468187, 0.07460709, -0.1136397, -0.09136356, 0.066606425, 0.0026669009,
+        -0.044199426, 0.00036007108, 0.08250663, -0.0514498, -0.11712702, 0.095867574, -0.06076361, -0.020884225, -0.080619715, 0.08296643, 0.053068575, 0.12098083, -0.11254162, 0.08396745, -0.08324022, -0.03347273,
+        0.042765986, -0.09901064, -0.077940024, 0.13568875, -0.022101019, 0.05128504, -0.12925202, 0.093002915, 0.080682844, 0.12746194, 0.1079751, -0.08291731, 0.0027332078, -0.048349854, -0.043545723, 0.114158764,
+        0.15914346, -0.12823515, 0.0667504, 0.10444725, 0.005477204, 0.07117925, -0.10252901, -0.1363161, -0.10700754, 0.098574944, 0.102727406, -0.06683451, -0.07764624, 0.06829442, -0.10016337, 0.12591775,
+        -0.14046511, -0.1089572, -0.11620644, 0.044049516, 0.08523194, -0.13522631, -0.034522, 0.15639518, 0.14953692, 0.050361708, -0.053788923, 0.097639576, -0.10296752, -0.14439781, -0.076772496, -0.14285564,
+        0.07770551, 0.094486594, 0.043299865, 0.0063698557, -0.059864704, -0.027039517, -0.096082665, 0.09635367, -0.09666994, -0.02019658, -0.11942833, -0.04333418, 0.009001773, -0.12313037, -0.06859621, 0.12718433,
+        -0.058990035, -0.06408748, -0.105371386, 0.04992091, -0.0014581253, -0.08609696, 0.022007488, 0.15043712, -0.12876332, 0.07341767, -0.14276639, 0.01958468, 0.16063902, -0.03585731, 0.11800295, 0.044684634,
+        0.12073837, -0.013875055, -0.08059021, 0.0027167243, -0.07629062, 0.043522045, 0.01301015, -0.03985002, -0.11870777, -0.119990095, 0.12545225, 0.06532105, -0.09401821, 0.058338188, -0.099224396, 0.01361347,
+        0.06781804, 0.039708547, -0.03867651, 0.010421071, -0.13447131, -0.12421775, 0.008316604, 0.10129418, 0.021854414, -0.09986489, 0.056461096, -0.09932355, 0.17305756, 0.102427416, -0.12928572, 0.121830694,
+        -0.050493903, -0.06684711, -0.076986365, -0.1305112, -0.067039356, -0.008969106, 0.16001752, 0.16491635, -0.05037338, -0.0138585875, 0.17379819, -0.1027064, -0.063301206, -0.09073822, 0.09877659, -0.068791084,
+        -0.021470973, 0.06327576, -0.13341428, -0.08423032, 0.09094462, 0.02076693, -0.055293366, 0.089071296, -0.016957257, 0.12082303, 0.03909813, 0.1553619, 0.012575612, 0.10129011, 0.10316109, 0.1457213,
+        0.06465126, -0.12452341, 0.16041987, 0.05720273, 0.023759877, 0.08743606, 0.05232465, 0.1471263, 0.05526916, 0.07147314, -0.046530034, -0.06737762, 0.049553927, 0.14771771, -0.07131042, 0.081946656,
+        0.057608988, 0.0917196, 0.101456776, -0.06732121, 0.08616743, -0.028766459, 0.14873086, 0.09415973, -0.124991216, 0.061315995, -0.12047637, 0.08663535, 0.071439035, 0.053388216, -0.11732596, -0.08729379,
+        0.07634862, -0.10864605, 0.122019336, 0.15549996, -0.13932379, 0.044033546, -0.0071000387, -0.06513519, 0.024415364, -0.12172792, 0.13389519, 0.12529725, -0.12993361, -0.068654805, -0.13669936, 0.10919841,
+        -0.055379193, -0.02938276, -0.027818413, 0.025405308, -0.051932305, 0.08713127, 0.014070068, -0.062500894, -0.114551276, -0.12579015, 0.1282547, 0.011316554, -0.04343751, -0.0044190115, -0.0507807, 0.022602139,
+        -0.00039363967, -0.11737858, 0.0551877, -0.09640618, -0.07765695, -0.036749743, 0.1295658, 0.11463933, -0.04966072, 0.03107091, 0.037317708, -0.0023495757, 0.09340728, -0.0014198147, 0.03148527, 0.14623946,
+        -0.03740223, -0.11457836, 0.15560117, -0.13441978, 0.10201562, 0.057204407, -0.04512839, 0.012007047, -0.04475753, 0.125947, -0.09738182, 0.0042169825, 0.1417371, 0.074756436, 0.12956609, 0.1529823,
+        -0.10252529, -0.10242574, -0.1159654, -0.12346362, 0.11590595, 0.11597086, 0.056735527, -0.07904448, 0.14485328, -0.0017999457, -0.0020856957, 0.062243726, 0.0020840315, 0.042429425, 0.11744471, 0.10756413,
+        -0.019606853, -0.08185541, 0.13579158, 0.059570212, 0.15714596, 0.12470559, -0.04544755, 0.10494046, 0.093151726, -0.063876934, -0.14056337, 0.14826912, -0.14403501, 0.15536036, -0.03035211, -0.038624648,
+        -0.03287424, 0.124454655, 0.014527374, -0.14053608, -0.12954743, -0.0020917635, -0.15084074, -0.0071195955, -0.111841455, 0.01482018, -0.04951101, -0.0021569526, -0.14493729, -0.13467441, -0.11242125, 0.14543799,
+        0.107298, -0.14657278, -0.048393082, 0.040170237, -0.1285834, 0.01109327, 0.07081575, 0.07885062, -0.08554995, -0.12007891, 0.095962964, 0.09168308, -0.03689592, -0.0822904, -0.1631233, 0.042672884,
+    },
+    b = {
+        -0.0039883535, 0.0042179106, 0.017508462, 0.012491285, 0.007144044, 0.007117222, 0.002893916, 0.006073723, 0.0063980925, 0.0032022425, -0.008069065, -0.0048934, -9.0046946e-05, -0.0008793299, 0.013215114, 0.01656113,
+        0.014694274, 0.0020781013, 0.009379207, -0.011879986, 0.008680574, 0.008540345, -0.003793483, 0.0010609523, 0.01609859, 0.014362666, -0.0064898175, -0.010501865, -0.004222787, -0.0034278838, 0.0067481776, -0.005520506,
+        0.0022975076, 0.0, 0.008903619, 0.0060009314, 0.0039497553, 0.00781561, -0.006061101, 0.0052163447, -0.0106285885, 0.0037674743, -0.0041440777, -0.004896186, 0.011260268, 0.010795424, 0.008511974, -0.0031065943,
+        -0.003529338, -0.0011410402, 0.0073232236, 0.005392491, 0.008132559, 0.015888443, 0.0, 0.0028940027, 0.005897168, -0.0070660627, -0.0007455525, 0.004224165, 0.0077929487, 0.010498625, -0.0016769003, 0.010779685,
+        0.0054294104, -0.0049050148, -0.0021257955, -0.0026695519, 0.008645886, 0.019661982, 0.003429966, 0.014054114, 0.015155236, -0.0069035413, 0.009361605, 0.00682877, -0.0021502331, 0.0, 0.004847129, -0.0040664524,
+        -0.0032241645, -0.0027377082, 0.0043052263, -0.0013343582, -0.00083941815, 0.009068512, 0.00042342, -0.0090768635, 0.009198968, -0.008238665, -0.005610008, 0.0119375605, -0.007704999, 0.0093749855, 0.00066463306, 0.0019148778,
+        -0.0024856348, 0.0075150565, -0.004861383, -0.0017716856, -0.00883173, -0.004382862, 0.0, 0.0, -0.0051447446, 0.019830914, 0.008728608, 0.0010687917, -0.004076801, 0.0101103755, 0.008010325, -0.0022426967,
+        0.0, -0.006491741, -0.002731513, 0.0036585573, 0.010777617, 0.0123316655, -0.0028574606, 0.0064409245, -0.011170828, -0.009176698, 0.015619665, -0.008314234, -0.008249157, 0.0009362974, 0.009734223, 0.008439508,
+    },
+}
 
-local Weights = HttpService:JSONDecode(json)
+layers[3] = {
+    inDim = 128,
+    outDim = 5,
+    activation = "linear",
+    W = {
+        -0.08564997, -0.053776708, 0.11664528, 0.14288817, 0.041968394, -0.062341526, -0.0738771, 0.113864504, 0.07484825, -0.13904761, -0.10878116, 0.058450002, -0.05839733, 0.14873448, 0.1415543, 0.12740622,
+        -0.027840808, -0.11198552, 0.079999626, -0.13163246, -0.012609018, -0.0093291085, -0.1660921, -0.21074328, -0.1662526, 0.0036415916, 0.13696969, -0.10911976, -0.18834831, -0.12668554, 0.12578465, 0.17065227,
+        -0.023926912, -0.20138112, 0.19075038, -0.07958099, 0.047147993, 0.18850715, -0.07093555, 0.10935521, 0.037959307, 0.1272266, 0.19536445, 0.16618219, -0.0036694135, 0.14816798, -0.1572555, 0.070080936,
+        -0.08347556, 0.1183497, 0.16948956, -0.14013837, -0.13207886, 0.018858215, -0.20963916, -0.08687133, -0.19112399, -0.10207705, -0.14912494, -0.031061102, 0.03892222, 0.15089771, 0.048551463, 0.18669951,
+        0.16702765, 0.12558182, 0.012273627, 0.039211128, 0.21261208, -0.07678962, 0.07684072, 0.14013575, 0.076863796, 0.20491111, 0.084235154, -0.11158033, -0.13275336, -0.19312337, 0.12719029, 0.06518762,
+        0.11732228, -0.08045471, 0.09065886, -0.2064971, 0.052919716, 0.100325495, -0.0019813234, -0.14633955, -0.20107873, -0.13727152, 0.15644225, -0.029095192, 0.088473685, -0.20719495, 0.17379554, -0.1822503,
+        0.14143902, 0.043492105, -0.12121858, 0.04432211, -0.035936277, -0.11468503, 0.10905535, 0.05447135, -0.043414548, -0.048103746, 0.08846876, 0.01375458, 0.015682943, 0.0026512376, -0.1123243, -0.014722999,
+        0.11909307, -0.14200501, 0.17094362, -0.12732296, -0.0813759, -0.0070040333, -0.09390133, 0.19923869, 0.06374707, 0.121944614, 0.011260665, 0.022802886, -0.014839167, 0.113394156, -0.15550037, 0.20721936,
+        0.08716552, 0.21426617, 0.06436246, 0.1593231, 0.073654264, 0.091201685, -0.1751665, 0.2045547, 0.18281418, 0.06091444, -0.09574135, -0.10437345, -0.17196606, -0.045617536, 0.041574787, 0.11416809,
+        0.15336898, 0.036497347, 0.07419416, -0.063338876, 0.1776871, 0.08195125, -0.06495571, -0.1656528, 0.0062595997, 0.15336877, -0.021423936, 0.007835093, -0.06779933, 0.16076533, 0.10504466, 0.09629294,
+        -0.16442363, -0.17825703, 0.14730908, -0.13844152, 0.16155915, 0.17768829, -0.16514553, -0.13150357, -0.049580224, 0.05686918, -0.2041026, 0.1754468, 0.12633236, -0.10057413, 0.10346885, -0.14297691,
+        -0.12668428, -0.042191602, -0.18498173, -0.097206205, -0.101590216, 0.0987553, -0.17232454, 0.14609024, 0.022319125, -0.11458329, 0.2116927, -0.0429319, 0.05215774, -0.01811449, -0.17024562, -0.17759286,
+        -0.07728124, -0.16411431, -0.04649765, -0.18628833, -0.070723355, 0.047482897, -0.11904783, 0.042035967, 0.009940471, -0.1935467, 0.2087437, 0.0023012024, -0.028683165, 0.1980493, -0.02057793, 0.046554357,
+        -0.11711398, -0.19883057, -0.120423645, -0.025324235, -0.047674213, -0.03691537, 0.117373124, -0.119752064, 0.20002341, -0.063682064, -0.18778889, 0.110486105, 0.21191797, 0.14632216, 0.119893484, 0.1719435,
+        -0.0112536615, -0.12623574, 0.11997539, -0.13179247, 0.009905083, -0.16856073, -0.21189661, 0.15665443, -0.07007901, 0.16383371, 0.17077056, 0.18057786, 0.028931644, 0.17157821, 0.13686818, -0.18548203,
+        0.20309637, -0.18489249, -0.09461427, 0.08460612, 0.21474375, -0.024082225, 0.058326066, -0.021297952, -0.010124714, 0.0047020903, 0.05360469, -0.20595923, -0.107011184, -0.13334814, -0.14426242, 0.1839378,
+        -0.16480377, -0.04047578, 0.036825094, -0.014713801, 0.03208835, 0.05276887, 0.04551382, 0.18858786, 0.17959794, 0.085730225, 0.055077262, -0.14778559, -0.06276686, -0.04932311, -0.083373934, 0.17396806,
+        -0.16149598, -0.103678904, 0.059144046, -0.10224993, 0.18288766, 0.10277019, 0.11818845, -0.049019154, 0.19563752, -0.0717637, -0.051913932, -0.16358684, 0.1489483, -0.07482804, -0.06035322, 0.049475912,
+        -0.15236445, 0.012443481, 0.17938274, 0.11845928, -0.03469927, -0.009040749, -0.15204762, -0.06241813, 0.101142086, 0.20434016, 0.19231804, -0.018936232, 0.18630368, 0.20482832, -0.20510623, -0.1351676,
+        -0.12413781, -0.0062705074, 0.16207863, 0.11852718, -0.07459029, 0.025924882, 0.15001626, 0.14148284, 0.1907612, -0.17492399, 0.16084561, -0.07350977, 0.0085783815, -0.063284546, 0.026231473, 0.04076354,
+        0.12843607, -0.016535593, -0.06560217, 0.0346712, 0.20374443, 0.0960797, -0.07971222, 0.10971852, 0.082591794, -0.021994643, 0.10476494, -0.03491731, 0.096893296, -0.13693714, 0.21610388, -0.20594199,
+        0.10894723, 0.10574073, -0.059316542, -0.14277202, -0.07326778, 0.20245112, -0.12910274, -0.14724031, 0.08147304, -0.088150084, -0.081240974, -0.17677897, 0.1723924, 0.18890935, -0.031346466, 0.13138102,
+        -0.14095177, 0.089648336, 0.18043853, 0.03622471, -0.08861299, 0.20528112, 0.1782723, -0.20883635, -0.12893328, 0.17775805, 0.17215571, -0.07174626, 0.11062743, 0.17813845, 0.14499296, 0.12887315,
+        0.0682007, 0.029465258, -0.13036306, 0.05234122, 0.15454496, 0.19710319, -0.085176624, -0.07995417, -0.11590904, -0.09674627, 0.068739995, -0.020256018, 0.0709287, -0.02860537, -0.18711784, -0.0842735,
+        0.103544, 0.17909187, 0.05699186, 0.13769367, -0.015146091, 0.1297729, 0.07602431, -0.16687419, -0.088346556, 0.10547049, 0.14673105, -0.001641321, -0.09093894, -0.14567725, 0.21093607, 0.12885386,
+        0.076012954, 0.096942544, -0.13605762, -0.18664922, -0.08614294, -0.15178579, 0.19287166, -0.0018161727, 0.101295166, 0.1528744, -0.11337808, -0.032181542, -0.080207564, 0.07326837, -0.12054794, 0.00068372197,
+        0.041080642, -0.08878279, -0.09498284, 0.12036529, -0.17221685, -0.022436243, 0.12519051, -0.11689573, 0.07935023, -0.19556232, -0.035677493, -0.17157118, 0.15924703, 0.0033428946, -0.06007575, 0.10428961,
+        -0.07446676, 0.046175145, -0.09550597, -0.011844944, 0.07084293, 0.21624653, -0.012748002, -0.07855033, 0.18221743, 0.18255411, -0.04260919, 0.19016421, -0.12011317, 0.058785796, -0.09067691, 0.14773045,
+        -0.13016333, -0.12645185, 0.17715998, -0.20567617, -0.08355101, 0.08075025, -0.15876172, 0.22921485, 0.20904106, -0.16524643, 0.050888173, -0.20411196, -0.01849691, -0.0462148, -0.09549576, -0.18794198,
+        -0.046110857, 0.11067838, 0.10514691, -0.055009875, 0.037009127, 0.14234605, -0.17326646, 0.08586251, 0.21954457, 0.08758006, -0.1397864, 0.08649633, -0.18383048, -0.014621205, 0.0016588673, -0.011591702,
+        0.10316539, 0.13459244, 0.07959888, -0.0243932, -0.039894663, 0.13049044, 0.18406168, -0.14732777, 0.22289847, 0.08641291, -0.09417817, -0.103149906, -0.1195805, 0.08495649, -0.06033113, 0.03710898,
+        -0.10952151, 0.05780323, -0.10810746, 0.16179535, -0.056299374, -0.11621983, -0.15708347, -0.14918494, 0.15626152, -0.1698136, 0.20338589, -0.08539771, 0.051756892, 0.03425123, 0.03972637, -0.12884986,
+        0.071754105, -0.11388534, 0.02558389, 0.06799792, -0.046711303, -0.18522352, 0.032685142, -0.018861603, -0.17866863, -0.045905918, -0.14394337, -0.14106005, -0.0767828, 0.10924317, -0.055534188, 0.15327623,
+        -0.19018489, 0.12697972, 0.22205293, -0.0070167487, 0.03415015, 0.20809557, -0.14529318, -0.07788704, 0.05841737, 0.1597935, -0.1980514, -0.06629043, 0.007803561, -0.10054654, 0.07554056, 0.022274286,
+        0.10328537, -0.12625414, -0.06944367, 0.07023082, 0.07895712, -0.11425167, 0.12251639, 0.08826059, 0.08071645, 0.15462144, -0.16313754, 0.06896512, -0.032575272, 0.18014649, 0.073007554, 0.2020397,
+        0.15415883, -0.13599417, 0.08803756, 0.14779364, 0.20562527, 0.19455259, 0.073805586, -0.07596555, -0.09535137, -0.17850874, 0.18666787, 0.19872902, 0.14253864, 0.022191873, -0.14207405, 0.05589598,
+        -0.018043414, 0.14720657, -0.16592884, -0.00026596448, 0.09540955, 0.12853855, 0.18568547, 0.15489192, 0.026207678, -0.122916766, -0.0832881, -0.08406675, 0.18885344, 0.16547596, -0.037362654, 0.09762501,
+        -0.11700805, 0.009202293, -0.12670328, -0.05362129, -0.06438023, -0.1377299, 0.13653457, 0.10089955, -0.01524057, 0.1961885, -0.07657962, -0.1087841, -0.10820925, 0.103224434, -0.18870531, -0.17901506,
+        -0.15892896, 0.010835673, -0.17550713, 0.11565876, -0.17463003, -0.14272673, -0.12145811, 0.09326692, -0.015467406, 0.10738942, 0.040127885, 0.06552234, 0.02109838, -0.0076223104, 0.10918045, 0.012398371,
+        -0.15519229, -0.16696121, 0.19017994, -0.11034715, 0.21077538, 0.18552226, 0.12325965, 0.20914602, -0.2047405, -0.13057433, 0.18399481, 0.108143695, -0.1117007, 0.19221462, -0.18476117, 0.1234408,
+    },
+    b = {
+        0.009790524, 0.008545746, 0.008289602, 0.017431205, 0.015088783,
+    },
+}
 
-return Weights
+return {
+    state_dim = 11,
+    num_actions = 5,
+    format = "flat",
+    layers = layers,
+}